@@ -43,6 +43,9 @@ def requires_daemon_restart(old_config: Config, new_config: Config) -> bool:
             old_config.daemon.api_key != new_config.daemon.api_key
             or old_config.daemon.ipc_host != new_config.daemon.ipc_host
             or old_config.daemon.ipc_port != new_config.daemon.ipc_port
+            or old_config.daemon.ipc_socket_enabled
+            != new_config.daemon.ipc_socket_enabled
+            or old_config.daemon.ipc_socket_path != new_config.daemon.ipc_socket_path
             or old_config.daemon.websocket_enabled
             != new_config.daemon.websocket_enabled
             or old_config.daemon.websocket_heartbeat_interval
@@ -10,7 +10,15 @@ from pathlib import Path
 
 import click
 from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn
+from rich.progress import (
+    BarColumn,
+    DownloadColumn,
+    Progress,
+    SpinnerColumn,
+    TextColumn,
+    TimeRemainingColumn,
+    TransferSpeedColumn,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -179,6 +187,10 @@ def create_torrent(
         with Progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
+            BarColumn(),
+            DownloadColumn(),
+            TransferSpeedColumn(),
+            TimeRemainingColumn(),
             console=console,
         ) as progress:
             task = progress.add_task(
@@ -186,41 +198,33 @@ def create_torrent(
                 total=None,
             )
 
-            torrent_bytes = None
+            def on_progress(hashed: int, total: int) -> None:
+                progress.update(task, completed=hashed, total=total)
 
-            if torrent_format == "v2":
+            if torrent_format in ("v2", "hybrid"):
                 from ccbt.core.torrent_v2 import TorrentV2Parser
 
                 progress.update(
-                    task, description="Parsing files and building file tree..."
+                    task,
+                    description=(
+                        "Hashing files and building hybrid metadata..."
+                        if torrent_format == "hybrid"
+                        else "Hashing files and building file tree..."
+                    ),
                 )
                 parser = TorrentV2Parser()
-                torrent_bytes = parser.generate_v2_torrent(
+                # Streams the torrent to disk; content is read once
+                info_hash_v1, info_hash_v2 = parser.create_torrent_file(
                     source=source,
-                    output=None,  # Return bytes, we'll write to file ourselves
-                    trackers=list(tracker) if tracker else None,
-                    web_seeds=list(web_seed) if web_seed else None,
-                    comment=comment,
-                    created_by=created_by,
-                    piece_length=piece_length,
-                    private=private,
-                )
-            elif torrent_format == "hybrid":
-                from ccbt.core.torrent_v2 import TorrentV2Parser
-
-                progress.update(
-                    task, description="Parsing files and building hybrid metadata..."
-                )
-                parser = TorrentV2Parser()
-                torrent_bytes = parser.generate_hybrid_torrent(
-                    source=source,
-                    output=None,  # Return bytes, we'll write to file ourselves
+                    output=output,
+                    hybrid=torrent_format == "hybrid",
                     trackers=list(tracker) if tracker else None,
                     web_seeds=list(web_seed) if web_seed else None,
                     comment=comment,
                     created_by=created_by,
                     piece_length=piece_length,
                     private=private,
+                    progress_callback=on_progress,
                 )
             else:  # v1
                 progress.update(
@@ -234,45 +238,17 @@ def create_torrent(
                 )
                 raise click.Abort
 
-            if torrent_bytes:
-                # Save torrent file
-                progress.update(task, description=f"Saving torrent to {output}...")
-                output.parent.mkdir(parents=True, exist_ok=True)
-                with open(output, "wb") as f:
-                    f.write(torrent_bytes)
-
-                progress.update(task, description=f"Torrent saved to {output}")
-                console.print(
-                    f"[green]✓ Torrent created successfully: {output}[/green]"
-                )
-
-                # Parse torrent to show info hashes
-                from ccbt.core.bencode import decode
-
-                torrent_dict = decode(torrent_bytes)
-                info_dict = torrent_dict.get(b"info", {})
+            progress.update(task, description=f"Torrent saved to {output}")
 
-                if torrent_format in ["v2", "hybrid"]:
-                    # Extract v2 info hash
-                    from ccbt.core.torrent_v2 import TorrentV2Parser
-
-                    parser = TorrentV2Parser()
-                    if torrent_format == "v2":
-                        v2_info = parser.parse_v2(info_dict, torrent_dict)
-                        info_hash_v2 = v2_info.info_hash_v2
-                    else:  # hybrid
-                        v1_info, v2_info = parser.parse_hybrid(info_dict, torrent_dict)
-                        info_hash_v2 = v2_info.info_hash_v2 if v2_info else None
-                        info_hash_v1 = v1_info.info_hash if v1_info else None
-
-                    if info_hash_v2:
-                        console.print(
-                            f"[dim]Info hash v2 (SHA-256): {info_hash_v2.hex()[:32]}...[/dim]",
-                        )
-                    if torrent_format == "hybrid" and info_hash_v1:
-                        console.print(
-                            f"[dim]Info hash v1 (SHA-1): {info_hash_v1.hex()[:32]}...[/dim]",
-                        )
+        console.print(f"[green]✓ Torrent created successfully: {output}[/green]")
+        if info_hash_v2:
+            console.print(
+                f"[dim]Info hash v2 (SHA-256): {info_hash_v2.hex()[:32]}...[/dim]",
+            )
+        if torrent_format == "hybrid" and info_hash_v1:
+            console.print(
+                f"[dim]Info hash v1 (SHA-1): {info_hash_v1.hex()[:32]}...[/dim]",
+            )
 
     except Exception as e:  # pragma: no cover - CLI error handler, hard to trigger reliably in unit tests
         logger.exception("Error creating torrent")
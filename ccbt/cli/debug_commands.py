@@ -0,0 +1,191 @@
+"""CLI commands for daemon event loop health and profiling.
+
+Provides `btbt debug loop` to inspect event loop lag, slow callbacks,
+asyncio task counts and periodic job run times, and `btbt debug profile`
+to run the daemon's statistical stack sampler.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from typing import Any, Awaitable, Callable
+
+import aiohttp
+import click
+from rich.console import Console
+from rich.table import Table
+
+from ccbt.config.config import get_config, init_config
+from ccbt.daemon.ipc_client import IPCClient  # type: ignore[attr-defined]
+
+console = Console()
+
+
+def _call_daemon(
+    request: Callable[[IPCClient], Awaitable[Any]], conflict: str = ""
+) -> Any:
+    """Run one IPC request against the daemon.
+
+    Args:
+        request: Coroutine function sending the request with a client
+        conflict: Message shown when the daemon answers 409 Conflict
+
+    Raises:
+        click.ClickException: If the daemon is unreachable or rejects the request
+
+    """
+    init_config()
+    cfg = get_config()
+    if not cfg.daemon or not cfg.daemon.api_key:
+        msg = (
+            "Daemon API key not found in config. "
+            "Start the daemon with: 'btbt daemon start'"
+        )
+        raise click.ClickException(msg)
+
+    async def _run() -> Any:
+        client = IPCClient(api_key=cfg.daemon.api_key)  # type: ignore[union-attr]
+        try:
+            return await request(client)
+        finally:
+            await client.close()
+
+    try:
+        return asyncio.run(_run())
+    except aiohttp.ClientResponseError as e:
+        messages = {
+            409: conflict,
+            503: "Event loop monitoring is disabled in the daemon configuration",
+        }
+        msg = messages.get(e.status) or f"Daemon returned {e.status}: {e.message}"
+        raise click.ClickException(msg) from e
+    except aiohttp.ClientError as e:
+        msg = (
+            f"Could not reach the daemon ({e}). "
+            "Start the daemon with: 'btbt daemon start'"
+        )
+        raise click.ClickException(msg) from e
+
+
+@click.group("debug")
+def debug() -> None:
+    """Inspect daemon event loop health and profile hot paths."""
+
+
+@debug.command("loop")
+@click.option("--tasks", "top_tasks", type=int, default=10, help="Task names shown")
+@click.option("--json", "as_json", is_flag=True, help="Print the raw JSON response")
+def loop_health(top_tasks: int, as_json: bool) -> None:
+    """Show event loop lag, slow callbacks, task counts and job run times."""
+    health = _call_daemon(lambda client: client.get_loop_health())
+    if as_json:
+        console.print_json(json.dumps(health.model_dump()))
+        return
+
+    lag = health.lag
+    table = Table(title="Event Loop Lag")
+    table.add_column("Last", style="green")
+    table.add_column("Mean", style="green")
+    table.add_column("Max", style="yellow")
+    table.add_column("Samples", style="cyan")
+    table.add_row(
+        f"{lag.get('last', 0.0) * 1000:.2f} ms",
+        f"{lag.get('mean', 0.0) * 1000:.2f} ms",
+        f"{lag.get('max', 0.0) * 1000:.2f} ms",
+        str(lag.get("samples", 0)),
+    )
+    console.print(table)
+
+    table = Table(title=f"Asyncio Tasks ({health.total_tasks} pending)")
+    table.add_column("Name", style="cyan")
+    table.add_column("Count", style="green", justify="right")
+    for name, count in list(health.tasks.items())[:top_tasks]:
+        table.add_row(name, str(count))
+    console.print(table)
+
+    if health.scheduler:
+        table = Table(title="Periodic Jobs")
+        table.add_column("Job", style="cyan")
+        table.add_column("Scheduled", justify="right")
+        table.add_column("Runs", justify="right")
+        table.add_column("Avg", justify="right", style="green")
+        table.add_column("Errors", justify="right", style="red")
+        table.add_column("Coalesced", justify="right", style="yellow")
+        for name, stats in sorted(health.scheduler.items()):
+            table.add_row(
+                name,
+                str(stats.get("jobs", 0)),
+                str(stats.get("runs", 0)),
+                f"{stats.get('average_seconds', 0.0) * 1000:.2f} ms",
+                str(stats.get("errors", 0)),
+                str(stats.get("coalesced", 0)),
+            )
+        console.print(table)
+
+    if not health.slow_callbacks:
+        console.print("[green]No slow callbacks recorded[/green]")
+        return
+    console.print(f"[yellow]Slow callbacks ({len(health.slow_callbacks)}):[/yellow]")
+    for record in reversed(health.slow_callbacks):
+        started = time.strftime("%H:%M:%S", time.localtime(record["started"]))
+        console.print(
+            f"\n[bold]{started}[/bold] blocked {record['duration'] * 1000:.1f} ms "
+            f"in {record['task'] or 'a callback'}"
+        )
+        for frame in record["stack"][-8:]:
+            console.print(f"  {frame}", highlight=False)
+
+
+@debug.group("profile")
+def profile() -> None:
+    """Sample daemon stacks into flamegraph collapsed-stack files."""
+
+
+@profile.command("start")
+@click.option(
+    "--interval",
+    type=float,
+    default=None,
+    help="Seconds between samples (default: observability.stack_sample_interval)",
+)
+def profile_start(interval: float | None) -> None:
+    """Start sampling the daemon's thread stacks."""
+    status = _call_daemon(
+        lambda client: client.start_profile(interval),
+        conflict="A profiling run is already in progress",
+    )
+    console.print(
+        f"[green]Sampling daemon stacks every {status.interval * 1000:.1f} ms[/green]"
+    )
+    console.print("Stop with: 'btbt debug profile stop'")
+
+
+@profile.command("stop")
+def profile_stop() -> None:
+    """Stop sampling and write the collapsed stacks."""
+    status = _call_daemon(
+        lambda client: client.stop_profile(),
+        conflict="No profiling run is in progress; start one with 'btbt debug profile start'",
+    )
+    console.print(
+        f"[green]Wrote {status.samples} samples ({status.stacks} distinct stacks) "
+        f"to {status.path}[/green]"
+    )
+    console.print(
+        "Render with: flamegraph.pl <file> > flame.svg, or open in speedscope"
+    )
+
+
+@profile.command("status")
+def profile_status() -> None:
+    """Show whether the stack sampler is running."""
+    status = _call_daemon(lambda client: client.get_profile_status())
+    if status.running:
+        console.print(
+            f"[green]Sampling[/green] every {status.interval * 1000:.1f} ms: "
+            f"{status.samples} samples, {status.stacks} distinct stacks"
+        )
+    else:
+        console.print("[yellow]Stack sampler is not running[/yellow]")
@@ -30,9 +30,15 @@ from ccbt.config.config import ConfigManager, get_config, reload_config
 from ccbt.executor.executor import UnifiedCommandExecutor
 from ccbt.executor.session_adapter import LocalSessionAdapter, SessionAdapter
 from ccbt.i18n import _
+from ccbt.session.torrent_index import MAX_PAGE_LIMIT, ListQuery
 
 logger = logging.getLogger(__name__)
 
+# Peer fields shown in the peers panel and table (besides ip and port)
+_PEER_FIELDS = frozenset({"download_rate", "upload_rate"})
+# Rows shown in the live peers panel
+_PEER_PANEL_ROWS = 10
+
 if TYPE_CHECKING:  # pragma: no cover - TYPE_CHECKING imports not executed at runtime
     from rich.progress import (
         Progress,
@@ -478,19 +484,17 @@ class InteractiveCLI:
                 self.stats["upload_speed"] = float(upload_rate)
                 self.stats["pieces_completed"] = int(pieces_completed)
                 self.stats["pieces_total"] = int(pieces_total)
-                # Peers count - use executor
-                peers = []
+                # Fastest peers for the panel, plus the total count
+                peers, peer_count = [], 0
                 if self.current_info_hash_hex:
                     try:
-                        result = await self.executor.execute(
-                            "torrent.get_peers", info_hash=self.current_info_hash_hex
+                        peers, peer_count = await self._query_peers(
+                            limit=_PEER_PANEL_ROWS, sort="-download_rate"
                         )
-                        if result.success and result.data.get("peers"):
-                            peers = result.data["peers"]
                     except Exception:
-                        peers = []
-                self._last_peers = peers or []
-                self.stats["peers_connected"] = len(self._last_peers)
+                        peers, peer_count = [], 0
+                self._last_peers = peers
+                self.stats["peers_connected"] = peer_count
 
                 # Update live progress
                 if (
@@ -540,6 +544,38 @@ class InteractiveCLI:
         except Exception as e:
             logger.debug("Failed to calculate progress: %s", e)
 
+    async def _query_peers(
+        self, limit: int | None = None, sort: str | None = None
+    ) -> tuple[list[dict[str, Any]], int]:
+        """Fetch the current torrent's peers with only the displayed fields.
+
+        Args:
+            limit: Maximum peers to fetch, or None for all of them
+            sort: Field to sort on, prefixed with ``-`` for descending order
+
+        Returns:
+            Tuple of (peer rows, total number of peers)
+
+        """
+        query = ListQuery(
+            fields=_PEER_FIELDS,
+            limit=MAX_PAGE_LIMIT if limit is None else limit,
+            sort=sort,
+        )
+        peers: list[dict[str, Any]] = []
+        while True:
+            result = await self.executor.execute(
+                "torrent.query_peers",
+                info_hash=self.current_info_hash_hex,
+                query=query,
+            )
+            if not result.success:
+                return peers, len(peers)
+            peers.extend(result.data["peers"])
+            if limit is not None or result.data["next_cursor"] is None:
+                return peers, result.data["total"]
+            query.cursor = result.data["next_cursor"]
+
     async def cmd_help(self, _args: list[str]) -> None:
         """Show help."""
         help_text = _("""
@@ -655,11 +691,7 @@ Available Commands:
         peers = []
         if self.current_info_hash_hex:
             try:
-                result = await self.executor.execute(
-                    "torrent.get_peers", info_hash=self.current_info_hash_hex
-                )
-                if result.success and result.data.get("peers"):
-                    peers = result.data["peers"]
+                peers, _count = await self._query_peers()
             except Exception:
                 peers = []
 
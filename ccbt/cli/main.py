@@ -30,6 +30,7 @@ from ccbt.cli.advanced_commands import test as test_cmd
 from ccbt.cli.config_commands import config as config_group
 from ccbt.cli.config_commands_extended import config_extended
 from ccbt.cli.daemon_commands import daemon as daemon_group
+from ccbt.cli.debug_commands import debug as debug_group
 from ccbt.cli.downloads import start_basic_magnet_download
 from ccbt.cli.interactive import InteractiveCLI
 from ccbt.cli.monitoring_commands import alerts as alerts_cmd
@@ -2442,6 +2443,7 @@ async def start_debug_mode(_session: AsyncSessionManager, console: Console) -> N
 cli.add_command(config_group)
 cli.add_command(config_extended)
 cli.add_command(daemon_group)
+cli.add_command(debug_group)
 cli.add_command(dashboard_cmd)
 cli.add_command(alerts_cmd)
 cli.add_command(metrics_cmd)
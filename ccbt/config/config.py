@@ -158,6 +158,9 @@ class ConfigManager:
             "CCBT_BLOCK_SIZE_KIB": "network.block_size_kib",
             "CCBT_CONNECTION_TIMEOUT": "network.connection_timeout",
             "CCBT_HANDSHAKE_TIMEOUT": "network.handshake_timeout",
+            "CCBT_INCOMING_ACCEPT_RATE": "network.incoming_accept_rate",
+            "CCBT_INCOMING_ACCEPT_BURST": "network.incoming_accept_burst",
+            "CCBT_MAX_HALF_OPEN_INCOMING": "network.max_half_open_incoming",
             "CCBT_KEEP_ALIVE_INTERVAL": "network.keep_alive_interval",
             "CCBT_GLOBAL_DOWN_KIB": "network.global_down_kib",
             "CCBT_GLOBAL_UP_KIB": "network.global_up_kib",
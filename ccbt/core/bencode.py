@@ -8,7 +8,7 @@ This module provides encoding and decoding functionality according to the BitTor
 
 from __future__ import annotations
 
-from typing import Any
+from typing import IO, Any
 
 from ccbt.utils.exceptions import BencodeError
 
@@ -189,6 +189,15 @@ class BencodeEncoder:
 
     def _encode_dict(self, dct: dict[Any, Any]) -> bytes:
         """Encode dictionary as bencoded dictionary."""
+        result = b"d"
+        for key, value in self._sorted_items(dct):
+            result += self.encode(key)
+            result += self.encode(value)
+        result += b"e"
+        return result
+
+    def _sorted_items(self, dct: dict[Any, Any]) -> list[tuple[Any, Any]]:
+        """Return dictionary items sorted by key, validating key types."""
         # Sort keys for bencode specification compliance
         try:
             sorted_items = sorted(
@@ -203,8 +212,7 @@ class BencodeEncoder:
                 msg,
             ) from e
 
-        result = b"d"
-        for key, value in sorted_items:
+        for key, _value in sorted_items:
             if not isinstance(
                 key, (str, bytes)
             ):  # pragma: no cover - Invalid dictionary key type error, tested via valid keys
@@ -212,10 +220,35 @@ class BencodeEncoder:
                 raise BencodeEncodeError(
                     msg,
                 )
-            result += self.encode(key)
-            result += self.encode(value)
-        result += b"e"
-        return result
+        return sorted_items
+
+    def encode_to(self, obj: Any, stream: IO[bytes]) -> None:
+        """Encode a Python object, writing the bencoded data to ``stream``.
+
+        Produces the same bytes as :meth:`encode` without building the whole
+        encoding in memory; byte strings are written without being copied.
+        """
+        if isinstance(obj, str):
+            obj = obj.encode("utf-8")
+        if isinstance(obj, bytes):
+            stream.write(f"{len(obj)}:".encode())
+            stream.write(obj)
+        elif isinstance(obj, int):
+            stream.write(self._encode_integer(obj))
+        elif isinstance(obj, list):
+            stream.write(b"l")
+            for item in obj:
+                self.encode_to(item, stream)
+            stream.write(b"e")
+        elif isinstance(obj, dict):
+            stream.write(b"d")
+            for key, value in self._sorted_items(obj):
+                self.encode_to(key, stream)
+                self.encode_to(value, stream)
+            stream.write(b"e")
+        else:
+            msg = f"Cannot encode type: {type(obj)}"
+            raise BencodeEncodeError(msg)
 
 
 def decode(data: bytes) -> Any:
@@ -228,3 +261,9 @@ def encode(obj: Any) -> bytes:
     """Convenience function to encode Python object to bencoded data."""
     encoder = BencodeEncoder()
     return encoder.encode(obj)
+
+
+def encode_to(obj: Any, stream: IO[bytes]) -> None:
+    """Encode Python object as bencoded data written to a binary stream."""
+    encoder = BencodeEncoder()
+    encoder.encode_to(obj, stream)
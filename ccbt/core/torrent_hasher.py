@@ -0,0 +1,274 @@
+"""Parallel single-pass piece hashing for torrent creation.
+
+Each file is read exactly once, in large piece-aligned chunks, and every chunk
+is handed to a thread pool that computes the v1 (SHA-1, over the concatenated
+content) and v2 (SHA-256 Merkle root of 16 KiB blocks, per file) piece hashes
+from the same buffer. hashlib releases the GIL for large buffers, so hashing
+scales across cores while the calling thread keeps the disk busy. Digests
+are stored by piece index, so the output is in order regardless of which
+worker finishes first, and only a bounded number of chunks is held in
+memory at any time.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import logging
+import os
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import IO, TYPE_CHECKING, Callable, Iterator, Sequence
+
+from ccbt.piece.hash_v2 import hash_piece_root_v2
+from ccbt.utils.exceptions import TorrentError
+
+if TYPE_CHECKING:  # pragma: no cover
+    from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# Target bytes read per chunk (rounded down to whole pieces, at least one)
+DEFAULT_CHUNK_SIZE = 4 * 1024 * 1024
+
+# Chunks queued per worker before the reader waits for results
+INFLIGHT_CHUNKS_PER_WORKER = 2
+
+# Upper bound on chunk memory held by queued and running hash jobs
+MAX_INFLIGHT_BYTES = 256 * 1024 * 1024
+
+# Called with (bytes_hashed, total_bytes) as chunks complete
+ProgressCallback = Callable[[int, int], None]
+
+
+@dataclass
+class PieceHashes:
+    """Piece hashes produced by :class:`TorrentHasher`."""
+
+    v1_pieces: bytes = b""  # Concatenated 20-byte SHA-1 hashes
+    v2_pieces: list[list[bytes]] = field(default_factory=list)  # Per file
+    total_length: int = 0
+
+
+@dataclass
+class _HashJob:
+    """Pieces of one chunk to hash on a worker."""
+
+    nbytes: int  # New bytes read for this job (for progress)
+    piece_length: int = 0
+    v1: list[tuple[int, list[memoryview]]] = field(default_factory=list)
+    v2: list[tuple[int, int, memoryview]] = field(default_factory=list)
+
+
+def _hash_job(
+    job: _HashJob,
+) -> tuple[list[tuple[int, bytes]], list[tuple[int, int, bytes]]]:
+    """Hash the pieces of one job.
+
+    Returns:
+        Tuple of (v1 (piece index, digest) list,
+        v2 (file index, piece index, digest) list)
+
+    """
+    v1_digests: list[tuple[int, bytes]] = []
+    for index, parts in job.v1:
+        hasher = hashlib.sha1()  # nosec B324 - SHA-1 required for v1 compatibility
+        for part in parts:
+            hasher.update(part)
+        v1_digests.append((index, hasher.digest()))
+    # Only the first piece of a file can be the whole file, whose root is
+    # not padded to a full piece (the result is the same for a full piece)
+    v2_digests = [
+        (
+            file_index,
+            index,
+            hash_piece_root_v2(data, job.piece_length if index else None),
+        )
+        for file_index, index, data in job.v2
+    ]
+    return v1_digests, v2_digests
+
+
+class TorrentHasher:
+    """Hash torrent content for v1, v2 or hybrid metadata in one read pass."""
+
+    def __init__(
+        self,
+        piece_length: int,
+        *,
+        v1: bool = True,
+        v2: bool = True,
+        workers: int | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        progress_callback: ProgressCallback | None = None,
+    ):
+        """Initialize torrent hasher.
+
+        Args:
+            piece_length: Piece length in bytes
+            v1: Compute v1 SHA-1 piece hashes over the concatenated files
+            v2: Compute v2 SHA-256 piece hashes per file
+            workers: Number of hash threads (defaults to CPU count)
+            chunk_size: Target read size; rounded to a multiple of piece_length
+            progress_callback: Called with (bytes_hashed, total_bytes)
+
+        """
+        if piece_length <= 0:
+            msg = f"Piece length must be positive, got {piece_length}"
+            raise ValueError(msg)
+
+        self.piece_length = piece_length
+        self.v1 = v1
+        self.v2 = v2
+        self.workers = max(1, workers or os.cpu_count() or 1)
+        self.chunk_size = max(1, chunk_size // piece_length) * piece_length
+        self.progress_callback = progress_callback
+
+    def hash_files(self, paths: Sequence[Path]) -> PieceHashes:
+        """Hash files in the given order.
+
+        v1 pieces span file boundaries in ``paths`` order; v2 pieces restart
+        at the beginning of every file.
+
+        Args:
+            paths: Files to hash
+
+        Returns:
+            Piece hashes for the files
+
+        Raises:
+            OSError: If a file cannot be read
+            TorrentError: If a file shrinks while it is being hashed
+
+        """
+        piece_length = self.piece_length
+        sizes = [path.stat().st_size for path in paths]
+        total = sum(sizes)
+
+        v1_out = bytearray(20 * -(-total // piece_length)) if self.v1 else None
+        v2_out = [[b""] * -(-size // piece_length) for size in sizes] if self.v2 else []
+
+        max_inflight = max(
+            2,
+            min(
+                self.workers * INFLIGHT_CHUNKS_PER_WORKER,
+                MAX_INFLIGHT_BYTES // self.chunk_size,
+            ),
+        )
+        pending: deque[tuple[Future, int]] = deque()
+        hashed = 0
+
+        def collect() -> None:
+            nonlocal hashed
+            future, nbytes = pending.popleft()
+            v1_digests, v2_digests = future.result()
+            if v1_out is not None:
+                for index, digest in v1_digests:
+                    v1_out[index * 20 : index * 20 + 20] = digest
+            for file_index, index, digest in v2_digests:
+                v2_out[file_index][index] = digest
+            if nbytes:
+                hashed += nbytes
+                if self.progress_callback is not None:
+                    self.progress_callback(hashed, total)
+
+        with ThreadPoolExecutor(
+            max_workers=self.workers, thread_name_prefix="ccbt-hash"
+        ) as pool:
+            try:
+                for job in self._iter_jobs(paths, sizes):
+                    pending.append((pool.submit(_hash_job, job), job.nbytes))
+                    while len(pending) >= max_inflight:
+                        collect()
+                while pending:
+                    collect()
+            finally:
+                for future, _ in pending:
+                    future.cancel()
+
+        logger.debug(
+            "Hashed %d bytes in %d files with %d workers",
+            total,
+            len(sizes),
+            self.workers,
+        )
+        return PieceHashes(
+            v1_pieces=bytes(v1_out) if v1_out is not None else b"",
+            v2_pieces=v2_out,
+            total_length=total,
+        )
+
+    def _iter_jobs(self, paths: Sequence[Path], sizes: list[int]) -> Iterator[_HashJob]:
+        """Read files once and split every chunk into v1 and v2 pieces."""
+        piece_length = self.piece_length
+        offset = 0  # Offset into the concatenated content
+        # Start of a v1 piece spanning chunks; len(carry) == offset % piece_length
+        carry: list[memoryview] = []
+        carry_len = 0
+
+        for file_index, (path, size) in enumerate(zip(paths, sizes)):
+            if size == 0:
+                continue
+            with open(path, "rb") as f:
+                with contextlib.suppress(AttributeError, OSError):
+                    os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+
+                file_offset = 0
+                while file_offset < size:
+                    view = self._read_chunk(
+                        f, min(self.chunk_size, size - file_offset), path
+                    )
+                    length = len(view)
+                    job = _HashJob(nbytes=length, piece_length=piece_length)
+
+                    if self.v2:
+                        # Chunks start on piece boundaries within the file
+                        first_piece = file_offset // piece_length
+                        for i, pos in enumerate(range(0, length, piece_length)):
+                            job.v2.append(
+                                (
+                                    file_index,
+                                    first_piece + i,
+                                    view[pos : pos + piece_length],
+                                )
+                            )
+
+                    if self.v1:
+                        pos = 0
+                        if carry_len:
+                            pos = min(length, piece_length - carry_len)
+                            carry.append(view[:pos])
+                            carry_len += pos
+                            if carry_len == piece_length:
+                                index = (offset + pos) // piece_length - 1
+                                job.v1.append((index, carry))
+                                carry, carry_len = [], 0
+                        while length - pos >= piece_length:
+                            index = (offset + pos) // piece_length
+                            job.v1.append((index, [view[pos : pos + piece_length]]))
+                            pos += piece_length
+                        if pos < length:
+                            carry.append(view[pos:])
+                            carry_len += length - pos
+
+                    yield job
+                    file_offset += length
+                    offset += length
+
+        if carry_len:
+            # Final partial v1 piece
+            yield _HashJob(nbytes=0, v1=[(offset // piece_length, carry)])
+
+    @staticmethod
+    def _read_chunk(f: IO[bytes], length: int, path: Path) -> memoryview:
+        """Read exactly ``length`` bytes into a new buffer."""
+        view = memoryview(bytearray(length))
+        got = 0
+        while got < length:
+            n = f.readinto(view[got:])
+            if not n:
+                msg = f"File changed while hashing: {path}"
+                raise TorrentError(msg)
+            got += n
+        return view
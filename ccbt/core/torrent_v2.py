@@ -13,14 +13,21 @@ import logging
 import math
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from ccbt.core.bencode import encode
+from ccbt.core.bencode import encode, encode_to
+from ccbt.core.torrent_hasher import TorrentHasher
 from ccbt.models import FileInfo, TorrentInfo
 from ccbt.utils.exceptions import TorrentError
 
+if TYPE_CHECKING:  # pragma: no cover
+    from ccbt.core.torrent_hasher import ProgressCallback
+
 logger = logging.getLogger(__name__)
 
+# Bencoded output is fed to info-hash calculations in blocks of this size
+HASH_WRITER_BUFFER_SIZE = 64 * 1024
+
 
 @dataclass
 class FileTreeNode:
@@ -469,6 +476,36 @@ def _validate_piece_layer(
     return True
 
 
+class _HashWriter:
+    """Write-only binary stream that feeds everything written to a hash."""
+
+    def __init__(self, hasher: Any) -> None:
+        """Initialize writer around a hashlib hash object."""
+        self._hasher = hasher
+        self._buffer = bytearray()
+
+    def write(self, data: bytes) -> int:
+        """Hash ``data``; small writes are batched into larger updates."""
+        if len(data) >= HASH_WRITER_BUFFER_SIZE:
+            self._flush()
+            self._hasher.update(data)
+        else:
+            self._buffer += data
+            if len(self._buffer) >= HASH_WRITER_BUFFER_SIZE:
+                self._flush()
+        return len(data)
+
+    def _flush(self) -> None:
+        if self._buffer:
+            self._hasher.update(self._buffer)
+            self._buffer.clear()
+
+    def digest(self) -> bytes:
+        """Return the digest of everything written."""
+        self._flush()
+        return self._hasher.digest()
+
+
 def _calculate_info_hash_v2(info_dict: dict[bytes, Any]) -> bytes:
     """Calculate SHA-256 info hash for v2 torrent.
 
@@ -483,11 +520,11 @@ def _calculate_info_hash_v2(info_dict: dict[bytes, Any]) -> bytes:
 
     """
     try:
-        # Bencode the info dictionary
-        info_bencoded = encode(info_dict)
-
-        # Calculate SHA-256 hash (32 bytes)
-        info_hash_v2 = hashlib.sha256(info_bencoded).digest()
+        # Calculate SHA-256 hash (32 bytes) of the bencoded info dictionary,
+        # streaming the encoding instead of building it in memory
+        writer = _HashWriter(hashlib.sha256())
+        encode_to(info_dict, writer)
+        info_hash_v2 = writer.digest()
 
         logger.debug("Calculated v2 info hash: %s", info_hash_v2.hex()[:16])
 
@@ -531,11 +568,10 @@ def _calculate_info_hash_v1(info_dict: dict[bytes, Any]) -> bytes | None:
             if key in info_dict:
                 v1_info_dict[key] = info_dict[key]
 
-        # Bencode the v1 info dictionary
-        v1_info_bencoded = encode(v1_info_dict)
-
         # Calculate SHA-1 hash (20 bytes) - required by BitTorrent v1 protocol
-        info_hash_v1 = hashlib.sha1(v1_info_bencoded).digest()  # nosec B324 - SHA-1 required by BitTorrent protocol v1
+        writer = _HashWriter(hashlib.sha1())  # nosec B324 - SHA-1 required by BitTorrent protocol v1
+        encode_to(v1_info_dict, writer)
+        info_hash_v1 = writer.digest()
 
         logger.debug("Calculated v1 info hash (hybrid): %s", info_hash_v1.hex()[:16])
 
@@ -990,8 +1026,6 @@ class TorrentV2Parser:
             TorrentError: If file cannot be read or hashing fails
 
         """
-        from ccbt.piece.hash_v2 import hash_piece_v2
-
         if not file_path.exists():
             msg = f"File not found: {file_path}"
             raise TorrentError(msg)
@@ -1010,36 +1044,15 @@ class TorrentV2Parser:
             return (empty_root, empty_layer)
 
         # Read file and hash pieces
-        piece_hashes: list[bytes] = []
         try:
-            with open(file_path, "rb") as f:
-                bytes_read = 0
-                while bytes_read < file_size:
-                    # Read piece (or remainder if less than piece_length)
-                    piece_data = f.read(piece_length)
-                    if not piece_data:  # pragma: no cover
-                        # Edge case: file read returns empty bytes before EOF
-                        # Should not occur with normal file operations - defensive check
-                        break
-
-                    # Hash the piece
-                    piece_hash = hash_piece_v2(piece_data)
-                    piece_hashes.append(piece_hash)
-                    bytes_read += len(piece_data)
-
-                    self.logger.debug(
-                        "Hashed piece %d/%d for file %s",
-                        len(piece_hashes),
-                        math.ceil(file_size / piece_length),
-                        file_path.name,
-                    )
-
+            hashes = TorrentHasher(piece_length, v1=False).hash_files([file_path])
         except OSError as e:
             msg = f"Error reading file {file_path}: {e}"
             raise TorrentError(msg) from e
+        piece_hashes = hashes.v2_pieces[0]
 
         # Calculate pieces root (Merkle root)
-        pieces_root = self._calculate_pieces_root(piece_hashes)
+        pieces_root = self._calculate_pieces_root(piece_hashes, piece_length)
 
         # Create PieceLayer
         piece_layer = PieceLayer(piece_length=piece_length, pieces=piece_hashes)
@@ -1053,11 +1066,16 @@ class TorrentV2Parser:
 
         return (pieces_root, piece_layer)
 
-    def _calculate_pieces_root(self, piece_hashes: list[bytes]) -> bytes:
+    def _calculate_pieces_root(
+        self,
+        piece_hashes: list[bytes],
+        piece_length: int | None = None,
+    ) -> bytes:
         """Calculate Merkle root (pieces_root) for a list of piece hashes.
 
         Args:
             piece_hashes: List of 32-byte SHA-256 piece hashes
+            piece_length: Piece length in bytes, used to pad the layer
 
         Returns:
             32-byte Merkle root (pieces_root)
@@ -1073,7 +1091,7 @@ class TorrentV2Parser:
             return bytes(32)
 
         try:
-            return hash_piece_layer(piece_hashes)
+            return hash_piece_layer(piece_hashes, piece_length)
         except ValueError as e:
             msg = f"Invalid piece hashes for root calculation: {e}"
             raise TorrentError(msg) from e
@@ -1100,6 +1118,8 @@ class TorrentV2Parser:
         file_tree: dict[str, FileTreeNode],
         base_path: Path,
         piece_length: int,
+        progress_callback: ProgressCallback | None = None,
+        workers: int | None = None,
     ) -> dict[bytes, PieceLayer]:
         """Build piece layers for all files in the file tree.
 
@@ -1107,6 +1127,8 @@ class TorrentV2Parser:
             file_tree: Dictionary mapping root names to FileTreeNode roots
             base_path: Base path where files are located
             piece_length: Length of each piece in bytes
+            progress_callback: Called with (bytes_hashed, total_bytes)
+            workers: Number of hash threads (defaults to CPU count)
 
         Returns:
             Dictionary mapping pieces_root (32 bytes) to PieceLayer
@@ -1116,23 +1138,53 @@ class TorrentV2Parser:
 
         This method:
         1. Traverses the file tree to find all file nodes
-        2. For each file, calculates piece hashes and pieces_root
-        3. Updates the file node's pieces_root field
+        2. Hashes all files in one parallel pass
+        3. Updates each file node's pieces_root field
         4. Returns a dictionary of all piece layers
 
         """
-        piece_layers: dict[bytes, PieceLayer] = {}
+        entries = self._collect_file_nodes(file_tree, base_path)
+        piece_layers, _ = self._hash_file_nodes(
+            entries,
+            piece_length,
+            v1=False,
+            progress_callback=progress_callback,
+            workers=workers,
+        )
+
+        self.logger.info(
+            "Built %d piece layers from file tree",
+            len(piece_layers),
+        )
+
+        return piece_layers
+
+    def _collect_file_nodes(
+        self,
+        file_tree: dict[str, FileTreeNode],
+        base_path: Path,
+    ) -> list[tuple[FileTreeNode, Path]]:
+        """Find every file node in the file tree with its path on disk.
+
+        Args:
+            file_tree: Dictionary mapping root names to FileTreeNode roots
+            base_path: Base path where files are located
+
+        Returns:
+            List of (file node, file path) tuples in tree order
+
+        """
+        entries: list[tuple[FileTreeNode, Path]] = []
 
         # Store base_path as instance attribute for use in nested function
         self.base_path = base_path
 
-        def traverse_and_hash(node: FileTreeNode, file_path: Path) -> None:
-            """Recursively traverse tree and hash files."""
+        def traverse(node: FileTreeNode, file_path: Path) -> None:
+            """Recursively traverse tree and collect file nodes."""
             # Check if this is a file node (has children=None, not checking pieces_root
             # because it might not be set yet)
             if node.children is None:
                 # This is a file node (or will be after we set pieces_root)
-                # Build piece layer for this file
                 # file_path should be the actual file path
                 if not file_path.exists():
                     # Try to resolve the path - might be relative to base_path
@@ -1175,34 +1227,13 @@ class TorrentV2Parser:
                         # Indicates invalid tree structure or path resolution issue
                         file_path = file_path / node.name
 
-                try:
-                    pieces_root, piece_layer = self._build_piece_layer(
-                        file_path, piece_length
-                    )
-
-                    # Update node's pieces_root
-                    node.pieces_root = pieces_root
-
-                    # Store piece layer with pieces_root as key
-                    piece_layers[pieces_root] = piece_layer
-
-                    self.logger.debug(
-                        "Added piece layer for %s: root=%s",
-                        file_path.name,
-                        pieces_root.hex()[:16],
-                    )
-                except (TorrentError, FileNotFoundError) as e:
-                    self.logger.exception(
-                        "Failed to build piece layer for %s", file_path
-                    )
-                    msg = f"Failed to build piece layer: {e}"
-                    raise TorrentError(msg) from e
+                entries.append((node, file_path))
 
             elif node.children is not None:
                 # This is a directory node - traverse children
                 for child_name, child_node in node.children.items():
                     child_path = file_path / child_name
-                    traverse_and_hash(child_node, child_path)
+                    traverse(child_node, child_path)
 
         # Traverse each root in the file tree
         for root_name, root_node in file_tree.items():
@@ -1216,17 +1247,74 @@ class TorrentV2Parser:
             if root_node.children is None:
                 # Single file at root - file is directly in base_path
                 file_path = base_path / root_node.name
-                traverse_and_hash(root_node, file_path)
+                traverse(root_node, file_path)
             else:
                 # Directory - traverse normally
-                traverse_and_hash(root_node, root_path)
+                traverse(root_node, root_path)
 
-        self.logger.info(
-            "Built %d piece layers from file tree",
-            len(piece_layers),
+        return entries
+
+    def _hash_file_nodes(
+        self,
+        entries: list[tuple[FileTreeNode, Path]],
+        piece_length: int,
+        *,
+        v1: bool,
+        progress_callback: ProgressCallback | None = None,
+        workers: int | None = None,
+    ) -> tuple[dict[bytes, PieceLayer], bytes]:
+        """Hash files in one pass, setting each node's pieces_root.
+
+        Args:
+            entries: (file node, file path) tuples; v1 pieces follow this order
+            piece_length: Length of each piece in bytes
+            v1: Also compute v1 SHA-1 pieces over the concatenated files
+            progress_callback: Called with (bytes_hashed, total_bytes)
+            workers: Number of hash threads (defaults to CPU count)
+
+        Returns:
+            Tuple of (piece layers by pieces_root, concatenated v1 piece hashes)
+
+        Raises:
+            TorrentError: If a file is missing or cannot be read
+
+        """
+        for _node, file_path in entries:
+            if not file_path.exists():
+                msg = f"Failed to build piece layer: File not found: {file_path}"
+                raise TorrentError(msg)
+            if not file_path.is_file():
+                msg = f"Failed to build piece layer: Path is not a file: {file_path}"
+                raise TorrentError(msg)
+
+        hasher = TorrentHasher(
+            piece_length,
+            v1=v1,
+            workers=workers,
+            progress_callback=progress_callback,
         )
+        try:
+            hashes = hasher.hash_files([file_path for _node, file_path in entries])
+        except OSError as e:
+            msg = f"Failed to build piece layer: Error reading file {e.filename}: {e}"
+            raise TorrentError(msg) from e
 
-        return piece_layers
+        piece_layers: dict[bytes, PieceLayer] = {}
+        for (node, file_path), piece_hashes in zip(entries, hashes.v2_pieces):
+            # Empty files have no pieces and an all-zeros root
+            pieces_root = self._calculate_pieces_root(piece_hashes, piece_length)
+            node.pieces_root = pieces_root
+            piece_layers[pieces_root] = PieceLayer(
+                piece_length=piece_length, pieces=piece_hashes
+            )
+            self.logger.debug(
+                "Added piece layer for %s: %d pieces, root=%s",
+                file_path.name,
+                len(piece_hashes),
+                pieces_root.hex()[:16],
+            )
+
+        return piece_layers, hashes.v1_pieces
 
     def _file_tree_to_dict(
         self, file_tree: dict[str, FileTreeNode]
@@ -1383,42 +1471,38 @@ class TorrentV2Parser:
 
         return files
 
-    def generate_v2_torrent(
+    def _build_info_dict(
         self,
         source: Path,
-        output: Path | None = None,
-        trackers: list[str] | None = None,
-        web_seeds: list[str] | None = None,
-        comment: str | None = None,
-        created_by: str = "ccBitTorrent",
-        piece_length: int | None = None,
-        private: bool = False,
-    ) -> bytes:
-        """Generate a v2-only torrent file.
+        piece_length: int | None,
+        private: bool,
+        *,
+        hybrid: bool,
+        progress_callback: ProgressCallback | None = None,
+        workers: int | None = None,
+    ) -> tuple[dict[bytes, Any], int]:
+        """Hash the source content and build the info dictionary.
+
+        Content is read once; for hybrid torrents the v1 and v2 piece hashes
+        are computed from the same buffers.
 
         Args:
             source: Source file or directory path
-            output: Optional output file path (returns bytes if None)
-            trackers: List of tracker announce URLs
-            web_seeds: List of web seed URLs
-            comment: Optional torrent comment
-            created_by: Created by field
             piece_length: Piece length in bytes (auto-calculated if None)
             private: Mark torrent as private (BEP 27)
+            hybrid: Build a hybrid (v1 + v2) info dictionary
+            progress_callback: Called with (bytes_hashed, total_bytes)
+            workers: Number of hash threads (defaults to CPU count)
 
         Returns:
-            Bencoded torrent file as bytes
+            Tuple of (info dictionary, number of files)
 
         Raises:
-            TorrentError: If generation fails
+            TorrentError: If the source is invalid or hashing fails
 
         """
-        import time
-
         from ccbt.piece.hash_v2 import hash_file_tree
 
-        self.logger.info("Generating v2 torrent from %s", source)
-
         # Validate source path
         if not source.exists():
             msg = f"Source path does not exist: {source}"
@@ -1455,36 +1539,70 @@ class TorrentV2Parser:
         name = source.name if source.is_dir() or source.parent.name else source.stem
 
         # Build file tree
-        file_tree = self._build_file_tree(
-            files, source if source.is_dir() else source.parent
-        )
-
-        # Build piece layers
-        # This also updates file tree nodes with their pieces_root
         base_path = source if source.is_dir() else source.parent
-        piece_layers = self.build_piece_layers(file_tree, base_path, piece_length)
+        file_tree = self._build_file_tree(files, base_path)
+
+        # Hash content. This also updates file tree nodes with their
+        # pieces_root. v1 pieces run over the files in path order, which is
+        # also the order of the v1 file list below.
+        entries = self._collect_file_nodes(file_tree, base_path)
+        if hybrid:
+            entries.sort(key=lambda entry: entry[1].relative_to(base_path).as_posix())
+        piece_layers, v1_pieces = self._hash_file_nodes(
+            entries,
+            piece_length,
+            v1=hybrid,
+            progress_callback=progress_callback,
+            workers=workers,
+        )
 
         # Calculate file tree root hash (after piece layers are built)
         # For v2, the root hash is computed from the file tree structure
         hash_file_tree(file_tree)
 
-        # Build info dictionary
+        # Build info dictionary (hybrid: meta version 3)
         info_dict: dict[bytes, Any] = {
-            b"meta version": 2,
+            b"meta version": 3 if hybrid else 2,
             b"name": name.encode("utf-8"),
             b"piece length": piece_length,
             b"file tree": self._file_tree_to_dict(file_tree),
             b"piece layers": self._piece_layers_to_dict(piece_layers),
         }
 
+        if hybrid:
+            info_dict[b"pieces"] = v1_pieces  # v1 piece hashes (SHA-1)
+
+            # Add v1 file structure for compatibility
+            # For multi-file, add "files" field
+            # For single-file, add "length" field
+            if len(files) == 1:
+                info_dict[b"length"] = files[0][1]
+            else:
+                info_dict[b"files"] = [
+                    {
+                        b"length": file_length,
+                        b"path": [p.encode("utf-8") for p in file_path_str.split("/")],
+                    }
+                    for file_path_str, file_length in sorted(files)
+                ]
+
         # Add private flag if set
         if private:
             info_dict[b"private"] = 1
 
-        # Calculate info hash
-        info_hash_v2 = _calculate_info_hash_v2(info_dict)
+        return info_dict, len(files)
+
+    def _build_torrent_dict(
+        self,
+        info_dict: dict[bytes, Any],
+        trackers: list[str] | None,
+        web_seeds: list[str] | None,
+        comment: str | None,
+        created_by: str,
+    ) -> dict[bytes, Any]:
+        """Wrap an info dictionary with announce and descriptive fields."""
+        import time
 
-        # Build complete torrent dictionary
         torrent_dict: dict[bytes, Any] = {
             b"info": info_dict,
         }
@@ -1509,7 +1627,57 @@ class TorrentV2Parser:
         if web_seeds:
             torrent_dict[b"url-list"] = [seed.encode("utf-8") for seed in web_seeds]
 
+        return torrent_dict
+
+    def generate_v2_torrent(
+        self,
+        source: Path,
+        output: Path | None = None,
+        trackers: list[str] | None = None,
+        web_seeds: list[str] | None = None,
+        comment: str | None = None,
+        created_by: str = "ccBitTorrent",
+        piece_length: int | None = None,
+        private: bool = False,
+        progress_callback: ProgressCallback | None = None,
+    ) -> bytes:
+        """Generate a v2-only torrent file.
+
+        Args:
+            source: Source file or directory path
+            output: Optional output file path (returns bytes if None)
+            trackers: List of tracker announce URLs
+            web_seeds: List of web seed URLs
+            comment: Optional torrent comment
+            created_by: Created by field
+            piece_length: Piece length in bytes (auto-calculated if None)
+            private: Mark torrent as private (BEP 27)
+            progress_callback: Called with (bytes_hashed, total_bytes)
+
+        Returns:
+            Bencoded torrent file as bytes
+
+        Raises:
+            TorrentError: If generation fails
+
+        """
+        self.logger.info("Generating v2 torrent from %s", source)
+
+        info_dict, num_files = self._build_info_dict(
+            source,
+            piece_length,
+            private,
+            hybrid=False,
+            progress_callback=progress_callback,
+        )
+
+        # Calculate info hash
+        info_hash_v2 = _calculate_info_hash_v2(info_dict)
+
         # Encode torrent
+        torrent_dict = self._build_torrent_dict(
+            info_dict, trackers, web_seeds, comment, created_by
+        )
         torrent_bytes = encode(torrent_dict)
 
         # Write to file if output specified
@@ -1522,8 +1690,8 @@ class TorrentV2Parser:
         self.logger.info(
             "Generated v2 torrent: info_hash_v2=%s, %d files, %d piece layers",
             info_hash_v2.hex()[:16],
-            len(files),
-            len(piece_layers),
+            num_files,
+            len(info_dict[b"piece layers"]),
         )
 
         return torrent_bytes
@@ -1538,6 +1706,7 @@ class TorrentV2Parser:
         created_by: str = "ccBitTorrent",
         piece_length: int | None = None,
         private: bool = False,
+        progress_callback: ProgressCallback | None = None,
     ) -> bytes:
         """Generate a hybrid torrent (v1 + v2).
 
@@ -1550,6 +1719,7 @@ class TorrentV2Parser:
             created_by: Created by field
             piece_length: Piece length in bytes (auto-calculated if None)
             private: Mark torrent as private (BEP 27)
+            progress_callback: Called with (bytes_hashed, total_bytes)
 
         Returns:
             Bencoded torrent file as bytes
@@ -1561,97 +1731,16 @@ class TorrentV2Parser:
         for maximum compatibility.
 
         """
-        import time
-
-        from ccbt.piece.hash_v2 import hash_file_tree
-
         self.logger.info("Generating hybrid torrent from %s", source)
 
-        # First generate v2 part (reuse v2 generation logic)
-        # We'll build the v2 structure and then add v1 fields
-
-        # Validate source path
-        if not source.exists():
-            msg = f"Source path does not exist: {source}"
-            raise TorrentError(msg)
-
-        # Calculate piece length if not provided (same as v2)
-        if piece_length is None:
-            total_size = (
-                sum(f.stat().st_size for f in source.rglob("*") if f.is_file())
-                if source.is_dir()
-                else source.stat().st_size
-            )
-            if total_size < 16 * 1024 * 1024:
-                piece_length = 16 * 1024
-            elif total_size < 512 * 1024 * 1024:
-                piece_length = 256 * 1024
-            else:
-                piece_length = 1024 * 1024
-
-        if piece_length & (piece_length - 1) != 0:
-            msg = f"Piece length must be power of 2, got {piece_length}"
-            raise TorrentError(msg)
-
-        # Collect files
-        files = self._collect_files_from_path(source)
-        if not files:
-            msg = f"No files found in source path: {source}"
-            raise TorrentError(msg)
-
-        # Determine torrent name
-        name = source.name if source.is_dir() or source.parent.name else source.stem
-
-        # Build file tree (v2 part)
-        file_tree = self._build_file_tree(
-            files, source if source.is_dir() else source.parent
+        info_dict, num_files = self._build_info_dict(
+            source,
+            piece_length,
+            private,
+            hybrid=True,
+            progress_callback=progress_callback,
         )
 
-        # Build piece layers (v2 part)
-        base_path = source if source.is_dir() else source.parent
-        piece_layers = self.build_piece_layers(file_tree, base_path, piece_length)
-
-        # Calculate file tree root (v2)
-        hash_file_tree(file_tree)
-
-        # Build v1 pieces (SHA-1 hashes)
-        # For hybrid, we need to hash the entire torrent content in v1 pieces
-        # This is more complex - we need to read all files in order and hash pieces
-        v1_pieces = self._build_v1_pieces(source, files, piece_length)
-
-        # Build info dictionary (hybrid: meta version 3)
-        info_dict: dict[bytes, Any] = {
-            b"meta version": 3,  # Hybrid
-            b"name": name.encode("utf-8"),
-            b"piece length": piece_length,
-            b"file tree": self._file_tree_to_dict(file_tree),
-            b"piece layers": self._piece_layers_to_dict(piece_layers),
-            b"pieces": v1_pieces,  # v1 piece hashes (SHA-1)
-        }
-
-        # Add v1 file structure for compatibility
-        # For multi-file, add "files" field
-        # For single-file, add "length" field
-        if len(files) == 1:
-            # Single file
-            info_dict[b"length"] = files[0][1]
-        else:
-            # Multi-file: build v1 files structure
-            v1_files = []
-            for file_path_str, file_length in files:
-                path_parts = file_path_str.split("/")
-                v1_files.append(
-                    {
-                        b"length": file_length,
-                        b"path": [p.encode("utf-8") for p in path_parts],
-                    }
-                )
-            info_dict[b"files"] = v1_files
-
-        # Add private flag
-        if private:
-            info_dict[b"private"] = 1
-
         # Calculate both info hashes
         info_hash_v2 = _calculate_info_hash_v2(info_dict)
         info_hash_v1 = _calculate_info_hash_v1(info_dict)
@@ -1660,30 +1749,10 @@ class TorrentV2Parser:
             msg = "Failed to calculate v1 info hash for hybrid torrent"
             raise TorrentError(msg)
 
-        # Build complete torrent dictionary
-        torrent_dict: dict[bytes, Any] = {
-            b"info": info_dict,
-        }
-
-        # Add announce
-        if trackers and trackers[0]:
-            torrent_dict[b"announce"] = trackers[0].encode("utf-8")
-
-        if trackers and len(trackers) > 1:
-            torrent_dict[b"announce-list"] = [
-                [tracker.encode("utf-8")] for tracker in trackers
-            ]
-
-        # Add optional fields
-        if comment:
-            torrent_dict[b"comment"] = comment.encode("utf-8")
-        torrent_dict[b"created by"] = created_by.encode("utf-8")
-        torrent_dict[b"creation date"] = int(time.time())
-
-        if web_seeds:
-            torrent_dict[b"url-list"] = [seed.encode("utf-8") for seed in web_seeds]
-
         # Encode torrent
+        torrent_dict = self._build_torrent_dict(
+            info_dict, trackers, web_seeds, comment, created_by
+        )
         torrent_bytes = encode(torrent_dict)
 
         # Write to file if output specified
@@ -1697,13 +1766,102 @@ class TorrentV2Parser:
             "Generated hybrid torrent: info_hash_v1=%s, info_hash_v2=%s, %d files",
             info_hash_v1.hex()[:16],
             info_hash_v2.hex()[:16],
-            len(files),
+            num_files,
         )
 
         return torrent_bytes
 
+    def create_torrent_file(
+        self,
+        source: Path,
+        output: Path,
+        *,
+        hybrid: bool = False,
+        trackers: list[str] | None = None,
+        web_seeds: list[str] | None = None,
+        comment: str | None = None,
+        created_by: str = "ccBitTorrent",
+        piece_length: int | None = None,
+        private: bool = False,
+        progress_callback: ProgressCallback | None = None,
+        workers: int | None = None,
+    ) -> tuple[bytes | None, bytes]:
+        """Create a v2 or hybrid torrent and stream it to ``output``.
+
+        Unlike :meth:`generate_v2_torrent` and :meth:`generate_hybrid_torrent`,
+        the encoded torrent is never assembled in memory: info hashes are
+        computed from the bencoded stream and the file is written
+        incrementally, then moved into place.
+
+        Args:
+            source: Source file or directory path
+            output: Output torrent file path
+            hybrid: Create a hybrid (v1 + v2) torrent instead of v2-only
+            trackers: List of tracker announce URLs
+            web_seeds: List of web seed URLs
+            comment: Optional torrent comment
+            created_by: Created by field
+            piece_length: Piece length in bytes (auto-calculated if None)
+            private: Mark torrent as private (BEP 27)
+            progress_callback: Called with (bytes_hashed, total_bytes)
+            workers: Number of hash threads (defaults to CPU count)
+
+        Returns:
+            Tuple of (info_hash_v1 or None for v2-only, info_hash_v2)
+
+        Raises:
+            TorrentError: If generation fails
+
+        """
+        self.logger.info(
+            "Creating %s torrent from %s", "hybrid" if hybrid else "v2", source
+        )
+
+        info_dict, num_files = self._build_info_dict(
+            source,
+            piece_length,
+            private,
+            hybrid=hybrid,
+            progress_callback=progress_callback,
+            workers=workers,
+        )
+
+        info_hash_v2 = _calculate_info_hash_v2(info_dict)
+        info_hash_v1 = _calculate_info_hash_v1(info_dict) if hybrid else None
+        if hybrid and info_hash_v1 is None:
+            msg = "Failed to calculate v1 info hash for hybrid torrent"
+            raise TorrentError(msg)
+
+        torrent_dict = self._build_torrent_dict(
+            info_dict, trackers, web_seeds, comment, created_by
+        )
+
+        output.parent.mkdir(parents=True, exist_ok=True)
+        partial = output.with_name(output.name + ".part")
+        try:
+            with open(partial, "wb") as f:
+                encode_to(torrent_dict, f)
+            partial.replace(output)
+        except OSError as e:
+            partial.unlink(missing_ok=True)
+            msg = f"Error writing torrent file {output}: {e}"
+            raise TorrentError(msg) from e
+
+        self.logger.info(
+            "Created torrent %s: info_hash_v2=%s, %d files",
+            output,
+            info_hash_v2.hex()[:16],
+            num_files,
+        )
+
+        return info_hash_v1, info_hash_v2
+
     def _build_v1_pieces(
-        self, source: Path, files: list[tuple[str, int]], piece_length: int
+        self,
+        source: Path,
+        files: list[tuple[str, int]],
+        piece_length: int,
+        progress_callback: ProgressCallback | None = None,
     ) -> bytes:
         """Build v1 piece hashes (SHA-1) for hybrid torrent.
 
@@ -1711,6 +1869,7 @@ class TorrentV2Parser:
             source: Source file or directory
             files: List of (relative_path, file_size) tuples
             piece_length: Piece length in bytes
+            progress_callback: Called with (bytes_hashed, total_bytes)
 
         Returns:
             Concatenated SHA-1 piece hashes (20 bytes each)
@@ -1719,54 +1878,22 @@ class TorrentV2Parser:
         divided into pieces of piece_length.
 
         """
-        import hashlib
-
-        pieces: list[bytes] = []
-        current_piece = bytearray()
-        bytes_in_current_piece = 0
-
         base_path = source if source.is_dir() else source.parent
 
         # Read all files in order and hash pieces across file boundaries
+        paths: list[Path] = []
         for file_path_str, _file_length in sorted(files):
             file_path = base_path / file_path_str
-
             if not file_path.exists() or not file_path.is_file():
                 self.logger.warning("Skipping missing file: %s", file_path)
                 continue
+            paths.append(file_path)
 
-            try:
-                with open(file_path, "rb") as f:
-                    while True:
-                        # Read data to fill current piece or start new piece
-                        remaining = piece_length - bytes_in_current_piece
-                        data = f.read(remaining)
-                        if not data:
-                            break
-
-                        current_piece.extend(data)
-                        bytes_in_current_piece += len(data)
-
-                        # If piece is complete, hash it
-                        if bytes_in_current_piece >= piece_length:
-                            piece_hash = hashlib.sha1(
-                                bytes(current_piece[:piece_length])
-                            ).digest()  # nosec B324 - SHA-1 required for v1 compatibility
-                            pieces.append(piece_hash)
-
-                            # Keep remainder for next piece
-                            remainder = current_piece[piece_length:]
-                            current_piece = bytearray(remainder)
-                            bytes_in_current_piece = len(remainder)
-
-            except OSError as e:
-                msg = f"Error reading file {file_path} for v1 pieces: {e}"
-                raise TorrentError(msg) from e
-
-        # Hash final partial piece if exists
-        if bytes_in_current_piece > 0:
-            piece_hash = hashlib.sha1(bytes(current_piece)).digest()  # nosec B324 - SHA-1 required for v1 compatibility
-            pieces.append(piece_hash)
-
-        # Concatenate all piece hashes
-        return b"".join(pieces)
+        hasher = TorrentHasher(
+            piece_length, v2=False, progress_callback=progress_callback
+        )
+        try:
+            return hasher.hash_files(paths).v1_pieces
+        except OSError as e:
+            msg = f"Error reading file {e.filename or source} for v1 pieces: {e}"
+            raise TorrentError(msg) from e
@@ -12,17 +12,30 @@ import contextlib
 import json
 import logging
 import os
+import socket
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
+from urllib.parse import urlsplit
 
 import aiohttp
 
+try:
+    import msgpack
+except ImportError:
+    msgpack = None  # type: ignore[assignment]
+
 from ccbt.daemon.ipc_protocol import (
     API_BASE_PATH,
     API_KEY_HEADER,
+    IPC_SOCKET_NAME,
+    MSGPACK_CONTENT_TYPE,
     PUBLIC_KEY_HEADER,
     SIGNATURE_HEADER,
     TIMESTAMP_HEADER,
+    BatchOperation,
+    BatchRequest,
+    BatchResponse,
+    BatchResult,
     BlacklistAddRequest,
     BlacklistResponse,
     EventType,
@@ -35,9 +48,13 @@ from ccbt.daemon.ipc_protocol import (
     GlobalStatsResponse,
     ImportStateRequest,
     IPFilterStatsResponse,
+    LoopHealthResponse,
     NATMapRequest,
     NATStatusResponse,
     PeerListResponse,
+    PeerPageResponse,
+    ProfileStartRequest,
+    ProfileStatusResponse,
     ProtocolInfo,
     QueueAddRequest,
     QueueListResponse,
@@ -47,9 +64,12 @@ from ccbt.daemon.ipc_protocol import (
     ScrapeListResponse,
     ScrapeRequest,
     ScrapeResult,
+    StatusDelta,
     StatusResponse,
+    StatusSubscribeRequest,
     TorrentAddRequest,
     TorrentListResponse,
+    TorrentPageResponse,
     TorrentStatusResponse,
     WebSocketEvent,
     WebSocketMessage,
@@ -58,8 +78,14 @@ from ccbt.daemon.ipc_protocol import (
     WhitelistResponse,
 )
 
+if TYPE_CHECKING:
+    from ccbt.session.torrent_index import ListQuery
+
 logger = logging.getLogger(__name__)
 
+# Hosts for which the daemon's Unix socket may be used instead of TCP
+_LOCAL_HOSTS = frozenset({"127.0.0.1", "localhost", "::1"})
+
 
 class IPCClient:
     """IPC client for communicating with daemon via HTTP REST and WebSocket."""
@@ -70,6 +96,7 @@ class IPCClient:
         base_url: str | None = None,
         key_manager: Any = None,  # Ed25519KeyManager
         timeout: float = 30.0,
+        socket_path: str | Path | None = None,
     ):
         """Initialize IPC client.
 
@@ -78,16 +105,26 @@ class IPCClient:
             base_url: Base URL for daemon (if None, will construct from config or default)
             key_manager: Optional Ed25519KeyManager for cryptographic authentication
             timeout: Request timeout in seconds
+            socket_path: Daemon's Unix socket (if None, will read from config).
+                Used instead of TCP when the daemon is local and listening on it.
 
         """
         self.api_key = api_key
         self.key_manager = key_manager
         self.base_url = base_url or self._get_default_url()
         self.timeout = aiohttp.ClientTimeout(total=timeout)
+        self.socket_path = (
+            Path(socket_path).expanduser()
+            if socket_path is not None
+            else self._get_default_socket_path()
+        )
+        # Transport of the current session: "unix" or "tcp"
+        self.transport: str | None = None
 
         self._session: aiohttp.ClientSession | None = None
         self._websocket: aiohttp.ClientWebSocketResponse | None = None
         self._websocket_task: asyncio.Task | None = None
+        self._websocket_messages: asyncio.Queue[dict[str, Any]] | None = None
 
     def _get_default_url(self) -> str:
         """Get default daemon URL from config or environment.
@@ -124,12 +161,110 @@ class IPCClient:
         # Default
         return "http://127.0.0.1:8080"
 
+    def _get_default_socket_path(self) -> Path | None:
+        """Get the daemon's Unix socket path from config (None if disabled)."""
+        state_dir = Path.home() / ".ccbt" / "daemon"
+        try:
+            from ccbt.config.config import get_config
+
+            cfg = get_config()
+            if cfg.daemon:
+                if not cfg.daemon.ipc_socket_enabled:
+                    return None
+                if cfg.daemon.ipc_socket_path:
+                    return Path(cfg.daemon.ipc_socket_path).expanduser()
+                if cfg.daemon.state_dir:
+                    state_dir = Path(cfg.daemon.state_dir).expanduser()
+        except Exception as e:
+            logger.debug("Could not read daemon config from ConfigManager: %s", e)
+        return state_dir / IPC_SOCKET_NAME
+
+    async def _unix_socket_available(self) -> bool:
+        """Check whether the daemon accepts connections on its Unix socket."""
+        if self.socket_path is None or not hasattr(socket, "AF_UNIX"):
+            return False
+        if urlsplit(self.base_url).hostname not in _LOCAL_HOSTS:
+            return False
+        try:
+            _reader, writer = await asyncio.wait_for(
+                asyncio.open_unix_connection(str(self.socket_path)), timeout=0.5
+            )
+        except (OSError, asyncio.TimeoutError):
+            return False
+        writer.close()
+        with contextlib.suppress(OSError):
+            await writer.wait_closed()
+        return True
+
     async def _ensure_session(self) -> aiohttp.ClientSession:
-        """Ensure HTTP session is created."""
+        """Ensure HTTP session is created.
+
+        The session keeps its connections open between requests. It goes
+        over the daemon's Unix socket when available, otherwise over TCP.
+        """
         if self._session is None or self._session.closed:
-            self._session = aiohttp.ClientSession(timeout=self.timeout)
+            if await self._unix_socket_available():
+                self.transport = "unix"
+                self._session = aiohttp.ClientSession(
+                    connector=aiohttp.UnixConnector(path=str(self.socket_path)),
+                    timeout=self.timeout,
+                )
+            else:
+                self.transport = "tcp"
+                self._session = aiohttp.ClientSession(timeout=self.timeout)
+            logger.debug("IPC client using %s transport", self.transport)
         return self._session
 
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        payload: Any = None,
+        not_found_ok: bool = False,
+        params: dict[str, str] | None = None,
+    ) -> Any:
+        """Send a request and decode the response.
+
+        Over the Unix socket, request and response bodies are msgpack
+        rather than JSON (when msgpack is installed).
+
+        Args:
+            method: HTTP method
+            path: Request path (starting with API_BASE_PATH)
+            payload: Request body, encoded by this method
+            not_found_ok: Return None on 404 instead of raising
+            params: URL query parameters
+
+        Returns:
+            Decoded response body
+
+        Raises:
+            aiohttp.ClientError: If connection fails or daemon returns error
+
+        """
+        session = await self._ensure_session()
+        binary = self.transport == "unix" and msgpack is not None
+        body: bytes | None = None
+        if payload is not None:
+            body = msgpack.packb(payload) if binary else json.dumps(payload).encode()
+        headers = self._get_headers(method, path, body)
+        if body is not None:
+            headers["Content-Type"] = (
+                MSGPACK_CONTENT_TYPE if binary else "application/json"
+            )
+        if binary:
+            headers["Accept"] = MSGPACK_CONTENT_TYPE
+
+        async with session.request(
+            method, f"{self.base_url}{path}", data=body, headers=headers, params=params
+        ) as resp:
+            if not_found_ok and resp.status == 404:
+                return None
+            resp.raise_for_status()
+            if resp.content_type == MSGPACK_CONTENT_TYPE and msgpack is not None:
+                return msgpack.unpackb(await resp.read(), strict_map_key=False)
+            return await resp.json()
+
     def _get_headers(
         self, method: str = "GET", path: str = "", body: bytes | None = None
     ) -> dict[str, str]:
@@ -207,14 +342,8 @@ class IPCClient:
 
     async def get_status(self) -> StatusResponse:
         """Get daemon status."""
-        session = await self._ensure_session()
-        url = f"{self.base_url}{API_BASE_PATH}/status"
-        path = f"{API_BASE_PATH}/status"
-
-        async with session.get(url, headers=self._get_headers("GET", path)) as resp:
-            resp.raise_for_status()
-            data = await resp.json()
-            return StatusResponse(**data)
+        data = await self._request("GET", f"{API_BASE_PATH}/status")
+        return StatusResponse(**data)
 
     async def add_torrent(
         self,
@@ -236,9 +365,6 @@ class IPCClient:
             aiohttp.ClientError: If connection fails or daemon returns error
 
         """
-        session = await self._ensure_session()
-        url = f"{self.base_url}{API_BASE_PATH}/torrents/add"
-
         req = TorrentAddRequest(
             path_or_magnet=path_or_magnet,
             output_dir=output_dir,
@@ -246,18 +372,10 @@ class IPCClient:
         )
 
         try:
-            import json as json_lib
-
-            body_json = json_lib.dumps(req.model_dump()).encode()
-            path = f"{API_BASE_PATH}/torrents/add"
-            async with session.post(
-                url,
-                json=req.model_dump(),
-                headers=self._get_headers("POST", path, body_json),
-            ) as resp:
-                resp.raise_for_status()
-                data = await resp.json()
-                return data["info_hash"]
+            data = await self._request(
+                "POST", f"{API_BASE_PATH}/torrents/add", req.model_dump()
+            )
+            return data["info_hash"]
         except aiohttp.ClientConnectorError as e:
             # Connection refused - daemon not running or IPC server not accessible
             logger.error(
@@ -305,14 +423,10 @@ class IPCClient:
             True if removed, False otherwise
 
         """
-        session = await self._ensure_session()
-        url = f"{self.base_url}{API_BASE_PATH}/torrents/{info_hash}"
-
-        async with session.delete(url, headers=self._get_headers()) as resp:
-            if resp.status == 404:
-                return False
-            resp.raise_for_status()
-            return True
+        data = await self._request(
+            "DELETE", f"{API_BASE_PATH}/torrents/{info_hash}", not_found_ok=True
+        )
+        return data is not None
 
     async def list_torrents(self) -> list[TorrentStatusResponse]:
         """List all torrents.
@@ -321,14 +435,23 @@ class IPCClient:
             List of torrent status responses
 
         """
-        session = await self._ensure_session()
-        url = f"{self.base_url}{API_BASE_PATH}/torrents"
+        data = await self._request("GET", f"{API_BASE_PATH}/torrents")
+        return TorrentListResponse(**data).torrents
 
-        async with session.get(url, headers=self._get_headers()) as resp:
-            resp.raise_for_status()
-            data = await resp.json()
-            response = TorrentListResponse(**data)
-            return response.torrents
+    async def query_torrents(self, query: ListQuery) -> TorrentPageResponse:
+        """List torrents filtered, sorted, paged and projected by the daemon.
+
+        Args:
+            query: Filters, sort order, page and fields
+
+        Returns:
+            One page of torrent rows carrying only the requested fields
+
+        """
+        data = await self._request(
+            "GET", f"{API_BASE_PATH}/torrents", params=query.to_params()
+        )
+        return TorrentPageResponse(**data)
 
     async def get_torrent_status(self, info_hash: str) -> TorrentStatusResponse | None:
         """Get torrent status.
@@ -340,15 +463,10 @@ class IPCClient:
             Torrent status response or None if not found
 
         """
-        session = await self._ensure_session()
-        url = f"{self.base_url}{API_BASE_PATH}/torrents/{info_hash}"
-
-        async with session.get(url, headers=self._get_headers()) as resp:
-            if resp.status == 404:
-                return None
-            resp.raise_for_status()
-            data = await resp.json()
-            return TorrentStatusResponse(**data)
+        data = await self._request(
+            "GET", f"{API_BASE_PATH}/torrents/{info_hash}", not_found_ok=True
+        )
+        return TorrentStatusResponse(**data) if data is not None else None
 
     async def pause_torrent(self, info_hash: str) -> bool:
         """Pause torrent.
@@ -360,14 +478,10 @@ class IPCClient:
             True if paused, False otherwise
 
         """
-        session = await self._ensure_session()
-        url = f"{self.base_url}{API_BASE_PATH}/torrents/{info_hash}/pause"
-
-        async with session.post(url, headers=self._get_headers()) as resp:
-            if resp.status == 404:
-                return False
-            resp.raise_for_status()
-            return True
+        data = await self._request(
+            "POST", f"{API_BASE_PATH}/torrents/{info_hash}/pause", not_found_ok=True
+        )
+        return data is not None
 
     async def resume_torrent(self, info_hash: str) -> bool:
         """Resume torrent.
@@ -379,14 +493,26 @@ class IPCClient:
             True if resumed, False otherwise
 
         """
-        session = await self._ensure_session()
-        url = f"{self.base_url}{API_BASE_PATH}/torrents/{info_hash}/resume"
+        data = await self._request(
+            "POST", f"{API_BASE_PATH}/torrents/{info_hash}/resume", not_found_ok=True
+        )
+        return data is not None
 
-        async with session.post(url, headers=self._get_headers()) as resp:
-            if resp.status == 404:
-                return False
-            resp.raise_for_status()
-            return True
+    async def batch(self, operations: list[BatchOperation]) -> list[BatchResult]:
+        """Run several torrent operations in one request.
+
+        Args:
+            operations: Operations to run, in order
+
+        Returns:
+            One result per operation, in the same order
+
+        """
+        req = BatchRequest(operations=operations)
+        data = await self._request(
+            "POST", f"{API_BASE_PATH}/batch", req.model_dump(exclude_none=True)
+        )
+        return BatchResponse(**data).results
 
     async def get_config(self) -> dict[str, Any]:
         """Get current config.
@@ -1079,6 +1205,24 @@ class IPCClient:
             data = await resp.json()
             return PeerListResponse(**data)
 
+    async def query_peers(self, info_hash: str, query: ListQuery) -> PeerPageResponse:
+        """List a torrent's peers sorted, paged and projected by the daemon.
+
+        Args:
+            info_hash: Torrent info hash (hex string)
+            query: Sort order, page and fields
+
+        Returns:
+            One page of peer rows carrying only the requested fields
+
+        """
+        data = await self._request(
+            "GET",
+            f"{API_BASE_PATH}/torrents/{info_hash}/peers",
+            params=query.to_params(),
+        )
+        return PeerPageResponse(**data)
+
     async def set_rate_limits(
         self,
         info_hash: str,
@@ -1219,8 +1363,63 @@ class IPCClient:
             data = await resp.json()
             return GlobalStatsResponse(**data)
 
+    # Debug Methods
+
+    async def get_loop_health(self) -> LoopHealthResponse:
+        """Get event loop lag, slow callbacks, task counts and job stats.
+
+        Returns:
+            Loop health response
+
+        """
+        data = await self._request("GET", f"{API_BASE_PATH}/debug/loop")
+        return LoopHealthResponse(**data)
+
+    async def get_profile_status(self) -> ProfileStatusResponse:
+        """Get the state of the daemon's stack sampler.
+
+        Returns:
+            Profile status response
+
+        """
+        data = await self._request("GET", f"{API_BASE_PATH}/debug/profile")
+        return ProfileStatusResponse(**data)
+
+    async def start_profile(
+        self, interval: float | None = None
+    ) -> ProfileStatusResponse:
+        """Start sampling the daemon's stacks.
+
+        Args:
+            interval: Seconds between samples (daemon default if None)
+
+        Returns:
+            Profile status response
+
+        """
+        req = ProfileStartRequest(interval=interval)
+        data = await self._request(
+            "POST", f"{API_BASE_PATH}/debug/profile/start", req.model_dump()
+        )
+        return ProfileStatusResponse(**data)
+
+    async def stop_profile(self) -> ProfileStatusResponse:
+        """Stop sampling and write the collapsed stacks on the daemon's host.
+
+        Returns:
+            Profile status response with the ``path`` written
+
+        """
+        data = await self._request("POST", f"{API_BASE_PATH}/debug/profile/stop")
+        return ProfileStatusResponse(**data)
+
     # WebSocket Methods
 
+    @property
+    def websocket_connected(self) -> bool:
+        """Whether the WebSocket connection is open."""
+        return self._websocket is not None and not self._websocket.closed
+
     async def connect_websocket(self) -> bool:
         """Establish WebSocket connection.
 
@@ -1261,6 +1460,7 @@ class IPCClient:
                 ws_url = f"{ws_url}{ws_path}?api_key={self.api_key}"
 
             self._websocket = await session.ws_connect(ws_url)
+            self._websocket_messages = asyncio.Queue()
 
             # Start receive task
             self._websocket_task = asyncio.create_task(self._websocket_receive_loop())
@@ -1296,29 +1496,63 @@ class IPCClient:
             logger.exception("Error subscribing to events: %s", e)
             return False
 
-    async def receive_event(self, timeout: float = 1.0) -> WebSocketEvent | None:
-        """Receive event from WebSocket.
+    async def subscribe_status(
+        self,
+        interval: float = 1.0,
+        fields: list[str] | None = None,
+    ) -> bool:
+        """Subscribe to the torrent status stream.
+
+        The daemon first sends every torrent's status, then only the fields
+        that changed, at most once per ``interval``. Updates are returned by
+        ``receive_event()`` as ``StatusDelta`` messages.
 
         Args:
-            timeout: Timeout in seconds
+            interval: Seconds between status updates
+            fields: Torrent status fields to stream (all fields if None)
 
         Returns:
-            WebSocket event or None if timeout
+            True if subscribed, False otherwise
 
         """
         if not self._websocket or self._websocket.closed:
-            return None
+            if not await self.connect_websocket():
+                return False
 
         try:
-            msg = await asyncio.wait_for(
-                self._websocket.receive(),
-                timeout=timeout,
-            )
+            req = StatusSubscribeRequest(interval=interval, fields=fields)
+            message = WebSocketMessage(action="subscribe_status", data=req.model_dump())
+
+            if self._websocket and not self._websocket.closed:
+                await self._websocket.send_json(message.model_dump())
+                return True
+            return False
+        except Exception:
+            logger.exception("Error subscribing to status stream")
+            return False
+
+    async def receive_event(
+        self, timeout: float = 1.0
+    ) -> WebSocketEvent | StatusDelta | None:
+        """Receive event or status update from WebSocket.
 
-            if msg.type == aiohttp.WSMsgType.TEXT:
-                data = json.loads(msg.data)
-                if "type" in data and "timestamp" in data:
-                    return WebSocketEvent(**data)
+        Args:
+            timeout: Timeout in seconds
+
+        Returns:
+            WebSocket event, status update, or None if timeout
+
+        """
+        messages = self._websocket_messages
+        if messages is None:
+            return None
+
+        try:
+            data = await asyncio.wait_for(messages.get(), timeout=timeout)
+            if data.get("action") == "status":
+                return StatusDelta(**data)
+            if "type" in data and "timestamp" in data:
+                return WebSocketEvent(**data)
 
             return None
         except asyncio.TimeoutError:
@@ -1332,11 +1566,12 @@ class IPCClient:
         if not self._websocket:
             return
 
+        messages = self._websocket_messages
         try:
             async for msg in self._websocket:
-                if msg.type == aiohttp.WSMsgType.TEXT:
-                    # Messages are handled by receive_event
-                    pass
+                if msg.type == aiohttp.WSMsgType.TEXT and messages is not None:
+                    # Messages are handed out by receive_event
+                    messages.put_nowait(json.loads(msg.data))
                 elif msg.type == aiohttp.WSMsgType.ERROR:
                     logger.warning("WebSocket error: %s", self._websocket.exception())
                     break
@@ -1348,9 +1583,10 @@ class IPCClient:
     async def _close_websocket(self) -> None:
         """Close WebSocket connection."""
         if self._websocket_task:
-            self._websocket_task.cancel()
-            with contextlib.suppress(asyncio.CancelledError):
-                await self._websocket_task
+            if self._websocket_task is not asyncio.current_task():
+                self._websocket_task.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await self._websocket_task
             self._websocket_task = None
 
         if self._websocket and not self._websocket.closed:
@@ -8,7 +8,7 @@ Defines constants, models, and types for HTTP REST and WebSocket IPC communicati
 from __future__ import annotations
 
 from enum import Enum
-from typing import Any
+from typing import Any, Literal
 
 from pydantic import BaseModel, Field
 
@@ -18,6 +18,8 @@ API_KEY_HEADER = "X-CCBT-API-Key"
 SIGNATURE_HEADER = "X-CCBT-Signature"
 PUBLIC_KEY_HEADER = "X-CCBT-Public-Key"
 TIMESTAMP_HEADER = "X-CCBT-Timestamp"
+MSGPACK_CONTENT_TYPE = "application/msgpack"
+IPC_SOCKET_NAME = "ipc.sock"  # Unix socket file in the daemon state directory
 
 
 class EventType(str, Enum):
@@ -52,6 +54,42 @@ class TorrentAddRequest(BaseModel):
     resume: bool = Field(False, description="Resume from checkpoint if available")
 
 
+class BatchOperation(BaseModel):
+    """One operation of a batch request."""
+
+    op: Literal["add", "remove", "pause", "resume", "status"] = Field(
+        ..., description="Operation to perform"
+    )
+    info_hash: str | None = Field(
+        None, description="Torrent info hash (hex), for all but add"
+    )
+    path_or_magnet: str | None = Field(
+        None, description="Torrent file path or magnet URI, for add"
+    )
+    output_dir: str | None = Field(None, description="Output directory override")
+    resume: bool = Field(False, description="Resume from checkpoint if available")
+
+
+class BatchRequest(BaseModel):
+    """Request carrying several operations, run in order."""
+
+    operations: list[BatchOperation] = Field(..., description="Operations to run")
+
+
+class BatchResult(BaseModel):
+    """Outcome of one batch operation."""
+
+    success: bool = Field(..., description="Whether the operation succeeded")
+    data: dict[str, Any] = Field(default_factory=dict, description="Result data")
+    error: str | None = Field(None, description="Error message if it failed")
+
+
+class BatchResponse(BaseModel):
+    """Batch response, one result per operation in request order."""
+
+    results: list[BatchResult] = Field(..., description="Operation results")
+
+
 class TorrentStatusResponse(BaseModel):
     """Torrent status response."""
 
@@ -78,6 +116,23 @@ class TorrentListResponse(BaseModel):
     )
 
 
+class TorrentPageResponse(BaseModel):
+    """One page of a filtered, sorted and projected torrent listing.
+
+    Returned by ``GET /api/v1/torrents`` when any of ``fields``, ``limit``,
+    ``cursor``, ``sort``, ``state``, ``min_ratio`` or ``max_ratio`` is given.
+    Rows carry ``info_hash`` plus the requested fields.
+    """
+
+    torrents: list[dict[str, Any]] = Field(
+        default_factory=list, description="Torrent rows (requested fields only)"
+    )
+    total: int = Field(0, description="Number of torrents matching the filters")
+    next_cursor: str | None = Field(
+        None, description="Cursor for the next page (None on the last page)"
+    )
+
+
 class PeerInfo(BaseModel):
     """Peer information."""
 
@@ -97,6 +152,24 @@ class PeerListResponse(BaseModel):
     count: int = Field(0, description="Number of peers")
 
 
+class PeerPageResponse(BaseModel):
+    """One page of a sorted and projected peer listing.
+
+    Returned by ``GET /api/v1/torrents/{info_hash}/peers`` when any of
+    ``fields``, ``limit``, ``cursor`` or ``sort`` is given. Rows carry ``ip``
+    and ``port`` plus the requested fields.
+    """
+
+    info_hash: str = Field(..., description="Torrent info hash")
+    peers: list[dict[str, Any]] = Field(
+        default_factory=list, description="Peer rows (requested fields only)"
+    )
+    total: int = Field(0, description="Number of peers")
+    next_cursor: str | None = Field(
+        None, description="Cursor for the next page (None on the last page)"
+    )
+
+
 class RateLimitRequest(BaseModel):
     """Request to set rate limits."""
 
@@ -166,6 +239,38 @@ class WebSocketEvent(BaseModel):
     data: dict[str, Any] = Field(default_factory=dict, description="Event data")
 
 
+class StatusSubscribeRequest(BaseModel):
+    """Torrent status stream subscription request."""
+
+    interval: float = Field(
+        1.0, ge=0.1, le=3600.0, description="Seconds between status updates"
+    )
+    fields: list[str] | None = Field(
+        None,
+        description="Torrent status fields to stream (all fields if omitted)",
+    )
+
+
+class StatusDelta(BaseModel):
+    """Torrent status fields changed since the subscriber's last update."""
+
+    action: str = Field("status", description="Message action")
+    version: int = Field(..., description="Snapshot version of this update")
+    full: bool = Field(
+        False, description="Whether this update replaces all known torrents"
+    )
+    torrents: dict[str, dict[str, Any]] = Field(
+        default_factory=dict,
+        description="Changed fields per torrent, keyed by info hash",
+    )
+    removed: list[str] = Field(
+        default_factory=list, description="Info hashes of removed torrents"
+    )
+    global_stats: dict[str, Any] = Field(
+        default_factory=dict, description="Changed global statistics"
+    )
+
+
 # File Selection Models
 class FileInfo(BaseModel):
     """File information."""
@@ -371,3 +476,45 @@ class ProtocolInfo(BaseModel):
     details: dict[str, Any] = Field(
         default_factory=dict, description="Protocol-specific details"
     )
+
+
+# Debug Models
+class LoopHealthResponse(BaseModel):
+    """Event loop health response."""
+
+    lag: dict[str, Any] = Field(
+        default_factory=dict,
+        description="Loop lag statistics in seconds (last, max, mean, samples, buckets)",
+    )
+    slow_callbacks: list[dict[str, Any]] = Field(
+        default_factory=list,
+        description="Recent slow callbacks with task name, duration and stack",
+    )
+    tasks: dict[str, int] = Field(
+        default_factory=dict, description="Pending asyncio tasks by name"
+    )
+    total_tasks: int = Field(0, description="Total pending asyncio tasks")
+    scheduler: dict[str, Any] = Field(
+        default_factory=dict, description="Periodic job statistics by job name"
+    )
+
+
+class ProfileStartRequest(BaseModel):
+    """Stack sampler start request."""
+
+    interval: float | None = Field(
+        None, gt=0, description="Seconds between samples (configured default if None)"
+    )
+
+
+class ProfileStatusResponse(BaseModel):
+    """Stack sampler status response."""
+
+    running: bool = Field(..., description="Whether the sampler is running")
+    interval: float = Field(0.0, description="Seconds between samples")
+    started: float | None = Field(None, description="Sampling start time")
+    samples: int = Field(0, description="Number of samples taken")
+    stacks: int = Field(0, description="Number of distinct stacks")
+    path: str | None = Field(
+        None, description="Collapsed stacks file (set when the run stops)"
+    )
@@ -11,11 +11,16 @@ from __future__ import annotations
 import asyncio
 import contextlib
 import hashlib
+import json
 import logging
 import os
+import socket
 import ssl
+import struct
 import sys
 import time
+from contextvars import ContextVar
+from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 import aiohttp
@@ -32,6 +37,11 @@ except ImportError:
     NoEncryption = None  # type: ignore[assignment, misc]
     PrivateFormat = None  # type: ignore[assignment, misc]
 
+try:
+    import msgpack
+except ImportError:
+    msgpack = None  # type: ignore[assignment]
+
 if TYPE_CHECKING:
     from aiohttp.web_request import Request
     from aiohttp.web_response import Response
@@ -43,9 +53,14 @@ else:
 from ccbt.daemon.ipc_protocol import (
     API_BASE_PATH,
     API_KEY_HEADER,
+    MSGPACK_CONTENT_TYPE,
     PUBLIC_KEY_HEADER,
     SIGNATURE_HEADER,
     TIMESTAMP_HEADER,
+    BatchOperation,
+    BatchRequest,
+    BatchResponse,
+    BatchResult,
     BlacklistAddRequest,
     BlacklistResponse,
     ErrorResponse,
@@ -58,25 +73,84 @@ from ccbt.daemon.ipc_protocol import (
     GlobalStatsResponse,
     ImportStateRequest,
     IPFilterStatsResponse,
+    LoopHealthResponse,
     NATMapRequest,
     PeerListResponse,
+    PeerPageResponse,
+    ProfileStartRequest,
+    ProfileStatusResponse,
     QueueAddRequest,
     QueueMoveRequest,
     RateLimitRequest,
     ResumeCheckpointRequest,
     ScrapeRequest,
     StatusResponse,
+    StatusSubscribeRequest,
     TorrentAddRequest,
     TorrentListResponse,
+    TorrentPageResponse,
     WebSocketEvent,
     WebSocketMessage,
     WebSocketSubscribeRequest,
     WhitelistAddRequest,
     WhitelistResponse,
 )
+from ccbt.daemon.status_stream import (
+    StatusSnapshot,
+    StatusSubscription,
+    WebSocketOutbox,
+)
+from ccbt.session.torrent_index import ListQuery
 
 logger = logging.getLogger(__name__)
 
+# Whether the request being handled asked for msgpack responses
+_msgpack_response: ContextVar[bool] = ContextVar("ipc_msgpack_response", default=False)
+
+
+def ipc_response(data: Any, status: int = 200) -> Response:
+    """Build a response in the encoding the client accepts (msgpack or JSON)."""
+    if msgpack is not None and _msgpack_response.get():
+        return web.Response(  # type: ignore[attr-defined]
+            body=msgpack.packb(data, default=str),
+            status=status,
+            content_type=MSGPACK_CONTENT_TYPE,
+        )
+    return web.json_response(data, status=status)  # type: ignore[attr-defined]
+
+
+async def read_request_body(request: Request) -> Any:
+    """Decode a msgpack or JSON request body.
+
+    Raises:
+        ValueError: If the body is not valid msgpack or JSON
+
+    """
+    if request.content_type == MSGPACK_CONTENT_TYPE and msgpack is not None:
+        return msgpack.unpackb(await request.read(), strict_map_key=False)
+    return await request.json()
+
+
+def is_unix_socket_peer(request: Request) -> bool:
+    """Whether the request came over the Unix socket from the daemon's user.
+
+    The socket file is only accessible to its owner; where the platform
+    reports peer credentials, the peer's UID is checked as well.
+    """
+    transport = request.transport
+    sock = transport.get_extra_info("socket") if transport is not None else None
+    if sock is None or sock.family != getattr(socket, "AF_UNIX", None):
+        return False
+    peercred = getattr(socket, "SO_PEERCRED", None)
+    if peercred is None:
+        return True
+    try:
+        creds = sock.getsockopt(socket.SOL_SOCKET, peercred, struct.calcsize("3i"))
+    except OSError:
+        return False
+    _pid, uid, _gid = struct.unpack("3i", creds)
+    return uid == os.getuid()
+
 
 class IPCServer:
     """IPC server for daemon communication via HTTP REST and WebSocket."""
@@ -91,6 +165,7 @@ class IPCServer:
         websocket_enabled: bool = True,
         websocket_heartbeat_interval: float = 30.0,
         tls_enabled: bool = False,
+        socket_path: str | Path | None = None,
     ):
         """Initialize IPC server.
 
@@ -103,6 +178,8 @@ class IPCServer:
             websocket_enabled: Enable WebSocket support
             websocket_heartbeat_interval: WebSocket heartbeat interval in seconds
             tls_enabled: Enable TLS/HTTPS (requires key_manager)
+            socket_path: Also listen on this Unix domain socket, where the
+                connecting user is authenticated by file permissions
 
         """
         self.session_manager = session_manager
@@ -146,16 +223,25 @@ class IPCServer:
         self.port = port
         self.websocket_enabled = websocket_enabled
         self.websocket_heartbeat_interval = websocket_heartbeat_interval
+        self.socket_path = Path(socket_path).expanduser() if socket_path else None
 
         self.app = web.Application()  # type: ignore[attr-defined]
         self.runner: web.AppRunner | None = None  # type: ignore[attr-defined]
         self.site: web.TCPSite | None = None  # type: ignore[attr-defined]
+        self.unix_site: web.UnixSite | None = None  # type: ignore[attr-defined]
         self._start_time = time.time()
 
         # WebSocket connections
         self._websocket_connections: set[web.WebSocketResponse] = set()  # type: ignore[attr-defined]
         self._websocket_subscriptions: dict[web.WebSocketResponse, set[EventType]] = {}  # type: ignore[attr-defined]
         self._websocket_heartbeat_tasks: dict[web.WebSocketResponse, asyncio.Task] = {}  # type: ignore[attr-defined]
+        self._websocket_outboxes: dict[web.WebSocketResponse, WebSocketOutbox] = {}  # type: ignore[attr-defined]
+
+        # Status stream: one snapshot sampled for all status subscribers
+        self.status_snapshot = StatusSnapshot()
+        self._status_subscriptions: dict[web.WebSocketResponse, StatusSubscription] = {}  # type: ignore[attr-defined]
+        self._status_task: asyncio.Task | None = None
+        self._status_wakeup = asyncio.Event()
 
         # Setup routes and middleware
         self._setup_middleware()
@@ -164,11 +250,29 @@ class IPCServer:
     def _setup_middleware(self) -> None:
         """Set up middleware for authentication and error handling."""
 
+        # Encoding middleware: answer in msgpack when the client accepts it
+        @web.middleware  # type: ignore[attr-defined]
+        async def codec_middleware(request: Request, handler: Any) -> Response:
+            """Select the response encoding for the request."""
+            token = _msgpack_response.set(
+                MSGPACK_CONTENT_TYPE in request.headers.get("Accept", "")
+            )
+            try:
+                return await handler(request)
+            finally:
+                _msgpack_response.reset(token)
+
+        self.app.middlewares.append(codec_middleware)
+
         # Authentication middleware (applies to all routes)
         @web.middleware  # type: ignore[attr-defined]
         async def auth_middleware(request: Request, handler: Any) -> Response:
             """Mandatory authentication middleware."""
             try:
+                # Unix socket peers are authenticated by file permissions
+                if is_unix_socket_peer(request):
+                    return await handler(request)
+
                 # Skip authentication for WebSocket upgrade requests (handled separately)
                 if (
                     request.path == f"{API_BASE_PATH}/events"
@@ -281,7 +385,7 @@ class IPCServer:
                         request.remote,
                         request.path,
                     )
-                    return web.json_response(  # type: ignore[attr-defined]
+                    return ipc_response(
                         ErrorResponse(
                             error="Unauthorized",
                             code="AUTH_REQUIRED",
@@ -301,7 +405,7 @@ class IPCServer:
                 )
                 # Fall back to allowing the request through (will be caught by error middleware)
                 # Or return unauthorized if we can't authenticate
-                return web.json_response(  # type: ignore[attr-defined]
+                return ipc_response(
                     ErrorResponse(
                         error="Authentication error",
                         code="AUTH_ERROR",
@@ -334,7 +438,7 @@ class IPCServer:
                 )
                 # Return error response - never let exceptions crash the server
                 try:
-                    return web.json_response(  # type: ignore[attr-defined]
+                    return ipc_response(
                         ErrorResponse(
                             error=str(e),
                             code="INTERNAL_ERROR",
@@ -365,6 +469,9 @@ class IPCServer:
         # Metrics endpoint (Prometheus format)
         self.app.router.add_get(f"{API_BASE_PATH}/metrics", self._handle_metrics)
 
+        # Batch endpoint (several torrent operations in one request)
+        self.app.router.add_post(f"{API_BASE_PATH}/batch", self._handle_batch)
+
         # Torrent management endpoints
         self.app.router.add_post(
             f"{API_BASE_PATH}/torrents/add",
@@ -536,6 +643,18 @@ class IPCServer:
             self._handle_get_ip_filter_stats,
         )
 
+        # Debug endpoints (event loop health and stack sampling)
+        self.app.router.add_get(f"{API_BASE_PATH}/debug/loop", self._handle_loop_health)
+        self.app.router.add_get(
+            f"{API_BASE_PATH}/debug/profile", self._handle_profile_status
+        )
+        self.app.router.add_post(
+            f"{API_BASE_PATH}/debug/profile/start", self._handle_profile_start
+        )
+        self.app.router.add_post(
+            f"{API_BASE_PATH}/debug/profile/stop", self._handle_profile_stop
+        )
+
         # WebSocket endpoint
         if self.websocket_enabled:
             self.app.router.add_get(
@@ -577,7 +696,7 @@ class IPCServer:
             ipc_url=f"http://{self.host}:{self.port}",
         )
 
-        return web.json_response(status.model_dump())  # type: ignore[attr-defined]
+        return ipc_response(status.model_dump())
 
     async def _handle_metrics(self, _request: Request) -> Response:
         """Handle GET /api/v1/metrics - Prometheus metrics endpoint."""
@@ -608,6 +727,86 @@ class IPCServer:
                 status=500,
             )
 
+    async def _handle_loop_health(self, _request: Request) -> Response:
+        """Handle GET /api/v1/debug/loop."""
+        from ccbt.observability import get_loop_monitor
+        from ccbt.utils.tasks import get_scheduler
+
+        monitor = get_loop_monitor()
+        if monitor is None:
+            return ipc_response(
+                ErrorResponse(
+                    error="Event loop monitoring is disabled",
+                    code="LOOP_MONITOR_DISABLED",
+                ).model_dump(),
+                status=503,
+            )
+
+        scheduler = {
+            name: {key: value for key, value in stats.items() if key != "buckets"}
+            for name, stats in get_scheduler().stats().items()
+        }
+        health = LoopHealthResponse(**monitor.snapshot(), scheduler=scheduler)
+        return ipc_response(health.model_dump())
+
+    async def _handle_profile_status(self, _request: Request) -> Response:
+        """Handle GET /api/v1/debug/profile."""
+        from ccbt.observability import get_stack_sampler
+
+        sampler = get_stack_sampler()
+        if sampler is None:
+            return ipc_response(ProfileStatusResponse(running=False).model_dump())
+        return ipc_response(ProfileStatusResponse(**sampler.status()).model_dump())
+
+    async def _handle_profile_start(self, request: Request) -> Response:
+        """Handle POST /api/v1/debug/profile/start."""
+        from ccbt.observability import start_stack_sampler
+
+        try:
+            data = await read_request_body(request) if request.can_read_body else {}
+            req = ProfileStartRequest(**(data or {}))
+        except (ValueError, TypeError) as e:
+            return ipc_response(
+                ErrorResponse(
+                    error=f"Invalid profile request: {e}", code="INVALID_REQUEST"
+                ).model_dump(),
+                status=400,
+            )
+
+        try:
+            sampler = start_stack_sampler(req.interval)
+        except RuntimeError as e:
+            return ipc_response(
+                ErrorResponse(error=str(e), code="PROFILER_RUNNING").model_dump(),
+                status=409,
+            )
+        logger.info("Started stack sampling every %.3fs", sampler.interval)
+        return ipc_response(ProfileStatusResponse(**sampler.status()).model_dump())
+
+    async def _handle_profile_stop(self, _request: Request) -> Response:
+        """Handle POST /api/v1/debug/profile/stop."""
+        from ccbt.observability import stop_stack_sampler
+
+        try:
+            # Joins the sampler thread and writes the file
+            status = await asyncio.to_thread(stop_stack_sampler)
+        except RuntimeError as e:
+            return ipc_response(
+                ErrorResponse(error=str(e), code="PROFILER_NOT_RUNNING").model_dump(),
+                status=409,
+            )
+        except OSError as e:
+            logger.exception("Error writing stack profile")
+            return ipc_response(
+                ErrorResponse(
+                    error=f"Error writing stack profile: {e}",
+                    code="PROFILE_WRITE_FAILED",
+                ).model_dump(),
+                status=500,
+            )
+        logger.info("Wrote %d stack samples to %s", status["samples"], status["path"])
+        return ipc_response(ProfileStatusResponse(**status).model_dump())
+
     async def _handle_add_torrent(self, request: Request) -> Response:
         """Handle POST /api/v1/torrents/add."""
         info_hash_hex: str | None = None
@@ -615,14 +814,14 @@ class IPCServer:
         try:
             # Parse JSON request body with error handling
             try:
-                data = await request.json()
+                data = await read_request_body(request)
             except ValueError as json_error:
                 logger.warning(
                     "Invalid JSON in add_torrent request from %s: %s",
                     request.remote,
                     json_error,
                 )
-                return web.json_response(  # type: ignore[attr-defined]
+                return ipc_response(
                     ErrorResponse(
                         error=f"Invalid JSON: {json_error}",
                         code="INVALID_JSON",
@@ -635,7 +834,7 @@ class IPCServer:
                     request.remote,
                     json_error,
                 )
-                return web.json_response(  # type: ignore[attr-defined]
+                return ipc_response(
                     ErrorResponse(
                         error=f"Error parsing request: {json_error}",
                         code="PARSE_ERROR",
@@ -653,7 +852,7 @@ class IPCServer:
                     request.remote,
                     validation_error,
                 )
-                return web.json_response(  # type: ignore[attr-defined]
+                return ipc_response(
                     ErrorResponse(
                         error=f"Invalid request data: {validation_error}",
                         code="VALIDATION_ERROR",
@@ -689,7 +888,7 @@ class IPCServer:
                         req.path_or_magnet[:100],
                         timeout,
                     )
-                    return web.json_response(  # type: ignore[attr-defined]
+                    return ipc_response(
                         ErrorResponse(
                             error=f"Operation timed out after {timeout:.0f}s - torrent may still be processing in background",
                             code="ADD_TORRENT_TIMEOUT",
@@ -705,7 +904,7 @@ class IPCServer:
                     )
                     # Return error response directly instead of re-raising
                     # This prevents the exception from propagating and potentially crashing the daemon
-                    return web.json_response(  # type: ignore[attr-defined]
+                    return ipc_response(
                         ErrorResponse(
                             error=str(executor_error) or "Failed to add torrent",
                             code="ADD_TORRENT_ERROR",
@@ -719,7 +918,7 @@ class IPCServer:
                         req.path_or_magnet[:100],
                         result.error,
                     )
-                    return web.json_response(  # type: ignore[attr-defined]
+                    return ipc_response(
                         ErrorResponse(
                             error=result.error or "Failed to add torrent",
                             code="ADD_TORRENT_ERROR",
@@ -733,7 +932,7 @@ class IPCServer:
                         "Executor returned success but no info_hash for torrent/magnet %s",
                         req.path_or_magnet[:100],
                     )
-                    return web.json_response(  # type: ignore[attr-defined]
+                    return ipc_response(
                         ErrorResponse(
                             error="Torrent was not added (info_hash is None)",
                             code="ADD_TORRENT_ERROR",
@@ -748,7 +947,7 @@ class IPCServer:
                     req.path_or_magnet[:100] if "req" in locals() else "unknown",
                     add_error,
                 )
-                return web.json_response(  # type: ignore[attr-defined]
+                return ipc_response(
                     ErrorResponse(
                         error=str(add_error) or "Failed to add torrent",
                         code="ADD_TORRENT_ERROR",
@@ -778,14 +977,12 @@ class IPCServer:
             # CRITICAL FIX: This check should never be reached if the inner try-except
             # handled the case correctly, but we include it as a safety net
             if info_hash_hex:
-                return web.json_response(
-                    {"info_hash": info_hash_hex, "status": "added"}
-                )  # type: ignore[attr-defined]
+                return ipc_response({"info_hash": info_hash_hex, "status": "added"})
             # This should never happen due to the check at lines 672-684, but handle it gracefully
             logger.error(
                 "Torrent was not added (info_hash is None) - this should not happen",
             )
-            return web.json_response(  # type: ignore[attr-defined]
+            return ipc_response(
                 ErrorResponse(
                     error="Torrent was not added (info_hash is None)",
                     code="ADD_TORRENT_ERROR",
@@ -800,7 +997,7 @@ class IPCServer:
                 path_or_magnet[:100] if path_or_magnet != "unknown" else "unknown",
                 e,
             )
-            return web.json_response(  # type: ignore[attr-defined]
+            return ipc_response(
                 ErrorResponse(error=str(e), code="ADD_TORRENT_ERROR").model_dump(),
                 status=400,
             )
@@ -825,9 +1022,9 @@ class IPCServer:
                         ws_error,
                     )
 
-                return web.json_response({"status": "removed"})  # type: ignore[attr-defined]
+                return ipc_response({"status": "removed"})
 
-            return web.json_response(  # type: ignore[attr-defined]
+            return ipc_response(
                 ErrorResponse(
                     error=result.error or "Torrent not found",
                     code="TORRENT_NOT_FOUND",
@@ -836,7 +1033,7 @@ class IPCServer:
             )
         except Exception as e:
             logger.exception("Error removing torrent %s: %s", info_hash, e)
-            return web.json_response(  # type: ignore[attr-defined]
+            return ipc_response(
                 ErrorResponse(
                     error=str(e) or "Failed to remove torrent",
                     code="REMOVE_TORRENT_ERROR",
@@ -844,13 +1041,20 @@ class IPCServer:
                 status=500,
             )
 
-    async def _handle_list_torrents(self, _request: Request) -> Response:
-        """Handle GET /api/v1/torrents."""
+    async def _handle_list_torrents(self, request: Request) -> Response:
+        """Handle GET /api/v1/torrents.
+
+        With query parameters (``fields``, ``limit``, ``cursor``, ``sort``,
+        ``state``, ``min_ratio``, ``max_ratio``) returns a TorrentPageResponse
+        from the session manager's index; otherwise every torrent in full.
+        """
+        if request.query:
+            return await self._handle_query_torrents(request)
         try:
             result = await self.executor.execute("torrent.list")
 
             if not result.success:
-                return web.json_response(  # type: ignore[attr-defined]
+                return ipc_response(
                     ErrorResponse(
                         error=result.error or "Failed to list torrents",
                         code="LIST_FAILED",
@@ -860,10 +1064,10 @@ class IPCServer:
 
             torrents = result.data.get("torrents", [])
             response = TorrentListResponse(torrents=torrents)
-            return web.json_response(response.model_dump())  # type: ignore[attr-defined]
+            return ipc_response(response.model_dump())
         except Exception as e:
             logger.exception("Error listing torrents: %s", e)
-            return web.json_response(  # type: ignore[attr-defined]
+            return ipc_response(
                 ErrorResponse(
                     error=str(e) or "Failed to list torrents",
                     code="LIST_FAILED",
@@ -871,6 +1075,27 @@ class IPCServer:
                 status=500,
             )
 
+    async def _handle_query_torrents(self, request: Request) -> Response:
+        """Handle GET /api/v1/torrents with listing query parameters."""
+        try:
+            query = ListQuery.from_params(request.query)
+        except ValueError as e:
+            return ipc_response(
+                ErrorResponse(error=str(e), code="INVALID_QUERY").model_dump(),
+                status=400,
+            )
+
+        result = await self.executor.execute("torrent.query", query=query)
+        if not result.success:
+            return ipc_response(
+                ErrorResponse(
+                    error=result.error or "Failed to list torrents",
+                    code="INVALID_QUERY",
+                ).model_dump(),
+                status=400,
+            )
+        return ipc_response(TorrentPageResponse(**result.data).model_dump())
+
     async def _handle_get_torrent_status(self, request: Request) -> Response:
         """Handle GET /api/v1/torrents/{info_hash}."""
         info_hash = request.match_info["info_hash"]
@@ -878,7 +1103,7 @@ class IPCServer:
             result = await self.executor.execute("torrent.status", info_hash=info_hash)
 
             if not result.success or not result.data.get("status"):
-                return web.json_response(  # type: ignore[attr-defined]
+                return ipc_response(
                     ErrorResponse(
                         error=result.error or "Torrent not found",
                         code="TORRENT_NOT_FOUND",
@@ -887,10 +1112,10 @@ class IPCServer:
                 )
 
             status = result.data["status"]
-            return web.json_response(status.model_dump())  # type: ignore[attr-defined]
+            return ipc_response(status.model_dump())
         except Exception as e:
             logger.exception("Error getting torrent status for %s: %s", info_hash, e)
-            return web.json_response(  # type: ignore[attr-defined]
+            return ipc_response(
                 ErrorResponse(
                     error=str(e) or "Failed to get torrent status",
                     code="GET_STATUS_ERROR",
@@ -905,9 +1130,9 @@ class IPCServer:
             result = await self.executor.execute("torrent.pause", info_hash=info_hash)
 
             if result.success and result.data.get("paused"):
-                return web.json_response({"status": "paused"})  # type: ignore[attr-defined]
+                return ipc_response({"status": "paused"})
 
-            return web.json_response(  # type: ignore[attr-defined]
+            return ipc_response(
                 ErrorResponse(
                     error=result.error or "Torrent not found",
                     code="TORRENT_NOT_FOUND",
@@ -916,7 +1141,7 @@ class IPCServer:
             )
         except Exception as e:
             logger.exception("Error pausing torrent %s: %s", info_hash, e)
-            return web.json_response(  # type: ignore[attr-defined]
+            return ipc_response(
                 ErrorResponse(
                     error=str(e) or "Failed to pause torrent",
                     code="PAUSE_FAILED",
@@ -931,9 +1156,9 @@ class IPCServer:
             result = await self.executor.execute("torrent.resume", info_hash=info_hash)
 
             if result.success and result.data.get("resumed"):
-                return web.json_response({"status": "resumed"})  # type: ignore[attr-defined]
+                return ipc_response({"status": "resumed"})
 
-            return web.json_response(  # type: ignore[attr-defined]
+            return ipc_response(
                 ErrorResponse(
                     error=result.error or "Torrent not found",
                     code="TORRENT_NOT_FOUND",
@@ -942,7 +1167,7 @@ class IPCServer:
             )
         except Exception as e:
             logger.exception("Error resuming torrent %s: %s", info_hash, e)
-            return web.json_response(  # type: ignore[attr-defined]
+            return ipc_response(
                 ErrorResponse(
                     error=str(e) or "Failed to resume torrent",
                     code="RESUME_FAILED",
@@ -950,14 +1175,116 @@ class IPCServer:
                 status=500,
             )
 
+    async def _handle_batch(self, request: Request) -> Response:
+        """Handle POST /api/v1/batch.
+
+        Operations run in order and each gets its own result, so one failing
+        operation does not abort the rest.
+        """
+        try:
+            req = BatchRequest(**await read_request_body(request))
+        except Exception as e:
+            return ipc_response(
+                ErrorResponse(
+                    error=f"Invalid request data: {e}",
+                    code="VALIDATION_ERROR",
+                ).model_dump(),
+                status=400,
+            )
+
+        results = []
+        for operation in req.operations:
+            try:
+                results.append(await self._run_batch_operation(operation))
+            except Exception as e:
+                logger.exception("Error in batch %s operation", operation.op)
+                results.append(BatchResult(success=False, error=str(e)))
+        return ipc_response(BatchResponse(results=results).model_dump())
+
+    async def _run_batch_operation(self, operation: BatchOperation) -> BatchResult:
+        """Run one operation of a batch request."""
+        if operation.op == "add":
+            if not operation.path_or_magnet:
+                return BatchResult(success=False, error="path_or_magnet is required")
+            result = await self.executor.execute(
+                "torrent.add",
+                path_or_magnet=operation.path_or_magnet,
+                output_dir=operation.output_dir,
+                resume=operation.resume,
+            )
+            info_hash = result.data.get("info_hash") if result.data else None
+            if not result.success or not info_hash:
+                return BatchResult(
+                    success=False, error=result.error or "Failed to add torrent"
+                )
+            await self._emit_websocket_event(
+                EventType.TORRENT_ADDED,
+                {"info_hash": info_hash, "name": operation.path_or_magnet},
+            )
+            return BatchResult(success=True, data={"info_hash": info_hash})
+
+        if not operation.info_hash:
+            return BatchResult(success=False, error="info_hash is required")
+        info_hash = operation.info_hash
+
+        if operation.op == "status":
+            result = await self.executor.execute("torrent.status", info_hash=info_hash)
+            if not result.success or not result.data.get("status"):
+                return BatchResult(
+                    success=False, error=result.error or "Torrent not found"
+                )
+            return BatchResult(success=True, data=result.data["status"].model_dump())
+
+        # remove, pause and resume report success under these keys
+        command, key = {
+            "remove": ("torrent.remove", "removed"),
+            "pause": ("torrent.pause", "paused"),
+            "resume": ("torrent.resume", "resumed"),
+        }[operation.op]
+        result = await self.executor.execute(command, info_hash=info_hash)
+        if not result.success or not result.data.get(key):
+            return BatchResult(success=False, error=result.error or "Torrent not found")
+        if operation.op == "remove":
+            await self._emit_websocket_event(
+                EventType.TORRENT_REMOVED, {"info_hash": info_hash}
+            )
+        return BatchResult(success=True, data={"status": key})
+
     async def _handle_get_torrent_peers(self, request: Request) -> Response:
-        """Handle GET /api/v1/torrents/{info_hash}/peers."""
+        """Handle GET /api/v1/torrents/{info_hash}/peers.
+
+        With query parameters (``fields``, ``limit``, ``cursor``, ``sort``)
+        returns a PeerPageResponse; otherwise every peer in full.
+        """
         info_hash = request.match_info["info_hash"]
 
+        if request.query:
+            try:
+                query = ListQuery.from_params(request.query)
+            except ValueError as e:
+                return ipc_response(
+                    ErrorResponse(error=str(e), code="INVALID_QUERY").model_dump(),
+                    status=400,
+                )
+            result = await self.executor.execute(
+                "torrent.query_peers", info_hash=info_hash, query=query
+            )
+            if not result.success:
+                return ipc_response(
+                    ErrorResponse(
+                        error=result.error or "Failed to list peers",
+                        code="INVALID_QUERY",
+                    ).model_dump(),
+                    status=400,
+                )
+            return ipc_response(
+                PeerPageResponse(info_hash=info_hash, **result.data).model_dump()
+            )
+
         result = await self.executor.execute("torrent.get_peers", info_hash=info_hash)
 
         if not result.success:
-            return web.json_response(  # type: ignore[attr-defined]
+            return ipc_response(
                 ErrorResponse(
                     error=result.error or "Torrent not found",
                     code="TORRENT_NOT_FOUND",
@@ -985,14 +1312,14 @@ class IPCServer:
             peers=peer_infos,
             count=len(peer_infos),
         )
-        return web.json_response(response.model_dump())  # type: ignore[attr-defined]
+        return ipc_response(response.model_dump())
 
     async def _handle_set_rate_limits(self, request: Request) -> Response:
         """Handle POST /api/v1/torrents/{info_hash}/rate-limits."""
         info_hash = request.match_info["info_hash"]
 
         try:
-            data = await request.json()
+            data = await read_request_body(request)
             req = RateLimitRequest(**data)
 
             result = await self.executor.execute(
@@ -1003,7 +1330,7 @@ class IPCServer:
             )
 
             if not result.success:
-                return web.json_response(  # type: ignore[attr-defined]
+                return ipc_response(
                     ErrorResponse(
                         error=result.error or "Failed to set rate limits",
                         code="RATE_LIMIT_ERROR",
@@ -1011,10 +1338,10 @@ class IPCServer:
                     status=400,
                 )
 
-            return web.json_response(result.data)  # type: ignore[attr-defined]
+            return ipc_response(result.data)
         except Exception as e:
             logger.exception("Error setting rate limits: %s", e)
-            return web.json_response(  # type: ignore[attr-defined]
+            return ipc_response(
                 ErrorResponse(
                     error=f"Failed to set rate limits: {e}",
                     code="RATE_LIMIT_ERROR",
@@ -1031,7 +1358,7 @@ class IPCServer:
         )
 
         if not result.success:
-            return web.json_response(  # type: ignore[attr-defined]
+            return ipc_response(
                 ErrorResponse(
                     error=result.error or "Failed to force announce",
                     code="ANNOUNCE_ERROR",
@@ -1039,12 +1366,12 @@ class IPCServer:
                 status=404,
             )
 
-        return web.json_response(result.data)  # type: ignore[attr-defined]
+        return ipc_response(result.data)
 
     async def _handle_export_session_state(self, request: Request) -> Response:
         """Handle POST /api/v1/torrents/export-state."""
         try:
-            data = await request.json() if request.content_length else {}
+            data = await read_request_body(request) if request.content_length else {}
             req = ExportStateRequest(**data)
 
             result = await self.executor.execute(
@@ -1053,7 +1380,7 @@ class IPCServer:
             )
 
             if not result.success:
-                return web.json_response(  # type: ignore[attr-defined]
+                return ipc_response(
                     ErrorResponse(
                         error=result.error or "Failed to export session state",
                         code="EXPORT_ERROR",
@@ -1061,10 +1388,10 @@ class IPCServer:
                     status=500,
                 )
 
-            return web.json_response(result.data)  # type: ignore[attr-defined]
+            return ipc_response(result.data)
         except Exception as e:
             logger.exception("Error exporting session state: %s", e)
-            return web.json_response(  # type: ignore[attr-defined]
+            return ipc_response(
                 ErrorResponse(
                     error=f"Failed to export session state: {e}",
                     code="EXPORT_ERROR",
@@ -1075,7 +1402,7 @@ class IPCServer:
     async def _handle_import_session_state(self, request: Request) -> Response:
         """Handle POST /api/v1/torrents/import-state."""
         try:
-            data = await request.json()
+            data = await read_request_body(request)
             req = ImportStateRequest(**data)
 
             result = await self.executor.execute(
@@ -1084,7 +1411,7 @@ class IPCServer:
             )
 
             if not result.success:
-                return web.json_response(  # type: ignore[attr-defined]
+                return ipc_response(
                     ErrorResponse(
                         error=result.error or "Failed to import session state",
                         code="IMPORT_ERROR",
@@ -1092,10 +1419,10 @@ class IPCServer:
                     status=400,
                 )
 
-            return web.json_response(result.data)  # type: ignore[attr-defined]
+            return ipc_response(result.data)
         except Exception as e:
             logger.exception("Error importing session state: %s", e)
-            return web.json_response(  # type: ignore[attr-defined]
+            return ipc_response(
                 ErrorResponse(
                     error=f"Failed to import session state: {e}",
                     code="IMPORT_ERROR",
@@ -1106,14 +1433,14 @@ class IPCServer:
     async def _handle_resume_from_checkpoint(self, request: Request) -> Response:
         """Handle POST /api/v1/torrents/resume-checkpoint."""
         try:
-            data = await request.json()
+            data = await read_request_body(request)
             req = ResumeCheckpointRequest(**data)
 
             # Convert hex info_hash to bytes
             try:
                 info_hash_bytes = bytes.fromhex(req.info_hash)
             except ValueError:
-                return web.json_response(  # type: ignore[attr-defined]
+                return ipc_response(
                     ErrorResponse(
                         error="Invalid info hash format",
                         code="INVALID_INFO_HASH",
@@ -1129,7 +1456,7 @@ class IPCServer:
             )
 
             if not result.success:
-                return web.json_response(  # type: ignore[attr-defined]
+                return ipc_response(
                     ErrorResponse(
                         error=result.error or "Failed to resume from checkpoint",
                         code="RESUME_ERROR",
@@ -1137,10 +1464,10 @@ class IPCServer:
                     status=400,
                 )
 
-            return web.json_response(result.data)  # type: ignore[attr-defined]
+            return ipc_response(result.data)
         except Exception as e:
             logger.exception("Error resuming from checkpoint: %s", e)
-            return web.json_response(  # type: ignore[attr-defined]
+            return ipc_response(
                 ErrorResponse(
                     error=f"Failed to resume from checkpoint: {e}",
                     code="RESUME_ERROR",
@@ -1153,7 +1480,7 @@ class IPCServer:
         result = await self.executor.execute("config.get")
 
         if not result.success:
-            return web.json_response(  # type: ignore[attr-defined]
+            return ipc_response(
                 ErrorResponse(
                     error=result.error or "Failed to get config",
                     code="CONFIG_ERROR",
@@ -1161,17 +1488,17 @@ class IPCServer:
                 status=500,
             )
 
-        return web.json_response(result.data["config"])  # type: ignore[attr-defined]
+        return ipc_response(result.data["config"])
 
     async def _handle_update_config(self, request: Request) -> Response:
         """Handle PUT /api/v1/config."""
         try:
-            data = await request.json()
+            data = await read_request_body(request)
 
             result = await self.executor.execute("config.update", config_dict=data)
 
             if not result.success:
-                return web.json_response(  # type: ignore[attr-defined]
+                return ipc_response(
                     ErrorResponse(
                         error=result.error or "Failed to update config",
                         code="CONFIG_UPDATE_FAILED",
@@ -1179,10 +1506,10 @@ class IPCServer:
                     status=400,
                 )
 
-            return web.json_response(result.data)  # type: ignore[attr-defined]
+            return ipc_response(result.data)
         except Exception as e:
             logger.exception("Error updating config: %s", e)
-            return web.json_response(  # type: ignore[attr-defined]
+            return ipc_response(
                 ErrorResponse(
                     error=f"Failed to update config: {e}",
                     code="CONFIG_UPDATE_ERROR",
@@ -1195,7 +1522,7 @@ class IPCServer:
         logger.info("Shutdown requested via IPC")
         # Schedule shutdown (don't block the response)
         _ = asyncio.create_task(self._shutdown_async())
-        return web.json_response({"status": "shutting_down"})  # type: ignore[attr-defined]
+        return ipc_response({"status": "shutting_down"})
 
     async def _shutdown_async(self) -> None:
         """Async shutdown handler."""
@@ -1212,7 +1539,7 @@ class IPCServer:
         try:
             info_hash_bytes = bytes.fromhex(info_hash)
         except ValueError:
-            return web.json_response(  # type: ignore[attr-defined]
+            return ipc_response(
                 ErrorResponse(
                     error="Invalid info hash format",
                     code="INVALID_INFO_HASH",
@@ -1223,7 +1550,7 @@ class IPCServer:
         result = await self.executor.execute("file.list", info_hash=info_hash)
 
         if not result.success:
-            return web.json_response(  # type: ignore[attr-defined]
+            return ipc_response(
                 ErrorResponse(
                     error=result.error or "Failed to get files",
                     code="FILE_LIST_FAILED",
@@ -1232,7 +1559,7 @@ class IPCServer:
             )
 
         file_list = result.data["files"]
-        return web.json_response(file_list.model_dump())  # type: ignore[attr-defined]
+        return ipc_response(file_list.model_dump())
 
     async def _handle_select_files(self, request: Request) -> Response:
         """Handle POST /api/v1/torrents/{info_hash}/files/select."""
@@ -1240,7 +1567,7 @@ class IPCServer:
         try:
             info_hash_bytes = bytes.fromhex(info_hash)
         except ValueError:
-            return web.json_response(  # type: ignore[attr-defined]
+            return ipc_response(
                 ErrorResponse(
                     error="Invalid info hash format",
                     code="INVALID_INFO_HASH",
@@ -1248,7 +1575,7 @@ class IPCServer:
                 status=400,
             )
 
-        data = await request.json()
+        data = await read_request_body(request)
         req = FileSelectRequest(**data)
 
         result = await self.executor.execute(
@@ -1258,7 +1585,7 @@ class IPCServer:
         )
 
         if not result.success:
-            return web.json_response(  # type: ignore[attr-defined]
+            return ipc_response(
                 ErrorResponse(
                     error=result.error or "Failed to select files",
                     code="FILE_SELECT_FAILED",
@@ -1266,7 +1593,7 @@ class IPCServer:
                 status=404,
             )
 
-        return web.json_response(result.data)  # type: ignore[attr-defined]
+        return ipc_response(result.data)
 
     async def _handle_deselect_files(self, request: Request) -> Response:
         """Handle POST /api/v1/torrents/{info_hash}/files/deselect."""
@@ -1274,7 +1601,7 @@ class IPCServer:
         try:
             info_hash_bytes = bytes.fromhex(info_hash)
         except ValueError:
-            return web.json_response(  # type: ignore[attr-defined]
+            return ipc_response(
                 ErrorResponse(
                     error="Invalid info hash format",
                     code="INVALID_INFO_HASH",
@@ -1282,7 +1609,7 @@ class IPCServer:
                 status=400,
             )
 
-        data = await request.json()
+        data = await read_request_body(request)
         req = FileSelectRequest(**data)
 
         result = await self.executor.execute(
@@ -1292,7 +1619,7 @@ class IPCServer:
         )
 
         if not result.success:
-            return web.json_response(  # type: ignore[attr-defined]
+            return ipc_response(
                 ErrorResponse(
                     error=result.error or "Failed to deselect files",
                     code="FILE_DESELECT_FAILED",
@@ -1300,7 +1627,7 @@ class IPCServer:
                 status=404,
             )
 
-        return web.json_response(result.data)  # type: ignore[attr-defined]
+        return ipc_response(result.data)
 
     async def _handle_set_file_priority(self, request: Request) -> Response:
         """Handle POST /api/v1/torrents/{info_hash}/files/priority."""
@@ -1308,7 +1635,7 @@ class IPCServer:
         try:
             info_hash_bytes = bytes.fromhex(info_hash)
         except ValueError:
-            return web.json_response(  # type: ignore[attr-defined]
+            return ipc_response(
                 ErrorResponse(
                     error="Invalid info hash format",
                     code="INVALID_INFO_HASH",
@@ -1316,7 +1643,7 @@ class IPCServer:
                 status=400,
             )
 
-        data = await request.json()
+        data = await read_request_body(request)
         req = FilePriorityRequest(**data)
 
         result = await self.executor.execute(
@@ -1327,7 +1654,7 @@ class IPCServer:
         )
 
         if not result.success:
-            return web.json_response(  # type: ignore[attr-defined]
+            return ipc_response(
                 ErrorResponse(
                     error=result.error or "Failed to set file priority",
                     code="FILE_PRIORITY_FAILED",
@@ -1335,7 +1662,7 @@ class IPCServer:
                 status=400,
             )
 
-        return web.json_response(result.data)  # type: ignore[attr-defined]
+        return ipc_response(result.data)
 
     async def _handle_verify_files(self, request: Request) -> Response:
         """Handle GET /api/v1/torrents/{info_hash}/files/verify."""
@@ -1343,7 +1670,7 @@ class IPCServer:
         try:
             info_hash_bytes = bytes.fromhex(info_hash)
         except ValueError:
-            return web.json_response(  # type: ignore[attr-defined]
+            return ipc_response(
                 ErrorResponse(
                     error="Invalid info hash format",
                     code="INVALID_INFO_HASH",
@@ -1354,7 +1681,7 @@ class IPCServer:
         result = await self.executor.execute("file.verify", info_hash=info_hash)
 
         if not result.success:
-            return web.json_response(  # type: ignore[attr-defined]
+            return ipc_response(
                 ErrorResponse(
                     error=result.error or "Failed to verify files",
                     code="FILE_VERIFY_FAILED",
@@ -1362,7 +1689,7 @@ class IPCServer:
                 status=404,
             )
 
-        return web.json_response(result.data)  # type: ignore[attr-defined]
+        return ipc_response(result.data)
 
     # Queue Handlers
 
@@ -1371,7 +1698,7 @@ class IPCServer:
         result = await self.executor.execute("queue.list")
 
         if not result.success:
-            return web.json_response(  # type: ignore[attr-defined]
+            return ipc_response(
                 ErrorResponse(
                     error=result.error or "Failed to get queue",
                     code="QUEUE_GET_FAILED",
@@ -1380,11 +1707,11 @@ class IPCServer:
             )
 
         queue_list = result.data["queue"]
-        return web.json_response(queue_list.model_dump())  # type: ignore[attr-defined]
+        return ipc_response(queue_list.model_dump())
 
     async def _handle_queue_add(self, request: Request) -> Response:
         """Handle POST /api/v1/queue/add."""
-        data = await request.json()
+        data = await read_request_body(request)
         req = QueueAddRequest(**data)
 
         result = await self.executor.execute(
@@ -1394,7 +1721,7 @@ class IPCServer:
         )
 
         if not result.success:
-            return web.json_response(  # type: ignore[attr-defined]
+            return ipc_response(
                 ErrorResponse(
                     error=result.error or "Failed to add to queue",
                     code="QUEUE_ADD_FAILED",
@@ -1402,7 +1729,7 @@ class IPCServer:
                 status=400,
             )
 
-        return web.json_response(result.data)  # type: ignore[attr-defined]
+        return ipc_response(result.data)
 
     async def _handle_queue_remove(self, request: Request) -> Response:
         """Handle DELETE /api/v1/queue/{info_hash}."""
@@ -1410,7 +1737,7 @@ class IPCServer:
         try:
             info_hash_bytes = bytes.fromhex(info_hash)
         except ValueError:
-            return web.json_response(  # type: ignore[attr-defined]
+            return ipc_response(
                 ErrorResponse(
                     error="Invalid info hash format",
                     code="INVALID_INFO_HASH",
@@ -1421,7 +1748,7 @@ class IPCServer:
         result = await self.executor.execute("queue.remove", info_hash=info_hash)
 
         if not result.success:
-            return web.json_response(  # type: ignore[attr-defined]
+            return ipc_response(
                 ErrorResponse(
                     error=result.error or "Torrent not found in queue",
                     code="QUEUE_NOT_FOUND",
@@ -1429,7 +1756,7 @@ class IPCServer:
                 status=404,
             )
 
-        return web.json_response(result.data)  # type: ignore[attr-defined]
+        return ipc_response(result.data)
 
     async def _handle_queue_move(self, request: Request) -> Response:
         """Handle POST /api/v1/queue/{info_hash}/move."""
@@ -1437,7 +1764,7 @@ class IPCServer:
         try:
             info_hash_bytes = bytes.fromhex(info_hash)
         except ValueError:
-            return web.json_response(  # type: ignore[attr-defined]
+            return ipc_response(
                 ErrorResponse(
                     error="Invalid info hash format",
                     code="INVALID_INFO_HASH",
@@ -1445,7 +1772,7 @@ class IPCServer:
                 status=400,
             )
 
-        data = await request.json()
+        data = await read_request_body(request)
         req = QueueMoveRequest(**data)
 
         result = await self.executor.execute(
@@ -1455,7 +1782,7 @@ class IPCServer:
         )
 
         if not result.success:
-            return web.json_response(  # type: ignore[attr-defined]
+            return ipc_response(
                 ErrorResponse(
                     error=result.error or "Failed to move in queue",
                     code="QUEUE_MOVE_FAILED",
@@ -1463,14 +1790,14 @@ class IPCServer:
                 status=400,
             )
 
-        return web.json_response(result.data)  # type: ignore[attr-defined]
+        return ipc_response(result.data)
 
     async def _handle_queue_clear(self, _request: Request) -> Response:
         """Handle POST /api/v1/queue/clear."""
         result = await self.executor.execute("queue.clear")
 
         if not result.success:
-            return web.json_response(  # type: ignore[attr-defined]
+            return ipc_response(
                 ErrorResponse(
                     error=result.error or "Failed to clear queue",
                     code="QUEUE_CLEAR_FAILED",
@@ -1478,7 +1805,7 @@ class IPCServer:
                 status=404,
             )
 
-        return web.json_response(result.data)  # type: ignore[attr-defined]
+        return ipc_response(result.data)
 
     async def _handle_queue_pause(self, request: Request) -> Response:
         """Handle POST /api/v1/queue/{info_hash}/pause."""
@@ -1486,7 +1813,7 @@ class IPCServer:
         result = await self.executor.execute("queue.pause", info_hash=info_hash)
 
         if not result.success:
-            return web.json_response(  # type: ignore[attr-defined]
+            return ipc_response(
                 ErrorResponse(
                     error=result.error or "Torrent not found",
                     code="TORRENT_NOT_FOUND",
@@ -1494,7 +1821,7 @@ class IPCServer:
                 status=404,
             )
 
-        return web.json_response(result.data)  # type: ignore[attr-defined]
+        return ipc_response(result.data)
 
     async def _handle_queue_resume(self, request: Request) -> Response:
         """Handle POST /api/v1/queue/{info_hash}/resume."""
@@ -1502,7 +1829,7 @@ class IPCServer:
         result = await self.executor.execute("queue.resume", info_hash=info_hash)
 
         if not result.success:
-            return web.json_response(  # type: ignore[attr-defined]
+            return ipc_response(
                 ErrorResponse(
                     error=result.error or "Torrent not found",
                     code="TORRENT_NOT_FOUND",
@@ -1510,7 +1837,7 @@ class IPCServer:
                 status=404,
             )
 
-        return web.json_response(result.data)  # type: ignore[attr-defined]
+        return ipc_response(result.data)
 
     # NAT Handlers
 
@@ -1519,7 +1846,7 @@ class IPCServer:
         result = await self.executor.execute("nat.status")
 
         if not result.success:
-            return web.json_response(  # type: ignore[attr-defined]
+            return ipc_response(
                 ErrorResponse(
                     error=result.error or "Failed to get NAT status",
                     code="NAT_STATUS_FAILED",
@@ -1528,14 +1855,14 @@ class IPCServer:
             )
 
         nat_status = result.data["status"]
-        return web.json_response(nat_status.model_dump())  # type: ignore[attr-defined]
+        return ipc_response(nat_status.model_dump())
 
     async def _handle_nat_discover(self, _request: Request) -> Response:
         """Handle POST /api/v1/nat/discover."""
         result = await self.executor.execute("nat.discover")
 
         if not result.success:
-            return web.json_response(  # type: ignore[attr-defined]
+            return ipc_response(
                 ErrorResponse(
                     error=result.error or "Failed to discover NAT",
                     code="NAT_DISCOVER_FAILED",
@@ -1543,11 +1870,11 @@ class IPCServer:
                 status=404,
             )
 
-        return web.json_response(result.data)  # type: ignore[attr-defined]
+        return ipc_response(result.data)
 
     async def _handle_nat_map(self, request: Request) -> Response:
         """Handle POST /api/v1/nat/map."""
-        data = await request.json()
+        data = await read_request_body(request)
         req = NATMapRequest(**data)
 
         result = await self.executor.execute(
@@ -1558,7 +1885,7 @@ class IPCServer:
         )
 
         if not result.success:
-            return web.json_response(  # type: ignore[attr-defined]
+            return ipc_response(
                 ErrorResponse(
                     error=result.error or "Failed to map NAT port",
                     code="NAT_MAP_FAILED",
@@ -1566,18 +1893,18 @@ class IPCServer:
                 status=404,
             )
 
-        return web.json_response(result.data)  # type: ignore[attr-defined]
+        return ipc_response(result.data)
 
     async def _handle_nat_unmap(self, request: Request) -> Response:
         """Handle POST /api/v1/nat/unmap."""
-        data = await request.json()
+        data = await read_request_body(request)
         port = data.get("port")
         protocol = data.get("protocol", "tcp")
 
         result = await self.executor.execute("nat.unmap", port=port, protocol=protocol)
 
         if not result.success:
-            return web.json_response(  # type: ignore[attr-defined]
+            return ipc_response(
                 ErrorResponse(
                     error=result.error or "Failed to unmap NAT port",
                     code="NAT_UNMAP_FAILED",
@@ -1585,14 +1912,14 @@ class IPCServer:
                 status=404,
             )
 
-        return web.json_response(result.data)  # type: ignore[attr-defined]
+        return ipc_response(result.data)
 
     async def _handle_nat_refresh(self, _request: Request) -> Response:
         """Handle POST /api/v1/nat/refresh."""
         result = await self.executor.execute("nat.refresh")
 
         if not result.success:
-            return web.json_response(  # type: ignore[attr-defined]
+            return ipc_response(
                 ErrorResponse(
                     error=result.error or "Failed to refresh NAT mappings",
                     code="NAT_REFRESH_FAILED",
@@ -1600,14 +1927,14 @@ class IPCServer:
                 status=404,
             )
 
-        return web.json_response(result.data)  # type: ignore[attr-defined]
+        return ipc_response(result.data)
 
     async def _handle_get_external_ip(self, _request: Request) -> Response:
         """Handle GET /api/v1/nat/external-ip."""
         result = await self.executor.execute("nat.get_external_ip")
 
         if not result.success:
-            return web.json_response(  # type: ignore[attr-defined]
+            return ipc_response(
                 ErrorResponse(
                     error=result.error or "Failed to get external IP",
                     code="NAT_ERROR",
@@ -1626,14 +1953,14 @@ class IPCServer:
             pass
 
         response = ExternalIPResponse(external_ip=external_ip, method=method)
-        return web.json_response(response.model_dump())  # type: ignore[attr-defined]
+        return ipc_response(response.model_dump())
 
     async def _handle_get_external_port(self, request: Request) -> Response:
         """Handle GET /api/v1/nat/external-port/{internal_port}."""
         try:
             internal_port = int(request.match_info["internal_port"])
         except (ValueError, KeyError):
-            return web.json_response(  # type: ignore[attr-defined]
+            return ipc_response(
                 ErrorResponse(
                     error="Invalid internal port",
                     code="INVALID_PORT",
@@ -1650,7 +1977,7 @@ class IPCServer:
         )
 
         if not result.success:
-            return web.json_response(  # type: ignore[attr-defined]
+            return ipc_response(
                 ErrorResponse(
                     error=result.error or "Failed to get external port",
                     code="NAT_ERROR",
@@ -1664,14 +1991,14 @@ class IPCServer:
             external_port=external_port,
             protocol=protocol,
         )
-        return web.json_response(response.model_dump())  # type: ignore[attr-defined]
+        return ipc_response(response.model_dump())
 
     # Scrape Handlers
 
     async def _handle_scrape(self, request: Request) -> Response:
         """Handle POST /api/v1/scrape/{info_hash}."""
         info_hash = request.match_info["info_hash"]
-        data = await request.json() if request.content_length else {}
+        data = await read_request_body(request) if request.content_length else {}
         req = ScrapeRequest(**data)
 
         result = await self.executor.execute(
@@ -1681,7 +2008,7 @@ class IPCServer:
         )
 
         if not result.success:
-            return web.json_response(  # type: ignore[attr-defined]
+            return ipc_response(
                 ErrorResponse(
                     error=result.error or "Failed to scrape torrent",
                     code="SCRAPE_FAILED",
@@ -1690,14 +2017,14 @@ class IPCServer:
             )
 
         scrape_result = result.data["result"]
-        return web.json_response(scrape_result.model_dump())  # type: ignore[attr-defined]
+        return ipc_response(scrape_result.model_dump())
 
     async def _handle_list_scrape(self, _request: Request) -> Response:
         """Handle GET /api/v1/scrape."""
         result = await self.executor.execute("scrape.list")
 
         if not result.success:
-            return web.json_response(  # type: ignore[attr-defined]
+            return ipc_response(
                 ErrorResponse(
                     error=result.error or "Failed to list scrape results",
                     code="SCRAPE_LIST_FAILED",
@@ -1706,7 +2033,7 @@ class IPCServer:
             )
 
         scrape_list = result.data["results"]
-        return web.json_response(scrape_list.model_dump())  # type: ignore[attr-defined]
+        return ipc_response(scrape_list.model_dump())
 
     async def _handle_get_scrape_result(self, request: Request) -> Response:
         """Handle GET /api/v1/scrape/{info_hash}."""
@@ -1719,14 +2046,14 @@ class IPCServer:
             if not result.success:
                 # If result not found, return 404
                 if "not found" in (result.error or "").lower():
-                    return web.json_response(  # type: ignore[attr-defined]
+                    return ipc_response(
                         ErrorResponse(
                             error=result.error or "Scrape result not found",
                             code="SCRAPE_NOT_FOUND",
                         ).model_dump(),
                         status=404,
                     )
-                return web.json_response(  # type: ignore[attr-defined]
+                return ipc_response(
                     ErrorResponse(
                         error=result.error or "Failed to get scrape result",
                         code="SCRAPE_GET_FAILED",
@@ -1736,7 +2063,7 @@ class IPCServer:
 
             scrape_result = result.data.get("result")
             if scrape_result is None:
-                return web.json_response(  # type: ignore[attr-defined]
+                return ipc_response(
                     ErrorResponse(
                         error="Scrape result not found",
                         code="SCRAPE_NOT_FOUND",
@@ -1744,10 +2071,10 @@ class IPCServer:
                     status=404,
                 )
 
-            return web.json_response(scrape_result.model_dump())  # type: ignore[attr-defined]
+            return ipc_response(scrape_result.model_dump())
         except Exception as e:
             logger.exception("Error getting scrape result for %s: %s", info_hash, e)
-            return web.json_response(  # type: ignore[attr-defined]
+            return ipc_response(
                 ErrorResponse(
                     error=f"Failed to get scrape result: {e}",
                     code="SCRAPE_GET_ERROR",
@@ -1762,7 +2089,7 @@ class IPCServer:
         result = await self.executor.execute("protocol.get_xet")
 
         if not result.success:
-            return web.json_response(  # type: ignore[attr-defined]
+            return ipc_response(
                 ErrorResponse(
                     error=result.error or "Failed to get Xet protocol info",
                     code="PROTOCOL_ERROR",
@@ -1771,14 +2098,14 @@ class IPCServer:
             )
 
         protocol_info = result.data["protocol"]
-        return web.json_response(protocol_info.model_dump())  # type: ignore[attr-defined]
+        return ipc_response(protocol_info.model_dump())
 
     async def _handle_get_ipfs_protocol(self, _request: Request) -> Response:
         """Handle GET /api/v1/protocols/ipfs."""
         result = await self.executor.execute("protocol.get_ipfs")
 
         if not result.success:
-            return web.json_response(  # type: ignore[attr-defined]
+            return ipc_response(
                 ErrorResponse(
                     error=result.error or "Failed to get IPFS protocol info",
                     code="PROTOCOL_ERROR",
@@ -1787,7 +2114,7 @@ class IPCServer:
             )
 
         protocol_info = result.data["protocol"]
-        return web.json_response(protocol_info.model_dump())  # type: ignore[attr-defined]
+        return ipc_response(protocol_info.model_dump())
 
     # Session Handlers
 
@@ -1796,7 +2123,7 @@ class IPCServer:
         result = await self.executor.execute("session.get_global_stats")
 
         if not result.success:
-            return web.json_response(  # type: ignore[attr-defined]
+            return ipc_response(
                 ErrorResponse(
                     error=result.error or "Failed to get global stats",
                     code="SESSION_ERROR",
@@ -1815,7 +2142,7 @@ class IPCServer:
             total_uploaded=stats.get("total_uploaded", 0),
             stats=stats,
         )
-        return web.json_response(response.model_dump())  # type: ignore[attr-defined]
+        return ipc_response(response.model_dump())
 
     # Security Handlers
 
@@ -1824,7 +2151,7 @@ class IPCServer:
         result = await self.executor.execute("security.get_blacklist")
 
         if not result.success:
-            return web.json_response(  # type: ignore[attr-defined]
+            return ipc_response(
                 ErrorResponse(
                     error=result.error or "Failed to get blacklist",
                     code="SECURITY_ERROR",
@@ -1834,14 +2161,14 @@ class IPCServer:
 
         blacklist = result.data.get("blacklist", [])
         response = BlacklistResponse(ips=blacklist, count=len(blacklist))
-        return web.json_response(response.model_dump())  # type: ignore[attr-defined]
+        return ipc_response(response.model_dump())
 
     async def _handle_get_whitelist(self, _request: Request) -> Response:
         """Handle GET /api/v1/security/whitelist."""
         result = await self.executor.execute("security.get_whitelist")
 
         if not result.success:
-            return web.json_response(  # type: ignore[attr-defined]
+            return ipc_response(
                 ErrorResponse(
                     error=result.error or "Failed to get whitelist",
                     code="SECURITY_ERROR",
@@ -1851,12 +2178,12 @@ class IPCServer:
 
         whitelist = result.data.get("whitelist", [])
         response = WhitelistResponse(ips=whitelist, count=len(whitelist))
-        return web.json_response(response.model_dump())  # type: ignore[attr-defined]
+        return ipc_response(response.model_dump())
 
     async def _handle_add_to_blacklist(self, request: Request) -> Response:
         """Handle POST /api/v1/security/blacklist."""
         try:
-            data = await request.json()
+            data = await read_request_body(request)
             req = BlacklistAddRequest(**data)
 
             result = await self.executor.execute(
@@ -1866,7 +2193,7 @@ class IPCServer:
             )
 
             if not result.success:
-                return web.json_response(  # type: ignore[attr-defined]
+                return ipc_response(
                     ErrorResponse(
                         error=result.error or "Failed to add to blacklist",
                         code="SECURITY_ERROR",
@@ -1880,10 +2207,10 @@ class IPCServer:
                 {"ip": req.ip, "action": "added"},
             )
 
-            return web.json_response(result.data)  # type: ignore[attr-defined]
+            return ipc_response(result.data)
         except Exception as e:
             logger.exception("Error adding to blacklist: %s", e)
-            return web.json_response(  # type: ignore[attr-defined]
+            return ipc_response(
                 ErrorResponse(
                     error=f"Failed to add to blacklist: {e}",
                     code="SECURITY_ERROR",
@@ -1898,7 +2225,7 @@ class IPCServer:
         result = await self.executor.execute("security.remove_from_blacklist", ip=ip)
 
         if not result.success:
-            return web.json_response(  # type: ignore[attr-defined]
+            return ipc_response(
                 ErrorResponse(
                     error=result.error or "Failed to remove from blacklist",
                     code="SECURITY_ERROR",
@@ -1912,12 +2239,12 @@ class IPCServer:
             {"ip": ip, "action": "removed"},
         )
 
-        return web.json_response(result.data)  # type: ignore[attr-defined]
+        return ipc_response(result.data)
 
     async def _handle_add_to_whitelist(self, request: Request) -> Response:
         """Handle POST /api/v1/security/whitelist."""
         try:
-            data = await request.json()
+            data = await read_request_body(request)
             req = WhitelistAddRequest(**data)
 
             result = await self.executor.execute(
@@ -1927,7 +2254,7 @@ class IPCServer:
             )
 
             if not result.success:
-                return web.json_response(  # type: ignore[attr-defined]
+                return ipc_response(
                     ErrorResponse(
                         error=result.error or "Failed to add to whitelist",
                         code="SECURITY_ERROR",
@@ -1941,10 +2268,10 @@ class IPCServer:
                 {"ip": req.ip, "action": "added"},
             )
 
-            return web.json_response(result.data)  # type: ignore[attr-defined]
+            return ipc_response(result.data)
         except Exception as e:
             logger.exception("Error adding to whitelist: %s", e)
-            return web.json_response(  # type: ignore[attr-defined]
+            return ipc_response(
                 ErrorResponse(
                     error=f"Failed to add to whitelist: {e}",
                     code="SECURITY_ERROR",
@@ -1959,7 +2286,7 @@ class IPCServer:
         result = await self.executor.execute("security.remove_from_whitelist", ip=ip)
 
         if not result.success:
-            return web.json_response(  # type: ignore[attr-defined]
+            return ipc_response(
                 ErrorResponse(
                     error=result.error or "Failed to remove from whitelist",
                     code="SECURITY_ERROR",
@@ -1973,14 +2300,14 @@ class IPCServer:
             {"ip": ip, "action": "removed"},
         )
 
-        return web.json_response(result.data)  # type: ignore[attr-defined]
+        return ipc_response(result.data)
 
     async def _handle_load_ip_filter(self, _request: Request) -> Response:
         """Handle POST /api/v1/security/ip-filter/load."""
         result = await self.executor.execute("security.load_ip_filter")
 
         if not result.success:
-            return web.json_response(  # type: ignore[attr-defined]
+            return ipc_response(
                 ErrorResponse(
                     error=result.error or "Failed to load IP filter",
                     code="SECURITY_ERROR",
@@ -1988,14 +2315,14 @@ class IPCServer:
                 status=500,
             )
 
-        return web.json_response(result.data)  # type: ignore[attr-defined]
+        return ipc_response(result.data)
 
     async def _handle_get_ip_filter_stats(self, _request: Request) -> Response:
         """Handle GET /api/v1/security/ip-filter/stats."""
         result = await self.executor.execute("security.get_ip_filter_stats")
 
         if not result.success:
-            return web.json_response(  # type: ignore[attr-defined]
+            return ipc_response(
                 ErrorResponse(
                     error=result.error or "Failed to get IP filter stats",
                     code="SECURITY_ERROR",
@@ -2011,7 +2338,7 @@ class IPCServer:
             allowed_count=stats_data.get("stats", {}).get("allowed_count", 0),
             stats=stats_data.get("stats", {}),
         )
-        return web.json_response(response.model_dump())  # type: ignore[attr-defined]
+        return ipc_response(response.model_dump())
 
     # WebSocket Handler
 
@@ -2021,9 +2348,10 @@ class IPCServer:
         await ws.prepare(request)
 
         # Authenticate WebSocket connection
-        # Try Ed25519 signature authentication first
-        authenticated = False
-        if self.key_manager:
+        # Unix socket peers are authenticated by file permissions
+        authenticated = is_unix_socket_peer(request)
+        # Try Ed25519 signature authentication next
+        if not authenticated and self.key_manager:
             signature = request.query.get("signature") or request.headers.get(
                 SIGNATURE_HEADER
             )
@@ -2067,6 +2395,9 @@ class IPCServer:
             return ws
 
         # Add to connections
+        outbox = WebSocketOutbox(ws)
+        outbox.start()
+        self._websocket_outboxes[ws] = outbox
         self._websocket_connections.add(ws)
         self._websocket_subscriptions[ws] = set()
 
@@ -2089,13 +2420,15 @@ class IPCServer:
                             self._websocket_subscriptions[ws].update(
                                 sub_req.event_types
                             )
-                            await ws.send_json(
-                                {
-                                    "action": "subscribed",
-                                    "event_types": [
-                                        e.value for e in sub_req.event_types
-                                    ],
-                                }
+                            outbox.put(
+                                json.dumps(
+                                    {
+                                        "action": "subscribed",
+                                        "event_types": [
+                                            e.value for e in sub_req.event_types
+                                        ],
+                                    }
+                                )
                             )
 
                         elif message.action == "unsubscribe":
@@ -2104,16 +2437,36 @@ class IPCServer:
                                     EventType(et) for et in message.data["event_types"]
                                 ]
                                 self._websocket_subscriptions[ws] -= set(event_types)
-                                await ws.send_json({"action": "unsubscribed"})
+                                outbox.put(json.dumps({"action": "unsubscribed"}))
+
+                        elif message.action == "subscribe_status":
+                            status_req = StatusSubscribeRequest(**message.data or {})
+                            self._status_subscriptions[ws] = StatusSubscription(
+                                interval=status_req.interval,
+                                fields=frozenset(status_req.fields)
+                                if status_req.fields
+                                else None,
+                            )
+                            outbox.put(
+                                json.dumps(
+                                    {
+                                        "action": "status_subscribed",
+                                        "interval": status_req.interval,
+                                    }
+                                )
+                            )
+                            self._start_status_stream()
+
+                        elif message.action == "unsubscribe_status":
+                            self._status_subscriptions.pop(ws, None)
+                            outbox.put(json.dumps({"action": "status_unsubscribed"}))
 
                         elif message.action == "ping":
-                            await ws.send_json({"action": "pong"})
+                            outbox.put(json.dumps({"action": "pong"}))
 
                     except Exception as e:
                         logger.exception("Error processing WebSocket message")
-                        await ws.send_json(
-                            {"action": "error", "error": str(e)},
-                        )
+                        outbox.put(json.dumps({"action": "error", "error": str(e)}))
 
                 elif msg.type == aiohttp.WSMsgType.ERROR:
                     logger.warning("WebSocket error: %s", ws.exception())
@@ -2125,11 +2478,15 @@ class IPCServer:
             # Cleanup
             self._websocket_connections.discard(ws)
             self._websocket_subscriptions.pop(ws, None)
+            self._status_subscriptions.pop(ws, None)
             if ws in self._websocket_heartbeat_tasks:
                 task = self._websocket_heartbeat_tasks.pop(ws)
                 task.cancel()
                 with contextlib.suppress(asyncio.CancelledError):
                     await task
+            if self._websocket_outboxes.get(ws) is outbox:
+                del self._websocket_outboxes[ws]
+            await outbox.close()
 
         return ws
 
@@ -2138,8 +2495,9 @@ class IPCServer:
         try:
             while not ws.closed:
                 await asyncio.sleep(self.websocket_heartbeat_interval)
-                if not ws.closed:
-                    await ws.send_json({"action": "ping"})
+                outbox = self._websocket_outboxes.get(ws)
+                if not ws.closed and outbox is not None:
+                    outbox.put(json.dumps({"action": "ping"}))
         except asyncio.CancelledError:
             pass
         except Exception as e:
@@ -2150,40 +2508,108 @@ class IPCServer:
         event_type: EventType,
         data: dict[str, Any],
     ) -> None:
-        """Emit event to all subscribed WebSocket connections."""
+        """Emit event to all subscribed WebSocket connections.
+
+        The event is serialized once and queued on each subscriber's outbox,
+        so a slow connection never delays the others. Connections without
+        event subscriptions receive every event, unless they only stream
+        status.
+        """
         if not self.websocket_enabled:
             return
 
-        event = WebSocketEvent(
-            type=event_type,
-            timestamp=time.time(),
-            data=data,
-        )
-
-        # Send to all subscribed connections
+        payload: str | None = None
         disconnected = []
         for ws in self._websocket_connections:
-            if ws.closed:
+            outbox = self._websocket_outboxes.get(ws)
+            if ws.closed or outbox is None or outbox.closed:
                 disconnected.append(ws)
                 continue
 
             # Check if connection is subscribed to this event type
             subscriptions = self._websocket_subscriptions.get(ws, set())
-            if not subscriptions or event_type in subscriptions:
-                try:
-                    await ws.send_json(event.model_dump())
-                except Exception as e:
-                    logger.debug("Error sending WebSocket event: %s", e)
-                    disconnected.append(ws)
+            if subscriptions:
+                if event_type not in subscriptions:
+                    continue
+            elif ws in self._status_subscriptions:
+                continue
+
+            if payload is None:
+                payload = WebSocketEvent(
+                    type=event_type,
+                    timestamp=time.time(),
+                    data=data,
+                ).model_dump_json()
+            if not outbox.put(payload):
+                disconnected.append(ws)
 
         # Cleanup disconnected connections
         for ws in disconnected:
             self._websocket_connections.discard(ws)
             self._websocket_subscriptions.pop(ws, None)
+            self._status_subscriptions.pop(ws, None)
+            outbox = self._websocket_outboxes.pop(ws, None)
+            if outbox is not None:
+                outbox.abort()
             if ws in self._websocket_heartbeat_tasks:
                 task = self._websocket_heartbeat_tasks.pop(ws)
                 task.cancel()
 
+    def _start_status_stream(self) -> None:
+        """Start sampling status for subscribers, or wake the running sampler."""
+        self._status_wakeup.set()
+        if self._status_task is None or self._status_task.done():
+            self._status_task = asyncio.create_task(self._status_stream_loop())
+
+    async def _status_stream_loop(self) -> None:
+        """Sample torrent status and push deltas while anyone is subscribed.
+
+        Status is sampled at most once per tick however many connections
+        subscribe, at the rate of the most frequent subscriber that is due.
+        """
+        loop = asyncio.get_running_loop()
+        snapshot = self.status_snapshot
+        while self._status_subscriptions:
+            self._status_wakeup.clear()
+            now = loop.time()
+            due = [
+                (ws, subscription)
+                for ws, subscription in self._status_subscriptions.items()
+                if subscription.next_due <= now
+            ]
+            if due:
+                try:
+                    snapshot.update(await self.session_manager.get_status())
+                except Exception as e:
+                    logger.debug("Error sampling torrent status: %s", e)
+                for ws, subscription in due:
+                    subscription.next_due = now + subscription.interval
+                    outbox = self._websocket_outboxes.get(ws)
+                    if (
+                        outbox is None
+                        or self._status_subscriptions.get(ws) is not subscription
+                        or subscription.version >= snapshot.version
+                    ):
+                        continue
+                    outbox.put_status(
+                        subscription,
+                        snapshot.version,
+                        snapshot.encode_delta(
+                            subscription.version, subscription.fields
+                        ),
+                    )
+
+            if not self._status_subscriptions:
+                break
+            delay = (
+                min(sub.next_due for sub in self._status_subscriptions.values())
+                - loop.time()
+            )
+            if delay > 0:
+                with contextlib.suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(self._status_wakeup.wait(), delay)
+        self._status_task = None
+
     # Server Lifecycle
 
     async def start(self) -> None:
@@ -2329,11 +2755,11 @@ class IPCServer:
                 "IPC server started on %s://%s:%d", protocol, self.host, self.port
             )
 
+            await self._start_unix_site()
+
             # CRITICAL: On Windows, verify the server is actually accepting HTTP connections
             # Socket test alone isn't sufficient - aiohttp might not be ready for HTTP yet
             # If binding to 0.0.0.0, verify via 127.0.0.1; otherwise use the bound host
-            import socket
-
             verify_host = "127.0.0.1" if self.host == "0.0.0.0" else self.host
 
             # First do a socket test to verify the port is bound
@@ -2429,6 +2855,37 @@ class IPCServer:
             )
             raise
 
+    async def _start_unix_site(self) -> None:
+        """Listen on the Unix domain socket as well as TCP.
+
+        The socket is created with mode 0600 inside a 0700 directory, so only
+        the daemon's user can connect. Failing to bind is not fatal: clients
+        fall back to TCP.
+        """
+        path = self.socket_path
+        if path is None or self.runner is None:
+            return
+        if not hasattr(socket, "AF_UNIX"):
+            logger.debug("Unix domain sockets not supported, using TCP only")
+            return
+        try:
+            path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+            # A socket left behind by a daemon that did not shut down cleanly
+            with contextlib.suppress(FileNotFoundError):
+                path.unlink()
+            # The umask is process-wide, so rely on the private directory
+            # to cover the socket until it is narrowed to 0600
+            self.unix_site = web.UnixSite(self.runner, str(path))  # type: ignore[attr-defined]
+            await self.unix_site.start()
+            path.chmod(0o600)
+        except OSError as e:
+            logger.warning(
+                "Could not listen on IPC socket %s, using TCP only: %s", path, e
+            )
+            self.unix_site = None
+            return
+        logger.info("IPC server listening on unix://%s", path)
+
     async def stop(self) -> None:
         """Stop the IPC server."""
         # Close all WebSocket connections
@@ -2442,14 +2899,32 @@ class IPCServer:
             with contextlib.suppress(asyncio.CancelledError):
                 await task
 
+        self._status_subscriptions.clear()
+        if self._status_task is not None:
+            self._status_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._status_task
+            self._status_task = None
+        for outbox in self._websocket_outboxes.values():
+            await outbox.close()
+
         self._websocket_connections.clear()
         self._websocket_subscriptions.clear()
         self._websocket_heartbeat_tasks.clear()
+        self._websocket_outboxes.clear()
 
         # Stop server
+        if self.unix_site:
+            await self.unix_site.stop()
+            self.unix_site = None
+            if self.socket_path is not None:
+                with contextlib.suppress(OSError):
+                    self.socket_path.unlink()
         if self.site:
             await self.site.stop()
+            self.site = None
         if self.runner:
             await self.runner.cleanup()
+            self.runner = None
 
         logger.info("IPC server stopped")
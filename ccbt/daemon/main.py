@@ -18,9 +18,16 @@ if TYPE_CHECKING:
 
 from ccbt.config.config import init_config
 from ccbt.daemon.daemon_manager import DaemonManager
+from ccbt.daemon.ipc_protocol import IPC_SOCKET_NAME
 from ccbt.daemon.ipc_server import IPCServer  # type: ignore[attr-defined]
 from ccbt.daemon.state_manager import StateManager
-from ccbt.monitoring import init_metrics, shutdown_metrics
+from ccbt.monitoring import (
+    init_metrics,
+    init_tracing,
+    shutdown_metrics,
+    shutdown_tracing,
+)
+from ccbt.observability import init_loop_monitor, shutdown_loop_monitor
 from ccbt.session.session import AsyncSessionManager
 from ccbt.utils.logging_config import get_logger, setup_logging
 
@@ -207,6 +214,20 @@ class DaemonMain:
                     "Error initializing metrics collection, continuing without metrics"
                 )
 
+            # Initialize tracing (sampling rate and span export)
+            try:
+                await init_tracing()
+            except Exception:
+                logger.exception("Error initializing tracing, continuing without it")
+
+            # Monitor event loop lag, slow callbacks and task counts
+            try:
+                init_loop_monitor()
+            except Exception:
+                logger.exception(
+                    "Error starting event loop monitor, continuing without it"
+                )
+
             # CRITICAL FIX: IPC server initialization moved here (after session manager start)
             # Security components were initialized earlier, so we can use them now
             # Get IPC configuration
@@ -220,6 +241,11 @@ class DaemonMain:
                 if daemon_config
                 else 30.0
             )
+            socket_path: str | Path | None = None
+            if daemon_config is None or daemon_config.ipc_socket_enabled:
+                socket_path = (
+                    daemon_config.ipc_socket_path if daemon_config else None
+                ) or self.daemon_manager.state_dir / IPC_SOCKET_NAME
 
             # CRITICAL FIX: Check if IPC port is available before attempting to bind
             from ccbt.utils.port_checker import (
@@ -271,6 +297,7 @@ class DaemonMain:
                 websocket_enabled=websocket_enabled,
                 websocket_heartbeat_interval=websocket_heartbeat,
                 tls_enabled=self._tls_enabled,
+                socket_path=socket_path,
             )
 
             # Start IPC server
@@ -376,6 +403,13 @@ class DaemonMain:
                 )
                 if await self.state_manager.validate_state(state):
                     restored_count = 0
+                    # Torrents restore one at a time; hold handshakes for the
+                    # ones still queued instead of rejecting them as unknown
+                    router = getattr(self.session_manager, "info_hash_router", None)
+                    if router is not None:
+                        for info_hash_hex in state.torrents:
+                            with contextlib.suppress(ValueError):
+                                router.expect(bytes.fromhex(info_hash_hex))
                     for info_hash_hex, torrent_state in state.torrents.items():
                         try:
                             # Restore torrent using source info
@@ -414,6 +448,10 @@ class DaemonMain:
                                 "Failed to restore torrent %s",
                                 info_hash_hex,
                             )
+                        finally:
+                            if router is not None:
+                                with contextlib.suppress(ValueError):
+                                    router.abandon(bytes.fromhex(info_hash_hex))
                     logger.info(
                         "Restored %d/%d torrents from state",
                         restored_count,
@@ -715,6 +753,18 @@ class DaemonMain:
         except Exception:
             logger.exception("Error shutting down metrics collection")
 
+        # Flush and stop trace export
+        try:
+            await shutdown_tracing()
+        except Exception:
+            logger.exception("Error shutting down tracing")
+
+        # Stop event loop monitoring and any profiling run
+        try:
+            shutdown_loop_monitor()
+        except Exception:
+            logger.exception("Error stopping event loop monitor")
+
         # Save state (before stopping services)
         if self.session_manager:
             try:
@@ -0,0 +1,332 @@
+"""Versioned torrent status snapshots and WebSocket fan-out.
+
+The daemon samples torrent status once per tick, only while someone is
+subscribed, and records for every field the snapshot version at which it
+last changed. A subscriber remembers the last version it received and is
+sent only the fields changed since then, so an idle torrent costs a few
+comparisons per tick and nothing on the wire.
+
+Each connection has a bounded outbox drained by its own writer task.
+Event messages are encoded once and queued on every interested outbox; a
+subscriber that falls too far behind is disconnected instead of stalling
+the others. Status updates never queue up: a pending update is replaced
+by one computed from the subscriber's last delivered version.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+import logging
+from collections import deque
+from dataclasses import dataclass
+from typing import Any
+
+from aiohttp import WSCloseCode
+
+logger = logging.getLogger(__name__)
+
+# Torrent status fields carried by the stream (as in TorrentStatusResponse)
+STATUS_FIELDS = (
+    "name",
+    "status",
+    "progress",
+    "download_rate",
+    "upload_rate",
+    "num_peers",
+    "num_seeds",
+    "total_size",
+    "downloaded",
+    "uploaded",
+    "is_private",
+)
+
+# Removed torrents remembered for delta updates; older subscribers get a
+# full snapshot instead
+MAX_TOMBSTONES = 4096
+
+# Messages queued per connection before a slow subscriber is dropped
+MAX_PENDING_MESSAGES = 256
+
+
+def aggregate_global_stats(statuses: dict[str, dict[str, Any]]) -> dict[str, Any]:
+    """Aggregate global statistics from torrent statuses.
+
+    Produces the same keys as ``AsyncSessionManager.get_global_stats()``.
+    """
+    num_paused = 0
+    num_seeding = 0
+    download_rate = 0.0
+    upload_rate = 0.0
+    progress = 0.0
+    for status in statuses.values():
+        state = status.get("status", "")
+        if state == "paused":
+            num_paused += 1
+        elif state == "seeding":
+            num_seeding += 1
+        download_rate += float(status.get("download_rate", 0.0))
+        upload_rate += float(status.get("upload_rate", 0.0))
+        progress += float(status.get("progress", 0.0))
+    count = len(statuses)
+    return {
+        "num_torrents": count,
+        "num_active": count - num_paused - num_seeding,
+        "num_paused": num_paused,
+        "num_seeding": num_seeding,
+        "download_rate": download_rate,
+        "upload_rate": upload_rate,
+        "average_progress": progress / count if count else 0.0,
+    }
+
+
+class StatusSnapshot:
+    """Torrent status with the version at which each field last changed."""
+
+    def __init__(self, max_tombstones: int = MAX_TOMBSTONES):
+        """Initialize an empty snapshot (version 0)."""
+        self.version = 0
+        self.max_tombstones = max_tombstones
+        self.torrents: dict[str, dict[str, Any]] = {}
+        self.global_stats: dict[str, Any] = {}
+        self._field_versions: dict[str, dict[str, int]] = {}
+        # Info hash -> last change version, kept in ascending version order
+        self._torrent_versions: dict[str, int] = {}
+        self._global_versions: dict[str, int] = {}
+        # Info hash -> removal version, in ascending version order
+        self._removed: dict[str, int] = {}
+        # Deltas from versions below this cannot list every removal
+        self._floor = 0
+        self._encoded: dict[tuple[int, frozenset[str] | None], str] = {}
+
+    def update(self, statuses: dict[str, dict[str, Any]]) -> bool:
+        """Record a new sample of every torrent's status.
+
+        Args:
+            statuses: Status per info hash, as from ``get_status()``
+
+        Returns:
+            True if anything changed and the version was bumped
+
+        """
+        version = self.version + 1
+        changed = False
+
+        for info_hash in [ih for ih in self.torrents if ih not in statuses]:
+            del self.torrents[info_hash]
+            del self._field_versions[info_hash]
+            del self._torrent_versions[info_hash]
+            self._removed[info_hash] = version
+            changed = True
+        while len(self._removed) > self.max_tombstones:
+            oldest = next(iter(self._removed))
+            self._floor = self._removed.pop(oldest)
+
+        for info_hash, status in statuses.items():
+            current = self.torrents.get(info_hash)
+            if current is None:
+                current = self.torrents[info_hash] = {}
+                self._field_versions[info_hash] = {}
+                self._removed.pop(info_hash, None)
+            field_versions = self._field_versions[info_hash]
+            torrent_changed = False
+            for field in STATUS_FIELDS:
+                if field not in status:
+                    continue
+                value = status[field]
+                if field not in current or current[field] != value:
+                    current[field] = value
+                    field_versions[field] = version
+                    torrent_changed = True
+            if torrent_changed:
+                # Re-insert so the dict stays ordered by version
+                self._torrent_versions.pop(info_hash, None)
+                self._torrent_versions[info_hash] = version
+                changed = True
+
+        for key, value in aggregate_global_stats(statuses).items():
+            if key not in self.global_stats or self.global_stats[key] != value:
+                self.global_stats[key] = value
+                self._global_versions[key] = version
+                changed = True
+
+        if changed:
+            self.version = version
+            self._encoded.clear()
+        return changed
+
+    def delta_since(
+        self,
+        since: int,
+        fields: frozenset[str] | None = None,
+    ) -> dict[str, Any]:
+        """Build the status message bringing a subscriber at ``since`` current.
+
+        Args:
+            since: Last version the subscriber received (0 for none)
+            fields: Torrent fields to include, or None for all
+
+        """
+        full = since <= 0 or since < self._floor
+        if full:
+            since = 0
+        torrents: dict[str, dict[str, Any]] = {}
+        for info_hash, version in reversed(self._torrent_versions.items()):
+            if version <= since:
+                break
+            current = self.torrents[info_hash]
+            changes = {
+                field: current[field]
+                for field, field_version in self._field_versions[info_hash].items()
+                if field_version > since and (fields is None or field in fields)
+            }
+            if changes:
+                torrents[info_hash] = changes
+
+        removed: list[str] = []
+        if not full:
+            for info_hash, version in reversed(self._removed.items()):
+                if version <= since:
+                    break
+                removed.append(info_hash)
+
+        return {
+            "action": "status",
+            "version": self.version,
+            "full": full,
+            "torrents": torrents,
+            "removed": removed,
+            "global_stats": {
+                key: value
+                for key, value in self.global_stats.items()
+                if self._global_versions[key] > since
+            },
+        }
+
+    def encode_delta(self, since: int, fields: frozenset[str] | None = None) -> str:
+        """Return ``delta_since()`` as JSON, encoded once per distinct request."""
+        key = (since, fields)
+        payload = self._encoded.get(key)
+        if payload is None:
+            payload = json.dumps(
+                self.delta_since(since, fields), separators=(",", ":"), default=str
+            )
+            self._encoded[key] = payload
+        return payload
+
+
+@dataclass
+class StatusSubscription:
+    """A connection's status stream settings and progress."""
+
+    interval: float
+    fields: frozenset[str] | None = None
+    version: int = 0  # Last snapshot version delivered
+    next_due: float = 0.0
+
+
+class WebSocketOutbox:
+    """Bounded send queue for one WebSocket, drained by its own task."""
+
+    def __init__(self, ws: Any, max_pending: int = MAX_PENDING_MESSAGES):
+        """Initialize outbox.
+
+        Args:
+            ws: WebSocket to write to (anything with ``send_str`` and ``close``)
+            max_pending: Queued messages beyond which the subscriber is dropped
+
+        """
+        self.ws = ws
+        self.max_pending = max_pending
+        self.closed = False
+        self._messages: deque[str] = deque()
+        self._status: tuple[StatusSubscription, int, str] | None = None
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        """Start the writer task."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    @property
+    def pending(self) -> int:
+        """Number of messages waiting to be written."""
+        return len(self._messages) + (self._status is not None)
+
+    def put(self, payload: str) -> bool:
+        """Queue an encoded message.
+
+        Returns:
+            False if the outbox is closed or was full, in which case the
+            connection is closed
+
+        """
+        if self.closed:
+            return False
+        if len(self._messages) >= self.max_pending:
+            logger.debug("Dropping slow WebSocket subscriber")
+            self.abort()
+            return False
+        self._messages.append(payload)
+        self._wakeup.set()
+        return True
+
+    def put_status(
+        self, subscription: StatusSubscription, version: int, payload: str
+    ) -> None:
+        """Queue a status update, replacing one that has not been sent yet.
+
+        ``subscription.version`` advances to ``version`` once it is written.
+        """
+        if self.closed:
+            return
+        self._status = (subscription, version, payload)
+        self._wakeup.set()
+
+    async def _run(self) -> None:
+        try:
+            while True:
+                await self._wakeup.wait()
+                self._wakeup.clear()
+                while self._messages or self._status is not None:
+                    if self._messages:
+                        await self.ws.send_str(self._messages.popleft())
+                    else:
+                        subscription, version, payload = self._status  # type: ignore[misc]
+                        self._status = None
+                        await self.ws.send_str(payload)
+                        subscription.version = version
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.debug("Error writing to WebSocket: %s", e)
+            self.closed = True
+
+    def abort(self) -> None:
+        """Discard queued messages and close the connection."""
+        if self.closed:
+            return
+        self.closed = True
+        self._messages.clear()
+        self._status = None
+        if self._task is not None:
+            self._task.cancel()
+        self._task = asyncio.ensure_future(
+            self.ws.close(
+                code=WSCloseCode.TRY_AGAIN_LATER,
+                message=b"Subscriber too slow",
+            )
+        )
+
+    async def close(self) -> None:
+        """Stop the writer task, discarding queued messages."""
+        self.closed = True
+        self._messages.clear()
+        self._status = None
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError, Exception):
+                await self._task
+            self._task = None
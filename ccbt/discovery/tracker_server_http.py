@@ -10,7 +10,7 @@ from __future__ import annotations
 import socket
 import time
 from http.server import BaseHTTPRequestHandler, HTTPServer
-from urllib.parse import parse_qs, unquote_to_bytes, urlparse
+from urllib.parse import parse_qs, urlparse
 
 from ccbt.core.bencode import encode
 
@@ -71,7 +71,9 @@ class AnnounceHandler(BaseHTTPRequestHandler):
             self.send_error(404)
             return
 
-        params = parse_qs(parsed.query)
+        # Latin-1 maps each percent-decoded byte to one character, so binary
+        # values such as info_hash survive the round trip unchanged
+        params = parse_qs(parsed.query, encoding="latin-1")
         try:
             info_hash_enc = params.get("info_hash", [None])[0]
             peer_id_enc = params.get("peer_id", [None])[0]
@@ -82,10 +84,7 @@ class AnnounceHandler(BaseHTTPRequestHandler):
                 msg = "missing info_hash or peer_id"
                 raise ValueError(msg)
 
-            # Decode binary params as raw percent-decoded bytes
-            info_hash = unquote_to_bytes(info_hash_enc)
-            # peer_id not used for store, but validate format
-            _ = unquote_to_bytes(peer_id_enc)
+            info_hash = info_hash_enc.encode("latin-1")
 
             port = int(port_str)
             ip = self.client_address[0]
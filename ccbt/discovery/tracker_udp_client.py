@@ -290,7 +290,9 @@ class AsyncUDPTrackerClient:
                     import sys
 
                     loop = asyncio.get_event_loop()
-                    is_proactor = isinstance(loop, asyncio.ProactorEventLoop)
+                    is_proactor = sys.platform == "win32" and isinstance(
+                        loop, asyncio.ProactorEventLoop
+                    )
                     if sys.platform == "win32" and is_proactor:
                         await asyncio.sleep(0.3)  # Longer wait for Proactor
                     else:
@@ -493,7 +495,9 @@ class AsyncUDPTrackerClient:
                 import sys
 
                 loop = asyncio.get_event_loop()
-                is_proactor = isinstance(loop, asyncio.ProactorEventLoop)
+                is_proactor = sys.platform == "win32" and isinstance(
+                    loop, asyncio.ProactorEventLoop
+                )
                 if sys.platform == "win32" and is_proactor:
                     # Wait longer for Proactor to release socket resources
                     await asyncio.sleep(0.3)
@@ -974,7 +978,9 @@ class AsyncUDPTrackerClient:
                     # WinError 10022 can occur if socket state is not properly synchronized
                     import sys
                     loop = asyncio.get_event_loop()
-                    is_proactor = isinstance(loop, asyncio.ProactorEventLoop)
+                    is_proactor = sys.platform == "win32" and isinstance(
+                        loop, asyncio.ProactorEventLoop
+                    )
                     if sys.platform == "win32" and is_proactor:
                         # Small delay to ensure socket state is synchronized on Windows Proactor
                         await asyncio.sleep(0.01)
@@ -1338,7 +1344,9 @@ class AsyncUDPTrackerClient:
                 # CRITICAL FIX: On Windows ProactorEventLoop, ensure socket is fully ready before sendto
                 import sys
                 loop = asyncio.get_event_loop()
-                is_proactor = isinstance(loop, asyncio.ProactorEventLoop)
+                is_proactor = sys.platform == "win32" and isinstance(
+                    loop, asyncio.ProactorEventLoop
+                )
                 if sys.platform == "win32" and is_proactor:
                     # Small delay to ensure socket state is synchronized on Windows Proactor
                     await asyncio.sleep(0.01)
@@ -1607,7 +1615,9 @@ class AsyncUDPTrackerClient:
                 # CRITICAL FIX: On Windows ProactorEventLoop, ensure socket is fully ready before sendto
                 import sys
                 loop = asyncio.get_event_loop()
-                is_proactor = isinstance(loop, asyncio.ProactorEventLoop)
+                is_proactor = sys.platform == "win32" and isinstance(
+                    loop, asyncio.ProactorEventLoop
+                )
                 if sys.platform == "win32" and is_proactor:
                     # Small delay to ensure socket state is synchronized on Windows Proactor
                     await asyncio.sleep(0.01)
@@ -2284,7 +2294,9 @@ class AsyncUDPTrackerClient:
                 # CRITICAL FIX: On Windows ProactorEventLoop, ensure socket is fully ready before sendto
                 import sys
                 loop = asyncio.get_event_loop()
-                is_proactor = isinstance(loop, asyncio.ProactorEventLoop)
+                is_proactor = sys.platform == "win32" and isinstance(
+                    loop, asyncio.ProactorEventLoop
+                )
                 if sys.platform == "win32" and is_proactor:
                     # Small delay to ensure socket state is synchronized on Windows Proactor
                     await asyncio.sleep(0.01)
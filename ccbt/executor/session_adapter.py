@@ -24,6 +24,7 @@ if TYPE_CHECKING:
         ScrapeResult,
         TorrentStatusResponse,
     )
+    from ccbt.session.torrent_index import ListQuery
 
 
 class SessionAdapter(ABC):
@@ -75,6 +76,19 @@ class SessionAdapter(ABC):
 
         """
 
+    @abstractmethod
+    async def query_torrents(self, query: ListQuery) -> dict[str, Any]:
+        """List torrents filtered, sorted, paged and projected.
+
+        Args:
+            query: Filters, sort order, page and fields
+
+        Returns:
+            Dict with ``torrents`` (rows with the requested fields),
+            ``total`` and ``next_cursor``
+
+        """
+
     @abstractmethod
     async def get_torrent_status(self, info_hash: str) -> TorrentStatusResponse | None:
         """Get torrent status.
@@ -396,6 +410,20 @@ class SessionAdapter(ABC):
 
         """
 
+    @abstractmethod
+    async def query_peers(self, info_hash: str, query: ListQuery) -> dict[str, Any]:
+        """List a torrent's peers sorted, paged and projected.
+
+        Args:
+            info_hash: Torrent info hash (hex string)
+            query: Sort order, page and fields
+
+        Returns:
+            Dict with ``peers`` (rows with the requested fields), ``total``
+            and ``next_cursor``
+
+        """
+
     @abstractmethod
     async def set_rate_limits(
         self,
@@ -548,6 +576,10 @@ class LocalSessionAdapter(SessionAdapter):
             )
         return torrents
 
+    async def query_torrents(self, query: ListQuery) -> dict[str, Any]:
+        """List torrents filtered, sorted, paged and projected."""
+        return await self.session_manager.query_torrents(query)
+
     async def get_torrent_status(self, info_hash: str) -> TorrentStatusResponse | None:
         """Get torrent status."""
         from ccbt.daemon.ipc_protocol import TorrentStatusResponse
@@ -1277,6 +1309,10 @@ class LocalSessionAdapter(SessionAdapter):
         """Get list of peers for a torrent."""
         return await self.session_manager.get_peers_for_torrent(info_hash)
 
+    async def query_peers(self, info_hash: str, query: ListQuery) -> dict[str, Any]:
+        """List a torrent's peers sorted, paged and projected."""
+        return await self.session_manager.query_peers(info_hash, query)
+
     async def set_rate_limits(
         self,
         info_hash: str,
@@ -1451,6 +1487,11 @@ class DaemonSessionAdapter(SessionAdapter):
         """List all torrents."""
         return await self.ipc_client.list_torrents()
 
+    async def query_torrents(self, query: ListQuery) -> dict[str, Any]:
+        """List torrents filtered, sorted, paged and projected."""
+        page = await self.ipc_client.query_torrents(query)
+        return page.model_dump()
+
     async def get_torrent_status(self, info_hash: str) -> TorrentStatusResponse | None:
         """Get torrent status."""
         return await self.ipc_client.get_torrent_status(info_hash)
@@ -1624,6 +1665,11 @@ class DaemonSessionAdapter(SessionAdapter):
             )
             raise RuntimeError(f"Error communicating with daemon: {e}") from e
 
+    async def query_peers(self, info_hash: str, query: ListQuery) -> dict[str, Any]:
+        """List a torrent's peers sorted, paged and projected."""
+        page = await self.ipc_client.query_peers(info_hash, query)
+        return page.model_dump()
+
     async def set_rate_limits(
         self,
         info_hash: str,
@@ -6,10 +6,13 @@ Handles torrent-related commands (add, remove, list, status, pause, resume).
 from __future__ import annotations
 
 import asyncio
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from ccbt.executor.base import CommandExecutor, CommandResult
 
+if TYPE_CHECKING:
+    from ccbt.session.torrent_index import ListQuery
+
 
 class TorrentExecutor(CommandExecutor):
     """Executor for torrent commands."""
@@ -37,6 +40,8 @@ class TorrentExecutor(CommandExecutor):
             return await self._remove_torrent(**kwargs)
         if command == "torrent.list":
             return await self._list_torrents()
+        if command == "torrent.query":
+            return await self._query_torrents(**kwargs)
         if command == "torrent.status":
             return await self._get_torrent_status(**kwargs)
         if command == "torrent.pause":
@@ -45,6 +50,8 @@ class TorrentExecutor(CommandExecutor):
             return await self._resume_torrent(**kwargs)
         if command == "torrent.get_peers":
             return await self._get_peers_for_torrent(**kwargs)
+        if command == "torrent.query_peers":
+            return await self._query_peers(**kwargs)
         if command == "torrent.set_rate_limits":
             return await self._set_rate_limits(**kwargs)
         if command == "torrent.force_announce":
@@ -144,6 +151,14 @@ class TorrentExecutor(CommandExecutor):
         except Exception as e:
             return CommandResult(success=False, error=str(e))
 
+    async def _query_torrents(self, query: ListQuery) -> CommandResult:
+        """List torrents filtered, sorted, paged and projected."""
+        try:
+            page = await self.adapter.query_torrents(query)
+            return CommandResult(success=True, data=page)
+        except Exception as e:
+            return CommandResult(success=False, error=str(e))
+
     async def _get_torrent_status(self, info_hash: str) -> CommandResult:
         """Get torrent status."""
         try:
@@ -176,6 +191,14 @@ class TorrentExecutor(CommandExecutor):
         except Exception as e:
             return CommandResult(success=False, error=str(e))
 
+    async def _query_peers(self, info_hash: str, query: ListQuery) -> CommandResult:
+        """List a torrent's peers sorted, paged and projected."""
+        try:
+            page = await self.adapter.query_peers(info_hash, query)
+            return CommandResult(success=True, data=page)
+        except Exception as e:
+            return CommandResult(success=False, error=str(e))
+
     async def _set_rate_limits(
         self,
         info_hash: str,
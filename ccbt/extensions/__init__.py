@@ -16,11 +16,14 @@ from ccbt.extensions.fast import FastExtension
 from ccbt.extensions.pex import PeerExchange
 from ccbt.extensions.protocol import ExtensionProtocol
 from ccbt.extensions.webseed import WebSeedExtension
+from ccbt.extensions.webseed_engine import WebSeedEngine, WebSeedLayout
 
 __all__ = [
     "DHTExtension",
     "ExtensionProtocol",
     "FastExtension",
     "PeerExchange",
+    "WebSeedEngine",
     "WebSeedExtension",
+    "WebSeedLayout",
 ]
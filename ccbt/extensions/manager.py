@@ -24,7 +24,7 @@ from ccbt.extensions.xet import XetExtension
 from ccbt.utils.events import Event, EventType, emit_event
 
 if TYPE_CHECKING:  # pragma: no cover - type checking only, not executed at runtime
-    from ccbt.models import PeerInfo, PieceInfo
+    from ccbt.models import PeerInfo, PieceInfo, TorrentInfo
 
 
 class ExtensionStatus(Enum):
@@ -421,14 +421,19 @@ class ExtensionManager:
         else:
             return data
 
-    def add_webseed(self, url: str, name: str | None = None) -> str:
-        """Add WebSeed."""
+    def add_webseed(
+        self,
+        url: str,
+        name: str | None = None,
+        torrent_info: TorrentInfo | None = None,
+    ) -> str:
+        """Add WebSeed, mapping pieces onto the files of ``torrent_info``."""
         if not self.is_extension_active("webseed"):
             msg = "WebSeed extension not active"
             raise RuntimeError(msg)
 
         webseed_ext = self.extensions["webseed"]
-        return webseed_ext.add_webseed(url, name)
+        return webseed_ext.add_webseed(url, name, torrent_info)
 
     def remove_webseed(self, webseed_id: str) -> None:
         """Remove WebSeed."""
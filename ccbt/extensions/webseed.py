@@ -18,10 +18,14 @@ from urllib.parse import urlparse
 
 import aiohttp
 
+from ccbt.extensions.webseed_engine import WebSeedEngine, WebSeedLayout
 from ccbt.utils.events import Event, EventType, emit_event
 
 if TYPE_CHECKING:  # pragma: no cover - type checking only, not executed at runtime
-    from ccbt.models import PieceInfo
+    from collections.abc import Iterable
+
+    from ccbt.extensions.webseed_engine import PieceCallback
+    from ccbt.models import PieceInfo, TorrentInfo
 
 
 @dataclass
@@ -47,6 +51,7 @@ class WebSeedExtension:
         self.webseeds: dict[str, WebSeedInfo] = {}
         self.session: aiohttp.ClientSession | None = None
         self.timeout = aiohttp.ClientTimeout(total=30.0)
+        self.layout: WebSeedLayout | None = None
         self.logger = logging.getLogger(__name__)
 
     async def start(self) -> None:
@@ -103,8 +108,19 @@ class WebSeedExtension:
             await self.session.close()
             self.session = None
 
-    def add_webseed(self, url: str, name: str | None = None) -> str:
-        """Add WebSeed URL."""
+    def add_webseed(
+        self,
+        url: str,
+        name: str | None = None,
+        torrent_info: TorrentInfo | None = None,
+    ) -> str:
+        """Add WebSeed URL.
+
+        When ``torrent_info`` is given, the BEP 19 file layout is built from
+        it so pieces are requested from the files they lie in.
+        """
+        if torrent_info is not None:
+            self.set_layout(WebSeedLayout.from_torrent_info(torrent_info))
         webseed_id = url
         self.webseeds[webseed_id] = WebSeedInfo(
             url=url,
@@ -160,6 +176,14 @@ class WebSeedExtension:
                 # No event loop running, skip event emission
                 pass
 
+    def set_layout(self, layout: WebSeedLayout | None) -> None:
+        """Set the torrent file layout used to map pieces to seed URLs.
+
+        Without a layout pieces are requested as ``index * length`` from the
+        seed URL itself, which is only right for single-file torrents.
+        """
+        self.layout = layout
+
     def get_webseed(self, webseed_id: str) -> WebSeedInfo | None:
         """Get WebSeed information."""
         return self.webseeds.get(webseed_id)
@@ -202,6 +226,25 @@ class WebSeedExtension:
             ):  # Tested in test_webseed_coverage.py::TestWebSeedExtensionCoverage::test_download_piece_session_none_after_start
                 return None
 
+            if self.layout is not None:
+                # BEP 19: map the piece onto the files it spans
+                start_byte, length = self.layout.piece_range(piece_info.index)
+                engine = WebSeedEngine(self.layout, [webseed.url], session=self.session)
+                data = await engine.fetch_range(webseed.url, start_byte, length)
+                self._record_download(webseed, len(data))
+                await emit_event(
+                    Event(
+                        event_type=EventType.WEBSEED_DOWNLOAD_SUCCESS.value,
+                        data={
+                            "webseed_id": webseed_id,
+                            "piece_index": piece_info.index,
+                            "bytes_downloaded": len(data),
+                            "timestamp": time.time(),
+                        },
+                    ),
+                )
+                return data
+
             async with self.session.get(webseed.url, headers=headers) as response:
                 # Handle proxy authentication challenge
                 if (
@@ -287,6 +330,50 @@ class WebSeedExtension:
 
             return None
 
+    async def download_pieces(
+        self,
+        piece_indices: Iterable[int],
+        on_piece: PieceCallback,
+    ) -> list[int]:
+        """Download pieces from all active WebSeeds.
+
+        Adjacent pieces are coalesced into larger range requests and several
+        requests are kept in flight per seed (see
+        :class:`ccbt.extensions.webseed_engine.WebSeedEngine`). Requires a
+        layout set with :meth:`set_layout`.
+
+        Args:
+            piece_indices: Pieces to download
+            on_piece: Called (or awaited) with the index and data of each piece
+
+        Returns:
+            Sorted indices of the pieces that could not be downloaded
+
+        """
+        pieces = sorted(set(piece_indices))
+        urls = [w.url for w in self.webseeds.values() if w.is_active]
+        if self.layout is None or not urls:
+            return pieces
+        if self.session is None:
+            await self.start()
+
+        engine = WebSeedEngine(self.layout, urls, session=self.session)
+        failed = await engine.download(pieces, on_piece)
+        for host in engine.hosts.values():
+            webseed = self.webseeds.get(host.url)
+            if webseed is not None and host.bytes_downloaded:
+                self._record_download(webseed, host.bytes_downloaded)
+        return failed
+
+    @staticmethod
+    def _record_download(webseed: WebSeedInfo, nbytes: int) -> None:
+        """Update WebSeed statistics after a successful download."""
+        webseed.last_accessed = time.time()
+        webseed.bytes_downloaded += nbytes
+        webseed.success_rate = webseed.bytes_downloaded / (
+            webseed.bytes_downloaded + webseed.bytes_failed
+        )
+
     async def download_piece_range(
         self,
         webseed_id: str,
@@ -0,0 +1,549 @@
+"""Pipelined WebSeed downloader (BEP 19).
+
+Provides:
+- Mapping of pieces onto per-file URLs as BEP 19 requires
+- Coalescing of adjacent pieces into larger range requests
+- Several range requests in flight per seed over pooled keep-alive
+  connections, with the number adapted to each seed's observed throughput
+- Streaming of response bodies straight into piece buffers
+
+A BEP 19 seed URL names either the file of a single-file torrent (or a
+directory to which the torrent name is appended when it ends in ``/``) or
+the directory holding the torrent's root directory, under which each file
+lives at ``<name>/<path>``. A piece that spans files is fetched with one
+range request per file.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import bisect
+import inspect
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Callable
+from urllib.parse import quote
+
+import aiohttp
+
+if TYPE_CHECKING:  # pragma: no cover - type checking only, not executed at runtime
+    from collections.abc import Awaitable, Iterable, Sequence
+
+    from ccbt.models import TorrentInfo
+
+# Largest span fetched by one range request after coalescing pieces
+DEFAULT_MAX_REQUEST_SIZE = 4 * 1024 * 1024
+
+# Size of the reads copied from a response body into the piece buffer
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# Consecutive failures after which a seed is no longer used
+MAX_SEED_FAILURES = 3
+
+PieceCallback = Callable[[int, bytes], "Awaitable[None] | None"]
+
+
+class WebSeedError(Exception):
+    """A range request to a WebSeed failed."""
+
+
+@dataclass(frozen=True)
+class WebSeedFile:
+    """A file as seen by WebSeed requests."""
+
+    path: tuple[str, ...]
+    length: int
+    offset: int
+    is_padding: bool = False
+
+
+@dataclass(frozen=True)
+class FileSpan:
+    """Part of a torrent byte range that lies in one file."""
+
+    file_index: int
+    file_offset: int
+    length: int
+    buffer_offset: int
+
+
+class WebSeedLayout:
+    """Maps torrent byte ranges onto the files a WebSeed serves."""
+
+    def __init__(
+        self,
+        name: str,
+        files: Sequence[WebSeedFile],
+        piece_length: int,
+        multi_file: bool,
+    ):
+        """Initialize layout.
+
+        Args:
+            name: Torrent name (the root directory of multi-file torrents)
+            files: Files in torrent order with their torrent offsets
+            piece_length: Piece length in bytes
+            multi_file: Whether seed URLs name a directory of files
+
+        """
+        self.name = name
+        self.files = list(files)
+        self.piece_length = piece_length
+        self.multi_file = multi_file
+        self.total_length = sum(f.length for f in self.files)
+        self.num_pieces = -(-self.total_length // piece_length)
+        self._starts = [f.offset for f in self.files]
+
+    @classmethod
+    def from_torrent_info(cls, torrent_info: TorrentInfo) -> WebSeedLayout:
+        """Build a layout from parsed torrent information."""
+        files = []
+        offset = 0
+        for file_info in torrent_info.files:
+            path = tuple(file_info.path) if file_info.path else (file_info.name,)
+            files.append(
+                WebSeedFile(path, file_info.length, offset, file_info.is_padding)
+            )
+            offset += file_info.length
+        multi_file = any(f.path is not None for f in torrent_info.files)
+        return cls(torrent_info.name, files, torrent_info.piece_length, multi_file)
+
+    def piece_range(self, piece_index: int) -> tuple[int, int]:
+        """Return the torrent offset and length of a piece.
+
+        Raises:
+            IndexError: If the piece is outside the torrent
+
+        """
+        if not 0 <= piece_index < self.num_pieces:
+            msg = f"Piece {piece_index} is outside the torrent"
+            raise IndexError(msg)
+        start = piece_index * self.piece_length
+        return start, min(self.piece_length, self.total_length - start)
+
+    def file_url(self, base_url: str, file_index: int) -> str:
+        """Return the URL of a file on a seed, following BEP 19."""
+        if not self.multi_file:
+            return base_url + quote(self.name) if base_url.endswith("/") else base_url
+        parts = (self.name, *self.files[file_index].path)
+        if not base_url.endswith("/"):
+            base_url += "/"
+        return base_url + "/".join(quote(part) for part in parts)
+
+    def map_range(self, start: int, length: int) -> list[FileSpan]:
+        """Split a torrent byte range into per-file spans.
+
+        Padding files (BEP 47) are skipped; their bytes are zero and are
+        never requested.
+        """
+        spans = []
+        end = start + length
+        index = max(0, bisect.bisect_right(self._starts, start) - 1)
+        while index < len(self.files) and start < end:
+            f = self.files[index]
+            file_end = f.offset + f.length
+            if start < file_end:
+                span_end = min(end, file_end)
+                if not f.is_padding:
+                    spans.append(
+                        FileSpan(
+                            index,
+                            start - f.offset,
+                            span_end - start,
+                            start - (end - length),
+                        )
+                    )
+                start = span_end
+            index += 1
+        return spans
+
+
+def coalesce_pieces(
+    piece_indices: Iterable[int],
+    piece_length: int,
+    max_request_size: int = DEFAULT_MAX_REQUEST_SIZE,
+) -> list[tuple[int, int]]:
+    """Group pieces into runs of adjacent pieces.
+
+    Args:
+        piece_indices: Pieces to fetch, in any order
+        piece_length: Piece length in bytes
+        max_request_size: Largest run in bytes (at least one piece)
+
+    Returns:
+        List of (first piece, piece count) runs in piece order
+
+    """
+    per_run = max(1, max_request_size // piece_length)
+    runs: list[tuple[int, int]] = []
+    for index in sorted(set(piece_indices)):
+        if runs:
+            first, count = runs[-1]
+            if first + count == index and count < per_run:
+                runs[-1] = (first, count + 1)
+                continue
+        runs.append((index, 1))
+    return runs
+
+
+@dataclass
+class WebSeedHost:
+    """Request window and throughput of one seed.
+
+    The window grows by one request while the throughput measured over the
+    last window keeps rising and shrinks when it drops or requests fail.
+    """
+
+    url: str
+    limit: int = 2
+    max_limit: int = 8
+    in_flight: int = 0
+    bytes_downloaded: int = 0
+    requests: int = 0
+    failures: int = 0
+    throughput: float = 0.0
+    _window_bytes: int = field(default=0, repr=False)
+    _window_requests: int = field(default=0, repr=False)
+    _window_start: float = field(default_factory=time.monotonic, repr=False)
+    _last_rate: float = field(default=0.0, repr=False)
+
+    @property
+    def usable(self) -> bool:
+        """Whether the seed has not failed too often in a row."""
+        return self.failures < MAX_SEED_FAILURES
+
+    def record_success(self, nbytes: int) -> None:
+        """Account for a completed request and adapt the window."""
+        self.failures = 0
+        self.requests += 1
+        self.bytes_downloaded += nbytes
+        self._window_bytes += nbytes
+        self._window_requests += 1
+        if self._window_requests < self.limit:
+            return
+        now = time.monotonic()
+        rate = self._window_bytes / max(now - self._window_start, 1e-6)
+        self.throughput = (
+            rate if not self.throughput else 0.5 * (self.throughput + rate)
+        )
+        if rate >= self._last_rate * 1.05:
+            self.limit = min(self.max_limit, self.limit + 1)
+        elif rate < self._last_rate * 0.9:
+            self.limit = max(1, self.limit - 1)
+        self._last_rate = rate
+        self._window_bytes = self._window_requests = 0
+        self._window_start = now
+
+    def record_failure(self) -> None:
+        """Account for a failed request and halve the window."""
+        self.failures += 1
+        self.limit = max(1, self.limit // 2)
+
+
+@dataclass
+class _Run:
+    first_piece: int
+    count: int
+    attempts: int = 0
+    tried: set[str] = field(default_factory=set)
+
+
+class WebSeedEngine:
+    """Download pieces from one or more WebSeeds.
+
+    Runs of adjacent pieces are queued and taken by per-seed workers, each
+    seed keeping up to its window of range requests in flight. Bodies are
+    copied into a buffer for the run as they arrive and every piece is
+    handed to the callback as soon as its last byte has been received. A
+    failed run is retried on another seed.
+
+    Attributes:
+        layout: Torrent file layout
+        hosts: Per-seed state, keyed by seed URL
+
+    """
+
+    def __init__(
+        self,
+        layout: WebSeedLayout,
+        urls: Iterable[str],
+        *,
+        session: aiohttp.ClientSession | None = None,
+        max_request_size: int = DEFAULT_MAX_REQUEST_SIZE,
+        initial_concurrency: int = 2,
+        max_concurrency: int = 8,
+        timeout: float = 30.0,
+    ):
+        """Initialize WebSeed engine.
+
+        Args:
+            layout: Torrent file layout
+            urls: Seed URLs (BEP 19 ``url-list``)
+            session: Session to use; by default one is created with a
+                keep-alive connection pool sized for ``max_concurrency``
+            max_request_size: Largest span fetched by one request
+            initial_concurrency: Requests in flight per seed at the start
+            max_concurrency: Most requests in flight per seed
+            timeout: Timeout of one range request in seconds
+
+        """
+        self.layout = layout
+        self.max_request_size = max(max_request_size, layout.piece_length)
+        self.max_concurrency = max(1, max_concurrency)
+        self.hosts = {
+            url: WebSeedHost(
+                url,
+                limit=min(max(1, initial_concurrency), self.max_concurrency),
+                max_limit=self.max_concurrency,
+            )
+            for url in urls
+        }
+        self.session = session
+        self._owns_session = session is None
+        self.timeout = aiohttp.ClientTimeout(total=timeout)
+        self.logger = logging.getLogger(__name__)
+
+    async def start(self) -> None:
+        """Create the HTTP session if none was given."""
+        if self.session is None:
+            connector = aiohttp.TCPConnector(
+                limit_per_host=self.max_concurrency,
+                keepalive_timeout=30.0,
+            )
+            self.session = aiohttp.ClientSession(
+                timeout=self.timeout, connector=connector
+            )
+            self._owns_session = True
+
+    async def stop(self) -> None:
+        """Close the HTTP session if the engine created it."""
+        if self.session is not None and self._owns_session:
+            await self.session.close()
+            self.session = None
+
+    async def __aenter__(self):
+        """Async context manager entry."""
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await self.stop()
+
+    async def fetch_range(self, url: str, start: int, length: int) -> bytes:
+        """Fetch a torrent byte range from one seed.
+
+        Args:
+            url: Seed URL
+            start: Torrent offset
+            length: Number of bytes
+
+        Returns:
+            The bytes of the range
+
+        Raises:
+            WebSeedError: If a request fails or returns short data
+
+        """
+        buffer = bytearray(length)
+        async for _ in self._stream_range(url, start, memoryview(buffer)):
+            pass
+        return bytes(buffer)
+
+    async def _stream_range(self, url: str, start: int, buffer: memoryview):
+        """Fill ``buffer`` with a torrent range, yielding the filled length.
+
+        Spans are fetched in order, so everything before the yielded length
+        is complete.
+        """
+        await self.start()
+        filled = 0
+        for span in self.layout.map_range(start, len(buffer)):
+            if span.buffer_offset > filled:
+                # Padding file bytes are already zero
+                filled = span.buffer_offset
+                yield filled
+            view = buffer[span.buffer_offset : span.buffer_offset + span.length]
+            async for received in self._stream_span(url, span, view):
+                yield span.buffer_offset + received
+            filled = span.buffer_offset + span.length
+        if filled < len(buffer):
+            yield len(buffer)
+
+    async def _stream_span(self, url: str, span: FileSpan, view: memoryview):
+        """Copy one file span into ``view``, yielding bytes received so far."""
+        if self.session is None:  # pragma: no cover - start() creates the session
+            msg = "WebSeed engine is not started"
+            raise WebSeedError(msg)
+        file_url = self.layout.file_url(url, span.file_index)
+        end = span.file_offset + span.length - 1
+        headers = {"Range": f"bytes={span.file_offset}-{end}"}
+        try:
+            async with self.session.get(file_url, headers=headers) as response:
+                whole_file = (
+                    span.file_offset == 0
+                    and span.length == self.layout.files[span.file_index].length
+                )
+                if response.status != 206 and not (
+                    response.status == 200 and whole_file
+                ):
+                    msg = f"HTTP {response.status} for {file_url} ({headers['Range']})"
+                    raise WebSeedError(msg)
+                received = 0
+                async for chunk in response.content.iter_chunked(STREAM_CHUNK_SIZE):
+                    if received + len(chunk) > span.length:
+                        msg = f"Response for {file_url} is longer than requested"
+                        raise WebSeedError(msg)
+                    view[received : received + len(chunk)] = chunk
+                    received += len(chunk)
+                    yield received
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            msg = f"Request to {file_url} failed: {e}"
+            raise WebSeedError(msg) from e
+        if received != span.length:
+            msg = f"Short response from {file_url}: {received} of {span.length} bytes"
+            raise WebSeedError(msg)
+
+    async def download(
+        self,
+        piece_indices: Iterable[int],
+        on_piece: PieceCallback,
+        max_attempts: int = 3,
+    ) -> list[int]:
+        """Download pieces, handing each to ``on_piece`` once it is complete.
+
+        Args:
+            piece_indices: Pieces to download
+            on_piece: Called (or awaited) with the index and data of a piece
+            max_attempts: Attempts per run of pieces before giving up
+
+        Returns:
+            Sorted indices of the pieces that could not be downloaded
+
+        """
+        await self.start()
+        pending: deque[_Run] = deque(
+            _Run(first, count)
+            for first, count in coalesce_pieces(
+                piece_indices, self.layout.piece_length, self.max_request_size
+            )
+        )
+        failed: list[int] = []
+        outstanding = len(pending)
+        changed = asyncio.Condition()
+
+        async def worker(host: WebSeedHost, slot: int) -> None:
+            nonlocal outstanding
+
+            def ready() -> bool:
+                # A free request slot and a run this seed has not tried yet,
+                # or nothing left to do
+                return (
+                    outstanding == 0
+                    or not host.usable
+                    or (
+                        slot < host.limit
+                        and any(host.url not in r.tried for r in pending)
+                    )
+                )
+
+            while host.usable:
+                async with changed:
+                    await changed.wait_for(ready)
+                    if outstanding == 0 or not host.usable:
+                        return
+                    run = next(r for r in pending if host.url not in r.tried)
+                    pending.remove(run)
+                    host.in_flight += 1
+
+                ok = await self._fetch_run(host, run, on_piece)
+
+                async with changed:
+                    host.in_flight -= 1
+                    if ok:
+                        outstanding -= 1
+                    else:
+                        run.attempts += 1
+                        run.tried.add(host.url)
+                        usable = {h.url for h in self.hosts.values() if h.usable}
+                        if run.attempts >= max_attempts or not usable:
+                            failed.extend(
+                                range(run.first_piece, run.first_piece + run.count)
+                            )
+                            outstanding -= 1
+                        else:
+                            pending.append(run)
+                        # A run every usable seed has failed, including one
+                        # left to a seed that has just become unusable,
+                        # would never be taken again: let them all retry it
+                        if usable:
+                            for waiting in pending:
+                                if usable <= waiting.tried:
+                                    waiting.tried.clear()
+                    changed.notify_all()
+
+        workers = [
+            asyncio.create_task(worker(host, slot))
+            for host in self.hosts.values()
+            for slot in range(host.max_limit)
+        ]
+        try:
+            await asyncio.gather(*workers)
+        finally:
+            for task in workers:
+                task.cancel()
+        for run in pending:
+            failed.extend(range(run.first_piece, run.first_piece + run.count))
+        return sorted(failed)
+
+    async def _fetch_run(
+        self,
+        host: WebSeedHost,
+        run: _Run,
+        on_piece: PieceCallback,
+    ) -> bool:
+        """Fetch a run of pieces from one seed, delivering completed pieces."""
+        start, _ = self.layout.piece_range(run.first_piece)
+        last_start, last_length = self.layout.piece_range(
+            run.first_piece + run.count - 1
+        )
+        length = last_start + last_length - start
+        buffer = memoryview(bytearray(length))
+        piece_length = self.layout.piece_length
+        delivered = 0
+        try:
+            async for filled in self._stream_range(host.url, start, buffer):
+                while delivered < run.count:
+                    piece_end = min((delivered + 1) * piece_length, length)
+                    if filled < piece_end:
+                        break
+                    data = bytes(buffer[delivered * piece_length : piece_end])
+                    result = on_piece(run.first_piece + delivered, data)
+                    if inspect.isawaitable(result):
+                        await result
+                    delivered += 1
+        except WebSeedError as e:
+            self.logger.debug("WebSeed %s: %s", host.url, e)
+            host.record_failure()
+            # Pieces already handed over do not need to be fetched again
+            run.first_piece += delivered
+            run.count -= delivered
+            return run.count == 0
+        host.record_success(length)
+        return True
+
+    def get_statistics(self) -> dict[str, dict[str, Any]]:
+        """Return request window and throughput for each seed."""
+        return {
+            url: {
+                "limit": host.limit,
+                "in_flight": host.in_flight,
+                "requests": host.requests,
+                "bytes_downloaded": host.bytes_downloaded,
+                "throughput": host.throughput,
+                "failures": host.failures,
+            }
+            for url, host in self.hosts.items()
+        }
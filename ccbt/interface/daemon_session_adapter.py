@@ -6,18 +6,41 @@ Provides AsyncSessionManager-like interface that wraps IPCClient for daemon comm
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import logging
 from typing import TYPE_CHECKING, Any, Callable
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from ccbt.daemon.ipc_client import IPCClient
-    from ccbt.daemon.ipc_protocol import EventType, WebSocketEvent
+    from ccbt.daemon.ipc_protocol import WebSocketEvent
 
 from ccbt.config.config import get_config
-from ccbt.daemon.ipc_protocol import EventType
+from ccbt.daemon.ipc_protocol import EventType, StatusDelta
+from ccbt.session.torrent_index import MAX_PAGE_LIMIT, ListQuery
 
 logger = logging.getLogger(__name__)
 
+# Status stream field names that differ from the cached status keys
+_STATUS_FIELD_KEYS = {"num_peers": "peers", "num_seeds": "seeds"}
+
+# Torrent fields kept in the cache (the columns the interface renders)
+_CACHED_TORRENT_FIELDS = frozenset(
+    {
+        "name",
+        "status",
+        "progress",
+        "download_rate",
+        "upload_rate",
+        "num_peers",
+        "num_seeds",
+        "total_size",
+        "downloaded",
+        "uploaded",
+    }
+)
+
 
 class DaemonInterfaceAdapter:
     """Adapter that makes IPCClient look like AsyncSessionManager.
@@ -46,6 +69,10 @@ class DaemonInterfaceAdapter:
         self._websocket_task: asyncio.Task | None = None
         self._event_callbacks: dict[EventType, list[Callable[[dict[str, Any]], None]]] = {}
         self._websocket_connected = False
+
+        # Status stream: cache is kept current by deltas pushed from the daemon
+        self.status_interval = 1.0
+        self._status_synced = False
         
         # Callbacks (matching AsyncSessionManager interface)
         self.on_torrent_added: Callable[[bytes, str], None] | None = None
@@ -95,6 +122,9 @@ class DaemonInterfaceAdapter:
                         EventType.TORRENT_COMPLETED,
                         EventType.TORRENT_STATUS_CHANGED,
                     ])
+                    await self._client.subscribe_status(
+                        interval=self.status_interval,
+                    )
                     
                     # Start event receive loop
                     self._websocket_task = asyncio.create_task(self._websocket_event_loop())
@@ -135,6 +165,7 @@ class DaemonInterfaceAdapter:
         if self._websocket_connected:
             await self._client._close_websocket()
             self._websocket_connected = False
+        self._status_synced = False
         
         # Close HTTP session
         await self._client.close()
@@ -180,6 +211,7 @@ class DaemonInterfaceAdapter:
                             break
                         
                         # Try to reconnect WebSocket
+                        self._status_synced = False
                         if await self._client.connect_websocket():
                             await self._client.subscribe_events([
                                 EventType.TORRENT_ADDED,
@@ -187,6 +219,9 @@ class DaemonInterfaceAdapter:
                                 EventType.TORRENT_COMPLETED,
                                 EventType.TORRENT_STATUS_CHANGED,
                             ])
+                            await self._client.subscribe_status(
+                                interval=self.status_interval,
+                            )
                             self.logger.info("WebSocket reconnected successfully")
                             consecutive_failures = 0
                             reconnect_delay = 1.0
@@ -201,8 +236,44 @@ class DaemonInterfaceAdapter:
                             self._websocket_connected = False
                             break
 
-    async def _handle_websocket_event(self, event: WebSocketEvent) -> None:
+    @property
+    def status_streaming(self) -> bool:
+        """Whether the cache is kept current by the daemon's status stream."""
+        return self._status_synced and self._client.websocket_connected
+
+    async def _apply_status_delta(self, delta: StatusDelta) -> None:
+        """Apply a status stream update to the cache."""
+        async with self._cache_lock:
+            if delta.full:
+                self._cached_torrents.clear()
+                self.torrents.clear()
+            for info_hash_hex in delta.removed:
+                self._cached_torrents.pop(info_hash_hex, None)
+                with contextlib.suppress(ValueError):
+                    self.torrents.pop(bytes.fromhex(info_hash_hex), None)
+            for info_hash_hex, changes in delta.torrents.items():
+                cached = self._cached_torrents.get(info_hash_hex)
+                if cached is None:
+                    try:
+                        info_hash = bytes.fromhex(info_hash_hex)
+                    except ValueError:
+                        continue
+                    cached = self._cached_torrents[info_hash_hex] = {
+                        "info_hash": info_hash_hex,
+                    }
+                    self.torrents[info_hash] = cached
+                for field, value in changes.items():
+                    cached[_STATUS_FIELD_KEYS.get(field, field)] = value
+            self._cached_status.update(delta.global_stats)
+            self._status_synced = True
+
+    async def _handle_websocket_event(
+        self, event: WebSocketEvent | StatusDelta
+    ) -> None:
         """Handle WebSocket event and update cache."""
+        if isinstance(event, StatusDelta):
+            await self._apply_status_delta(event)
+            return
         try:
             if event.type == EventType.TORRENT_ADDED:
                 info_hash_hex = event.data.get("info_hash", "")
@@ -213,7 +284,8 @@ class DaemonInterfaceAdapter:
                         await self.on_torrent_added(info_hash, name)
                     except ValueError:
                         pass
-                await self._refresh_cache()
+                if not self.status_streaming:
+                    await self._refresh_cache()
             
             elif event.type == EventType.TORRENT_REMOVED:
                 info_hash_hex = event.data.get("info_hash", "")
@@ -223,7 +295,8 @@ class DaemonInterfaceAdapter:
                         await self.on_torrent_removed(info_hash)
                     except ValueError:
                         pass
-                await self._refresh_cache()
+                if not self.status_streaming:
+                    await self._refresh_cache()
             
             elif event.type == EventType.TORRENT_COMPLETED:
                 info_hash_hex = event.data.get("info_hash", "")
@@ -234,7 +307,8 @@ class DaemonInterfaceAdapter:
                         await self.on_torrent_complete(info_hash, name)
                     except ValueError:
                         pass
-                await self._refresh_cache()
+                if not self.status_streaming:
+                    await self._refresh_cache()
             
             elif event.type == EventType.TORRENT_STATUS_CHANGED:
                 # Update cached status for this torrent
@@ -257,36 +331,32 @@ class DaemonInterfaceAdapter:
     async def _refresh_cache(self) -> None:
         """Refresh cached status from daemon."""
         try:
-            # Get all torrents
-            torrent_list = await self._client.list_torrents()
-            
+            # Get all torrents, only the fields the interface renders
+            query = ListQuery(fields=_CACHED_TORRENT_FIELDS, limit=MAX_PAGE_LIMIT)
+            rows: list[dict[str, Any]] = []
+            while True:
+                page = await self._client.query_torrents(query)
+                rows.extend(page.torrents)
+                if page.next_cursor is None:
+                    break
+                query.cursor = page.next_cursor
+
             async with self._cache_lock:
                 self._cached_torrents.clear()
                 self.torrents.clear()
-                
-                for torrent_status in torrent_list:
-                    info_hash_hex = torrent_status.info_hash
+
+                for row in rows:
+                    info_hash_hex = row["info_hash"]
                     try:
                         info_hash = bytes.fromhex(info_hash_hex)
-                        self.torrents[info_hash] = torrent_status  # Store status object
-                        
-                        # Convert to dict format for compatibility
-                        self._cached_torrents[info_hash_hex] = {
-                            "info_hash": info_hash_hex,
-                            "name": torrent_status.name,
-                            "status": torrent_status.status,
-                            "progress": torrent_status.progress,
-                            "download_rate": torrent_status.download_rate,
-                            "upload_rate": torrent_status.upload_rate,
-                            "peers": torrent_status.num_peers,
-                            "seeds": torrent_status.num_seeds,
-                            "total_size": torrent_status.total_size,
-                            "downloaded": torrent_status.downloaded,
-                            "uploaded": torrent_status.uploaded,
-                        }
                     except ValueError:
                         continue
-                
+                    cached = self._cached_torrents[info_hash_hex] = {
+                        _STATUS_FIELD_KEYS.get(field, field): value
+                        for field, value in row.items()
+                    }
+                    self.torrents[info_hash] = cached
+
                 # Update global stats
                 status = await self._client.get_status()
                 self._cached_status = {
@@ -305,7 +375,8 @@ class DaemonInterfaceAdapter:
 
     async def get_status(self) -> dict[str, Any]:
         """Get status of all torrents."""
-        await self._refresh_cache()
+        if not self.status_streaming:
+            await self._refresh_cache()
         async with self._cache_lock:
             return dict(self._cached_torrents)
 
@@ -406,7 +477,8 @@ class DaemonInterfaceAdapter:
 
     async def get_global_stats(self) -> dict[str, Any]:
         """Aggregate global statistics across all torrents."""
-        await self._refresh_cache()
+        if not self.status_streaming:
+            await self._refresh_cache()
         async with self._cache_lock:
             stats = dict(self._cached_status)
             
@@ -442,11 +514,31 @@ class DaemonInterfaceAdapter:
             
             return stats
 
-    async def get_peers_for_torrent(self, info_hash_hex: str) -> list[dict[str, Any]]:
-        """Return list of peers for a torrent."""
-        # IPC doesn't provide detailed peer info, return empty list
-        # This could be extended if IPC adds peer details endpoint
-        return []
+    async def get_peers_for_torrent(
+        self, info_hash_hex: str, fields: Iterable[str] | None = None
+    ) -> list[dict[str, Any]]:
+        """Return list of peers for a torrent.
+
+        Args:
+            info_hash_hex: Torrent info hash (hex string)
+            fields: Peer fields to fetch (plus ``ip`` and ``port``), or None
+                for all of them
+        """
+        query = ListQuery(
+            fields=frozenset(fields) if fields is not None else None,
+            limit=MAX_PAGE_LIMIT,
+        )
+        peers: list[dict[str, Any]] = []
+        try:
+            while True:
+                page = await self._client.query_peers(info_hash_hex, query)
+                peers.extend(page.peers)
+                if page.next_cursor is None:
+                    return peers
+                query.cursor = page.next_cursor
+        except Exception as e:
+            self.logger.debug("Error getting peers for %s: %s", info_hash_hex, e)
+            return peers
 
     async def force_announce(self, info_hash_hex: str) -> bool:
         """Force a tracker announce for a given torrent if possible."""
@@ -1142,7 +1142,8 @@ class GlobalConfigDetailScreen(GlobalConfigScreen):  # type: ignore[misc]
                     # Use timeout to prevent hanging
                     task = asyncio.create_task(
                         asyncio.wait_for(
-                            self.session.get_peers_for_torrent(ih), timeout=1.0
+                            self.session.get_peers_for_torrent(ih, fields=()),
+                            timeout=1.0,
                         )
                     )
                     peer_count_tasks.append(task)
@@ -1443,7 +1444,8 @@ class GlobalConfigDetailScreen(GlobalConfigScreen):  # type: ignore[misc]
                 try:
                     task = asyncio.create_task(
                         asyncio.wait_for(
-                            self.session.get_peers_for_torrent(ih), timeout=1.0
+                            self.session.get_peers_for_torrent(ih, fields=()),
+                            timeout=1.0,
                         )
                     )
                     peer_count_tasks.append(task)
@@ -857,7 +857,9 @@ class TorrentConfigDetailScreen(PerTorrentConfigScreen):  # type: ignore[misc]
 
             # Get connection count
             try:
-                peers = await self.session.get_peers_for_torrent(self.info_hash_hex)
+                peers = await self.session.get_peers_for_torrent(
+                    self.info_hash_hex, fields=()
+                )
                 connection_count = len(peers) if peers else 0
                 table.add_row("", "")
                 table.add_row("[bold]Connections[/bold]", "")
@@ -142,7 +142,15 @@ class NetworkQualityScreen(MonitoringScreen):  # type: ignore[misc]
             # Peer connection quality (for first torrent if available)
             if all_status:
                 first_ih = next(iter(all_status.keys()))
-                peers = await self.session.get_peers_for_torrent(first_ih)
+                peers = await self.session.get_peers_for_torrent(
+                    first_ih,
+                    fields=(
+                        "choked",
+                        "request_latency",
+                        "pieces_downloaded",
+                        "pieces_uploaded",
+                    ),
+                )
                 if peers:
                     # Calculate aggregate peer metrics
                     total_peers = len(peers)
@@ -735,7 +735,9 @@ class TerminalDashboard(App):  # type: ignore[misc]
 
             # Connection count
             try:
-                peers = await self.session.get_peers_for_torrent(info_hash_hex)
+                peers = await self.session.get_peers_for_torrent(
+                    info_hash_hex, fields=()
+                )
                 metrics["connection_count"] = len(peers) if peers else 0
             except Exception:
                 metrics["connection_count"] = torrent_status.get("peer_count", 0)
@@ -780,7 +782,10 @@ class TerminalDashboard(App):  # type: ignore[misc]
         # Background polling task - requires widget tree and full app context
         try:
             # Check daemon connection status if using DaemonInterfaceAdapter
-            if self._is_daemon_session:
+            # (not needed while the daemon streams status to the adapter)
+            if self._is_daemon_session and not getattr(
+                self.session, "status_streaming", False
+            ):
                 try:
                     # Verify daemon is still accessible
                     if hasattr(self.session, "_client"):
@@ -624,6 +624,48 @@ class NetworkConfig(BaseModel):
         le=60.0,
         description="Handshake timeout in seconds",
     )
+    incoming_accept_rate: float = Field(
+        default=100.0,
+        ge=1.0,
+        le=10000.0,
+        description="Maximum incoming connections accepted per second",
+    )
+    incoming_accept_burst: int = Field(
+        default=200,
+        ge=1,
+        le=100000,
+        description="Incoming connections accepted in a burst above the rate",
+    )
+    incoming_accept_rate_per_ip: float = Field(
+        default=1.0,
+        ge=0.01,
+        le=1000.0,
+        description="Maximum incoming connections accepted per second from one IP",
+    )
+    incoming_accept_burst_per_ip: int = Field(
+        default=5,
+        ge=1,
+        le=1000,
+        description="Incoming connections accepted in a burst from one IP",
+    )
+    max_half_open_incoming: int = Field(
+        default=256,
+        ge=1,
+        le=65536,
+        description="Maximum incoming connections waiting for a handshake",
+    )
+    max_half_open_incoming_per_ip: int = Field(
+        default=4,
+        ge=1,
+        le=1024,
+        description="Maximum incoming connections from one IP waiting for a handshake",
+    )
+    incoming_pending_session_timeout: float = Field(
+        default=30.0,
+        ge=1.0,
+        le=300.0,
+        description="Seconds an incoming handshake waits for a torrent that is still being added",
+    )
     keep_alive_interval: float = Field(
         default=120.0,
         ge=30.0,
@@ -1511,10 +1553,46 @@ class ObservabilityConfig(BaseModel):
         description="Metrics collection interval in seconds",
     )
     trace_file: str | None = Field(default=None, description="Path to write traces")
+    trace_sampling_rate: float = Field(
+        default=0.01,
+        ge=0.0,
+        le=1.0,
+        description="Fraction of traces to record (decided at the root span)",
+    )
+    trace_export_format: str = Field(
+        default="json",
+        description="Trace file format (json|otlp)",
+    )
     alerts_rules_path: str | None = Field(
         default=".ccbt/alerts.json",
         description="Path to alert rules JSON file",
     )
+    loop_monitor_enabled: bool = Field(
+        default=True,
+        description="Monitor event loop lag, slow callbacks and task counts",
+    )
+    loop_lag_interval: float = Field(
+        default=0.1,
+        ge=0.01,
+        le=10.0,
+        description="Seconds between event loop lag samples",
+    )
+    slow_callback_threshold: float = Field(
+        default=0.1,
+        ge=0.01,
+        le=60.0,
+        description="Seconds a callback may block the event loop before it is recorded",
+    )
+    stack_sample_interval: float = Field(
+        default=0.005,
+        ge=0.001,
+        le=1.0,
+        description="Seconds between stack samples while the profiler runs",
+    )
+    profile_dir: str = Field(
+        default=".ccbt/profiles",
+        description="Directory for collapsed stack profiles",
+    )
 
 
 class UIConfig(BaseModel):
@@ -2012,6 +2090,16 @@ class FileCheckpoint(BaseModel):
         None,
         description="File SHA-1 hash (BEP 47, 20 bytes if provided)",
     )
+    # Resume verification: files whose size and mtime still match are not rehashed
+    disk_size: int | None = Field(
+        None,
+        ge=0,
+        description="Size of the file on disk when the checkpoint was saved",
+    )
+    mtime_ns: int | None = Field(
+        None,
+        description="Modification time (ns) of the file when the checkpoint was saved",
+    )
 
 
 class TorrentCheckpoint(BaseModel):
@@ -2178,6 +2266,14 @@ class DaemonConfig(BaseModel):
         description="IPC server host (127.0.0.1 for local-only access, 0.0.0.0 for all interfaces)",
     )
     ipc_port: int = Field(64124, ge=1, le=65535, description="IPC server port")
+    ipc_socket_enabled: bool = Field(
+        True,
+        description="Also serve IPC on a Unix domain socket (local clients prefer it)",
+    )
+    ipc_socket_path: str | None = Field(
+        None,
+        description="Unix domain socket path (default: <state_dir>/ipc.sock)",
+    )
     websocket_enabled: bool = Field(True, description="Enable WebSocket support")
     websocket_heartbeat_interval: float = Field(
         30.0,
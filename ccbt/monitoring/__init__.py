@@ -15,18 +15,22 @@ from __future__ import annotations
 from ccbt.monitoring.alert_manager import AlertManager
 from ccbt.monitoring.dashboard import DashboardManager
 from ccbt.monitoring.metrics_collector import MetricsCollector
-from ccbt.monitoring.tracing import TracingManager
+from ccbt.monitoring.tracing import SpanExporter, TracingManager
 
 __all__ = [
     "AlertManager",
     "DashboardManager",
     "MetricsCollector",
+    "SpanExporter",
     "TracingManager",
     "get_alert_manager",
     "get_metrics_collector",
+    "get_tracing_manager",
     "init_metrics",
+    "init_tracing",
     "reset_metrics_collector",
     "shutdown_metrics",
+    "shutdown_tracing",
 ]
 
 # Global alert manager singleton for CLI/UI integration
@@ -35,6 +39,9 @@ _GLOBAL_ALERT_MANAGER: AlertManager | None = None
 # Global metrics collector singleton for CLI/UI integration
 _GLOBAL_METRICS_COLLECTOR: MetricsCollector | None = None
 
+# Global tracing manager singleton, shared by instrumented hot paths
+_GLOBAL_TRACING_MANAGER: TracingManager | None = None
+
 
 def get_alert_manager() -> AlertManager:
     """Return a process-global AlertManager to share rules/alerts across components."""
@@ -61,6 +68,79 @@ def get_metrics_collector() -> MetricsCollector:
     return _GLOBAL_METRICS_COLLECTOR
 
 
+def get_tracing_manager() -> TracingManager:
+    """Return the process-global TracingManager.
+
+    Until :func:`init_tracing` configures it, the manager samples no
+    traces, so instrumented hot paths record nothing.
+    """
+    global _GLOBAL_TRACING_MANAGER
+    if _GLOBAL_TRACING_MANAGER is None:
+        _GLOBAL_TRACING_MANAGER = TracingManager()
+        _GLOBAL_TRACING_MANAGER.set_sampling_rate(0.0)
+    return _GLOBAL_TRACING_MANAGER
+
+
+async def init_tracing() -> TracingManager | None:
+    """Configure tracing and start exporting spans if a trace file is set.
+
+    Sets the sampling rate from ``observability.trace_sampling_rate`` and,
+    when ``observability.trace_file`` is set, starts writing finished
+    spans to it in ``observability.trace_export_format``. Errors are
+    logged, not raised.
+
+    Returns:
+        TracingManager | None: The tracing manager if spans are exported,
+            None if no trace file is configured or initialization failed.
+
+    """
+    from ccbt.utils.logging_config import get_logger
+
+    logger = get_logger(__name__)
+
+    try:
+        from ccbt.config.config import get_config
+
+        observability = get_config().observability
+        tracing_manager = get_tracing_manager()
+        tracing_manager.set_sampling_rate(observability.trace_sampling_rate)
+        if not observability.trace_file:
+            logger.debug("No trace file configured, not exporting spans")
+            return None
+
+        exporter = SpanExporter(
+            observability.trace_file, observability.trace_export_format
+        )
+        await tracing_manager.start_exporter(exporter)
+        logger.info(
+            "Exporting traces to %s (%s, sampling %.2f%%)",
+            exporter.path,
+            exporter.format_type,
+            tracing_manager.sampling_rate * 100,
+        )
+        return tracing_manager
+    except Exception as e:  # pragma: no cover - Defensive: config or exporter errors
+        logger.warning("Failed to initialize tracing: %s", e, exc_info=True)
+        return None
+
+
+async def shutdown_tracing() -> None:
+    """Stop exporting spans, writing out the ones still queued.
+
+    Safe to call when tracing was never initialized.
+    """
+    from ccbt.utils.logging_config import get_logger
+
+    logger = get_logger(__name__)
+
+    if _GLOBAL_TRACING_MANAGER is None:
+        return
+    try:
+        await _GLOBAL_TRACING_MANAGER.stop_exporter()
+    except Exception as e:  # pragma: no cover - Defensive: shutdown exception handler
+        logger.warning("Failed to shutdown tracing: %s", e, exc_info=True)
+
+
 async def init_metrics() -> MetricsCollector | None:
     """Initialize and start metrics collection if enabled in configuration.
 
@@ -0,0 +1,166 @@
+"""Compiled alert rule conditions.
+
+Conditions are small Python expressions over ``value``, such as
+``value > 90`` or ``value * 8 / 1024 < 50``. A condition is parsed once
+and compiled into nested closures that take the metric value as an
+argument, so evaluating a rule costs a few function calls instead of a
+parse. Only constants, ``value``, arithmetic, unary signs and comparisons
+are allowed; anything else fails to compile.
+"""
+
+from __future__ import annotations
+
+import ast
+import contextlib
+import functools
+import operator
+from typing import TYPE_CHECKING, Any, Callable
+
+from ccbt.utils.logging_config import get_logger
+
+if TYPE_CHECKING:  # pragma: no cover - type checking only, not executed at runtime
+    from collections.abc import Iterable
+
+logger = get_logger(__name__)
+
+Condition = Callable[[Any], Any]
+
+_BINARY_OPERATORS: dict[type[ast.AST], Callable[[Any, Any], Any]] = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+    ast.Mod: operator.mod,
+    ast.Pow: operator.pow,
+}
+
+_UNARY_OPERATORS: dict[type[ast.AST], Callable[[Any], Any]] = {
+    ast.USub: operator.neg,
+    ast.UAdd: operator.pos,
+}
+
+_COMPARISONS: dict[type[ast.AST], Callable[[Any, Any], bool]] = {
+    ast.Lt: operator.lt,
+    ast.LtE: operator.le,
+    ast.Gt: operator.gt,
+    ast.GtE: operator.ge,
+    ast.Eq: operator.eq,
+    ast.NotEq: operator.ne,
+}
+
+
+def _never(_value: Any) -> bool:
+    return False
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+def _compile_node(node: ast.AST) -> Condition:
+    if isinstance(node, ast.Expression):
+        return _compile_node(node.body)
+    if isinstance(node, ast.Constant):
+        constant = node.value
+        return lambda _value: constant
+    if isinstance(node, ast.Name):
+        if node.id != "value":
+            msg = f"Variable '{node.id}' not allowed"
+            raise ValueError(msg)
+        return _identity
+    if isinstance(node, ast.BinOp):
+        binary = _BINARY_OPERATORS.get(type(node.op))
+        if binary is None:
+            msg = f"Operation {type(node.op).__name__} not allowed"
+            raise ValueError(msg)
+        left = _compile_node(node.left)
+        right = _compile_node(node.right)
+        return lambda value: binary(left(value), right(value))
+    if isinstance(node, ast.UnaryOp):
+        unary = _UNARY_OPERATORS.get(type(node.op))
+        if unary is None:
+            msg = f"Operation {type(node.op).__name__} not allowed"
+            raise ValueError(msg)
+        operand = _compile_node(node.operand)
+        return lambda value: unary(operand(value))
+    if isinstance(node, ast.Compare):
+        first = _compile_node(node.left)
+        steps = []
+        for op, comparator in zip(node.ops, node.comparators):
+            compare = _COMPARISONS.get(type(op))
+            if compare is None:
+                msg = f"Operation {type(op).__name__} not allowed"
+                raise ValueError(msg)
+            steps.append((compare, _compile_node(comparator)))
+        if len(steps) == 1:
+            compare, second = steps[0]
+            return lambda value: compare(first(value), second(value))
+
+        def chain(value: Any) -> bool:
+            left = first(value)
+            for compare, operand in steps:
+                right = operand(value)
+                if not compare(left, right):
+                    return False
+                left = right
+            return True
+
+        return chain
+    msg = f"Node type {type(node).__name__} not allowed"
+    raise ValueError(msg)
+
+
+def compile_condition(condition: str) -> Condition:
+    """Compile a condition into a function of the metric value.
+
+    Raises:
+        SyntaxError: If the condition is not a Python expression
+        ValueError: If the condition uses anything but the allowed operations
+
+    """
+    return _compile_node(ast.parse(condition.strip(), mode="eval"))
+
+
+@functools.lru_cache(maxsize=1024)
+def get_condition(condition: str) -> Condition:
+    """Return the compiled condition, compiling each distinct string once.
+
+    Conditions that do not compile are logged once and never match.
+    """
+    try:
+        return compile_condition(condition)
+    except (SyntaxError, ValueError) as e:
+        logger.debug("Invalid alert condition %r: %s", condition, e)
+        return _never
+
+
+def evaluate_condition(condition: Condition | str, value: Any) -> bool:
+    """Evaluate a condition for a metric value.
+
+    Numeric strings are compared as numbers. Errors raised while evaluating
+    (such as comparing a string with a number) count as not matching.
+    """
+    if isinstance(condition, str):
+        condition = get_condition(condition)
+    if isinstance(value, str):
+        with contextlib.suppress(ValueError):
+            value = float(value)
+    try:
+        return bool(condition(value))
+    except Exception:
+        return False
+
+
+def index_rules(rules: Iterable[Any]) -> dict[str, list[tuple[Any, Condition]]]:
+    """Group rules by metric name, with their compiled conditions.
+
+    Args:
+        rules: Rules with ``metric_name`` and ``condition`` attributes
+
+    """
+    index: dict[str, list[tuple[Any, Condition]]] = {}
+    for rule in rules:
+        index.setdefault(rule.metric_name, []).append(
+            (rule, get_condition(rule.condition))
+        )
+    return index
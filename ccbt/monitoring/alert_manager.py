@@ -23,6 +23,11 @@ from email.mime.text import MIMEText
 from enum import Enum
 from typing import TYPE_CHECKING, Any, Callable
 
+from ccbt.monitoring.alert_conditions import (
+    evaluate_condition,
+    get_condition,
+    index_rules,
+)
 from ccbt.utils.events import Event, EventType, emit_event
 from ccbt.utils.logging_config import get_logger
 
@@ -103,6 +108,8 @@ class AlertManager:
     def __init__(self):
         """Initialize alert manager."""
         self.alert_rules: dict[str, AlertRule] = {}
+        # Rules with compiled conditions by metric name, rebuilt on change
+        self._rules_by_metric: dict[str, list[tuple[AlertRule, Any]]] | None = None
         self.active_alerts: dict[str, Alert] = {}
         self.alert_history: deque = deque(maxlen=10000)
         self.notification_configs: dict[NotificationChannel, NotificationConfig] = {}
@@ -171,8 +178,10 @@ class AlertManager:
                 notification_channels=channels,
                 suppression_rules=list(data.get("suppression_rules", [])),
             )
+            get_condition(rule.condition)
             self.alert_rules[rule.name] = rule
             loaded += 1
+        self._rules_by_metric = None
         return loaded
 
     def save_rules_to_file(self, path: Path) -> None:
@@ -203,12 +212,15 @@ class AlertManager:
 
     def add_alert_rule(self, rule: AlertRule) -> None:
         """Add an alert rule."""
+        get_condition(rule.condition)
         self.alert_rules[rule.name] = rule
+        self._rules_by_metric = None
 
     def remove_alert_rule(self, rule_name: str) -> None:
         """Remove an alert rule."""
         if rule_name in self.alert_rules:
             del self.alert_rules[rule_name]
+            self._rules_by_metric = None
 
     def update_alert_rule(self, rule_name: str, updates: dict[str, Any]) -> None:
         """Update an alert rule."""
@@ -217,6 +229,7 @@ class AlertManager:
             for key, value in updates.items():
                 if hasattr(rule, key):
                     setattr(rule, key, value)
+            self._rules_by_metric = None
 
     def add_suppression_rule(self, name: str, rule: dict[str, Any]) -> None:
         """Add a suppression rule."""
@@ -249,13 +262,22 @@ class AlertManager:
         value: Any,
         timestamp: float | None = None,
     ) -> None:
-        """Process an alert for a metric."""
+        """Process an alert for a metric.
+
+        Only the rules of ``metric_name`` are evaluated, with their
+        conditions compiled when the rules were added.
+        """
+        if self._rules_by_metric is None:
+            self._rules_by_metric = index_rules(self.alert_rules.values())
+        rules = self._rules_by_metric.get(metric_name)
+        if not rules:
+            return
+
         if timestamp is None:
             timestamp = time.time()
 
-        # Check all alert rules for this metric
-        for rule in self.alert_rules.values():
-            if rule.metric_name != metric_name or not rule.enabled:
+        for rule, condition in rules:
+            if not rule.enabled:
                 continue
 
             # Check cooldown
@@ -263,7 +285,7 @@ class AlertManager:
                 continue
 
             # Evaluate condition
-            if self._evaluate_condition(rule.condition, value):
+            if evaluate_condition(condition, value):
                 await self._trigger_alert(rule, value, timestamp)
 
     async def resolve_alert(
@@ -489,96 +511,7 @@ class AlertManager:
 
     def _evaluate_condition(self, condition: str, value: Any) -> bool:
         """Evaluate alert condition safely."""
-        try:
-            # Replace 'value' with actual value
-            condition_expr = condition.replace("value", str(value))
-
-            # Safe evaluation using ast and operator modules
-            import ast
-            import operator
-
-            # Define safe operations
-            safe_operators = {
-                ast.Lt: operator.lt,
-                ast.LtE: operator.le,
-                ast.Gt: operator.gt,
-                ast.GtE: operator.ge,
-                ast.Eq: operator.eq,
-                ast.NotEq: operator.ne,
-                ast.Add: operator.add,
-                ast.Sub: operator.sub,
-                ast.Mult: operator.mul,
-                ast.Div: operator.truediv,
-                ast.Mod: operator.mod,
-                ast.Pow: operator.pow,
-            }
-
-            # Define safe unary operations
-            safe_unary_operators = {
-                ast.USub: operator.neg,
-                ast.UAdd: operator.pos,
-            }
-
-            # Parse and evaluate safely
-            tree = ast.parse(condition_expr, mode="eval")
-
-            def safe_eval(node):
-                if isinstance(node, ast.Expression):
-                    return safe_eval(node.body)
-                if isinstance(node, ast.Constant):
-                    return node.value
-                if isinstance(node, ast.Name):
-                    # Only allow specific variables
-                    if (
-                        node.id in ["value"]
-                    ):  # pragma: no cover - Valid variable path already tested via condition evaluation
-                        return value
-                    msg = f"Variable '{node.id}' not allowed"
-                    raise ValueError(msg)
-                if isinstance(node, ast.BinOp):
-                    left = safe_eval(node.left)
-                    right = safe_eval(node.right)
-                    op = safe_operators.get(type(node.op))
-                    if op is None:
-                        msg = f"Operation {type(node.op).__name__} not allowed"
-                        raise ValueError(
-                            msg,
-                        )
-                    return op(left, right)
-                if isinstance(node, ast.UnaryOp):
-                    operand = safe_eval(node.operand)
-                    op = safe_unary_operators.get(type(node.op))
-                    if (
-                        op is None
-                    ):  # pragma: no cover - Defensive check for unsupported unary operations (only USub and UAdd are supported)
-                        msg = f"Operation {type(node.op).__name__} not allowed"
-                        raise ValueError(  # pragma: no cover - Error path for unsupported unary operations
-                            msg,
-                        )
-                    return op(operand)
-                if isinstance(node, ast.Compare):
-                    left = safe_eval(node.left)
-                    for op, comparator in zip(node.ops, node.comparators):
-                        right = safe_eval(comparator)
-                        op_func = safe_operators.get(type(op))
-                        if (
-                            op_func is None
-                        ):  # pragma: no cover - Defensive check for unsupported comparison operations (only standard comparisons are supported)
-                            msg = f"Operation {type(op).__name__} not allowed"
-                            raise ValueError(  # pragma: no cover - Error path for unsupported comparison operations
-                                msg,
-                            )
-                        if not op_func(left, right):
-                            return False
-                    return True
-                msg = f"Node type {type(node).__name__} not allowed"  # pragma: no cover - Error message construction for unsupported AST node types
-                raise ValueError(
-                    msg
-                )  # pragma: no cover - Defensive check for unsupported AST node types (only Expression, Constant, Name, BinOp, UnaryOp, Compare are supported)
-
-            return safe_eval(tree)
-        except Exception:
-            return False
+        return evaluate_condition(condition, value)
 
     async def _send_notifications(self, alert: Alert) -> None:
         """Send notifications for an alert."""
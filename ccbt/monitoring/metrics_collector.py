@@ -23,8 +23,19 @@ from typing import Any, Callable, TypedDict
 
 import psutil
 
+from ccbt.monitoring.alert_conditions import (
+    evaluate_condition,
+    get_condition,
+    index_rules,
+)
+from ccbt.monitoring.metrics_registry import (
+    MetricsRegistry,
+    format_labels,
+    format_value,
+)
 from ccbt.utils.events import Event, EventType, emit_event
 from ccbt.utils.logging_config import get_logger
+from ccbt.utils.tasks import scheduler_registry
 
 # Optional Prometheus HTTP server support
 try:
@@ -87,6 +98,10 @@ class Metric:
     description: str
     labels: list[MetricLabel] = field(default_factory=list)
     values: deque = field(default_factory=lambda: deque(maxlen=1000))
+    # Latest value per label set, exported to Prometheus
+    current: dict[tuple[tuple[str, str], ...], int | float | str] = field(
+        default_factory=dict
+    )
     aggregation: AggregationType = AggregationType.SUM
     retention_seconds: int = 3600  # 1 hour
 
@@ -123,6 +138,8 @@ class MetricsCollector:
         """Initialize metrics collector."""
         self.metrics: dict[str, Metric] = {}
         self.alert_rules: dict[str, AlertRule] = {}
+        # Rules with compiled conditions by metric name, rebuilt on change
+        self._rules_by_metric: dict[str, list[tuple[AlertRule, Any]]] | None = None
         self.collectors: dict[str, Callable] = {}
 
         # System metrics
@@ -188,6 +205,15 @@ class MetricsCollector:
         self.collection_task: asyncio.Task | None = None
         self.running = False
 
+        # Pre-registered series for hot paths (see metrics_registry)
+        self.registry = MetricsRegistry()
+
+        # Alert rules are evaluated against the latest samples once per
+        # interval instead of on every recorded value
+        self.alert_interval = 1.0  # seconds
+        self.alert_task: asyncio.Task | None = None
+        self._alert_samples: dict[str, float | str] = {}
+
         # HTTP server for Prometheus endpoint (if enabled)
         self._http_server: Any | None = None
         self._http_server_thread: Any | None = None
@@ -208,6 +234,7 @@ class MetricsCollector:
         self.collection_task = asyncio.create_task(
             self._collection_loop()
         )  # pragma: no cover
+        self.alert_task = asyncio.create_task(self._alert_loop())
 
         # Start Prometheus HTTP server if enabled and available
         await self._start_prometheus_server()
@@ -235,6 +262,12 @@ class MetricsCollector:
             with contextlib.suppress(asyncio.CancelledError):  # pragma: no cover
                 await self.collection_task
 
+        if self.alert_task:
+            self.alert_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self.alert_task
+            self.alert_task = None
+
         # Stop Prometheus HTTP server if running
         await self._stop_prometheus_server()
 
@@ -273,7 +306,12 @@ class MetricsCollector:
         value: float | str,
         labels: list[MetricLabel] | None = None,
     ) -> None:
-        """Record a metric value."""
+        """Record a metric value.
+
+        Alert rules see the value at the next alert sampling interval (see
+        :meth:`evaluate_alerts`). Hot paths should record through
+        pre-registered :attr:`registry` series instead.
+        """
         if name not in self.metrics:
             # Auto-register metric if it doesn't exist
             self.register_metric(
@@ -283,47 +321,12 @@ class MetricsCollector:
             )
 
         metric = self.metrics[name]
-        metric_value = MetricValue(
-            value=value,
-            timestamp=time.time(),
-            labels=labels or [],
+        labels = labels or []
+        metric.values.append(
+            MetricValue(value=value, timestamp=time.time(), labels=labels)
         )
-
-        metric.values.append(metric_value)
-
-        # Check alert rules
-        self._check_alert_rules(name, value)
-
-        # Also forward to global AlertManager (if available) so shared rules can trigger
-        try:
-            # Lazy import to avoid circular imports during module load
-            from ccbt.monitoring import (
-                get_alert_manager,
-            )
-
-            am = get_alert_manager()
-            # Only attempt numeric evaluation for shared rules
-            v_any: float | str = value
-            if isinstance(value, str):
-                # simple numeric parse; ignore parse errors
-                with contextlib.suppress(Exception):  # pragma: no cover
-                    if value.replace(".", "", 1).isdigit():  # pragma: no cover
-                        v_any = float(value)  # pragma: no cover
-            # Schedule async processing if running in an event loop
-            import asyncio as _asyncio
-
-            with contextlib.suppress(RuntimeError):  # pragma: no cover
-                loop = _asyncio.get_event_loop()  # pragma: no cover
-                if loop.is_running():  # pragma: no cover
-                    task = loop.create_task(am.process_alert(name, v_any))  # type: ignore[arg-type] # pragma: no cover
-                    task.add_done_callback(
-                        lambda _t: None
-                    )  # Discard task reference  # pragma: no cover
-        except Exception:  # pragma: no cover
-            # If alert manager not available, skip silently
-            logger.debug(  # pragma: no cover
-                "Alert manager not available for metric processing", exc_info=True
-            )
+        metric.current[tuple((label.name, label.value) for label in labels)] = value
+        self._alert_samples[name] = value
 
         # Update statistics
         self.stats["metrics_collected"] += 1
@@ -383,6 +386,8 @@ class MetricsCollector:
         cooldown_seconds: int = 300,
     ) -> None:
         """Add an alert rule."""
+        get_condition(condition)
+        self._rules_by_metric = None
         self.alert_rules[name] = AlertRule(
             name=name,
             metric_name=metric_name,
@@ -530,6 +535,55 @@ class MetricsCollector:
                     ),
                 )
 
+    async def _alert_loop(self) -> None:
+        """Evaluate alert rules once per alert interval."""
+        while self.running:
+            try:
+                await self.evaluate_alerts()
+            except Exception:  # pragma: no cover - Defensive: keep sampling
+                self.stats["collection_errors"] += 1
+                logger.debug("Alert evaluation failed", exc_info=True)
+            await asyncio.sleep(self.alert_interval)
+
+    async def evaluate_alerts(self) -> None:
+        """Evaluate alert rules against the latest sample of each metric.
+
+        Covers the metrics recorded since the last evaluation and every
+        registry family (counters and gauges as the sum of their series,
+        histograms as their observation count). Samples are also passed to
+        the global AlertManager so shared rules can trigger.
+        """
+        samples, self._alert_samples = self._alert_samples, {}
+        for family in self.registry.families():
+            samples[family.name] = family.total()
+        if not samples:
+            return
+
+        for name, value in samples.items():
+            self._check_alert_rules(name, value)
+
+        try:
+            # Lazy import to avoid circular imports during module load
+            from ccbt.monitoring import get_alert_manager
+
+            am = get_alert_manager()
+        except Exception:  # pragma: no cover
+            # If alert manager not available, skip silently
+            logger.debug(  # pragma: no cover
+                "Alert manager not available for metric processing", exc_info=True
+            )
+            return
+        timestamp = time.time()
+        for name, value in samples.items():
+            # Only attempt numeric evaluation for shared rules
+            v_any: float | str = value
+            if isinstance(value, str):
+                # simple numeric parse; ignore parse errors
+                with contextlib.suppress(Exception):
+                    if value.replace(".", "", 1).isdigit():
+                        v_any = float(value)
+            await am.process_alert(name, v_any, timestamp)
+
     async def _collect_system_metrics(self) -> None:
         """Collect system metrics."""
         try:  # pragma: no cover
@@ -907,8 +961,11 @@ class MetricsCollector:
 
     def _check_alert_rules(self, metric_name: str, value: float | str) -> None:
         """Check alert rules for a metric."""
-        for rule_name, rule in self.alert_rules.items():
-            if rule.metric_name != metric_name or not rule.enabled:
+        if self._rules_by_metric is None:
+            self._rules_by_metric = index_rules(self.alert_rules.values())
+        for rule, condition in self._rules_by_metric.get(metric_name, ()):
+            rule_name = rule.name
+            if not rule.enabled:
                 continue
 
             # Check cooldown
@@ -918,8 +975,7 @@ class MetricsCollector:
 
             # Evaluate condition
             try:
-                # Simple condition evaluation (in production, use a proper expression evaluator)
-                if self._evaluate_condition(rule.condition, value):
+                if evaluate_condition(condition, value):
                     rule.last_triggered = current_time
                     self.stats["alerts_triggered"] += 1
 
@@ -961,111 +1017,40 @@ class MetricsCollector:
 
     def _evaluate_condition(self, condition: str, value: float | str) -> bool:
         """Evaluate alert condition safely."""
-        try:
-            # Replace 'value' with actual value
-            condition_expr = condition.replace("value", str(value))
-
-            # Safe evaluation using ast and operator modules
-            import ast
-            import operator
-
-            # Define safe operations
-            safe_operators = {
-                ast.Lt: operator.lt,
-                ast.LtE: operator.le,
-                ast.Gt: operator.gt,
-                ast.GtE: operator.ge,
-                ast.Eq: operator.eq,
-                ast.NotEq: operator.ne,
-                ast.Add: operator.add,
-                ast.Sub: operator.sub,
-                ast.Mult: operator.mul,
-                ast.Div: operator.truediv,
-                ast.Mod: operator.mod,
-                ast.Pow: operator.pow,
-            }
-
-            # Define safe unary operations
-            safe_unary_operators = {
-                ast.USub: operator.neg,
-                ast.UAdd: operator.pos,
-            }
-
-            # Parse and evaluate safely
-            tree = ast.parse(condition_expr, mode="eval")
-
-            def safe_eval(node):
-                if isinstance(node, ast.Expression):
-                    return safe_eval(node.body)
-                if isinstance(node, ast.Constant):
-                    return node.value
-                if isinstance(node, ast.Name):
-                    # Only allow specific variables
-                    if node.id in ["value"]:  # pragma: no cover
-                        return value  # pragma: no cover
-                    msg = f"Variable '{node.id}' not allowed"
-                    raise ValueError(msg)  # pragma: no cover
-                if isinstance(node, ast.BinOp):
-                    left = safe_eval(node.left)
-                    right = safe_eval(node.right)
-                    op = safe_operators.get(type(node.op))
-                    if op is None:  # pragma: no cover
-                        msg = f"Operation {type(node.op).__name__} not allowed"
-                        raise ValueError(  # pragma: no cover
-                            msg,  # pragma: no cover
-                        )  # pragma: no cover
-                    return op(left, right)
-                if isinstance(node, ast.UnaryOp):
-                    operand = safe_eval(node.operand)
-                    op = safe_unary_operators.get(type(node.op))
-                    if op is None:  # pragma: no cover
-                        msg = f"Operation {type(node.op).__name__} not allowed"
-                        raise ValueError(  # pragma: no cover
-                            msg,  # pragma: no cover
-                        )  # pragma: no cover
-                    return op(operand)
-                if isinstance(node, ast.Compare):
-                    left = safe_eval(node.left)
-                    for op, comparator in zip(node.ops, node.comparators):
-                        right = safe_eval(comparator)
-                        op_func = safe_operators.get(type(op))
-                        if op_func is None:  # pragma: no cover
-                            msg = f"Operation {type(op).__name__} not allowed"
-                            raise ValueError(  # pragma: no cover
-                                msg,  # pragma: no cover
-                            )  # pragma: no cover
-                        if not op_func(left, right):
-                            return False
-                    return True
-                msg = f"Node type {type(node).__name__} not allowed"
-                raise ValueError(msg)
-
-            return safe_eval(tree)
-        except Exception:
-            return False
+        return evaluate_condition(condition, value)
 
     def _export_prometheus_format(self) -> str:
-        """Export metrics in Prometheus format."""
+        """Export the current metric values in Prometheus text format.
+
+        Each label set is written once with its latest value and no
+        timestamp; non-numeric values cannot be exposed and are left out.
+        """
         lines = []
 
         for name, metric in self.metrics.items():
-            # Add help comment
+            if name in self.registry:
+                continue
+            metric_type = metric.metric_type.value
+            if metric.metric_type not in (MetricType.COUNTER, MetricType.GAUGE):
+                # Only the latest observation is kept, not buckets or quantiles
+                metric_type = "untyped"
             lines.append(f"# HELP {name} {metric.description}")
-            lines.append(f"# TYPE {name} {metric.metric_type.value}")
-
-            # Add metric values
-            for value in metric.values:
-                labels_str = ""
-                if value.labels:
-                    label_pairs = [
-                        f'{label.name}="{label.value}"' for label in value.labels
-                    ]
-                    labels_str = "{" + ",".join(label_pairs) + "}"
+            lines.append(f"# TYPE {name} {metric_type}")
 
+            for label_set, value in list(metric.current.items()):
+                if isinstance(value, str):
+                    continue
+                names = [label_name for label_name, _ in label_set]
+                values = [label_value for _, label_value in label_set]
                 lines.append(
-                    f"{name}{labels_str} {value.value} {int(value.timestamp * 1000)}",
+                    f"{name}{format_labels(names, values)} {format_value(value)}"
                 )
 
+        for registry in (self.registry, scheduler_registry):
+            registry_text = registry.render()
+            if registry_text:
+                lines.append(registry_text)
+
         return "\n".join(lines)
 
     def register_custom_collector(self, name: str, collector: Callable) -> None:
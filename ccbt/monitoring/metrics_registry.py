@@ -0,0 +1,411 @@
+"""Low-overhead metric series for hot paths.
+
+Series are registered once, up front, as counter, gauge or histogram
+families. A label set is bound once with :meth:`MetricFamily.labels` to a
+child handle that is kept by the caller, so recording a sample is a
+single locked add with no allocation, no clock read and no history::
+
+    registry = MetricsRegistry()
+    blocks = registry.counter("ccbt_blocks_received", "Blocks received", ["kind"])
+    data_blocks = blocks.labels("data")  # Once, at setup
+
+    data_blocks.inc()  # Per block
+
+Histograms use fixed bucket bounds chosen at registration. Only current
+values are kept; :meth:`MetricsRegistry.render` writes them in the
+Prometheus text exposition format.
+"""
+
+from __future__ import annotations
+
+import bisect
+import math
+import threading
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Generic, TypeVar
+
+if TYPE_CHECKING:  # pragma: no cover - type checking only, not executed at runtime
+    from collections.abc import Iterable, Iterator, Sequence
+
+# Latency buckets in seconds, from 100us to 10s
+DEFAULT_BUCKETS = (
+    0.0001,
+    0.0005,
+    0.001,
+    0.005,
+    0.01,
+    0.05,
+    0.1,
+    0.5,
+    1.0,
+    5.0,
+    10.0,
+)
+
+
+def format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    """Format a label set as ``{name="value",...}`` (empty without labels)."""
+    if not names:
+        return ""
+    pairs = ",".join(
+        f'{name}="{_escape_label(value)}"' for name, value in zip(names, values)
+    )
+    return "{" + pairs + "}"
+
+
+def format_value(value: float) -> str:
+    """Format a sample value as Prometheus expects."""
+    if math.isnan(value):
+        return "NaN"
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+class CounterChild:
+    """Counter series for one label set."""
+
+    __slots__ = ("_lock", "_value")
+
+    def __init__(self) -> None:
+        """Initialize counter at zero."""
+        self._lock = threading.Lock()
+        self._value: float = 0
+
+    def inc(self, amount: float = 1) -> None:
+        """Add a non-negative amount."""
+        if amount < 0:
+            msg = "Counters can only increase"
+            raise ValueError(msg)
+        with self._lock:
+            self._value += amount
+
+    @property
+    def value(self) -> float:
+        """Current count."""
+        return self._value
+
+
+class GaugeChild:
+    """Gauge series for one label set."""
+
+    __slots__ = ("_lock", "_value")
+
+    def __init__(self) -> None:
+        """Initialize gauge at zero."""
+        self._lock = threading.Lock()
+        self._value: float = 0
+
+    def set(self, value: float) -> None:
+        """Set the gauge."""
+        self._value = value
+
+    def inc(self, amount: float = 1) -> None:
+        """Add to the gauge."""
+        with self._lock:
+            self._value += amount
+
+    def dec(self, amount: float = 1) -> None:
+        """Subtract from the gauge."""
+        with self._lock:
+            self._value -= amount
+
+    @property
+    def value(self) -> float:
+        """Current value."""
+        return self._value
+
+
+class HistogramChild:
+    """Histogram series for one label set, with fixed buckets."""
+
+    __slots__ = ("_bounds", "_counts", "_lock", "_sum")
+
+    def __init__(self, bounds: tuple[float, ...]) -> None:
+        """Initialize empty histogram.
+
+        Args:
+            bounds: Sorted upper bounds of the finite buckets
+
+        """
+        self._bounds = bounds
+        self._lock = threading.Lock()
+        # One count per bucket (not cumulative) plus the +Inf bucket
+        self._counts = [0] * (len(bounds) + 1)
+        self._sum: float = 0.0
+
+    def observe(self, value: float) -> None:
+        """Record an observation."""
+        index = bisect.bisect_left(self._bounds, value)
+        with self._lock:
+            self._counts[index] += 1
+            self._sum += value
+
+    @property
+    def count(self) -> int:
+        """Number of observations."""
+        return sum(self._counts)
+
+    @property
+    def sum(self) -> float:
+        """Sum of the observations."""
+        return self._sum
+
+    def buckets(self) -> list[tuple[float, int]]:
+        """Return cumulative ``(upper bound, count)`` pairs, ending with +Inf."""
+        with self._lock:
+            counts = list(self._counts)
+        result = []
+        total = 0
+        for bound, count in zip((*self._bounds, math.inf), counts):
+            total += count
+            result.append((bound, total))
+        return result
+
+
+Child = TypeVar("Child", CounterChild, GaugeChild, HistogramChild)
+
+
+class MetricFamily(ABC, Generic[Child]):
+    """A named metric and its series, one per bound label set.
+
+    Families without label names record through their own methods
+    (``inc``, ``set``, ``observe``), which go to the single unlabeled series.
+
+    Attributes:
+        name: Metric name
+        description: Help text
+        label_names: Names of the labels every series is bound with
+
+    """
+
+    metric_type = "untyped"
+
+    def __init__(self, name: str, description: str, label_names: Sequence[str] = ()):
+        """Initialize metric family."""
+        self.name = name
+        self.description = description
+        self.label_names = tuple(label_names)
+        self._children: dict[tuple[str, ...], Child] = {}
+        self._lock = threading.Lock()
+        self._unlabeled: Child | None = None if self.label_names else self.labels()
+
+    def labels(self, *values: str, **labels: str) -> Child:
+        """Return the series for a label set, creating it on first use.
+
+        Bind label sets once and keep the returned handle; looking a series
+        up is far more expensive than recording to it.
+
+        Raises:
+            ValueError: If the labels do not match the family's label names
+
+        """
+        if labels:
+            if values:
+                msg = "Pass label values either by position or by name"
+                raise ValueError(msg)
+            try:
+                values = tuple(labels.pop(name) for name in self.label_names)
+            except KeyError as e:
+                msg = f"Missing label {e} for {self.name}"
+                raise ValueError(msg) from None
+            if labels:
+                msg = f"Unknown labels {sorted(labels)} for {self.name}"
+                raise ValueError(msg)
+        if len(values) != len(self.label_names):
+            msg = f"{self.name} expects labels {list(self.label_names)}"
+            raise ValueError(msg)
+        key = tuple(str(v) for v in values)
+        child = self._children.get(key)
+        if child is None:
+            with self._lock:
+                child = self._children.get(key)
+                if child is None:
+                    child = self._children[key] = self._new_child()
+        return child
+
+    def series(self) -> Iterator[tuple[tuple[str, ...], Child]]:
+        """Iterate over ``(label values, series)`` pairs."""
+        yield from list(self._children.items())
+
+    def total(self) -> float:
+        """Return the sum of the current values of all series (for alert sampling)."""
+        return sum(getattr(child, "value", 0) for _, child in self.series())
+
+    def render(self) -> Iterator[str]:
+        """Yield the exposition lines of the family."""
+        yield f"# HELP {self.name} {self.description}"
+        yield f"# TYPE {self.name} {self.metric_type}"
+        for values, child in self.series():
+            yield from self._render_child(values, child)
+
+    def _render_child(self, values: tuple[str, ...], child: Child) -> Iterator[str]:
+        labels = format_labels(self.label_names, values)
+        yield f"{self.name}{labels} {format_value(child.value)}"  # type: ignore[union-attr]
+
+    @abstractmethod
+    def _new_child(self) -> Child:
+        """Create the series for a new label set."""
+
+    def _default(self) -> Child:
+        if self._unlabeled is None:
+            msg = f"{self.name} has labels {list(self.label_names)}; use labels()"
+            raise ValueError(msg)
+        return self._unlabeled
+
+
+class Counter(MetricFamily[CounterChild]):
+    """Monotonic counter family."""
+
+    metric_type = "counter"
+
+    def inc(self, amount: float = 1) -> None:
+        """Increment the unlabeled series."""
+        self._default().inc(amount)
+
+    def _new_child(self) -> CounterChild:
+        return CounterChild()
+
+
+class Gauge(MetricFamily[GaugeChild]):
+    """Gauge family."""
+
+    metric_type = "gauge"
+
+    def set(self, value: float) -> None:
+        """Set the unlabeled series."""
+        self._default().set(value)
+
+    def inc(self, amount: float = 1) -> None:
+        """Add to the unlabeled series."""
+        self._default().inc(amount)
+
+    def dec(self, amount: float = 1) -> None:
+        """Subtract from the unlabeled series."""
+        self._default().dec(amount)
+
+    def _new_child(self) -> GaugeChild:
+        return GaugeChild()
+
+
+class Histogram(MetricFamily[HistogramChild]):
+    """Histogram family with fixed buckets.
+
+    Attributes:
+        buckets: Sorted upper bounds of the finite buckets
+
+    """
+
+    metric_type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        description: str,
+        label_names: Sequence[str] = (),
+        buckets: Iterable[float] = DEFAULT_BUCKETS,
+    ):
+        """Initialize histogram family.
+
+        Raises:
+            ValueError: If no finite bucket bound is given
+
+        """
+        self.buckets = tuple(sorted(b for b in buckets if not math.isinf(b)))
+        if not self.buckets:
+            msg = f"Histogram {name} needs at least one bucket"
+            raise ValueError(msg)
+        super().__init__(name, description, label_names)
+
+    def observe(self, value: float) -> None:
+        """Record an observation in the unlabeled series."""
+        self._default().observe(value)
+
+    def total(self) -> float:
+        """Return the number of observations in all series."""
+        return sum(child.count for _, child in self.series())
+
+    def _render_child(
+        self, values: tuple[str, ...], child: HistogramChild
+    ) -> Iterator[str]:
+        names = (*self.label_names, "le")
+        buckets = child.buckets()
+        for bound, count in buckets:
+            labels = format_labels(names, (*values, format_value(bound)))
+            yield f"{self.name}_bucket{labels} {count}"
+        labels = format_labels(self.label_names, values)
+        yield f"{self.name}_sum{labels} {format_value(child.sum)}"
+        yield f"{self.name}_count{labels} {buckets[-1][1]}"
+
+    def _new_child(self) -> HistogramChild:
+        return HistogramChild(self.buckets)
+
+
+class MetricsRegistry:
+    """Registry of pre-registered metric families.
+
+    Registering a name again returns the existing family if it has the same
+    type and label names.
+    """
+
+    def __init__(self) -> None:
+        """Initialize empty registry."""
+        self._families: dict[str, MetricFamily] = {}
+        self._lock = threading.Lock()
+
+    def counter(
+        self, name: str, description: str, label_names: Sequence[str] = ()
+    ) -> Counter:
+        """Register a counter family."""
+        return self._register(Counter, name, description, label_names)
+
+    def gauge(
+        self, name: str, description: str, label_names: Sequence[str] = ()
+    ) -> Gauge:
+        """Register a gauge family."""
+        return self._register(Gauge, name, description, label_names)
+
+    def histogram(
+        self,
+        name: str,
+        description: str,
+        label_names: Sequence[str] = (),
+        buckets: Iterable[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        """Register a histogram family with fixed bucket bounds."""
+        return self._register(Histogram, name, description, label_names, buckets)
+
+    def get(self, name: str) -> MetricFamily | None:
+        """Return a registered family."""
+        return self._families.get(name)
+
+    def families(self) -> list[MetricFamily]:
+        """Return all registered families."""
+        return list(self._families.values())
+
+    def __contains__(self, name: object) -> bool:
+        """Check if a family is registered under a name."""
+        return name in self._families
+
+    def render(self) -> str:
+        """Render the current value of every series in Prometheus text format."""
+        return "\n".join(line for family in self.families() for line in family.render())
+
+    def _register(self, cls, name, description, label_names, *args):
+        with self._lock:
+            family = self._families.get(name)
+            if family is None:
+                family = self._families[name] = cls(
+                    name, description, label_names, *args
+                )
+            elif type(family) is not cls or family.label_names != tuple(label_names):
+                msg = (
+                    f"Metric {name} is already registered as a "
+                    f"{family.metric_type} with labels {list(family.label_names)}"
+                )
+                raise ValueError(msg)
+            return family
@@ -8,24 +8,32 @@ Provides comprehensive tracing including:
 - Span management
 - Trace correlation
 - OpenTelemetry integration
+
+Whether a trace is recorded is decided once, when its root span starts;
+spans of an unsampled trace are not created at all. Span IDs are 64-bit
+integers and trace IDs 128-bit hex strings, as in OpenTelemetry. Finished
+spans are buffered in a bounded ring that a background exporter drains
+in batches to a JSON Lines or OTLP/JSON file, so tracing can stay on
+around hot paths.
 """
 
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import contextvars
 import json
+import random
 import threading
 import time
-import uuid
 from collections import deque
 from dataclasses import dataclass, field
 from enum import Enum
+from pathlib import Path
 from typing import Any
 
 from typing_extensions import Self
 
-from ccbt.utils.events import Event, EventType, emit_event
 from ccbt.utils.logging_config import get_logger
 
 logger = get_logger(__name__)
@@ -55,8 +63,8 @@ class Span:
     """Tracing span."""
 
     trace_id: str
-    span_id: str
-    parent_span_id: str | None
+    span_id: int
+    parent_span_id: int | None
     name: str
     kind: SpanKind
     start_time: float
@@ -81,23 +89,183 @@ class Trace:
     root_span: Span | None = None
 
 
+def new_trace_id() -> str:
+    """Return a random 128-bit trace ID as 32 hex digits."""
+    return f"{random.getrandbits(128) or 1:032x}"  # nosec B311 - not security-sensitive
+
+
+def new_span_id() -> int:
+    """Return a random non-zero 64-bit span ID."""
+    return random.getrandbits(64) or 1  # nosec B311 - not security-sensitive
+
+
+def format_span_id(span_id: int | str | None) -> str | None:
+    """Format a span ID as 16 hex digits."""
+    if span_id is None or isinstance(span_id, str):
+        return span_id
+    return f"{span_id:016x}"
+
+
+# OTLP span kinds and status codes
+_OTLP_KINDS = {
+    SpanKind.INTERNAL: 1,
+    SpanKind.SERVER: 2,
+    SpanKind.CLIENT: 3,
+    SpanKind.PRODUCER: 4,
+    SpanKind.CONSUMER: 5,
+}
+_OTLP_STATUS_OK = 1
+_OTLP_STATUS_ERROR = 2
+
+
+def _otlp_value(value: Any) -> dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def _otlp_attributes(attributes: dict[str, Any]) -> list[dict[str, Any]]:
+    return [{"key": k, "value": _otlp_value(v)} for k, v in attributes.items()]
+
+
+def _nanos(timestamp: float | None) -> str:
+    return str(int((timestamp or 0.0) * 1_000_000_000))
+
+
+class SpanExporter:
+    """Appends batches of finished spans to a file.
+
+    Formats:
+        json: One JSON object per span per line
+        otlp: One OTLP/JSON ``ExportTraceServiceRequest`` per batch per line,
+            as written by the OpenTelemetry file exporter
+
+    """
+
+    FORMATS = ("json", "otlp")
+
+    def __init__(
+        self,
+        path: str | Path,
+        format_type: str = "json",
+        service_name: str = "ccbt",
+    ):
+        """Initialize span exporter.
+
+        Raises:
+            ValueError: If the format is not supported
+
+        """
+        if format_type not in self.FORMATS:
+            msg = f"Unsupported format: {format_type}"
+            raise ValueError(msg)
+        self.path = Path(path)
+        self.format_type = format_type
+        self.service_name = service_name
+
+    def export(self, spans: list[Span]) -> None:
+        """Write a batch of spans (blocking; run it in an executor)."""
+        if not spans:
+            return
+        if self.format_type == "otlp":
+            lines = [json.dumps(self._otlp_request(spans), default=str)]
+        else:
+            lines = [json.dumps(self._json_span(span), default=str) for span in spans]
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write("\n".join(lines) + "\n")
+
+    @staticmethod
+    def _json_span(span: Span) -> dict[str, Any]:
+        return {
+            "trace_id": span.trace_id,
+            "span_id": format_span_id(span.span_id),
+            "parent_span_id": format_span_id(span.parent_span_id),
+            "name": span.name,
+            "kind": span.kind.value,
+            "start_time": span.start_time,
+            "end_time": span.end_time,
+            "duration": span.duration,
+            "status": span.status.value,
+            "attributes": span.attributes,
+            "events": span.events,
+        }
+
+    def _otlp_request(self, spans: list[Span]) -> dict[str, Any]:
+        otlp_spans = []
+        for span in spans:
+            otlp_span: dict[str, Any] = {
+                "traceId": span.trace_id,
+                "spanId": format_span_id(span.span_id),
+                "name": span.name,
+                "kind": _OTLP_KINDS[span.kind],
+                "startTimeUnixNano": _nanos(span.start_time),
+                "endTimeUnixNano": _nanos(span.end_time),
+                "attributes": _otlp_attributes(span.attributes),
+                "events": [
+                    {
+                        "timeUnixNano": _nanos(event.get("timestamp")),
+                        "name": event.get("name", ""),
+                        "attributes": _otlp_attributes(event.get("attributes", {})),
+                    }
+                    for event in span.events
+                ],
+                "status": (
+                    {"code": _OTLP_STATUS_OK}
+                    if span.status == SpanStatus.OK
+                    else {"code": _OTLP_STATUS_ERROR, "message": span.status.value}
+                ),
+            }
+            if span.parent_span_id is not None:
+                otlp_span["parentSpanId"] = format_span_id(span.parent_span_id)
+            otlp_spans.append(otlp_span)
+        return {
+            "resourceSpans": [
+                {
+                    "resource": {
+                        "attributes": _otlp_attributes(
+                            {"service.name": self.service_name}
+                        )
+                    },
+                    "scopeSpans": [
+                        {
+                            "scope": {"name": "ccbt.monitoring.tracing"},
+                            "spans": otlp_spans,
+                        }
+                    ],
+                }
+            ]
+        }
+
+
 class TracingManager:
     """Distributed tracing manager."""
 
     def __init__(self):
         """Initialize tracing manager."""
-        self.active_spans: dict[str, Span] = {}
+        self.active_spans: dict[int, Span] = {}
         self.completed_spans: deque = deque(maxlen=10000)
         self.traces: dict[str, Trace] = {}
-        self.trace_context: contextvars.ContextVar[dict[str, str] | None] = (
+        self.trace_context: contextvars.ContextVar[dict[str, Any] | None] = (
             contextvars.ContextVar("trace_context", default=None)
         )
 
         # Configuration
         self.sampling_rate = 1.0  # 100% sampling
         self.max_spans_per_trace = 1000
+        self.max_traces = 1000  # Oldest traces are dropped beyond this
         self.span_retention_seconds = 3600  # 1 hour
 
+        # Finished spans waiting for the exporter (oldest dropped when full)
+        self.export_buffer: deque[Span] = deque(maxlen=65536)
+        self.export_batch_size = 512
+        self.exporter: SpanExporter | None = None
+        self._export_task: asyncio.Task | None = None
+
         # Statistics
         self.stats = {
             "spans_created": 0,
@@ -106,6 +274,9 @@ class TracingManager:
             "traces_completed": 0,
             "sampling_decisions": 0,
             "sampled_spans": 0,
+            "spans_exported": 0,
+            "spans_dropped": 0,
+            "export_errors": 0,
         }
 
         # Thread-local storage for context
@@ -115,17 +286,33 @@ class TracingManager:
         self,
         name: str,
         kind: SpanKind = SpanKind.INTERNAL,
-        parent_span_id: str | None = None,
+        parent_span_id: int | None = None,
         attributes: dict[str, Any] | None = None,
-    ) -> str:
-        """Start a new span."""
-        # Generate trace ID if not in context
-        trace_id = self._get_or_create_trace_id()
-
-        # Generate span ID
-        span_id = str(uuid.uuid4())
-
-        # Create span
+    ) -> int | None:
+        """Start a new span.
+
+        A span with no parent and no trace in the current context starts a
+        new trace, which is sampled at the sampling rate. Returns None (and
+        records nothing) if the trace is not sampled.
+        """
+        parent = (
+            self.active_spans.get(parent_span_id)
+            if parent_span_id is not None
+            else None
+        )
+        if parent is not None:
+            trace_id = parent.trace_id
+        else:
+            context = self.trace_context.get()
+            trace_id = context.get("trace_id") if context else None
+            if not trace_id:
+                if context and context.get("sampled") is False:
+                    return None
+                if not self._should_sample():
+                    return None
+                trace_id = new_trace_id()
+
+        span_id = new_span_id()
         span = Span(
             trace_id=trace_id,
             span_id=span_id,
@@ -145,36 +332,19 @@ class TracingManager:
         # Update statistics
         self.stats["spans_created"] += 1
 
-        # Emit span started event
-        task = asyncio.create_task(
-            emit_event(
-                Event(
-                    event_type=EventType.SPAN_STARTED.value,
-                    data={
-                        "trace_id": trace_id,
-                        "span_id": span_id,
-                        "name": name,
-                        "kind": kind.value,
-                        "timestamp": span.start_time,
-                    },
-                ),
-            ),
-        )
-        task.add_done_callback(lambda _t: None)  # Discard task reference
-
         return span_id
 
     def end_span(
         self,
-        span_id: str,
+        span_id: int | None,
         status: SpanStatus = SpanStatus.OK,
         attributes: dict[str, Any] | None = None,
     ) -> Span | None:
-        """End a span."""
-        if span_id not in self.active_spans:
+        """End a span and queue it for export."""
+        span = self.active_spans.pop(span_id, None)  # type: ignore[arg-type]
+        if span is None:
             return None
 
-        span = self.active_spans[span_id]
         span.end_time = time.time()
         span.duration = span.end_time - span.start_time
         span.status = status
@@ -183,9 +353,11 @@ class TracingManager:
         if attributes:
             span.attributes.update(attributes)
 
-        # Move to completed spans
         self.completed_spans.append(span)
-        del self.active_spans[span_id]
+        if self.exporter is not None:
+            if len(self.export_buffer) == self.export_buffer.maxlen:
+                self.stats["spans_dropped"] += 1
+            self.export_buffer.append(span)
 
         # Update trace
         self._update_trace(span)
@@ -193,37 +365,19 @@ class TracingManager:
         # Update statistics
         self.stats["spans_completed"] += 1
 
-        # Emit span ended event
-        task = asyncio.create_task(
-            emit_event(
-                Event(
-                    event_type=EventType.SPAN_ENDED.value,
-                    data={
-                        "trace_id": span.trace_id,
-                        "span_id": span_id,
-                        "name": span.name,
-                        "duration": span.duration,
-                        "status": status.value,
-                        "timestamp": span.end_time,
-                    },
-                ),
-            ),
-        )
-        task.add_done_callback(lambda _t: None)  # Discard task reference
-
         return span
 
     def add_span_event(
         self,
-        span_id: str,
+        span_id: int,
         name: str,
         attributes: dict[str, Any] | None = None,
     ) -> None:
         """Add an event to a span."""
-        if span_id not in self.active_spans:
+        span = self.active_spans.get(span_id)
+        if span is None:
             return
 
-        span = self.active_spans[span_id]
         event = {
             "name": name,
             "timestamp": time.time(),
@@ -231,20 +385,18 @@ class TracingManager:
         }
         span.events.append(event)
 
-    def add_span_attribute(self, span_id: str, key: str, value: Any) -> None:
+    def add_span_attribute(self, span_id: int, key: str, value: Any) -> None:
         """Add an attribute to a span."""
-        if span_id not in self.active_spans:
-            return
-
-        span = self.active_spans[span_id]
-        span.attributes[key] = value
+        span = self.active_spans.get(span_id)
+        if span is not None:
+            span.attributes[key] = value
 
     def get_active_span(self) -> Span | None:
         """Get the current active span."""
         span_id = self._get_current_span_id()
-        if span_id and span_id in self.active_spans:
-            return self.active_spans[span_id]
-        return None
+        if span_id is None:
+            return None
+        return self.active_spans.get(span_id)
 
     def get_trace(self, trace_id: str) -> Trace | None:
         """Get a complete trace."""
@@ -267,6 +419,10 @@ class TracingManager:
             "sampling_rate": self.sampling_rate,
             "sampling_decisions": self.stats["sampling_decisions"],
             "sampled_spans": self.stats["sampled_spans"],
+            "spans_exported": self.stats["spans_exported"],
+            "spans_dropped": self.stats["spans_dropped"],
+            "export_errors": self.stats["export_errors"],
+            "export_buffer": len(self.export_buffer),
         }
 
     def export_traces(self, format_type: str = "json") -> str:
@@ -321,6 +477,61 @@ class TracingManager:
         """Set sampling rate (0.0 to 1.0)."""
         self.sampling_rate = max(0.0, min(1.0, rate))
 
+    async def start_exporter(
+        self,
+        exporter: SpanExporter,
+        interval: float = 1.0,
+        batch_size: int = 512,
+    ) -> None:
+        """Export finished spans in the background.
+
+        Spans ended from now on are queued in :attr:`export_buffer` and
+        written every ``interval`` seconds, ``batch_size`` spans per write.
+        """
+        await self.stop_exporter()
+        self.exporter = exporter
+        self.export_batch_size = batch_size
+        self._export_task = asyncio.create_task(self._export_loop(interval))
+
+    async def stop_exporter(self) -> None:
+        """Stop the background exporter and write out the queued spans."""
+        task, self._export_task = self._export_task, None
+        if task is not None:
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+        await self.flush_spans()
+        self.exporter = None
+
+    async def flush_spans(self) -> int:
+        """Write the queued spans in batches and return how many were written."""
+        exporter = self.exporter
+        if exporter is None:
+            return 0
+        loop = asyncio.get_running_loop()
+        exported = 0
+        while self.export_buffer:
+            batch = [
+                self.export_buffer.popleft()
+                for _ in range(min(self.export_batch_size, len(self.export_buffer)))
+            ]
+            try:
+                await loop.run_in_executor(None, exporter.export, batch)
+            except Exception as e:
+                self.stats["export_errors"] += 1
+                self.stats["spans_dropped"] += len(batch)
+                logger.warning("Failed to export %d spans: %s", len(batch), e)
+                continue
+            exported += len(batch)
+            self.stats["spans_exported"] += len(batch)
+        return exported
+
+    async def _export_loop(self, interval: float) -> None:
+        """Periodically write out the queued spans."""
+        while True:
+            await asyncio.sleep(interval)
+            await self.flush_spans()
+
     def _get_or_create_trace_id(self) -> str:
         """Get or create trace ID."""
         context = self.trace_context.get()
@@ -331,33 +542,33 @@ class TracingManager:
         trace_id = context.get("trace_id")
 
         if not trace_id:
-            trace_id = str(uuid.uuid4())
+            trace_id = new_trace_id()
             self._update_trace_context(trace_id, None)
 
         return trace_id
 
-    def _get_current_span_id(self) -> str | None:
+    def _get_current_span_id(self) -> int | None:
         """Get current span ID from context."""
         context = self.trace_context.get()
         if context is None:
             return None
         return context.get("span_id")
 
-    def _update_trace_context(self, trace_id: str, span_id: str | None) -> None:
+    def _update_trace_context(self, trace_id: str, span_id: int | None) -> None:
         """Update trace context."""
-        context = {
-            "trace_id": trace_id,
-            "span_id": span_id,
-        }
-        # Filter out None values to ensure dict[str, str] type
-        filtered_context = {k: v for k, v in context.items() if v is not None}
-        self.trace_context.set(filtered_context)
+        context: dict[str, Any] = {"trace_id": trace_id}
+        if span_id is not None:
+            context["span_id"] = span_id
+        self.trace_context.set(context)
 
     def _update_trace(self, span: Span) -> None:
         """Update trace with completed span."""
         trace_id = span.trace_id
 
         if trace_id not in self.traces:
+            if len(self.traces) >= self.max_traces:
+                # Drop the oldest trace; finished spans still reach the exporter
+                del self.traces[next(iter(self.traces))]
             trace = Trace(trace_id=trace_id)
             self.traces[trace_id] = trace
             self.stats["traces_created"] += 1
@@ -380,26 +591,10 @@ class TracingManager:
         if trace.start_time is not None and trace.end_time is not None:
             trace.duration = trace.end_time - trace.start_time
 
-        # Check if trace is complete
-        if self._is_trace_complete(trace):
+        # A trace is complete when its root span ends
+        if span.parent_span_id is None and self._is_trace_complete(trace):
             self.stats["traces_completed"] += 1
 
-            # Emit trace completed event
-            task = asyncio.create_task(
-                emit_event(
-                    Event(
-                        event_type=EventType.TRACE_COMPLETED.value,
-                        data={
-                            "trace_id": trace_id,
-                            "duration": trace.duration,
-                            "span_count": len(trace.spans),
-                            "timestamp": trace.end_time,
-                        },
-                    ),
-                ),
-            )
-            task.add_done_callback(lambda _t: None)  # Discard task reference
-
     def _is_trace_complete(self, trace: Trace) -> bool:
         """Check if trace is complete."""
         # A trace is complete when all spans are completed
@@ -409,9 +604,7 @@ class TracingManager:
         )
 
     def _should_sample(self) -> bool:
-        """Determine if current trace should be sampled."""
-        import random
-
+        """Determine if a new trace should be sampled."""
         self.stats["sampling_decisions"] += 1
 
         if random.random() < self.sampling_rate:  # nosec B311 - Sampling rate is not security-sensitive
@@ -436,44 +629,58 @@ class TraceContext:
         self.name = name
         self.kind = kind
         self.attributes = attributes
-        self.span_id: str | None = None
+        self.span_id: int | None = None
+        self._token: contextvars.Token | None = None
 
     def __enter__(self) -> Self:
-        """Enter the span context manager."""
-        # Check if we should sample
-        if not self.tracing_manager._should_sample():  # noqa: SLF001
-            return self
+        """Enter the span context manager.
+
+        Inside an unsampled trace no span is started and ``span_id`` stays
+        None, so recording events and attributes costs nothing.
+        """
+        manager = self.tracing_manager
+        self._token = manager.trace_context.set(manager.trace_context.get())
 
         # Get parent span ID
-        parent_span_id = self.tracing_manager._get_current_span_id()  # noqa: SLF001
+        parent_span_id = manager._get_current_span_id()  # noqa: SLF001
 
-        # Start span
-        self.span_id = self.tracing_manager.start_span(
+        # Start span (sampled when it is the root of a new trace)
+        self.span_id = manager.start_span(
             self.name,
             self.kind,
             parent_span_id,
             self.attributes,
         )
+        if self.span_id is None:
+            # Not sampled: nested spans in this scope are not sampled either
+            manager.trace_context.set({"sampled": False})
 
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Exit the span context manager."""
-        if self.span_id:
+        if self.span_id is not None:
             # Determine status
             status = SpanStatus.ERROR if exc_type is not None else SpanStatus.OK
 
             # End span
             self.tracing_manager.end_span(self.span_id, status)
 
+        # Restore the enclosing span as current
+        token, self._token = self._token, None
+        if token is not None:
+            # Fails if exited from another context; the span has ended anyway
+            with contextlib.suppress(ValueError):
+                self.tracing_manager.trace_context.reset(token)
+
     def add_event(self, name: str, attributes: dict[str, Any] | None = None) -> None:
         """Add event to current span."""
-        if self.span_id:
+        if self.span_id is not None:
             self.tracing_manager.add_span_event(self.span_id, name, attributes)
 
     def add_attribute(self, key: str, value: Any) -> None:
         """Add attribute to current span."""
-        if self.span_id:
+        if self.span_id is not None:
             self.tracing_manager.add_span_attribute(self.span_id, key, value)
 
 
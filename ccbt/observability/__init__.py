@@ -5,13 +5,165 @@ from __future__ import annotations
 Provides comprehensive observability including:
 - Request tracing
 - Performance profiling
+- Event loop health monitoring
+- Statistical stack sampling
 - Debug mode
 - Memory profiling
 - Log aggregation
 """
 
+from __future__ import annotations
+
+import time
+from pathlib import Path
+from typing import Any
+
+from ccbt.observability.loop_monitor import LoopMonitor, SlowCallback, StackSampler
 from ccbt.observability.profiler import Profiler
 
 __all__ = [
+    "LoopMonitor",
     "Profiler",
+    "SlowCallback",
+    "StackSampler",
+    "get_loop_monitor",
+    "get_stack_sampler",
+    "init_loop_monitor",
+    "shutdown_loop_monitor",
+    "start_stack_sampler",
+    "stop_stack_sampler",
 ]
+
+# Process-global loop monitor, started by the daemon
+_GLOBAL_LOOP_MONITOR: LoopMonitor | None = None
+
+# Stack sampler of the current or last profiling run
+_GLOBAL_STACK_SAMPLER: StackSampler | None = None
+
+
+def get_loop_monitor() -> LoopMonitor | None:
+    """Return the running loop monitor, or None if it was not started."""
+    return _GLOBAL_LOOP_MONITOR
+
+
+def init_loop_monitor() -> LoopMonitor | None:
+    """Start monitoring the running event loop if enabled in configuration.
+
+    Uses ``observability.loop_lag_interval`` and
+    ``observability.slow_callback_threshold``, and registers the loop
+    metrics with the global metrics collector so they are exported with
+    the others. Errors are logged, not raised.
+
+    Returns:
+        LoopMonitor | None: The started monitor, or None if disabled or
+            initialization failed.
+
+    """
+    from ccbt.utils.logging_config import get_logger
+
+    global _GLOBAL_LOOP_MONITOR
+    logger = get_logger(__name__)
+
+    try:
+        from ccbt.config.config import get_config
+        from ccbt.monitoring import get_metrics_collector
+
+        observability = get_config().observability
+        if not observability.loop_monitor_enabled:
+            logger.debug("Event loop monitoring disabled in configuration")
+            return None
+
+        if _GLOBAL_LOOP_MONITOR is not None:
+            _GLOBAL_LOOP_MONITOR.stop()
+        _GLOBAL_LOOP_MONITOR = LoopMonitor(
+            interval=observability.loop_lag_interval,
+            slow_threshold=observability.slow_callback_threshold,
+            registry=get_metrics_collector().registry,
+        )
+        _GLOBAL_LOOP_MONITOR.start()
+        logger.info(
+            "Monitoring event loop (lag every %.3fs, slow callbacks over %.3fs)",
+            observability.loop_lag_interval,
+            observability.slow_callback_threshold,
+        )
+        return _GLOBAL_LOOP_MONITOR
+    except Exception as e:  # pragma: no cover - Defensive: config or loop errors
+        logger.warning("Failed to start event loop monitor: %s", e, exc_info=True)
+        _GLOBAL_LOOP_MONITOR = None
+        return None
+
+
+def shutdown_loop_monitor() -> None:
+    """Stop the loop monitor and any running stack sampler.
+
+    Safe to call when neither was started.
+    """
+    global _GLOBAL_LOOP_MONITOR
+    if _GLOBAL_LOOP_MONITOR is not None:
+        _GLOBAL_LOOP_MONITOR.stop()
+        _GLOBAL_LOOP_MONITOR = None
+    if _GLOBAL_STACK_SAMPLER is not None:
+        _GLOBAL_STACK_SAMPLER.stop()
+
+
+def get_stack_sampler() -> StackSampler | None:
+    """Return the sampler of the current or last profiling run."""
+    return _GLOBAL_STACK_SAMPLER
+
+
+def start_stack_sampler(interval: float | None = None) -> StackSampler:
+    """Start a new stack sampling run.
+
+    Args:
+        interval: Seconds between samples (``observability.stack_sample_interval``
+            if None)
+
+    Returns:
+        The started sampler
+
+    Raises:
+        RuntimeError: If a sampling run is already in progress
+        ValueError: If the interval is not positive
+
+    """
+    from ccbt.config.config import get_config
+
+    global _GLOBAL_STACK_SAMPLER
+    if _GLOBAL_STACK_SAMPLER is not None and _GLOBAL_STACK_SAMPLER.running:
+        msg = "Stack sampler is already running"
+        raise RuntimeError(msg)
+    if interval is None:
+        interval = get_config().observability.stack_sample_interval
+    sampler = StackSampler(interval)
+    sampler.start()
+    _GLOBAL_STACK_SAMPLER = sampler
+    return sampler
+
+
+def stop_stack_sampler(path: str | Path | None = None) -> dict[str, Any]:
+    """Stop the sampling run and write its collapsed stacks.
+
+    Args:
+        path: File to write (a timestamped file in
+            ``observability.profile_dir`` if None)
+
+    Returns:
+        The sampler status with the ``path`` written
+
+    Raises:
+        RuntimeError: If no sampling run is in progress
+
+    """
+    from ccbt.config.config import get_config
+
+    sampler = _GLOBAL_STACK_SAMPLER
+    if sampler is None or not sampler.running:
+        msg = "Stack sampler is not running"
+        raise RuntimeError(msg)
+    sampler.stop()
+    if path is None:
+        stamp = time.strftime("%Y%m%d-%H%M%S", time.localtime(sampler.started))
+        path = Path(get_config().observability.profile_dir) / f"stacks-{stamp}.txt"
+    status = sampler.status()
+    status["path"] = str(sampler.write(path))
+    return status
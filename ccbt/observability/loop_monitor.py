@@ -0,0 +1,369 @@
+"""Event loop health monitoring and statistical stack sampling.
+
+:class:`LoopMonitor` is cheap enough to leave running in the daemon. A
+timer callback measures how late the event loop runs it (the loop lag),
+and a watchdog thread notices when that callback has not run for longer
+than the slow-callback threshold. It then records the running task and
+the loop thread's stack while the loop is still blocked. Asyncio task
+counts are grouped by task name on demand.
+
+:class:`StackSampler` is opt-in. A thread samples the stacks of all
+threads with ``sys._current_frames()`` at a fixed interval and counts
+them as collapsed stacks (``frame;frame;frame count``), the input format
+of ``flamegraph.pl`` and speedscope.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import sys
+import threading
+import time
+from collections import Counter as CountMap
+from collections import deque
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from ccbt.monitoring.metrics_registry import MetricsRegistry
+
+if TYPE_CHECKING:  # pragma: no cover - type checking only, not executed at runtime
+    from types import CodeType, FrameType
+
+logger = logging.getLogger(__name__)
+
+# Loop lag is usually well under a millisecond, stalls run to seconds
+LAG_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Innermost frames kept for each slow callback
+SLOW_STACK_DEPTH = 30
+
+
+@dataclass
+class SlowCallback:
+    """A stretch of time the event loop spent in one callback or task step."""
+
+    started: float  # Wall clock time the stall began
+    duration: float  # Seconds blocked (final once the loop catches up)
+    task: str | None  # Name of the running task, None for a plain callback
+    stack: list[str] = field(default_factory=list)  # Outermost frame first
+
+
+def task_label(task: asyncio.Task[Any]) -> str:
+    """Return a grouping name for a task.
+
+    Explicitly named tasks keep their name; tasks with a generated
+    ``Task-<n>`` name are labeled by their coroutine's qualified name.
+    """
+    name = task.get_name()
+    if name.startswith("Task-"):
+        coro = task.get_coro()
+        return getattr(coro, "__qualname__", type(coro).__name__)
+    return name
+
+
+def format_stack(frame: FrameType | None, limit: int = SLOW_STACK_DEPTH) -> list[str]:
+    """Format the innermost ``limit`` frames of a stack, outermost first."""
+    lines: list[str] = []
+    while frame is not None and len(lines) < limit:
+        code = frame.f_code
+        lines.append(f"{code.co_filename}:{frame.f_lineno} in {code.co_name}")
+        frame = frame.f_back
+    lines.reverse()
+    return lines
+
+
+class LoopMonitor:
+    """Always-on event loop lag, slow callback and task count monitor."""
+
+    def __init__(
+        self,
+        interval: float = 0.1,
+        slow_threshold: float = 0.1,
+        history: int = 100,
+        registry: MetricsRegistry | None = None,
+    ):
+        """Initialize loop monitor.
+
+        Args:
+            interval: Seconds between lag samples
+            slow_threshold: Seconds the loop must be blocked before the
+                running callback is recorded as slow
+            history: Number of slow callbacks kept
+            registry: Registry for the loop metrics (a private one if None)
+
+        """
+        if interval <= 0 or slow_threshold <= 0:
+            msg = "interval and slow_threshold must be positive"
+            raise ValueError(msg)
+        self.interval = interval
+        self.slow_threshold = slow_threshold
+        self.registry = registry if registry is not None else MetricsRegistry()
+        self.lag_seconds = self.registry.histogram(
+            "ccbt_event_loop_lag_seconds",
+            "Delay between when a loop timer was due and when it ran",
+            buckets=LAG_BUCKETS,
+        )
+        self.slow_callbacks_total = self.registry.counter(
+            "ccbt_event_loop_slow_callbacks_total",
+            "Callbacks or task steps that blocked the event loop",
+        )
+        self.tasks_gauge = self.registry.gauge(
+            "ccbt_asyncio_tasks", "Pending asyncio tasks by name", ["name"]
+        )
+        self._lag = self.lag_seconds.labels()
+
+        self.last_lag = 0.0
+        self.max_lag = 0.0
+        self._slow: deque[SlowCallback] = deque(maxlen=history)
+        self._lock = threading.Lock()
+        self._task_names: set[str] = set()
+
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._loop_thread: int | None = None
+        self._handle: asyncio.TimerHandle | None = None
+        self._expected = 0.0
+        self._last_beat = 0.0
+        self._reported = 0.0
+        self._stalled: SlowCallback | None = None
+        self._stopped = threading.Event()
+        self._watchdog: threading.Thread | None = None
+
+    @property
+    def running(self) -> bool:
+        """Whether the monitor is sampling."""
+        return self._handle is not None
+
+    def start(self) -> None:
+        """Start sampling the running event loop.
+
+        Raises:
+            RuntimeError: If no event loop is running
+
+        """
+        if self.running:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread = threading.get_ident()
+        self._stopped.clear()
+        self._last_beat = time.monotonic()
+        self._expected = self._loop.time() + self.interval
+        self._handle = self._loop.call_at(self._expected, self._beat)
+        self._watchdog = threading.Thread(
+            target=self._watch, name="ccbt-loop-watchdog", daemon=True
+        )
+        self._watchdog.start()
+
+    def stop(self) -> None:
+        """Stop sampling."""
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        self._stopped.set()
+        if self._watchdog is not None:
+            self._watchdog.join(timeout=1.0)
+            self._watchdog = None
+
+    def slow_callbacks(self) -> list[SlowCallback]:
+        """Return the recorded slow callbacks, oldest first."""
+        with self._lock:
+            return list(self._slow)
+
+    def task_counts(self) -> dict[str, int]:
+        """Count the event loop's pending tasks by name and update the gauge."""
+        loop = self._loop or asyncio.get_running_loop()
+        counts = CountMap(task_label(task) for task in asyncio.all_tasks(loop))
+        for name in self._task_names - counts.keys():
+            self.tasks_gauge.labels(name).set(0)
+        for name, count in counts.items():
+            self.tasks_gauge.labels(name).set(count)
+        self._task_names = set(counts)
+        return dict(counts.most_common())
+
+    def snapshot(self) -> dict[str, Any]:
+        """Summarize loop health.
+
+        Returns:
+            Dict with ``lag`` statistics in seconds (``last``, ``max``,
+            ``mean``, ``samples`` and cumulative histogram ``buckets``),
+            recent ``slow_callbacks``, pending ``tasks`` by name and
+            ``total_tasks``
+
+        """
+        lag = self._lag
+        tasks = self.task_counts()
+        return {
+            "lag": {
+                "last": self.last_lag,
+                "max": self.max_lag,
+                "mean": lag.sum / lag.count if lag.count else 0.0,
+                "samples": lag.count,
+                "buckets": lag.buckets(),
+            },
+            "slow_callbacks": [asdict(record) for record in self.slow_callbacks()],
+            "tasks": tasks,
+            "total_tasks": sum(tasks.values()),
+        }
+
+    def _beat(self) -> None:
+        """Record how late this timer ran and schedule the next one."""
+        loop = self._loop
+        if loop is None or self._handle is None:
+            return
+        now = loop.time()
+        lag = max(0.0, now - self._expected)
+        self.last_lag = lag
+        self.max_lag = max(self.max_lag, lag)
+        self._lag.observe(lag)
+        with self._lock:
+            self._last_beat = time.monotonic()
+            if self._stalled is not None:
+                # The loop caught up, so the stall's length is now known
+                self._stalled.duration = max(self._stalled.duration, lag)
+                self._stalled = None
+        self._expected = now + self.interval
+        self._handle = loop.call_at(self._expected, self._beat)
+
+    def _watch(self) -> None:
+        """Watchdog thread: capture the loop's stack while it is blocked."""
+        while not self._stopped.wait(self.slow_threshold / 2):
+            with self._lock:
+                last_beat = self._last_beat
+            stalled = time.monotonic() - last_beat - self.interval
+            if stalled < self.slow_threshold or last_beat == self._reported:
+                continue
+            self._reported = last_beat
+
+            task = None
+            if self._loop is not None:
+                current = asyncio.current_task(self._loop)
+                task = current.get_name() if current is not None else None
+            frame = sys._current_frames().get(self._loop_thread)  # noqa: SLF001
+            record = SlowCallback(
+                started=time.time() - stalled,
+                duration=stalled,
+                task=task,
+                stack=format_stack(frame),
+            )
+            with self._lock:
+                if self._last_beat != last_beat:
+                    continue  # The loop caught up while the stack was taken
+                self._slow.append(record)
+                self._stalled = record
+            self.slow_callbacks_total.inc()
+            logger.warning(
+                "Event loop blocked for %.3fs in %s at %s",
+                stalled,
+                task or "a callback",
+                record.stack[-1] if record.stack else "unknown",
+            )
+
+
+class StackSampler:
+    """Opt-in statistical profiler writing flamegraph collapsed stacks."""
+
+    def __init__(self, interval: float = 0.005):
+        """Initialize stack sampler.
+
+        Args:
+            interval: Seconds between samples
+
+        """
+        if interval <= 0:
+            msg = "interval must be positive"
+            raise ValueError(msg)
+        self.interval = interval
+        self.samples = 0
+        self.started: float | None = None
+        self._stacks: CountMap[str] = CountMap()
+        self._labels: dict[CodeType, str] = {}
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def running(self) -> bool:
+        """Whether the sampler thread is running."""
+        return self._thread is not None
+
+    def start(self) -> None:
+        """Start sampling in a background thread."""
+        if self.running:
+            return
+        self._stopped.clear()
+        self.started = time.time()
+        self._thread = threading.Thread(
+            target=self._run, name="ccbt-stack-sampler", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop sampling; the collected stacks are kept."""
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+
+    def status(self) -> dict[str, Any]:
+        """Return the sampler's state, sample and distinct stack counts."""
+        with self._lock:
+            stacks = len(self._stacks)
+        return {
+            "running": self.running,
+            "interval": self.interval,
+            "started": self.started,
+            "samples": self.samples,
+            "stacks": stacks,
+        }
+
+    def collapsed(self) -> str:
+        """Return the samples as collapsed stacks, most frequent first."""
+        with self._lock:
+            counts = self._stacks.most_common()
+        return "".join(f"{stack} {count}\n" for stack, count in counts)
+
+    def write(self, path: str | Path) -> Path:
+        """Write the collapsed stacks to a file.
+
+        Returns:
+            The path written
+
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(self.collapsed(), encoding="utf-8")
+        return path
+
+    def _label(self, code: CodeType) -> str:
+        """Return the collapsed-stack frame name for a code object."""
+        label = self._labels.get(code)
+        if label is None:
+            name = getattr(code, "co_qualname", code.co_name)
+            label = (
+                f"{name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+            )
+            self._labels[code] = label = label.replace(";", ":")
+        return label
+
+    def _run(self) -> None:
+        """Sampler thread: take one sample of every other thread per interval."""
+        own = threading.get_ident()
+        while not self._stopped.wait(self.interval):
+            names = {thread.ident: thread.name for thread in threading.enumerate()}
+            sample: list[str] = []
+            for ident, frame in sys._current_frames().items():  # noqa: SLF001
+                if ident == own:
+                    continue
+                frames: list[str] = []
+                current: FrameType | None = frame
+                while current is not None:
+                    frames.append(self._label(current.f_code))
+                    current = current.f_back
+                frames.append(names.get(ident, str(ident)))
+                frames.reverse()
+                sample.append(";".join(frames))
+            with self._lock:
+                self._stacks.update(sample)
+                self.samples += 1
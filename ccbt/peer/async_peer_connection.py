@@ -22,6 +22,7 @@ if TYPE_CHECKING:  # pragma: no cover - type checking only, not executed at runt
         EncryptedStreamReader,
         EncryptedStreamWriter,
     )
+    from ccbt.utils.tasks import PeriodicJob
 
 from ccbt.config.config import get_config
 from ccbt.models import MessageType
@@ -43,6 +44,7 @@ from ccbt.peer.peer import (
     RequestMessage,
     UnchokeMessage,
 )
+from ccbt.piece.merkle import ZERO_HASH, MerkleTree, piece_layer_pad
 from ccbt.protocols.bittorrent_v2 import (
     MESSAGE_ID_FILE_TREE_REQUEST,
     MESSAGE_ID_FILE_TREE_RESPONSE,
@@ -53,10 +55,16 @@ from ccbt.protocols.bittorrent_v2 import (
     PieceLayerRequest,
     PieceLayerResponse,
 )
+from ccbt.utils.tasks import get_scheduler
 
 # Error message constants
 _ERROR_READER_NOT_INITIALIZED = "Reader is not initialized"
 
+# Seconds between peer rate updates
+STATS_INTERVAL = 5.0
+# Seconds between keep-alive messages (peers drop connections idle for ~2 min)
+KEEPALIVE_INTERVAL = 120.0
+
 
 class ConnectionState(Enum):
     """States of a peer connection."""
@@ -290,9 +298,10 @@ class AsyncPeerConnectionManager:
         self.optimistic_unchoke: AsyncPeerConnection | None = None
         self.optimistic_unchoke_time: float = 0.0
 
-        # Background tasks
-        self._choking_task: asyncio.Task | None = None
-        self._stats_task: asyncio.Task | None = None
+        # Periodic jobs on the shared scheduler, and background tasks
+        self._choking_job: PeriodicJob | None = None
+        self._stats_job: PeriodicJob | None = None
+        self._keepalive_job: PeriodicJob | None = None
         self._reconnection_task: asyncio.Task | None = None
 
         # Running state flag for idempotency
@@ -304,6 +313,9 @@ class AsyncPeerConnectionManager:
         self._piece_selection_debounce_interval: float = 0.1  # 100ms debounce interval
         self._piece_selection_debounce_lock = asyncio.Lock()
 
+        # BEP 52 piece layers whose root has been checked (pieces_root -> tree)
+        self._piece_layer_trees: dict[bytes, MerkleTree] = {}
+
         # Callbacks
         self.on_peer_connected: Callable[[AsyncPeerConnection], None] | None = None
         self.on_peer_disconnected: Callable[[AsyncPeerConnection], None] | None = None
@@ -617,8 +629,8 @@ class AsyncPeerConnectionManager:
         This method is idempotent - calling it multiple times will only start
         the manager once. It initializes:
         - Connection pool
-        - Choking/unchoking management loop
-        - Peer statistics update loop
+        - Choking/unchoking, peer statistics and keep-alive jobs on the
+          shared scheduler
         - Failed peer reconnection loop
 
         Raises:
@@ -635,16 +647,25 @@ class AsyncPeerConnectionManager:
             await self.connection_pool.start()
             self.logger.debug("Connection pool started")
 
-            # Start background tasks
-            # CRITICAL FIX: Only create tasks if they don't already exist
-            # This prevents duplicate tasks if start() is called multiple times
-            if self._choking_task is None or self._choking_task.done():
-                self._choking_task = asyncio.create_task(self._choking_loop())
-                self.logger.debug("Choking loop task started")
+            # Register periodic jobs with the shared scheduler (one timer for
+            # all torrents) instead of running a sleeping task per manager
+            scheduler = get_scheduler()
+            if self._choking_job is None or self._choking_job.cancelled:
+                self._choking_job = scheduler.schedule(
+                    self._update_choking,
+                    self.config.network.unchoke_interval,
+                    name="peer.choking",
+                )
+
+            if self._stats_job is None or self._stats_job.cancelled:
+                self._stats_job = scheduler.schedule(
+                    self._update_peer_stats, STATS_INTERVAL, name="peer.stats"
+                )
 
-            if self._stats_task is None or self._stats_task.done():
-                self._stats_task = asyncio.create_task(self._stats_loop())
-                self.logger.debug("Stats loop task started")
+            if self._keepalive_job is None or self._keepalive_job.cancelled:
+                self._keepalive_job = scheduler.schedule(
+                    self._send_keepalives, KEEPALIVE_INTERVAL, name="peer.keepalive"
+                )
 
             if self._reconnection_task is None or self._reconnection_task.done():
                 self._reconnection_task = asyncio.create_task(self._reconnection_loop())
@@ -655,10 +676,8 @@ class AsyncPeerConnectionManager:
 
             self.logger.info(
                 "Async peer connection manager started (connection_pool=%s, "
-                "choking_task=%s, stats_task=%s, reconnection_task=%s)",
+                "reconnection_task=%s)",
                 getattr(self.connection_pool, "_running", "unknown"),
-                self._choking_task is not None and not self._choking_task.done(),
-                self._stats_task is not None and not self._stats_task.done(),
                 self._reconnection_task is not None
                 and not self._reconnection_task.done(),
             )
@@ -925,15 +944,17 @@ class AsyncPeerConnectionManager:
 
         self.logger.info("Stopping async peer connection manager...")
 
+        # Cancel periodic jobs (and any run in progress)
+        for job in (self._choking_job, self._stats_job, self._keepalive_job):
+            if job is not None:
+                job.cancel()
+        self._choking_job = None
+        self._stats_job = None
+        self._keepalive_job = None
+
         # Collect all tasks to cancel
         tasks_to_cancel: list[asyncio.Task] = []
 
-        if self._choking_task and not self._choking_task.done():
-            tasks_to_cancel.append(self._choking_task)
-
-        if self._stats_task and not self._stats_task.done():
-            tasks_to_cancel.append(self._stats_task)
-
         if self._reconnection_task and not self._reconnection_task.done():
             tasks_to_cancel.append(self._reconnection_task)
 
@@ -964,8 +985,6 @@ class AsyncPeerConnectionManager:
                     )
 
         # Clear task references
-        self._choking_task = None
-        self._stats_task = None
         self._reconnection_task = None
 
         # Disconnect all peers (with timeout protection)
@@ -1854,7 +1873,9 @@ class AsyncPeerConnectionManager:
 
                     # Connect via uTP (with fallback to TCP on failure)
                     try:
-                        await connection.connect()
+                        # The handshake and message loop below read from the
+                        # uTP stream adapter, so no separate receive task
+                        await connection.connect(start_receiver=False)
                         # Connection successful - uTP handles transport layer
                         # Still need BitTorrent protocol handshake, but skip TCP connection
                         # The reader/writer are already set up by UTPPeerConnection.connect()
@@ -2273,8 +2294,11 @@ class AsyncPeerConnectionManager:
                                     "Using existing reader/writer from connection object for %s",
                                     peer_info,
                                 )
-                elif connection:
+                elif connection and (
+                    connection.reader is None or connection.writer is None
+                ):
                     # TCP connection - set reader/writer from local variables
+                    # (pooled connections already carry their own streams)
                     # CRITICAL FIX: Ensure reader/writer are set before assigning to connection
                     if reader is None or writer is None:
                         # Reader/writer not initialized - this should not happen in normal flow
@@ -2476,8 +2500,7 @@ class AsyncPeerConnectionManager:
                     self.logger.error(error_msg)
                     raise RuntimeError(error_msg)
 
-                # CRITICAL FIX: Read handshake with support for v1 (68 bytes), v2 (80 bytes), and hybrid (100 bytes)
-                # First read the minimum v1 handshake size to detect protocol version
+                # Read the 68-byte handshake (the same size for v1, v2 and hybrid)
                 # CRITICAL FIX: Increase timeout to 10s for better reliability on slower networks (Phase 5)
 
                 # Validate connection state before reading handshake
@@ -2518,43 +2541,15 @@ class AsyncPeerConnectionManager:
                     )
                     peer_handshake_data = protocol_len_byte + remaining_v1
 
-                    # Check if this is a v2 or hybrid handshake by examining reserved bytes
-                    # Bit 0 of first reserved byte indicates v2 support
-                    if len(peer_handshake_data) >= 28:
-                        reserved_byte = peer_handshake_data[20]
-                        is_v2 = (reserved_byte & 0x01) != 0
-
-                        if is_v2:
-                            # This might be v2 (80 bytes) or hybrid (100 bytes)
-                            # Read additional bytes to determine
-                            # v2: +12 more bytes (32-byte info_hash_v2 instead of 20-byte info_hash_v1)
-                            # hybrid: +52 more bytes (20-byte info_hash_v1 + 32-byte info_hash_v2)
-                            # For now, try to read enough for v2 first
-                            try:
-                                additional_data = await asyncio.wait_for(
-                                    reader.readexactly(12),  # type: ignore[union-attr]
-                                    timeout=10.0,
-                                )
-                                peer_handshake_data += additional_data
-                                # Check if there's more (hybrid has 20 more bytes for info_hash_v1)
-                                # We'll handle this in the decode step
-                                self.logger.debug(
-                                    "Received v2 handshake from %s (%d bytes)",
-                                    peer_info,
-                                    len(peer_handshake_data),
-                                )
-                            except asyncio.TimeoutError:
-                                # Not v2, use v1 handshake
-                                self.logger.debug(
-                                    "Received v1 handshake from %s (68 bytes)",
-                                    peer_info,
-                                )
-                        else:
-                            self.logger.debug(
-                                "Received v1 handshake from %s (68 bytes)", peer_info
-                            )
-                    else:
-                        self.logger.debug("Received handshake from %s", peer_info)
+                    # BEP 52 keeps the 68-byte handshake for v2 and hybrid
+                    # torrents (the info hash is the truncated v2 hash); the
+                    # v2 reserved bit only advertises support, so reading past
+                    # 68 bytes would swallow the peer's bitfield
+                    self.logger.debug(
+                        "Received handshake from %s (v2 support: %s)",
+                        peer_info,
+                        bool(peer_handshake_data[20] & 0x01),
+                    )
 
                 except asyncio.TimeoutError:
                     error_msg = (
@@ -3000,47 +2995,28 @@ class AsyncPeerConnectionManager:
                     await self._disconnect_peer(connection)
                 raise
 
-    async def _keepalive_sender(self, connection: AsyncPeerConnection) -> None:
-        """Periodic task to send keep-alive messages to peer.
+    async def _send_keepalives(self) -> None:
+        """Send a keep-alive (length=0 message) to every connected peer.
 
-        Sends keep-alive (length=0 message) every 120 seconds to prevent connection timeout.
+        Run every KEEPALIVE_INTERVAL seconds by the shared scheduler, for all
+        connections at once rather than from a task per connection.
         """
-        keepalive_interval = 120.0  # Send keep-alive every 120 seconds
-
-        try:
-            while connection.is_connected():
-                await asyncio.sleep(keepalive_interval)
-
-                if not connection.is_connected():
-                    break
-
-                # Send keep-alive message (4 zero bytes)
-                try:
-                    if connection.writer and not connection.writer.is_closing():
-                        keepalive_msg = b"\x00\x00\x00\x00"
-                        connection.writer.write(keepalive_msg)
-                        await connection.writer.drain()
-                        connection.stats.last_activity = time.time()
-                        self.logger.debug(
-                            "Sent keep-alive message to %s", connection.peer_info
-                        )
-                except Exception as e:
-                    self.logger.debug(
-                        "Failed to send keep-alive to %s: %s (connection may be closing)",
-                        connection.peer_info,
-                        e,
-                    )
-                    break
-        except asyncio.CancelledError:
-            self.logger.debug(
-                "Keep-alive sender cancelled for peer %s", connection.peer_info
-            )
-        except Exception:
-            self.logger.debug(
-                "Keep-alive sender error for peer %s",
-                connection.peer_info,
-                exc_info=True,
-            )
+        keepalive_msg = b"\x00\x00\x00\x00"
+        now = time.time()
+        for connection in list(self.connections.values()):
+            if not connection.is_connected():
+                continue
+            try:
+                if connection.writer and not connection.writer.is_closing():
+                    # Four bytes fit the transport buffer; no drain per peer
+                    connection.writer.write(keepalive_msg)
+                    connection.stats.last_activity = now
+            except Exception as e:
+                self.logger.debug(
+                    "Failed to send keep-alive to %s: %s (connection may be closing)",
+                    connection.peer_info,
+                    e,
+                )
 
     async def _handle_peer_messages(self, connection: AsyncPeerConnection) -> None:
         """Handle incoming messages from a peer."""
@@ -3055,15 +3031,6 @@ class AsyncPeerConnectionManager:
             connection.am_interested,
         )
 
-        # CRITICAL FIX: Start keep-alive sender task
-        keepalive_task = None
-        try:
-            keepalive_task = asyncio.create_task(self._keepalive_sender(connection))
-        except Exception as e:
-            self.logger.warning(
-                "Failed to start keep-alive sender for %s: %s", connection.peer_info, e
-            )
-
         try:
             while connection.is_connected():  # pragma: no cover - Message loop requires active connection and messages, complex to test
                 if connection.reader is None:  # pragma: no cover - Same context
@@ -3217,12 +3184,6 @@ class AsyncPeerConnectionManager:
                 connection.state.value,
             )  # pragma: no cover - Same context
         finally:
-            # CRITICAL FIX: Cancel keep-alive sender task when message loop stops
-            if keepalive_task and not keepalive_task.done():
-                keepalive_task.cancel()
-                with contextlib.suppress(asyncio.CancelledError):
-                    await keepalive_task
-
             self.logger.info(
                 "Message loop stopped for peer %s (processed %d messages, duration=%.1fs, final state=%s)",
                 connection.peer_info,
@@ -3264,6 +3225,14 @@ class AsyncPeerConnectionManager:
                 handler = self.message_handlers.get(MessageType.PIECE)
                 if handler:
                     await handler(connection, message)  # type: ignore[misc]  # Handler is async
+            elif isinstance(message, RequestMessage):
+                handler = self.message_handlers.get(MessageType.REQUEST)
+                if handler:
+                    await handler(connection, message)  # type: ignore[misc]  # Handler is async
+            elif isinstance(message, CancelMessage):
+                handler = self.message_handlers.get(MessageType.CANCEL)
+                if handler:
+                    await handler(connection, message)  # type: ignore[misc]  # Handler is async
             elif hasattr(message, "message_id") and message.message_id in [
                 MESSAGE_ID_PIECE_LAYER_REQUEST,
                 MESSAGE_ID_PIECE_LAYER_RESPONSE,
@@ -3626,6 +3595,14 @@ class AsyncPeerConnectionManager:
             len(message.piece_hashes),
         )
 
+        if not self._verify_piece_layer(message):
+            self.logger.warning(
+                "Discarding piece layer from %s: hashes do not match pieces_root %s",
+                connection.peer_info,
+                message.pieces_root.hex()[:16],
+            )
+            return
+
         # Update piece manager with piece availability from piece layer
         if self.piece_manager:
             try:
@@ -3650,8 +3627,9 @@ class AsyncPeerConnectionManager:
                             torrent_piece_hashes = self.torrent_data["piece_hashes"]
                             if isinstance(torrent_piece_hashes, list):
                                 # Match piece hashes to find indices
+                                layer_set = set(message.piece_hashes)
                                 for i, torrent_hash in enumerate(torrent_piece_hashes):
-                                    if torrent_hash in message.piece_hashes:
+                                    if torrent_hash in layer_set:
                                         piece_indices.add(i)
 
                 # If we found piece indices, update piece manager
@@ -3683,6 +3661,46 @@ class AsyncPeerConnectionManager:
         ):  # pragma: no cover - Optional callback for piece layer, tested via direct piece layer handling
             self.on_piece_layer_received(connection, message)  # type: ignore[attr-defined]
 
+    def _verify_piece_layer(self, message: PieceLayerResponse) -> bool:
+        """Check a received piece layer against its pieces_root.
+
+        Layers are only checked for roots listed in this torrent's piece
+        layers. Verified layers are kept as Merkle trees, so a repeated
+        response only has to compare hashes, and proofs for BEP 52 hash
+        requests can be served without rebuilding the tree.
+
+        Args:
+            message: Piece layer response message
+
+        Returns:
+            False if the hashes do not produce the pieces_root
+
+        """
+        pieces_root = message.pieces_root
+        tree = self._piece_layer_trees.get(pieces_root)
+        if tree is not None:
+            return tree.leaves == message.piece_hashes
+
+        if not isinstance(self.torrent_data, dict) or not message.piece_hashes:
+            return True
+        if pieces_root not in (self.torrent_data.get("piece_layers") or {}):
+            return True
+
+        piece_length = self.torrent_data.get("piece_length")
+        try:
+            pad = (
+                piece_layer_pad(piece_length)
+                if isinstance(piece_length, int)
+                else ZERO_HASH
+            )
+        except ValueError:
+            pad = ZERO_HASH
+        tree = MerkleTree(message.piece_hashes, pad=pad)
+        if tree.root() != pieces_root:
+            return False
+        self._piece_layer_trees[pieces_root] = tree
+        return True
+
     async def _handle_file_tree_request(
         self,
         connection: AsyncPeerConnection,
@@ -4590,8 +4608,14 @@ class AsyncPeerConnectionManager:
                     "Removed peer %s from connections dict (state: ERROR)", peer_key
                 )
 
-        # Cancel connection task (only if it exists - PooledConnection doesn't have this)
-        if hasattr(connection, "connection_task") and connection.connection_task:
+        # Cancel connection task (only if it exists - PooledConnection doesn't have this).
+        # The message loop disconnects itself on exit; cancelling and awaiting
+        # the current task would only leave a stray cancellation request on it.
+        if (
+            hasattr(connection, "connection_task")
+            and connection.connection_task
+            and connection.connection_task is not asyncio.current_task()
+        ):
             connection.connection_task.cancel()
             with contextlib.suppress(asyncio.CancelledError):
                 await connection.connection_task
@@ -4751,27 +4775,6 @@ class AsyncPeerConnectionManager:
             except Exception:
                 self.logger.exception("Error in reconnection loop")
 
-    async def _choking_loop(self) -> None:
-        """Background task for choking/unchoking management."""
-        while await self._choking_loop_step():  # pragma: no cover - Background loop requires time-based iterations, complex to test
-            pass  # pragma: no cover - Same context
-
-    async def _choking_loop_step(self) -> bool:
-        """Execute one choking loop iteration. Return False to stop the loop."""
-        try:  # pragma: no cover - Background loop step requires time-based execution, complex to test reliably
-            await asyncio.sleep(
-                self.config.network.unchoke_interval
-            )  # pragma: no cover - Time-dependent sleep in background loop
-            await self._update_choking()  # pragma: no cover - Same context
-            return True  # pragma: no cover - Same context
-        except asyncio.CancelledError:  # pragma: no cover - Cancellation handling in choking loop, requires task cancellation which is difficult to test reliably
-            return False  # pragma: no cover - Cancellation return path in choking loop
-        except Exception:  # pragma: no cover - Exception handling in choking loop
-            self.logger.exception(
-                "Error in choking loop"
-            )  # pragma: no cover - Same context
-            return True  # pragma: no cover - Same context
-
     async def _update_choking(self) -> None:
         """Update choking/unchoking based on tit-for-tat."""
         async with self.connection_lock:  # pragma: no cover - Choking management requires multiple active peers, complex to test
@@ -4807,8 +4810,9 @@ class AsyncPeerConnectionManager:
 
             self.upload_slots = new_upload_slots  # pragma: no cover - Same context
 
-            # Optimistic unchoke
-            await self._update_optimistic_unchoke()  # pragma: no cover - Same context
+        # Optimistic unchoke takes connection_lock itself, so run it after
+        # releasing the lock (asyncio locks are not reentrant)
+        await self._update_optimistic_unchoke()  # pragma: no cover - Same context
 
     async def _update_optimistic_unchoke(self) -> None:
         """Update optimistic unchoke peer."""
@@ -4870,27 +4874,6 @@ class AsyncPeerConnectionManager:
             connection.am_choking = False
             self.logger.debug("Unchoked peer %s", connection.peer_info)
 
-    async def _stats_loop(self) -> None:
-        """Background task for updating peer statistics."""
-        while await self._stats_loop_step():  # pragma: no cover - Background loop requires time-based iterations, complex to test
-            pass  # pragma: no cover - Same context
-
-    async def _stats_loop_step(self) -> bool:
-        """Execute one stats loop iteration. Return False to stop the loop."""
-        try:  # pragma: no cover - Background loop step requires time-based execution, complex to test reliably
-            await asyncio.sleep(
-                5.0
-            )  # pragma: no cover - Time-dependent sleep in background loop
-            await self._update_peer_stats()  # pragma: no cover - Same context
-            return True  # pragma: no cover - Same context
-        except asyncio.CancelledError:
-            return False  # pragma: no cover - Cancellation handling in stats loop
-        except Exception:  # pragma: no cover - Exception handling in stats loop
-            self.logger.exception(
-                "Error in stats loop"
-            )  # pragma: no cover - Same context
-            return True  # pragma: no cover - Same context
-
     async def _update_peer_stats(self) -> None:
         """Update peer statistics."""
         current_time = time.time()  # pragma: no cover - Stats update loop requires time-based state changes, complex to test
@@ -0,0 +1,229 @@
+"""Routing and admission control for incoming peer handshakes.
+
+The session manager registers every torrent session with an
+:class:`InfoHashRouter` when it is created, and marks torrents that are
+about to be added (for example while restoring state on startup) as
+pending. Incoming handshakes are resolved against the table without
+polling: known info hashes route at once, pending ones wait on a future
+that completes when the session registers, and unknown ones are rejected
+immediately.
+
+:class:`AcceptLimiter` bounds how fast and how many unauthenticated
+connections the listener holds before a handshake has been read.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any
+
+# Idle per-IP buckets are pruned once the table grows past this size
+MAX_TRACKED_IPS = 4096
+
+
+class InfoHashRouter:
+    """Map info hashes to torrent sessions for incoming connections."""
+
+    def __init__(self) -> None:
+        """Initialize an empty routing table."""
+        self._sessions: dict[bytes, Any] = {}
+        self._pending: dict[bytes, asyncio.Future[Any]] = {}
+
+    def __len__(self) -> int:
+        """Return the number of registered sessions."""
+        return len(self._sessions)
+
+    def __contains__(self, info_hash: object) -> bool:
+        """Check whether a session is registered for an info hash."""
+        return info_hash in self._sessions
+
+    def register(self, info_hash: bytes, session: Any) -> None:
+        """Register a session and wake handshakes waiting for it.
+
+        Args:
+            info_hash: Info hash peers use in their handshake
+            session: Torrent session accepting incoming peers
+
+        """
+        self._sessions[info_hash] = session
+        future = self._pending.pop(info_hash, None)
+        if future is not None and not future.done():
+            future.set_result(session)
+
+    def unregister(self, info_hash: bytes, session: Any | None = None) -> None:
+        """Remove a session from the table.
+
+        Args:
+            info_hash: Info hash to remove
+            session: Only remove if this session is the one registered
+
+        """
+        if session is None or self._sessions.get(info_hash) is session:
+            self._sessions.pop(info_hash, None)
+        self.abandon(info_hash)
+
+    def expect(self, info_hash: bytes) -> None:
+        """Mark a torrent as being added so its handshakes wait for it.
+
+        Must be called from the event loop that runs the listener.
+
+        Args:
+            info_hash: Info hash of the torrent about to be added
+
+        """
+        if info_hash in self._sessions or info_hash in self._pending:
+            return
+        self._pending[info_hash] = asyncio.get_running_loop().create_future()
+
+    def abandon(self, info_hash: bytes) -> None:
+        """Stop waiting for a pending torrent; waiting handshakes are rejected.
+
+        Args:
+            info_hash: Info hash previously passed to :meth:`expect`
+
+        """
+        future = self._pending.pop(info_hash, None)
+        if future is not None and not future.done():
+            future.set_result(None)
+
+    def clear(self) -> None:
+        """Remove every session and reject handshakes still waiting."""
+        self._sessions.clear()
+        for info_hash in list(self._pending):
+            self.abandon(info_hash)
+
+    def get(self, info_hash: bytes) -> Any | None:
+        """Return the registered session for an info hash, if any."""
+        return self._sessions.get(info_hash)
+
+    def is_pending(self, info_hash: bytes) -> bool:
+        """Check whether a torrent is expected but not registered yet."""
+        return info_hash in self._pending
+
+    async def resolve(self, info_hash: bytes, timeout: float) -> Any | None:
+        """Return the session for an incoming handshake.
+
+        Args:
+            info_hash: Info hash from the peer's handshake
+            timeout: Maximum seconds to wait for a pending torrent
+
+        Returns:
+            Session, or None if the torrent is unknown, was abandoned or
+            did not register within ``timeout``
+
+        """
+        session = self._sessions.get(info_hash)
+        if session is not None:
+            return session
+        future = self._pending.get(info_hash)
+        if future is None:
+            return None
+        try:
+            # Shield: one waiter timing out must not cancel the shared future
+            return await asyncio.wait_for(asyncio.shield(future), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+
+class AcceptLimiter:
+    """Token-bucket accept rate limits and half-open handshake caps."""
+
+    def __init__(
+        self,
+        *,
+        rate: float,
+        burst: int,
+        rate_per_ip: float,
+        burst_per_ip: int,
+        max_half_open: int,
+        max_half_open_per_ip: int,
+    ):
+        """Initialize accept limiter.
+
+        Args:
+            rate: Connections accepted per second across all peers
+            burst: Connections accepted in a burst across all peers
+            rate_per_ip: Connections accepted per second from one IP
+            burst_per_ip: Connections accepted in a burst from one IP
+            max_half_open: Connections allowed before their handshake is read
+            max_half_open_per_ip: Half-open connections allowed from one IP
+
+        """
+        self.rate = rate
+        self.burst = float(burst)
+        self.rate_per_ip = rate_per_ip
+        self.burst_per_ip = float(burst_per_ip)
+        self.max_half_open = max_half_open
+        self.max_half_open_per_ip = max_half_open_per_ip
+
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._ip_buckets: dict[str, tuple[float, float]] = {}
+        self._half_open = 0
+        self._half_open_by_ip: dict[str, int] = {}
+
+    @property
+    def half_open(self) -> int:
+        """Number of connections currently waiting for a handshake."""
+        return self._half_open
+
+    def admit(self, ip: str) -> str | None:
+        """Try to admit a new connection and count it as half-open.
+
+        Args:
+            ip: Remote IP address
+
+        Returns:
+            None if admitted, otherwise the reason for rejection
+
+        """
+        if self._half_open >= self.max_half_open:
+            return "half-open limit"
+        if self._half_open_by_ip.get(ip, 0) >= self.max_half_open_per_ip:
+            return "per-IP half-open limit"
+
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        if self._tokens < 1.0:
+            return "accept rate"
+
+        ip_tokens, ip_updated = self._ip_buckets.get(ip, (self.burst_per_ip, now))
+        ip_tokens = min(
+            self.burst_per_ip, ip_tokens + (now - ip_updated) * self.rate_per_ip
+        )
+        if ip_tokens < 1.0:
+            self._ip_buckets[ip] = (ip_tokens, now)
+            return "per-IP accept rate"
+
+        self._tokens -= 1.0
+        if len(self._ip_buckets) >= MAX_TRACKED_IPS:
+            self._prune(now)
+        self._ip_buckets[ip] = (ip_tokens - 1.0, now)
+        self._half_open += 1
+        self._half_open_by_ip[ip] = self._half_open_by_ip.get(ip, 0) + 1
+        return None
+
+    def release(self, ip: str) -> None:
+        """Stop counting an admitted connection as half-open.
+
+        Args:
+            ip: Remote IP address passed to :meth:`admit`
+
+        """
+        self._half_open = max(0, self._half_open - 1)
+        count = self._half_open_by_ip.get(ip, 0) - 1
+        if count > 0:
+            self._half_open_by_ip[ip] = count
+        else:
+            self._half_open_by_ip.pop(ip, None)
+
+    def _prune(self, now: float) -> None:
+        """Drop per-IP buckets that have refilled completely."""
+        refill = self.burst_per_ip / self.rate_per_ip if self.rate_per_ip > 0 else 0.0
+        self._ip_buckets = {
+            ip: bucket
+            for ip, bucket in self._ip_buckets.items()
+            if now - bucket[1] < refill
+        }
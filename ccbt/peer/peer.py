@@ -792,6 +792,10 @@ class AsyncMessageDecoder:
             Next message or None if queue is empty
 
         """
+        # Take queued messages directly: wait_for() can drop an item that
+        # arrives as its timeout fires when the event loop lags.
+        if not self.message_queue.empty():
+            return self.message_queue.get_nowait()
         try:
             return await asyncio.wait_for(self.message_queue.get(), timeout=0.1)
         except asyncio.TimeoutError:
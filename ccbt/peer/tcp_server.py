@@ -12,6 +12,7 @@ import socket
 from typing import TYPE_CHECKING, Any
 
 from ccbt.config.config import get_config
+from ccbt.peer.handshake_router import AcceptLimiter
 from ccbt.utils.exceptions import HandshakeError
 
 if TYPE_CHECKING:
@@ -37,6 +38,23 @@ class IncomingPeerServer:
         self._running = False
         self.logger = logging.getLogger(__name__)
 
+        network = self.config.network
+        self.accept_limiter = AcceptLimiter(
+            rate=network.incoming_accept_rate,
+            burst=network.incoming_accept_burst,
+            rate_per_ip=network.incoming_accept_rate_per_ip,
+            burst_per_ip=network.incoming_accept_burst_per_ip,
+            max_half_open=network.max_half_open_incoming,
+            max_half_open_per_ip=network.max_half_open_incoming_per_ip,
+        )
+        self.stats = {
+            "accepted": 0,
+            "routed": 0,
+            "rejected_filtered": 0,
+            "rejected_rate_limited": 0,
+            "rejected_unknown_info_hash": 0,
+        }
+
     async def start(self) -> None:
         """Start the TCP server.
 
@@ -204,13 +222,41 @@ class IncomingPeerServer:
             addresses.append(f"{sockname[0]}:{sockname[1]}")
         return addresses
 
+    def _is_ip_blocked(self, peer_ip: str) -> bool:
+        """Check the session manager's blacklist and IP filter."""
+        security_manager = getattr(self.session_manager, "security_manager", None)
+        if security_manager is None or not hasattr(security_manager, "is_ip_blocked"):
+            return False
+        return security_manager.is_ip_blocked(peer_ip)
+
+    async def _resolve_session(self, info_hash: bytes) -> Any | None:
+        """Find the session for a handshake without polling.
+
+        Torrents that are still being added are awaited through the session
+        manager's routing table; unknown info hashes return None at once.
+        """
+        router = getattr(self.session_manager, "info_hash_router", None)
+        if router is not None:
+            return await router.resolve(
+                info_hash, self.config.network.incoming_pending_session_timeout
+            )
+        return await self.session_manager.get_session_for_info_hash(info_hash)
+
+    @staticmethod
+    def _abort(writer: asyncio.StreamWriter) -> None:
+        """Drop a connection without waiting for a graceful close."""
+        transport = writer.transport
+        if transport is not None:
+            transport.abort()
+
     async def _handle_connection(
         self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
     ) -> None:
         """Handle an incoming TCP connection.
 
-        Reads the BitTorrent handshake, validates it, and routes to the
-        appropriate torrent session.
+        Checks the IP filter and accept limits before reading anything, then
+        reads the BitTorrent handshake, validates it, and routes it to the
+        torrent session registered for its info hash.
 
         Args:
             reader: Stream reader for incoming data
@@ -223,7 +269,31 @@ class IncomingPeerServer:
         else:
             peer_ip, peer_port = "unknown", 0
 
+        if self._is_ip_blocked(peer_ip):
+            self.stats["rejected_filtered"] += 1
+            self.logger.debug(
+                "Rejected incoming connection from %s:%d: IP is blocked",
+                peer_ip,
+                peer_port,
+            )
+            self._abort(writer)
+            return
+
+        reason = self.accept_limiter.admit(peer_ip)
+        if reason is not None:
+            self.stats["rejected_rate_limited"] += 1
+            self.logger.debug(
+                "Rejected incoming connection from %s:%d: %s",
+                peer_ip,
+                peer_port,
+                reason,
+            )
+            self._abort(writer)
+            return
+
+        self.stats["accepted"] += 1
         self.logger.debug("Incoming connection from %s:%d", peer_ip, peer_port)
+        half_open = True
 
         try:
             # Read first byte to determine protocol length
@@ -269,40 +339,19 @@ class IncomingPeerServer:
                 await writer.wait_closed()
                 return
 
-            # CRITICAL FIX: Lookup torrent session by info_hash with retry logic
-            # Session may not be registered yet if it's starting in background
-            # Wait up to 60 seconds for session registration before rejecting connection
-            # Increased to 60s to handle slow session initialization, especially for magnet links
-            # Magnet links take longer to initialize (metadata fetching) than torrent files
-            session = None
-            max_wait_time = 60.0  # Maximum time to wait for session registration (increased to 60s for magnet links)
-            check_interval = 0.2  # Check every 200ms
-            start_time = asyncio.get_event_loop().time()
-
-            while (
-                session is None
-                and (asyncio.get_event_loop().time() - start_time) < max_wait_time
-            ):
-                session = await self.session_manager.get_session_for_info_hash(
-                    handshake.info_hash
-                )
-                if session is None:
-                    await asyncio.sleep(check_interval)
+            # Sessions register with the routing table when created; torrents
+            # still being added are awaited, anything else is rejected now
+            session = await self._resolve_session(handshake.info_hash)
 
             if session is None:
-                elapsed = asyncio.get_event_loop().time() - start_time
-                self.logger.warning(
-                    "No active torrent for info_hash %s from %s:%d after waiting %.1fs. "
-                    "Session may not be registered yet or torrent not active. "
-                    "This may indicate slow session initialization (especially for magnet links) or session registration failure. "
-                    "If this is a magnet link, metadata fetching may still be in progress.",
+                self.stats["rejected_unknown_info_hash"] += 1
+                self.logger.debug(
+                    "No active torrent for info_hash %s from %s:%d, rejecting",
                     handshake.info_hash.hex()[:16],
                     peer_ip,
                     peer_port,
-                    elapsed,
                 )
-                writer.close()
-                await writer.wait_closed()
+                self._abort(writer)
                 return
 
             # CRITICAL FIX: Check session readiness before accepting connections
@@ -313,20 +362,23 @@ class IncomingPeerServer:
                 and hasattr(session.info, "status")
                 and session.info.status == "stopped"
             ):
-                elapsed = asyncio.get_event_loop().time() - start_time
                 self.logger.debug(
                     "Rejecting connection from %s:%d for info_hash %s: session is stopped (not ready). "
-                    "Session status: %s (waited %.1fs for registration)",
+                    "Session status: %s",
                     peer_ip,
                     peer_port,
                     handshake.info_hash.hex()[:16],
                     session.info.status,
-                    elapsed,
                 )
                 writer.close()
                 await writer.wait_closed()
                 return
 
+            # Handshake complete: the session owns the connection from here
+            self.accept_limiter.release(peer_ip)
+            half_open = False
+            self.stats["routed"] += 1
+
             # Route to torrent session's peer connection manager
             await session.accept_incoming_peer(
                 reader, writer, handshake, peer_ip, peer_port
@@ -360,3 +412,6 @@ class IncomingPeerServer:
                 await writer.wait_closed()
             except Exception:
                 pass  # Ignore errors during cleanup
+        finally:
+            if half_open:
+                self.accept_limiter.release(peer_ip)
@@ -31,7 +31,13 @@ logger = logging.getLogger(__name__)
 
 
 class UTPStreamReader:
-    """Stream reader adapter for uTP connections."""
+    """Stream reader adapter for uTP connections.
+
+    Mirrors the subset of :class:`asyncio.StreamReader` used by the peer
+    message loop so uTP peers share the TCP framing and decoding path.
+    Reads are served from the connection's chunked receive buffer; the local
+    buffer only holds bytes pushed back by callers.
+    """
 
     def __init__(self, utp_connection: UTPConnection):
         """Initialize stream reader.
@@ -43,6 +49,12 @@ class UTPStreamReader:
         self.utp_connection = utp_connection
         self._buffer = bytearray()
 
+    def _take_buffered(self, n: int) -> bytes:
+        """Remove and return up to ``n`` bytes from the local buffer."""
+        data = bytes(self._buffer[:n])
+        del self._buffer[:n]
+        return data
+
     async def read(self, n: int = -1) -> bytes:
         """Read data from uTP connection.
 
@@ -50,17 +62,19 @@ class UTPStreamReader:
             n: Number of bytes to read (-1 for all available)
 
         Returns:
-            Read data bytes
+            Read data bytes (shorter than ``n`` only if the connection closed)
 
         """
         if n < 0:
             # Read all available
             if len(self._buffer) > 0:
-                data = bytes(self._buffer)
-                self._buffer.clear()
-                return data
+                return self._take_buffered(len(self._buffer))
             return await self.utp_connection.receive(-1)
 
+        if not self._buffer:
+            # Nothing pushed back locally - let the connection slice its buffer
+            return await self.utp_connection.receive(n)
+
         # Read exactly n bytes
         while len(self._buffer) < n:
             # Get more data from uTP connection
@@ -71,9 +85,7 @@ class UTPStreamReader:
             self._buffer.extend(chunk)
 
         # Return requested amount
-        data = bytes(self._buffer[:n])
-        self._buffer = self._buffer[n:]
-        return data
+        return self._take_buffered(n)
 
     async def readexactly(self, n: int) -> bytes:
         """Read exactly n bytes.
@@ -85,15 +97,37 @@ class UTPStreamReader:
             Exactly n bytes
 
         Raises:
-            EOFError: If connection closed before n bytes available
+            asyncio.IncompleteReadError: If connection closed before n bytes
+                were available (an ``EOFError`` subclass, as raised by
+                :meth:`asyncio.StreamReader.readexactly`)
 
         """
         data = await self.read(n)
         if len(data) < n:
-            msg = f"Connection closed: expected {n} bytes, got {len(data)}"
-            raise EOFError(msg)
+            raise asyncio.IncompleteReadError(data, n)
         return data
 
+    async def readinto(self, buf: bytearray | memoryview) -> int:
+        """Read available data directly into ``buf``.
+
+        Args:
+            buf: Writable destination buffer
+
+        Returns:
+            Number of bytes written (0 at end of stream)
+
+        """
+        if self._buffer:
+            count = min(len(buf), len(self._buffer))
+            memoryview(buf)[:count] = self._buffer[:count]
+            del self._buffer[:count]
+            return count
+        return await self.utp_connection.readinto(buf)
+
+    def at_eof(self) -> bool:
+        """Return True if the peer closed and all buffered data was read."""
+        return not self._buffer and self.utp_connection.at_eof
+
 
 class UTPStreamWriter:
     """Stream writer adapter for uTP connections."""
@@ -186,10 +220,17 @@ class UTPPeerConnection(AsyncPeerConnection):
             UTPConnectionState.RESET: ConnectionState.ERROR,
         }
 
-    async def connect(self) -> None:
+    async def connect(self, start_receiver: bool = True) -> None:
         """Connect to peer via uTP.
 
         Establishes uTP connection and creates stream reader/writer adapters.
+
+        Args:
+            start_receiver: Start the background receive loop. Pass False when
+                the caller drives ``reader`` itself (e.g. the connection
+                manager's handshake and message loop), so the stream has a
+                single consumer.
+
         """
         self.state = ConnectionState.CONNECTING
 
@@ -229,7 +270,8 @@ class UTPPeerConnection(AsyncPeerConnection):
             self.stats.last_activity = time.time()
 
             # Start message receiving task
-            self.connection_task = asyncio.create_task(self._receive_messages())
+            if start_receiver:
+                self.connection_task = asyncio.create_task(self._receive_messages())
 
             logger.info(
                 "uTP peer connection established to %s:%s",
@@ -265,29 +307,24 @@ class UTPPeerConnection(AsyncPeerConnection):
         self.writer = None
 
     async def _receive_messages(self) -> None:
-        """Background task to receive messages from uTP connection."""
+        """Background task to receive messages from uTP connection.
+
+        Whatever the connection has reassembled is handed to the message
+        decoder in one piece, so framing happens once per batch of packets
+        instead of once per length prefix and payload.
+        """
         if self.reader is None:
             return
 
         try:
             while self.state == ConnectionState.CONNECTED:
-                # Read message length (4 bytes)
-                length_data = await self.reader.readexactly(4)
-                if not length_data:  # pragma: no cover - Defensive: readexactly should raise EOFError, but handle empty return gracefully
-                    break
-
-                message_length = int.from_bytes(length_data, byteorder="big")
-                if message_length == 0:
-                    # Keep-alive message
-                    continue
-
-                # Read message data
-                message_data = await self.reader.readexactly(message_length)
-                if not message_data:  # pragma: no cover - Defensive: readexactly should raise EOFError, but handle empty return gracefully
-                    break
-
-                # Feed to message decoder
-                await self.message_decoder.feed_data(length_data + message_data)
+                data = await self.reader.read(-1)
+                if not data:
+                    msg = "uTP stream ended"
+                    raise EOFError(msg)
+
+                # Feed to message decoder (keep-alives are consumed there)
+                await self.message_decoder.feed_data(data)
 
                 # Update statistics
                 self.stats.last_activity = time.time()
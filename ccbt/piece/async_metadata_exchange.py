@@ -38,12 +38,23 @@ from enum import Enum
 from typing import Any, Callable
 
 from ccbt.config.config import get_config
-from ccbt.core.bencode import BencodeDecoder, BencodeEncoder
+from ccbt.core.bencode import BencodeDecodeError, BencodeDecoder, BencodeEncoder
 
 # Error message constants
 _ERROR_WRITER_NOT_INITIALIZED = "Writer is not initialized"
 _ERROR_READER_NOT_INITIALIZED = "Reader is not initialized"
 
+# BEP 9 metadata piece size
+METADATA_PIECE_SIZE = 16384
+# Extension id we advertise for ut_metadata; peers address responses with it
+METADATA_LOCAL_EXT_ID = 1
+# Outstanding ut_metadata requests per peer
+METADATA_PIPELINE_DEPTH = 16
+# Seconds before an outstanding piece is duplicated to another peer
+METADATA_STRAGGLER_TIMEOUT = 2.0
+# Seconds without a ut_metadata message before a peer is abandoned
+METADATA_PEER_IDLE_TIMEOUT = 30.0
+
 
 class MetadataState(Enum):
     """States of metadata exchange."""
@@ -78,6 +89,8 @@ class PeerMetadataSession:
     pieces_received: dict[int, bytes] = field(default_factory=dict)
     pieces_requested: set[int] = field(default_factory=set)
     pieces_failed: set[int] = field(default_factory=set)
+    # piece index -> time the outstanding request was sent
+    pieces_in_flight: dict[int, float] = field(default_factory=dict)
 
     # Piece count for this session (populated after extended handshake)
     num_pieces: int = 0
@@ -122,8 +135,17 @@ class AsyncMetadataExchange:
         self.metadata_size: int | None = None
         self.num_pieces: int = 0
 
+        # Request scheduling: piece index -> {peer: time requested}
+        self._inflight: dict[int, dict[tuple[str, int], float]] = {}
+        self._received_pieces = 0
+
+        # Running SHA-1 over the contiguous prefix of received pieces
+        self._hasher = hashlib.sha1()  # nosec B324 - SHA-1 required by BitTorrent protocol (BEP 3)
+        self._hashed_pieces = 0
+
         # Completion tracking
-        self.completed = False
+        self._completed = False
+        self._completion_event: asyncio.Event | None = None
         self.metadata_data: bytes | None = None
         self.metadata_dict: dict[bytes, Any] | None = None
 
@@ -146,6 +168,25 @@ class AsyncMetadataExchange:
         """Async context manager exit with proper cleanup."""
         await self.stop()
 
+    @property
+    def completed(self) -> bool:
+        """Whether validated metadata is available."""
+        return self._completed
+
+    @completed.setter
+    def completed(self, value: bool) -> None:
+        self._completed = value
+        if value and self._completion_event is not None:
+            self._completion_event.set()
+
+    def _get_completion_event(self) -> asyncio.Event:
+        """Return the completion event, creating it on the running loop."""
+        if self._completion_event is None:
+            self._completion_event = asyncio.Event()
+            if self._completed:
+                self._completion_event.set()
+        return self._completion_event
+
     def _raise_connection_error(self, message: str) -> None:
         """Raise a ConnectionError with the given message."""
         raise ConnectionError(message)
@@ -223,50 +264,17 @@ class AsyncMetadataExchange:
         except asyncio.TimeoutError:
             self.logger.warning("Metadata fetch timed out")
             return None
+        finally:
+            # Once metadata is verified, release the remaining peers right away
+            # so the download can start instead of waiting on stragglers.
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
 
-        # Cancel remaining tasks
-        for task in tasks:  # pragma: no cover - Task cancellation after timeout is difficult to test reliably
-            if not task.done():  # pragma: no cover - Same context
-                task.cancel()  # pragma: no cover - Same context
-
-        # CRITICAL FIX: Validate metadata before returning
-        if self.metadata_dict:
-            # Verify metadata contains required fields
-            if b"info" not in self.metadata_dict:
-                self.logger.error("Metadata missing 'info' dictionary")
-                return None
-
-            # Verify info_hash matches if we have it
-            try:
-                import hashlib
-
-                from ccbt.core.bencode import BencodeEncoder
-
-                encoder = BencodeEncoder()
-                info_dict = self.metadata_dict[b"info"]
-                info_hash_calculated = hashlib.sha1(encoder.encode(info_dict)).digest()
-
-                # If we have expected info_hash, validate it matches
-                if hasattr(self, "info_hash") and self.info_hash:
-                    if info_hash_calculated != self.info_hash:
-                        self.logger.error(
-                            "Metadata info_hash mismatch: expected %s, got %s",
-                            self.info_hash.hex()
-                            if isinstance(self.info_hash, bytes)
-                            else str(self.info_hash),
-                            info_hash_calculated.hex(),
-                        )
-                        return None
-
-                self.logger.info(
-                    "Metadata validated successfully (info_hash: %s)",
-                    info_hash_calculated.hex()[:16] + "...",
-                )
-            except Exception as e:
-                self.logger.error("Metadata validation failed: %s", e, exc_info=True)
-                return None
-
-        return self.metadata_dict  # pragma: no cover - Return path after timeout, difficult to test without actual metadata fetch
+        # _assemble_metadata only publishes metadata whose SHA-1 matches the
+        # info-hash (BEP 9), so anything here is already validated.
+        return self.metadata_dict
 
     async def _connect_and_fetch(
         self,
@@ -503,7 +511,9 @@ class AsyncMetadataExchange:
         if session.writer is None:
             msg = _ERROR_WRITER_NOT_INITIALIZED
             raise RuntimeError(msg)
-        payload = BencodeEncoder().encode({b"m": {b"ut_metadata": 1}})
+        payload = BencodeEncoder().encode(
+            {b"m": {b"ut_metadata": METADATA_LOCAL_EXT_ID}}
+        )
         msg = struct.pack("!IBB", 2 + len(payload), 20, 0) + payload
         session.writer.write(msg)
         await session.writer.drain()
@@ -550,12 +560,18 @@ class AsyncMetadataExchange:
                 break  # pragma: no cover - Same context
 
     async def _request_metadata_pieces(self, session: PeerMetadataSession) -> None:
-        """Request metadata pieces from a peer."""
+        """Request metadata pieces from a peer.
+
+        Fills the peer's request pipeline and then services responses until
+        metadata is complete or the peer stops being useful. Pieces are spread
+        across every session that advertises ut_metadata, so a single slow peer
+        never serializes the whole fetch.
+        """
         if not session.ut_metadata_id or not session.metadata_size:
             return
 
         # Calculate number of pieces
-        session.num_pieces = math.ceil(session.metadata_size / 16384)
+        session.num_pieces = math.ceil(session.metadata_size / METADATA_PIECE_SIZE)
 
         # Initialize metadata pieces if not done
         if not self.metadata_pieces:
@@ -563,33 +579,78 @@ class AsyncMetadataExchange:
             self.num_pieces = session.num_pieces
             for i in range(self.num_pieces):
                 self.metadata_pieces[i] = MetadataPiece(i)
+        elif session.metadata_size != self.metadata_size:
+            self.logger.debug(
+                "METADATA_EXCHANGE: Peer %s:%d advertises metadata_size=%d, expected %s",
+                session.peer_info[0],
+                session.peer_info[1],
+                session.metadata_size,
+                self.metadata_size,
+            )
+            return
 
-        # Request all pieces from this peer
         self.logger.info(
-            "METADATA_EXCHANGE: Requesting %d metadata piece(s) from %s:%d",
-            session.num_pieces,
+            "METADATA_EXCHANGE: Pipelining up to %d metadata request(s) to %s:%d (%d piece(s) total)",
+            METADATA_PIPELINE_DEPTH,
             session.peer_info[0],
             session.peer_info[1],
+            session.num_pieces,
         )
-        for piece_idx in range(session.num_pieces):
-            if piece_idx not in session.pieces_requested:
-                self.logger.debug(
-                    "METADATA_EXCHANGE: Requesting metadata piece %d/%d from %s:%d",
-                    piece_idx + 1,
-                    session.num_pieces,
-                    session.peer_info[0],
-                    session.peer_info[1],
-                )
-                await self._request_metadata_piece(session, piece_idx)
-                session.pieces_requested.add(piece_idx)
-                await asyncio.sleep(0.1)  # Small delay between requests
+        await self._fill_pipeline(session)
+
+        if session.reader is not None:
+            await self._receive_metadata_pieces(session)
+
+    def _select_piece_for(self, session: PeerMetadataSession) -> int | None:
+        """Pick the next metadata piece to request from ``session``.
+
+        Unrequested pieces are handed out lowest index first, which keeps the
+        incremental info-hash advancing. Once every piece is in flight, pieces
+        that have been outstanding elsewhere for longer than the straggler
+        timeout are duplicated to this peer.
+        """
+        now = time.time()
+        straggler: int | None = None
+        straggler_age = 0.0
+        for idx, piece in self.metadata_pieces.items():
+            if piece.data is not None or idx in session.pieces_failed:
+                continue
+            if idx in session.pieces_in_flight:
+                continue
+            owners = self._inflight.get(idx)
+            if not owners:
+                return idx
+            age = now - min(owners.values())
+            if age >= METADATA_STRAGGLER_TIMEOUT and age > straggler_age:
+                straggler = idx
+                straggler_age = age
+        return straggler
+
+    async def _fill_pipeline(self, session: PeerMetadataSession) -> None:
+        """Top up ``session`` with outstanding requests up to the pipeline depth."""
+        attempted: set[int] = set()
+        while (
+            not self.completed
+            and len(session.pieces_in_flight) < METADATA_PIPELINE_DEPTH
+        ):
+            piece_idx = self._select_piece_for(session)
+            if piece_idx is None or piece_idx in attempted:
+                return
+            attempted.add(piece_idx)
+            if not await self._request_metadata_piece(session, piece_idx):
+                return
 
     async def _request_metadata_piece(
         self,
         session: PeerMetadataSession,
         piece_idx: int,
-    ) -> None:
-        """Request a specific metadata piece."""
+    ) -> bool:
+        """Send a request for a specific metadata piece without waiting for it.
+
+        Returns:
+            True if the request was written to the peer
+
+        """
         try:
             if session.writer is None:
                 msg = _ERROR_WRITER_NOT_INITIALIZED
@@ -603,10 +664,6 @@ class AsyncMetadataExchange:
 
             session.writer.write(req_msg)
             await session.writer.drain()
-
-            # Wait for response
-            await self._wait_for_piece_response(session, piece_idx)
-
         except Exception as e:
             self.logger.debug(
                 "Failed to request piece %s from %s: %s",
@@ -615,95 +672,142 @@ class AsyncMetadataExchange:
                 e,
             )
             session.pieces_failed.add(piece_idx)
+            return False
 
-    async def _wait_for_piece_response(
+        requested_at = time.time()
+        session.pieces_requested.add(piece_idx)
+        session.pieces_in_flight[piece_idx] = requested_at
+        self._inflight.setdefault(piece_idx, {})[session.peer_info] = requested_at
+        return True
+
+    def _clear_inflight(self, session: PeerMetadataSession, piece_idx: int) -> None:
+        """Forget an outstanding request of ``piece_idx`` to ``session``."""
+        session.pieces_in_flight.pop(piece_idx, None)
+        owners = self._inflight.get(piece_idx)
+        if owners is not None:
+            owners.pop(session.peer_info, None)
+            if not owners:
+                del self._inflight[piece_idx]
+
+    async def _read_message(
         self,
         session: PeerMetadataSession,
-        piece_idx: int,
-    ) -> None:
-        """Wait for a metadata piece response."""
-        timeout = 10.0
-        start_time = time.time()
+        header_timeout: float,
+    ) -> bytes | None:
+        """Read one length-prefixed peer message.
 
-        while time.time() - start_time < timeout:
-            try:
-                if session.reader is None:
-                    msg = _ERROR_READER_NOT_INITIALIZED
-                    raise RuntimeError(msg)
-                length_data = await asyncio.wait_for(
-                    session.reader.readexactly(4),
-                    timeout=1.0,
-                )
-                length = struct.unpack("!I", length_data)[0]
+        Only the wait for the length prefix is bounded by ``header_timeout``.
+        ``readexactly`` consumes nothing until all four bytes are buffered, so
+        timing out there leaves the stream intact; the body is read without a
+        timeout because cancelling it would desynchronize the stream. A peer
+        that stalls mid-message is bounded by the overall fetch timeout.
 
-                if (
-                    length == 0
-                ):  # pragma: no cover - Keep-alive message handling in piece response loop, requires full protocol simulation
-                    continue  # pragma: no cover
+        Returns:
+            Message payload, or None for a keep-alive
 
-                payload = await asyncio.wait_for(
-                    session.reader.readexactly(length),
-                    timeout=1.0,
-                )  # pragma: no cover - Complex piece response parsing requires full protocol implementation
-                msg_id = payload[0] if payload else 0  # pragma: no cover - Same context
-
-                if msg_id == 20:  # Extended message  # pragma: no cover - Same context
-                    ext_id = (
-                        payload[1] if len(payload) > 1 else 0
-                    )  # pragma: no cover - Same context
-                    if (
-                        ext_id == session.ut_metadata_id
-                    ):  # pragma: no cover - Same context
-                        # Parse metadata piece response
-                        decoder = BencodeDecoder(
-                            payload[2:]
-                        )  # pragma: no cover - Same context
-                        header = decoder.decode()  # pragma: no cover - Same context
-
-                        msg_type = header.get(
-                            b"msg_type"
-                        )  # pragma: no cover - Same context
-                        piece_index = header.get(
-                            b"piece"
-                        )  # pragma: no cover - Same context
-
-                        if (
-                            msg_type == 1 and piece_index == piece_idx
-                        ):  # Data response  # pragma: no cover - Same context
-                            header_len = decoder.pos  # pragma: no cover - Same context
-                            piece_data = payload[
-                                2 + header_len :
-                            ]  # pragma: no cover - Same context
-
-                            await self._handle_metadata_piece(
-                                session,
-                                piece_idx,
-                                piece_data,
-                            )  # pragma: no cover - Same context
-                            return  # pragma: no cover - Same context
-                        if msg_type == 2:  # Reject  # pragma: no cover - Same context
-                            self.logger.debug(
-                                "Peer %s rejected piece %s",
-                                session.peer_info,
-                                piece_idx,
-                            )  # pragma: no cover - Same context
-                            session.pieces_failed.add(
-                                piece_idx
-                            )  # pragma: no cover - Same context
-                            return  # pragma: no cover - Same context
+        Raises:
+            asyncio.TimeoutError: If no message starts within ``header_timeout``
+
+        """
+        if session.reader is None:
+            msg = _ERROR_READER_NOT_INITIALIZED
+            raise RuntimeError(msg)
+        length_data = await asyncio.wait_for(
+            session.reader.readexactly(4),
+            timeout=header_timeout,
+        )
+        length = struct.unpack("!I", length_data)[0]
+        if length == 0:
+            return None
+        return await session.reader.readexactly(length)
+
+    async def _receive_metadata_pieces(self, session: PeerMetadataSession) -> None:
+        """Service ut_metadata responses from ``session`` until done.
 
+        Each response immediately frees a pipeline slot that is refilled, so
+        faster peers naturally end up serving more pieces.
+        """
+        idle_deadline = time.time() + METADATA_PEER_IDLE_TIMEOUT
+        while not self.completed:
+            try:
+                payload = await self._read_message(
+                    session, METADATA_STRAGGLER_TIMEOUT
+                )
             except asyncio.TimeoutError:
-                continue  # pragma: no cover - Timeout handling in piece response loop
-            except (
-                Exception
-            ) as e:  # pragma: no cover - Exception handling in piece response loop
+                if time.time() >= idle_deadline:
+                    self.logger.debug(
+                        "METADATA_EXCHANGE: Peer %s:%d idle, giving up",
+                        session.peer_info[0],
+                        session.peer_info[1],
+                    )
+                    break
+                # Nothing arrived: pick up stragglers stuck on other peers
+                await self._fill_pipeline(session)
+                continue
+            except (asyncio.IncompleteReadError, ConnectionError, OSError) as e:
                 self.logger.debug(
-                    "Error waiting for piece %s: %s", piece_idx, e
-                )  # pragma: no cover - Same context
-                break  # pragma: no cover - Same context
+                    "METADATA_EXCHANGE: Connection to %s:%d lost: %s",
+                    session.peer_info[0],
+                    session.peer_info[1],
+                    e,
+                )
+                break
 
-        # Timeout
-        session.pieces_failed.add(piece_idx)
+            session.last_activity = time.time()
+            if not payload or payload[0] != 20 or len(payload) < 2:
+                continue
+            if payload[1] != METADATA_LOCAL_EXT_ID:
+                continue
+
+            idle_deadline = time.time() + METADATA_PEER_IDLE_TIMEOUT
+            try:
+                await self._handle_metadata_message(session, payload[2:])
+            except BencodeDecodeError as e:
+                self.logger.debug(
+                    "METADATA_EXCHANGE: Malformed ut_metadata message from %s:%d: %s",
+                    session.peer_info[0],
+                    session.peer_info[1],
+                    e,
+                )
+                session.consecutive_failures += 1
+                if session.consecutive_failures >= session.max_retries:
+                    break
+                continue
+            await self._fill_pipeline(session)
+
+        for piece_idx in list(session.pieces_in_flight):
+            self._clear_inflight(session, piece_idx)
+
+    async def _handle_metadata_message(
+        self,
+        session: PeerMetadataSession,
+        body: bytes,
+    ) -> None:
+        """Handle the bencoded body of a ut_metadata message."""
+        decoder = BencodeDecoder(body)
+        header = decoder.decode()
+        if not isinstance(header, dict):
+            return
+        msg_type = header.get(b"msg_type")
+        piece_idx = header.get(b"piece")
+        if not isinstance(piece_idx, int) or piece_idx not in self.metadata_pieces:
+            return
+
+        self._clear_inflight(session, piece_idx)
+        if msg_type == 1:  # Data
+            await self._handle_metadata_piece(session, piece_idx, body[decoder.pos :])
+        elif msg_type == 2:  # Reject
+            self.logger.debug("Peer %s rejected piece %s", session.peer_info, piece_idx)
+            session.pieces_failed.add(piece_idx)
+            session.consecutive_failures += 1
+
+    def _expected_piece_length(self, piece_idx: int) -> int | None:
+        """Return the exact length piece ``piece_idx`` must have, if known."""
+        if not self.metadata_size or not self.num_pieces:
+            return None
+        if piece_idx == self.num_pieces - 1:
+            return self.metadata_size - METADATA_PIECE_SIZE * (self.num_pieces - 1)
+        return METADATA_PIECE_SIZE
 
     async def _handle_metadata_piece(
         self,
@@ -712,7 +816,20 @@ class AsyncMetadataExchange:
         piece_data: bytes,
     ) -> None:
         """Handle a received metadata piece."""
-        self.logger.info(
+        expected_length = self._expected_piece_length(piece_idx)
+        if expected_length is not None and len(piece_data) != expected_length:
+            self.logger.debug(
+                "METADATA_EXCHANGE: Dropping piece %d from %s:%d with bad length %d (expected %d)",
+                piece_idx,
+                session.peer_info[0],
+                session.peer_info[1],
+                len(piece_data),
+                expected_length,
+            )
+            session.pieces_failed.add(piece_idx)
+            return
+
+        self.logger.debug(
             "METADATA_EXCHANGE: Received metadata piece %d/%d from %s:%d (%d bytes)",
             piece_idx + 1,
             session.num_pieces,
@@ -722,31 +839,60 @@ class AsyncMetadataExchange:
         )
         # Store piece data
         session.pieces_received[piece_idx] = piece_data
+        session.consecutive_failures = 0
+
+        # Update global piece tracking; duplicates from straggler re-requests
+        # only count towards the source bookkeeping.
+        piece = self.metadata_pieces.get(piece_idx)
+        if piece is not None:
+            piece.received_count += 1
+            piece.sources.add(session.peer_info)
+            if piece.data is None:
+                piece.data = piece_data
+                self._received_pieces += 1
+                self._advance_hash()
 
-        # Update global piece tracking
-        if piece_idx in self.metadata_pieces:
-            self.metadata_pieces[piece_idx].data = piece_data
-            self.metadata_pieces[piece_idx].received_count += 1
-            self.metadata_pieces[piece_idx].sources.add(session.peer_info)
-
-        # Check progress
-        received_count = sum(
-            1 for p in self.metadata_pieces.values() if p.data is not None
-        )
         self.logger.debug(
             "METADATA_EXCHANGE: Progress: %d/%d pieces received",
-            received_count,
+            self._received_pieces,
             len(self.metadata_pieces),
         )
 
+        if self.on_progress:
+            self.on_progress(self.get_progress())
+
         # Check if we have all pieces
-        if self._is_metadata_complete():
+        if not self.completed and self._is_metadata_complete():
             self.logger.info(
                 "METADATA_EXCHANGE: All %d metadata pieces received, assembling metadata",
                 len(self.metadata_pieces),
             )
             await self._assemble_metadata()
 
+    def _advance_hash(self) -> None:
+        """Feed the contiguous run of received pieces into the running SHA-1.
+
+        Pieces are hashed as soon as the prefix before them is complete, so
+        by the time the last piece lands only its own bytes remain to hash.
+        """
+        while self._hashed_pieces < len(self.metadata_pieces):
+            piece = self.metadata_pieces.get(self._hashed_pieces)
+            if piece is None or piece.data is None:
+                return
+            self._hasher.update(piece.data)
+            self._hashed_pieces += 1
+
+    def _reset_pieces(self) -> None:
+        """Discard all received pieces so they are fetched again."""
+        for piece in self.metadata_pieces.values():
+            piece.data = None
+        for session in self.sessions.values():
+            session.pieces_received.clear()
+            session.pieces_failed.clear()
+        self._received_pieces = 0
+        self._hasher = hashlib.sha1()  # nosec B324 - SHA-1 required by BitTorrent protocol (BEP 3)
+        self._hashed_pieces = 0
+
     def _is_metadata_complete(self) -> bool:
         """Check if all metadata pieces have been received."""
         if not self.metadata_pieces:
@@ -755,34 +901,44 @@ class AsyncMetadataExchange:
         return all(piece.data is not None for piece in self.metadata_pieces.values())
 
     async def _assemble_metadata(self) -> None:
-        """Assemble complete metadata from pieces."""
+        """Assemble complete metadata from pieces and validate it against the info-hash."""
         try:
             # Sort pieces by index and concatenate
             sorted_pieces = sorted(self.metadata_pieces.items())
             metadata_data = b"".join(piece.data for _, piece in sorted_pieces)
 
+            # BEP 9: the info-hash is the SHA-1 of the raw metadata bytes. Reuse
+            # the running digest when every piece has already been fed to it.
+            if self._hashed_pieces == len(sorted_pieces):
+                calculated_hash = self._hasher.digest()
+            else:
+                calculated_hash = hashlib.sha1(metadata_data).digest()  # nosec B324 - SHA-1 required by BitTorrent protocol (BEP 3)
+            if calculated_hash != self.info_hash:
+                self.logger.warning(
+                    "Metadata hash validation failed, discarding %d piece(s)",
+                    len(sorted_pieces),
+                )
+                self._reset_pieces()
+                if self.on_error:
+                    self.on_error(ValueError("Metadata info_hash mismatch"))
+                return
+
             # Decode metadata
             decoder = BencodeDecoder(metadata_data)
             metadata_dict = decoder.decode()
 
-            # Validate hash
-            encoded_metadata = BencodeEncoder().encode(metadata_dict)
-            calculated_hash = hashlib.sha1(encoded_metadata).digest()  # nosec B324 - SHA-1 required by BitTorrent protocol (BEP 3)
-            if calculated_hash == self.info_hash:
-                self.metadata_data = metadata_data
-                self.metadata_dict = metadata_dict
-                self.completed = True
-
-                self.logger.info(
-                    "METADATA_EXCHANGE: Successfully assembled metadata (size=%d bytes, info_hash=%s)",
-                    len(metadata_data),
-                    calculated_hash.hex()[:16] + "...",
-                )
+            self.metadata_data = metadata_data
+            self.metadata_dict = metadata_dict
+            self.completed = True
 
-                if self.on_complete:
-                    self.on_complete(metadata_dict)
-            else:
-                self.logger.warning("Metadata hash validation failed")
+            self.logger.info(
+                "METADATA_EXCHANGE: Successfully assembled metadata (size=%d bytes, info_hash=%s)",
+                len(metadata_data),
+                calculated_hash.hex()[:16] + "...",
+            )
+
+            if self.on_complete:
+                self.on_complete(metadata_dict)
 
         except Exception as e:
             self.logger.exception("Failed to assemble metadata")
@@ -792,7 +948,7 @@ class AsyncMetadataExchange:
     async def _wait_for_completion(self) -> None:
         """Wait for metadata fetch to complete."""
         while not self.completed:
-            await asyncio.sleep(0.1)
+            await self._get_completion_event().wait()
 
     async def _cleanup_loop(self) -> None:
         """Background task to clean up failed sessions."""
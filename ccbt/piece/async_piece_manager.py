@@ -10,6 +10,7 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
+import hashlib
 import logging
 import time
 from collections import Counter, defaultdict
@@ -26,7 +27,16 @@ from ccbt.models import (
     TorrentCheckpoint,
 )
 from ccbt.models import PieceState as PieceStateModel
-from ccbt.piece.hash_v2 import HashAlgorithm, verify_piece
+from ccbt.monitoring import get_tracing_manager
+from ccbt.monitoring.tracing import SpanKind, TraceContext
+from ccbt.piece.hash_v2 import (
+    HashAlgorithm,
+    hash_blocks_v2,
+    piece_root_v2,
+    verify_piece,
+)
+from ccbt.piece.merkle import BLOCK_SIZE
+from ccbt.storage.resume_verifier import stat_file
 
 if (
     TYPE_CHECKING
@@ -56,6 +66,10 @@ class PieceBlock:
     requested_from: set[str] = field(
         default_factory=set,
     )  # Peer keys that have this block
+    peer_key: str | None = None  # Peer the received data came from
+    leaf_hashes: list[bytes] = field(
+        default_factory=list,
+    )  # SHA-256 of each 16 KiB v2 block in data (hashed on arrival)
 
     def is_complete(self) -> bool:
         """Check if block is complete."""
@@ -86,6 +100,9 @@ class PieceData:
     hash_verified: bool = False
     priority: int = 0  # Higher priority = download first
     request_count: int = 0  # How many times we've requested this piece
+    # Running SHA-1 over the blocks received in order (hybrid torrents)
+    sha1: Any = field(default=None, repr=False, compare=False)
+    sha1_blocks: int = 0  # Blocks fed into sha1
 
     def __post_init__(self):
         """Initialize blocks after creation."""
@@ -111,15 +128,31 @@ class PieceData:
                 actual_length = min(block_size, self.length - begin)
                 self.blocks.append(PieceBlock(self.piece_index, begin, actual_length))
 
-    def add_block(self, begin: int, data: bytes) -> bool:
-        """Add a block of data to this piece."""
-        for block in self.blocks:
+    def add_block(self, begin: int, data: bytes, peer_key: str | None = None) -> bool:
+        """Add a block of data to this piece.
+
+        Data for a coalesced request spans several consecutive blocks and is
+        split across them; it must end on a block boundary.
+        """
+        for i, block in enumerate(self.blocks):
             if block.begin == begin and not block.received:
-                if len(data) != block.length:
+                covered = []
+                end = begin
+                for candidate in self.blocks[i:]:
+                    if end >= begin + len(data):
+                        break
+                    covered.append(candidate)
+                    end += candidate.length
+                if end != begin + len(data):
                     return False
 
-                block.data = data
-                block.received = True
+                for candidate in covered:
+                    if candidate.received:
+                        continue
+                    offset = candidate.begin - begin
+                    candidate.data = data[offset : offset + candidate.length]
+                    candidate.received = True
+                    candidate.peer_key = peer_key
 
                 # Check if piece is now complete
                 if all(b.received for b in self.blocks):
@@ -177,6 +210,57 @@ class PieceData:
         """Get list of missing blocks."""
         return [block for block in self.blocks if not block.received]
 
+    def get_block(self, begin: int) -> PieceBlock | None:
+        """Get the block starting at ``begin``."""
+        for block in self.blocks:
+            if block.begin == begin:
+                return block
+        return None
+
+    def reset_block(self, block: PieceBlock) -> None:
+        """Drop a block's data so it is downloaded again."""
+        block.data = b""
+        block.received = False
+        block.peer_key = None
+        block.leaf_hashes = []
+        if self.sha1_blocks > self.blocks.index(block):
+            self.sha1 = None
+            self.sha1_blocks = 0
+        if self.state == PieceState.COMPLETE:
+            self.state = PieceState.DOWNLOADING
+
+    def reset(self) -> None:
+        """Drop all block data so the piece is downloaded again."""
+        for block in self.blocks:
+            block.data = b""
+            block.received = False
+            block.peer_key = None
+            block.leaf_hashes = []
+        self.sha1 = None
+        self.sha1_blocks = 0
+        self.hash_verified = False
+        self.state = PieceState.MISSING
+
+    def update_sha1(self) -> None:
+        """Feed blocks received in order since the last call into the SHA-1."""
+        if self.sha1 is None:
+            self.sha1 = hashlib.sha1()  # nosec B324 - SHA-1 required for v1 pieces
+            self.sha1_blocks = 0
+        while (
+            self.sha1_blocks < len(self.blocks)
+            and self.blocks[self.sha1_blocks].received
+        ):
+            self.sha1.update(self.blocks[self.sha1_blocks].data)
+            self.sha1_blocks += 1
+
+    def v2_leaf_hashes(self) -> list[bytes]:
+        """Get the 16 KiB block hashes of the piece, hashing only what is missing."""
+        if all(block.leaf_hashes for block in self.blocks):
+            leaves = [leaf for block in self.blocks for leaf in block.leaf_hashes]
+            if len(leaves) == -(-self.length // BLOCK_SIZE):
+                return leaves
+        return hash_blocks_v2(self.get_data())
+
     def verify_hash(self, expected_hash: bytes) -> bool:
         """Verify piece hash.
 
@@ -301,6 +385,7 @@ class AsyncPieceManager:
         # Check if torrent has v2 piece layers (for hybrid torrents)
         self.piece_layers = torrent_data.get("piece_layers")
         self.meta_version = torrent_data.get("meta_version", 1)  # 1=v1, 2=v2, 3=hybrid
+        self.bad_blocks: Counter = Counter()  # peer_key -> blocks that failed a hash
 
         # File selection manager (optional)
         self.file_selection_manager = file_selection_manager
@@ -419,6 +504,12 @@ class AsyncPieceManager:
         self._hash_worker_task: asyncio.Task | None = None
         self._piece_selector_task: asyncio.Task | None = None
         self._background_tasks: set[asyncio.Task] = set()
+        # Downloading pieces with blocks that did not fit any peer's pipeline
+        self._unrequested_pieces: set[int] = set()
+        # Whether a task requesting those blocks is scheduled or running
+        self._refill_pending = False
+        # Outstanding (piece index, block offset) requests by peer key
+        self._peer_requests: defaultdict[str, set[tuple[int, int]]] = defaultdict(set)
 
         self.logger = logging.getLogger(__name__)
 
@@ -683,6 +774,36 @@ class AsyncPieceManager:
             if not old_has_piece:
                 self.piece_frequency[piece_index] += 1
 
+    async def handle_peer_disconnected(self, peer_key: str) -> None:
+        """Forget a disconnected peer and re-request the blocks it still owed.
+
+        Args:
+            peer_key: Peer identifier (``ip:port``)
+
+        """
+        async with self.lock:
+            availability = self.peer_availability.pop(peer_key, None)
+            if availability is not None:
+                for piece_index in availability.pieces:
+                    self.piece_frequency[piece_index] -= 1
+                    if self.piece_frequency[piece_index] <= 0:
+                        del self.piece_frequency[piece_index]
+
+            for piece_index, begin in self._peer_requests.pop(peer_key, ()):
+                if piece_index >= len(self.pieces):
+                    continue
+                block = self.pieces[piece_index].get_block(begin)
+                if block is not None and not block.received:
+                    block.requested_from.discard(peer_key)
+                    self._unrequested_pieces.add(piece_index)
+
+            refill = bool(self._unrequested_pieces) and not self._refill_pending
+            if refill:
+                self._refill_pending = True
+
+        if refill:
+            await self._request_unrequested_blocks()
+
     async def request_piece_from_peers(
         self,
         piece_index: int,
@@ -695,6 +816,19 @@ class AsyncPieceManager:
             peer_manager: Peer connection manager
 
         """
+        with TraceContext(
+            get_tracing_manager(),
+            "piece.request",
+            SpanKind.CLIENT,
+            {"piece_index": piece_index},
+        ):
+            await self._request_piece_from_peers(piece_index, peer_manager)
+
+    async def _request_piece_from_peers(
+        self,
+        piece_index: int,
+        peer_manager: Any,
+    ) -> None:
         # CRITICAL FIX: Ensure pieces are initialized before requesting
         # This handles the case where get_missing_pieces() returns indices but pieces list is empty
         if self.num_pieces > 0 and len(self.pieces) == 0:
@@ -923,7 +1057,7 @@ class AsyncPieceManager:
                         >= connection.max_pipeline_depth
                     ):
                         reasons.append("pipeline full")
-                self.logger.warning(
+                self.logger.debug(
                     "Peer %s not available for piece %d: %s",
                     peer_key,
                     piece_index,
@@ -971,7 +1105,7 @@ class AsyncPieceManager:
                         block.begin,
                         block.length,
                     )
-                    block.requested_from.add(str(peer_connection.peer_info))
+                    self._mark_requested(block, str(peer_connection.peer_info))
 
     async def _request_blocks_endgame(
         self,
@@ -997,22 +1131,39 @@ class AsyncPieceManager:
                         block.begin,
                         block.length,
                     )
-                    block.requested_from.add(str(peer_connection.peer_info))
+                    self._mark_requested(block, str(peer_connection.peer_info))
+
+    def _mark_requested(self, block: PieceBlock, peer_key: str) -> None:
+        """Record that a block was requested from a peer."""
+        block.requested_from.add(peer_key)
+        self._peer_requests[peer_key].add((block.piece_index, block.begin))
 
     async def handle_piece_block(
         self,
         piece_index: int,
         begin: int,
         data: bytes,
+        peer_key: str | None = None,
     ) -> None:
         """Handle a received piece block.
 
+        For v2 and hybrid torrents the block's 16 KiB leaves are hashed here,
+        so piece verification only has to combine them.
+
         Args:
             piece_index: Index of the piece
             begin: Starting offset of the block
             data: Block data
+            peer_key: Peer that sent the block
 
         """
+        # Hash outside the lock; only blocks starting on a leaf boundary
+        leaves = (
+            hash_blocks_v2(data)
+            if self.meta_version in (2, 3) and data and begin % BLOCK_SIZE == 0
+            else None
+        )
+
         async with self.lock:
             if (
                 piece_index >= len(self.pieces)
@@ -1022,7 +1173,22 @@ class AsyncPieceManager:
             piece = self.pieces[piece_index]
 
             # Add block to piece
-            if piece.add_block(begin, data):
+            if piece.add_block(begin, data, peer_key):
+                for block in piece.blocks:
+                    if begin <= block.begin < begin + len(data):
+                        for key in block.requested_from:
+                            self._peer_requests[key].discard((piece_index, block.begin))
+                if leaves is not None and (
+                    len(data) % BLOCK_SIZE == 0 or begin + len(data) == piece.length
+                ):
+                    for block in piece.blocks:
+                        offset = block.begin - begin
+                        if 0 <= offset < len(data):
+                            first = offset // BLOCK_SIZE
+                            last = -(-(offset + block.length) // BLOCK_SIZE)
+                            block.leaf_hashes = leaves[first:last]
+                if self.meta_version == 3:
+                    piece.update_sha1()
                 if piece.state == PieceState.COMPLETE:
                     self.completed_pieces.add(piece_index)
                     self.logger.info(
@@ -1042,6 +1208,12 @@ class AsyncPieceManager:
                         if hasattr(piece.state, "value")
                         else str(piece.state),
                     )
+                    # A slot in the sender's pipeline is free again
+                    if piece.state == PieceState.DOWNLOADING and any(
+                        not b.received and not b.requested_from for b in piece.blocks
+                    ):
+                        self._unrequested_pieces.add(piece_index)
+                    self._schedule_refill()
 
                 # Update file progress if file selection manager exists
                 if self.file_selection_manager:
@@ -1069,8 +1241,8 @@ class AsyncPieceManager:
                                 current_bytes + bytes_for_file,
                             )
 
-                # Notify callback
-                if self.on_piece_completed:
+                # Notify callback once the last block has arrived
+                if piece.state == PieceState.COMPLETE and self.on_piece_completed:
                     self.on_piece_completed(piece_index)
 
                     # Schedule hash verification and keep a strong reference
@@ -1080,6 +1252,69 @@ class AsyncPieceManager:
                     self._background_tasks.add(_task)
                     _task.add_done_callback(self._background_tasks.discard)
 
+    def _penalize_peer(self, peer_key: str, factor: float = 0.5) -> None:
+        """Count a bad block against a peer and lower its reliability."""
+        self.bad_blocks[peer_key] += 1
+        availability = self.peer_availability.get(peer_key)
+        if availability is not None:
+            availability.reliability_score *= factor
+
+    def _schedule_refill(self) -> None:
+        """Start requesting unrequested blocks unless a refill is pending.
+
+        Must be called with the lock held.
+        """
+        if (
+            self._refill_pending
+            or not self._unrequested_pieces
+            or self._peer_manager is None
+        ):
+            return
+        self._refill_pending = True
+        _task = asyncio.create_task(self._request_unrequested_blocks())
+        self._background_tasks.add(_task)
+        _task.add_done_callback(self._background_tasks.discard)
+
+    async def _request_unrequested_blocks(self) -> None:
+        """Request the blocks of downloading pieces that did not fit the pipeline.
+
+        Callers set ``_refill_pending`` first; it is cleared once every
+        pending piece has been tried. Pieces that still have unrequested
+        blocks afterwards are retried when the next block arrives from any
+        peer, since no outstanding request is left to trigger them otherwise.
+        """
+        try:
+            peer_manager = self._peer_manager
+            if peer_manager is None:
+                return
+            tried: set[int] = set()
+            while pending := sorted(self._unrequested_pieces - tried):
+                for index in pending:
+                    tried.add(index)
+                    self._unrequested_pieces.discard(index)
+                    piece = self.pieces[index]
+                    if piece.state != PieceState.DOWNLOADING:
+                        continue
+                    blocks = [
+                        b for b in piece.get_missing_blocks() if not b.requested_from
+                    ]
+                    if not blocks:
+                        continue
+                    try:
+                        peers = await self._get_peers_for_piece(index, peer_manager)
+                        if peers:
+                            await self._request_blocks_normal(
+                                index, blocks, peers, peer_manager
+                            )
+                    except Exception as e:
+                        self.logger.debug(
+                            "Could not request blocks for piece %d: %s", index, e
+                        )
+                    if any(not b.requested_from for b in piece.get_missing_blocks()):
+                        self._unrequested_pieces.add(index)
+        finally:
+            self._refill_pending = False
+
     async def _hash_worker(
         self,
     ) -> (
@@ -1126,13 +1361,14 @@ class AsyncPieceManager:
                     )
                     return
 
-                # Use optimized hash verification with memoryview (SHA-256)
+                # Combine the block hashes taken as blocks arrived
                 loop = asyncio.get_event_loop()
                 is_valid = await loop.run_in_executor(
                     self.hash_executor,
-                    self._hash_piece_optimized,
+                    self._hash_piece_v2,
                     piece,
                     expected_hash,
+                    self._v2_pad_length(piece_index),
                 )
             # For hybrid torrents (meta_version == 3), verify both SHA-1 and SHA-256
             elif (
@@ -1222,6 +1458,14 @@ class AsyncPieceManager:
                     )
                     if self.on_download_complete:  # pragma: no cover - Completion callback, tested via download_complete test
                         self.on_download_complete()
+                elif self.is_downloading and self._peer_manager is not None:
+                    # Pick the next pieces now rather than on the selector tick
+                    _task = asyncio.create_task(self._select_pieces())
+                    self._background_tasks.add(_task)
+                    _task.add_done_callback(self._background_tasks.discard)
+            elif self.meta_version in (2, 3):
+                async with self.lock:
+                    self._reject_v2_piece(piece)
             else:
                 self.logger.warning(
                     "PIECE_MANAGER: Hash verification failed for piece %d (state remains %s)",
@@ -1435,11 +1679,12 @@ class AsyncPieceManager:
 
         """
         try:
-            # Verify SHA-1 hash first (v1)
+            # Verify SHA-1 hash first (v1). Blocks that arrived in order were
+            # already fed into the running hash; this finishes the rest
             loop = asyncio.get_event_loop()
             v1_valid = await loop.run_in_executor(
                 self.hash_executor,
-                self._hash_piece_optimized,
+                self._finish_sha1,
                 piece,
                 expected_hash_v1,
             )
@@ -1468,12 +1713,13 @@ class AsyncPieceManager:
                 )
                 return False
 
-            # Verify SHA-256 hash (v2)
+            # Verify SHA-256 hash (v2) from the block hashes
             v2_valid = await loop.run_in_executor(
                 self.hash_executor,
-                self._hash_piece_optimized,
+                self._hash_piece_v2,
                 piece,
                 expected_hash_v2,
+                self._v2_pad_length(piece_index),
             )
 
             if (
@@ -1498,17 +1744,16 @@ class AsyncPieceManager:
             self.logger.exception("Error in hybrid piece verification")
             return False
 
-    def _get_v2_piece_hash(self, piece_index: int) -> bytes | None:
-        """Get SHA-256 hash for a piece from v2 piece layers.
+    def _find_v2_piece(self, piece_index: int) -> tuple[list[bytes], int] | None:
+        """Find the piece layer holding a piece.
 
         For hybrid torrents, piece layers are organized by file (pieces_root).
-        This method finds which file the piece belongs to and returns its v2 hash.
 
         Args:
             piece_index: Global piece index
 
         Returns:
-            32-byte SHA-256 hash or None if not found
+            Tuple of (file piece layer hashes, file-local piece index) or None
 
         """
         if (
@@ -1534,13 +1779,90 @@ class AsyncPieceManager:
                 if (
                     0 <= file_local_index < len(piece_list)
                 ):  # pragma: no cover - Valid local index path, tested via invalid index
-                    return piece_list[file_local_index]
+                    return piece_list, file_local_index
             current_offset += file_num_pieces
 
         return (
             None  # pragma: no cover - Piece not found fallback, tested via piece found
         )
 
+    def _get_v2_piece_hash(self, piece_index: int) -> bytes | None:
+        """Get SHA-256 hash for a piece from v2 piece layers.
+
+        This method finds which file the piece belongs to and returns its v2 hash.
+
+        Args:
+            piece_index: Global piece index
+
+        Returns:
+            32-byte SHA-256 hash or None if not found
+
+        """
+        found = self._find_v2_piece(piece_index)
+        if found is None:
+            return None
+        piece_list, file_local_index = found
+        return piece_list[file_local_index]
+
+    def _v2_pad_length(self, piece_index: int) -> int | None:
+        """Get the length a piece's v2 hash is padded to.
+
+        Returns:
+            The piece length, or None if the piece is a whole file (its hash
+            is then the file's unpadded pieces_root)
+
+        """
+        found = self._find_v2_piece(piece_index)
+        if found is not None and len(found[0]) == 1:
+            return None
+        if self.piece_length <= 0 or self.piece_length & (self.piece_length - 1):
+            return None
+        return self.piece_length
+
+    def _hash_piece_v2(
+        self,
+        piece: PieceData,
+        expected_hash: bytes,
+        pad_length: int | None,
+    ) -> bool:
+        """Verify a piece against its v2 hash from its 16 KiB block hashes.
+
+        Block hashes taken when the blocks arrived are reused, so only the
+        interior Merkle nodes are hashed here.
+        """
+        try:
+            actual_hash = piece_root_v2(piece.v2_leaf_hashes(), pad_length)
+        except Exception:
+            self.logger.exception("Error in v2 piece hash verification")
+            return False
+        return actual_hash == expected_hash
+
+    def _finish_sha1(self, piece: PieceData, expected_hash: bytes) -> bool:
+        """Verify a piece against its SHA-1 hash using the running hash."""
+        try:
+            piece.update_sha1()
+            return piece.sha1.copy().digest() == expected_hash
+        except Exception:
+            self.logger.exception("Error in SHA-1 piece hash verification")
+            return False
+
+    def _reject_v2_piece(self, piece: PieceData) -> None:
+        """Drop a piece that failed verification and blame its senders.
+
+        Must be called with the lock held. A piece with a single sender
+        identifies the bad peer; otherwise every sender loses a little trust.
+        """
+        senders = {block.peer_key for block in piece.blocks if block.peer_key}
+        self.logger.warning(
+            "PIECE_MANAGER: Hash verification failed for piece %d (senders: %s), re-downloading",
+            piece.piece_index,
+            ", ".join(sorted(senders)) or "unknown",
+        )
+        for peer_key in senders:
+            self._penalize_peer(peer_key, 0.5 if len(senders) == 1 else 0.9)
+        piece.reset()
+        self.completed_pieces.discard(piece.piece_index)
+
     async def _batch_verify_pieces(
         self,
         pieces_to_verify: list[tuple[int, PieceData]],
@@ -2784,24 +3106,14 @@ class AsyncPieceManager:
         ):  # pragma: no cover - State check for verified piece, tested separately
             return None
 
-        # Find the block that contains this range
-        for block in (
-            piece.blocks
-        ):  # pragma: no cover - Block lookup loop, requires specific block arrangement
-            if (
-                block.begin <= begin < block.begin + block.length
-            ):  # pragma: no cover - Block range matching
-                offset = (
-                    begin - block.begin
-                )  # pragma: no cover - Offset calculation in block extraction
-                end_offset = min(
-                    offset + length, block.length
-                )  # pragma: no cover - Block extraction logic
-                return block.data[
-                    offset:end_offset
-                ]  # pragma: no cover - Block data extraction
-
-        return None  # pragma: no cover - No matching block found, edge case
+        # Coalesced requests span several blocks
+        end = begin + length
+        chunks = [
+            block.data[max(begin - block.begin, 0) : end - block.begin]
+            for block in piece.blocks
+            if block.begin < end and begin < block.begin + block.length
+        ]
+        return b"".join(chunks) if chunks else None
 
     def get_stats(self) -> dict[str, Any]:
         """Get piece manager statistics."""
@@ -2815,6 +3127,7 @@ class AsyncPieceManager:
             "endgame_mode": self.endgame_mode,
             "piece_frequency": dict(self.piece_frequency.most_common(10)),
             "peer_count": len(self.peer_availability),
+            "bad_blocks": sum(self.bad_blocks.values()),
         }
 
     async def get_checkpoint_state(
@@ -2885,11 +3198,15 @@ class AsyncPieceManager:
                     file_paths
                 ):  # pragma: no cover - File checkpoint creation, integration path
                     file_info = file_info_map.get(file_path)
+                    # Size and mtime let resume skip rehashing unchanged files
+                    st = stat_file(file_path)
                     files.append(
                         FileCheckpoint(
                             path=file_path,
                             size=file_sizes.get(file_path, 0),
                             exists=files_exist.get(file_path, False),
+                            disk_size=st.st_size if st else None,
+                            mtime_ns=st.st_mtime_ns if st else None,
                             # BEP 47: Include file attributes in checkpoint
                             attributes=(
                                 getattr(file_info, "attributes", None)
@@ -18,6 +18,14 @@ import logging
 from enum import Enum
 from typing import TYPE_CHECKING, Any, BinaryIO
 
+from ccbt.piece.merkle import (
+    BLOCK_SIZE,
+    ZERO_HASH,
+    MerkleTree,
+    piece_height,
+    piece_layer_pad,
+)
+
 if TYPE_CHECKING:  # pragma: no cover - type checking only, not executed at runtime
     from io import BytesIO
 
@@ -209,14 +217,91 @@ def verify_piece_v2_streaming(
     return matches
 
 
-def hash_piece_layer(piece_hashes: list[bytes]) -> bytes:
+def hash_blocks_v2(data: bytes | memoryview) -> list[bytes]:
+    """Calculate the SHA-256 leaf hashes of the 16 KiB blocks in ``data``.
+
+    The last block may be shorter; it is hashed as is, without padding.
+
+    Args:
+        data: Data starting on a block boundary
+
+    Returns:
+        List of 32-byte block hashes
+
+    """
+    view = memoryview(data)
+    return [
+        hashlib.sha256(view[i : i + BLOCK_SIZE]).digest()
+        for i in range(0, len(view), BLOCK_SIZE)
+    ]
+
+
+def piece_root_v2(
+    block_hashes: list[bytes],
+    piece_length: int | None = None,
+) -> bytes:
+    """Calculate a BEP 52 piece hash from its block hashes.
+
+    A piece hash is the root of the Merkle subtree over the piece's 16 KiB
+    blocks. Every piece of a multi-piece file spans a whole piece, so blocks
+    past the end of the file are zero hashes. A file that fits in one piece
+    is only padded to a power of two, so its root is the file's pieces_root.
+
+    Args:
+        block_hashes: SHA-256 hashes of the piece's blocks, in order
+        piece_length: Piece length in bytes to pad to, or None for a file
+            that fits in one piece
+
+    Returns:
+        32-byte piece hash
+
+    Raises:
+        ValueError: If block_hashes is empty or piece_length is invalid
+
+    """
+    height = None if piece_length is None else piece_height(piece_length)
+    return MerkleTree(block_hashes).root(height)
+
+
+def hash_piece_root_v2(
+    data: bytes | memoryview,
+    piece_length: int | None = None,
+) -> bytes:
+    """Calculate the BEP 52 piece hash of piece data.
+
+    For pieces of at most 16 KiB this is the SHA-256 of the data.
+
+    Args:
+        data: Piece data
+        piece_length: See :func:`piece_root_v2`
+
+    Returns:
+        32-byte piece hash
+
+    Raises:
+        ValueError: If data is empty
+
+    """
+    if not len(data):
+        msg = "Cannot hash empty piece data"
+        raise ValueError(msg)
+    return piece_root_v2(hash_blocks_v2(data), piece_length)
+
+
+def hash_piece_layer(
+    piece_hashes: list[bytes],
+    piece_length: int | None = None,
+) -> bytes:
     """Calculate Merkle root (pieces_root) for a piece layer.
 
     In BEP 52, each file has a piece layer consisting of SHA-256 hashes of pieces.
-    The pieces_root is the Merkle root of all piece hashes in the layer.
+    The pieces_root is the Merkle root of all piece hashes in the layer, with
+    the layer padded to a power of two by hashes of all-zero pieces.
 
     Args:
         piece_hashes: List of 32-byte SHA-256 piece hashes
+        piece_length: Piece length in bytes, used to pick the padding hash
+            (None pads with zero leaves, as for 16 KiB pieces)
 
     Returns:
         32-byte Merkle root (pieces_root)
@@ -245,8 +330,8 @@ def hash_piece_layer(piece_hashes: list[bytes]) -> bytes:
     if len(piece_hashes) == 1:
         return piece_hashes[0]
 
-    # Calculate Merkle root using binary tree
-    root = _calculate_merkle_root(piece_hashes)
+    pad = ZERO_HASH if piece_length is None else piece_layer_pad(piece_length)
+    root = _calculate_merkle_root(piece_hashes, pad)
 
     logger.debug(
         "Calculated piece layer root: %d pieces -> %s",
@@ -257,56 +342,34 @@ def hash_piece_layer(piece_hashes: list[bytes]) -> bytes:
     return root
 
 
-def _calculate_merkle_root(hashes: list[bytes]) -> bytes:
+def _calculate_merkle_root(hashes: list[bytes], pad: bytes = ZERO_HASH) -> bytes:
     """Calculate Merkle root using binary tree construction.
 
-    The algorithm:
-    1. Start with leaf nodes (hashes)
-    2. Pair up adjacent hashes, concatenate, and hash to get parent
-    3. Continue until only one hash remains (the root)
-    4. If odd number of nodes at a level, duplicate the last one
+    The hashes are the leaves of a :class:`~ccbt.piece.merkle.MerkleTree`;
+    leaves missing to fill a power of two are ``pad``.
 
     Args:
         hashes: List of 32-byte hashes
+        pad: Padding leaf hash
 
     Returns:
         32-byte Merkle root hash
 
     """
-    current_level = list(hashes)
-
-    # Build tree bottom-up until we have the root
-    while len(current_level) > 1:
-        next_level: list[bytes] = []
-
-        # Process pairs
-        for i in range(0, len(current_level), 2):
-            if i + 1 < len(current_level):
-                # Pair of hashes: concatenate and hash
-                combined = current_level[i] + current_level[i + 1]
-            else:
-                # Odd number: duplicate the last hash
-                combined = current_level[i] + current_level[i]
-
-            # Hash the combined pair to get parent
-            parent_hash = hashlib.sha256(combined).digest()
-            next_level.append(parent_hash)
-
-        current_level = next_level
-
-    # The single remaining hash is the root
-    return current_level[0]
+    return MerkleTree(hashes, pad=pad).root()
 
 
 def verify_piece_layer(
     piece_hashes: list[bytes],
     expected_root: bytes,
+    piece_length: int | None = None,
 ) -> bool:
     """Verify piece layer Merkle root.
 
     Args:
         piece_hashes: List of 32-byte SHA-256 piece hashes
         expected_root: Expected 32-byte Merkle root (pieces_root)
+        piece_length: Piece length in bytes (see :func:`hash_piece_layer`)
 
     Returns:
         True if root matches, False otherwise
@@ -329,7 +392,7 @@ def verify_piece_layer(
         )
         raise ValueError(msg)
 
-    actual_root = hash_piece_layer(piece_hashes)
+    actual_root = hash_piece_layer(piece_hashes, piece_length)
     matches = actual_root == expected_root
 
     if not matches:
@@ -0,0 +1,401 @@
+"""Incremental binary Merkle trees.
+
+Shared by the BEP 52 piece layer code (:mod:`ccbt.piece.hash_v2`) and the
+Xet file hashes (:mod:`ccbt.storage.xet_hashing`). Leaves can be appended one
+at a time; every interior node whose two children are known is hashed once
+and cached, so computing the root after an append costs O(log n) hashes
+instead of rebuilding the whole tree.
+
+Two ways of completing the right edge of a tree whose width is not a power
+of two are supported:
+
+- Zero padding (BEP 52): missing leaves are ``pad`` (32 zero bytes for the
+  block layer) and a missing subtree of height ``k`` is the root of ``2**k``
+  padding leaves. These zero-subtree hashes are computed once per tree.
+- Duplication (``pad=None``): a node without a right sibling is hashed with
+  itself. Used by the Xet hashes, which were always built this way.
+
+Inclusion proofs list the sibling ("uncle") hashes from a node up to the
+root, which is the layout of the proof hashes in BEP 52 hash responses.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from typing import TYPE_CHECKING, Callable
+
+if TYPE_CHECKING:  # pragma: no cover - type checking only, not executed at runtime
+    from collections.abc import Iterable, Sequence
+
+HASH_SIZE = 32
+
+# Leaf block size of BEP 52 Merkle trees
+BLOCK_SIZE = 16 * 1024
+
+# BEP 52 padding leaf: hashes beyond the end of a file are zero
+ZERO_HASH = bytes(HASH_SIZE)
+
+HashFunc = Callable[[bytes], bytes]
+
+
+def sha256(data: bytes) -> bytes:
+    """Return the SHA-256 digest of ``data``."""
+    return hashlib.sha256(data).digest()
+
+
+def zero_subtree_hashes(
+    height: int,
+    pad: bytes = ZERO_HASH,
+    hash_func: HashFunc = sha256,
+) -> list[bytes]:
+    """Return the roots of all-padding subtrees of height 0 to ``height``.
+
+    Args:
+        height: Highest subtree height needed
+        pad: Padding leaf hash
+        hash_func: Hash applied to the concatenation of two children
+
+    Returns:
+        List where item ``k`` is the root of ``2**k`` padding leaves
+
+    """
+    zeros = [pad]
+    for _ in range(height):
+        zeros.append(hash_func(zeros[-1] + zeros[-1]))
+    return zeros
+
+
+def piece_height(piece_length: int) -> int:
+    """Return the number of tree levels between 16 KiB blocks and a piece.
+
+    Args:
+        piece_length: Piece length in bytes (a power of two)
+
+    Returns:
+        Height of a piece subtree; pieces of one block or less are leaves
+
+    Raises:
+        ValueError: If piece_length is not a power of two
+
+    """
+    if piece_length <= 0 or piece_length & (piece_length - 1):
+        msg = f"Piece length must be a power of two, got {piece_length}"
+        raise ValueError(msg)
+    return max(0, (piece_length // BLOCK_SIZE).bit_length() - 1)
+
+
+def piece_layer_pad(piece_length: int) -> bytes:
+    """Return the BEP 52 padding hash for a piece layer.
+
+    Piece layer hashes are roots of subtrees covering one piece of 16 KiB
+    blocks, so pieces past the end of a file are padded with the root of an
+    all-zero subtree of that height. Pieces of one block or less are leaves.
+
+    Args:
+        piece_length: Piece length in bytes (a power of two)
+
+    Returns:
+        32-byte padding hash
+
+    Raises:
+        ValueError: If piece_length is not a power of two
+
+    """
+    height = piece_height(piece_length)
+    return zero_subtree_hashes(height)[height]
+
+
+class MerkleTree:
+    """Binary Merkle tree that grows by appending leaves.
+
+    ``levels[0]`` holds the leaves and ``levels[k]`` the nodes of height
+    ``k`` whose subtrees are complete. Nodes on the right edge that depend on
+    padding are not cached; they are recomputed from the cached nodes below
+    them when the root or a proof is requested.
+
+    Attributes:
+        hash_func: Hash applied to the concatenation of two children
+        pad: Padding leaf hash, or None to pair unpaired nodes with themselves
+
+    """
+
+    def __init__(
+        self,
+        leaves: Iterable[bytes] = (),
+        *,
+        hash_func: HashFunc = sha256,
+        pad: bytes | None = ZERO_HASH,
+    ):
+        """Initialize Merkle tree.
+
+        Args:
+            leaves: Initial leaf hashes
+            hash_func: Hash applied to the concatenation of two children
+            pad: Padding leaf hash, or None to pair unpaired nodes with themselves
+
+        """
+        self.hash_func = hash_func
+        self.pad = pad
+        self._levels: list[list[bytes]] = [[]]
+        self._zeros: list[bytes] = [] if pad is None else [pad]
+        self.extend(leaves)
+
+    def __len__(self) -> int:
+        """Return the number of leaves."""
+        return len(self._levels[0])
+
+    @property
+    def leaves(self) -> list[bytes]:
+        """Leaf hashes in order (do not modify)."""
+        return self._levels[0]
+
+    @property
+    def height(self) -> int:
+        """Number of levels above the leaves."""
+        return max(0, len(self) - 1).bit_length()
+
+    def append(self, leaf: bytes) -> None:
+        """Append a leaf and hash the subtrees it completes.
+
+        Args:
+            leaf: Leaf hash
+
+        """
+        levels = self._levels
+        levels[0].append(leaf)
+        level = 0
+        while len(levels[level]) % 2 == 0:
+            nodes = levels[level]
+            if level + 1 == len(levels):
+                levels.append([])
+            levels[level + 1].append(self.hash_func(nodes[-2] + nodes[-1]))
+            level += 1
+
+    def extend(self, leaves: Iterable[bytes]) -> None:
+        """Append many leaves, hashing each level in one pass.
+
+        Args:
+            leaves: Leaf hashes
+
+        """
+        levels = self._levels
+        levels[0].extend(leaves)
+        hash_func = self.hash_func
+        level = 0
+        while len(levels[level]) >= 2:
+            nodes = levels[level]
+            if level + 1 == len(levels):
+                levels.append([])
+            parents = levels[level + 1]
+            parents.extend(
+                hash_func(nodes[i] + nodes[i + 1])
+                for i in range(2 * len(parents), len(nodes) - 1, 2)
+            )
+            level += 1
+
+    def _zero(self, level: int) -> bytes:
+        """Return the root of an all-padding subtree of height ``level``."""
+        zeros = self._zeros
+        while len(zeros) <= level:
+            zeros.append(self.hash_func(zeros[-1] + zeros[-1]))
+        return zeros[level]
+
+    def _width(self, level: int) -> int:
+        """Return the number of non-padding nodes at ``level``."""
+        return -(-len(self) >> level)
+
+    def node(self, level: int, index: int) -> bytes:
+        """Return a node, computing right-edge nodes from cached children.
+
+        Args:
+            level: Height of the node (0 for leaves)
+            index: Position of the node within its level
+
+        Returns:
+            Node hash; positions past the data are padding (zero padding only)
+
+        Raises:
+            IndexError: If the node is outside the tree
+
+        """
+        if level < 0 or index < 0 or level > self.height:
+            msg = f"Node ({level}, {index}) is outside the tree"
+            raise IndexError(msg)
+        if level < len(self._levels) and index < len(self._levels[level]):
+            return self._levels[level][index]
+        if index >= self._width(level):
+            if self.pad is None or index >= 1 << (self.height - level):
+                msg = f"Node ({level}, {index}) is outside the tree"
+                raise IndexError(msg)
+            return self._zero(level)
+        # Right edge: the right child may itself be partial or padding
+        left = self.node(level - 1, 2 * index)
+        return self.hash_func(left + self._sibling(level - 1, 2 * index, left))
+
+    def _sibling(self, level: int, index: int, node: bytes) -> bytes:
+        """Return the sibling of a node that is part of the data."""
+        sibling = index ^ 1
+        if sibling < self._width(level):
+            return self.node(level, sibling)
+        return node if self.pad is None else self._zero(level)
+
+    def root(self, height: int | None = None) -> bytes:
+        """Return the root hash.
+
+        Args:
+            height: Pad the tree to at least this many levels above the
+                leaves (a BEP 52 piece hash spans a whole piece of blocks
+                even when the file ends inside it)
+
+        Returns:
+            32-byte root; a single leaf is its own root
+
+        Raises:
+            ValueError: If the tree has no leaves
+
+        """
+        if not self._levels[0]:
+            msg = "Merkle tree has no leaves"
+            raise ValueError(msg)
+        carry: bytes | None = None
+        level = 0
+        while True:
+            nodes = self._levels[level] if level < len(self._levels) else []
+            count = len(nodes) + (carry is not None)
+            if count == 1:
+                root = nodes[0] if carry is None else carry
+                for extra in range(level, height or 0):
+                    partner = root if self.pad is None else self._zero(extra)
+                    root = self.hash_func(root + partner)
+                return root
+            if carry is not None and len(nodes) % 2:
+                carry = self.hash_func(nodes[-1] + carry)
+            elif carry is not None:
+                partner = carry if self.pad is None else self._zero(level)
+                carry = self.hash_func(carry + partner)
+            elif len(nodes) % 2:
+                partner = nodes[-1] if self.pad is None else self._zero(level)
+                carry = self.hash_func(nodes[-1] + partner)
+            level += 1
+
+    def proof(self, index: int, level: int = 0) -> list[bytes]:
+        """Return the uncle hashes proving a node against the root.
+
+        Args:
+            index: Position of the node within its level
+            level: Height of the node (0 for leaves)
+
+        Returns:
+            Sibling hashes from ``level`` up to the level below the root
+
+        Raises:
+            IndexError: If the node is not part of the data
+
+        """
+        if index < 0 or index >= self._width(level) or level > self.height:
+            msg = f"Node ({level}, {index}) is outside the tree"
+            raise IndexError(msg)
+        uncles = []
+        for height in range(level, self.height):
+            node = self.node(height, index)
+            uncles.append(self._sibling(height, index, node))
+            index >>= 1
+        return uncles
+
+    def layer(
+        self, level: int, index: int = 0, length: int | None = None
+    ) -> list[bytes]:
+        """Return a run of nodes from one level, padded past the data.
+
+        Args:
+            level: Height of the nodes (0 for leaves)
+            index: First position
+            length: Number of nodes (defaults to the rest of the data)
+
+        Returns:
+            Node hashes
+
+        """
+        if length is None:
+            length = self._width(level) - index
+        return [self.node(level, i) for i in range(index, index + length)]
+
+    @staticmethod
+    def root_from_proof(
+        node: bytes,
+        index: int,
+        proof: Sequence[bytes],
+        hash_func: HashFunc = sha256,
+    ) -> bytes:
+        """Fold a node with its uncle hashes into a root.
+
+        Args:
+            node: Node hash
+            index: Position of the node within its level
+            proof: Uncle hashes, lowest first
+            hash_func: Hash applied to the concatenation of two children
+
+        Returns:
+            Root implied by the proof
+
+        """
+        for uncle in proof:
+            node = hash_func(uncle + node) if index & 1 else hash_func(node + uncle)
+            index >>= 1
+        return node
+
+    @classmethod
+    def verify_proof(
+        cls,
+        node: bytes,
+        index: int,
+        proof: Sequence[bytes],
+        root: bytes,
+        hash_func: HashFunc = sha256,
+    ) -> bool:
+        """Check a node against a root with its uncle hashes.
+
+        Args:
+            node: Node hash
+            index: Position of the node within its level
+            proof: Uncle hashes, lowest first
+            root: Expected root
+            hash_func: Hash applied to the concatenation of two children
+
+        Returns:
+            True if the proof leads to ``root``
+
+        """
+        return cls.root_from_proof(node, index, proof, hash_func) == root
+
+    @classmethod
+    def verify_hashes(
+        cls,
+        hashes: Sequence[bytes],
+        index: int,
+        proof: Sequence[bytes],
+        root: bytes,
+        hash_func: HashFunc = sha256,
+    ) -> bool:
+        """Check a BEP 52 hash response against a root.
+
+        The response holds ``hashes``, a power-of-two run of nodes from one
+        layer starting at ``index`` (a multiple of its length), followed by
+        the uncle hashes of the subtree they span.
+
+        Args:
+            hashes: Consecutive nodes from one layer
+            index: Position of the first node within its layer
+            proof: Uncle hashes of the subtree, lowest first
+            root: Expected root
+            hash_func: Hash applied to the concatenation of two children
+
+        Returns:
+            True if the hashes belong to the tree with ``root``
+
+        """
+        count = len(hashes)
+        if not count or count & (count - 1) or index % count:
+            return False
+        subtree = cls(hashes, hash_func=hash_func, pad=None).root()
+        return cls.verify_proof(subtree, index // count, proof, root, hash_func)
@@ -727,10 +727,11 @@ class TorrentQueueManager:
                         self._sync_active_sets()
                     )  # pragma: no cover - tested via integration tests
 
-                    # Enforce limits
-                    await (
-                        self._enforce_queue_limits()
-                    )  # pragma: no cover - tested via integration tests
+                # Enforce limits (takes the lock itself, and asyncio locks
+                # are not reentrant)
+                await (
+                    self._enforce_queue_limits()
+                )  # pragma: no cover - tested via integration tests
 
                 # Try to start queued torrents (outside lock)
                 await (
@@ -1,16 +1,109 @@
 """RC4 stream cipher implementation for BEP 3.
 
-from __future__ import annotations
-
 RC4 is deprecated but required for BEP 3 compatibility with existing
-BitTorrent clients. This is a direct implementation to avoid external
-dependencies.
+BitTorrent clients. The cipher keeps independent encryption and decryption
+keystream positions so a single instance can serve both directions of a
+continuous MSE/PE stream. When the ``cryptography`` package exposes a native
+ARC4 primitive for the key length it is used; otherwise a pure-Python
+keystream generator with bulk integer XOR is used.
 """
 
 from __future__ import annotations
 
+import warnings
+from typing import Any
+
 from ccbt.security.ciphers.base import CipherSuite
 
+try:  # pragma: no cover - import location depends on cryptography version
+    from cryptography.hazmat.decrepit.ciphers.algorithms import ARC4 as _ARC4
+except ImportError:  # pragma: no cover - older cryptography releases
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            from cryptography.hazmat.primitives.ciphers.algorithms import (
+                ARC4 as _ARC4,
+            )
+    except ImportError:
+        _ARC4 = None
+
+try:  # pragma: no cover - always present alongside ARC4
+    from cryptography.hazmat.primitives.ciphers import Cipher as _Cipher
+except ImportError:  # pragma: no cover - cryptography not installed
+    _Cipher = None
+
+# Keystream is generated in chunks of this size by the pure-Python fallback
+_KEYSTREAM_CHUNK = 64 * 1024
+
+
+def _create_native_context(key: bytes) -> Any | None:
+    """Create a native ARC4 context for ``key``, or None if unavailable."""
+    if _ARC4 is None or _Cipher is None:
+        return None
+    if len(key) * 8 not in _ARC4.key_sizes:
+        return None
+    try:
+        return _Cipher(_ARC4(key), mode=None).encryptor()
+    except Exception:  # pragma: no cover - OpenSSL built without legacy ciphers
+        return None
+
+
+class _RC4State:
+    """Pure-Python RC4 keystream state (KSA + incremental PRGA)."""
+
+    __slots__ = ("_i", "_j", "_s")
+
+    def __init__(self, key: bytes):
+        s = list(range(256))
+        j = 0
+        key_len = len(key)
+        for i in range(256):
+            j = (j + s[i] + key[i % key_len]) & 0xFF
+            s[i], s[j] = s[j], s[i]
+        self._s = s
+        self._i = 0
+        self._j = 0
+
+    def keystream(self, length: int) -> bytes:
+        """Generate the next ``length`` keystream bytes."""
+        s = self._s
+        i = self._i
+        j = self._j
+        out = bytearray(length)
+        for k in range(length):
+            i = (i + 1) & 0xFF
+            si = s[i]
+            j = (j + si) & 0xFF
+            sj = s[j]
+            s[i] = sj
+            s[j] = si
+            out[k] = s[(si + sj) & 0xFF]
+        self._i = i
+        self._j = j
+        return bytes(out)
+
+    def update(self, data: bytes) -> bytes:
+        """XOR ``data`` with the next keystream bytes."""
+        length = len(data)
+        if length <= _KEYSTREAM_CHUNK:
+            return _xor_bytes(data, self.keystream(length))
+        view = memoryview(data)
+        return b"".join(
+            _xor_bytes(
+                view[offset : offset + _KEYSTREAM_CHUNK],
+                self.keystream(min(_KEYSTREAM_CHUNK, length - offset)),
+            )
+            for offset in range(0, length, _KEYSTREAM_CHUNK)
+        )
+
+
+def _xor_bytes(data: bytes | memoryview, key_stream: bytes) -> bytes:
+    """XOR two equal-length buffers using arbitrary-precision integers."""
+    length = len(key_stream)
+    return (
+        int.from_bytes(data, "little") ^ int.from_bytes(key_stream, "little")
+    ).to_bytes(length, "little")
+
 
 class RC4Cipher(CipherSuite):
     """RC4 stream cipher implementation."""
@@ -27,40 +120,25 @@ class RC4Cipher(CipherSuite):
             raise ValueError(msg)
 
         self.key = key
-        self._s = list(range(256))
-        self._i = 0
-        self._j = 0
-
-        # Key scheduling algorithm (KSA)
-        j = 0
-        for i in range(256):
-            j = (j + self._s[i] + key[i % len(key)]) % 256
-            self._s[i], self._s[j] = self._s[j], self._s[i]
-
-    def _prga(self, length: int) -> bytes:
-        """Pseudo-random generation algorithm (PRGA).
-
-        Args:
-            length: Number of bytes to generate
 
-        Returns:
-            Key stream bytes
+        # Independent keystream state per direction
+        self._encryptor = _create_native_context(key)
+        if self._encryptor is not None:
+            self._decryptor = _create_native_context(key)
+        else:
+            self._encryptor = _RC4State(key)
+            self._decryptor = _RC4State(key)
 
-        """
-        result = bytearray(length)
-        for k in range(length):
-            self._i = (self._i + 1) % 256
-            self._j = (self._j + self._s[self._i]) % 256
-            self._s[self._i], self._s[self._j] = (
-                self._s[self._j],
-                self._s[self._i],
-            )
-            result[k] = self._s[(self._s[self._i] + self._s[self._j]) % 256]
-        return bytes(result)
+    @property
+    def is_native(self) -> bool:
+        """Whether the native ARC4 primitive backs this cipher."""
+        return not isinstance(self._encryptor, _RC4State)
 
     def encrypt(self, data: bytes) -> bytes:
         """Encrypt data using RC4.
 
+        Consecutive calls continue the encryption keystream.
+
         Args:
             data: Plaintext data to encrypt
 
@@ -70,14 +148,14 @@ class RC4Cipher(CipherSuite):
         """
         if not data:
             return b""
-
-        # RC4 is symmetric: encryption == decryption (XOR with key stream)
-        key_stream = self._prga(len(data))
-        return bytes(a ^ b for a, b in zip(data, key_stream))
+        return self._encryptor.update(data)
 
     def decrypt(self, data: bytes) -> bytes:
         """Decrypt data using RC4.
 
+        Consecutive calls continue the decryption keystream, which is
+        independent of the encryption keystream.
+
         Args:
             data: Encrypted data to decrypt
 
@@ -85,11 +163,9 @@ class RC4Cipher(CipherSuite):
             Decrypted plaintext data (same length as input)
 
         """
-        # RC4 is symmetric (XOR cipher), but we need fresh state
-        # Create a new cipher instance with same key to decrypt
-        # This ensures we start with fresh PRGA state
-        decrypt_cipher = RC4Cipher(self.key)
-        return decrypt_cipher.encrypt(data)
+        if not data:
+            return b""
+        return self._decryptor.update(data)
 
     def key_size(self) -> int:
         """Get the key size in bytes.
@@ -16,24 +16,44 @@ import asyncio
 import bz2
 import gzip
 import hashlib
+import heapq
+import io
 import ipaddress
 import logging
 import lzma
+import struct
+import sys
 import time
-from dataclasses import dataclass
+from array import array
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import IO, TYPE_CHECKING, Iterable
 
 import aiofiles
 import aiohttp
 
 if TYPE_CHECKING:  # pragma: no cover
+    import os
     from ipaddress import IPv4Network, IPv6Network
     # TYPE_CHECKING block is only evaluated by type checkers, not at runtime
 
 logger = logging.getLogger(__name__)
 
+# Magic bytes of supported compressed filter list formats
+COMPRESSION_MAGIC: dict[bytes, str] = {
+    b"\x1f\x8b": ".gz",
+    b"BZh": ".bz2",
+    b"\xfd7zXZ\x00": ".xz",
+}
+
+# Compiled index cache file header: magic, byte order, source size, source
+# mtime (ns), loaded lines, error lines, IPv4/IPv6 networks, IPv4/IPv6 merged
+# ranges. Sections follow in _write_index_cache() order.
+INDEX_CACHE_MAGIC = b"CCBTIPF1"
+INDEX_CACHE_HEADER = struct.Struct("<8scQqQQQQQQ")
+
 
 class FilterMode(Enum):
     """IP filter modes."""
@@ -52,6 +72,155 @@ class IPFilterRule:
     source: str = "manual"  # Source of rule (file path, URL, or "manual")
 
 
+@dataclass
+class _ParsedFilterList:
+    """Networks parsed from a filter list, stored as integers."""
+
+    ipv4_networks: array = field(default_factory=lambda: array("I"))
+    ipv4_prefixes: bytearray = field(default_factory=bytearray)
+    ipv6_networks: list[int] = field(default_factory=list)
+    ipv6_prefixes: bytearray = field(default_factory=bytearray)
+    loaded: int = 0
+    errors: int = 0
+
+    # Networks merged into sorted inclusive ranges, see _merge_ranges()
+    ipv4_starts: list[int] = field(default_factory=list)
+    ipv4_ends: list[int] = field(default_factory=list)
+    ipv6_starts: list[int] = field(default_factory=list)
+    ipv6_ends: list[int] = field(default_factory=list)
+
+    def compile(self) -> None:
+        """Merge the parsed networks into lookup ranges."""
+        self.ipv4_starts, self.ipv4_ends = _merge_ranges(
+            self.ipv4_networks, self.ipv4_prefixes, 32
+        )
+        self.ipv6_starts, self.ipv6_ends = _merge_ranges(
+            self.ipv6_networks, self.ipv6_prefixes, 128
+        )
+
+
+def _summarize_range(start: int, end: int, bits: int) -> list[tuple[int, int]]:
+    """Split an inclusive integer address range into aligned CIDR blocks.
+
+    Args:
+        start: First address of the range
+        end: Last address of the range
+        bits: Address width (32 for IPv4, 128 for IPv6)
+
+    Returns:
+        List of (network address, prefix length) tuples covering the range
+
+    """
+    networks: list[tuple[int, int]] = []
+    while start <= end:
+        # Largest block aligned at start that does not run past end
+        host_bits = (start & -start).bit_length() - 1 if start else bits
+        host_bits = min(host_bits, (end - start + 1).bit_length() - 1)
+        networks.append((start, bits - host_bits))
+        start += 1 << host_bits
+    return networks
+
+
+def _collapse_ranges(
+    spans: Iterable[tuple[int, int]],
+) -> tuple[list[int], list[int]]:
+    """Collapse sorted inclusive (start, end) spans into disjoint ranges.
+
+    Args:
+        spans: Spans sorted by start address
+
+    Returns:
+        Tuple of (range starts, range ends), both sorted ascending
+
+    """
+    starts: list[int] = []
+    ends: list[int] = []
+    for start, end in spans:
+        # Adjacent or overlapping ranges collapse into one
+        if ends and start <= ends[-1] + 1:
+            ends[-1] = max(ends[-1], end)
+        else:
+            starts.append(start)
+            ends.append(end)
+    return starts, ends
+
+
+def _merge_ranges(
+    networks: Iterable[int], prefixes: Iterable[int], bits: int
+) -> tuple[list[int], list[int]]:
+    """Merge networks into sorted, non-overlapping inclusive integer ranges.
+
+    Args:
+        networks: Network addresses
+        prefixes: Prefix lengths matching ``networks``
+        bits: Address width (32 for IPv4, 128 for IPv6)
+
+    Returns:
+        Tuple of (range starts, range ends), both sorted ascending
+
+    """
+    return _collapse_ranges(
+        (start, start + (1 << (bits - prefixlen)) - 1)
+        for start, prefixlen in sorted(zip(networks, prefixes))
+    )
+
+
+def _merge_compiled(
+    starts: list[int],
+    ends: list[int],
+    other_starts: list[int],
+    other_ends: list[int],
+) -> tuple[list[int], list[int]]:
+    """Merge two sets of already merged ranges in linear time."""
+    if not starts:
+        return list(other_starts), list(other_ends)
+    if not other_starts:
+        return starts, ends
+    return _collapse_ranges(
+        heapq.merge(zip(starts, ends), zip(other_starts, other_ends))
+    )
+
+
+def _insert_range(starts: list[int], ends: list[int], start: int, end: int) -> None:
+    """Insert one inclusive range into merged ranges in place."""
+    # Ranges are disjoint, so ends are sorted as well as starts
+    lo = bisect_left(ends, start - 1)
+    hi = bisect_right(starts, end + 1)
+    if lo < hi:
+        start = min(start, starts[lo])
+        end = max(end, ends[hi - 1])
+    starts[lo:hi] = [start]
+    ends[lo:hi] = [end]
+
+
+def _in_ranges(starts: list[int], ends: list[int], value: int) -> bool:
+    """Check whether ``value`` falls in one of the merged ranges."""
+    i = bisect_right(starts, value) - 1
+    return i >= 0 and value <= ends[i]
+
+
+def _pack_ipv4(values: Iterable[int]) -> bytes:
+    """Encode IPv4 integers as native 4-byte words."""
+    return array("I", values).tobytes()
+
+
+def _unpack_ipv4(data: bytes | memoryview) -> array:
+    """Decode native 4-byte words written by :func:`_pack_ipv4`."""
+    values = array("I")
+    values.frombytes(data)
+    return values
+
+
+def _pack_ipv6(values: Iterable[int]) -> bytes:
+    """Encode IPv6 integers as 16-byte big-endian words."""
+    return b"".join(value.to_bytes(16, "big") for value in values)
+
+
+def _unpack_ipv6(data: bytes | memoryview) -> list[int]:
+    """Decode 16-byte big-endian words written by :func:`_pack_ipv6`."""
+    return [int.from_bytes(data[i : i + 16], "big") for i in range(0, len(data), 16)]
+
+
 class IPFilter:
     """IP filter for blocking/allowing peer connections.
 
@@ -63,6 +232,11 @@ class IPFilter:
     - File and URL-based filter lists
     - Compressed filter lists (.gz, .bz2, .xz)
     - Auto-update from URLs
+
+    Rules are stored as integer arrays and compiled on first lookup into
+    sorted, merged start/end ranges per address family, so each check is a
+    single ``bisect`` regardless of list size. ``rules``, ``ipv4_ranges`` and
+    ``ipv6_ranges`` are built from the arrays on demand.
     """
 
     def __init__(self, enabled: bool = False, mode: FilterMode = FilterMode.BLOCK):
@@ -73,12 +247,30 @@ class IPFilter:
             mode: Filter mode (BLOCK or ALLOW)
 
         """
-        # IPv4 and IPv6 network ranges (sorted by network address)
-        self.ipv4_ranges: list[ipaddress.IPv4Network] = []
-        self.ipv6_ranges: list[ipaddress.IPv6Network] = []
-
-        # All filter rules
-        self.rules: list[IPFilterRule] = []
+        # Rule storage: one entry per network, attributes shared via a group id
+        self._ipv4_networks = array("I")
+        self._ipv4_prefixes = bytearray()
+        self._ipv4_groups = array("I")
+        self._ipv6_networks: list[int] = []
+        self._ipv6_prefixes = bytearray()
+        self._ipv6_groups = array("I")
+
+        # Distinct (mode, priority, source) rule attributes
+        self._groups: list[tuple[FilterMode, int, str]] = []
+        self._group_ids: dict[tuple[FilterMode, int, str], int] = {}
+
+        # Compiled lookup index (merged ranges). Additions are merged in
+        # place; removals mark it dirty for a rebuild on the next lookup.
+        self._ipv4_starts: list[int] = []
+        self._ipv4_ends: list[int] = []
+        self._ipv6_starts: list[int] = []
+        self._ipv6_ends: list[int] = []
+        self._index_dirty = False
+
+        # Object views of the rules, built on demand
+        self._rules_view: list[IPFilterRule] | None = None
+        self._ipv4_view: list[ipaddress.IPv4Network] | None = None
+        self._ipv6_view: list[ipaddress.IPv6Network] | None = None
 
         # Statistics
         self.stats: dict[str, int | float] = {
@@ -97,6 +289,89 @@ class IPFilter:
 
         logger.debug("IPFilter initialized: enabled=%s, mode=%s", enabled, mode.value)
 
+    @property
+    def rules(self) -> list[IPFilterRule]:
+        """All filter rules."""
+        if self._rules_view is None:
+            rules: list[IPFilterRule] = []
+            for networks, prefixes, groups, network_cls in (
+                (
+                    self._ipv4_networks,
+                    self._ipv4_prefixes,
+                    self._ipv4_groups,
+                    ipaddress.IPv4Network,
+                ),
+                (
+                    self._ipv6_networks,
+                    self._ipv6_prefixes,
+                    self._ipv6_groups,
+                    ipaddress.IPv6Network,
+                ),
+            ):
+                for network, prefixlen, group in zip(networks, prefixes, groups):
+                    mode, priority, source = self._groups[group]
+                    rules.append(
+                        IPFilterRule(
+                            network=network_cls((network, prefixlen)),
+                            mode=mode,
+                            priority=priority,
+                            source=source,
+                        )
+                    )
+            self._rules_view = rules
+        return self._rules_view
+
+    @property
+    def ipv4_ranges(self) -> list[ipaddress.IPv4Network]:
+        """IPv4 filter networks, sorted by network address."""
+        if self._ipv4_view is None:
+            self._ipv4_view = [
+                ipaddress.IPv4Network(entry)
+                for entry in sorted(zip(self._ipv4_networks, self._ipv4_prefixes))
+            ]
+        return self._ipv4_view
+
+    @property
+    def ipv6_ranges(self) -> list[ipaddress.IPv6Network]:
+        """IPv6 filter networks, sorted by network address."""
+        if self._ipv6_view is None:
+            self._ipv6_view = [
+                ipaddress.IPv6Network(entry)
+                for entry in sorted(zip(self._ipv6_networks, self._ipv6_prefixes))
+            ]
+        return self._ipv6_view
+
+    def _rules_changed(self) -> None:
+        """Invalidate the object views."""
+        self._rules_view = None
+        self._ipv4_view = None
+        self._ipv6_view = None
+
+    def _compile_index(self) -> None:
+        """Rebuild the merged range arrays used for lookups."""
+        self._ipv4_starts, self._ipv4_ends = _merge_ranges(
+            self._ipv4_networks, self._ipv4_prefixes, 32
+        )
+        self._ipv6_starts, self._ipv6_ends = _merge_ranges(
+            self._ipv6_networks, self._ipv6_prefixes, 128
+        )
+        self._index_dirty = False
+        logger.debug(
+            "Compiled IP filter index: %d IPv4 and %d IPv6 merged ranges",
+            len(self._ipv4_starts),
+            len(self._ipv6_starts),
+        )
+
+    def _group_id(self, mode: FilterMode, priority: int, source: str) -> int:
+        """Get the id of a (mode, priority, source) group, creating it if new."""
+        key = (mode, priority, source)
+        group = self._group_ids.get(key)
+        if group is None:
+            group = len(self._groups)
+            self._groups.append(key)
+            self._group_ids[key] = group
+        return group
+
     def is_blocked(self, ip: str) -> bool:
         """Check if an IP address is blocked by the filter.
 
@@ -156,36 +431,15 @@ class IPFilter:
 
     def _is_ipv4_in_ranges(self, ip: ipaddress.IPv4Address) -> bool:
         """Check if IPv4 address is in any range using binary search."""
-        if not self.ipv4_ranges:
-            return False
-
-        # Binary search for overlapping network
-        # Networks are sorted by network_address, so we can use bisect
-        ip_int = int(ip)
-
-        for network in self.ipv4_ranges:
-            if ip_int >= int(network.network_address) and ip_int <= int(
-                network.broadcast_address
-            ):
-                return True
-
-        return False
+        if self._index_dirty:
+            self._compile_index()
+        return _in_ranges(self._ipv4_starts, self._ipv4_ends, int(ip))
 
     def _is_ipv6_in_ranges(self, ip: ipaddress.IPv6Address) -> bool:
         """Check if IPv6 address is in any range using binary search."""
-        if not self.ipv6_ranges:
-            return False
-
-        # Binary search for overlapping network
-        ip_int = int(ip)
-
-        for network in self.ipv6_ranges:
-            if ip_int >= int(network.network_address) and ip_int <= int(
-                network.broadcast_address
-            ):
-                return True
-
-        return False
+        if self._index_dirty:
+            self._compile_index()
+        return _in_ranges(self._ipv6_starts, self._ipv6_ends, int(ip))
 
     def add_rule(
         self,
@@ -196,6 +450,9 @@ class IPFilter:
     ) -> bool:
         """Add an IP range rule to the filter.
 
+        Range notation that does not fall on a CIDR boundary is stored as the
+        set of networks covering exactly that range.
+
         Args:
             ip_range: IP range in CIDR notation (192.168.0.0/24) or
                      range notation (192.168.0.0-192.168.255.255)
@@ -208,7 +465,7 @@ class IPFilter:
 
         """
         try:
-            network, is_ipv4 = self._parse_ip_range(ip_range)
+            networks, is_ipv4 = self._parse_ip_networks(ip_range)
         except ValueError:
             logger.exception("Failed to parse IP range '%s'", ip_range)
             return False
@@ -216,29 +473,52 @@ class IPFilter:
         if mode is None:
             mode = self.mode
 
-        rule = IPFilterRule(
-            network=network, mode=mode, priority=priority, source=source
-        )
-        self.rules.append(rule)
-
-        # Add to appropriate range list
-        if is_ipv4:
-            if not isinstance(network, ipaddress.IPv4Network):
-                msg = f"Expected IPv4Network, got {type(network)}"
-                raise TypeError(msg)
-            self.ipv4_ranges.append(network)
-            # Keep sorted for efficient binary search
-            self.ipv4_ranges.sort(key=lambda n: int(n.network_address))
-        else:
-            if not isinstance(network, ipaddress.IPv6Network):
-                msg = f"Expected IPv6Network, got {type(network)}"
-                raise TypeError(msg)
-            self.ipv6_ranges.append(network)
-            self.ipv6_ranges.sort(key=lambda n: int(n.network_address))
+        group = self._group_id(mode, priority, source)
+        for network, prefixlen in networks:
+            if is_ipv4:
+                self._ipv4_networks.append(network)
+                self._ipv4_prefixes.append(prefixlen)
+                self._ipv4_groups.append(group)
+                starts, ends, bits = self._ipv4_starts, self._ipv4_ends, 32
+            else:
+                self._ipv6_networks.append(network)
+                self._ipv6_prefixes.append(prefixlen)
+                self._ipv6_groups.append(group)
+                starts, ends, bits = self._ipv6_starts, self._ipv6_ends, 128
+            if not self._index_dirty:
+                end = network + (1 << (bits - prefixlen)) - 1
+                _insert_range(starts, ends, network, end)
+        self._rules_changed()
 
         logger.debug("Added IP filter rule: %s (%s)", ip_range, mode.value)
         return True
 
+    def _add_parsed(
+        self, parsed: _ParsedFilterList, mode: FilterMode | None, source: str
+    ) -> None:
+        """Add a parsed filter list in bulk."""
+        group = self._group_id(self.mode if mode is None else mode, 0, source)
+        self._ipv4_networks.extend(parsed.ipv4_networks)
+        self._ipv4_prefixes.extend(parsed.ipv4_prefixes)
+        self._ipv4_groups.extend(array("I", [group]) * len(parsed.ipv4_networks))
+        self._ipv6_networks.extend(parsed.ipv6_networks)
+        self._ipv6_prefixes.extend(parsed.ipv6_prefixes)
+        self._ipv6_groups.extend(array("I", [group]) * len(parsed.ipv6_networks))
+        if not self._index_dirty:
+            self._ipv4_starts, self._ipv4_ends = _merge_compiled(
+                self._ipv4_starts,
+                self._ipv4_ends,
+                parsed.ipv4_starts,
+                parsed.ipv4_ends,
+            )
+            self._ipv6_starts, self._ipv6_ends = _merge_compiled(
+                self._ipv6_starts,
+                self._ipv6_ends,
+                parsed.ipv6_starts,
+                parsed.ipv6_ends,
+            )
+        self._rules_changed()
+
     def remove_rule(self, ip_range: str) -> bool:
         """Remove IP range rule from filter.
 
@@ -250,50 +530,52 @@ class IPFilter:
 
         """
         try:
-            network, is_ipv4 = self._parse_ip_range(ip_range)
+            networks, is_ipv4 = self._parse_ip_networks(ip_range)
         except ValueError:
             logger.exception("Failed to parse IP range '%s'", ip_range)
             return False
 
-        # Find and remove matching rules
-        removed = False
-        self.rules = [
-            rule
-            for rule in self.rules
-            if not (
-                rule.network == network and rule.network.prefixlen == network.prefixlen
+        targets = set(networks)
+        if is_ipv4:
+            entries = list(
+                zip(self._ipv4_networks, self._ipv4_prefixes, self._ipv4_groups)
+            )
+        else:
+            entries = list(
+                zip(self._ipv6_networks, self._ipv6_prefixes, self._ipv6_groups)
             )
-        ]
+        kept = [entry for entry in entries if entry[:2] not in targets]
+        if len(kept) == len(entries):
+            return False
 
-        # Rebuild range lists
         if is_ipv4:
-            old_len = len(self.ipv4_ranges)
-            self.ipv4_ranges = [
-                n
-                for n in self.ipv4_ranges
-                if not (n == network and n.prefixlen == network.prefixlen)
-            ]
-            if len(self.ipv4_ranges) < old_len:
-                removed = True
+            self._ipv4_networks = array("I", (entry[0] for entry in kept))
+            self._ipv4_prefixes = bytearray(entry[1] for entry in kept)
+            self._ipv4_groups = array("I", (entry[2] for entry in kept))
         else:
-            old_len = len(self.ipv6_ranges)
-            self.ipv6_ranges = [
-                n
-                for n in self.ipv6_ranges
-                if not (n == network and n.prefixlen == network.prefixlen)
-            ]
-            if len(self.ipv6_ranges) < old_len:
-                removed = True
+            self._ipv6_networks = [entry[0] for entry in kept]
+            self._ipv6_prefixes = bytearray(entry[1] for entry in kept)
+            self._ipv6_groups = array("I", (entry[2] for entry in kept))
+        self._index_dirty = True
+        self._rules_changed()
 
-        if removed:
-            logger.debug("Removed IP filter rule: %s", ip_range)
-        return removed
+        logger.debug("Removed IP filter rule: %s", ip_range)
+        return True
 
     def clear(self) -> None:
         """Clear all filter rules and reset statistics."""
-        self.ipv4_ranges.clear()
-        self.ipv6_ranges.clear()
-        self.rules.clear()
+        self._ipv4_networks = array("I")
+        self._ipv4_prefixes = bytearray()
+        self._ipv4_groups = array("I")
+        self._ipv6_networks = []
+        self._ipv6_prefixes = bytearray()
+        self._ipv6_groups = array("I")
+        self._groups.clear()
+        self._group_ids.clear()
+        self._ipv4_starts, self._ipv4_ends = [], []
+        self._ipv6_starts, self._ipv6_ends = [], []
+        self._index_dirty = False
+        self._rules_changed()
         self.stats = {"matches": 0, "blocks": 0, "allows": 0}
         logger.info("IP filter cleared")
 
@@ -313,10 +595,12 @@ class IPFilter:
             Dictionary with filter statistics
 
         """
+        ipv4_count = len(self._ipv4_networks)
+        ipv6_count = len(self._ipv6_networks)
         return {
-            "total_rules": len(self.rules),
-            "ipv4_ranges": len(self.ipv4_ranges),
-            "ipv6_ranges": len(self.ipv6_ranges),
+            "total_rules": ipv4_count + ipv6_count,
+            "ipv4_ranges": ipv4_count,
+            "ipv6_ranges": ipv6_count,
             "matches": self.stats["matches"],
             "blocks": self.stats["blocks"],
             "allows": self.stats["allows"],
@@ -324,7 +608,7 @@ class IPFilter:
         }
 
     def _parse_ip_range(self, ip_range: str) -> tuple[IPv4Network | IPv6Network, bool]:
-        """Parse IP range into network object.
+        """Parse IP range into its first network object.
 
         Supports:
         - CIDR notation: 192.168.0.0/24
@@ -340,6 +624,27 @@ class IPFilter:
         Raises:
             ValueError: If IP range is invalid
 
+        """
+        networks, is_ipv4 = self._parse_ip_networks(ip_range)
+        if is_ipv4:
+            return ipaddress.IPv4Network(networks[0]), True
+        return ipaddress.IPv6Network(networks[0]), False
+
+    def _parse_ip_networks(self, ip_range: str) -> tuple[list[tuple[int, int]], bool]:
+        """Parse IP range into integer networks.
+
+        Accepts the same notations as :meth:`_parse_ip_range`. Ranges are
+        split into every CIDR block needed to cover them exactly.
+
+        Args:
+            ip_range: IP range string to parse
+
+        Returns:
+            Tuple of (list of (network address, prefix length), is_ipv4: bool)
+
+        Raises:
+            ValueError: If IP range is invalid
+
         """
         ip_range = ip_range.strip()
 
@@ -347,28 +652,23 @@ class IPFilter:
         if "/" in ip_range:
             try:
                 network = ipaddress.ip_network(ip_range, strict=False)
-                is_ipv4 = isinstance(network, ipaddress.IPv4Network)
-                return network, is_ipv4
             except ValueError as e:
                 msg = f"Invalid CIDR notation: {e}"
                 raise ValueError(msg) from e
+            return (
+                [(int(network.network_address), network.prefixlen)],
+                network.version == 4,
+            )
 
         # Try range notation (start-end)
         if "-" in ip_range:
-            parts = ip_range.split("-", 1)
-            if len(parts) != 2:  # pragma: no cover
-                # Unreachable: split("-", 1) with maxsplit=1 always returns exactly 2 elements
-                # when "-" is present (before and after the first "-")
-                msg = f"Invalid range format: {ip_range}"
-                raise ValueError(msg)
-
-            start_str, end_str = parts[0].strip(), parts[1].strip()
+            start_str, end_str = ip_range.split("-", 1)
             try:
-                start_ip = ipaddress.ip_address(start_str)
-                end_ip = ipaddress.ip_address(end_str)
+                start_ip = ipaddress.ip_address(start_str.strip())
+                end_ip = ipaddress.ip_address(end_str.strip())
 
                 # Ensure same IP version
-                if not isinstance(end_ip, type(start_ip)):
+                if start_ip.version != end_ip.version:
                     msg = "Range start and end must be same IP version"
                     raise TypeError(msg)
 
@@ -376,35 +676,239 @@ class IPFilter:
                 if int(start_ip) > int(end_ip):
                     msg = "Range start must be <= end"
                     raise ValueError(msg)
-
-                # Convert to networks
-                networks = list(ipaddress.summarize_address_range(start_ip, end_ip))
-                # Always use first network (may be multiple if range is large)
-                network = networks[0]
-
-                is_ipv4 = isinstance(network, ipaddress.IPv4Network)
-                return network, is_ipv4
             except ValueError as e:
                 msg = f"Invalid IP range: {e}"
                 raise ValueError(msg) from e
 
+            return (
+                _summarize_range(int(start_ip), int(end_ip), start_ip.max_prefixlen),
+                start_ip.version == 4,
+            )
+
         # Try single IP (convert to /32 or /128)
         try:
             ip_addr = ipaddress.ip_address(ip_range)
-            if isinstance(ip_addr, ipaddress.IPv4Address):
-                network = ipaddress.IPv4Network(f"{ip_addr}/32", strict=False)
-                return network, True
-            network = ipaddress.IPv6Network(f"{ip_addr}/128", strict=False)
-            return network, False
         except ValueError as e:
             msg = f"Invalid IP address or range: {e}"
             raise ValueError(msg) from e
+        return [(int(ip_addr), ip_addr.max_prefixlen)], ip_addr.version == 4
+
+    @staticmethod
+    def _extract_ip_part(line: str) -> str | None:
+        """Extract the IP range from a filter list line.
+
+        Returns:
+            IP range string, or None for blank and comment lines
+
+        """
+        line = line.strip()
+
+        # Skip empty lines and comments
+        if not line or line.startswith("#"):
+            return None
+
+        # PeerGuardian format: "start_ip - end_ip" or "start_ip-end_ip"
+        if " - " in line:
+            line = line.replace(" - ", "-", 1)
+        # Ignore description after the range
+        return line.split(None, 1)[0]
+
+    def _parse_lines(self, lines: Iterable[str]) -> _ParsedFilterList:
+        """Parse filter list lines into integer networks.
+
+        Runs without touching filter state, so it is safe to call from a
+        worker thread.
+        """
+        parsed = _ParsedFilterList()
+        for line in lines:
+            ip_part = self._extract_ip_part(line)
+            if ip_part is None:
+                parsed.loaded += 1  # Not an error, just skip
+                continue
+            try:
+                networks, is_ipv4 = self._parse_ip_networks(ip_part)
+            except (ValueError, TypeError):
+                # Invalid line - log but don't fail entire file
+                logger.debug("Invalid filter line: %.50s", line.strip())
+                parsed.errors += 1
+                continue
+            for network, prefixlen in networks:
+                if is_ipv4:
+                    parsed.ipv4_networks.append(network)
+                    parsed.ipv4_prefixes.append(prefixlen)
+                else:
+                    parsed.ipv6_networks.append(network)
+                    parsed.ipv6_prefixes.append(prefixlen)
+            parsed.loaded += 1
+        parsed.compile()
+        return parsed
+
+    @staticmethod
+    def _detect_compression(file_path: Path) -> str | None:
+        """Detect filter list compression from the extension or magic bytes.
+
+        Returns:
+            Compression suffix (".gz", ".bz2", ".xz") or None for plain text
+
+        """
+        file_ext = file_path.suffix.lower()
+        if file_ext in {".gz", ".bz2", ".xz"}:
+            return file_ext
+        with file_path.open("rb") as f:
+            head = f.read(6)
+        for magic, ext in COMPRESSION_MAGIC.items():
+            if head.startswith(magic):
+                return ext
+        return None
+
+    @staticmethod
+    def _open_compressed(fileobj: IO[bytes], compression: str | None) -> IO[str]:
+        """Wrap a binary stream in a decompressing text reader."""
+        if compression == ".gz":
+            fileobj = gzip.GzipFile(fileobj=fileobj)
+        elif compression == ".bz2":
+            fileobj = bz2.BZ2File(fileobj)
+        elif compression == ".xz":
+            fileobj = lzma.LZMAFile(fileobj)
+        return io.TextIOWrapper(fileobj, encoding="utf-8", errors="replace")
+
+    def _parse_file(self, file_path: Path) -> _ParsedFilterList:
+        """Stream-parse a (possibly compressed) filter list file."""
+        compression = self._detect_compression(file_path)
+        with file_path.open("rb") as raw, self._open_compressed(
+            raw, compression
+        ) as text:
+            return self._parse_lines(text)
+
+    def _parse_bytes(self, content: bytes) -> _ParsedFilterList:
+        """Stream-parse a (possibly compressed) downloaded filter list."""
+        compression = next(
+            (
+                ext
+                for magic, ext in COMPRESSION_MAGIC.items()
+                if content.startswith(magic)
+            ),
+            None,
+        )
+        with self._open_compressed(io.BytesIO(content), compression) as text:
+            return self._parse_lines(text)
+
+    @staticmethod
+    def _index_cache_path(cache_dir: str | Path, file_path: Path) -> Path:
+        """Get the compiled index cache file for a filter list."""
+        path_hash = hashlib.sha1(
+            str(file_path).encode(), usedforsecurity=False
+        ).hexdigest()
+        return Path(cache_dir).expanduser() / f"{path_hash}.idx"
+
+    @staticmethod
+    def _read_index_cache(
+        cache_file: Path, source_stat: os.stat_result
+    ) -> _ParsedFilterList | None:
+        """Read a compiled index cache if it matches the source file.
+
+        Returns:
+            Parsed filter list, or None if the cache is missing or stale
+
+        """
+        try:
+            data = cache_file.read_bytes()
+        except OSError:
+            return None
+        if len(data) < INDEX_CACHE_HEADER.size:
+            return None
+
+        (
+            magic,
+            byteorder,
+            size,
+            mtime_ns,
+            loaded,
+            errors,
+            ipv4_count,
+            ipv6_count,
+            ipv4_merged,
+            ipv6_merged,
+        ) = INDEX_CACHE_HEADER.unpack_from(data)
+        if (
+            magic != INDEX_CACHE_MAGIC
+            or byteorder != sys.byteorder[0].encode()
+            or size != source_stat.st_size
+            or mtime_ns != source_stat.st_mtime_ns
+        ):
+            return None
+
+        section_sizes = (
+            ipv4_count * 4,
+            ipv4_count,
+            ipv6_count * 16,
+            ipv6_count,
+            ipv4_merged * 4,
+            ipv4_merged * 4,
+            ipv6_merged * 16,
+            ipv6_merged * 16,
+        )
+        if len(data) != INDEX_CACHE_HEADER.size + sum(section_sizes):
+            return None
+
+        view = memoryview(data)
+        sections = []
+        offset = INDEX_CACHE_HEADER.size
+        for section_size in section_sizes:
+            sections.append(view[offset : offset + section_size])
+            offset += section_size
+
+        return _ParsedFilterList(
+            ipv4_networks=_unpack_ipv4(sections[0]),
+            ipv4_prefixes=bytearray(sections[1]),
+            ipv6_networks=_unpack_ipv6(sections[2]),
+            ipv6_prefixes=bytearray(sections[3]),
+            loaded=loaded,
+            errors=errors,
+            ipv4_starts=_unpack_ipv4(sections[4]).tolist(),
+            ipv4_ends=_unpack_ipv4(sections[5]).tolist(),
+            ipv6_starts=_unpack_ipv6(sections[6]),
+            ipv6_ends=_unpack_ipv6(sections[7]),
+        )
+
+    @staticmethod
+    def _write_index_cache(
+        cache_file: Path, source_stat: os.stat_result, parsed: _ParsedFilterList
+    ) -> None:
+        """Write a compiled index cache for a parsed filter list."""
+        header = INDEX_CACHE_HEADER.pack(
+            INDEX_CACHE_MAGIC,
+            sys.byteorder[0].encode(),
+            source_stat.st_size,
+            source_stat.st_mtime_ns,
+            parsed.loaded,
+            parsed.errors,
+            len(parsed.ipv4_networks),
+            len(parsed.ipv6_networks),
+            len(parsed.ipv4_starts),
+            len(parsed.ipv6_starts),
+        )
+
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = cache_file.with_suffix(".tmp")
+        with tmp_file.open("wb") as f:
+            f.write(header)
+            f.write(_pack_ipv4(parsed.ipv4_networks))
+            f.write(parsed.ipv4_prefixes)
+            f.write(_pack_ipv6(parsed.ipv6_networks))
+            f.write(parsed.ipv6_prefixes)
+            f.write(_pack_ipv4(parsed.ipv4_starts))
+            f.write(_pack_ipv4(parsed.ipv4_ends))
+            f.write(_pack_ipv6(parsed.ipv6_starts))
+            f.write(_pack_ipv6(parsed.ipv6_ends))
+        tmp_file.replace(cache_file)
 
     async def load_from_file(
         self,
         file_path: str,
         mode: FilterMode | None = None,
         source: str | None = None,
+        cache_dir: str | Path | None = None,
     ) -> tuple[int, int]:
         """Load filter rules from a file.
 
@@ -413,10 +917,16 @@ class IPFilter:
         - CIDR notation
         - Compressed files (.gz, .bz2, .xz)
 
+        The file is stream-parsed in a worker thread. With ``cache_dir``, the
+        parsed networks are also stored as a compiled index keyed by the
+        file's size and modification time, so reloading an unchanged list
+        skips parsing entirely.
+
         Args:
             file_path: Path to filter file
             mode: Filter mode (None uses instance default)
             source: Source identifier (defaults to file path)
+            cache_dir: Directory for the compiled index cache (None disables)
 
         Returns:
             Tuple of (loaded_rules: int, errors: int)
@@ -431,93 +941,45 @@ class IPFilter:
         if source is None:
             source = str(file_path_obj)
 
-        loaded = 0
-        errors = 0
-
-        # Detect compression
-        file_ext = file_path_obj.suffix.lower()
-        is_compressed = file_ext in {".gz", ".bz2", ".xz"}
-
         try:
-            if is_compressed:
-                # Handle compressed files
-                async for line in self._read_compressed_file(file_path_obj):
-                    if await self._parse_and_add_line(line, mode, source):
-                        loaded += 1
-                    else:
-                        errors += 1
-            else:
-                # Handle plain text files
-                async with aiofiles.open(
-                    file_path_obj, encoding="utf-8", errors="replace"
-                ) as f:
-                    async for line in f:
-                        if await self._parse_and_add_line(line, mode, source):
-                            loaded += 1
-                        else:
-                            errors += 1
-
-            logger.info(
-                "Loaded %d rules from %s (%d errors)", loaded, file_path, errors
+            source_stat = file_path_obj.stat()
+            cache_file = (
+                self._index_cache_path(cache_dir, file_path_obj) if cache_dir else None
             )
-            return loaded, errors
 
+            parsed = None
+            if cache_file is not None:
+                parsed = await asyncio.to_thread(
+                    self._read_index_cache, cache_file, source_stat
+                )
+                if parsed is not None:
+                    logger.debug("Using compiled filter index %s", cache_file)
+
+            if parsed is None:
+                parsed = await asyncio.to_thread(self._parse_file, file_path_obj)
+                if cache_file is not None:
+                    try:
+                        await asyncio.to_thread(
+                            self._write_index_cache, cache_file, source_stat, parsed
+                        )
+                    except OSError:
+                        logger.warning(
+                            "Failed to write filter index cache %s",
+                            cache_file,
+                            exc_info=True,
+                        )
         except Exception:
             logger.exception("Error loading filter file %s", file_path)
-            return loaded, errors + 1
-
-    async def _read_compressed_file(self, file_path: Path):
-        """Read compressed file line by line."""
-        file_ext = file_path.suffix.lower()
-
-        if file_ext == ".gz":
-            opener = gzip.open
-        elif file_ext == ".bz2":
-            opener = bz2.open
-        elif file_ext == ".xz":
-            opener = lzma.open
-        else:
-            msg = f"Unsupported compression format: {file_ext}"
-            raise ValueError(msg)
-
-        # Read compressed file in chunks
-        with opener(file_path, "rt", encoding="utf-8", errors="replace") as f:
-            while True:
-                line = f.readline()
-                if not line:
-                    break
-                yield line
-
-    async def _parse_and_add_line(
-        self,
-        line: str,
-        mode: FilterMode | None,
-        source: str,
-    ) -> bool:
-        """Parse a single line and add rule if valid."""
-        line = line.strip()
-
-        # Skip empty lines and comments
-        if not line or line.startswith("#"):
-            return True  # Not an error, just skip
-
-        # Try to parse as IP range
-        try:
-            # PeerGuardian format: "start_ip - end_ip" or "start_ip-end_ip"
-            if " - " in line or ("-" in line and "/" not in line):
-                # Extract IP range (ignore description after space)
-                ip_part = line.split()[0] if " " in line else line
-                # Replace " - " with "-"
-                ip_part = ip_part.replace(" - ", "-")
-            else:
-                # CIDR or single IP
-                ip_part = line.split()[0] if " " in line else line
+            return 0, 1
 
-            return self.add_rule(ip_part, mode=mode, source=source)
-        except ValueError:
-            # Invalid line - log but don't fail entire file
-            logger.debug("Invalid filter line: %.50s", line)
-            return False
+        self._add_parsed(parsed, mode, source)
+        logger.info(
+            "Loaded %d rules from %s (%d errors)",
+            parsed.loaded,
+            file_path,
+            parsed.errors,
+        )
+        return parsed.loaded, parsed.errors
 
     async def load_from_url(
         self,
@@ -555,7 +1017,7 @@ class IPFilter:
                 if file_age < update_interval:
                     logger.debug("Using cached filter from %s", cache_file)
                     loaded, errors = await self.load_from_file(
-                        str(cache_file), mode=mode, source=source
+                        str(cache_file), mode=mode, source=source, cache_dir=cache_path
                     )
                     return True, loaded, None
 
@@ -575,50 +1037,26 @@ class IPFilter:
                     # Read content
                     content = await response.read()  # pragma: no cover
 
-                    # Save to cache if cache_dir provided
-                    if cache_dir and cache_path:  # pragma: no cover
-                        async with aiofiles.open(cache_file, "wb") as f:
-                            await f.write(content)
-
-                    # Parse content
-                    loaded = 0  # pragma: no cover
-                    errors = 0  # pragma: no cover
-
-                    # Detect compression from Content-Encoding header or file extension
-                    response.headers.get("Content-Type", "")  # pragma: no cover
-                    is_compressed = (
-                        ".gz" in url or ".bz2" in url or ".xz" in url
-                    )  # pragma: no cover
-
-                    # Try to decompress if needed
-                    if is_compressed or url.endswith(".gz"):  # pragma: no cover
-                        text_content = gzip.decompress(content).decode(
-                            "utf-8", errors="replace"
-                        )
-                    elif url.endswith(".bz2"):  # pragma: no cover
-                        text_content = bz2.decompress(content).decode(
-                            "utf-8", errors="replace"
-                        )
-                    elif url.endswith(".xz"):  # pragma: no cover
-                        text_content = lzma.decompress(content).decode(
-                            "utf-8", errors="replace"
-                        )
-                    else:  # pragma: no cover
-                        text_content = content.decode("utf-8", errors="replace")
-
-                    # Parse lines
-                    for line in text_content.splitlines():  # pragma: no cover
-                        if await self._parse_and_add_line(line, mode, source):
-                            loaded += 1
-                        else:
-                            errors += 1
-
-                    self._last_update = time.time()  # pragma: no cover
-                    logger.info(
-                        "Loaded %d rules from %s (%d errors)", loaded, url, errors
-                    )  # pragma: no cover
-                    return True, loaded, None  # pragma: no cover
-            # Note: URL loading success path (lines 528-568) requires complex async context manager
+            # Save to cache if cache_dir provided, and parse it from there so
+            # the compiled index is written alongside
+            if cache_dir and cache_path:  # pragma: no cover
+                async with aiofiles.open(cache_file, "wb") as f:
+                    await f.write(content)
+                loaded, errors = await self.load_from_file(
+                    str(cache_file), mode=mode, source=source, cache_dir=cache_path
+                )
+            else:  # pragma: no cover
+                # Compression is detected from the content's magic bytes
+                parsed = await asyncio.to_thread(self._parse_bytes, content)
+                self._add_parsed(parsed, mode, source)
+                loaded, errors = parsed.loaded, parsed.errors
+
+            self._last_update = time.time()  # pragma: no cover
+            logger.info(
+                "Loaded %d rules from %s (%d errors)", loaded, url, errors
+            )  # pragma: no cover
+            return True, loaded, None  # pragma: no cover
+            # Note: URL loading success path requires complex async context manager
             # mocking of aiohttp.ClientSession that is difficult to achieve reliably in unit tests.
             # These paths are tested via integration tests with real HTTP servers or manual testing.
 
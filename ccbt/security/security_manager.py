@@ -206,6 +206,22 @@ class SecurityManager:
 
         return True, "Valid peer"
 
+    def is_ip_blocked(self, ip: str) -> bool:
+        """Check the blacklist and IP filter for an address.
+
+        Cheap synchronous check for accept paths that must reject a
+        connection before reading from it. Does not log security events.
+
+        Returns:
+            True if connections from the IP must be refused
+
+        """
+        if ip in self.ip_blacklist:
+            return True
+        return bool(
+            self.ip_filter and self.ip_filter.enabled and self.ip_filter.is_blocked(ip)
+        )
+
     async def record_peer_activity(
         self,
         peer_id: str,
@@ -571,18 +587,21 @@ class SecurityManager:
 
         logger.info("Loading IP filter...")
 
-        # Load filter files
+        cache_dir = getattr(ip_filter_config, "filter_cache_dir", "~/.ccbt/filters")
+
+        # Load filter files (compiled indexes are cached next to URL downloads)
         filter_files = getattr(ip_filter_config, "filter_files", [])
         for file_path in filter_files:
             if file_path:
-                loaded, errors = await self.ip_filter.load_from_file(file_path)
+                loaded, errors = await self.ip_filter.load_from_file(
+                    file_path, cache_dir=cache_dir
+                )
                 logger.info(
                     "Loaded %d rules from %s (%d errors)", loaded, file_path, errors
                 )
 
         # Load filter URLs
         filter_urls = getattr(ip_filter_config, "filter_urls", [])
-        cache_dir = getattr(ip_filter_config, "filter_cache_dir", "~/.ccbt/filters")
         update_interval = getattr(ip_filter_config, "filter_update_interval", 86400.0)
 
         if filter_urls:
@@ -596,4 +615,7 @@ class SecurityManager:
                 filter_urls, cache_dir, update_interval
             )
 
-        logger.info("IP filter loaded: %d rules", len(self.ip_filter.rules))
+        logger.info(
+            "IP filter loaded: %d rules",
+            self.ip_filter.get_filter_statistics()["total_rules"],
+        )
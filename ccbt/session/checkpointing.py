@@ -55,6 +55,11 @@ class CheckpointController:
             except Exception:
                 pass
         await self.flush_now()
+        # Commit the last group of journal records of binary checkpoints
+        close_journal = getattr(self._manager, "close_journal", None)
+        info_hash = getattr(self._ctx.info, "info_hash", None)
+        if close_journal is not None and info_hash:
+            await close_journal(info_hash)
 
     async def enqueue_save(self) -> None:
         """Signal that checkpoint state should be persisted (batched if enabled)."""
@@ -438,9 +438,10 @@ class AsyncDownloadManager:
     def _on_piece_received(self, connection, piece_message) -> None:
         if not self.piece_manager:
             return
+        peer_key = str(connection.peer_info)
         task = asyncio.create_task(
             self.piece_manager.update_peer_have(
-                str(connection.peer_info),
+                peer_key,
                 piece_message.piece_index,
             ),
         )
@@ -452,6 +453,7 @@ class AsyncDownloadManager:
                 piece_message.piece_index,
                 piece_message.begin,
                 piece_message.block,
+                peer_key=peer_key,
             ),
         )
         self._background_tasks.add(task)
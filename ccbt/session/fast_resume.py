@@ -6,6 +6,7 @@ for fast resume data.
 
 from __future__ import annotations
 
+import asyncio
 import random
 from typing import TYPE_CHECKING, Any
 
@@ -204,32 +205,37 @@ class FastResumeLoader:
             min(num_pieces_to_verify, len(verified_pieces)),
         )
 
-        # Verify pieces
+        # Verify pieces concurrently; reads and hashing run in executors
+        async def _verify_piece(piece_idx: int) -> bool:
+            expected_hash = piece_hashes[piece_idx]
+            try:
+                return await file_assembler.verify_piece_hash(  # type: ignore[union-attr]
+                    piece_idx,
+                    expected_hash,
+                )
+            except Exception as e:
+                self.logger.warning(
+                    "Failed to verify piece %d: %s",
+                    piece_idx,
+                    e,
+                )
+                return False
+
+        pieces_to_check = [p for p in pieces_to_check if 0 <= p < len(piece_hashes)]
         failed_pieces: list[int] = []
-        for piece_idx in pieces_to_check:
-            if 0 <= piece_idx < len(piece_hashes):
-                expected_hash = piece_hashes[piece_idx]
-                if file_assembler and hasattr(file_assembler, "verify_piece_hash"):
-                    try:
-                        is_valid = await file_assembler.verify_piece_hash(
-                            piece_idx,
-                            expected_hash,
-                        )
-                        if not is_valid:
-                            failed_pieces.append(piece_idx)
-                    except Exception as e:
-                        self.logger.warning(
-                            "Failed to verify piece %d: %s",
-                            piece_idx,
-                            e,
-                        )
-                        failed_pieces.append(piece_idx)
-                else:
-                    # Cannot verify without file assembler
-                    self.logger.debug(
-                        "Skipping piece %d verification (no file assembler)",
-                        piece_idx,
-                    )
+        if file_assembler and hasattr(file_assembler, "verify_piece_hash"):
+            results = await asyncio.gather(*map(_verify_piece, pieces_to_check))
+            failed_pieces = [
+                piece_idx
+                for piece_idx, is_valid in zip(pieces_to_check, results)
+                if not is_valid
+            ]
+        else:
+            # Cannot verify without file assembler
+            self.logger.debug(
+                "Skipping verification of %d pieces (no file assembler)",
+                len(pieces_to_check),
+            )
 
         return {
             "valid": len(failed_pieces) == 0,
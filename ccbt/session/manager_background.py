@@ -36,6 +36,9 @@ class ManagerBackgroundTasks:
                         session = self.manager.torrents.pop(
                             info_hash
                         )  # pragma: no cover - Remove stopped session, tested via integration tests
+                        router = getattr(self.manager, "info_hash_router", None)
+                        if router is not None:  # pragma: no cover
+                            router.unregister(info_hash, session)
                         await session.stop()  # pragma: no cover - Stop removed session, tested via integration tests
                         if self.manager.on_torrent_removed:
                             await self.manager.on_torrent_removed(
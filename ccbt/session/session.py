@@ -12,11 +12,12 @@ import logging
 import time
 from dataclasses import dataclass
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Awaitable, Callable, cast
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Iterable, cast
 
 if TYPE_CHECKING:
     from ccbt.discovery.dht import AsyncDHTClient
     from ccbt.utils.di import DIContainer
+    from ccbt.utils.tasks import PeriodicJob
 
 from ccbt import (
     session as _session_mod,
@@ -28,18 +29,30 @@ from ccbt.discovery.pex import PEXManager
 from ccbt.discovery.tracker import AsyncTrackerClient
 from ccbt.models import PieceState, TorrentCheckpoint
 from ccbt.models import TorrentInfo as TorrentInfoModel
+from ccbt.peer.handshake_router import InfoHashRouter
 from ccbt.services.peer_service import PeerService
+from ccbt.session.torrent_index import (
+    PEER_KEY_FIELDS,
+    ListQuery,
+    TorrentIndex,
+    project,
+    query_peers,
+)
 from ccbt.storage.checkpoint import CheckpointManager
 from ccbt.storage.file_assembler import AsyncDownloadManager
+from ccbt.storage.resume_verifier import ResumeProgress
 from ccbt.utils.exceptions import ValidationError
 from ccbt.utils.logging_config import get_logger
 from ccbt.utils.metrics import Metrics
+from ccbt.utils.tasks import get_scheduler
 
 # Expose TorrentParser at module level for test patching
 TorrentParser = _TorrentParser
 
 # Constants
 INFO_HASH_LENGTH = 20  # SHA-1 hash length in bytes
+STATUS_INTERVAL = 5.0  # Seconds between status updates
+ANNOUNCE_RETRY_INTERVAL = 60.0  # Seconds before retrying a failed announce
 
 
 @dataclass
@@ -116,15 +129,20 @@ class AsyncTorrentSession:
         self.torrent_file_path: str | None = None
         self.magnet_uri: str | None = None
 
-        # Background tasks
-        self._announce_task: asyncio.Task[None] | None = None
-        self._status_task: asyncio.Task[None] | None = None
-        self._checkpoint_task: asyncio.Task[None] | None = None
+        # Periodic jobs on the shared scheduler
+        self._announce_job: PeriodicJob | None = None
+        self._status_job: PeriodicJob | None = None
+        self._checkpoint_job: PeriodicJob | None = None
         self._stop_event = asyncio.Event()
+        self._background_tasks: set[asyncio.Task] = set()
 
         # Checkpoint state
         self.checkpoint_loaded = False
         self.resume_from_checkpoint = False
+        # Rehash progress while resuming from a checkpoint (None otherwise)
+        self.resume_progress: ResumeProgress | None = None
+        # Pieces verified since the last checkpoint save, journaled by the next one
+        self._pieces_to_checkpoint: set[int] = set()
 
         # Callbacks
         self.on_status_update: Callable[[dict[str, Any]], None] | None = None
@@ -379,14 +397,34 @@ class AsyncTorrentSession:
                         peer_manager.on_peer_disconnected = (
                             self.download_manager._on_peer_disconnected
                         )  # type: ignore[attr-defined]
+                    else:
+                        peer_manager.on_peer_disconnected = (
+                            self._on_peer_disconnected
+                        )
                     if hasattr(self.download_manager, "_on_piece_received"):
                         peer_manager.on_piece_received = (
                             self.download_manager._on_piece_received
                         )  # type: ignore[attr-defined]
+                    else:
+                        # The file assembler download manager has no block
+                        # handler, so received blocks go straight to the
+                        # piece manager
+                        peer_manager.on_piece_received = self._on_peer_piece_received
                     if hasattr(self.download_manager, "_on_bitfield_received"):
                         peer_manager.on_bitfield_received = (
                             self.download_manager._on_bitfield_received
                         )  # type: ignore[attr-defined]
+                    else:
+                        peer_manager.on_bitfield_received = (
+                            self._on_peer_bitfield_received
+                        )
+                    # Pieces are only hash-verified when a completion
+                    # callback is set, so wire the piece manager here too
+                    self.piece_manager.on_piece_completed = self._on_piece_completed
+                    self.piece_manager.on_piece_verified = self._on_piece_hash_verified
+                    self.piece_manager.on_download_complete = (
+                        self._on_pieces_complete
+                    )
 
                     # Set peer manager on download manager
                     self.download_manager.peer_manager = peer_manager  # type: ignore[assignment]
@@ -455,24 +493,30 @@ class AsyncTorrentSession:
                         dht_error,
                     )
 
-            # Start background tasks with error isolation
-            # CRITICAL FIX: Wrap task creation to ensure exceptions don't crash the daemon
-            # The event loop exception handler will catch any unhandled exceptions in these tasks
-            try:
-                self._announce_task = asyncio.create_task(self._announce_loop())
-                self._status_task = asyncio.create_task(self._status_loop())
-
-                # Start checkpoint task if enabled
-                if self.config.disk.checkpoint_enabled:
-                    self._checkpoint_task = asyncio.create_task(self._checkpoint_loop())
-            except Exception as task_error:
-                # Log error but don't fail session start - tasks will be handled by exception handler
-                self.logger.warning(
-                    "Error creating background tasks (will be handled by exception handler): %s",
-                    task_error,
+            # Register periodic work on the shared scheduler rather than
+            # running a sleeping task per torrent; the scheduler logs and
+            # counts job errors so they cannot crash the daemon
+            self._cancel_jobs()
+            scheduler = get_scheduler()
+            self._announce_job = scheduler.schedule(
+                self._announce_loop_step,
+                self.config.network.announce_interval,
+                name="session.announce",
+                delay=0.0,
+            )
+            self._status_job = scheduler.schedule(
+                self._status_loop_step, STATUS_INTERVAL, name="session.status"
+            )
+
+            # Start checkpoint job if enabled
+            if self.config.disk.checkpoint_enabled:
+                interval = self.config.disk.checkpoint_interval
+                self._checkpoint_job = scheduler.schedule(
+                    self._checkpoint_loop_step,
+                    interval,
+                    name="session.checkpoint",
+                    delay=interval,
                 )
-                # Re-raise only if critical - but task creation shouldn't fail
-                raise
 
             self.info.status = "downloading"
             self.logger.info("Started torrent session: %s", self.info.name)
@@ -488,13 +532,8 @@ class AsyncTorrentSession:
         """Stop the async torrent session."""
         self._stop_event.set()
 
-        # Cancel background tasks
-        if self._announce_task:
-            self._announce_task.cancel()
-        if self._status_task:
-            self._status_task.cancel()
-        if self._checkpoint_task:
-            self._checkpoint_task.cancel()
+        # Cancel periodic jobs
+        self._cancel_jobs()
 
         # Save final checkpoint before stopping
         if (
@@ -505,6 +544,12 @@ class AsyncTorrentSession:
                 await self._save_checkpoint()
             except Exception as e:
                 self.logger.warning("Failed to save final checkpoint: %s", e)
+        # Commit the last group of journal records
+        if self.config.disk.checkpoint_enabled:
+            try:
+                await self.checkpoint_manager.flush_journals()
+            except Exception as e:
+                self.logger.warning("Failed to flush checkpoint journal: %s", e)
 
         # Stop components
         if self.pex_manager:
@@ -546,12 +591,7 @@ class AsyncTorrentSession:
 
             # Stop background tasks
             self._stop_event.set()
-            if self._announce_task:
-                self._announce_task.cancel()
-            if self._status_task:
-                self._status_task.cancel()
-            if self._checkpoint_task:
-                self._checkpoint_task.cancel()
+            self._cancel_jobs()
 
             # Stop heavy components
             if self.pex_manager:
@@ -575,65 +615,90 @@ class AsyncTorrentSession:
             self.logger.exception("Failed to resume torrent")
             raise
 
-    async def _announce_loop(self) -> None:
-        """Background task for periodic tracker announces."""
+    def _cancel_jobs(self) -> None:
+        """Cancel this session's periodic jobs."""
+        for job in (self._announce_job, self._status_job, self._checkpoint_job):
+            if job is not None:
+                job.cancel()
+        self._announce_job = None
+        self._status_job = None
+        self._checkpoint_job = None
+
+    async def _announce_loop_step(self) -> float:
+        """Announce to trackers once.
+
+        Returns:
+            Seconds until the next announce
+
+        """
         announce_interval = self.config.network.announce_interval
 
-        while not self._stop_event.is_set():
-            try:
-                # Announce to tracker
-                td: dict[str, Any]
-                if isinstance(self.torrent_data, TorrentInfoModel):
-                    td = {
-                        "info_hash": self.torrent_data.info_hash,
-                        "name": self.torrent_data.name,
-                        "announce": getattr(self.torrent_data, "announce", ""),
-                    }
-                else:
-                    td = self.torrent_data
-
-                # CRITICAL FIX: Check for trackers before attempting announce
-                # For magnet links without trackers, skip tracker announce and rely on DHT
-                tracker_urls = self._collect_trackers(td)
-                if not tracker_urls:
-                    # No trackers available - this is normal for magnet links without tracker URLs
-                    # Rely on DHT for peer discovery instead
-                    self.logger.debug(
-                        "No trackers found for %s; skipping tracker announce (relying on DHT)",
-                        td.get("name", "unknown"),
-                    )
-                    # Wait longer when no trackers (DHT discovery is slower)
-                    await asyncio.sleep(announce_interval * 2)
-                    continue
+        try:
+            # Announce to tracker
+            td: dict[str, Any]
+            if isinstance(self.torrent_data, TorrentInfoModel):
+                td = {
+                    "info_hash": self.torrent_data.info_hash,
+                    "name": self.torrent_data.name,
+                    "announce": getattr(self.torrent_data, "announce", ""),
+                }
+            else:
+                td = self.torrent_data
+
+            # CRITICAL FIX: Check for trackers before attempting announce
+            # For magnet links without trackers, skip tracker announce and rely on DHT
+            tracker_urls = self._collect_trackers(td)
+            if not tracker_urls:
+                # No trackers available - this is normal for magnet links without tracker URLs
+                # Rely on DHT for peer discovery instead
+                self.logger.debug(
+                    "No trackers found for %s; skipping tracker announce (relying on DHT)",
+                    td.get("name", "unknown"),
+                )
+                # Wait longer when no trackers (DHT discovery is slower)
+                return announce_interval * 2
 
-                response = await self.tracker.announce(td)
+            network = self.config.network
+            listen_port = network.listen_port_tcp or network.listen_port
+            response = await self.tracker.announce(td, port=listen_port)
 
-                if (
-                    response.peers
-                    and self.download_manager
-                    and hasattr(self.download_manager, "add_peers")
-                    and callable(self.download_manager.add_peers)
-                ):
-                    # Update peer list in download manager
-                    add_peers_method = cast(
-                        "Callable[[Any], Any] | Callable[[Any], Awaitable[Any]]",
-                        self.download_manager.add_peers,
+            if (
+                response.peers
+                and self.download_manager
+                and hasattr(self.download_manager, "add_peers")
+                and callable(self.download_manager.add_peers)
+            ):
+                # Update peer list in download manager
+                add_peers_method = cast(
+                    "Callable[[Any], Any] | Callable[[Any], Awaitable[Any]]",
+                    self.download_manager.add_peers,
+                )
+                if asyncio.iscoroutinefunction(add_peers_method):
+                    await cast("Callable[[Any], Awaitable[Any]]", add_peers_method)(
+                        response.peers
                     )
-                    if asyncio.iscoroutinefunction(add_peers_method):
-                        await cast("Callable[[Any], Awaitable[Any]]", add_peers_method)(
-                            response.peers
-                        )
-                    else:
-                        cast("Callable[[Any], Any]", add_peers_method)(response.peers)
+                else:
+                    cast("Callable[[Any], Any]", add_peers_method)(response.peers)
+            elif response.peers and getattr(
+                self.download_manager, "peer_manager", None
+            ):
+                # The file assembler download manager has no add_peers, so
+                # hand tracker peers to the peer manager wired in start(),
+                # skipping our own entry in the tracker's peer list
+                own_ips = {"127.0.0.1", "::1", network.listen_interface}
+                await self.download_manager.peer_manager.connect_to_peers(
+                    [
+                        {"ip": p.ip, "port": p.port, "peer_source": "tracker"}
+                        for p in response.peers
+                        if not (p.port == listen_port and p.ip in own_ips)
+                    ]
+                )
 
-                # Wait for next announce
-                await asyncio.sleep(announce_interval)
+        except Exception as e:
+            self.logger.warning("Tracker announce failed: %s", e)
+            return ANNOUNCE_RETRY_INTERVAL
 
-            except asyncio.CancelledError:
-                break
-            except Exception as e:
-                self.logger.warning("Tracker announce failed: %s", e)
-                await asyncio.sleep(60)  # Retry in 1 minute on error
+        return announce_interval
 
     def _collect_trackers(self, td: dict[str, Any]) -> list[str]:
         """Collect and deduplicate tracker URLs from torrent_data.
@@ -679,28 +744,23 @@ class AsyncTorrentSession:
 
         return unique
 
-    async def _status_loop(self) -> None:
-        """Background task for status monitoring."""
-        while not self._stop_event.is_set():
-            try:
-                # Get current status
-                status = await self.get_status()
-
-                # Notify callback
-                if self.on_status_update:
-                    await self.on_status_update(status)
+    async def _status_loop_step(self) -> None:
+        """Publish the current status to the status callback once."""
+        try:
+            # Get current status
+            status = await self.get_status()
 
-                # Update session manager metrics
-                # Note: update_torrent_metrics method doesn't exist in AsyncSessionManager
+            # Keep this torrent's row of the manager's listing index current
+            torrent_index = getattr(self.session_manager, "torrent_index", None)
+            if torrent_index is not None:
+                torrent_index.set_status(self.info.info_hash.hex(), status)
 
-                # Wait before next status check
-                await asyncio.sleep(5)
+            # Notify callback
+            if self.on_status_update:
+                await self.on_status_update(status)
 
-            except asyncio.CancelledError:
-                break
-            except Exception:
-                self.logger.exception("Status loop error")
-                await asyncio.sleep(5)
+        except Exception:
+            self.logger.exception("Status loop error")
 
     async def _on_download_complete(self) -> None:
         """Handle download completion."""
@@ -727,8 +787,56 @@ class AsyncTorrentSession:
         if self.on_complete:
             await self.on_complete()
 
-    async def _on_piece_verified(self, _piece_index: int) -> None:
+    def _spawn(self, coro: Any) -> None:
+        """Run a callback coroutine in the background, keeping a reference."""
+        task = asyncio.create_task(coro)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
+    def _on_peer_piece_received(self, connection: Any, message: Any) -> None:
+        """Hand a block received from a peer to the piece manager."""
+        self._spawn(
+            self.piece_manager.handle_piece_block(
+                message.piece_index,
+                message.begin,
+                message.block,
+                peer_key=str(connection.peer_info),
+            )
+        )
+
+    def _on_peer_bitfield_received(self, connection: Any, message: Any) -> None:
+        """Record which pieces a peer has so they can be requested from it."""
+        self._spawn(
+            self.piece_manager.update_peer_availability(
+                str(connection.peer_info), message.bitfield
+            )
+        )
+
+    def _on_peer_disconnected(self, connection: Any) -> None:
+        """Release the blocks a disconnected peer was asked for."""
+        self._spawn(
+            self.piece_manager.handle_peer_disconnected(str(connection.peer_info))
+        )
+
+    def _on_piece_completed(self, piece_index: int) -> None:
+        """Log a piece whose blocks have all arrived."""
+        self.logger.debug("Completed piece %s", piece_index)
+
+    def _on_piece_hash_verified(self, piece_index: int) -> None:
+        """Advertise a verified piece and run the session handler."""
+        peer_manager = getattr(self.download_manager, "peer_manager", None)
+        if peer_manager is not None and hasattr(peer_manager, "broadcast_have"):
+            self._spawn(peer_manager.broadcast_have(piece_index))
+        self._spawn(self._on_piece_verified(piece_index))
+
+    def _on_pieces_complete(self) -> None:
+        """Run the session completion handler once every piece is verified."""
+        self._spawn(self._on_download_complete())
+
+    async def _on_piece_verified(self, piece_index: int) -> None:
         """Handle piece verification."""
+        self._pieces_to_checkpoint.add(piece_index)
+
         # Update PEX manager if available
         if self.pex_manager:
             # PEX manager will handle peer discovery
@@ -744,6 +852,28 @@ class AsyncTorrentSession:
                     e,
                 )
 
+    async def accept_incoming_peer(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+        handshake: Any,
+        peer_ip: str,
+        peer_port: int,
+    ) -> None:
+        """Hand a connection routed by the TCP server to the peer manager."""
+        peer_manager = getattr(self.download_manager, "peer_manager", None)
+        if peer_manager is None or not hasattr(peer_manager, "accept_incoming"):
+            self.logger.debug(
+                "Peer manager not ready, rejecting incoming peer %s:%d",
+                peer_ip,
+                peer_port,
+            )
+            writer.close()
+            return
+        await peer_manager.accept_incoming(
+            reader, writer, handshake, peer_ip, peer_port
+        )
+
     async def get_status(self) -> dict[str, Any]:
         """Get current torrent status."""
         status = self.download_manager.get_status()
@@ -757,8 +887,14 @@ class AsyncTorrentSession:
                 "is_private": self.is_private,  # BEP 27: Include private flag in status
             },
         )
+        if self.resume_progress is not None:
+            status["resume_progress"] = self.resume_progress.fraction
         return status
 
+    def _on_resume_progress(self, progress: ResumeProgress) -> None:
+        """Record the rehash progress of a resume verification."""
+        self.resume_progress = progress
+
     async def _resume_from_checkpoint(self, checkpoint: TorrentCheckpoint) -> None:
         """Resume download from checkpoint."""
         try:
@@ -772,11 +908,18 @@ class AsyncTorrentSession:
                 hasattr(self.download_manager, "file_assembler")
                 and self.download_manager.file_assembler
             ):
-                validation_results = (
-                    await self.download_manager.file_assembler.verify_existing_pieces(
+                # Rehash on the piece manager's hash pool, reporting progress
+                # through get_status()
+                file_assembler = self.download_manager.file_assembler
+                self.resume_progress = ResumeProgress()
+                try:
+                    validation_results = await file_assembler.verify_existing_pieces(
                         checkpoint,
+                        progress_callback=self._on_resume_progress,
+                        hash_executor=getattr(self.piece_manager, "hash_executor", None),
                     )
-                )
+                finally:
+                    self.resume_progress = None
 
                 if not validation_results["valid"]:
                     self.logger.warning(
@@ -792,6 +935,13 @@ class AsyncTorrentSession:
                             "Corrupted pieces: %s",
                             validation_results["corrupted_pieces"],
                         )
+                        # Download pieces that failed the rehash again
+                        corrupted = set(validation_results["corrupted_pieces"])
+                        checkpoint.verified_pieces = [
+                            piece
+                            for piece in checkpoint.verified_pieces
+                            if piece not in corrupted
+                        ]
 
             # Skip preallocation for existing files
             if (
@@ -850,26 +1000,29 @@ class AsyncTorrentSession:
                 # Add display name
                 checkpoint.display_name = self.torrent_data.get("name", self.info.name)
 
-            await self.checkpoint_manager.save_checkpoint(checkpoint)
+            changed_pieces, self._pieces_to_checkpoint = (
+                self._pieces_to_checkpoint,
+                set(),
+            )
+            try:
+                await self.checkpoint_manager.save_checkpoint(
+                    checkpoint, changed_pieces=changed_pieces
+                )
+            except Exception:
+                self._pieces_to_checkpoint |= changed_pieces
+                raise
             self.logger.debug("Saved checkpoint for %s", self.info.name)
 
         except Exception:
             self.logger.exception("Failed to save checkpoint")
             raise
 
-    async def _checkpoint_loop(self) -> None:
-        """Background task for periodic checkpoint saving."""
-        while not self._stop_event.is_set():
-            try:
-                await asyncio.sleep(self.config.disk.checkpoint_interval)
-
-                if not self._stop_event.is_set():
-                    await self._save_checkpoint()
-
-            except asyncio.CancelledError:
-                break
-            except Exception:
-                self.logger.exception("Error in checkpoint loop")
+    async def _checkpoint_loop_step(self) -> None:
+        """Save a checkpoint once."""
+        try:
+            await self._save_checkpoint()
+        except Exception:
+            self.logger.exception("Error in checkpoint loop")
 
     async def delete_checkpoint(self) -> bool:
         """Delete checkpoint files for this torrent."""
@@ -930,6 +1083,10 @@ class AsyncSessionManager:
         self.output_dir = output_dir
         self.torrents: dict[bytes, AsyncTorrentSession] = {}
         self.lock = asyncio.Lock()
+        # Routes incoming handshakes to sessions; kept in step with torrents
+        self.info_hash_router = InfoHashRouter()
+        # Latest status rows for paginated listings, refreshed by get_status()
+        self.torrent_index = TorrentIndex()
 
         # Global components
         self.dht_client: AsyncDHTClient | None = None
@@ -1282,6 +1439,7 @@ class AsyncSessionManager:
             for session in self.torrents.values():
                 await session.stop()
             self.torrents.clear()
+            self.info_hash_router.clear()
 
         # Stop background tasks
         if self._cleanup_task:
@@ -1696,6 +1854,7 @@ class AsyncSessionManager:
                     session.torrent_file_path = path
 
                 self.torrents[info_hash] = session
+                self.info_hash_router.register(info_hash, session)
 
                 # BEP 27: Track private torrents for DHT/PEX/LSD enforcement
                 if session.is_private:
@@ -1751,6 +1910,7 @@ class AsyncSessionManager:
                 session.magnet_uri = uri
 
                 self.torrents[info_hash] = session
+                self.info_hash_router.register(info_hash, session)
 
                 # BEP 27: Track private torrents for DHT/PEX/LSD enforcement
                 if session.is_private:
@@ -1775,6 +1935,8 @@ class AsyncSessionManager:
                     # Remove session from torrents dict if it's still there
                     if info_hash and info_hash in self.torrents:
                         removed_session = self.torrents.pop(info_hash, None)
+                        self.info_hash_router.unregister(info_hash)
+                        self.torrent_index.remove(info_hash.hex())
                         if removed_session:
                             # Try to stop the session to clean up resources
                             try:
@@ -1805,6 +1967,8 @@ class AsyncSessionManager:
 
         async with self.lock:
             session = self.torrents.pop(info_hash, None)
+            self.info_hash_router.unregister(info_hash)
+            self.torrent_index.remove(info_hash.hex())
             # BEP 27: Remove from private_torrents set when torrent is removed
             self.private_torrents.discard(info_hash)
 
@@ -1820,10 +1984,13 @@ class AsyncSessionManager:
 
         return False
 
-    async def get_peers_for_torrent(self, info_hash_hex: str) -> list[dict[str, Any]]:
+    async def get_peers_for_torrent(
+        self, info_hash_hex: str, fields: Iterable[str] | None = None
+    ) -> list[dict[str, Any]]:
         """Return list of peers for a torrent (placeholder).
 
-        Returns an empty list until peer tracking is wired.
+        Returns an empty list until peer tracking is wired. ``fields``
+        limits each peer to those keys (plus ``ip`` and ``port``).
         """
         try:
             _ = bytes.fromhex(info_hash_hex)
@@ -1833,7 +2000,7 @@ class AsyncSessionManager:
             return []
         try:
             peers = await self.peer_service.list_peers()
-            return [
+            rows = [
                 {
                     "ip": p.peer_info.ip,
                     "port": p.peer_info.port,
@@ -1846,6 +2013,10 @@ class AsyncSessionManager:
             ]
         except Exception:
             return []
+        if fields is None:
+            return rows
+        keep = frozenset(fields) | PEER_KEY_FIELDS
+        return [project(row, keep) for row in rows]
 
     async def force_announce(self, info_hash_hex: str) -> bool:
         """Force a tracker announce for a given torrent if possible."""
@@ -1954,8 +2125,47 @@ class AsyncSessionManager:
         async with self.lock:
             for info_hash, session in self.torrents.items():
                 status[info_hash.hex()] = await session.get_status()
+        for info_hash_hex, torrent_status in status.items():
+            self.torrent_index.set_status(info_hash_hex, torrent_status)
         return status
 
+    async def query_torrents(self, query: ListQuery) -> dict[str, Any]:
+        """List torrents filtered, sorted, paged and projected.
+
+        Answered from ``torrent_index``, whose rows the sessions' status jobs
+        keep current; only torrents added since their last status are
+        sampled here.
+
+        Returns:
+            Dict with ``torrents``, ``total`` and ``next_cursor``
+
+        Raises:
+            ValueError: If the sort field or cursor is invalid
+
+        """
+        index = self.torrent_index
+        if len(index.rows) != len(self.torrents):
+            async with self.lock:
+                sessions = {ih.hex(): sess for ih, sess in self.torrents.items()}
+            for info_hash_hex in index.rows.keys() - sessions.keys():
+                index.remove(info_hash_hex)
+            for info_hash_hex, session in sessions.items():
+                if info_hash_hex not in index.rows:
+                    index.set_status(info_hash_hex, await session.get_status())
+        return index.query(query)
+
+    async def query_peers(self, info_hash_hex: str, query: ListQuery) -> dict[str, Any]:
+        """List a torrent's peers sorted, paged and projected.
+
+        Returns:
+            Dict with ``peers``, ``total`` and ``next_cursor``
+
+        Raises:
+            ValueError: If the sort field or cursor is invalid
+
+        """
+        return query_peers(await self.get_peers_for_torrent(info_hash_hex), query)
+
     async def get_torrent_status(self, info_hash_hex: str) -> dict[str, Any] | None:
         """Get status of a specific torrent."""
         try:
@@ -2001,6 +2211,8 @@ class AsyncSessionManager:
 
                     for info_hash in to_remove:
                         session = self.torrents.pop(info_hash)
+                        self.info_hash_router.unregister(info_hash, session)
+                        self.torrent_index.remove(info_hash.hex())
                         # BEP 27: Remove from private_torrents set during cleanup
                         self.private_torrents.discard(info_hash)
                         await session.stop()
@@ -0,0 +1,404 @@
+"""Index of torrent status rows for paginated, projected listings.
+
+Each torrent session publishes its status dict from its periodic status
+job; the index keeps the listing-relevant fields of the latest one as a
+flat row, buckets the rows by state and keeps one sort order per queried
+field, moving only the entries of rows whose value changed. Listing
+queries filter, sort and page over the rows and copy only the requested
+fields, instead of building a full model per torrent.
+
+Pages are addressed with keyset cursors (the sort key and info hash of the
+last row returned), so torrents added or removed between requests do not
+shift later pages.
+"""
+
+from __future__ import annotations
+
+import base64
+import bisect
+import json
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Iterable
+
+# Listed torrent fields and their defaults (as in TorrentStatusResponse)
+TORRENT_FIELDS: dict[str, Any] = {
+    "info_hash": "",
+    "name": "Unknown",
+    "status": "unknown",
+    "progress": 0.0,
+    "download_rate": 0.0,
+    "upload_rate": 0.0,
+    "num_peers": 0,
+    "num_seeds": 0,
+    "total_size": 0,
+    "downloaded": 0,
+    "uploaded": 0,
+    "ratio": 0.0,
+    "is_private": False,
+    "added_time": 0.0,
+}
+
+# Peer fields that can be sorted on and their defaults (as in PeerInfo)
+PEER_SORT_FIELDS: dict[str, Any] = {
+    "ip": "",
+    "port": 0,
+    "download_rate": 0.0,
+    "upload_rate": 0.0,
+    "client": "",
+}
+
+# Peer fields always included so rows can be told apart
+PEER_KEY_FIELDS = frozenset({"ip", "port"})
+
+DEFAULT_PAGE_LIMIT = 100
+MAX_PAGE_LIMIT = 1000
+
+
+@dataclass
+class ListQuery:
+    """Filtering, sorting and paging options for a listing.
+
+    Attributes:
+        fields: Fields to include in each row, or None for all
+        limit: Maximum rows per page
+        cursor: Cursor returned with the previous page, or None for the first
+        sort: Field to sort on, prefixed with ``-`` for descending order
+        states: Only torrents in one of these states
+        min_ratio: Only torrents with at least this share ratio
+        max_ratio: Only torrents with at most this share ratio
+
+    """
+
+    fields: frozenset[str] | None = None
+    limit: int = DEFAULT_PAGE_LIMIT
+    cursor: str | None = None
+    sort: str | None = None
+    states: frozenset[str] | None = None
+    min_ratio: float | None = None
+    max_ratio: float | None = None
+
+    def __post_init__(self) -> None:
+        """Validate the limit.
+
+        Raises:
+            ValueError: If the limit is out of range
+
+        """
+        if not 0 <= self.limit <= MAX_PAGE_LIMIT:
+            msg = f"limit must be between 0 and {MAX_PAGE_LIMIT}"
+            raise ValueError(msg)
+
+    @classmethod
+    def from_params(cls, params: Any) -> ListQuery:
+        """Build a query from URL query parameters.
+
+        ``fields`` and ``state`` are comma-separated lists; an empty
+        ``fields`` selects only the key fields.
+
+        Raises:
+            ValueError: If a parameter is malformed
+
+        """
+
+        def split(name: str) -> frozenset[str] | None:
+            value = params.get(name)
+            if value is None:
+                return None
+            return frozenset(part for part in value.split(",") if part)
+
+        def number(name: str) -> float | None:
+            value = params.get(name)
+            return float(value) if value not in (None, "") else None
+
+        return cls(
+            fields=split("fields"),
+            limit=int(params.get("limit", DEFAULT_PAGE_LIMIT)),
+            cursor=params.get("cursor") or None,
+            sort=params.get("sort") or None,
+            states=split("state") or None,
+            min_ratio=number("min_ratio"),
+            max_ratio=number("max_ratio"),
+        )
+
+    def to_params(self) -> dict[str, str]:
+        """Encode the query as URL query parameters (inverse of from_params)."""
+        params: dict[str, str] = {"limit": str(self.limit)}
+        if self.fields is not None:
+            params["fields"] = ",".join(sorted(self.fields))
+        if self.cursor:
+            params["cursor"] = self.cursor
+        if self.sort:
+            params["sort"] = self.sort
+        if self.states:
+            params["state"] = ",".join(sorted(self.states))
+        if self.min_ratio is not None:
+            params["min_ratio"] = str(self.min_ratio)
+        if self.max_ratio is not None:
+            params["max_ratio"] = str(self.max_ratio)
+        return params
+
+    def sort_key(self, allowed: Iterable[str]) -> tuple[str | None, bool]:
+        """Split ``sort`` into the field name and whether it is descending.
+
+        Raises:
+            ValueError: If the field cannot be sorted on
+
+        """
+        if not self.sort:
+            return None, False
+        descending = self.sort.startswith("-")
+        field = self.sort.lstrip("-+")
+        if field not in allowed:
+            msg = f"Cannot sort on {field!r}"
+            raise ValueError(msg)
+        return field, descending
+
+
+def encode_cursor(value: Any, key: str) -> str:
+    """Encode the position after a row as an opaque cursor."""
+    raw = json.dumps([value, key], separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[Any, str]:
+    """Decode a cursor from ``encode_cursor()``.
+
+    Raises:
+        ValueError: If the cursor is malformed
+
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        value, key = json.loads(raw)
+        return value, str(key)
+    except Exception as e:
+        msg = f"Invalid cursor: {cursor!r}"
+        raise ValueError(msg) from e
+
+
+def project(row: dict[str, Any], fields: frozenset[str] | None) -> dict[str, Any]:
+    """Copy the requested fields of a row (all of them if ``fields`` is None)."""
+    if fields is None:
+        return dict(row)
+    return {field: row[field] for field in fields if field in row}
+
+
+def paginate(
+    order: list[tuple[Any, str]],
+    rows: dict[str, dict[str, Any]],
+    query: ListQuery,
+    *,
+    descending: bool = False,
+    predicate: Any = None,
+    key_fields: frozenset[str] = frozenset({"info_hash"}),
+) -> dict[str, Any]:
+    """Page through rows in a precomputed order.
+
+    Args:
+        order: ``(sort value, key)`` pairs in ascending order
+        rows: Row per key
+        query: Paging options and projected fields
+        descending: Walk the order backwards
+        predicate: Optional filter taking a row
+        key_fields: Fields always included so the client can identify rows
+
+    Returns:
+        Dict with the page ``items``, the ``total`` number of matching rows
+        and the ``next_cursor`` (None on the last page)
+
+    Raises:
+        ValueError: If the cursor is malformed or from a different sort
+
+    """
+    start = len(order) if descending else 0
+    if query.cursor:
+        position = decode_cursor(query.cursor)
+        try:
+            if descending:
+                start = bisect.bisect_left(order, position)
+            else:
+                start = bisect.bisect_right(order, position)
+        except TypeError as e:
+            msg = "Cursor does not match the sort order"
+            raise ValueError(msg) from e
+
+    indices = range(start - 1, -1, -1) if descending else range(start, len(order))
+    fields = query.fields | key_fields if query.fields is not None else None
+    items: list[dict[str, Any]] = []
+    next_cursor = None
+    for index in indices:
+        row = rows[order[index][1]]
+        if predicate is not None and not predicate(row):
+            continue
+        if len(items) == query.limit:
+            last = order[index + 1] if descending else order[index - 1]
+            next_cursor = encode_cursor(*last) if items else None
+            break
+        items.append(project(row, fields))
+
+    if predicate is None:
+        total = len(order)
+    else:
+        total = sum(1 for row in rows.values() if predicate(row))
+    return {"items": items, "total": total, "next_cursor": next_cursor}
+
+
+class TorrentIndex:
+    """Latest status row per torrent, bucketed by state with sorted orders."""
+
+    def __init__(self) -> None:
+        """Initialize an empty index."""
+        self.rows: dict[str, dict[str, Any]] = {}
+        self._by_state: dict[str, set[str]] = {}
+        # Sort field -> (value, info hash) pairs in ascending order
+        self._orders: dict[str, list[tuple[Any, str]]] = {}
+
+    def update(self, statuses: dict[str, dict[str, Any]]) -> None:
+        """Replace all rows with a new status sample.
+
+        Args:
+            statuses: Status per info hash, as from ``get_status()``
+
+        """
+        self.rows = {
+            info_hash: self._row(info_hash, status)
+            for info_hash, status in statuses.items()
+        }
+        self._by_state = {}
+        for info_hash, row in self.rows.items():
+            self._by_state.setdefault(row["status"], set()).add(info_hash)
+        self._orders.clear()
+
+    def set_status(self, info_hash: str, status: dict[str, Any]) -> None:
+        """Add or replace the row of one torrent.
+
+        Only the sort orders of fields whose value changed are touched.
+
+        Args:
+            info_hash: Torrent info hash (hex)
+            status: Torrent status, as from ``AsyncTorrentSession.get_status()``
+
+        """
+        row = self._row(info_hash, status)
+        old = self.rows.get(info_hash)
+        if old is None or old["status"] != row["status"]:
+            if old is not None:
+                self._by_state[old["status"]].discard(info_hash)
+            self._by_state.setdefault(row["status"], set()).add(info_hash)
+        for field, order in self._orders.items():
+            if old is not None:
+                if old[field] == row[field]:
+                    continue
+                del order[bisect.bisect_left(order, (old[field], info_hash))]
+            bisect.insort(order, (row[field], info_hash))
+        self.rows[info_hash] = row
+
+    def remove(self, info_hash: str) -> None:
+        """Drop the row of a removed torrent, if it has one."""
+        row = self.rows.pop(info_hash, None)
+        if row is None:
+            return
+        self._by_state[row["status"]].discard(info_hash)
+        for field, order in self._orders.items():
+            del order[bisect.bisect_left(order, (row[field], info_hash))]
+
+    @staticmethod
+    def _row(info_hash: str, status: dict[str, Any]) -> dict[str, Any]:
+        row = {
+            field: status.get(field, default)
+            for field, default in TORRENT_FIELDS.items()
+        }
+        row["info_hash"] = info_hash
+        # Sort keys must compare, so missing values fall back to defaults
+        for field, default in TORRENT_FIELDS.items():
+            if row[field] is None:
+                row[field] = default
+        downloaded = row["downloaded"]
+        row["ratio"] = row["uploaded"] / downloaded if downloaded else 0.0
+        return row
+
+    def _order(self, field: str) -> list[tuple[Any, str]]:
+        order = self._orders.get(field)
+        if order is None:
+            order = sorted((row[field], ih) for ih, row in self.rows.items())
+            self._orders[field] = order
+        return order
+
+    def query(self, query: ListQuery) -> dict[str, Any]:
+        """Filter, sort and page the rows.
+
+        Without ``sort`` torrents are ordered by info hash.
+
+        Returns:
+            Dict with ``torrents``, ``total`` and ``next_cursor``
+
+        Raises:
+            ValueError: If the sort field or cursor is invalid
+
+        """
+        field, descending = query.sort_key(TORRENT_FIELDS)
+        order = self._order(field or "info_hash")
+
+        candidates: set[str] | None = None
+        if query.states is not None:
+            candidates = set()
+            for state in query.states:
+                candidates |= self._by_state.get(state, set())
+
+        predicate = None
+        if (
+            candidates is not None
+            or query.min_ratio is not None
+            or query.max_ratio is not None
+        ):
+
+            def predicate(row: dict[str, Any]) -> bool:
+                if candidates is not None and row["info_hash"] not in candidates:
+                    return False
+                if query.min_ratio is not None and row["ratio"] < query.min_ratio:
+                    return False
+                return query.max_ratio is None or row["ratio"] <= query.max_ratio
+
+        page = paginate(
+            order, self.rows, query, descending=descending, predicate=predicate
+        )
+        return {
+            "torrents": page["items"],
+            "total": page["total"],
+            "next_cursor": page["next_cursor"],
+        }
+
+
+def query_peers(peers: list[dict[str, Any]], query: ListQuery) -> dict[str, Any]:
+    """Sort, page and project a torrent's peer list.
+
+    Peers are identified by ``ip:port`` and ordered by it without ``sort``.
+
+    Returns:
+        Dict with ``peers``, ``total`` and ``next_cursor``
+
+    Raises:
+        ValueError: If the sort field or cursor is invalid
+
+    """
+    field, descending = query.sort_key(PEER_SORT_FIELDS)
+    rows = {f"{peer.get('ip', '')}:{peer.get('port', 0)}": peer for peer in peers}
+    if field is None:
+        order = sorted((key, key) for key in rows)
+    else:
+        default = PEER_SORT_FIELDS[field]
+        order = sorted(
+            (row.get(field) if row.get(field) is not None else default, key)
+            for key, row in rows.items()
+        )
+    page = paginate(
+        order, rows, query, descending=descending, key_fields=PEER_KEY_FIELDS
+    )
+    return {
+        "peers": page["items"],
+        "total": page["total"],
+        "next_cursor": page["next_cursor"],
+    }
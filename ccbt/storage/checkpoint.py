@@ -10,15 +10,20 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
+import functools
 import gzip
 import hashlib
+import itertools
 import json
 import os
 import struct
 import time
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:  # pragma: no cover - type checking only, not executed at runtime
+    from collections.abc import Iterable
 
 try:
     import zstandard as zstd
@@ -44,6 +49,15 @@ from ccbt.models import (
     PieceState,
     TorrentCheckpoint,
 )
+from ccbt.storage.checkpoint_journal import (
+    JOURNAL_SUFFIX,
+    CheckpointJournal,
+    JournalState,
+    apply_records,
+    decode_piece_states,
+    encode_piece_states,
+    snapshot_metadata,
+)
 from ccbt.utils.exceptions import (
     CheckpointCorruptedError,
     CheckpointError,
@@ -55,6 +69,31 @@ from ccbt.utils.logging_config import get_logger
 # Re-export TorrentCheckpoint for convenience
 __all__ = ["CheckpointFileInfo", "CheckpointManager", "TorrentCheckpoint"]
 
+# Leading bytes of compressed binary checkpoints
+GZIP_MAGIC = b"\x1f\x8b"
+ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+
+def _encode_bitfield(pieces: list[int], total_pieces: int) -> bytes:
+    """Encode piece indices as a bitfield, highest bit first."""
+    bitfield = bytearray((total_pieces + 7) // 8)
+    for piece_idx in pieces:
+        bitfield[piece_idx // 8] |= 1 << (7 - piece_idx % 8)
+    return bytes(bitfield)
+
+
+def _decode_bitfield(bitfield: bytes, total_pieces: int) -> set[int]:
+    """Decode a bitfield written by :func:`_encode_bitfield`."""
+    pieces = set()
+    for byte_idx, byte_val in enumerate(bitfield):
+        if not byte_val:
+            continue
+        for bit_idx in range(8):
+            piece_idx = byte_idx * 8 + bit_idx
+            if piece_idx < total_pieces and byte_val & (1 << (7 - bit_idx)):
+                pieces.add(piece_idx)
+    return pieces
+
 
 @dataclass
 class CheckpointFileInfo:
@@ -68,6 +107,15 @@ class CheckpointFileInfo:
     checkpoint_format: CheckpointFormat
 
 
+@dataclass
+class _ActiveJournal:
+    """Journal being appended to for one torrent."""
+
+    journal: CheckpointJournal
+    state: JournalState
+    snapshot_size: int
+
+
 class CheckpointManager:
     """Manages torrent download checkpoints with JSON and binary checkpoint_formats."""
 
@@ -75,6 +123,11 @@ class CheckpointManager:
     MAGIC_BYTES = b"CCBT"
     VERSION = 1
 
+    # A journal is compacted into a new snapshot once it is larger than
+    # this many times the snapshot, and at least JOURNAL_COMPACT_MIN bytes
+    JOURNAL_COMPACT_RATIO = 4
+    JOURNAL_COMPACT_MIN = 1024 * 1024
+
     def __init__(self, config: DiskConfig | None = None):
         """Initialize checkpoint manager.
 
@@ -99,6 +152,10 @@ class CheckpointManager:
         self._last_checkpoint_hash: bytes | None = None
         self._last_checkpoint: TorrentCheckpoint | None = None
 
+        # Journals of incremental binary checkpoints, by info hash
+        self._journals: dict[bytes, _ActiveJournal] = {}
+        self._journal_locks: dict[bytes, asyncio.Lock] = {}
+
         self.logger.info(
             "Checkpoint manager initialized with directory: %s",
             self.checkpoint_dir,
@@ -128,6 +185,10 @@ class CheckpointManager:
             msg
         )  # pragma: no cover - Invalid checkpoint format validation, defensive error handling
 
+    def _get_journal_path(self, info_hash: bytes) -> Path:
+        """Get the journal path of a binary checkpoint."""
+        return self.checkpoint_dir / f"{info_hash.hex()}{JOURNAL_SUFFIX}"
+
     def _calculate_checkpoint_hash(self, checkpoint: TorrentCheckpoint) -> bytes:
         """Calculate hash of checkpoint state for deduplication.
 
@@ -158,12 +219,15 @@ class CheckpointManager:
         self,
         checkpoint: TorrentCheckpoint,
         checkpoint_format: CheckpointFormat | None = None,
+        changed_pieces: Iterable[int] | None = None,
     ) -> Path:
         """Save checkpoint to disk.
 
         Args:
             checkpoint: Checkpoint data to save
             checkpoint_format: Format to save in (uses config default if None)
+            changed_pieces: Pieces verified since the previous save; journal
+                appends then compare only these instead of every piece
 
         Returns:
             Path to saved checkpoint file
@@ -176,31 +240,41 @@ class CheckpointManager:
             msg = "Checkpointing is disabled"
             raise CheckpointError(msg)
 
-        # Check for deduplication
-        if self.config.checkpoint_deduplication:
+        checkpoint_format = checkpoint_format or self.config.checkpoint_format
+        save_binary = (
+            functools.partial(
+                self._save_incremental_checkpoint, changed_pieces=changed_pieces
+            )
+            if self.config.checkpoint_incremental
+            else self._save_binary_checkpoint
+        )
+
+        # Check for deduplication (journal appends skip unchanged state
+        # themselves, without hashing the whole checkpoint)
+        if self.config.checkpoint_deduplication and not (
+            self.config.checkpoint_incremental
+            and checkpoint_format == CheckpointFormat.BINARY
+        ):
             current_hash = self._calculate_checkpoint_hash(checkpoint)
             if self._last_checkpoint_hash == current_hash:
                 self.logger.debug("Checkpoint unchanged, skipping save")
                 # Return existing path
-                checkpoint_format = checkpoint_format or self.config.checkpoint_format
                 return self._get_checkpoint_path(
                     checkpoint.info_hash, checkpoint_format
                 )
             self._last_checkpoint_hash = current_hash
 
-        checkpoint_format = checkpoint_format or self.config.checkpoint_format
-
         try:
             if checkpoint_format == CheckpointFormat.JSON:
                 path = await self._save_json_checkpoint(checkpoint)
             elif checkpoint_format == CheckpointFormat.BINARY:
-                path = await self._save_binary_checkpoint(checkpoint)
+                path = await save_binary(checkpoint)
             elif (
                 checkpoint_format == CheckpointFormat.BOTH
             ):  # pragma: no cover - Both format path, tested but not all branches covered
                 # Save both checkpoint_formats
                 json_path = await self._save_json_checkpoint(checkpoint)
-                bin_path = await self._save_binary_checkpoint(checkpoint)
+                bin_path = await save_binary(checkpoint)
                 self.logger.debug(
                     "Saved checkpoint in both checkpoint_formats: %s, %s",
                     json_path,
@@ -281,161 +355,90 @@ class CheckpointManager:
         self.logger.debug("Saved JSON checkpoint: %s", path)
         return path
 
-    async def _save_binary_checkpoint(self, checkpoint: TorrentCheckpoint) -> Path:
-        """Save checkpoint in binary checkpoint_format."""
+    async def _save_binary_checkpoint(
+        self,
+        checkpoint: TorrentCheckpoint,
+        snapshot_id: bytes | None = None,
+    ) -> Path:
+        """Save checkpoint in binary checkpoint_format.
+
+        The file is written next to the old one and renamed over it, so a
+        crash leaves either the old or the new checkpoint on disk.
+
+        Args:
+            checkpoint: Checkpoint data to save
+            snapshot_id: Id of the journal started with this snapshot
+
+        """
         if not HAS_MSGPACK:
             msg = "msgpack is required for binary checkpoint checkpoint_format"
             raise CheckpointError(msg)
 
         path = self._get_checkpoint_path(checkpoint.info_hash, CheckpointFormat.BINARY)
+        tmp_path = path.with_name(path.name + ".tmp")
 
         # Update timestamp
         checkpoint.updated_at = time.time()
 
-        # Prepare binary data
-        def _write_binary():
-            with open(path, "wb") as f:
-                # Write header
-                f.write(self.MAGIC_BYTES)  # 4 bytes
-                f.write(struct.pack("B", self.VERSION))  # 1 byte
-                f.write(checkpoint.info_hash)  # 20 bytes
-                f.write(
-                    struct.pack("Q", int(checkpoint.updated_at)),
-                )  # 8 bytes timestamp
-                f.write(struct.pack("I", checkpoint.total_pieces))  # 4 bytes
-
-                # Write verified pieces bitfield
-                bitfield = bytearray((checkpoint.total_pieces + 7) // 8)
-                for piece_idx in checkpoint.verified_pieces:
-                    byte_idx = piece_idx // 8
-                    bit_idx = piece_idx % 8
-                    bitfield[byte_idx] |= 1 << (7 - bit_idx)
-                f.write(bitfield)
-
-                # Write metadata as msgpack
-                metadata = {
-                    "torrent_name": checkpoint.torrent_name,
-                    "piece_length": checkpoint.piece_length,
-                    "total_length": checkpoint.total_length,
-                    "piece_states": {
-                        str(k): v.value for k, v in checkpoint.piece_states.items()
-                    },
-                    "download_stats": (
-                        checkpoint.download_stats.model_dump()
-                        if checkpoint.download_stats is not None
-                        else DownloadStats().model_dump()
-                    ),
-                    "output_dir": checkpoint.output_dir,
-                    "files": [f.model_dump() for f in checkpoint.files],
-                    "peer_info": checkpoint.peer_info,
-                    "endgame_mode": checkpoint.endgame_mode,
-                    "torrent_file_path": checkpoint.torrent_file_path,
-                    "magnet_uri": checkpoint.magnet_uri,
-                    "announce_urls": checkpoint.announce_urls,
-                    "display_name": checkpoint.display_name,
-                }
+        def _write_binary_data(f):
+            # Header: magic, version, info hash, timestamp, piece count
+            f.write(self.MAGIC_BYTES)  # 4 bytes
+            f.write(struct.pack("B", self.VERSION))  # 1 byte
+            f.write(checkpoint.info_hash)  # 20 bytes
+            f.write(struct.pack("Q", int(checkpoint.updated_at)))  # 8 bytes
+            f.write(struct.pack("I", checkpoint.total_pieces))  # 4 bytes
+            f.write(
+                _encode_bitfield(checkpoint.verified_pieces, checkpoint.total_pieces)
+            )
 
-                if not HAS_MSGPACK or msgpack is None:
-                    msg = "msgpack not available for binary checkpoint write"
-                    raise CheckpointError(
-                        msg,
-                    )
-                metadata_bytes = msgpack.packb(metadata)  # type: ignore[attr-defined]
-                f.write(struct.pack("I", len(metadata_bytes)))  # 4 bytes length
-                f.write(metadata_bytes)
-                f.flush()  # Ensure Python buffer is written
-                os.fsync(f.fileno())  # Ensure OS buffer is written to disk
-                # Verify file was actually written by checking size
-                f.seek(0, os.SEEK_END)
-                file_size = f.tell()
-                if file_size == 0:
-                    msg = "File was created but is empty"
-                    raise OSError(msg)
+            # Metadata as msgpack, with piece states as one code byte per piece
+            metadata = snapshot_metadata(checkpoint)
+            metadata["piece_state_codes"] = encode_piece_states(
+                checkpoint.piece_states, checkpoint.total_pieces
+            )
+            if snapshot_id is not None:
+                metadata["snapshot_id"] = snapshot_id
 
-        if self.config.checkpoint_compression:
-            # Compress the binary data using configured algorithm
-            algo = self.config.checkpoint_compression_algorithm.lower()
+            if not HAS_MSGPACK or msgpack is None:
+                msg = "msgpack not available for binary checkpoint write"
+                raise CheckpointError(
+                    msg,
+                )
+            metadata_bytes = msgpack.packb(metadata)  # type: ignore[attr-defined]
+            f.write(struct.pack("I", len(metadata_bytes)))  # 4 bytes length
+            f.write(metadata_bytes)
 
-            def _write_compressed():
-                if algo == "zstd" and HAS_ZSTD and zstd is not None:
+        def _write_binary():
+            with open(tmp_path, "wb") as f:
+                if not self.config.checkpoint_compression:
+                    _write_binary_data(f)
+                elif (
+                    self.config.checkpoint_compression_algorithm.lower() == "zstd"
+                    and HAS_ZSTD
+                    and zstd is not None
+                ):
                     # Use zstd for faster compression
                     compressor = zstd.ZstdCompressor(level=3)  # Balanced speed/ratio
-                    with open(path, "wb") as f, compressor.stream_writer(f) as writer:
+                    with compressor.stream_writer(f, closefd=False) as writer:
                         _write_binary_data(writer)
                 else:  # pragma: no cover - gzip fallback path, zstd is default when available
-                    # Fallback to gzip
-                    with open(path, "wb") as f, gzip.GzipFile(
-                        fileobj=f, mode="wb"
-                    ) as gz:
+                    with gzip.GzipFile(fileobj=f, mode="wb") as gz:
                         _write_binary_data(gz)
+                f.flush()  # Ensure Python buffer is written
+                os.fsync(f.fileno())  # Ensure OS buffer is written to disk
+                if f.tell() == 0:
+                    msg = "File was created but is empty"
+                    raise OSError(msg)
+            os.replace(tmp_path, path)
 
-            def _write_binary_data(f):
-                f.write(self.MAGIC_BYTES)
-                f.write(struct.pack("B", self.VERSION))
-                f.write(checkpoint.info_hash)
-                f.write(struct.pack("Q", int(checkpoint.updated_at)))
-                f.write(struct.pack("I", checkpoint.total_pieces))
-
-                bitfield = bytearray((checkpoint.total_pieces + 7) // 8)
-                for piece_idx in checkpoint.verified_pieces:
-                    byte_idx = piece_idx // 8
-                    bit_idx = piece_idx % 8
-                    bitfield[byte_idx] |= 1 << (7 - bit_idx)
-                f.write(bitfield)
-
-                metadata = {
-                    "torrent_name": checkpoint.torrent_name,
-                    "piece_length": checkpoint.piece_length,
-                    "total_length": checkpoint.total_length,
-                    "piece_states": {
-                        str(k): v.value for k, v in checkpoint.piece_states.items()
-                    },
-                    "download_stats": (
-                        checkpoint.download_stats.model_dump()
-                        if checkpoint.download_stats is not None
-                        else DownloadStats().model_dump()
-                    ),
-                    "output_dir": checkpoint.output_dir,
-                    "files": [f.model_dump() for f in checkpoint.files],
-                    "peer_info": checkpoint.peer_info,
-                    "endgame_mode": checkpoint.endgame_mode,
-                    "torrent_file_path": checkpoint.torrent_file_path,
-                    "magnet_uri": checkpoint.magnet_uri,
-                    "announce_urls": checkpoint.announce_urls,
-                    "display_name": checkpoint.display_name,
-                }
-
-                if not HAS_MSGPACK or msgpack is None:
-                    msg = "msgpack not available for binary checkpoint write"
-                    raise CheckpointError(
-                        msg,
-                    )
-                metadata_bytes = msgpack.packb(metadata)  # type: ignore[attr-defined]
-                f.write(struct.pack("I", len(metadata_bytes)))
-                f.write(metadata_bytes)
-                # Note: For compressed writes, the file handle is managed by the compression library
-                # which should handle flushing, but we ensure it's synced after the context manager
-
-            try:
-                await asyncio.get_event_loop().run_in_executor(None, _write_compressed)
-
-                # Ensure compressed file is synced to disk
-                def _sync_compressed():
-                    with open(path, "rb+") as f:
-                        os.fsync(f.fileno())
-
-                await asyncio.get_event_loop().run_in_executor(None, _sync_compressed)
-            except Exception as e:
-                self.logger.exception("Failed to write compressed binary checkpoint")
-                msg = f"Failed to write compressed binary checkpoint: {e}"
-                raise CheckpointError(msg) from e
-        else:
-            try:
-                await asyncio.get_event_loop().run_in_executor(None, _write_binary)
-            except Exception as e:
-                self.logger.exception("Failed to write binary checkpoint")
-                msg = f"Failed to write binary checkpoint: {e}"
-                raise CheckpointError(msg) from e
+        try:
+            await asyncio.get_event_loop().run_in_executor(None, _write_binary)
+        except Exception as e:
+            with contextlib.suppress(OSError):
+                tmp_path.unlink()
+            self.logger.exception("Failed to write binary checkpoint")
+            msg = f"Failed to write binary checkpoint: {e}"
+            raise CheckpointError(msg) from e
 
         # Verify file was actually created
         # Add a small delay on Windows to account for file system delays
@@ -473,6 +476,79 @@ class CheckpointManager:
         self.logger.debug("Saved binary checkpoint: %s", path)
         return path
 
+    async def _save_incremental_checkpoint(
+        self,
+        checkpoint: TorrentCheckpoint,
+        changed_pieces: Iterable[int] | None = None,
+    ) -> Path:
+        """Save a binary checkpoint by appending to its journal.
+
+        The first save of a torrent, and any save once the journal has
+        outgrown the snapshot, writes a full snapshot and starts an empty
+        journal for it (compaction). Other saves append only the pieces and
+        metadata changed since the previous save, looking only at
+        ``changed_pieces`` when it is given.
+        """
+        info_hash = checkpoint.info_hash
+        lock = self._journal_locks.setdefault(info_hash, asyncio.Lock())
+        loop = asyncio.get_event_loop()
+        async with lock:
+            active = self._journals.get(info_hash)
+            if active is not None and active.journal.size < max(
+                self.JOURNAL_COMPACT_MIN,
+                self.JOURNAL_COMPACT_RATIO * active.snapshot_size,
+            ):
+                checkpoint.updated_at = time.time()
+                records = active.state.diff(checkpoint, changed_pieces)
+                try:
+                    await loop.run_in_executor(None, active.journal.append, records)
+                except Exception:
+                    # The journal may hold a partial record; start over
+                    await self._close_journal(info_hash)
+                    raise
+                return self._get_checkpoint_path(info_hash, CheckpointFormat.BINARY)
+
+            await self._close_journal(info_hash)
+            snapshot_id = os.urandom(8)
+            path = await self._save_binary_checkpoint(checkpoint, snapshot_id)
+            # Until the new journal exists, the old one is ignored on load
+            # because its snapshot id no longer matches
+            journal = await loop.run_in_executor(
+                None,
+                CheckpointJournal.create,
+                self._get_journal_path(info_hash),
+                info_hash,
+                snapshot_id,
+                self.config.checkpoint_batch_interval,
+            )
+            self._journals[info_hash] = _ActiveJournal(
+                journal, JournalState.from_checkpoint(checkpoint), path.stat().st_size
+            )
+            return path
+
+    async def _close_journal(self, info_hash: bytes) -> None:
+        """Commit and close the journal of a torrent, if one is open."""
+        active = self._journals.pop(info_hash, None)
+        if active is not None:
+            await asyncio.get_event_loop().run_in_executor(None, active.journal.close)
+
+    async def close_journal(self, info_hash: bytes) -> None:
+        """Commit pending journal records of a torrent and close its journal.
+
+        The next save of the torrent writes a new snapshot.
+
+        Args:
+            info_hash: Torrent info hash
+
+        """
+        async with self._journal_locks.setdefault(info_hash, asyncio.Lock()):
+            await self._close_journal(info_hash)
+
+    async def flush_journals(self) -> None:
+        """Commit pending journal records of all torrents and close the journals."""
+        for info_hash in list(self._journals):
+            await self.close_journal(info_hash)
+
     async def load_checkpoint(
         self,
         info_hash: bytes,
@@ -614,11 +690,20 @@ class CheckpointManager:
 
         def _read_binary():
             with open(path, "rb") as f:
-                if self.config.checkpoint_compression:
+                # Detect compression from the data; the configured algorithm
+                # may have changed since the file was written
+                magic = f.read(4)
+                f.seek(0)
+                if magic[:2] == GZIP_MAGIC:
                     with gzip.GzipFile(fileobj=f, mode="rb") as gz:
                         return _read_binary_data(gz)
-                else:
-                    return _read_binary_data(f)
+                if magic == ZSTD_MAGIC:
+                    if not HAS_ZSTD or zstd is None:
+                        msg = "zstandard is required to read this checkpoint"
+                        raise CheckpointError(msg)
+                    with zstd.ZstdDecompressor().stream_reader(f) as reader:
+                        return _read_binary_data(reader)
+                return _read_binary_data(f)
 
         def _read_binary_data(f):
             # Read header
@@ -644,15 +729,7 @@ class CheckpointManager:
 
             # Read bitfield
             bitfield_size = (total_pieces + 7) // 8
-            bitfield = f.read(bitfield_size)
-
-            # Parse verified pieces from bitfield
-            verified_pieces = []
-            for byte_idx, byte_val in enumerate(bitfield):
-                for bit_idx in range(8):
-                    piece_idx = byte_idx * 8 + bit_idx
-                    if piece_idx < total_pieces and (byte_val & (1 << (7 - bit_idx))):
-                        verified_pieces.append(piece_idx)
+            verified = _decode_bitfield(f.read(bitfield_size), total_pieces)
 
             # Read metadata
             metadata_len = struct.unpack("I", f.read(4))[0]
@@ -664,21 +741,38 @@ class CheckpointManager:
                 )
             metadata = msgpack.unpackb(metadata_bytes, raw=False)  # type: ignore[attr-defined]
 
-            # Convert string values back to PieceState enums
-            if "piece_states" in metadata:
-                metadata["piece_states"] = {
-                    int(k): PieceState(v) for k, v in metadata["piece_states"].items()
+            # Piece states are stored as code bytes, or as a map of strings
+            # by older versions
+            if "piece_state_codes" in metadata:
+                piece_states = decode_piece_states(metadata["piece_state_codes"])
+            else:
+                piece_states = {
+                    int(k): PieceState(v)
+                    for k, v in metadata.get("piece_states", {}).items()
                 }
 
+            # Replay the changes journaled since the snapshot was written
+            if metadata.get("snapshot_id"):
+                apply_records(
+                    CheckpointJournal.read(
+                        self._get_journal_path(info_hash),
+                        info_hash,
+                        metadata["snapshot_id"],
+                    ),
+                    verified,
+                    piece_states,
+                    metadata,
+                )
+
             # Create checkpoint object
             checkpoint_dict = {
                 "version": "1.0",
                 "info_hash": info_hash,
                 "created_at": timestamp,  # Use timestamp as created_at
-                "updated_at": timestamp,
+                "updated_at": metadata.get("updated_at", timestamp),
                 "total_pieces": total_pieces,
-                "verified_pieces": verified_pieces,
-                "piece_states": metadata.get("piece_states", {}),
+                "verified_pieces": sorted(verified),
+                "piece_states": piece_states,
                 "download_stats": DownloadStats(**metadata.get("download_stats", {})),
                 "files": [FileCheckpoint(**f) for f in metadata.get("files", [])],
                 "peer_info": metadata.get("peer_info"),
@@ -740,6 +834,13 @@ class CheckpointManager:
             deleted = True
             self.logger.debug("Deleted binary checkpoint: %s", bin_path)
 
+        # Delete journal of the binary checkpoint
+        await self.close_journal(info_hash)
+        journal_path = self._get_journal_path(info_hash)
+        if journal_path.exists():
+            journal_path.unlink()
+            self.logger.debug("Deleted checkpoint journal: %s", journal_path)
+
         return deleted
 
     async def list_checkpoints(self) -> list[CheckpointFileInfo]:
@@ -936,7 +1037,10 @@ class CheckpointManager:
         cutoff_time = time.time() - (max_age_days * 24 * 60 * 60)
         deleted_count = 0
 
-        for file_path in self.checkpoint_dir.glob("*.checkpoint.*"):
+        for file_path in itertools.chain(
+            self.checkpoint_dir.glob("*.checkpoint.*"),
+            self.checkpoint_dir.glob(f"*{JOURNAL_SUFFIX}"),
+        ):
             try:
                 if file_path.stat().st_mtime < cutoff_time:
                     file_path.unlink()
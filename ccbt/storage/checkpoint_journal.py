@@ -0,0 +1,378 @@
+"""Append-only journal for incremental binary checkpoints.
+
+A binary checkpoint is a base snapshot (the ``.checkpoint.bin*`` file) plus
+a journal (``<info_hash>.journal``) of the changes made since the snapshot
+was written. A save appends only the pieces verified or changed since the
+previous save, so its cost depends on what changed rather than on the
+number of pieces in the torrent.
+
+Journal layout::
+
+    header:  magic "CCBJ", version (u8), info hash (20 bytes), snapshot id (8 bytes)
+    frames:  length (u32), CRC-32 (u32), records
+    records: type (u8), length (u32), body
+
+Each save appends one frame holding all of its records, so a save is
+replayed either completely or not at all.
+
+Every snapshot gets a random id, which is written to the snapshot and to
+the header of the journal started with it. A journal whose id does not
+match the snapshot (left over from a crash between writing a new snapshot
+and starting its journal) is ignored. Frames are read up to the first
+short or corrupt frame, so a torn write at the end of the journal is
+dropped.
+
+Frames are written as they are saved but only fsynced once per group
+interval, so a crash loses at most the saves of the last group.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import os
+import struct
+import time
+import zlib
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import TYPE_CHECKING, Any
+
+from ccbt.models import DownloadStats, PieceState
+
+if TYPE_CHECKING:  # pragma: no cover - type checking only, not executed at runtime
+    from collections.abc import Iterable, Iterator
+    from pathlib import Path
+
+    from ccbt.models import TorrentCheckpoint
+
+try:
+    import msgpack
+
+    HAS_MSGPACK = True
+except Exception:  # pragma: no cover - Import exception handling, tested via mocking
+    HAS_MSGPACK = False
+    msgpack = None  # type: ignore[assignment]
+
+JOURNAL_MAGIC = b"CCBJ"
+JOURNAL_VERSION = 1
+JOURNAL_SUFFIX = ".journal"
+
+_HEADER = struct.Struct("<4sB20s8s")
+_FRAME = struct.Struct("<II")
+_RECORD = struct.Struct("<BI")
+_INDEX = struct.Struct("<I")
+_STATE = struct.Struct("<IB")
+
+# Byte codes of piece states; ABSENT marks a piece with no recorded state
+PIECE_STATES = list(PieceState)
+_STATE_CODES = {state: code for code, state in enumerate(PIECE_STATES)}
+ABSENT = 0xFF
+
+
+class RecordType(IntEnum):
+    """Journal record types."""
+
+    VERIFIED = 1  # Piece indices added to the verified set
+    UNVERIFIED = 2  # Piece indices removed from the verified set
+    PIECE_STATES = 3  # (piece index, state code) pairs
+    METADATA = 4  # msgpack map of changed metadata fields
+
+
+# Checkpoint fields stored in the metadata map of snapshots
+METADATA_FIELDS = (
+    "torrent_name",
+    "piece_length",
+    "total_length",
+    "download_stats",
+    "output_dir",
+    "files",
+    "peer_info",
+    "endgame_mode",
+    "torrent_file_path",
+    "magnet_uri",
+    "announce_urls",
+    "display_name",
+)
+
+
+def _dump_field(name: str, value: Any) -> Any:
+    """Return a metadata field in the form stored in snapshots."""
+    if name == "download_stats":
+        return (value if value is not None else DownloadStats()).model_dump()
+    if name == "files":
+        return [f.model_dump() for f in value]
+    if name == "announce_urls":
+        return list(value)
+    return value
+
+
+def snapshot_metadata(checkpoint: TorrentCheckpoint) -> dict[str, Any]:
+    """Return the metadata of a checkpoint as stored in snapshots."""
+    return {
+        name: _dump_field(name, getattr(checkpoint, name)) for name in METADATA_FIELDS
+    }
+
+
+def encode_piece_states(piece_states: dict[int, Any], total_pieces: int) -> bytes:
+    """Encode piece states as one state code byte per piece."""
+    codes = bytearray([ABSENT]) * total_pieces
+    for index, state in piece_states.items():
+        if 0 <= index < total_pieces:
+            codes[index] = _STATE_CODES[PieceState(state)]
+    return bytes(codes)
+
+
+def decode_piece_states(codes: bytes) -> dict[int, PieceState]:
+    """Decode piece states encoded by :func:`encode_piece_states`."""
+    return {
+        index: PIECE_STATES[code] for index, code in enumerate(codes) if code != ABSENT
+    }
+
+
+@dataclass
+class JournalState:
+    """Checkpoint state covered by the snapshot and journal on disk.
+
+    New checkpoints are compared against it to find the records to append.
+    Metadata fields are kept as the checkpoint's own values and only dumped
+    when they change, so every save must pass a freshly built checkpoint.
+    """
+
+    verified: set[int] = field(default_factory=set)
+    piece_states: dict[int, PieceState] = field(default_factory=dict)
+    metadata: dict[str, Any] = field(default_factory=dict)
+
+    @classmethod
+    def from_checkpoint(cls, checkpoint: TorrentCheckpoint) -> JournalState:
+        """Capture the state of a checkpoint that was just written in full."""
+        return cls(
+            set(checkpoint.verified_pieces),
+            {k: PieceState(v) for k, v in checkpoint.piece_states.items()},
+            {name: getattr(checkpoint, name) for name in METADATA_FIELDS},
+        )
+
+    def diff(
+        self,
+        checkpoint: TorrentCheckpoint,
+        changed_pieces: Iterable[int] | None = None,
+    ) -> list[tuple[RecordType, bytes]]:
+        """Return the records turning this state into ``checkpoint``.
+
+        If ``changed_pieces`` is given (the pieces verified since the
+        previous save), only those pieces are compared; otherwise every
+        piece is. The state is updated to match ``checkpoint``.
+        """
+        records: list[tuple[RecordType, bytes]] = []
+        states = checkpoint.piece_states
+        if changed_pieces is None:
+            verified = set(checkpoint.verified_pieces)
+            added = verified - self.verified
+            removed = self.verified - verified
+            changed = dict(states.items() - self.piece_states.items())
+            dropped = self.piece_states.keys() - states.keys()
+        else:
+            pieces = set(changed_pieces)
+            added = pieces - self.verified
+            removed = set()
+            changed = {
+                index: states[index]
+                for index in pieces
+                if index in states and self.piece_states.get(index) != states[index]
+            }
+            dropped = set()
+        if added:
+            records.append((RecordType.VERIFIED, _pack_indices(added)))
+            self.verified |= added
+        if removed:
+            records.append((RecordType.UNVERIFIED, _pack_indices(removed)))
+            self.verified -= removed
+
+        if changed or dropped:
+            body = bytearray()
+            for index, state in changed.items():
+                piece_state = PieceState(state)
+                body += _STATE.pack(index, _STATE_CODES[piece_state])
+                self.piece_states[index] = piece_state
+            for index in dropped:
+                body += _STATE.pack(index, ABSENT)
+                del self.piece_states[index]
+            records.append((RecordType.PIECE_STATES, bytes(body)))
+
+        updates: dict[str, Any] = {}
+        for name in METADATA_FIELDS:
+            value = getattr(checkpoint, name)
+            if self.metadata.get(name) != value:
+                updates[name] = _dump_field(name, value)
+                self.metadata[name] = value
+        if updates or records:
+            updates["updated_at"] = checkpoint.updated_at
+            records.append((RecordType.METADATA, _packb(updates)))
+        return records
+
+
+def _pack_indices(indices: Iterable[int]) -> bytes:
+    indices = sorted(indices)
+    return struct.pack(f"<{len(indices)}I", *indices)
+
+
+def _unpack_indices(body: bytes) -> tuple[int, ...]:
+    return struct.unpack(f"<{len(body) // _INDEX.size}I", body)
+
+
+def _packb(value: Any) -> bytes:
+    if not HAS_MSGPACK or msgpack is None:
+        msg = "msgpack is required for checkpoint journals"
+        raise RuntimeError(msg)
+    return msgpack.packb(value)  # type: ignore[attr-defined]
+
+
+def apply_records(
+    records: Iterable[tuple[RecordType, bytes]],
+    verified: set[int],
+    piece_states: dict[int, PieceState],
+    metadata: dict[str, Any],
+) -> None:
+    """Replay journal records onto snapshot state in place."""
+    for record_type, body in records:
+        if record_type == RecordType.VERIFIED:
+            verified.update(_unpack_indices(body))
+        elif record_type == RecordType.UNVERIFIED:
+            verified.difference_update(_unpack_indices(body))
+        elif record_type == RecordType.PIECE_STATES:
+            for index, code in _STATE.iter_unpack(body):
+                if code == ABSENT:
+                    piece_states.pop(index, None)
+                else:
+                    piece_states[index] = PIECE_STATES[code]
+        elif record_type == RecordType.METADATA and msgpack is not None:
+            metadata.update(msgpack.unpackb(body, raw=False))  # type: ignore[attr-defined]
+
+
+class CheckpointJournal:
+    """Writer for the journal of one checkpoint snapshot.
+
+    Attributes:
+        path: Journal file
+        group_interval: Seconds between fsyncs of appended records
+
+    """
+
+    def __init__(self, path: Path, fd: int, size: int, group_interval: float):
+        """Initialize journal writer (use :meth:`create`)."""
+        self.path = path
+        self.group_interval = group_interval
+        self._fd: int | None = fd
+        self._size = size
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+    @classmethod
+    def create(
+        cls,
+        path: Path,
+        info_hash: bytes,
+        snapshot_id: bytes,
+        group_interval: float = 5.0,
+    ) -> CheckpointJournal:
+        """Start an empty journal for a snapshot, replacing any old journal.
+
+        The header is written to a temporary file that is renamed over the
+        old journal, so a crash leaves either the old or the new journal.
+        """
+        header = _HEADER.pack(JOURNAL_MAGIC, JOURNAL_VERSION, info_hash, snapshot_id)
+        tmp_path = path.with_name(path.name + ".tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(header)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+        fd = os.open(path, os.O_WRONLY | os.O_APPEND | getattr(os, "O_BINARY", 0))
+        return cls(path, fd, len(header), group_interval)
+
+    @property
+    def size(self) -> int:
+        """Bytes in the journal file."""
+        return self._size
+
+    def append(self, records: Iterable[tuple[RecordType, bytes]]) -> int:
+        """Append the records of one save as a frame.
+
+        The journal is fsynced if the group interval has passed.
+
+        Returns:
+            Number of bytes written
+
+        """
+        if self._fd is None:
+            msg = f"Journal {self.path} is closed"
+            raise ValueError(msg)
+        frame = bytearray()
+        for record_type, body in records:
+            frame += _RECORD.pack(record_type, len(body))
+            frame += body
+        if not frame:
+            return 0
+        data = _FRAME.pack(len(frame), zlib.crc32(frame)) + frame
+        view = memoryview(data)
+        while view:
+            view = view[os.write(self._fd, view) :]
+        self._size += len(data)
+        self._unsynced += 1
+        if time.monotonic() - self._last_sync >= self.group_interval:
+            self.sync()
+        return len(data)
+
+    def sync(self) -> None:
+        """Fsync appended frames (commit the current group)."""
+        if self._fd is not None and self._unsynced:
+            os.fsync(self._fd)
+            self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+    def close(self) -> None:
+        """Commit pending frames and close the journal."""
+        if self._fd is not None:
+            self.sync()
+            os.close(self._fd)
+            self._fd = None
+
+    @staticmethod
+    def read(
+        path: Path,
+        info_hash: bytes,
+        snapshot_id: bytes,
+    ) -> Iterator[tuple[RecordType, bytes]]:
+        """Read the intact records of the journal belonging to a snapshot.
+
+        Yields nothing if the journal is missing or was started for another
+        snapshot. Reading stops at the first short or corrupt frame.
+        """
+        try:
+            data = path.read_bytes()
+        except FileNotFoundError:
+            return
+        if len(data) < _HEADER.size:
+            return
+        magic, version, journal_hash, journal_id = _HEADER.unpack_from(data)
+        if (
+            magic != JOURNAL_MAGIC
+            or version != JOURNAL_VERSION
+            or journal_hash != info_hash
+            or journal_id != snapshot_id
+        ):
+            return
+        pos = _HEADER.size
+        while pos + _FRAME.size <= len(data):
+            length, crc = _FRAME.unpack_from(data, pos)
+            pos += _FRAME.size
+            frame = data[pos : pos + length]
+            if len(frame) < length or zlib.crc32(frame) != crc:
+                return
+            pos += length
+            offset = 0
+            while offset + _RECORD.size <= length:
+                record_type, size = _RECORD.unpack_from(frame, offset)
+                offset += _RECORD.size
+                with contextlib.suppress(ValueError):  # Unknown types are skipped
+                    yield RecordType(record_type), frame[offset : offset + size]
+                offset += size
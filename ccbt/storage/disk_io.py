@@ -56,6 +56,8 @@ import contextlib
 from ccbt.config.config import get_config
 from ccbt.config.config_capabilities import SystemCapabilities
 from ccbt.models import PreallocationStrategy
+from ccbt.monitoring import get_tracing_manager
+from ccbt.monitoring.tracing import TraceContext
 from ccbt.storage.buffers import get_buffer_manager
 from ccbt.utils.exceptions import DiskError
 from ccbt.utils.logging_config import get_logger
@@ -1063,6 +1065,17 @@ class DiskIOManager:
         if not writes_to_process:
             return
 
+        with TraceContext(
+            get_tracing_manager(),
+            "disk.flush",
+            attributes={"file": file_path.name, "writes": len(writes_to_process)},
+        ):
+            await self._flush_writes(file_path, writes_to_process)
+
+    async def _flush_writes(
+        self, file_path: Path, writes_to_process: list[WriteRequest]
+    ) -> None:
+        """Combine and write a file's pending writes, then resolve their futures."""
         # Sort writes by offset (or LBA if enabled) for optimal disk access
         if self.config.disk.io_schedule_by_lba:
             # Sort by file path first, then by offset (approximates LBA ordering)
@@ -1655,15 +1668,8 @@ class DiskIOManager:
             return None
 
         try:
-            chunk_path = await dedup.check_chunk_exists(chunk_hash)
-            if not chunk_path or not chunk_path.exists():
-                return None
-
-            # Read chunk data
-            return await asyncio.get_event_loop().run_in_executor(
-                self.executor,
-                chunk_path.read_bytes,
-            )
+            # Index lookup plus one positional read from the chunk's pack
+            return await dedup.read_chunk(chunk_hash)
 
         except Exception as e:
             self.logger.warning(
@@ -5,12 +5,16 @@ from __future__ import annotations
 import asyncio
 import logging
 import os
-from typing import Any, Sized
+from typing import TYPE_CHECKING, Any, Callable, Sized
 
 from ccbt.config.config import get_config
 from ccbt.core.torrent_attributes import apply_file_attributes, verify_file_sha1
 from ccbt.models import TorrentCheckpoint, TorrentInfo
 from ccbt.storage.disk_io import DiskIOManager
+from ccbt.storage.resume_verifier import ResumeProgress, ResumeVerifier
+
+if TYPE_CHECKING:  # pragma: no cover - type checking only, not executed at runtime
+    from concurrent.futures import Executor
 
 
 class FileSegment:
@@ -271,6 +275,7 @@ class AsyncFileAssembler:
             self.piece_length = torrent_data.piece_length
             self.pieces = torrent_data.pieces
             self.num_pieces = torrent_data.num_pieces
+            self.piece_layers = torrent_data.piece_layers
         else:
             # Legacy dict format
             self.name = torrent_data.get("name", "unknown")
@@ -280,6 +285,7 @@ class AsyncFileAssembler:
             self.piece_length = torrent_data.get("piece_length", 0)
             self.pieces = torrent_data.get("pieces", [])
             self.num_pieces = torrent_data.get("num_pieces", 0)
+            self.piece_layers = torrent_data.get("piece_layers")
 
         # Create output directory if it doesn't exist
         os.makedirs(output_dir, exist_ok=True)
@@ -301,6 +307,7 @@ class AsyncFileAssembler:
             cache_size_mb=self.config.disk.cache_size_mb,
         )
         self._disk_io_started = False
+        self._piece_verifier: ResumeVerifier | None = None
 
     async def __aenter__(self):
         """Async context manager entry."""
@@ -839,6 +846,50 @@ class AsyncFileAssembler:
         """Get list of all file paths that will be created."""
         return list({seg.file_path for seg in self.file_segments})
 
+    def get_file_sizes(self) -> dict[str, int]:
+        """Get expected size of every file by path."""
+        sizes: dict[str, int] = {}
+        for seg in self.file_segments:
+            sizes[seg.file_path] = max(sizes.get(seg.file_path, 0), seg.end_offset)
+        return sizes
+
+    def verify_files_exist(self) -> dict[str, bool]:
+        """Check which files exist on disk, by path."""
+        return {path: os.path.exists(path) for path in self.get_file_paths()}
+
+    def get_resume_verifier(
+        self,
+        progress_callback: Callable[[ResumeProgress], None] | None = None,
+        hash_executor: Executor | None = None,
+    ) -> ResumeVerifier:
+        """Create a verifier checking pieces against the files on disk.
+
+        Args:
+            progress_callback: Called with the progress after every piece
+            hash_executor: Executor running the hashing (None for the loop
+                default)
+
+        """
+        return ResumeVerifier(
+            self.file_segments,
+            self.pieces,
+            self.piece_length,
+            self.total_length,
+            hash_executor=hash_executor,
+            progress_callback=progress_callback,
+            piece_layers=(
+                self.piece_layers.values()
+                if isinstance(self.piece_layers, dict)
+                else None
+            ),
+        )
+
+    async def verify_piece_hash(self, piece_index: int, expected_hash: bytes) -> bool:
+        """Read a piece from disk and check it against its SHA-1 or v2 hash."""
+        if self._piece_verifier is None:
+            self._piece_verifier = self.get_resume_verifier()
+        return await self._piece_verifier.verify_piece(piece_index, expected_hash)
+
     async def _apply_file_attributes(self, file_info, file_path: str) -> None:
         """Apply BEP 47 file attributes to a completed file.
 
@@ -1012,11 +1063,19 @@ class AsyncFileAssembler:
     async def verify_existing_pieces(
         self,
         checkpoint: TorrentCheckpoint,
+        progress_callback: Callable[[ResumeProgress], None] | None = None,
+        hash_executor: Executor | None = None,
     ) -> dict[str, Any]:
         """Verify that pieces mentioned in checkpoint actually exist and are valid.
 
+        Files whose size and modification time match the checkpoint are
+        trusted; verified pieces in changed files are rehashed.
+
         Args:
             checkpoint: TorrentCheckpoint with piece information
+            progress_callback: Called with the rehash progress after every piece
+            hash_executor: Executor running the rehashing (None for the loop
+                default)
 
         Returns:
             Dict with validation results
@@ -1025,8 +1084,10 @@ class AsyncFileAssembler:
         validation_results: dict[str, Any] = {
             "valid": True,
             "missing_files": [],  # type: list[str]
-            "corrupted_pieces": [],  # type: list[str]
+            "corrupted_pieces": [],  # type: list[int]
             "missing_pieces": [],  # type: list[int]
+            "rehashed_files": [],  # type: list[str]
+            "skipped_files": [],  # type: list[str]
         }
 
         # Ensure disk I/O manager is started
@@ -1039,27 +1100,15 @@ class AsyncFileAssembler:
                     self.disk_io.start()  # pragma: no cover - Sync disk_io.start call, tested via integration tests with sync disk_io
             self._disk_io_started = True  # pragma: no cover - Disk IO start flag, tested via integration tests
 
-        # Check if all files mentioned in checkpoint exist
-        for file_checkpoint in checkpoint.files:
-            if not os.path.exists(file_checkpoint.path):
-                validation_results["missing_files"].append(file_checkpoint.path)
-                validation_results["valid"] = False
-            else:
-                # Check file size
-                actual_size = os.path.getsize(file_checkpoint.path)
-                if actual_size != file_checkpoint.size:
-                    validation_results["corrupted_pieces"].extend(
-                        [
-                            piece
-                            for piece in checkpoint.verified_pieces
-                            if any(
-                                seg.file_path == file_checkpoint.path
-                                for seg in self.file_segments
-                                if seg.piece_index == piece
-                            )
-                        ],
-                    )
-                    validation_results["valid"] = False
+        # Check files against the checkpoint and rehash changed ones
+        verifier = self.get_resume_verifier(progress_callback, hash_executor)
+        result = await verifier.verify(checkpoint.files, checkpoint.verified_pieces)
+        validation_results["missing_files"] = result.missing_files
+        validation_results["corrupted_pieces"] = sorted(result.failed_pieces)
+        validation_results["rehashed_files"] = result.changed_files
+        validation_results["skipped_files"] = result.unchanged_files
+        if result.missing_files or result.failed_pieces:
+            validation_results["valid"] = False
 
         # Check if all verified pieces are actually written
         for piece_index in checkpoint.verified_pieces:
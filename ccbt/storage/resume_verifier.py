@@ -0,0 +1,373 @@
+"""Resume verification that only rehashes files changed since the checkpoint.
+
+Checkpoints record the on-disk size and modification time of every file
+(``disk_size`` and ``mtime_ns`` of :class:`~ccbt.models.FileCheckpoint`).
+On resume, a file whose size and mtime still match is trusted without
+reading it, so restarting with a seeded library costs one ``stat`` per
+file. Verified pieces that touch a changed file are rehashed; pieces that
+touch a missing file fail.
+
+Changed pieces are read sequentially with one reader per storage device,
+all devices in parallel, and hashed on the hash executor while the next
+piece is read.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Callable
+
+if TYPE_CHECKING:  # pragma: no cover - type checking only, not executed at runtime
+    from collections.abc import Iterable, Sequence
+    from concurrent.futures import Executor
+
+    from ccbt.models import FileCheckpoint
+    from ccbt.storage.file_assembler import FileSegment
+
+# Lengths of the v1 (SHA-1) and v2 (SHA-256) piece hashes
+SHA1_SIZE = 20
+SHA256_SIZE = 32
+
+
+@dataclass
+class ResumeProgress:
+    """Progress of a resume verification."""
+
+    files_total: int = 0
+    files_changed: int = 0
+    pieces_total: int = 0  # Pieces to rehash
+    pieces_checked: int = 0
+    bytes_hashed: int = 0
+
+    @property
+    def fraction(self) -> float:
+        """Fraction of the pieces to rehash that have been checked."""
+        if not self.pieces_total:
+            return 1.0
+        return self.pieces_checked / self.pieces_total
+
+
+@dataclass
+class ResumeVerifyResult:
+    """Outcome of a resume verification."""
+
+    valid_pieces: set[int] = field(default_factory=set)
+    failed_pieces: set[int] = field(default_factory=set)
+    unchanged_files: list[str] = field(default_factory=list)
+    changed_files: list[str] = field(default_factory=list)
+    missing_files: list[str] = field(default_factory=list)
+    bytes_hashed: int = 0
+
+
+def stat_file(path: str) -> os.stat_result | None:
+    """Return the stat of a regular file, or None if it does not exist."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st if os.path.isfile(path) else None
+
+
+def file_unchanged(file_checkpoint: FileCheckpoint, st: os.stat_result) -> bool:
+    """Check a file against the size and mtime recorded in a checkpoint.
+
+    Checkpoints written before mtimes were recorded only have the expected
+    size, which is all that was checked before.
+    """
+    if file_checkpoint.mtime_ns is None:
+        return st.st_size == file_checkpoint.size
+    disk_size = (
+        file_checkpoint.disk_size
+        if file_checkpoint.disk_size is not None
+        else file_checkpoint.size
+    )
+    return st.st_size == disk_size and st.st_mtime_ns == file_checkpoint.mtime_ns
+
+
+class ResumeVerifier:
+    """Verifies checkpointed pieces against the files on disk.
+
+    Attributes:
+        piece_hashes: SHA-1 hash of every piece
+        piece_hashes_v2: BEP 52 hash of every piece (empty for v1 torrents)
+        piece_length: Nominal piece length
+        total_length: Torrent length in bytes
+        hash_executor: Executor running the hashing (None for the loop default)
+        max_in_flight: Pieces read ahead of the hashing, per device
+        progress_callback: Called with the progress after every piece
+
+    """
+
+    def __init__(
+        self,
+        segments: Iterable[FileSegment],
+        piece_hashes: Sequence[bytes],
+        piece_length: int,
+        total_length: int,
+        *,
+        hash_executor: Executor | None = None,
+        max_in_flight: int = 4,
+        progress_callback: Callable[[ResumeProgress], None] | None = None,
+        piece_layers: Iterable[Sequence[bytes]] | None = None,
+    ):
+        """Initialize resume verifier.
+
+        Args:
+            segments: File segments of every piece (padding is left out)
+            piece_hashes: SHA-1 hash of every piece
+            piece_length: Nominal piece length
+            total_length: Torrent length in bytes
+            hash_executor: Executor running the hashing
+            max_in_flight: Pieces read ahead of the hashing, per device
+            progress_callback: Called with the progress after every piece
+            piece_layers: BEP 52 piece layers in torrent order, used for
+                pieces without a SHA-1 hash
+
+        """
+        self.piece_hashes = piece_hashes
+        self.piece_hashes_v2: list[bytes] = []
+        # Pieces that are a whole file: their hash is the unpadded pieces_root
+        self._whole_file_pieces: set[int] = set()
+        for layer in piece_layers or ():
+            if len(layer) == 1:
+                self._whole_file_pieces.add(len(self.piece_hashes_v2))
+            self.piece_hashes_v2.extend(layer)
+        self.piece_length = piece_length
+        self.total_length = total_length
+        self.hash_executor = hash_executor
+        self.max_in_flight = max(1, max_in_flight)
+        self.progress_callback = progress_callback
+        self.progress = ResumeProgress()
+        self._piece_segments: dict[int, list[FileSegment]] = {}
+        self._file_pieces: dict[str, set[int]] = {}
+        for seg in segments:
+            self._piece_segments.setdefault(seg.piece_index, []).append(seg)
+            self._file_pieces.setdefault(seg.file_path, set()).add(seg.piece_index)
+
+    def pieces_in_file(self, path: str) -> set[int]:
+        """Return the indices of the pieces with data in a file."""
+        return self._file_pieces.get(path, set())
+
+    def piece_size(self, index: int) -> int:
+        """Return the length of a piece (the last one may be shorter)."""
+        return max(
+            0, min(self.piece_length, self.total_length - index * self.piece_length)
+        )
+
+    def read_piece(self, index: int, handles: dict[str, int] | None = None) -> bytes:
+        """Read a piece from its files; padding is zero.
+
+        Args:
+            index: Piece index
+            handles: Open file descriptors by path, reused across calls
+                (files are opened and closed per call if None)
+
+        Raises:
+            OSError: If a file cannot be read or is too short
+
+        """
+        data = bytearray(self.piece_size(index))
+        for seg in self._piece_segments.get(index, ()):
+            length = seg.end_offset - seg.start_offset
+            if handles is None:
+                with open(seg.file_path, "rb") as f:
+                    f.seek(seg.start_offset)
+                    chunk = f.read(length)
+            else:
+                fd = handles.get(seg.file_path)
+                if fd is None:
+                    fd = handles[seg.file_path] = os.open(
+                        seg.file_path, os.O_RDONLY | getattr(os, "O_BINARY", 0)
+                    )
+                os.lseek(fd, seg.start_offset, os.SEEK_SET)
+                chunk = os.read(fd, length)
+            if len(chunk) != length:
+                msg = f"Short read of piece {index} from {seg.file_path}"
+                raise OSError(msg)
+            data[seg.piece_offset : seg.piece_offset + length] = chunk
+        return bytes(data)
+
+    def check_piece(
+        self, index: int, data: bytes, expected: bytes | None = None
+    ) -> bool:
+        """Check piece data against its SHA-1 or, failing that, its v2 hash.
+
+        Pieces with neither hash cannot be checked and fail.
+
+        Args:
+            index: Piece index
+            data: Piece data
+            expected: Hash to check against instead of the piece's hash
+                (20 bytes for SHA-1, 32 bytes for a BEP 52 piece hash)
+
+        """
+        if expected is None:
+            if index < len(self.piece_hashes):
+                expected = self.piece_hashes[index]
+            elif index < len(self.piece_hashes_v2):
+                expected = self.piece_hashes_v2[index]
+            else:
+                expected = b""
+        if len(expected) == SHA1_SIZE:
+            return hashlib.sha1(data).digest() == expected  # nosec B324 - BitTorrent v1
+        if len(expected) == SHA256_SIZE:
+            return self._check_piece_v2(index, data, expected)
+        return False
+
+    def _check_piece_v2(self, index: int, data: bytes, expected: bytes) -> bool:
+        """Check piece data against its BEP 52 piece hash.
+
+        The hash covers only the file's own bytes, so trailing padding is cut
+        off and blocks past the end of the file count as zero hashes.
+        """
+        from ccbt.piece.hash_v2 import hash_piece_root_v2
+
+        segments = self._piece_segments.get(index, ())
+        end = max(
+            (seg.piece_offset + seg.end_offset - seg.start_offset for seg in segments),
+            default=0,
+        )
+        whole_file = index in self._whole_file_pieces
+        power_of_two = self.piece_length > 0 and not (
+            self.piece_length & (self.piece_length - 1)
+        )
+        pad_length = self.piece_length if power_of_two and not whole_file else None
+        try:
+            return hash_piece_root_v2(data[:end], pad_length) == expected
+        except ValueError:
+            return False
+
+    async def verify_piece(self, index: int, expected: bytes | None = None) -> bool:
+        """Read and check one piece (see :meth:`check_piece`)."""
+        loop = asyncio.get_running_loop()
+        try:
+            data = await loop.run_in_executor(None, self.read_piece, index)
+        except OSError:
+            return False
+        return await loop.run_in_executor(
+            self.hash_executor, self.check_piece, index, data, expected
+        )
+
+    async def verify(
+        self,
+        files: Iterable[FileCheckpoint],
+        verified_pieces: Iterable[int],
+    ) -> ResumeVerifyResult:
+        """Verify the pieces a checkpoint lists as verified.
+
+        Args:
+            files: Files recorded in the checkpoint
+            verified_pieces: Pieces the checkpoint lists as verified
+
+        Returns:
+            Pieces that are still valid and the files that were checked
+
+        """
+        loop = asyncio.get_running_loop()
+        files = list(files)
+        verified = set(verified_pieces)
+        result = ResumeVerifyResult()
+        stats = await loop.run_in_executor(
+            None, lambda: [stat_file(f.path) for f in files]
+        )
+
+        recheck: set[int] = set()
+        devices: dict[str, int] = {}
+        for file_checkpoint, st in zip(files, stats):
+            pieces = verified & self.pieces_in_file(file_checkpoint.path)
+            if st is None:
+                result.missing_files.append(file_checkpoint.path)
+                result.failed_pieces |= pieces
+                continue
+            devices[file_checkpoint.path] = st.st_dev
+            if file_unchanged(file_checkpoint, st):
+                result.unchanged_files.append(file_checkpoint.path)
+            else:
+                result.changed_files.append(file_checkpoint.path)
+                recheck |= pieces
+        recheck -= result.failed_pieces
+
+        # Read each device sequentially, in piece order
+        by_device: dict[int, list[int]] = {}
+        for index in sorted(recheck):
+            first = self._piece_segments[index][0].file_path
+            by_device.setdefault(devices.get(first, -1), []).append(index)
+
+        self.progress = ResumeProgress(
+            files_total=len(files),
+            files_changed=len(result.changed_files),
+            pieces_total=len(recheck),
+        )
+        self._report()
+        if by_device:
+            with ThreadPoolExecutor(
+                max_workers=len(by_device), thread_name_prefix="resume-read"
+            ) as reader:
+                checked = await asyncio.gather(
+                    *(
+                        self._verify_sequential(pieces, reader)
+                        for pieces in by_device.values()
+                    )
+                )
+            for failed in checked:
+                result.failed_pieces |= failed
+
+        result.valid_pieces = verified - result.failed_pieces
+        result.bytes_hashed = self.progress.bytes_hashed
+        return result
+
+    async def _verify_sequential(self, pieces: list[int], reader: Executor) -> set[int]:
+        """Read pieces in order and hash them, keeping a few hashes in flight."""
+        loop = asyncio.get_running_loop()
+        failed: set[int] = set()
+        in_flight: set[asyncio.Future[tuple[int, bool, int]]] = set()
+        handles: dict[str, int] = {}
+
+        def _check(index: int, data: bytes) -> tuple[int, bool, int]:
+            return index, self.check_piece(index, data), len(data)
+
+        def _collect(done: Iterable[asyncio.Future[tuple[int, bool, int]]]) -> None:
+            for fut in done:
+                index, ok, size = fut.result()
+                if not ok:
+                    failed.add(index)
+                self.progress.bytes_hashed += size
+                self._advance()
+
+        try:
+            for index in pieces:
+                try:
+                    data = await loop.run_in_executor(
+                        reader, self.read_piece, index, handles
+                    )
+                except OSError:
+                    failed.add(index)
+                    self._advance()
+                    continue
+                in_flight.add(
+                    loop.run_in_executor(self.hash_executor, _check, index, data)
+                )
+                if len(in_flight) >= self.max_in_flight:
+                    done, in_flight = await asyncio.wait(
+                        in_flight, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    _collect(done)
+            if in_flight:
+                done, _ = await asyncio.wait(in_flight)
+                _collect(done)
+        finally:
+            for fd in handles.values():
+                os.close(fd)
+        return failed
+
+    def _advance(self) -> None:
+        self.progress.pieces_checked += 1
+        self._report()
+
+    def _report(self) -> None:
+        if self.progress_callback is not None:
+            self.progress_callback(self.progress)
@@ -8,12 +8,30 @@ deduplication across different files and torrents.
 Based on reference implementations:
 - xet-core (Rust): https://github.com/huggingface/xet-core
 - zig-xet (Zig): https://github.com/jedisct1/huggingface-xet
+
+Boundary detection only depends on the low bits of the rolling hash that
+the target mask tests, and those bits only depend on the last few bytes.
+The chunker therefore tracks the hash modulo the mask, skips the first
+MIN_CHUNK_SIZE bytes of every chunk without hashing them, and with NumPy
+installed evaluates the hash for a whole chunk-sized span in a handful of
+vector operations. Boundaries are identical to the original per-byte
+implementation, which is kept as ``_find_chunk_boundary`` for reference.
 """
 
 from __future__ import annotations
 
 import logging
-from typing import Iterator
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, Iterator
+
+try:
+    import numpy as np
+
+    HAS_NUMPY = True
+except ImportError:  # pragma: no cover - NumPy is optional
+    HAS_NUMPY = False  # pragma: no cover - Same context
+    np = None  # type: ignore[assignment]  # pragma: no cover - Same context
 
 logger = logging.getLogger(__name__)
 
@@ -23,6 +41,9 @@ MAX_CHUNK_SIZE = 131072  # 128 KB - maximum chunk size
 TARGET_CHUNK_SIZE = 16384  # 16 KB - default average/target chunk size
 WINDOW_SIZE = 48  # Rolling hash window size in bytes
 
+# Spans shorter than this are scanned per byte even when NumPy is available
+VECTOR_MIN_SPAN = 2048
+
 
 class GearhashChunker:
     """Content-defined chunking using Gearhash algorithm.
@@ -53,6 +74,14 @@ class GearhashChunker:
         self.target_size = target_size
         self.gear_table = self._init_gear_table()
 
+        # Boundaries only test the low bits of the hash, so track just those
+        self.target_mask = (1 << (32 - target_size.bit_length())) - 1
+        self._mask_bits = self.target_mask.bit_length()
+        self._gear_masked = [value & self.target_mask for value in self.gear_table]
+        self._gear_array = (
+            np.array(self._gear_masked, dtype=np.uint32) if HAS_NUMPY else None
+        )
+
     def _init_gear_table(self) -> list[int]:
         """Initialize precomputed gear table for rolling hash.
 
@@ -354,29 +383,120 @@ class GearhashChunker:
             return []  # pragma: no cover - Empty data edge case, tested in test_chunk_buffer_empty
 
         chunks = []
-        data_len = len(data)
         pos = 0
+        for chunk_end in self.chunk_boundaries(data):
+            chunks.append(data[pos:chunk_end])
+            pos = chunk_end
+        return chunks
+
+    def chunk_boundaries(self, data: bytes | bytearray | memoryview) -> list[int]:
+        """Find all chunk boundaries in a buffer.
 
-        # Minimum mask: ensures chunks are at least MIN_CHUNK_SIZE
-        # Maximum mask: ensures chunks are at most MAX_CHUNK_SIZE
-        # Target mask: controls average chunk size
-        min_mask = (1 << (32 - MIN_CHUNK_SIZE.bit_length())) - 1
-        max_mask = (1 << (32 - MAX_CHUNK_SIZE.bit_length())) - 1
-        target_mask = (1 << (32 - self.target_size.bit_length())) - 1
+        Args:
+            data: Input data to chunk
 
+        Returns:
+            End offset of every chunk, the last one being ``len(data)``
+
+        """
+        boundaries = []
+        data_len = len(data)
+        pos = 0
         while pos < data_len:
-            # Calculate chunk end position
-            chunk_end = self._find_chunk_boundary(
-                data, pos, min_mask, max_mask, target_mask
-            )
+            pos = self._next_boundary(data, pos)
+            boundaries.append(pos)
+        return boundaries
 
-            # Extract chunk
-            chunk = data[pos:chunk_end]
-            chunks.append(chunk)
+    def chunk_buffers(
+        self,
+        buffers: Iterable[bytes],
+        max_workers: int | None = None,
+    ) -> list[list[bytes]]:
+        """Chunk independent buffers (for example pieces) in parallel.
 
-            pos = chunk_end
+        NumPy releases the GIL while it hashes, so buffers are spread over
+        a thread pool when it is available. Without NumPy they are chunked
+        one after another.
 
-        return chunks
+        Args:
+            buffers: Buffers to chunk independently
+            max_workers: Worker threads (default: CPU count)
+
+        Returns:
+            Chunks of every buffer, in input order
+
+        """
+        buffers = list(buffers)
+        workers = min(max_workers or os.cpu_count() or 1, len(buffers))
+        if not HAS_NUMPY or workers <= 1:
+            return [self.chunk_buffer(data) for data in buffers]
+        with ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="ccbt-xet-chunk"
+        ) as executor:
+            return list(executor.map(self.chunk_buffer, buffers))
+
+    def _next_boundary(self, data: bytes | bytearray | memoryview, start: int) -> int:
+        """Find the end of the chunk starting at ``start``.
+
+        Returns the same position as :meth:`_find_chunk_boundary`.
+
+        Args:
+            data: Input data
+            start: Starting position in data
+
+        Returns:
+            Position of next chunk boundary (end of current chunk)
+
+        """
+        data_len = len(data)
+        min_chunk_end = start + MIN_CHUNK_SIZE
+        if min_chunk_end >= data_len:
+            return data_len
+        max_chunk_end = min(start + MAX_CHUNK_SIZE, data_len)
+
+        mask = self.target_mask
+        bits = self._mask_bits
+        gear = self._gear_masked
+
+        # Only the last `bits` bytes of the initial window reach the masked bits
+        hash_value = 0
+        for byte in data[start + WINDOW_SIZE - bits : start + WINDOW_SIZE]:
+            hash_value = ((hash_value << 1) + gear[byte]) & mask
+
+        # The window still contributes for the first bits - 1 positions
+        scalar_end = max_chunk_end
+        if HAS_NUMPY and max_chunk_end - min_chunk_end >= VECTOR_MIN_SPAN:
+            scalar_end = min_chunk_end + bits - 1
+
+        pos = min_chunk_end
+        for byte in data[min_chunk_end:scalar_end]:
+            hash_value = ((hash_value << 1) + gear[byte]) & mask
+            pos += 1
+            if not hash_value:
+                return pos
+        if scalar_end == max_chunk_end:
+            return max_chunk_end
+
+        # From here on the hash only depends on bytes at or after
+        # min_chunk_end: sum(gear[data[p - j]] << j for j < bits) modulo the
+        # mask. Summing 2**k terms by doubling is exact because the extra
+        # terms are shifted past the mask.
+        values = self._gear_array[
+            np.frombuffer(
+                data,
+                dtype=np.uint8,
+                count=max_chunk_end - min_chunk_end,
+                offset=min_chunk_end,
+            )
+        ]
+        span = 1
+        while span < bits:
+            values[span:] = values[span:] + (values[:-span] << span)
+            span <<= 1
+        hits = np.flatnonzero((values[bits - 1 :] & mask) == 0)
+        if hits.size:
+            return scalar_end + int(hits[0]) + 1
+        return max_chunk_end
 
     def _find_chunk_boundary(
         self,
@@ -467,38 +587,7 @@ class GearhashChunker:
 
         """
         with open(file_path, "rb") as f:
-            buffer = b""
-
-            while True:
-                # Read next chunk of file
-                chunk = f.read(chunk_size_hint)
-                if not chunk:
-                    break
-
-                # Add to buffer
-                buffer += chunk
-
-                # Process buffer in chunks
-                while len(buffer) >= MIN_CHUNK_SIZE:
-                    # Find boundary
-                    boundary = self._find_chunk_boundary(
-                        buffer,
-                        0,
-                        (1 << (32 - MIN_CHUNK_SIZE.bit_length())) - 1,
-                        (1 << (32 - MAX_CHUNK_SIZE.bit_length())) - 1,
-                        (1 << (32 - self.target_size.bit_length())) - 1,
-                    )
-
-                    # Yield chunk
-                    chunk_data = buffer[:boundary]
-                    yield chunk_data
-
-                    # Remove processed data from buffer
-                    buffer = buffer[boundary:]
-
-            # Process remaining buffer
-            if buffer:
-                yield buffer
+            yield from self.chunk_stream(iter(lambda: f.read(chunk_size_hint), b""))
 
     def chunk_stream(self, stream: Iterator[bytes]) -> Iterator[bytes]:
         """Chunk a stream of data using Gearhash CDC.
@@ -510,31 +599,24 @@ class GearhashChunker:
             Content-defined chunks (bytes)
 
         """
-        buffer = b""
+        buffer = bytearray()
 
         for chunk in stream:
             buffer += chunk
 
-            # Process buffer in chunks
-            while (
-                len(buffer) >= MIN_CHUNK_SIZE
-            ):  # pragma: no cover - Stream chunking loop, tested via test_chunk_stream_with_remaining_buffer
-                # Find boundary
-                boundary = self._find_chunk_boundary(
-                    buffer,
-                    0,
-                    (1 << (32 - MIN_CHUNK_SIZE.bit_length())) - 1,
-                    (1 << (32 - MAX_CHUNK_SIZE.bit_length())) - 1,
-                    (1 << (32 - self.target_size.bit_length())) - 1,
-                )  # pragma: no cover - Same context
-
-                # Yield chunk
-                chunk_data = buffer[:boundary]  # pragma: no cover - Same context
-                yield chunk_data  # pragma: no cover - Same context
-
-                # Remove processed data from buffer
-                buffer = buffer[boundary:]  # pragma: no cover - Same context
+            # Cut chunks while at least MIN_CHUNK_SIZE bytes are buffered; as
+            # before, the buffer end counts as the end of the data
+            pos = 0
+            while len(buffer) - pos >= MIN_CHUNK_SIZE:
+                boundary = self._next_boundary(buffer, pos)
+                yield bytes(buffer[pos:boundary])
+                pos = boundary
+
+            # Drop processed data from buffer
+            del buffer[:pos]
 
         # Process remaining buffer
         if buffer:
-            yield buffer  # pragma: no cover - Remaining buffer handling tested in test_chunk_stream_with_remaining_buffer
+            yield bytes(
+                buffer
+            )  # pragma: no cover - Remaining buffer handling tested in test_chunk_stream_with_remaining_buffer
@@ -2,21 +2,108 @@
 
 This module provides local and global deduplication for Xet chunks,
 using SQLite for local caching and DHT for peer-to-peer chunk discovery.
+
+The SQLite index is owned by a dedicated writer thread so lookups and
+inserts never block the event loop. Operations queued while a transaction
+is running are applied together in the next one (group commit), the
+database runs in WAL mode, and ``last_accessed`` updates are coalesced
+and flushed periodically instead of committing on every lookup. An
+in-memory Bloom filter answers most lookups for chunks that are not
+stored without touching the database.
+
+Chunk data lives in append-only xorb pack files (see
+:mod:`ccbt.storage.xet_pack`) rather than one file per chunk. The index
+maps each hash to its pack, offset and length, tracks dead bytes per pack
+when reference counts drop to zero, and a compactor rewrites packs that
+are mostly dead while the index is idle. Chunk files written by older
+versions stay readable and are moved into packs by the compactor.
 """
 
 from __future__ import annotations
 
+import asyncio
 import hashlib
 import logging
+import math
+import queue
 import sqlite3
+import threading
 import time
+from concurrent.futures import Future
+from functools import partial
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
 from ccbt.models import PeerInfo
+from ccbt.storage.xet_pack import ChunkPackStore
+from ccbt.storage.xet_xorb import XORB_ENTRY_HEADER_SIZE
 
 logger = logging.getLogger(__name__)
 
+# Target false-positive rate of the in-memory chunk filter
+BLOOM_FALSE_POSITIVE_RATE = 0.01
+
+# Smallest chunk filter capacity; the filter doubles when it fills up
+BLOOM_MIN_CAPACITY = 1 << 16
+
+# Maximum queued index operations applied in one transaction
+MAX_BATCH_OPS = 512
+
+# Seconds between flushes of coalesced last_accessed updates
+TOUCH_FLUSH_INTERVAL = 5.0
+
+# Sealed packs with at least this fraction of dead bytes are rewritten
+COMPACT_DEAD_RATIO = 0.5
+
+# Packs rewritten and legacy chunk files packed per idle compaction pass
+COMPACT_PACKS_PER_PASS = 1
+MIGRATE_FILES_PER_PASS = 256
+
+
+class ChunkBloomFilter:
+    """Bloom filter over chunk hashes for fast negative lookups."""
+
+    def __init__(
+        self,
+        capacity: int,
+        false_positive_rate: float = BLOOM_FALSE_POSITIVE_RATE,
+    ):
+        """Initialize an empty filter.
+
+        Args:
+            capacity: Number of hashes the filter is sized for
+            false_positive_rate: Target false-positive rate at capacity
+
+        """
+        self.capacity = max(1, capacity)
+        ln2 = math.log(2)
+        self.num_bits = max(
+            8, math.ceil(-self.capacity * math.log(false_positive_rate) / ln2**2)
+        )
+        self.num_hashes = max(1, round(self.num_bits / self.capacity * ln2))
+        self.count = 0
+        self._bits = bytearray((self.num_bits + 7) // 8)
+
+    def _positions(self, key: bytes) -> list[int]:
+        """Return the bit positions for a key (double hashing)."""
+        digest = hashlib.blake2b(key, digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return [(h1 + i * h2) % self.num_bits for i in range(self.num_hashes)]
+
+    def add(self, key: bytes) -> None:
+        """Add a chunk hash to the filter."""
+        for pos in self._positions(key):
+            self._bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+    def __contains__(self, key: object) -> bool:
+        """Check whether a chunk hash may be stored (no false negatives)."""
+        if not isinstance(key, (bytes, bytearray)):
+            return False
+        bits = self._bits
+        return all(bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(key))
+
 
 class XetDeduplication:
     """Chunk-level deduplication manager.
@@ -24,10 +111,16 @@ class XetDeduplication:
     Manages local deduplication cache using SQLite and provides
     integration with DHT for global chunk discovery.
 
+    All database access runs on a writer thread. The chunk filter only
+    learns about chunks stored through this instance (and those present
+    when it was opened), so one process should own a cache database at a
+    time.
+
     Attributes:
         cache_path: Path to SQLite cache database
-        chunk_store_path: Directory where chunks are physically stored
-        db: SQLite database connection
+        chunk_store_path: Directory where chunk pack files are stored
+        packs: Pack file store holding chunk data
+        db: SQLite database connection (used by the writer thread)
         dht_client: Optional DHT client for global chunk discovery
 
     """
@@ -47,11 +140,31 @@ class XetDeduplication:
         self.cache_path = Path(cache_db_path)
         self.chunk_store_path = self.cache_path.parent / "xet_chunks"
         self.chunk_store_path.mkdir(parents=True, exist_ok=True)
+        self.packs = ChunkPackStore(self.chunk_store_path)
 
         self.db = self._init_database()
         self.dht_client = dht_client
         self.logger = logging.getLogger(__name__)
 
+        # Filter is built by the writer thread; None means "ask the database"
+        self._bloom: ChunkBloomFilter | None = None
+        # Coalesced last_accessed updates; only touched by the writer thread
+        self._touches: dict[bytes, float] = {}
+        self._last_touch_flush = time.monotonic()
+        # Pack files to delete once the current transaction has committed
+        self._after_commit: list[Callable[[], None]] = []
+        # Set once no legacy one-file-per-chunk rows are left to migrate
+        self._legacy_migrated = False
+
+        self._ops: queue.SimpleQueue[tuple[Callable[[], Any], Future] | None] = (
+            queue.SimpleQueue()
+        )
+        self._closed = False
+        self._writer = threading.Thread(
+            target=self._writer_loop, name="ccbt-xet-index", daemon=True
+        )
+        self._writer.start()
+
     def _init_database(self) -> sqlite3.Connection:
         """Initialize SQLite cache database.
 
@@ -64,7 +177,12 @@ class XetDeduplication:
         # Ensure parent directory exists
         self.cache_path.parent.mkdir(parents=True, exist_ok=True)
 
-        db = sqlite3.connect(str(self.cache_path))
+        # Autocommit mode: the writer thread issues BEGIN/COMMIT per batch
+        db = sqlite3.connect(
+            str(self.cache_path), check_same_thread=False, isolation_level=None
+        )
+        db.execute("PRAGMA journal_mode=WAL")
+        db.execute("PRAGMA synchronous=NORMAL")
         db.execute("""
             CREATE TABLE IF NOT EXISTS chunks (
                 hash BLOB PRIMARY KEY,
@@ -81,99 +199,345 @@ class XetDeduplication:
         db.execute("""
             CREATE INDEX IF NOT EXISTS idx_last_accessed ON chunks(last_accessed)
         """)
-        db.commit()
+        columns = {row[1] for row in db.execute("PRAGMA table_info(chunks)")}
+        if "pack_offset" not in columns:
+            # Rows from the one-file-per-chunk layout keep offset 0
+            db.execute(
+                "ALTER TABLE chunks ADD COLUMN pack_offset INTEGER NOT NULL DEFAULT 0"
+            )
+        db.execute("""
+            CREATE INDEX IF NOT EXISTS idx_storage_path ON chunks(storage_path)
+        """)
+        db.execute("""
+            CREATE TABLE IF NOT EXISTS packs (
+                path TEXT PRIMARY KEY,
+                size INTEGER NOT NULL,
+                dead_bytes INTEGER NOT NULL DEFAULT 0,
+                sealed INTEGER NOT NULL DEFAULT 0
+            )
+        """)
 
         return db
 
-    async def check_chunk_exists(self, chunk_hash: bytes) -> Path | None:
-        """Check if chunk exists locally.
+    def _writer_loop(self) -> None:
+        """Apply queued index operations in batches until closed."""
+        self._open_packs()
+        self._rebuild_bloom()
+        stopping = False
+        while not stopping:
+            try:
+                item = self._ops.get(timeout=TOUCH_FLUSH_INTERVAL)
+            except queue.Empty:
+                self._run_batch([], flush_touches=True)
+                self._compact_when_idle()
+                continue
+
+            batch: list[tuple[Callable[[], Any], Future]] = []
+            while True:
+                if item is None:
+                    stopping = True
+                    break
+                batch.append(item)
+                if len(batch) >= MAX_BATCH_OPS:
+                    break
+                try:
+                    item = self._ops.get_nowait()
+                except queue.Empty:
+                    break
+            self._run_batch(batch, flush_touches=stopping)
 
-        Queries the database for the chunk hash and updates the
-        last_accessed timestamp if found.
+    def _run_batch(
+        self,
+        batch: list[tuple[Callable[[], Any], Future]],
+        *,
+        flush_touches: bool = False,
+    ) -> None:
+        """Run operations in one transaction and resolve their futures."""
+        flush_touches = flush_touches or (
+            time.monotonic() - self._last_touch_flush >= TOUCH_FLUSH_INTERVAL
+        )
+        if not batch and not (flush_touches and self._touches):
+            return
 
-        Args:
-            chunk_hash: 32-byte chunk hash
+        results: list[tuple[Future, Any, BaseException | None]] = []
+        processed = 0
+        try:
+            self.db.execute("BEGIN IMMEDIATE")
+            for op, future in batch:
+                processed += 1
+                if not future.set_running_or_notify_cancel():
+                    continue
+                # Savepoint per operation: a failing one leaves the rest intact
+                self.db.execute("SAVEPOINT op")
+                try:
+                    results.append((future, op(), None))
+                except Exception as e:
+                    self.db.execute("ROLLBACK TO op")
+                    results.append((future, None, e))
+                self.db.execute("RELEASE op")
+            if flush_touches:
+                self._flush_touches()
+            self.db.execute("COMMIT")
+        except sqlite3.Error as e:
+            self.logger.warning("Xet chunk index transaction failed: %s", e)
+            if self.db.in_transaction:
+                self.db.execute("ROLLBACK")
+            self._after_commit.clear()
+            # Nothing in the batch was committed
+            results = [(future, None, e) for future, _, _ in results]
+            results.extend(
+                (future, None, e)
+                for _, future in batch[processed:]
+                if future.set_running_or_notify_cancel()
+            )
 
-        Returns:
-            Path to stored chunk if exists, None otherwise
+        for action in self._after_commit:
+            try:
+                action()
+            except OSError as e:
+                self.logger.warning("Failed to remove compacted Xet file: %s", e)
+        self._after_commit.clear()
+
+        for future, result, error in results:
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(result)
+
+        if self._bloom is not None and self._bloom.count > self._bloom.capacity:
+            self._rebuild_bloom()
+
+    def _flush_touches(self) -> None:
+        """Write coalesced last_accessed updates (writer thread)."""
+        if self._touches:
+            self.db.executemany(
+                "UPDATE chunks SET last_accessed = ? WHERE hash = ?",
+                [(ts, chunk_hash) for chunk_hash, ts in self._touches.items()],
+            )
+            self._touches.clear()
+        self._last_touch_flush = time.monotonic()
+
+    def _open_packs(self) -> None:
+        """Reopen the active pack and seal any other unsealed ones (writer thread)."""
+        rows = self.db.execute(
+            "SELECT path, size FROM packs WHERE sealed = 0 ORDER BY path"
+        ).fetchall()
+        for i, (path, size) in enumerate(rows):
+            try:
+                if i == len(rows) - 1:
+                    self.packs.resume(Path(path), size)
+                    continue
+                self.packs.finalize(Path(path), size)
+                self.db.execute("UPDATE packs SET sealed = 1 WHERE path = ?", (path,))
+            except (OSError, ValueError) as e:
+                self.logger.warning("Failed to reopen Xet pack %s: %s", path, e)
+
+    def _append_chunk(self, chunk_hash: bytes, chunk_data: bytes) -> tuple[Path, int]:
+        """Append chunk data to the active pack and account for it (writer thread)."""
+        sealed = self.packs.reserve(len(chunk_data))
+        if sealed is not None:
+            self.db.execute(
+                "UPDATE packs SET sealed = 1 WHERE path = ?", (str(sealed),)
+            )
+        pack_path, offset = self.packs.append(chunk_hash, chunk_data)
+        self.db.execute(
+            """INSERT INTO packs (path, size) VALUES (?, ?)
+               ON CONFLICT(path) DO UPDATE SET size = excluded.size""",
+            (str(pack_path), self.packs.active_size),
+        )
+        return pack_path, offset
+
+    def _release_storage(self, storage_path: str, size: int) -> None:
+        """Free the storage of a chunk whose index row is being deleted.
+
+        Chunks in packs only add to the pack's dead bytes; the compactor
+        reclaims the space later. Legacy chunk files are deleted.
+
+        Raises:
+            OSError: If a legacy chunk file cannot be deleted
 
         """
         cursor = self.db.execute(
+            "UPDATE packs SET dead_bytes = dead_bytes + ? WHERE path = ?",
+            (XORB_ENTRY_HEADER_SIZE + size, storage_path),
+        )
+        if cursor.rowcount == 0:
+            Path(storage_path).unlink()
+
+    def _rebuild_bloom(self) -> None:
+        """Rebuild the chunk filter from the database (writer thread)."""
+        try:
+            hashes = [row[0] for row in self.db.execute("SELECT hash FROM chunks")]
+        except sqlite3.Error as e:
+            self.logger.warning("Failed to load Xet chunk filter: %s", e)
+            self._bloom = None
+            return
+        bloom = ChunkBloomFilter(max(BLOOM_MIN_CAPACITY, 2 * len(hashes)))
+        for chunk_hash in hashes:
+            bloom.add(chunk_hash)
+        self._bloom = bloom
+
+    def _submit(self, op: Callable[..., Any], *args: Any) -> Future:
+        """Queue an operation for the writer thread."""
+        if self._closed:
+            msg = "Cannot operate on a closed database."
+            raise sqlite3.ProgrammingError(msg)
+        future: Future = Future()
+        self._ops.put((partial(op, *args), future))
+        return future
+
+    async def _run(self, op: Callable[..., Any], *args: Any) -> Any:
+        """Run an operation on the writer thread and await its result."""
+        return await asyncio.wrap_future(self._submit(op, *args))
+
+    def _call(self, op: Callable[..., Any], *args: Any) -> Any:
+        """Run an operation on the writer thread and wait for its result."""
+        return self._submit(op, *args).result()
+
+    async def flush(self) -> None:
+        """Commit pending last_accessed updates now."""
+        await self._run(self._flush_touches)
+
+    def _lookup_op(self, chunk_hash: bytes) -> Path | None:
+        row = self.db.execute(
             "SELECT storage_path FROM chunks WHERE hash = ?",
             (chunk_hash,),
-        )
-        row = cursor.fetchone()
-        if row:
-            # Update last accessed timestamp
-            self.db.execute(
-                "UPDATE chunks SET last_accessed = ? WHERE hash = ?",
-                (time.time(), chunk_hash),
-            )
-            self.db.commit()
-            return Path(row[0])
-        return None
+        ).fetchone()
+        if row is None:
+            return None
+        self._touches[chunk_hash] = time.time()
+        return Path(row[0])
 
-    async def store_chunk(
-        self,
-        chunk_hash: bytes,
-        chunk_data: bytes,
-    ) -> Path:
-        """Store chunk with deduplication.
+    async def check_chunk_exists(self, chunk_hash: bytes) -> Path | None:
+        """Check if chunk exists locally.
 
-        Checks if chunk already exists. If it does, increments
-        reference count. Otherwise, stores the chunk physically
-        and creates a database entry.
+        Answers from the in-memory filter when the chunk is definitely not
+        stored; otherwise queries the index on the writer thread. The
+        last_accessed timestamp of a found chunk is updated in the next
+        batched flush.
 
         Args:
             chunk_hash: 32-byte chunk hash
-            chunk_data: Chunk data to store
 
         Returns:
-            Path to stored chunk (may be existing or new)
+            Path to stored chunk if exists, None otherwise
 
         """
-        # Check if already exists
-        existing = await self.check_chunk_exists(chunk_hash)
-        if existing:
-            # Increment reference count
-            self.db.execute(
-                "UPDATE chunks SET ref_count = ref_count + 1 WHERE hash = ?",
+        bloom = self._bloom
+        if bloom is not None and chunk_hash not in bloom:
+            return None
+        return await self._run(self._lookup_op, chunk_hash)
+
+    def _store_op(self, chunk_hash: bytes, chunk_data: bytes) -> Path:
+        bloom = self._bloom
+        if bloom is None or chunk_hash in bloom:
+            row = self.db.execute(
+                "SELECT storage_path FROM chunks WHERE hash = ?",
                 (chunk_hash,),
-            )
-            self.db.commit()
-            self.logger.debug(
-                "Chunk %s already exists, incremented ref count",
-                chunk_hash.hex()[:16],
-            )
-            return existing
+            ).fetchone()
+            if row is not None:
+                # Increment reference count
+                self.db.execute(
+                    "UPDATE chunks SET ref_count = ref_count + 1 WHERE hash = ?",
+                    (chunk_hash,),
+                )
+                self._touches[chunk_hash] = time.time()
+                self.logger.debug(
+                    "Chunk %s already exists, incremented ref count",
+                    chunk_hash.hex()[:16],
+                )
+                return Path(row[0])
 
-        # Store new chunk
-        storage_file = self.chunk_store_path / chunk_hash.hex()
-        storage_file.write_bytes(chunk_data)
+        # Store new chunk before indexing it
+        storage_file, offset = self._append_chunk(chunk_hash, chunk_data)
 
-        # Update database
         current_time = time.time()
         self.db.execute(
-            """INSERT INTO chunks (hash, size, storage_path, created_at, last_accessed)
-               VALUES (?, ?, ?, ?, ?)""",
+            """INSERT INTO chunks
+               (hash, size, storage_path, pack_offset, created_at, last_accessed)
+               VALUES (?, ?, ?, ?, ?, ?)""",
             (
                 chunk_hash,
                 len(chunk_data),
                 str(storage_file),
+                offset,
                 current_time,
                 current_time,
             ),
         )
-        self.db.commit()
+        if bloom is not None:
+            bloom.add(chunk_hash)
 
         self.logger.debug(
             "Stored new chunk %s (%d bytes)",
             chunk_hash.hex()[:16],
             len(chunk_data),
         )
-
         return storage_file
 
+    async def store_chunk(
+        self,
+        chunk_hash: bytes,
+        chunk_data: bytes,
+    ) -> Path:
+        """Store chunk with deduplication.
+
+        Checks if chunk already exists. If it does, increments
+        reference count. Otherwise, stores the chunk physically
+        and creates a database entry. Runs on the writer thread and
+        returns once the transaction containing it has committed.
+
+        Args:
+            chunk_hash: 32-byte chunk hash
+            chunk_data: Chunk data to store
+
+        Returns:
+            Path to the pack file holding the chunk (may be existing or new)
+
+        """
+        return await self._run(self._store_op, chunk_hash, chunk_data)
+
+    def _locate_op(self, chunk_hash: bytes) -> tuple[Path, int, int] | None:
+        row = self.db.execute(
+            "SELECT storage_path, pack_offset, size FROM chunks WHERE hash = ?",
+            (chunk_hash,),
+        ).fetchone()
+        if row is None:
+            return None
+        self._touches[chunk_hash] = time.time()
+        return Path(row[0]), row[1], row[2]
+
+    async def read_chunk(self, chunk_hash: bytes) -> bytes | None:
+        """Read a stored chunk.
+
+        Looks the chunk up in the index and reads it with a single
+        positional read from its pack.
+
+        Args:
+            chunk_hash: 32-byte chunk hash
+
+        Returns:
+            Chunk data, or None if the chunk is not stored or unreadable
+
+        """
+        bloom = self._bloom
+        if bloom is not None and chunk_hash not in bloom:
+            return None
+        error: Exception | None = None
+        # A second attempt covers a pack sealed or compacted after the lookup
+        for _ in range(2):
+            location = await self._run(self._locate_op, chunk_hash)
+            if location is None:
+                return None
+            try:
+                return await asyncio.to_thread(self.packs.read, *location, chunk_hash)
+            except (OSError, ValueError) as e:
+                error = e
+        self.logger.warning(
+            "Failed to read Xet chunk %s: %s", chunk_hash.hex()[:16], error
+        )
+        return None
+
     async def query_dht_for_chunk(self, chunk_hash: bytes) -> PeerInfo | None:
         """Query DHT for peers that have this chunk.
 
@@ -386,22 +750,13 @@ class XetDeduplication:
 
         return None
 
-    def get_chunk_info(self, chunk_hash: bytes) -> dict | None:
-        """Get information about a stored chunk.
-
-        Args:
-            chunk_hash: 32-byte chunk hash
-
-        Returns:
-            Dictionary with chunk information or None if not found
-
-        """
-        cursor = self.db.execute(
-            """SELECT hash, size, storage_path, ref_count, created_at, last_accessed
+    def _chunk_info_op(self, chunk_hash: bytes) -> dict | None:
+        row = self.db.execute(
+            """SELECT hash, size, storage_path, ref_count, created_at, last_accessed,
+                      pack_offset
                FROM chunks WHERE hash = ?""",
             (chunk_hash,),
-        )
-        row = cursor.fetchone()
+        ).fetchone()
         if row:
             return {
                 "hash": row[0],
@@ -409,29 +764,29 @@ class XetDeduplication:
                 "storage_path": row[2],
                 "ref_count": row[3],
                 "created_at": row[4],
-                "last_accessed": row[5],
+                "last_accessed": self._touches.get(chunk_hash, row[5]),
+                "pack_offset": row[6],
             }
         return None
 
-    def remove_chunk_reference(self, chunk_hash: bytes) -> bool:
-        """Remove a reference to a chunk.
-
-        Decrements the reference count. If ref_count reaches zero,
-        the chunk file is deleted.
+    def get_chunk_info(self, chunk_hash: bytes) -> dict | None:
+        """Get information about a stored chunk.
 
         Args:
             chunk_hash: 32-byte chunk hash
 
         Returns:
-            True if chunk was removed, False otherwise
+            Dictionary with chunk information or None if not found
 
         """
+        return self._call(self._chunk_info_op, chunk_hash)
+
+    def _remove_reference_op(self, chunk_hash: bytes) -> bool:
         # Get current ref count
-        cursor = self.db.execute(
-            "SELECT ref_count, storage_path FROM chunks WHERE hash = ?",
+        row = self.db.execute(
+            "SELECT ref_count, storage_path, size FROM chunks WHERE hash = ?",
             (chunk_hash,),
-        )
-        row = cursor.fetchone()
+        ).fetchone()
         if not row:
             return False
 
@@ -439,9 +794,9 @@ class XetDeduplication:
         storage_path = row[1]
 
         if ref_count <= 1:
-            # Remove chunk file and database entry
+            # Release chunk storage and remove database entry
             try:
-                Path(storage_path).unlink()
+                self._release_storage(storage_path, row[2])
             except OSError as e:
                 self.logger.warning(
                     "Failed to remove chunk file %s: %s",
@@ -450,44 +805,44 @@ class XetDeduplication:
                 )
 
             self.db.execute("DELETE FROM chunks WHERE hash = ?", (chunk_hash,))
-            self.db.commit()
+            self._touches.pop(chunk_hash, None)
             return True
         # Decrement ref count
         self.db.execute(
             "UPDATE chunks SET ref_count = ref_count - 1 WHERE hash = ?",
             (chunk_hash,),
         )
-        self.db.commit()
         return False
 
-    async def cleanup_unused_chunks(
-        self,
-        max_age_seconds: int = 30 * 24 * 60 * 60,  # 30 days
-    ) -> int:
-        """Remove chunks that haven't been accessed recently.
+    def remove_chunk_reference(self, chunk_hash: bytes) -> bool:
+        """Remove a reference to a chunk.
+
+        Decrements the reference count. If ref_count reaches zero, the
+        chunk is removed from the index and its space in the pack is
+        reclaimed by the next compaction.
 
         Args:
-            max_age_seconds: Maximum age in seconds before chunk is considered unused
+            chunk_hash: 32-byte chunk hash
 
         Returns:
-            Number of chunks removed
+            True if chunk was removed, False otherwise
 
         """
-        cutoff_time = time.time() - max_age_seconds
+        return self._call(self._remove_reference_op, chunk_hash)
 
-        cursor = self.db.execute(
-            """SELECT hash, storage_path FROM chunks
+    def _cleanup_op(self, cutoff_time: float) -> int:
+        # Pending accesses must count before deciding what is unused
+        self._flush_touches()
+        rows = self.db.execute(
+            """SELECT hash, storage_path, size FROM chunks
                WHERE last_accessed < ? AND ref_count <= 1""",
             (cutoff_time,),
-        )
+        ).fetchall()
 
         removed_count = 0
-        for row in cursor.fetchall():
-            chunk_hash = row[0]
-            storage_path = row[1]
-
+        for chunk_hash, storage_path, size in rows:
             try:
-                Path(storage_path).unlink()
+                self._release_storage(storage_path, size)
                 self.db.execute("DELETE FROM chunks WHERE hash = ?", (chunk_hash,))
                 removed_count += 1
             except OSError as e:
@@ -496,37 +851,202 @@ class XetDeduplication:
                     storage_path,
                     e,
                 )
+        return removed_count
+
+    async def cleanup_unused_chunks(
+        self,
+        max_age_seconds: int = 30 * 24 * 60 * 60,  # 30 days
+    ) -> int:
+        """Remove chunks that haven't been accessed recently.
+
+        Args:
+            max_age_seconds: Maximum age in seconds before chunk is considered unused
+
+        Returns:
+            Number of chunks removed
 
-        self.db.commit()
+        """
+        removed_count = await self._run(self._cleanup_op, time.time() - max_age_seconds)
+        if removed_count:
+            # Drop removed hashes from the filter
+            await self._run(self._rebuild_bloom)
         self.logger.info("Cleaned up %d unused chunks", removed_count)
         return removed_count
 
-    def get_cache_stats(self) -> dict:
-        """Get statistics about the deduplication cache.
+    def _compact_op(
+        self,
+        min_dead_ratio: float,
+        max_packs: int | None = None,
+        max_files: int | None = None,
+    ) -> int:
+        """Rewrite mostly-dead packs and pack legacy chunk files.
 
         Returns:
-            Dictionary with cache statistics
+            Number of pack bytes reclaimed
 
         """
-        cursor = self.db.execute(
+        query = """SELECT path, size FROM packs
+                   WHERE sealed = 1 AND dead_bytes > 0 AND dead_bytes >= size * ?
+                   ORDER BY dead_bytes DESC LIMIT ?"""
+        # LIMIT -1 means no limit in SQLite
+        params = (min_dead_ratio, -1 if max_packs is None else max_packs)
+        reclaimed = 0
+        discarded: list[Path] = []
+        for path, size in self.db.execute(query, params).fetchall():
+            pack_path = Path(path)
+            live = self.db.execute(
+                "SELECT hash, pack_offset, size FROM chunks WHERE storage_path = ?",
+                (path,),
+            ).fetchall()
+            moved = 0
+            for chunk_hash, offset, length in live:
+                try:
+                    data = self.packs.read(pack_path, offset, length, chunk_hash)
+                except (OSError, ValueError) as e:
+                    self._drop_unreadable(chunk_hash, e)
+                    continue
+                self._move_chunk(chunk_hash, data)
+                moved += XORB_ENTRY_HEADER_SIZE + length
+            self.db.execute("DELETE FROM packs WHERE path = ?", (path,))
+            discarded.append(pack_path)
+            reclaimed += size - moved
+
+        if not self._legacy_migrated:
+            discarded.extend(self._migrate_legacy(max_files))
+
+        if discarded:
+            # Moved chunks must be durable before their old copies go away
+            self.packs.sync()
+            self._after_commit.extend(
+                partial(self._discard_file, path) for path in discarded
+            )
+        if reclaimed:
+            self.logger.info("Compacted Xet packs, reclaimed %d bytes", reclaimed)
+        return reclaimed
+
+    def _migrate_legacy(self, max_files: int | None) -> list[Path]:
+        """Move chunks stored one per file into packs (writer thread).
+
+        Returns:
+            Legacy files to delete after commit
+
+        """
+        query = """SELECT hash, storage_path, size FROM chunks
+                   WHERE storage_path NOT IN (SELECT path FROM packs)
+                   LIMIT ?"""
+        rows = self.db.execute(
+            query, (-1 if max_files is None else max_files,)
+        ).fetchall()
+        if max_files is None or len(rows) < max_files:
+            self._legacy_migrated = True
+
+        migrated: list[Path] = []
+        for chunk_hash, storage_path, size in rows:
+            legacy_file = Path(storage_path)
+            try:
+                data = legacy_file.read_bytes()
+                if len(data) != size:
+                    msg = f"expected {size} bytes, found {len(data)}"
+                    raise ValueError(msg)
+            except (OSError, ValueError) as e:
+                self._drop_unreadable(chunk_hash, e)
+                continue
+            self._move_chunk(chunk_hash, data)
+            migrated.append(legacy_file)
+        return migrated
+
+    def _move_chunk(self, chunk_hash: bytes, chunk_data: bytes) -> None:
+        """Append a chunk to the active pack and point its index row there."""
+        pack_path, offset = self._append_chunk(chunk_hash, chunk_data)
+        self.db.execute(
+            "UPDATE chunks SET storage_path = ?, pack_offset = ? WHERE hash = ?",
+            (str(pack_path), offset, chunk_hash),
+        )
+
+    def _drop_unreadable(self, chunk_hash: bytes, error: Exception) -> None:
+        self.logger.warning(
+            "Dropping unreadable Xet chunk %s: %s", chunk_hash.hex()[:16], error
+        )
+        self.db.execute("DELETE FROM chunks WHERE hash = ?", (chunk_hash,))
+
+    def _discard_file(self, path: Path) -> None:
+        if self.packs.is_pack(path):
+            self.packs.discard(path)
+        else:
+            path.unlink(missing_ok=True)
+
+    def _compact_when_idle(self) -> None:
+        """Run one bounded compaction pass while no operations are queued."""
+        future: Future = Future()
+        op = partial(
+            self._compact_op,
+            COMPACT_DEAD_RATIO,
+            COMPACT_PACKS_PER_PASS,
+            MIGRATE_FILES_PER_PASS,
+        )
+        self._run_batch([(op, future)])
+        error = future.exception()
+        if error is not None:
+            self.logger.warning("Xet pack compaction failed: %s", error)
+
+    async def compact(self, min_dead_ratio: float = COMPACT_DEAD_RATIO) -> int:
+        """Reclaim space held by unreferenced chunks.
+
+        Live chunks of every sealed pack with at least ``min_dead_ratio``
+        dead bytes are copied into the active pack and the old pack file is
+        deleted. Chunk files left by the one-file-per-chunk layout are
+        moved into packs as well. The same work runs in small steps in the
+        background whenever the index is idle.
+
+        Args:
+            min_dead_ratio: Fraction of dead bytes at which a pack is rewritten
+
+        Returns:
+            Number of pack bytes reclaimed
+
+        """
+        return await self._run(self._compact_op, min_dead_ratio)
+
+    def _cache_stats_op(self) -> dict:
+        row = self.db.execute(
             """SELECT
                 COUNT(*) as total_chunks,
                 SUM(size) as total_size,
                 SUM(ref_count) as total_refs,
                 AVG(size) as avg_size
                FROM chunks"""
-        )
-        row = cursor.fetchone()
+        ).fetchone()
+        pack_row = self.db.execute(
+            "SELECT COUNT(*), SUM(size), SUM(dead_bytes) FROM packs"
+        ).fetchone()
 
         return {
             "total_chunks": row[0] or 0,
             "total_size": row[1] or 0,
             "total_refs": row[2] or 0,
             "avg_size": row[3] or 0,
+            "pack_count": pack_row[0] or 0,
+            "pack_bytes": pack_row[1] or 0,
+            "dead_bytes": pack_row[2] or 0,
         }
 
+    def get_cache_stats(self) -> dict:
+        """Get statistics about the deduplication cache.
+
+        Returns:
+            Dictionary with cache statistics
+
+        """
+        return self._call(self._cache_stats_op)
+
     def close(self) -> None:
-        """Close database connection."""
+        """Flush pending updates, stop the writer thread and close the database."""
+        if self._closed:
+            return
+        self._closed = True
+        self._ops.put(None)
+        self._writer.join()
+        self.packs.close()
         if self.db:
             self.db.close()
 
@@ -544,4 +1064,4 @@ class XetDeduplication:
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit."""
-        self.close()
+        await asyncio.to_thread(self.close)
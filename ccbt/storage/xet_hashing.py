@@ -14,6 +14,8 @@ import hashlib
 import logging
 from typing import TYPE_CHECKING
 
+from ccbt.piece.merkle import MerkleTree
+
 if TYPE_CHECKING:
     from collections.abc import Callable
 
@@ -80,9 +82,8 @@ class XetHasher:
     def build_merkle_tree(chunks: list[bytes]) -> bytes:
         """Build Merkle tree from chunk hashes.
 
-        Constructs a binary Merkle tree bottom-up from chunk hashes.
-        Each level pairs hashes and hashes them together until a single
-        root hash remains.
+        Hashes each chunk and builds a binary Merkle tree over the hashes
+        (see :meth:`build_merkle_tree_from_hashes`).
 
         Args:
             chunks: List of chunk data (not hashes - will be hashed)
@@ -94,25 +95,9 @@ class XetHasher:
         if not chunks:
             return b"\x00" * XetHasher.HASH_SIZE
 
-        # Compute chunk hashes
-        hashes = [XetHasher.compute_chunk_hash(chunk) for chunk in chunks]
-
-        # Build binary tree bottom-up
-        while len(hashes) > 1:
-            next_level = []
-            for i in range(0, len(hashes), 2):
-                if i + 1 < len(hashes):
-                    # Pair hashes: combine and hash
-                    combined = hashes[i] + hashes[i + 1]
-                    next_level.append(XetHasher.compute_chunk_hash(combined))
-                else:
-                    # Odd number, promote single hash (duplicate for pairing)
-                    # In Merkle trees, odd nodes are typically duplicated
-                    combined = hashes[i] + hashes[i]
-                    next_level.append(XetHasher.compute_chunk_hash(combined))
-            hashes = next_level
-
-        return hashes[0]
+        return XetHasher.build_merkle_tree_from_hashes(
+            [XetHasher.compute_chunk_hash(chunk) for chunk in chunks]
+        )
 
     @staticmethod
     def build_merkle_tree_from_hashes(chunk_hashes: list[bytes]) -> bytes:
@@ -139,24 +124,10 @@ class XetHasher:
                 msg = f"Invalid hash size: expected {XetHasher.HASH_SIZE}, got {len(h)}"
                 raise ValueError(msg)
 
-        # Build binary tree bottom-up
-        hashes = list(chunk_hashes)
-        while len(hashes) > 1:
-            next_level = []
-            for i in range(0, len(hashes), 2):
-                if i + 1 < len(hashes):
-                    # Pair hashes
-                    combined = hashes[i] + hashes[i + 1]
-                    next_level.append(XetHasher.compute_chunk_hash(combined))
-                else:  # pragma: no cover - Odd number handling tested in test_build_merkle_tree_three
-                    # Odd number, duplicate for pairing
-                    combined = hashes[i] + hashes[i]  # pragma: no cover - Same context
-                    next_level.append(
-                        XetHasher.compute_chunk_hash(combined)
-                    )  # pragma: no cover - Same context
-            hashes = next_level
-
-        return hashes[0]
+        # Unpaired nodes are hashed with themselves
+        return MerkleTree(
+            chunk_hashes, hash_func=XetHasher.compute_chunk_hash, pad=None
+        ).root()
 
     @staticmethod
     def verify_chunk_hash(chunk_data: bytes, expected_hash: bytes) -> bool:
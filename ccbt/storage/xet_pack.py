@@ -0,0 +1,379 @@
+"""Append-only pack files for the local Xet chunk store.
+
+Instead of one file per chunk, chunks are appended to pack files that use
+the xorb layout from :mod:`ccbt.storage.xet_xorb`: header, chunk count,
+entries of (hash, size, compressed size, data) and a total-size trailer.
+The active pack grows until the next chunk would push it past
+``MAX_XORB_SIZE``. Sealing it writes the chunk count and trailer, after
+which it is an ordinary xorb and never changes again.
+
+Sealed packs are read through a small cache of read-only memory maps; the
+active pack is read with a positional read. Every read fetches the entry
+header together with the data and checks the chunk hash, so a stale
+location (for example a pack that was compacted away) is detected instead
+of returning the wrong bytes.
+
+This module only manages files. The chunk index (hash to pack, offset and
+length) and per-pack accounting live in
+:class:`ccbt.storage.xet_deduplication.XetDeduplication`.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import logging
+import mmap
+import os
+import struct
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import BinaryIO
+
+from ccbt.storage.xet_xorb import (
+    MAX_XORB_SIZE,
+    XORB_COUNT_SIZE,
+    XORB_ENTRY_HEADER_SIZE,
+    XORB_HEADER_SIZE,
+    XORB_MAGIC,
+    encode_chunk_entry_header,
+    encode_xorb_header,
+)
+
+logger = logging.getLogger(__name__)
+
+PACK_PREFIX = "pack-"
+PACK_SUFFIX = ".xorb"
+
+# Sealed packs kept memory-mapped at once (least recently used are dropped)
+MAX_MAPPED_PACKS = 64
+
+# Bytes before the first entry of a pack
+PACK_DATA_START = XORB_HEADER_SIZE + XORB_COUNT_SIZE
+
+_O_BINARY = getattr(os, "O_BINARY", 0)
+
+
+class ChunkPackStore:
+    """Append chunks to xorb pack files and read them back by offset.
+
+    Appends, sealing and discarding happen on one thread (the index writer);
+    reads may come from any thread.
+
+    Attributes:
+        root: Directory holding the pack files
+        max_pack_size: Size at which the active pack is sealed
+
+    """
+
+    def __init__(
+        self,
+        root: Path | str,
+        max_pack_size: int = MAX_XORB_SIZE,
+        max_mapped_packs: int = MAX_MAPPED_PACKS,
+    ):
+        """Initialize pack store.
+
+        Args:
+            root: Directory holding the pack files
+            max_pack_size: Size at which the active pack is sealed
+            max_mapped_packs: Sealed packs kept memory-mapped at once
+
+        """
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.max_pack_size = max_pack_size
+        self.max_mapped_packs = max_mapped_packs
+
+        self._lock = threading.Lock()
+        self._maps: OrderedDict[Path, mmap.mmap] = OrderedDict()
+        self._active_path: Path | None = None
+        self._active_fd: int | None = None
+        self._active_size = 0
+        self._active_count = 0
+        self._active_total = 0
+        self._next_id = self._scan_next_id()
+
+    @staticmethod
+    def is_pack(path: Path | str) -> bool:
+        """Check whether a path names a pack file (not a legacy chunk file)."""
+        name = Path(path).name
+        return name.startswith(PACK_PREFIX) and name.endswith(PACK_SUFFIX)
+
+    @property
+    def active_path(self) -> Path | None:
+        """Path of the pack currently being appended to."""
+        return self._active_path
+
+    @property
+    def active_size(self) -> int:
+        """Bytes written to the active pack."""
+        return self._active_size
+
+    def _scan_next_id(self) -> int:
+        """Return the number for the next new pack file."""
+        highest = 0
+        for path in self.root.glob(f"{PACK_PREFIX}*{PACK_SUFFIX}"):
+            digits = path.name[len(PACK_PREFIX) : -len(PACK_SUFFIX)]
+            if digits.isdigit():
+                highest = max(highest, int(digits))
+        return highest + 1
+
+    @staticmethod
+    def _scan(f: BinaryIO, limit: int) -> tuple[int, int, int]:
+        """Walk the entries of a pack up to ``limit`` bytes.
+
+        Returns:
+            Tuple of (chunk count, total chunk size, end of last whole entry)
+
+        Raises:
+            ValueError: If the file is not a pack
+
+        """
+        f.seek(0)
+        header = f.read(PACK_DATA_START)
+        if len(header) < PACK_DATA_START or header[:4] != XORB_MAGIC:
+            msg = "Not a xorb pack file"
+            raise ValueError(msg)
+
+        count = total = 0
+        pos = PACK_DATA_START
+        while pos + XORB_ENTRY_HEADER_SIZE <= limit:
+            f.seek(pos)
+            entry = f.read(XORB_ENTRY_HEADER_SIZE)
+            if len(entry) < XORB_ENTRY_HEADER_SIZE:
+                break
+            size, compressed_size = struct.unpack("II", entry[32:])
+            end = pos + XORB_ENTRY_HEADER_SIZE + (compressed_size or size)
+            if end > limit:
+                break
+            count += 1
+            total += size
+            pos = end
+        return count, total, pos
+
+    def resume(self, path: Path, size: int) -> None:
+        """Reopen an unsealed pack as the active pack.
+
+        Bytes past ``size`` (appended by a transaction that never committed)
+        are truncated.
+
+        Args:
+            path: Pack file left active by an earlier run
+            size: Committed size of the pack
+
+        """
+        with path.open("r+b") as f:
+            count, total, end = self._scan(f, min(size, path.stat().st_size))
+            f.truncate(end)
+        fd = os.open(path, os.O_RDWR | _O_BINARY)
+        os.lseek(fd, end, os.SEEK_SET)
+        with self._lock:
+            self._active_path = path
+            self._active_fd = fd
+        self._active_size = end
+        self._active_count = count
+        self._active_total = total
+
+    def finalize(self, path: Path, size: int) -> None:
+        """Seal a pack that an earlier run left unsealed.
+
+        Args:
+            path: Pack file to seal
+            size: Committed size of the pack
+
+        """
+        with path.open("r+b") as f:
+            count, total, end = self._scan(f, min(size, path.stat().st_size))
+            f.truncate(end)
+            f.seek(XORB_HEADER_SIZE)
+            f.write(struct.pack("I", count))
+            f.seek(end)
+            f.write(struct.pack("Q", total))
+            f.flush()
+            os.fsync(f.fileno())
+
+    def _open_new(self) -> tuple[Path, int]:
+        """Create a new active pack and return its path and descriptor."""
+        path = self.root / f"{PACK_PREFIX}{self._next_id:08d}{PACK_SUFFIX}"
+        self._next_id += 1
+        fd = os.open(path, os.O_RDWR | os.O_CREAT | os.O_EXCL | _O_BINARY, 0o644)
+        self._write_all(fd, encode_xorb_header() + struct.pack("I", 0))
+        with self._lock:
+            self._active_path = path
+            self._active_fd = fd
+        self._active_size = PACK_DATA_START
+        self._active_count = 0
+        self._active_total = 0
+        return path, fd
+
+    @staticmethod
+    def _write_all(fd: int, data: bytes) -> None:
+        view = memoryview(data)
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+
+    def reserve(self, length: int) -> Path | None:
+        """Seal the active pack if a chunk of ``length`` bytes will not fit.
+
+        Args:
+            length: Size of the chunk about to be appended
+
+        Returns:
+            Path of the pack that was sealed, or None
+
+        """
+        if (
+            self._active_path is not None
+            and self._active_count
+            and self._active_size + XORB_ENTRY_HEADER_SIZE + length > self.max_pack_size
+        ):
+            return self.seal()
+        return None
+
+    def append(self, chunk_hash: bytes, chunk_data: bytes) -> tuple[Path, int]:
+        """Append a chunk to the active pack.
+
+        Args:
+            chunk_hash: 32-byte chunk hash
+            chunk_data: Chunk data (stored uncompressed)
+
+        Returns:
+            Tuple of (pack path, offset of the chunk data in the pack)
+
+        """
+        path, fd = self._active_path, self._active_fd
+        if path is None or fd is None:
+            path, fd = self._open_new()
+
+        entry = encode_chunk_entry_header(chunk_hash, len(chunk_data))
+        self._write_all(fd, entry + chunk_data)
+        offset = self._active_size + XORB_ENTRY_HEADER_SIZE
+        self._active_size = offset + len(chunk_data)
+        self._active_count += 1
+        self._active_total += len(chunk_data)
+        return path, offset
+
+    def sync(self) -> None:
+        """Flush the active pack to disk."""
+        if self._active_fd is not None:
+            os.fsync(self._active_fd)
+
+    def seal(self) -> Path | None:
+        """Write the chunk count and trailer and close the active pack.
+
+        Returns:
+            Path of the sealed pack, or None if no pack was active
+
+        """
+        path, fd = self._active_path, self._active_fd
+        if path is None or fd is None:
+            return None
+        self._write_all(fd, struct.pack("Q", self._active_total))
+        os.lseek(fd, XORB_HEADER_SIZE, os.SEEK_SET)
+        self._write_all(fd, struct.pack("I", self._active_count))
+        os.fsync(fd)
+        with self._lock:
+            self._active_path = None
+            self._active_fd = None
+            os.close(fd)
+        self._active_size = 0
+        return path
+
+    def _map(self, path: Path) -> mmap.mmap:
+        """Return a cached read-only map of a sealed pack."""
+        with self._lock:
+            mapped = self._maps.get(path)
+            if mapped is not None:
+                self._maps.move_to_end(path)
+                return mapped
+        with path.open("rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        with self._lock:
+            self._maps[path] = mapped
+            while len(self._maps) > self.max_mapped_packs:
+                # Dropped maps close once no reader holds them
+                self._maps.popitem(last=False)
+        return mapped
+
+    def read(
+        self,
+        path: Path,
+        offset: int,
+        length: int,
+        chunk_hash: bytes | None = None,
+    ) -> bytes:
+        """Read a chunk with one positional read.
+
+        Args:
+            path: Pack file (or legacy single-chunk file) holding the chunk
+            offset: Offset of the chunk data
+            length: Chunk size in bytes
+            chunk_hash: Expected hash, checked against the entry header
+
+        Returns:
+            Chunk data
+
+        Raises:
+            OSError: If the file cannot be read
+            ValueError: If the entry does not hold the expected chunk
+
+        """
+        if not self.is_pack(path):
+            # Legacy layout: the whole file is the chunk
+            with path.open("rb") as f:
+                f.seek(offset)
+                return f.read(length)
+
+        start = offset - XORB_ENTRY_HEADER_SIZE
+        span = XORB_ENTRY_HEADER_SIZE + length
+        buf: bytes | None = None
+        with self._lock:
+            if path == self._active_path and self._active_fd is not None:
+                if hasattr(os, "pread"):
+                    buf = os.pread(self._active_fd, span, start)
+                else:  # pragma: no cover - Windows has no pread
+                    with path.open("rb") as f:
+                        f.seek(start)
+                        buf = f.read(span)
+        if buf is None:
+            buf = self._map(path)[start : start + span]
+
+        if len(buf) != span:
+            msg = f"Short read from {path.name} at offset {offset}"
+            raise ValueError(msg)
+        if chunk_hash is not None and buf[:32] != chunk_hash:
+            msg = f"Chunk {chunk_hash.hex()[:16]} not found in {path.name}"
+            raise ValueError(msg)
+        return buf[XORB_ENTRY_HEADER_SIZE:]
+
+    def discard(self, path: Path) -> None:
+        """Delete a pack file that no longer holds live chunks.
+
+        Args:
+            path: Sealed pack to delete
+
+        """
+        with self._lock:
+            mapped = self._maps.pop(path, None)
+        if mapped is not None:
+            with contextlib.suppress(BufferError):  # Reader still holds a view
+                mapped.close()
+        try:
+            path.unlink(missing_ok=True)
+        except OSError as e:
+            logger.warning("Failed to remove pack file %s: %s", path, e)
+
+    def close(self) -> None:
+        """Close the active pack (left unsealed) and drop all maps."""
+        with self._lock:
+            fd, self._active_fd = self._active_fd, None
+            self._active_path = None
+            maps = list(self._maps.values())
+            self._maps.clear()
+        if fd is not None:
+            os.close(fd)
+        for mapped in maps:
+            with contextlib.suppress(BufferError):  # Reader still holds a view
+                mapped.close()
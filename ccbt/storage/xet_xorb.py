@@ -37,12 +37,50 @@ XORB_MAGIC_INT = 0x24687531  # Magic number for xorb format (little-endian uint3
 XORB_MAGIC = struct.pack("<I", XORB_MAGIC_INT)  # Convert to 4 bytes (little-endian)
 XORB_VERSION = 1  # Format version
 XORB_HEADER_SIZE = 16  # Header size in bytes
+XORB_COUNT_SIZE = 4  # Chunk count after the header (uint32)
+XORB_ENTRY_HEADER_SIZE = 40  # Hash + uncompressed size + compressed size
+XORB_TRAILER_SIZE = 8  # Total uncompressed size (uint64)
 
 # Compression flags
 FLAG_COMPRESSED = 0x01  # Chunk data is compressed with LZ4
 FLAG_RESERVED_MASK = 0xFE  # Reserved bits for future use
 
 
+def encode_xorb_header(flags: int = 0x00) -> bytes:
+    """Encode the 16-byte xorb header.
+
+    Args:
+        flags: Header flags (FLAG_COMPRESSED or 0)
+
+    Returns:
+        16-byte header
+
+    """
+    # Pack magic as 4 bytes (little-endian uint32), version, flags, reserved
+    return (
+        XORB_MAGIC  # 4 bytes (already packed as bytes)
+        + struct.pack("BB", XORB_VERSION, flags)  # 2 bytes
+        + b"\x00" * 10  # Reserved bytes
+    )
+
+
+def encode_chunk_entry_header(
+    chunk_hash: bytes, uncompressed_size: int, compressed_size: int = 0
+) -> bytes:
+    """Encode the 40-byte header that precedes chunk data in a xorb.
+
+    Args:
+        chunk_hash: 32-byte chunk hash
+        uncompressed_size: Chunk size before compression
+        compressed_size: Size of the stored data if compressed, 0 otherwise
+
+    Returns:
+        Entry header bytes
+
+    """
+    return chunk_hash + struct.pack("II", uncompressed_size, compressed_size)
+
+
 class Xorb:
     """Xorb (XOR of blocks) format handler.
 
@@ -134,12 +172,7 @@ class Xorb:
 
         """
         flags = FLAG_COMPRESSED if (compress and HAS_LZ4) else 0x00
-        # Pack magic as 4 bytes (little-endian uint32), version, flags, reserved
-        return (
-            XORB_MAGIC  # 4 bytes (already packed as bytes)
-            + struct.pack("BB", XORB_VERSION, flags)  # 2 bytes
-            + b"\x00" * 10  # Reserved bytes
-        )
+        return encode_xorb_header(flags)
 
     def _serialize_chunks(self, compress: bool = False) -> bytes:
         """Serialize chunk entries.
@@ -197,9 +230,9 @@ class Xorb:
 
             # Format: Hash (32 bytes) + uncompressed_size (4 bytes) + compressed_size (4 bytes) + data
             data += (
-                chunk_hash
-                + struct.pack("I", uncompressed_size)
-                + struct.pack("I", compressed_size)
+                encode_chunk_entry_header(
+                    chunk_hash, uncompressed_size, compressed_size
+                )
                 + final_data
             )
 
@@ -18,11 +18,16 @@ import contextlib
 import logging
 import struct
 import time
+from collections import deque
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Callable
+from typing import TYPE_CHECKING, Callable
 
 from ccbt.config.config import get_config
+from ccbt.transport.utp_timer import UTPTimer, UTPTimerWheel
+
+if TYPE_CHECKING:  # pragma: no cover
+    from ccbt.transport.utp_socket import UTPSocketManager
 
 # Import here to avoid circular dependency
 logger = logging.getLogger(__name__)
@@ -233,6 +238,135 @@ class UTPPacket:
 _PacketInfo = tuple[UTPPacket, float, int]
 
 
+class UTPReceiveBuffer:
+    """Reassembled in-order receive data stored as a deque of chunks.
+
+    Payloads are appended without copying into a contiguous buffer, and
+    reads consume from the head using an offset into the first chunk, so the
+    cost of a read is proportional to the bytes returned rather than to the
+    amount of data buffered.
+    """
+
+    __slots__ = ("_chunks", "_offset", "_size")
+
+    def __init__(self, data: bytes | bytearray | memoryview = b""):
+        """Initialize receive buffer.
+
+        Args:
+            data: Optional initial contents
+
+        """
+        self._chunks: deque[bytes] = deque()
+        self._offset = 0  # Bytes already consumed from the first chunk
+        self._size = 0
+        self.extend(data)
+
+    def __len__(self) -> int:
+        """Return number of buffered bytes."""
+        return self._size
+
+    def __bytes__(self) -> bytes:
+        """Return a copy of the buffered bytes without consuming them."""
+        if not self._chunks:
+            return b""
+        if len(self._chunks) == 1:
+            return self._chunks[0][self._offset :]
+        return b"".join(self._iter_views())
+
+    def __repr__(self) -> str:
+        """Return debug representation."""
+        return f"UTPReceiveBuffer(size={self._size}, chunks={len(self._chunks)})"
+
+    def _iter_views(self):
+        """Yield memoryviews over the unconsumed part of each chunk."""
+        first = True
+        for chunk in self._chunks:
+            if first:
+                first = False
+                yield memoryview(chunk)[self._offset :]
+            else:
+                yield memoryview(chunk)
+
+    def extend(self, data: bytes | bytearray | memoryview) -> None:
+        """Append data to the end of the buffer."""
+        if not data:
+            return
+        if not isinstance(data, bytes):
+            data = bytes(data)
+        self._chunks.append(data)
+        self._size += len(data)
+
+    def clear(self) -> None:
+        """Discard all buffered data."""
+        self._chunks.clear()
+        self._offset = 0
+        self._size = 0
+
+    def readinto(self, buf: bytearray | memoryview) -> int:
+        """Move up to ``len(buf)`` bytes from the head of the buffer into ``buf``.
+
+        Args:
+            buf: Writable destination buffer
+
+        Returns:
+            Number of bytes copied
+
+        """
+        dest = memoryview(buf).cast("B")
+        wanted = min(len(dest), self._size)
+        copied = 0
+        chunks = self._chunks
+        while copied < wanted:
+            chunk = chunks[0]
+            available = len(chunk) - self._offset
+            take = min(available, wanted - copied)
+            dest[copied : copied + take] = memoryview(chunk)[
+                self._offset : self._offset + take
+            ]
+            copied += take
+            if take == available:
+                chunks.popleft()
+                self._offset = 0
+            else:
+                self._offset += take
+        self._size -= copied
+        return copied
+
+    def read(self, n: int = -1) -> bytes:
+        """Remove and return up to ``n`` bytes (-1 for everything buffered).
+
+        Args:
+            n: Maximum number of bytes to return
+
+        Returns:
+            Data removed from the head of the buffer
+
+        """
+        if n < 0 or n >= self._size:
+            data = bytes(self)
+            self.clear()
+            return data
+        if n == 0:
+            return b""
+
+        # Fast path: the request is satisfied by the head chunk alone
+        chunk = self._chunks[0]
+        end = self._offset + n
+        if end <= len(chunk):
+            data = chunk[self._offset : end]
+            if end == len(chunk):
+                self._chunks.popleft()
+                self._offset = 0
+            else:
+                self._offset = end
+            self._size -= n
+            return data
+
+        out = bytearray(n)
+        self.readinto(out)
+        return bytes(out)
+
+
 class UTPConnection:
     """uTP connection implementation with reliable, ordered delivery.
 
@@ -322,8 +456,9 @@ class UTPConnection:
         # Receive buffer
         self.recv_buffer: dict[int, UTPPacket] = {}  # seq_nr -> packet (out-of-order)
         self.recv_buffer_expected_seq = 0  # Next expected sequence number
-        self.recv_data_buffer = bytearray()  # Reassembled received data
+        self.recv_data_buffer = UTPReceiveBuffer()  # Reassembled received data
         self.recv_data_available = asyncio.Event()  # Signal when data is available
+        self._recv_eof = False  # No more data will arrive (FIN, RESET or close)
 
         # SACK support
         self.received_seqs: set[int] = set()  # Set of all received sequence numbers
@@ -332,7 +467,7 @@ class UTPConnection:
 
         # Delayed ACK support
         self.pending_acks: list[UTPPacket] = []  # Queue of packets waiting for ACK
-        self.ack_timer: asyncio.Task | None = None  # Delayed ACK timer task
+        self.ack_timer: UTPTimer | None = None  # Delayed ACK timer
         self.ack_delay: float = (
             self.config.network.utp.ack_interval
             if hasattr(self.config, "network")
@@ -346,8 +481,12 @@ class UTPConnection:
         # Transport (UDP socket) - set via set_transport()
         self.transport: asyncio.DatagramTransport | None = None
 
+        # Owning socket manager (shared timer wheel and per-burst ACK flush)
+        self.socket_manager: UTPSocketManager | None = None
+        self._timer_wheel: UTPTimerWheel | None = None
+        self._rto_timers: dict[int, UTPTimer] = {}  # seq_nr -> RTO timer
+
         # Background tasks
-        self._retransmission_task: asyncio.Task | None = None
         self._send_task: asyncio.Task | None = None
         self._receive_task: asyncio.Task | None = None
 
@@ -386,6 +525,16 @@ class UTPConnection:
         self.ecn_echo: bool = False  # ECN Echo flag to send
         self.ecn_cwr: bool = False  # ECN CWR (Congestion Window Reduced) flag
 
+    @property
+    def at_eof(self) -> bool:
+        """Whether the peer has finished sending and all data has been read."""
+        return self._recv_eof and len(self.recv_data_buffer) == 0
+
+    def _mark_recv_eof(self) -> None:
+        """Record that no more data will arrive and wake pending readers."""
+        self._recv_eof = True
+        self.recv_data_available.set()
+
     def set_transport(self, transport: asyncio.DatagramTransport) -> None:
         """Set UDP transport for sending packets.
 
@@ -395,6 +544,19 @@ class UTPConnection:
         """
         self.transport = transport
 
+    @property
+    def timer_wheel(self) -> UTPTimerWheel:
+        """Timer wheel for RTO and delayed ACK timers.
+
+        Uses the socket manager's shared wheel when registered, otherwise a
+        private wheel (e.g. for a connection driven without a manager).
+        """
+        if self.socket_manager is not None:
+            return self.socket_manager.timer_wheel
+        if self._timer_wheel is None:
+            self._timer_wheel = UTPTimerWheel()
+        return self._timer_wheel
+
     async def initialize_transport(self) -> None:
         """Initialize transport via UTPSocketManager.
 
@@ -405,6 +567,7 @@ class UTPConnection:
 
         socket_manager = await UTPSocketManager.get_instance()
         self.transport = socket_manager.get_transport()
+        self.socket_manager = socket_manager
 
         # Generate connection ID if not already set (for collision detection)
         if not self._connection_id_generated:
@@ -684,9 +847,6 @@ class UTPConnection:
         # Start background tasks
         self._start_background_tasks()
 
-        # Start ACK timer
-        self._start_ack_timer()
-
         # Remove SYN from send buffer (now ACK'd)
         if 0 in self.send_buffer:
             del self.send_buffer[0]
@@ -779,49 +939,23 @@ class UTPConnection:
         )
 
     def _start_background_tasks(self) -> None:
-        """Start background tasks for retransmission and packet processing."""
-        if self._retransmission_task is None:
-            self._retransmission_task = asyncio.create_task(self._retransmission_loop())
+        """Start background task for packet processing.
+
+        Retransmission and delayed ACK timers run on the shared timer wheel
+        rather than in per-connection tasks.
+        """
         if self._send_task is None:
             self._send_task = asyncio.create_task(self._send_loop())
 
-    def _start_ack_timer(self) -> None:
-        """Start delayed ACK timer."""
-        if self.ack_timer is None:
-            self.ack_timer = asyncio.create_task(self._delayed_ack_loop())
-
-    async def _stop_ack_timer(self) -> None:
-        """Stop delayed ACK timer."""
-        if self.ack_timer:
+    def _cancel_timers(self) -> None:
+        """Cancel all RTO timers and the delayed ACK timer."""
+        for timer in self._rto_timers.values():
+            timer.cancel()
+        self._rto_timers.clear()
+        if self.ack_timer is not None:
             self.ack_timer.cancel()
-            with contextlib.suppress(asyncio.CancelledError):
-                # Wait for task to complete cancellation
-                await self.ack_timer
-            # Send any pending ACKs before clearing timer
-            if self.pending_acks:
-                self._send_batched_acks()
             self.ack_timer = None
 
-    async def _delayed_ack_loop(self) -> None:
-        """Background task to send delayed ACKs."""
-        while self.state == UTPConnectionState.CONNECTED:
-            try:
-                # Wait for ACK delay or immediate ACK trigger
-                await asyncio.sleep(self.ack_delay)
-
-                # Send any pending ACKs
-                if self.pending_acks:
-                    self._send_batched_acks()
-            except asyncio.CancelledError:  # pragma: no cover
-                # Send any pending ACKs before cancellation
-                # Hard to test: requires cancellation during delayed ACK loop
-                if self.pending_acks:
-                    self._send_batched_acks()  # pragma: no cover
-                break
-            except Exception:
-                self.logger.exception("Error in delayed ACK loop")
-                break
-
     async def _send_loop(self) -> None:
         """Background task to process send queue."""
         while self.state == UTPConnectionState.CONNECTED:
@@ -895,9 +1029,11 @@ class UTPConnection:
                 time.perf_counter(),
                 0,  # retry_count
             )
+            self._arm_retransmit_timer(self.seq_nr)
 
-            # Send packet
+            # Send packet (carries our current ack_nr)
             self._send_packet(packet)
+            self._ack_piggybacked()
 
     def _can_send(self) -> bool:
         """Check if we can send more packets.
@@ -1043,7 +1179,7 @@ class UTPConnection:
             seq for seq in self.send_buffer if self._is_sequence_acked(seq, acked_seq)
         ]
         for seq in acked_packets:
-            del self.send_buffer[seq]
+            self._forget_sent_packet(seq)
 
         logger.debug(
             "Received ACK: ack_nr=%s, acked %s packets",
@@ -1090,8 +1226,11 @@ class UTPConnection:
         if UTPExtensionType.SACK in self.negotiated_extensions:
             self.received_seqs.add(packet.seq_nr)
 
+        # Distance ahead of the next expected sequence number (mod 2^16)
+        distance = (packet.seq_nr - self.recv_buffer_expected_seq) & 0xFFFF
+
         # Check if packet is in-order
-        if packet.seq_nr == self.recv_buffer_expected_seq:
+        if distance == 0:
             # In-order packet - add to receive buffer
             self.recv_data_buffer.extend(packet.data)
             self.recv_buffer_expected_seq = (
@@ -1100,6 +1239,13 @@ class UTPConnection:
 
             # Process any buffered out-of-order packets
             self._process_out_of_order_packets()
+        elif distance >= 0x8000:
+            # Duplicate of data already delivered (retransmission) - only ACK it
+            logger.debug(
+                "Dropped duplicate data packet: seq=%s, expected=%s",
+                packet.seq_nr,
+                self.recv_buffer_expected_seq,
+            )
         else:
             # Out-of-order packet - buffer it
             self.recv_buffer[packet.seq_nr] = packet
@@ -1175,11 +1321,18 @@ class UTPConnection:
         )
 
         if immediate:
+            if self.socket_manager is not None:
+                # Coalesce with other immediate ACKs from the same datagram
+                # burst; the manager flushes once the burst is processed
+                self._queue_ack(ack_packet, arm_timer=False)
+                self.socket_manager.schedule_ack_flush(self)
+                return
             # Send immediately
             self._send_packet(ack_packet)
             # Clear pending ACKs since we're sending now
             self.pending_acks.clear()
             self.ack_packet_count = 0
+            self._cancel_ack_timer()
             # Immediate ACK path: tested but coverage may not track this specific return
             return
         # Queue for delayed sending
@@ -1204,20 +1357,49 @@ class UTPConnection:
         # Hard to test: requires exact sequence of 2 packets to trigger immediate ACK
         return self.ack_packet_count >= 2  # pragma: no cover
 
-    def _queue_ack(self, ack_packet: UTPPacket) -> None:
+    def _queue_ack(self, ack_packet: UTPPacket, arm_timer: bool = True) -> None:
         """Queue ACK packet for delayed sending.
 
         Args:
             ack_packet: ACK packet to queue
+            arm_timer: Schedule the delayed ACK timer if not already pending
 
         """
         # Store the most recent ACK packet (we only need to send the latest one)
         # Clear old pending ACKs since we only need the latest state
         self.pending_acks.clear()
         self.pending_acks.append(ack_packet)
+        if arm_timer and self.ack_timer is None:
+            self.ack_timer = self.timer_wheel.schedule(
+                self.ack_delay, self._on_ack_timer
+            )
+
+    def _cancel_ack_timer(self) -> None:
+        """Cancel the pending delayed ACK timer, if any."""
+        if self.ack_timer is not None:
+            self.ack_timer.cancel()
+            self.ack_timer = None
+
+    def _on_ack_timer(self) -> None:
+        """Send the delayed ACK when its timer expires."""
+        self.ack_timer = None
+        if self.state == UTPConnectionState.CONNECTED:
+            self._send_batched_acks()
+
+    def _ack_piggybacked(self) -> None:
+        """Drop a pending plain ACK once a data packet has carried ack_nr.
+
+        ACKs carrying SACK or ECN extensions are kept, since data packets
+        are sent without them.
+        """
+        if self.pending_acks and not self.pending_acks[-1].extensions:
+            self.pending_acks.clear()
+            self.ack_packet_count = 0
+            self._cancel_ack_timer()
 
     def _send_batched_acks(self) -> None:
         """Send all queued ACK packets."""
+        self._cancel_ack_timer()
         if not self.pending_acks:
             return
 
@@ -1228,42 +1410,51 @@ class UTPConnection:
             self.pending_acks.clear()
             self.ack_packet_count = 0
 
+    async def _wait_for_data(self, needed: int) -> None:
+        """Wait until ``needed`` bytes are buffered or the stream has ended."""
+        while len(self.recv_data_buffer) < needed and not self._recv_eof:
+            self.recv_data_available.clear()
+            await self.recv_data_available.wait()
+
     async def receive(self, max_bytes: int = -1) -> bytes:
         """Receive data from uTP connection.
 
         Args:
-            max_bytes: Maximum bytes to receive (-1 for all available)
+            max_bytes: Bytes to receive (-1 for all available). Waits until
+                that many bytes are buffered; fewer are returned only when
+                the connection has been closed.
 
         Returns:
-            Received data bytes
+            Received data bytes (empty once the connection is at EOF)
 
         """
-        if max_bytes < 0:
-            # Return all available data
-            if len(self.recv_data_buffer) == 0:
-                # Wait for data
-                await self.recv_data_available.wait()  # pragma: no cover
-                # Hard to test reliably: requires receive(-1) when buffer is empty
-                # and async event coordination. Tests cancel before this wait completes.
-                self.recv_data_available.clear()  # pragma: no cover
-
-            data = bytes(self.recv_data_buffer)
-            self.recv_data_buffer.clear()
-            return data
-        # Wait until we have enough data
-        while len(self.recv_data_buffer) < max_bytes:
-            await self.recv_data_available.wait()  # pragma: no cover
-            # Hard to test reliably: requires receive(N) when buffer has < N bytes
-            # and async event coordination. Tests cancel before this wait completes.
-            self.recv_data_available.clear()  # pragma: no cover
-
-        # Extract requested amount
-        data = bytes(self.recv_data_buffer[:max_bytes])
-        self.recv_data_buffer = self.recv_data_buffer[max_bytes:]
+        await self._wait_for_data(1 if max_bytes < 0 else max_bytes)
+        data = self.recv_data_buffer.read(max_bytes)
         if len(self.recv_data_buffer) > 0:
             self.recv_data_available.set()  # More data available
         return data
 
+    async def readinto(self, buf: bytearray | memoryview) -> int:
+        """Receive available data directly into ``buf``.
+
+        Waits until at least one byte is buffered, then copies as much as
+        fits without creating intermediate ``bytes`` objects.
+
+        Args:
+            buf: Writable destination buffer
+
+        Returns:
+            Number of bytes written (0 once the connection is at EOF)
+
+        """
+        if len(buf) == 0:
+            return 0
+        await self._wait_for_data(1)
+        copied = self.recv_data_buffer.readinto(buf)
+        if len(self.recv_data_buffer) > 0:
+            self.recv_data_available.set()
+        return copied
+
     def _handle_fin_packet(self, _packet: UTPPacket) -> None:
         """Handle ST_FIN packet (connection close).
 
@@ -1273,6 +1464,7 @@ class UTPConnection:
         """
         if self.state == UTPConnectionState.CONNECTED:
             self.state = UTPConnectionState.FIN_RECEIVED
+            self._mark_recv_eof()
             # Send FIN-ACK
             fin_ack = UTPPacket(
                 type=UTPPacketType.ST_FIN,
@@ -1304,6 +1496,7 @@ class UTPConnection:
             # This is handled at a higher level (e.g., in peer connection manager)
 
         self.state = UTPConnectionState.RESET
+        self._mark_recv_eof()
         self.logger.warning(
             "Connection reset by peer: %s:%s",
             self.remote_addr[0],
@@ -1330,23 +1523,19 @@ class UTPConnection:
             self._send_packet(fin_packet)
             self.state = UTPConnectionState.FIN_SENT
 
-        # Stop ACK timer and send any pending ACKs
-        await self._stop_ack_timer()
-        if self.pending_acks:  # pragma: no cover
-            # Hard to test: requires pending ACKs at close time
-            self._send_batched_acks()  # pragma: no cover
+        # Send any pending ACKs and stop RTO / delayed ACK timers
+        if self.pending_acks:
+            self._send_batched_acks()
+        self._cancel_timers()
 
         # Cancel background tasks
-        if self._retransmission_task:
-            self._retransmission_task.cancel()
-            with contextlib.suppress(asyncio.CancelledError):
-                await self._retransmission_task
         if self._send_task:
             self._send_task.cancel()
             with contextlib.suppress(asyncio.CancelledError):
                 await self._send_task
 
         self.state = UTPConnectionState.CLOSED
+        self._mark_recv_eof()
 
         # Unregister from socket manager
         from ccbt.transport.utp_socket import UTPSocketManager
@@ -1368,28 +1557,8 @@ class UTPConnection:
             self.remote_addr[1],
         )
 
-    async def _retransmission_loop(self) -> None:
-        """Background task to check for retransmissions."""
-        while self.state == UTPConnectionState.CONNECTED:
-            await asyncio.sleep(0.1)  # Check every 100ms
-            try:
-                await self._check_retransmissions()
-            except Exception as e:  # pragma: no cover
-                # Log but continue loop
-                self.logger.warning("Error in retransmission loop: %s", e)
-
-    async def _check_retransmissions(self) -> None:
-        """Check for packets that need retransmission using RTO calculation."""
-        current_time = time.perf_counter()
-        max_retries = (
-            self.config.network.utp.max_retransmits
-            if hasattr(self.config, "network")
-            and hasattr(self.config.network, "utp")
-            and hasattr(self.config.network.utp, "max_retransmits")
-            else 5
-        )
-
-        # Calculate RTO (Retransmission Timeout) using RFC 6298 formula
+    def _current_rto(self) -> float:
+        """Return the retransmission timeout (RFC 6298), bounded to [0.1, 60] s."""
         # RTO = SRTT + 4 * RTTVAR
         if self.srtt > 0 and self.rttvar > 0:
             rto = self.srtt + 4.0 * self.rttvar
@@ -1398,47 +1567,92 @@ class UTPConnection:
             rto = self.rtt + 4.0 * self.rtt_variance if self.rtt > 0 else 0.1
 
         # RTO bounds: min 100ms, max 60s
-        rto = max(0.1, min(rto, 60.0))
-
-        retransmit_list = []
-        for seq, (_packet, send_time, retry_count) in list(self.send_buffer.items()):
-            # Calculate timeout with exponential backoff
-            packet_timeout = rto * (2**retry_count)  # Exponential backoff
-
-            if current_time - send_time > packet_timeout:
-                if retry_count >= max_retries:
-                    # Too many retries - connection failed
-                    self.logger.error(
-                        "Packet %s exceeded max retries, connection failed",
-                        seq,
-                    )
-                    self.state = UTPConnectionState.CLOSED
-                    return
+        return max(0.1, min(rto, 60.0))
 
-                retransmit_list.append(seq)
-                # Mark as retransmitted for Karn's algorithm
-                self.retransmitted_packets.add(seq)
+    def _arm_retransmit_timer(self, seq: int) -> None:
+        """Schedule the RTO timer for ``seq`` from its send time and retry count."""
+        packet_info = self.send_buffer.get(seq)
+        if packet_info is None:
+            return
+        _packet, send_time, retry_count = packet_info
+        # Exponential backoff
+        deadline = send_time + self._current_rto() * (2**retry_count)
+
+        old_timer = self._rto_timers.pop(seq, None)
+        if old_timer is not None:
+            old_timer.cancel()
+        self._rto_timers[seq] = self.timer_wheel.schedule(
+            deadline - time.perf_counter(), self._on_retransmit_timeout, seq
+        )
 
-        # Retransmit packets
-        for seq in retransmit_list:
-            packet_info = self.send_buffer[seq]
-            packet = packet_info[0]
-            retry_count = packet_info[2]
+    def _forget_sent_packet(self, seq: int) -> None:
+        """Remove an acknowledged packet and cancel its RTO timer."""
+        self.send_buffer.pop(seq, None)
+        timer = self._rto_timers.pop(seq, None)
+        if timer is not None:
+            timer.cancel()
 
-            # Update timestamp for retransmission
-            packet.timestamp = self._get_timestamp_microseconds()
-            self._send_packet(packet)
+    def _on_retransmit_timeout(self, seq: int) -> None:
+        """Handle an RTO timer expiry for a single packet.
 
-            # Update retry count
-            self.send_buffer[seq] = (packet, current_time, retry_count + 1)
-            self.packets_retransmitted += 1
+        Only the expired packet is examined. If it was retransmitted by fast
+        or selective retransmit since the timer was armed, the timer is
+        re-armed for the remaining time instead.
 
-            self.logger.debug(
-                "Retransmitted packet seq=%s (retry=%s, RTO=%.3f)",
+        Args:
+            seq: Sequence number whose timer expired
+
+        """
+        self._rto_timers.pop(seq, None)
+        if self.state != UTPConnectionState.CONNECTED:
+            return
+        packet_info = self.send_buffer.get(seq)
+        if packet_info is None:
+            return  # ACK'd in the meantime
+
+        packet, send_time, retry_count = packet_info
+        current_time = time.perf_counter()
+        rto = self._current_rto()
+        if current_time - send_time < rto * (2**retry_count):
+            self._arm_retransmit_timer(seq)
+            return
+
+        max_retries = (
+            self.config.network.utp.max_retransmits
+            if hasattr(self.config, "network")
+            and hasattr(self.config.network, "utp")
+            and hasattr(self.config.network.utp, "max_retransmits")
+            else 5
+        )
+        if retry_count >= max_retries:
+            # Too many retries - connection failed
+            self.logger.error(
+                "Packet %s exceeded max retries, connection failed",
                 seq,
-                retry_count,
-                rto,
             )
+            self.state = UTPConnectionState.CLOSED
+            self._cancel_timers()
+            self._mark_recv_eof()
+            return
+
+        # Mark as retransmitted for Karn's algorithm
+        self.retransmitted_packets.add(seq)
+
+        # Update timestamp for retransmission
+        packet.timestamp = self._get_timestamp_microseconds()
+        self._send_packet(packet)
+
+        # Update retry count and back off
+        self.send_buffer[seq] = (packet, current_time, retry_count + 1)
+        self.packets_retransmitted += 1
+        self._arm_retransmit_timer(seq)
+
+        self.logger.debug(
+            "Retransmitted packet seq=%s (retry=%s, RTO=%.3f)",
+            seq,
+            retry_count,
+            rto,
+        )
 
     # Congestion Control Methods (BEP 29 LEDBAT)
     def _calculate_target_window(self) -> int:
@@ -1769,7 +1983,7 @@ class UTPConnection:
             for seq in range(block.start_seq, block.end_seq):
                 if seq in self.send_buffer:
                     # Packet was SACK'd - remove from send buffer
-                    del self.send_buffer[seq]
+                    self._forget_sent_packet(seq)
                     self.logger.debug("SACK'd packet seq=%s", seq)
 
         # Identify gaps for selective retransmission
@@ -1797,6 +2011,7 @@ class UTPConnection:
                 # Update retry count
                 self.send_buffer[seq] = (packet, time.perf_counter(), retry_count + 1)
                 self.packets_retransmitted += 1
+                self._arm_retransmit_timer(seq)
 
                 self.logger.debug("Selectively retransmitted packet seq=%s", seq)
 
@@ -1820,6 +2035,7 @@ class UTPConnection:
         # Update retry count
         self.send_buffer[oldest_seq] = (packet, time.perf_counter(), retry_count + 1)
         self.packets_retransmitted += 1
+        self._arm_retransmit_timer(oldest_seq)
 
         # Reset duplicate ACK counter
         self.duplicate_acks = 0
@@ -13,6 +13,7 @@ import struct
 from typing import TYPE_CHECKING, Callable
 
 from ccbt.config.config import get_config
+from ccbt.transport.utp_timer import UTPTimerWheel
 
 if TYPE_CHECKING:  # pragma: no cover
     from ccbt.transport.utp import UTPConnection
@@ -98,6 +99,14 @@ class UTPSocketManager:
         # Active connection IDs for collision detection
         self.active_connection_ids: set[int] = set()
 
+        # Shared timer wheel for per-packet RTO and delayed ACK timers
+        self.timer_wheel = UTPTimerWheel()
+
+        # Connections with ACKs to send once the current datagram burst is
+        # processed (insertion-ordered, deduplicated)
+        self._ack_flush_pending: dict[UTPConnection, None] = {}
+        self._ack_flush_scheduled = False
+
         # Callback for incoming connections
         self.on_incoming_connection: (
             Callable[[UTPConnection, tuple[str, int]], None] | None
@@ -227,6 +236,10 @@ class UTPSocketManager:
         self.connections.clear()
         self.pending_connections.clear()
         self.active_connection_ids.clear()
+        self._ack_flush_pending.clear()
+
+        # Stop timers
+        await self.timer_wheel.stop()
 
         # Close transport
         if self.transport:
@@ -423,6 +436,39 @@ class UTPSocketManager:
             # or IndexError during parsing. Normal packet creation validates fields,
             # so this only happens with corrupted/untrusted network data.
 
+    def schedule_ack_flush(self, connection: UTPConnection) -> None:
+        """Send ``connection``'s pending ACK after the current datagram burst.
+
+        Datagrams that arrive together are delivered to the protocol in the
+        same event loop iteration, so deferring the flush with ``call_soon``
+        collapses the ACKs a burst would trigger into one per connection.
+
+        Args:
+            connection: Connection with a queued ACK
+
+        """
+        self._ack_flush_pending[connection] = None
+        if self._ack_flush_scheduled:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:  # pragma: no cover - always called from the loop
+            self._flush_acks()
+            return
+        self._ack_flush_scheduled = True
+        loop.call_soon(self._flush_acks)
+
+    def _flush_acks(self) -> None:
+        """Send the pending ACK of every connection queued during the burst."""
+        self._ack_flush_scheduled = False
+        pending = self._ack_flush_pending
+        self._ack_flush_pending = {}
+        for connection in pending:
+            try:
+                connection._send_batched_acks()  # noqa: SLF001
+            except Exception as e:  # pragma: no cover - defensive
+                self.logger.debug("Error flushing uTP ACKs: %s", e)
+
     def send_packet(self, packet_data: bytes, addr: tuple[str, int]) -> None:
         """Send UDP packet.
 
@@ -534,6 +580,7 @@ class UTPSocketManager:
                 msg = "uTP socket not initialized when handling incoming SYN"
                 raise RuntimeError(msg)
             conn.set_transport(self.transport)
+            conn.socket_manager = self
 
             # Register connection (this will add connection_id to active_connection_ids)
             self.register_connection(conn, addr, local_conn_id)
@@ -0,0 +1,223 @@
+"""Hashed timer wheel for uTP connection timers.
+
+A single wheel, owned by :class:`~ccbt.transport.utp_socket.UTPSocketManager`,
+schedules per-packet retransmission timeouts and delayed ACKs for every uTP
+connection. Timers are bucketed by expiry tick, so each tick only touches the
+timers in one slot, and the driver task sleeps on an event while no timers are
+pending, so quiet connections cost nothing.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import time
+from typing import Any, Callable
+
+logger = logging.getLogger(__name__)
+
+# Wheel resolution in seconds (uTP RTO floor is 100ms, ACK delay >= 10ms)
+DEFAULT_TICK_INTERVAL = 0.01
+
+# Number of slots; one revolution covers DEFAULT_TICK_INTERVAL * slots seconds
+DEFAULT_WHEEL_SLOTS = 512
+
+
+class UTPTimer:
+    """Handle for a timer scheduled on a :class:`UTPTimerWheel`."""
+
+    __slots__ = ("_wheel", "args", "callback", "cancelled", "deadline_tick")
+
+    def __init__(
+        self,
+        wheel: UTPTimerWheel,
+        deadline_tick: int,
+        callback: Callable[..., Any],
+        args: tuple[Any, ...],
+    ):
+        """Initialize timer handle.
+
+        Args:
+            wheel: Wheel the timer is scheduled on
+            deadline_tick: Absolute tick at which the timer fires
+            callback: Function called on expiry
+            args: Positional arguments for ``callback``
+
+        """
+        self._wheel = wheel
+        self.deadline_tick = deadline_tick
+        self.callback = callback
+        self.args = args
+        self.cancelled = False
+
+    def cancel(self) -> None:
+        """Cancel the timer. Cancelling a fired or cancelled timer is a no-op."""
+        if not self.cancelled:
+            self.cancelled = True
+            self._wheel._timer_cancelled()  # noqa: SLF001
+
+
+class UTPTimerWheel:
+    """Hashed timer wheel driven by a single asyncio task.
+
+    Callbacks run synchronously on the event loop when their tick is reached
+    and must not block. Cancelled timers are dropped lazily when their slot
+    is next visited.
+    """
+
+    def __init__(
+        self,
+        tick_interval: float = DEFAULT_TICK_INTERVAL,
+        slots: int = DEFAULT_WHEEL_SLOTS,
+    ):
+        """Initialize timer wheel.
+
+        Args:
+            tick_interval: Seconds per tick
+            slots: Number of wheel slots
+
+        """
+        self.tick_interval = tick_interval
+        self._slots: list[list[UTPTimer]] = [[] for _ in range(slots)]
+        self._start_time = time.perf_counter()
+        self._current_tick = 0  # Last tick whose slot has been processed
+        self._active = 0  # Scheduled, not yet fired or cancelled
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task | None = None
+
+        # Statistics
+        self.timers_fired = 0
+
+    def __len__(self) -> int:
+        """Return number of pending timers."""
+        return self._active
+
+    def _tick_for(self, now: float) -> int:
+        """Convert a ``perf_counter`` timestamp to a tick number."""
+        return int((now - self._start_time) / self.tick_interval)
+
+    def _timer_cancelled(self) -> None:
+        """Account for a cancelled timer."""
+        self._active -= 1
+
+    def schedule(
+        self, delay: float, callback: Callable[..., Any], *args: Any
+    ) -> UTPTimer:
+        """Schedule ``callback(*args)`` to run after ``delay`` seconds.
+
+        The callback fires on the first tick at or after the deadline, so
+        actual delay is rounded up to the wheel resolution.
+
+        Args:
+            delay: Delay in seconds
+            callback: Function to call on expiry
+            *args: Positional arguments for ``callback``
+
+        Returns:
+            Timer handle that can be cancelled
+
+        """
+        now_tick = self._tick_for(time.perf_counter())
+        ticks = max(1, -int(-max(delay, 0.0) // self.tick_interval))
+        # Never schedule into a slot that has already been processed
+        deadline_tick = max(now_tick, self._current_tick) + ticks
+        timer = UTPTimer(self, deadline_tick, callback, args)
+        self._slots[deadline_tick % len(self._slots)].append(timer)
+        self._active += 1
+        self._ensure_running()
+        self._wakeup.set()
+        return timer
+
+    def advance(self, now: float | None = None) -> int:
+        """Fire every timer whose tick has been reached.
+
+        Args:
+            now: Current ``perf_counter`` time (defaults to now)
+
+        Returns:
+            Number of timers fired
+
+        """
+        target_tick = self._tick_for(time.perf_counter() if now is None else now)
+        if target_tick <= self._current_tick:
+            return 0
+
+        slot_count = len(self._slots)
+        first_tick = self._current_tick + 1
+        # After a long stall each slot only needs one visit
+        last_tick = min(target_tick, self._current_tick + slot_count)
+        self._current_tick = target_tick
+
+        fired = 0
+        for tick in range(first_tick, last_tick + 1):
+            slot = self._slots[tick % slot_count]
+            if not slot:
+                continue
+            expired: list[UTPTimer] = []
+            remaining: list[UTPTimer] = []
+            for timer in slot:
+                if timer.cancelled:
+                    continue
+                if timer.deadline_tick <= target_tick:
+                    expired.append(timer)
+                else:
+                    remaining.append(timer)
+            self._slots[tick % slot_count] = remaining
+
+            for timer in expired:
+                if timer.cancelled:  # Cancelled by an earlier callback
+                    continue
+                timer.cancelled = True
+                self._active -= 1
+                fired += 1
+                try:
+                    timer.callback(*timer.args)
+                except Exception:
+                    logger.exception("Error in uTP timer callback")
+
+        self.timers_fired += fired
+        return fired
+
+    def _ensure_running(self) -> None:
+        """Start the driver task if it is not running."""
+        if self._task is not None and not self._task.done():
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # No running loop: timers fire once a loop calls advance()/start()
+            return
+        self._task = loop.create_task(self._run())
+
+    def start(self) -> None:
+        """Start the driver task (also started lazily by :meth:`schedule`)."""
+        self._ensure_running()
+
+    async def stop(self) -> None:
+        """Stop the driver task and drop all pending timers."""
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        for slot in self._slots:
+            for timer in slot:
+                timer.cancelled = True
+            slot.clear()
+        self._active = 0
+
+    async def _run(self) -> None:
+        """Drive the wheel: tick while timers are pending, sleep otherwise."""
+        while True:
+            if self._active == 0:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                # Resynchronise after idling so the skipped ticks are not walked
+                self._current_tick = max(
+                    self._current_tick,
+                    self._tick_for(time.perf_counter()) - 1,
+                )
+                continue
+            await asyncio.sleep(self.tick_interval)
+            self.advance()
@@ -10,16 +10,18 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
+import itertools
 import json
 import time
 import uuid
 from abc import ABC, abstractmethod
+from collections import deque
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any
 
 from ccbt.utils.exceptions import CCBTError
-from ccbt.utils.logging_config import LoggingContext, get_logger
+from ccbt.utils.logging_config import get_logger
 
 
 class EventPriority(Enum):
@@ -379,34 +381,203 @@ class EventHandler(ABC):
         return True
 
 
+class EventQueue:
+    """Bounded event queue with one FIFO per priority.
+
+    Events are taken highest priority first. When the queue is full, an
+    event evicts the oldest event of the lowest lower priority, or is
+    dropped if there is none. Events put with a coalescing key replace the
+    pending event with the same key instead of queueing again, keeping its
+    place in the queue.
+
+    The queue is not bound to an event loop; only waiting for events is.
+    It must be used from one thread.
+    """
+
+    def __init__(self, maxsize: int = 10000):
+        """Initialize event queue.
+
+        Args:
+            maxsize: Maximum number of queued events
+
+        """
+        self.maxsize = maxsize
+        # Highest priority first
+        self._queues: dict[EventPriority, deque[Any]] = {
+            priority: deque()
+            for priority in sorted(EventPriority, key=lambda p: p.value, reverse=True)
+        }
+        self._coalesced: dict[tuple[Any, ...], Event] = {}
+        self._size = 0
+        self._waiters: deque[asyncio.Future[None]] = deque()
+
+    def qsize(self) -> int:
+        """Return the number of queued events."""
+        return self._size
+
+    def empty(self) -> bool:
+        """Check if no events are queued."""
+        return self._size == 0
+
+    def full(self) -> bool:
+        """Check if the queue is full."""
+        return self._size >= self.maxsize
+
+    def put_nowait(
+        self, event: Event, coalesce_key: tuple[Any, ...] | None = None
+    ) -> str:
+        """Queue an event without waiting.
+
+        Args:
+            event: Event to queue
+            coalesce_key: Key of the series the event replaces, if any
+
+        Returns:
+            "queued", "evicted" (queued in place of a lower priority event),
+            "coalesced" or "dropped"
+
+        """
+        if coalesce_key is not None and coalesce_key in self._coalesced:
+            self._coalesced[coalesce_key] = event
+            return "coalesced"
+        result = "queued"
+        if self._size >= self.maxsize:
+            if not self._evict(event.priority):
+                return "dropped"
+            result = "evicted"
+        if coalesce_key is not None:
+            self._coalesced[coalesce_key] = event
+            self._queues[event.priority].append(coalesce_key)
+        else:
+            self._queues[event.priority].append(event)
+        self._size += 1
+        self._wake()
+        return result
+
+    def get_nowait(self) -> Event:
+        """Take the next event.
+
+        Raises:
+            asyncio.QueueEmpty: If no event is queued
+
+        """
+        for queue in self._queues.values():
+            if queue:
+                self._size -= 1
+                item = queue.popleft()
+                if isinstance(item, tuple):
+                    return self._coalesced.pop(item)
+                return item
+        raise asyncio.QueueEmpty
+
+    async def get(self) -> Event:
+        """Wait for and take the next event."""
+        while not self._size:
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            try:
+                await waiter
+            except BaseException:
+                with contextlib.suppress(ValueError):
+                    self._waiters.remove(waiter)
+                # Pass the wakeup on if cancelled after being woken
+                if waiter.done() and not waiter.cancelled() and self._size:
+                    self._wake()
+                raise
+        return self.get_nowait()
+
+    def clear_waiters(self) -> None:
+        """Forget waiters, such as those of a previous event loop."""
+        self._waiters.clear()
+
+    def _wake(self) -> None:
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                with contextlib.suppress(RuntimeError):  # Loop closed
+                    waiter.set_result(None)
+                    return
+
+    def _evict(self, priority: EventPriority) -> bool:
+        for queued_priority in reversed(self._queues):
+            if queued_priority.value >= priority.value:
+                return False
+            queue = self._queues[queued_priority]
+            if queue:
+                item = queue.popleft()
+                if isinstance(item, tuple):
+                    self._coalesced.pop(item, None)
+                self._size -= 1
+                return True
+        return False
+
+
+# Event types whose queued events describe current state, so only the latest
+# event per key is worth handling. Keys are the data fields naming the series.
+DEFAULT_COALESCED_EVENTS: dict[str, tuple[str, ...]] = {
+    EventType.GLOBAL_METRICS_UPDATE.value: (),
+    EventType.PERFORMANCE_METRIC.value: ("metric_name",),
+    EventType.BANDWIDTH_UPDATE.value: ("info_hash",),
+    EventType.DISK_IO_UPDATE.value: (),
+    EventType.PIECE_REQUESTED.value: ("info_hash", "piece_index"),
+}
+
+
 class EventBus:
-    """Event bus for managing events and handlers."""
+    """Event bus for managing events and handlers.
 
-    def __init__(self, max_queue_size: int = 10000):
+    Events are queued by priority and dispatched by a pool of workers, so
+    a slow handler holds up one worker instead of every event. Handlers of
+    an event run one after another in the worker that took it. Events of
+    the same type may be handled concurrently by different workers.
+    """
+
+    def __init__(
+        self,
+        max_queue_size: int = 10000,
+        workers: int = 4,
+        coalesce: dict[str, tuple[str, ...]] | None = None,
+    ):
         """Initialize event bus.
 
         Args:
             max_queue_size: Maximum size of event queue
+            workers: Number of dispatch workers
+            coalesce: Event types to coalesce, with the data fields that key
+                them (defaults to :data:`DEFAULT_COALESCED_EVENTS`)
 
         """
         self.max_queue_size = max_queue_size
+        self.workers = max(1, workers)
         self.handlers: dict[str, list[EventHandler]] = {}
-        self.event_queue: asyncio.Queue = asyncio.Queue(maxsize=max_queue_size)
-        self.replay_buffer: list[Event] = []
-        self.max_replay_events = 1000
+        self.coalesce = dict(DEFAULT_COALESCED_EVENTS if coalesce is None else coalesce)
+        self.event_queue = EventQueue(maxsize=max_queue_size)
+        self.replay_buffer: deque[Event] = deque(maxlen=1000)
         self.running = False
         self.logger = get_logger(__name__)
         self._loop: asyncio.AbstractEventLoop | None = None
-        self._task: asyncio.Task | None = None
+        self._workers: list[asyncio.Task] = []
+        # Handlers per event type, including wildcard handlers
+        self._dispatch: dict[str, tuple[EventHandler, ...]] = {}
 
         # Statistics
         self.stats = {
             "events_processed": 0,
             "events_dropped": 0,
+            "events_coalesced": 0,
             "handlers_registered": 0,
             "queue_size": 0,
         }
 
+    @property
+    def max_replay_events(self) -> int:
+        """Maximum number of events kept for replay."""
+        return self.replay_buffer.maxlen or 0
+
+    @max_replay_events.setter
+    def max_replay_events(self, value: int) -> None:
+        self.replay_buffer = deque(self.replay_buffer, maxlen=value)
+
     def register_handler(self, event_type: str, handler: EventHandler) -> None:
         """Register an event handler.
 
@@ -419,6 +590,7 @@ class EventBus:
             self.handlers[event_type] = []
 
         self.handlers[event_type].append(handler)
+        self._dispatch.clear()
         self.stats["handlers_registered"] += 1
         self.logger.debug(
             "Registered handler '%s' for event type '%s'",
@@ -437,6 +609,7 @@ class EventBus:
         if event_type in self.handlers:
             try:
                 self.handlers[event_type].remove(handler)
+                self._dispatch.clear()
                 self.logger.debug(
                     "Unregistered handler '%s' for event type '%s'",
                     handler.name,
@@ -447,60 +620,57 @@ class EventBus:
                 # This should not occur in normal operation but protects against race conditions
                 pass
 
+    def emit_nowait(self, event: Event) -> bool:
+        """Queue an event without waiting.
+
+        Safe to call from synchronous code on the event loop thread.
+
+        Args:
+            event: Event to emit
+
+        Returns:
+            False if the event was dropped because the queue is full
+
+        """
+        self.replay_buffer.append(event)
+
+        coalesce_key = None
+        fields = self.coalesce.get(event.event_type)
+        if fields is not None:
+            data = event.data
+            coalesce_key = (event.event_type, *(data.get(f) for f in fields))
+
+        result = self.event_queue.put_nowait(event, coalesce_key)
+        self.stats["queue_size"] = self.event_queue.qsize()
+        if result == "queued":
+            return True
+        if result == "coalesced":
+            self.stats["events_coalesced"] += 1
+            return True
+        self.stats["events_dropped"] += 1
+        if result == "evicted":
+            self.logger.debug(
+                "Event queue full, dropped a lower priority event for %s",
+                event.event_type,
+            )
+            return True
+        self.logger.warning(
+            "Event queue full, dropping event: %s",
+            event.event_type,
+        )
+        return False
+
     async def emit(self, event: Event) -> None:
         """Emit an event.
 
+        Never waits for room in the queue; see :meth:`emit_nowait`.
+
         Args:
             event: Event to emit
 
         """
         try:
-            # Add to replay buffer
-            self.replay_buffer.append(event)
-            if len(self.replay_buffer) > self.max_replay_events:
-                self.replay_buffer.pop(0)
-
-            # Add to queue
-            if self.event_queue.full():
-                self.stats["events_dropped"] += 1
-                self.logger.warning(
-                    "Event queue full, dropping event: %s",
-                    event.event_type,
-                )
-                return
-
-            # If we somehow switched loops between start/emit, rebind queue lazily
-            if self._loop is None:
-                try:
-                    self._loop = asyncio.get_running_loop()
-                except RuntimeError:  # pragma: no cover
-                    # Edge case: No running loop, get event loop instead
-                    # Rare in production as event bus should be started in async context
-                    self._loop = asyncio.get_event_loop()
-            try:
-                current_loop = asyncio.get_running_loop()
-            except RuntimeError:  # pragma: no cover
-                # Edge case: No running loop detected
-                # Fallback to event loop for compatibility
-                current_loop = asyncio.get_event_loop()
-            if self._loop is not current_loop:  # pragma: no cover
-                # Cross-loop queue migration - extremely difficult to test with real loop switching
-                # Requires actual event loop context switching which is complex and brittle in tests
-                # Recreate queue on current loop to avoid cross-loop errors
-                old_q = self.event_queue
-                self.event_queue = asyncio.Queue(maxsize=self.max_queue_size)
-                self._loop = current_loop
-                # Drain old queue non-blocking into new one to preserve events
-                try:
-                    while True:
-                        item = old_q.get_nowait()
-                        await self.event_queue.put(item)
-                except asyncio.QueueEmpty:
-                    pass
-
-            await self.event_queue.put(event)
-            self.stats["queue_size"] = self.event_queue.qsize()
-
+            self.emit_nowait(event)
         except Exception:
             self.logger.exception("Failed to emit event")
 
@@ -509,31 +679,26 @@ class EventBus:
         if self.running:
             return
 
-        # Rebind to the current running loop and recreate the queue if needed
-        try:
-            current_loop = asyncio.get_running_loop()
-        except RuntimeError:  # pragma: no cover
-            # Edge case: No running loop detected at start
-            # Fallback to event loop for compatibility
-            current_loop = asyncio.get_event_loop()
-
+        current_loop = asyncio.get_running_loop()
         if self._loop is not current_loop:
-            # Cancel any previous processing task bound to another loop
-            if self._task is not None and not self._task.done():
-                with contextlib.suppress(Exception):  # pragma: no cover
-                    # Defensive: Suppress exceptions during task cancellation
-                    # Task may already be cancelled or done, which is fine
-                    self._task.cancel()
-            self._task = None
-            # Recreate queue bound to this loop
-            self.event_queue = asyncio.Queue(maxsize=self.max_queue_size)
+            # Drop workers and waiters bound to a previous loop; queued
+            # events are kept since the queue itself is not bound to a loop
+            for task in self._workers:
+                if not task.done():
+                    with contextlib.suppress(Exception):  # pragma: no cover
+                        # Defensive: the old loop may already be closed
+                        task.cancel()
+            self._workers = []
+            self.event_queue.clear_waiters()
             self._loop = current_loop
 
         self.running = True
-        self.logger.info("Event bus started")
+        self.logger.info("Event bus started (%d workers)", self.workers)
 
-        # Start event processing task on this loop
-        self._task = asyncio.create_task(self._process_events())
+        # Start dispatch workers on this loop
+        self._workers = [
+            asyncio.create_task(self._process_events()) for _ in range(self.workers)
+        ]
 
     async def stop(self) -> None:
         """Stop the event bus."""
@@ -542,63 +707,49 @@ class EventBus:
 
         self.running = False
         self.logger.info("Event bus stopped")
-        # Cancel and await processing task to avoid stray logging on closed streams
-        if self._task is not None:
-            self._task.cancel()
+        # Cancel and await workers to avoid stray logging on closed streams
+        workers, self._workers = self._workers, []
+        for task in workers:
+            task.cancel()
+        if workers:
             # Ensure cancellation is processed; ignore cancellation-related errors
             with contextlib.suppress(Exception):
-                await asyncio.gather(self._task, return_exceptions=True)
-            self._task = None
+                await asyncio.gather(*workers, return_exceptions=True)
 
     async def _process_events(self) -> None:
-        """Process events from the queue."""
+        """Take events from the queue and dispatch them (one worker)."""
         while self.running:
             try:
-                event = await asyncio.wait_for(self.event_queue.get(), timeout=1.0)
+                event = await self.event_queue.get()
                 await self._handle_event(event)
                 self.stats["events_processed"] += 1
                 self.stats["queue_size"] = self.event_queue.qsize()
 
-            except asyncio.TimeoutError:
-                continue
             except asyncio.CancelledError:
                 break
             except Exception:
                 self.logger.exception("Error processing event")
 
+    def _handlers_for(self, event_type: str) -> tuple[EventHandler, ...]:
+        """Return the handlers of an event type, including wildcard handlers."""
+        handlers = self._dispatch.get(event_type)
+        if handlers is None:
+            handlers = self._dispatch[event_type] = (
+                *self.handlers.get(event_type, ()),
+                *self.handlers.get("*", ()),
+            )
+        return handlers
+
     async def _handle_event(self, event: Event) -> None:
         """Handle a single event."""
         try:
-            with LoggingContext(
-                "event_handle",
-                event_type=event.event_type,
-                event_id=event.event_id,
-            ):
-                # Get handlers for this event type
-                handlers = self.handlers.get(event.event_type, [])
-
-                # Also get handlers for wildcard events
-                wildcard_handlers = self.handlers.get("*", [])
-                all_handlers = handlers + wildcard_handlers
-
-                if not all_handlers:
-                    self.logger.debug(
-                        "No handlers for event type: %s",
-                        event.event_type,
-                    )
-                    return
-
-                # Process handlers
-                tasks = []
-                for handler in all_handlers:
-                    if handler.can_handle(event):
-                        task = asyncio.create_task(
-                            self._handle_with_handler(event, handler),
-                        )
-                        tasks.append(task)
+            handlers = self._handlers_for(event.event_type)
+            if not handlers:
+                return
 
-                if tasks:
-                    await asyncio.gather(*tasks, return_exceptions=True)
+            for handler in handlers:
+                if handler.can_handle(event):
+                    await self._handle_with_handler(event, handler)
 
         except Exception:
             self.logger.exception("Error handling event")
@@ -629,7 +780,11 @@ class EventBus:
             List of events
 
         """
-        events = self.replay_buffer[-limit:] if limit > 0 else self.replay_buffer
+        if limit > 0:
+            events = list(itertools.islice(reversed(self.replay_buffer), limit))
+            events.reverse()
+        else:
+            events = list(self.replay_buffer)
 
         if event_type:
             events = [e for e in events if e.event_type == event_type]
@@ -640,9 +795,11 @@ class EventBus:
         """Get event bus statistics."""
         return {
             "running": self.running,
+            "workers": len(self._workers),
             "queue_size": self.stats["queue_size"],
             "events_processed": self.stats["events_processed"],
             "events_dropped": self.stats["events_dropped"],
+            "events_coalesced": self.stats["events_coalesced"],
             "handlers_registered": self.stats["handlers_registered"],
             "replay_buffer_size": len(self.replay_buffer),
         }
@@ -666,6 +823,11 @@ async def emit_event(event: Event) -> None:
     await bus.emit(event)
 
 
+def emit_event_nowait(event: Event) -> bool:
+    """Emit an event to the global event bus from synchronous code."""
+    return get_event_bus().emit_nowait(event)
+
+
 async def emit_peer_connected(
     peer_ip: str,
     peer_port: int,
@@ -1,9 +1,45 @@
-"""Task helpers for tracking and cancelling background tasks."""
+"""Task helpers for tracking and cancelling background tasks.
+
+:class:`PeriodicScheduler` runs periodic jobs (announces, status sampling,
+checkpoints, choking rounds) from one hierarchical timer wheel instead of a
+sleeping task per job, so the cost of an idle daemon does not grow with the
+number of torrents::
+
+    scheduler = get_scheduler()
+    job = scheduler.schedule(session.announce_once, 1800.0, name="announce")
+    ...
+    job.cancel()
+
+Only slots holding due jobs are visited. A job runs in its own task and is
+rescheduled when it finishes, so runs never overlap and periods missed while
+it ran (or while the event loop was blocked) coalesce into one run. Jitter
+spreads jobs registered together over their interval. Run times are recorded
+per job name in a histogram of the scheduler's metrics registry.
+"""
 
 from __future__ import annotations
 
 import asyncio
-from typing import Any, Coroutine
+import contextlib
+import logging
+import math
+import random
+import time
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Coroutine
+
+from ccbt.monitoring.metrics_registry import MetricsRegistry
+
+if TYPE_CHECKING:  # pragma: no cover - type checking only, not executed at runtime
+    from ccbt.monitoring.metrics_registry import Counter, Histogram
+
+logger = logging.getLogger(__name__)
+
+# Job callback; may return the delay until its next run instead of the interval
+JobCallback = Callable[[], Awaitable["float | None"]]
+
+WHEEL_BITS = 6
+WHEEL_SLOTS = 1 << WHEEL_BITS
+WHEEL_MASK = WHEEL_SLOTS - 1
 
 
 class BackgroundTaskGroup:
@@ -30,11 +66,433 @@ class BackgroundTaskGroup:
         if timeout is None:
             await asyncio.gather(*self._tasks, return_exceptions=True)
         else:
-            import contextlib
-
             with contextlib.suppress(asyncio.TimeoutError):
                 await asyncio.wait_for(
                     asyncio.gather(*self._tasks, return_exceptions=True),
                     timeout=timeout,
                 )
         self._tasks.clear()
+
+
+class PeriodicJob:
+    """Handle for a job registered with :class:`PeriodicScheduler`.
+
+    Attributes:
+        name: Job name, used as the metrics label (shared by jobs of one kind)
+        interval: Seconds between the end of one run and the next
+        jitter: Fraction of the interval by which each delay is randomized
+        runs: Number of completed runs
+
+    """
+
+    __slots__ = (
+        "_callback",
+        "_cancelled",
+        "_deadline",
+        "_scheduler",
+        "_slot",
+        "_task",
+        "interval",
+        "jitter",
+        "name",
+        "runs",
+    )
+
+    def __init__(
+        self,
+        scheduler: PeriodicScheduler,
+        callback: JobCallback,
+        interval: float,
+        name: str,
+        jitter: float,
+    ) -> None:
+        """Initialize job handle (use :meth:`PeriodicScheduler.schedule`)."""
+        self._scheduler = scheduler
+        self._callback = callback
+        self.interval = interval
+        self.name = name
+        self.jitter = jitter
+        self.runs = 0
+        self._cancelled = False
+        self._deadline = 0
+        # Wheel slot holding the job while it waits, None while it runs
+        self._slot: dict[PeriodicJob, None] | None = None
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def cancelled(self) -> bool:
+        """Whether the job has been cancelled."""
+        return self._cancelled
+
+    @property
+    def running(self) -> bool:
+        """Whether a run is in progress."""
+        return self._task is not None
+
+    def cancel(self) -> None:
+        """Stop scheduling the job and cancel a run in progress."""
+        if self._cancelled:
+            return
+        self._cancelled = True
+        self._scheduler._unschedule(self)  # noqa: SLF001
+        if self._task is not None:
+            self._task.cancel()
+
+    def __repr__(self) -> str:
+        """Return a debug representation."""
+        return f"<PeriodicJob {self.name} every {self.interval}s>"
+
+
+class PeriodicScheduler:
+    """Hierarchical timer wheel running periodic jobs on one event loop.
+
+    The wheel has ``levels`` rings of 64 slots. Ring 0 holds jobs due within
+    64 ticks, one slot per tick; each higher ring covers 64 times the span of
+    the one below and is cascaded into the lower rings as time reaches its
+    slots. One timer handle is armed for the next tick with work, so nothing
+    wakes while no job is due.
+    """
+
+    def __init__(
+        self,
+        tick: float = 0.1,
+        levels: int = 4,
+        registry: MetricsRegistry | None = None,
+    ):
+        """Initialize scheduler.
+
+        Args:
+            tick: Wheel resolution in seconds
+            levels: Number of rings; the wheel spans ``tick * 64**levels``
+                seconds, and later deadlines wait in the top ring
+            registry: Registry for the job metrics (a private one if None)
+
+        """
+        if tick <= 0 or levels < 1:
+            msg = "tick must be positive and levels at least 1"
+            raise ValueError(msg)
+        self.tick = tick
+        self.levels = levels
+        self.registry = registry if registry is not None else MetricsRegistry()
+        self.run_seconds: Histogram = self.registry.histogram(
+            "ccbt_scheduler_job_run_seconds",
+            "Run time of periodic jobs",
+            ["job"],
+        )
+        self.errors: Counter = self.registry.counter(
+            "ccbt_scheduler_job_errors_total",
+            "Periodic job runs that raised",
+            ["job"],
+        )
+        self.coalesced: Counter = self.registry.counter(
+            "ccbt_scheduler_job_coalesced_total",
+            "Periods skipped because a job was still running or late",
+            ["job"],
+        )
+
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._origin = 0.0
+        # Last tick processed
+        self._tick = 0
+        self._wheel: list[list[dict[PeriodicJob, None]]] = [
+            [{} for _ in range(WHEEL_SLOTS)] for _ in range(levels)
+        ]
+        self._span = WHEEL_SLOTS**levels
+        self._waiting = 0
+        self._jobs: set[PeriodicJob] = set()
+        self._timer: asyncio.TimerHandle | None = None
+        self._timer_tick = 0
+        self._closed = False
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop | None:
+        """Event loop the scheduler is bound to (set by the first job)."""
+        return self._loop
+
+    @property
+    def jobs(self) -> int:
+        """Number of scheduled jobs."""
+        return len(self._jobs)
+
+    def schedule(
+        self,
+        callback: JobCallback,
+        interval: float,
+        *,
+        name: str,
+        jitter: float = 0.1,
+        delay: float | None = None,
+    ) -> PeriodicJob:
+        """Run ``callback`` every ``interval`` seconds.
+
+        Must be called from the event loop the jobs should run on.
+
+        Args:
+            callback: Coroutine function run for each period; if it returns a
+                number, that is the delay before the next run
+            interval: Seconds from the end of one run to the start of the next
+            name: Job name, shared by jobs of the same kind (a metrics label)
+            jitter: Each delay is randomized by up to this fraction of it
+            delay: Seconds before the first run; a random point within the
+                first interval if None, so jobs added together spread out
+
+        Returns:
+            Handle to cancel the job
+
+        Raises:
+            ValueError: If interval or jitter is out of range
+            RuntimeError: If the scheduler is closed or used from another loop
+
+        """
+        if interval <= 0 or not 0 <= jitter < 1:
+            msg = "interval must be positive and jitter in [0, 1)"
+            raise ValueError(msg)
+        if self._closed:
+            msg = "Scheduler is closed"
+            raise RuntimeError(msg)
+        loop = asyncio.get_running_loop()
+        if self._loop is None:
+            self._loop = loop
+            self._origin = loop.time()
+        elif self._loop is not loop:
+            msg = "Scheduler is bound to another event loop"
+            raise RuntimeError(msg)
+
+        job = PeriodicJob(self, callback, interval, name, jitter)
+        self._jobs.add(job)
+        if delay is None:
+            delay = random.uniform(0, interval)  # nosec B311 - Spreading only
+        self._arm(self._insert_after(job, delay))
+        return job
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """Summarize jobs and run times per job name.
+
+        Returns:
+            Dict per job name with the number of ``jobs`` scheduled, the
+            number of ``runs``, total and average run seconds, ``errors``,
+            ``coalesced`` periods and cumulative histogram ``buckets``
+
+        """
+        scheduled: dict[str, int] = {}
+        for job in self._jobs:
+            scheduled[job.name] = scheduled.get(job.name, 0) + 1
+        errors = {values[0]: child.value for values, child in self.errors.series()}
+        coalesced = {
+            values[0]: child.value for values, child in self.coalesced.series()
+        }
+        result: dict[str, dict[str, Any]] = {}
+        for (name,), child in self.run_seconds.series():
+            runs = child.count
+            result[name] = {
+                "jobs": scheduled.get(name, 0),
+                "runs": runs,
+                "total_seconds": child.sum,
+                "average_seconds": child.sum / runs if runs else 0.0,
+                "errors": errors.get(name, 0),
+                "coalesced": coalesced.get(name, 0),
+                "buckets": child.buckets(),
+            }
+        for name, count in scheduled.items():
+            result.setdefault(
+                name,
+                {
+                    "jobs": count,
+                    "runs": 0,
+                    "total_seconds": 0.0,
+                    "average_seconds": 0.0,
+                    "errors": 0,
+                    "coalesced": 0,
+                    "buckets": [],
+                },
+            )
+        return result
+
+    async def close(self) -> None:
+        """Cancel all jobs and wait for runs in progress to finish."""
+        self._closed = True
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        tasks = [job._task for job in self._jobs if job._task is not None]  # noqa: SLF001
+        for job in list(self._jobs):
+            job.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    # Wheel
+
+    def _now_tick(self) -> int:
+        assert self._loop is not None  # noqa: S101 - Set before any job exists
+        return int((self._loop.time() - self._origin) / self.tick)
+
+    def _insert_after(self, job: PeriodicJob, delay: float) -> int:
+        if not self._waiting and self._timer is None:
+            # Nothing waiting: skip the idle ticks instead of walking them
+            self._tick = max(self._tick, self._now_tick())
+        elapsed = self._loop.time() - self._origin if self._loop else 0.0
+        deadline = math.ceil((elapsed + max(delay, 0.0)) / self.tick)
+        job._deadline = max(deadline, self._tick + 1)  # noqa: SLF001
+        return self._place(job)
+
+    def _place(self, job: PeriodicJob) -> int:
+        """Put a job in its slot and return the tick at which it is visited."""
+        deadline = job._deadline  # noqa: SLF001
+        delta = deadline - self._tick
+        if delta >= self._span:
+            # Beyond the wheel: park in the top ring, re-placed on cascade
+            deadline = self._tick + self._span - 1
+            delta = self._span - 1
+        level = 0
+        while delta >= WHEEL_SLOTS ** (level + 1):
+            level += 1
+        shift = WHEEL_BITS * level
+        slot = self._wheel[level][(deadline >> shift) & WHEEL_MASK]
+        slot[job] = None
+        job._slot = slot  # noqa: SLF001
+        self._waiting += 1
+        return (deadline >> shift) << shift
+
+    def _unschedule(self, job: PeriodicJob) -> None:
+        self._jobs.discard(job)
+        if job._slot is not None:  # noqa: SLF001
+            del job._slot[job]  # noqa: SLF001
+            job._slot = None  # noqa: SLF001
+            self._waiting -= 1
+
+    def _next_tick(self) -> int | None:
+        """Return the next tick with work: a due ring-0 slot or a cascade."""
+        if not self._waiting:
+            return None
+        best: int | None = None
+        ring = self._wheel[0]
+        for tick in range(self._tick + 1, self._tick + WHEEL_SLOTS + 1):
+            if ring[tick & WHEEL_MASK]:
+                best = tick
+                break
+        for level in range(1, self.levels):
+            shift = WHEEL_BITS * level
+            base = self._tick >> shift
+            ring = self._wheel[level]
+            for step in range(1, WHEEL_SLOTS + 1):
+                tick = (base + step) << shift
+                if best is not None and tick >= best:
+                    break
+                if ring[(base + step) & WHEEL_MASK]:
+                    best = tick
+                    break
+        return best
+
+    def _advance(self, now_tick: int) -> list[PeriodicJob]:
+        """Process ticks up to ``now_tick`` and return the jobs that are due."""
+        due: list[PeriodicJob] = []
+        while self._tick < now_tick:
+            tick = self._next_tick()
+            if tick is None or tick > now_tick:
+                self._tick = now_tick
+                break
+            self._tick = tick
+            for level in range(1, self.levels):
+                shift = WHEEL_BITS * level
+                if tick & ((1 << shift) - 1):
+                    break
+                self._cascade(self._wheel[level][(tick >> shift) & WHEEL_MASK], due)
+            # Ring 0 may also hold jobs parked beyond a one-ring wheel
+            self._cascade(self._wheel[0][tick & WHEEL_MASK], due)
+        return due
+
+    def _cascade(self, slot: dict[PeriodicJob, None], due: list[PeriodicJob]) -> None:
+        jobs = list(slot)
+        slot.clear()
+        self._waiting -= len(jobs)
+        for job in jobs:
+            job._slot = None  # noqa: SLF001
+            if job._deadline <= self._tick:  # noqa: SLF001
+                due.append(job)
+            else:
+                self._place(job)
+
+    def _arm(self, tick: int | None = None) -> None:
+        """Arm the timer for ``tick`` if earlier, or for the next tick with work."""
+        if self._closed or self._loop is None:
+            return
+        if tick is None:
+            tick = self._next_tick()
+        if tick is None:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            return
+        if self._timer is not None:
+            if self._timer_tick <= tick:
+                return
+            self._timer.cancel()
+        self._timer_tick = tick
+        self._timer = self._loop.call_at(
+            self._origin + tick * self.tick, self._on_timer
+        )
+
+    def _on_timer(self) -> None:
+        self._timer = None
+        for job in self._advance(max(self._now_tick(), self._timer_tick)):
+            job._task = self._loop.create_task(  # type: ignore[union-attr]  # noqa: SLF001
+                self._run(job), name=f"periodic:{job.name}"
+            )
+        self._arm()
+
+    # Runs
+
+    async def _run(self, job: PeriodicJob) -> None:
+        late = self._now_tick() - job._deadline  # noqa: SLF001
+        if late * self.tick >= job.interval:
+            self.coalesced.labels(job.name).inc(int(late * self.tick / job.interval))
+        started = time.perf_counter()
+        delay: float | None = None
+        try:
+            delay = await job._callback()  # noqa: SLF001
+        except asyncio.CancelledError:
+            if job.cancelled:
+                return
+            raise
+        except Exception:
+            self.errors.labels(job.name).inc()
+            logger.exception("Periodic job %s failed", job.name)
+        finally:
+            self.run_seconds.labels(job.name).observe(time.perf_counter() - started)
+            job._task = None  # noqa: SLF001
+            job.runs += 1
+        if job.cancelled or self._closed:
+            return
+        if delay is None:
+            delay = job.interval
+        if job.jitter:
+            delay *= 1 + random.uniform(-job.jitter, job.jitter)  # nosec B311
+        self._arm(self._insert_after(job, delay))
+
+
+# Shared by every scheduler get_scheduler() creates, so job metrics survive
+# event loop changes and can be exported by the metrics collector
+scheduler_registry = MetricsRegistry()
+
+_scheduler: PeriodicScheduler | None = None
+
+
+def get_scheduler() -> PeriodicScheduler:
+    """Return the shared scheduler for the running event loop.
+
+    A new scheduler is created when the loop changes (e.g. between
+    ``asyncio.run()`` calls).
+
+    Raises:
+        RuntimeError: If no event loop is running
+
+    """
+    global _scheduler
+    loop = asyncio.get_running_loop()
+    if (
+        _scheduler is None
+        or _scheduler._closed  # noqa: SLF001
+        or (_scheduler.loop is not None and _scheduler.loop is not loop)
+    ):
+        _scheduler = PeriodicScheduler(registry=scheduler_registry)
+    return _scheduler
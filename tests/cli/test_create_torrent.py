@@ -147,7 +147,7 @@ class TestTorrentCreationSuccessFailure:
             raise Exception("Test error")
 
         monkeypatch.setattr(
-            "ccbt.core.torrent_v2.TorrentV2Parser.generate_v2_torrent",
+            "ccbt.core.torrent_v2.TorrentV2Parser.create_torrent_file",
             _raise_error,
         )
 
@@ -170,7 +170,7 @@ class TestTorrentCreationSuccessFailure:
         # Mock successful torrent creation
         with patch("ccbt.core.torrent_v2.TorrentV2Parser") as mock_parser:
             mock_instance = MagicMock()
-            mock_instance.generate_v2_torrent.return_value = b"torrent data"
+            mock_instance.create_torrent_file.return_value = (None, b"\x00" * 32)
             mock_parser.return_value = mock_instance
 
             result = runner.invoke(
@@ -210,7 +210,7 @@ class TestTorrentCreationSuccessFailure:
         # Mock successful torrent creation
         with patch("ccbt.core.torrent_v2.TorrentV2Parser") as mock_parser:
             mock_instance = MagicMock()
-            mock_instance.generate_v2_torrent.return_value = b"torrent data"
+            mock_instance.create_torrent_file.return_value = (None, b"\x00" * 32)
             mock_parser.return_value = mock_instance
 
             result = runner.invoke(
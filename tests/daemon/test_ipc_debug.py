@@ -0,0 +1,101 @@
+"""Tests for the event loop health and stack sampling endpoints."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import aiohttp
+import pytest
+
+import ccbt.observability as observability
+from ccbt.config.config import get_config
+from ccbt.daemon.ipc_client import IPCClient
+from ccbt.daemon.ipc_server import IPCServer
+from ccbt.observability import LoopMonitor
+from ccbt.utils.tasks import get_scheduler
+
+
+@pytest.fixture
+async def client():
+    """Client connected over TCP to an IPC server with a mocked executor."""
+    session_manager = MagicMock()
+    session_manager.get_global_stats = AsyncMock(return_value={})
+    executor = MagicMock()
+    executor.adapter.session_manager = session_manager
+    executor_manager = MagicMock()
+    executor_manager.get_executor.return_value = executor
+    with patch(
+        "ccbt.executor.manager.ExecutorManager.get_instance",
+        return_value=executor_manager,
+    ):
+        server = IPCServer(session_manager=session_manager, api_key="key", port=0)
+    await server.start()
+    client = IPCClient(api_key="key", base_url=f"http://127.0.0.1:{server.port}")
+    client.socket_path = None
+    yield client
+    await client.close()
+    await server.stop()
+
+
+@pytest.fixture
+def loop_monitor(monkeypatch):
+    """Running loop monitor installed as the global one."""
+    monitor = LoopMonitor(interval=0.01)
+    monkeypatch.setattr(observability, "_GLOBAL_LOOP_MONITOR", monitor)
+    return monitor
+
+
+class TestDebugEndpoints:
+    """Test loop health and profiling are reachable over IPC."""
+
+    @pytest.mark.asyncio
+    async def test_loop_health(self, client, loop_monitor):
+        """Test lag, task counts and periodic job stats are returned."""
+        loop_monitor.start()
+        job = get_scheduler().schedule(AsyncMock(), 60.0, name="test.job")
+        try:
+            health = await client.get_loop_health()
+        finally:
+            job.cancel()
+            loop_monitor.stop()
+
+        assert health.total_tasks >= 1
+        assert sum(health.tasks.values()) == health.total_tasks
+        assert health.scheduler["test.job"]["jobs"] == 1
+        assert "buckets" not in health.scheduler["test.job"]
+        assert set(health.lag) >= {"last", "max", "mean", "samples"}
+
+    @pytest.mark.asyncio
+    async def test_loop_health_disabled(self, client, monkeypatch):
+        """Test 503 when the loop monitor is not running."""
+        monkeypatch.setattr(observability, "_GLOBAL_LOOP_MONITOR", None)
+        with pytest.raises(aiohttp.ClientResponseError) as exc_info:
+            await client.get_loop_health()
+        assert exc_info.value.status == 503
+
+    @pytest.mark.asyncio
+    async def test_profile_start_stop(self, client, tmp_path, monkeypatch):
+        """Test a profiling run writes collapsed stacks to the profile dir."""
+        monkeypatch.setattr(observability, "_GLOBAL_STACK_SAMPLER", None)
+        monkeypatch.setattr(get_config().observability, "profile_dir", str(tmp_path))
+
+        status = await client.start_profile(interval=0.002)
+        assert status.running
+        assert status.interval == 0.002
+        with pytest.raises(aiohttp.ClientResponseError) as exc_info:
+            await client.start_profile()
+        assert exc_info.value.status == 409
+
+        assert (await client.get_profile_status()).running
+        await asyncio.sleep(0.05)
+        status = await client.stop_profile()
+        assert not status.running
+        assert status.samples > 0
+        assert status.path is not None
+        assert status.path.startswith(str(tmp_path))
+        assert open(status.path, encoding="utf-8").read()
+
+        with pytest.raises(aiohttp.ClientResponseError) as exc_info:
+            await client.stop_profile()
+        assert exc_info.value.status == 409
@@ -0,0 +1,140 @@
+"""Tests for the paginated, projected torrent and peer listing endpoints."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import aiohttp
+import pytest
+
+from ccbt.cli.interactive import InteractiveCLI
+from ccbt.daemon.ipc_client import IPCClient
+from ccbt.daemon.ipc_server import IPCServer
+from ccbt.executor.base import CommandResult
+from ccbt.interface.daemon_session_adapter import DaemonInterfaceAdapter
+from ccbt.session.torrent_index import ListQuery, TorrentIndex, query_peers
+
+INDEX = TorrentIndex()
+INDEX.update(
+    {
+        f"{i:02x}" * 20: {"name": f"t{i}", "status": "seeding", "progress": i / 10}
+        for i in range(5)
+    }
+)
+PEERS = [{"ip": "10.0.0.1", "port": port, "client": "x"} for port in (3, 1, 2)]
+
+
+async def execute(command: str, **kwargs):
+    """Executor stand-in answering listing queries from a fixed index."""
+    query = kwargs.get("query")
+    if command == "torrent.query":
+        try:
+            return CommandResult(success=True, data=INDEX.query(query))
+        except ValueError as e:
+            return CommandResult(success=False, error=str(e))
+    if command == "torrent.query_peers":
+        return CommandResult(success=True, data=query_peers(PEERS, query))
+    return CommandResult(success=False, error=f"Unexpected {command}")
+
+
+@pytest.fixture
+async def client():
+    """Client connected over TCP to an IPC server with a mocked executor."""
+    session_manager = MagicMock()
+    session_manager.get_global_stats = AsyncMock(return_value={})
+    executor = MagicMock()
+    executor.adapter.session_manager = session_manager
+    executor.execute = AsyncMock(side_effect=execute)
+    executor_manager = MagicMock()
+    executor_manager.get_executor.return_value = executor
+    with patch(
+        "ccbt.executor.manager.ExecutorManager.get_instance",
+        return_value=executor_manager,
+    ):
+        server = IPCServer(session_manager=session_manager, api_key="key", port=0)
+    await server.start()
+    client = IPCClient(api_key="key", base_url=f"http://127.0.0.1:{server.port}")
+    client.socket_path = None
+    yield client
+    await client.close()
+    await server.stop()
+
+
+class TestListingEndpoints:
+    """Test listings are paged and carry only the requested fields."""
+
+    @pytest.mark.asyncio
+    async def test_query_torrents_pages(self, client):
+        """Test following cursors returns every torrent once."""
+        query = ListQuery(fields=frozenset({"progress"}), limit=2, sort="-progress")
+        seen = []
+        while True:
+            page = await client.query_torrents(query)
+            assert page.total == 5
+            seen.extend(page.torrents)
+            if page.next_cursor is None:
+                break
+            query.cursor = page.next_cursor
+
+        assert [row["progress"] for row in seen] == [0.4, 0.3, 0.2, 0.1, 0.0]
+        assert set(seen[0]) == {"info_hash", "progress"}
+
+    @pytest.mark.asyncio
+    async def test_invalid_query_rejected(self, client):
+        """Test bad parameters are a 400, not a server error."""
+        for query in (ListQuery(sort="nope"), ListQuery(cursor="!!")):
+            with pytest.raises(aiohttp.ClientResponseError) as exc_info:
+                await client.query_torrents(query)
+            assert exc_info.value.status == 400
+
+    @pytest.mark.asyncio
+    async def test_query_peers_projected(self, client):
+        """Test peer rows keep only ip, port and requested fields."""
+        page = await client.query_peers(
+            "aa" * 20, ListQuery(fields=frozenset(), limit=2)
+        )
+        assert page.info_hash == "aa" * 20
+        assert page.peers == [
+            {"ip": "10.0.0.1", "port": 1},
+            {"ip": "10.0.0.1", "port": 2},
+        ]
+        assert page.total == 3
+        assert page.next_cursor is not None
+
+
+class TestListingCallers:
+    """Test the interfaces list through the projected queries."""
+
+    @pytest.mark.asyncio
+    async def test_dashboard_cache_pages_projected_rows(self, client):
+        """Test the daemon dashboard cache walks pages of rendered fields."""
+        adapter = DaemonInterfaceAdapter(client)
+        client.list_torrents = AsyncMock(side_effect=AssertionError("full list"))
+        with patch("ccbt.interface.daemon_session_adapter.MAX_PAGE_LIMIT", 2):
+            await adapter._refresh_cache()
+
+        assert len(adapter.torrents) == 5
+        cached = adapter._cached_torrents["01" * 20]
+        assert cached["name"] == "t1"
+        assert cached["peers"] == 0
+        assert "ratio" not in cached
+
+    @pytest.mark.asyncio
+    async def test_interactive_peers_query(self):
+        """Test interactive mode fetches peer pages, not the full peer list."""
+        executor = MagicMock()
+        executor.execute = AsyncMock(side_effect=execute)
+        cli = InteractiveCLI(executor, MagicMock(), MagicMock())
+        cli.current_info_hash_hex = "aa" * 20
+
+        peers, total = await cli._query_peers(limit=2, sort="-port")
+        assert [peer["port"] for peer in peers] == [3, 2]
+        assert total == 3
+
+        with patch("ccbt.cli.interactive.MAX_PAGE_LIMIT", 1):
+            peers, total = await cli._query_peers()
+        assert [peer["port"] for peer in peers] == [1, 2, 3]
+        assert total == 3
+        assert "client" not in peers[0]
+        commands = {call.args[0] for call in executor.execute.await_args_list}
+        assert commands == {"torrent.query_peers"}
@@ -0,0 +1,203 @@
+"""Tests for the Unix domain socket IPC transport and batch endpoint."""
+
+from __future__ import annotations
+
+import asyncio
+import socket
+import stat
+import tempfile
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import aiohttp
+import msgpack
+import pytest
+
+from ccbt.daemon.ipc_client import IPCClient
+from ccbt.daemon.ipc_protocol import API_BASE_PATH, MSGPACK_CONTENT_TYPE, BatchOperation
+from ccbt.daemon.ipc_server import IPCServer
+from ccbt.executor.base import CommandResult
+
+pytestmark = pytest.mark.skipif(
+    not hasattr(socket, "AF_UNIX"), reason="Unix domain sockets not supported"
+)
+
+TORRENTS = {"aa" * 20}
+
+
+async def execute(command: str, **kwargs):
+    """Executor stand-in knowing one torrent."""
+    info_hash = kwargs.get("info_hash")
+    if command == "torrent.add":
+        return CommandResult(success=True, data={"info_hash": "bb" * 20})
+    if info_hash not in TORRENTS:
+        return CommandResult(success=False, error="Torrent not found")
+    if command == "torrent.pause":
+        return CommandResult(success=True, data={"paused": True})
+    if command == "torrent.status":
+        status = MagicMock()
+        status.model_dump.return_value = {"info_hash": info_hash, "progress": 0.5}
+        return CommandResult(success=True, data={"status": status})
+    return CommandResult(success=False, error=f"Unexpected {command}")
+
+
+@pytest.fixture
+async def ipc_server():
+    """IPC server listening on TCP and a Unix socket, over a mocked executor."""
+    session_manager = MagicMock()
+    session_manager.get_global_stats = AsyncMock(return_value={"num_torrents": 1})
+    executor = MagicMock()
+    executor.adapter.session_manager = session_manager
+    executor.execute = AsyncMock(side_effect=execute)
+    executor_manager = MagicMock()
+    executor_manager.get_executor.return_value = executor
+    # AF_UNIX paths are short, so keep clear of pytest's long tmp_path
+    with tempfile.TemporaryDirectory(prefix="ccbt") as tmp:
+        with patch(
+            "ccbt.executor.manager.ExecutorManager.get_instance",
+            return_value=executor_manager,
+        ):
+            server = IPCServer(
+                session_manager=session_manager,
+                api_key="test-api-key",
+                port=0,
+                socket_path=Path(tmp) / "daemon" / "ipc.sock",
+            )
+        await server.start()
+        yield server
+        await server.stop()
+
+
+def make_client(server: IPCServer, socket_path: Path | None = None) -> IPCClient:
+    """Client without an API key, pointed at the server."""
+    return IPCClient(
+        api_key=None,
+        base_url=f"http://127.0.0.1:{server.port}",
+        socket_path=socket_path or server.socket_path,
+    )
+
+
+class TestUnixSocketTransport:
+    """Test local clients use the owner-only socket."""
+
+    @pytest.mark.asyncio
+    async def test_socket_is_owner_only(self, ipc_server):
+        """Test the socket and its directory are private to the daemon user."""
+        path = ipc_server.socket_path
+        assert stat.S_ISSOCK(path.stat().st_mode)
+        assert stat.S_IMODE(path.stat().st_mode) == 0o600
+        assert stat.S_IMODE(path.parent.stat().st_mode) == 0o700
+
+        await ipc_server.stop()
+        assert not path.exists()
+
+    @pytest.mark.asyncio
+    async def test_socket_bound_without_umask(self):
+        """Test binding leaves the process-wide umask alone."""
+        with tempfile.TemporaryDirectory(prefix="ccbt") as tmp:
+            server = IPCServer(
+                session_manager=MagicMock(),
+                api_key="test-api-key",
+                port=0,
+                socket_path=Path(tmp) / "daemon" / "ipc.sock",
+            )
+            server.runner = MagicMock()
+            with patch("ccbt.daemon.ipc_server.web.UnixSite") as site_cls, patch(
+                "os.umask", side_effect=AssertionError("umask changed")
+            ):
+                site_cls.return_value.start = AsyncMock(
+                    side_effect=lambda: server.socket_path.touch()
+                )
+                await server._start_unix_site()
+
+            assert server.unix_site is site_cls.return_value
+            assert stat.S_IMODE(server.socket_path.stat().st_mode) == 0o600
+            assert stat.S_IMODE(server.socket_path.parent.stat().st_mode) == 0o700
+
+    @pytest.mark.asyncio
+    async def test_socket_probe_is_async(self, ipc_server):
+        """Test the socket probe is awaited on the loop, not a blocking connect."""
+        client = make_client(ipc_server)
+        with patch(
+            "asyncio.open_unix_connection", wraps=asyncio.open_unix_connection
+        ) as open_conn:
+            assert await client._unix_socket_available() is True
+        open_conn.assert_called_once_with(str(ipc_server.socket_path))
+        missing = make_client(ipc_server, ipc_server.socket_path.with_name("none"))
+        assert await missing._unix_socket_available() is False
+
+    @pytest.mark.asyncio
+    async def test_client_prefers_socket_without_api_key(self, ipc_server):
+        """Test the client picks the socket, where permissions authenticate."""
+        client = make_client(ipc_server)
+        try:
+            status = await client.get_status()
+            assert status.num_torrents == 1
+            assert client.transport == "unix"
+            # The session is kept for later requests
+            session = client._session
+            assert await client.pause_torrent("aa" * 20) is True
+            assert await client.pause_torrent("cc" * 20) is False
+            assert client._session is session
+        finally:
+            await client.close()
+
+    @pytest.mark.asyncio
+    async def test_tcp_fallback_still_requires_api_key(self, ipc_server):
+        """Test TCP is used when the socket is missing, with normal auth."""
+        client = make_client(ipc_server, ipc_server.socket_path.with_name("none"))
+        try:
+            with pytest.raises(aiohttp.ClientResponseError) as exc_info:
+                await client.get_status()
+            assert exc_info.value.status == 401
+            assert client.transport == "tcp"
+        finally:
+            await client.close()
+
+    @pytest.mark.asyncio
+    async def test_msgpack_negotiated(self, ipc_server):
+        """Test msgpack bodies are accepted and returned on request."""
+        connector = aiohttp.UnixConnector(path=str(ipc_server.socket_path))
+        async with aiohttp.ClientSession(connector=connector) as session:
+            async with session.post(
+                f"http://localhost{API_BASE_PATH}/torrents/add",
+                data=msgpack.packb({"path_or_magnet": "magnet:?xt=urn:btih:bb"}),
+                headers={
+                    "Content-Type": MSGPACK_CONTENT_TYPE,
+                    "Accept": MSGPACK_CONTENT_TYPE,
+                },
+            ) as resp:
+                assert resp.content_type == MSGPACK_CONTENT_TYPE
+                assert msgpack.unpackb(await resp.read()) == {
+                    "info_hash": "bb" * 20,
+                    "status": "added",
+                }
+            async with session.get(f"http://localhost{API_BASE_PATH}/status") as resp:
+                assert resp.content_type == "application/json"
+
+
+class TestBatch:
+    """Test several operations run in one request."""
+
+    @pytest.mark.asyncio
+    async def test_batch_results_in_order(self, ipc_server):
+        """Test each operation gets its own result, failures included."""
+        client = make_client(ipc_server)
+        try:
+            results = await client.batch(
+                [
+                    BatchOperation(op="add", path_or_magnet="a.torrent"),
+                    BatchOperation(op="pause", info_hash="aa" * 20),
+                    BatchOperation(op="pause", info_hash="cc" * 20),
+                    BatchOperation(op="status", info_hash="aa" * 20),
+                    BatchOperation(op="resume"),
+                ]
+            )
+        finally:
+            await client.close()
+
+        assert [r.success for r in results] == [True, True, False, True, False]
+        assert results[0].data == {"info_hash": "bb" * 20}
+        assert results[2].error == "Torrent not found"
+        assert results[3].data["progress"] == 0.5
+        assert results[4].error == "info_hash is required"
@@ -0,0 +1,250 @@
+"""Tests for the versioned status snapshot and WebSocket fan-out."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from ccbt.daemon.ipc_protocol import EventType, StatusDelta
+from ccbt.daemon.ipc_server import IPCServer
+from ccbt.daemon.status_stream import (
+    StatusSnapshot,
+    StatusSubscription,
+    WebSocketOutbox,
+)
+
+
+def torrent(**fields):
+    """Build a torrent status with defaults."""
+    status = {
+        "name": "t",
+        "status": "downloading",
+        "progress": 0.0,
+        "download_rate": 0.0,
+        "upload_rate": 0.0,
+        "num_peers": 0,
+    }
+    status.update(fields)
+    return status
+
+
+class FakeWebSocket:
+    """WebSocket recording sent messages, optionally blocking until released."""
+
+    def __init__(self, gate: asyncio.Event | None = None):
+        self.gate = gate
+        self.sent: list[dict] = []
+        self.closed = False
+        self.close_code = None
+
+    async def send_str(self, data: str) -> None:
+        if self.gate is not None:
+            await self.gate.wait()
+        self.sent.append(json.loads(data))
+
+    async def close(self, code: int = 1000, message: bytes = b"") -> None:
+        self.closed = True
+        self.close_code = code
+
+
+class TestStatusSnapshot:
+    """Test deltas carry only what changed since a version."""
+
+    def test_first_delta_is_full_then_changes_only(self):
+        """Test a new subscriber gets everything, later ones only changes."""
+        snapshot = StatusSnapshot()
+        snapshot.update({"aa": torrent(name="a"), "bb": torrent(name="b")})
+        first = snapshot.delta_since(0)
+        assert first["full"] is True
+        assert set(first["torrents"]) == {"aa", "bb"}
+        assert first["torrents"]["aa"]["name"] == "a"
+        assert first["global_stats"]["num_torrents"] == 2
+
+        assert (
+            snapshot.update({"aa": torrent(name="a"), "bb": torrent(name="b")}) is False
+        )
+        assert snapshot.version == first["version"]
+
+        snapshot.update(
+            {"aa": torrent(name="a", progress=0.5), "bb": torrent(name="b")}
+        )
+        delta = snapshot.delta_since(first["version"])
+        assert delta["full"] is False
+        assert delta["torrents"] == {"aa": {"progress": 0.5}}
+        assert delta["global_stats"] == {"average_progress": 0.25}
+
+    def test_removed_and_projected(self):
+        """Test removals are listed and field projection is applied."""
+        snapshot = StatusSnapshot()
+        snapshot.update({"aa": torrent(), "bb": torrent()})
+        since = snapshot.version
+        snapshot.update({"aa": torrent(download_rate=10.0, num_peers=3)})
+
+        delta = snapshot.delta_since(since, frozenset({"num_peers"}))
+        assert delta["torrents"] == {"aa": {"num_peers": 3}}
+        assert delta["removed"] == ["bb"]
+
+    def test_old_version_gets_full_snapshot(self):
+        """Test subscribers older than the kept tombstones are resynced."""
+        snapshot = StatusSnapshot(max_tombstones=1)
+        snapshot.update({"aa": torrent(), "bb": torrent(), "cc": torrent()})
+        since = snapshot.version
+        snapshot.update({"aa": torrent(), "bb": torrent()})
+        snapshot.update({"aa": torrent()})
+
+        delta = snapshot.delta_since(since)
+        assert delta["full"] is True
+        assert list(delta["torrents"]) == ["aa"]
+        assert delta["removed"] == []
+
+    def test_payload_encoded_once_per_version(self):
+        """Test subscribers at the same version share one encoding."""
+        snapshot = StatusSnapshot()
+        snapshot.update({"aa": torrent()})
+
+        payload = snapshot.encode_delta(0)
+        assert snapshot.encode_delta(0) is payload
+        assert StatusDelta(**json.loads(payload)).full is True
+
+        snapshot.update({"aa": torrent(progress=1.0)})
+        assert snapshot.encode_delta(0) is not payload
+
+
+class TestWebSocketOutbox:
+    """Test slow subscribers are dropped or coalesced."""
+
+    @pytest.mark.asyncio
+    async def test_slow_subscriber_is_dropped(self):
+        """Test a full outbox closes its connection."""
+        slow_ws = FakeWebSocket(asyncio.Event())
+        outbox = WebSocketOutbox(slow_ws, max_pending=2)
+        outbox.start()
+        await asyncio.sleep(0)
+
+        assert outbox.put("{}") is True  # Taken by the blocked writer
+        await asyncio.sleep(0)
+        assert outbox.put("{}") is True
+        assert outbox.put("{}") is True
+        assert outbox.put("{}") is False
+        await asyncio.sleep(0)
+
+        assert slow_ws.closed
+        assert outbox.put("{}") is False
+        await outbox.close()
+
+    @pytest.mark.asyncio
+    async def test_status_updates_coalesce(self):
+        """Test a pending status update is replaced, not queued."""
+        gate = asyncio.Event()
+        ws = FakeWebSocket(gate)
+        outbox = WebSocketOutbox(ws)
+        outbox.start()
+        subscription = StatusSubscription(interval=1.0)
+
+        outbox.put("{}")
+        await asyncio.sleep(0)
+        for version in (1, 2, 3):
+            outbox.put_status(subscription, version, json.dumps({"v": version}))
+        assert outbox.pending == 1
+        gate.set()
+        await asyncio.sleep(0.01)
+
+        assert ws.sent == [{}, {"v": 3}]
+        assert subscription.version == 3
+        await outbox.close()
+
+
+@pytest.fixture
+def ipc_server():
+    """IPC server over a mocked session manager, without a listening socket."""
+    session_manager = MagicMock()
+    session_manager.get_status = AsyncMock(return_value={})
+    executor = MagicMock()
+    executor.adapter.session_manager = session_manager
+    executor_manager = MagicMock()
+    executor_manager.get_executor.return_value = executor
+    with patch(
+        "ccbt.executor.manager.ExecutorManager.get_instance",
+        return_value=executor_manager,
+    ):
+        server = IPCServer(session_manager=session_manager, api_key="key")
+    return server
+
+
+def connect(server: IPCServer, ws: FakeWebSocket) -> WebSocketOutbox:
+    """Register a fake connection the way the WebSocket handler does."""
+    outbox = WebSocketOutbox(ws)
+    outbox.start()
+    server._websocket_outboxes[ws] = outbox
+    server._websocket_connections.add(ws)
+    server._websocket_subscriptions[ws] = set()
+    return outbox
+
+
+class TestIPCServerFanOut:
+    """Test events and status are fanned out without blocking."""
+
+    @pytest.mark.asyncio
+    async def test_event_serialized_once_for_all_subscribers(self, ipc_server):
+        """Test a blocked subscriber does not delay the others."""
+        fast = FakeWebSocket()
+        slow = FakeWebSocket(asyncio.Event())
+        connect(ipc_server, fast)
+        connect(ipc_server, slow)
+
+        with patch(
+            "ccbt.daemon.ipc_server.WebSocketEvent.model_dump_json",
+            autospec=True,
+            side_effect=lambda event: json.dumps({"type": event.type.value}),
+        ) as dump:
+            await asyncio.wait_for(
+                ipc_server._emit_websocket_event(EventType.TORRENT_ADDED, {}), 1.0
+            )
+            await asyncio.sleep(0)
+
+        assert dump.call_count == 1
+        assert fast.sent == [{"type": "torrent_added"}]
+        assert slow.sent == []
+        await ipc_server.stop()
+
+    @pytest.mark.asyncio
+    async def test_status_stream_sends_changes_only(self, ipc_server):
+        """Test subscribers get a full snapshot, then changed fields."""
+        statuses = {"aa": torrent(), "bb": torrent()}
+        ipc_server.session_manager.get_status = AsyncMock(side_effect=lambda: statuses)
+        ws = FakeWebSocket()
+        status_only = FakeWebSocket()
+        connect(ipc_server, ws)
+        connect(ipc_server, status_only)
+        ipc_server._websocket_subscriptions[ws].add(EventType.TORRENT_ADDED)
+        ipc_server._status_subscriptions[ws] = StatusSubscription(interval=0.1)
+        ipc_server._status_subscriptions[status_only] = StatusSubscription(
+            interval=0.1, fields=frozenset({"progress"})
+        )
+        ipc_server._start_status_stream()
+        await asyncio.sleep(0.05)
+
+        statuses = {"aa": torrent(progress=0.5)}
+        await asyncio.sleep(0.1)
+        await ipc_server._emit_websocket_event(EventType.TORRENT_ADDED, {})
+        await asyncio.sleep(0)
+
+        full, delta, event = ws.sent
+        assert full["full"] is True
+        assert set(full["torrents"]) == {"aa", "bb"}
+        assert delta["torrents"] == {"aa": {"progress": 0.5}}
+        assert delta["removed"] == ["bb"]
+        assert event["type"] == "torrent_added"
+        # Status-only connections are not sent events
+        assert [m["torrents"] for m in status_only.sent] == [
+            {"aa": {"progress": 0.0}, "bb": {"progress": 0.0}},
+            {"aa": {"progress": 0.5}},
+        ]
+        # One sample per tick, shared by both subscribers
+        assert ipc_server.session_manager.get_status.await_count == 2
+
+        await ipc_server.stop()
+        assert ipc_server._status_task is None
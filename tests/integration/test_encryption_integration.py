@@ -276,12 +276,11 @@ class TestEncryptionStreamIntegration:
         # Verify all were encrypted
         assert mock_writer.write.call_count == len(messages)
 
-        # Simulate reading (each message independently encrypted)
-        for i, msg in enumerate(messages):
-            # Create new cipher for each message to match encryption
-            read_cipher = RC4Cipher(key)
-            encrypted_msg = read_cipher.encrypt(msg)
-
+        # Read back the written ciphertext: the keystream continues across
+        # messages rather than restarting for each one
+        written = [call[0][0] for call in mock_writer.write.call_args_list]
+        assert written[1] != RC4Cipher(key).encrypt(messages[1])
+        for msg, encrypted_msg in zip(messages, written):
             mock_reader.readexactly = AsyncMock(return_value=encrypted_msg)
             decrypted = await encrypted_reader.readexactly(len(msg))
 
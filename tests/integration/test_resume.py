@@ -4,7 +4,6 @@ Tests complete resume workflow from checkpoint loading to download continuation.
 """
 
 import asyncio
-import contextlib
 import tempfile
 import time
 from pathlib import Path
@@ -13,6 +12,8 @@ from unittest.mock import AsyncMock, Mock, patch
 import pytest
 
 from ccbt.storage.checkpoint import CheckpointManager
+from ccbt.storage.resume_verifier import ResumeProgress
+from ccbt.utils.tasks import get_scheduler
 from ccbt.models import (
     CheckpointFormat,
     DiskConfig,
@@ -206,16 +207,20 @@ class TestResumeIntegration:
         # Ensure stop event is not set
         session._stop_event.clear()
 
-        # Start checkpoint loop
-        checkpoint_task = asyncio.create_task(session._checkpoint_loop())
+        # Schedule the checkpoint job as start() does
+        interval = session.config.disk.checkpoint_interval
+        job = get_scheduler().schedule(
+            session._checkpoint_loop_step,
+            interval,
+            name="test.checkpoint",
+            delay=interval,
+        )
 
         # Wait for at least one checkpoint save (interval is 0.1, wait 0.25 to ensure it runs)
         await asyncio.sleep(0.25)
 
-        # Stop the task
-        checkpoint_task.cancel()
-        with contextlib.suppress(asyncio.CancelledError):
-            await checkpoint_task
+        # Stop the job
+        job.cancel()
 
         # Verify checkpoint save was called
         assert checkpoint_manager.save_checkpoint.call_count >= 1
@@ -284,8 +289,15 @@ class TestResumeIntegration:
             "existing_pieces": {0},
             "warnings": [],
         }
+        seen_progress = []
+
+        async def verify_existing_pieces(checkpoint, progress_callback, hash_executor):
+            progress_callback(ResumeProgress(pieces_total=2, pieces_checked=1))
+            seen_progress.append(session.resume_progress.fraction)
+            return validation_results
+
         file_assembler.verify_existing_pieces = AsyncMock(
-            return_value=validation_results,
+            side_effect=verify_existing_pieces,
         )
         session.download_manager.file_assembler = file_assembler
 
@@ -297,8 +309,14 @@ class TestResumeIntegration:
         # Test resume from checkpoint
         await session._resume_from_checkpoint(sample_checkpoint)
 
-        # Verify validation was called
-        file_assembler.verify_existing_pieces.assert_called_once_with(sample_checkpoint)
+        # Verify validation ran on the hash pool and reported its progress
+        file_assembler.verify_existing_pieces.assert_called_once_with(
+            sample_checkpoint,
+            progress_callback=session._on_resume_progress,
+            hash_executor=piece_manager.hash_executor,
+        )
+        assert seen_progress == [0.5]
+        assert session.resume_progress is None
         # skip_preallocation_if_exists is no longer called in the new implementation
         piece_manager.restore_from_checkpoint.assert_called_once_with(sample_checkpoint)
 
@@ -352,7 +370,11 @@ class TestResumeIntegration:
         await session._resume_from_checkpoint(sample_checkpoint)
 
         # Verify validation was called and warnings were logged
-        file_assembler.verify_existing_pieces.assert_called_once_with(sample_checkpoint)
+        file_assembler.verify_existing_pieces.assert_called_once()
+        assert (
+            file_assembler.verify_existing_pieces.call_args.args[0]
+            is sample_checkpoint
+        )
         # Resume should still proceed despite validation warnings
         piece_manager.restore_from_checkpoint.assert_called_once_with(sample_checkpoint)
 
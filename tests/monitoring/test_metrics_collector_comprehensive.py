@@ -242,12 +242,14 @@ async def test_set_gauge_existing_metric(metrics_collector):
 @pytest.mark.asyncio
 async def test_record_histogram(metrics_collector):
     """Test record_histogram() method."""
-    metrics_collector.record_histogram("hist_metric", 50.0, [1, 10, 50, 100, 1000])
+    labels = [MetricLabel(name="peer", value="peer1")]
+    metrics_collector.record_histogram("hist_metric", 50.0, labels)
     
     assert "hist_metric" in metrics_collector.metrics
     metric = metrics_collector.metrics["hist_metric"]
     assert metric.metric_type == MetricType.HISTOGRAM
     assert len(metric.values) > 0
+    assert metric.current[(("peer", "peer1"),)] == 50.0
 
 
 @pytest.mark.asyncio
@@ -550,26 +552,20 @@ async def test_unregister_custom_collector(metrics_collector):
 
 @pytest.mark.asyncio
 async def test_record_metric_alert_manager_integration(metrics_collector):
-    """Test record_metric() integrates with AlertManager (lines 237-263)."""
+    """Test recorded values reach the AlertManager at the next evaluation."""
     with patch("ccbt.monitoring.get_alert_manager") as mock_get_am:
         mock_am = MagicMock()
         mock_am.process_alert = AsyncMock()
         mock_get_am.return_value = mock_am
-        
-        # Mock event loop
-        with patch("asyncio.get_event_loop") as mock_get_loop:
-            mock_loop = MagicMock()
-            mock_loop.is_running.return_value = True
-            mock_task = MagicMock()
-            mock_task.add_done_callback = MagicMock()
-            mock_loop.create_task = MagicMock(return_value=mock_task)
-            mock_get_loop.return_value = mock_loop
-            
-            metrics_collector.record_metric("test_metric", 42.0)
-            
-            # AlertManager should be called (if conditions met)
-            # The actual call depends on async task scheduling
-            assert mock_loop.create_task.called
+
+        metrics_collector.record_metric("test_metric", 41.0)
+        metrics_collector.record_metric("test_metric", 42.0)
+        assert not mock_am.process_alert.called
+
+        await metrics_collector.evaluate_alerts()
+
+        mock_am.process_alert.assert_awaited_once()
+        assert mock_am.process_alert.call_args.args[:2] == ("test_metric", 42.0)
 
 
 @pytest.mark.asyncio
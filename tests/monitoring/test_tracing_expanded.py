@@ -16,7 +16,7 @@ from __future__ import annotations
 
 import asyncio
 import time
-from unittest.mock import AsyncMock, Mock, patch
+from unittest.mock import Mock
 
 import pytest
 
@@ -532,16 +532,15 @@ async def test_is_trace_complete_incomplete(tracing_manager):
 
 
 @pytest.mark.asyncio
-async def test_is_trace_complete_emits_event(tracing_manager):
-    """Test trace completion emits event (lines 384-398)."""
+async def test_trace_completion_counted_without_event(tracing_manager):
+    """Test trace completion is counted without emitting an event per trace."""
     span_id = tracing_manager.start_span("test")
-    trace_id = tracing_manager.active_spans[span_id].trace_id
-    
-    with patch("ccbt.monitoring.tracing.emit_event", new_callable=AsyncMock) as mock_emit:
-        tracing_manager.end_span(span_id)
-        
-        # Should emit trace completed event
-        assert mock_emit.called or tracing_manager.stats["traces_completed"] >= 0
+    tasks = asyncio.all_tasks()
+
+    tracing_manager.end_span(span_id)
+
+    assert asyncio.all_tasks() == tasks
+    assert tracing_manager.stats["traces_completed"] == 1
 
 
 @pytest.mark.asyncio
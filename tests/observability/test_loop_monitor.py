@@ -0,0 +1,126 @@
+"""Tests for event loop health monitoring and stack sampling."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+import ccbt.observability as observability
+from ccbt.observability.loop_monitor import LoopMonitor, StackSampler, task_label
+
+
+def blocking_step() -> None:
+    """Block the event loop long enough to be recorded as slow."""
+    time.sleep(0.2)
+
+
+class TestLoopMonitor:
+    """Test lag sampling, slow callback capture and task counts."""
+
+    @pytest.mark.asyncio
+    async def test_lag_and_slow_callback(self):
+        """Test a blocking task step is recorded with its task and stack."""
+        monitor = LoopMonitor(interval=0.01, slow_threshold=0.05)
+        monitor.start()
+        try:
+            await asyncio.sleep(0.05)
+
+            async def stall() -> None:
+                blocking_step()
+
+            await asyncio.create_task(stall(), name="stalling-task")
+            await asyncio.sleep(0.05)
+        finally:
+            monitor.stop()
+
+        assert not monitor.running
+        assert monitor.max_lag >= 0.15
+        slow = monitor.slow_callbacks()
+        assert len(slow) == 1
+        assert slow[0].task == "stalling-task"
+        assert slow[0].duration >= 0.15
+        assert "in blocking_step" in slow[0].stack[-1]
+        assert monitor.slow_callbacks_total.labels().value == 1
+
+        health = monitor.snapshot()
+        assert health["lag"]["samples"] >= 5
+        assert health["lag"]["max"] == monitor.max_lag
+        assert health["slow_callbacks"][0]["task"] == "stalling-task"
+
+    @pytest.mark.asyncio
+    async def test_task_counts_by_name(self):
+        """Test tasks are grouped by name, or by coroutine if unnamed."""
+        monitor = LoopMonitor()
+        release = asyncio.Event()
+
+        async def waiter() -> None:
+            await release.wait()
+
+        tasks = [asyncio.create_task(waiter(), name="periodic:peer.stats")]
+        tasks += [asyncio.create_task(waiter()) for _ in range(3)]
+        await asyncio.sleep(0)
+
+        counts = monitor.task_counts()
+        label = task_label(tasks[-1])
+        assert label.endswith("waiter")
+        assert counts["periodic:peer.stats"] == 1
+        assert counts[label] == 3
+        assert monitor.tasks_gauge.labels(label).value == 3
+
+        release.set()
+        await asyncio.gather(*tasks)
+        assert label not in monitor.task_counts()
+        assert monitor.tasks_gauge.labels(label).value == 0
+
+
+def spin(stop: threading.Event) -> None:
+    """Keep a thread busy in an identifiable frame."""
+    while not stop.is_set():
+        time.sleep(0.001)
+
+
+class TestStackSampler:
+    """Test collapsed stacks are collected from other threads."""
+
+    def test_collapsed_stacks(self, tmp_path):
+        """Test samples name the thread and frames, root first."""
+        stop = threading.Event()
+        worker = threading.Thread(target=spin, args=(stop,), name="spinner")
+        worker.start()
+        sampler = StackSampler(interval=0.002)
+        sampler.start()
+        time.sleep(0.1)
+        sampler.stop()
+        stop.set()
+        worker.join()
+
+        assert sampler.samples > 10
+        lines = sampler.collapsed().splitlines()
+        spinner = [line for line in lines if line.startswith("spinner;")]
+        assert spinner
+        stack, count = spinner[0].rsplit(" ", 1)
+        assert int(count) > 0
+        assert stack.split(";")[-1].startswith("spin (test_loop_monitor.py:")
+        assert not any("ccbt-stack-sampler" in line for line in lines)
+
+        path = sampler.write(tmp_path / "out" / "stacks.txt")
+        assert path.read_text(encoding="utf-8") == sampler.collapsed()
+
+    def test_global_sampler_lifecycle(self, tmp_path):
+        """Test only one sampling run at a time, written on stop."""
+        with pytest.raises(RuntimeError, match="not running"):
+            observability.stop_stack_sampler()
+
+        sampler = observability.start_stack_sampler(0.002)
+        assert observability.get_stack_sampler() is sampler
+        with pytest.raises(RuntimeError, match="already running"):
+            observability.start_stack_sampler()
+        time.sleep(0.02)
+
+        status = observability.stop_stack_sampler(tmp_path / "stacks.txt")
+        assert not status["running"]
+        assert status["samples"] > 0
+        assert status["path"] == str(tmp_path / "stacks.txt")
@@ -200,13 +200,9 @@ def run_cipher_benchmark(
     for _ in range(iterations):
         if operation == "encrypt":
             result = cipher.encrypt(data)
-        # For decryption, we need to encrypt first to get encrypted data
-        elif cipher_class == RC4Cipher:
-            # RC4 needs fresh instance for decryption
-            encrypt_cipher = cipher_class(key)
-            encrypted = encrypt_cipher.encrypt(data)
-            decrypt_cipher = cipher_class(key)
-            result = decrypt_cipher.decrypt(encrypted)
+        # For decryption, we need to encrypt first to get encrypted data.
+        # Ciphers keep independent encrypt/decrypt keystreams, so one
+        # instance round-trips a continuous stream.
         else:
             encrypted = cipher.encrypt(data)
             result = cipher.decrypt(encrypted)
@@ -0,0 +1,547 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import os
+import sys
+
+# Add project root to path for imports when run as script
+# This must be done before any local imports
+_script_dir = os.path.dirname(os.path.abspath(__file__))
+_project_root = os.path.abspath(os.path.join(_script_dir, os.pardir, os.pardir))
+if _project_root not in sys.path:
+    sys.path.insert(0, _project_root)
+
+import argparse
+import asyncio
+import hashlib
+import json
+import platform
+import random
+import shutil
+import socket
+import tempfile
+import threading
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from http.server import ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+import toml
+
+from ccbt.core.bencode import encode  # type: ignore
+from ccbt.discovery.tracker_server_http import AnnounceHandler, InMemoryTrackerStore  # type: ignore
+from ccbt.discovery.tracker_server_udp import UDPTracker  # type: ignore
+
+# Import bench_utils using relative import or direct import
+try:
+    from tests.performance.bench_utils import record_benchmark_results
+except ImportError:
+    # Fallback: import directly from same directory
+    import importlib.util
+    _bench_utils_path = os.path.join(os.path.dirname(__file__), "bench_utils.py")
+    _spec = importlib.util.spec_from_file_location("bench_utils", _bench_utils_path)
+    _bench_utils = importlib.util.module_from_spec(_spec)
+    _spec.loader.exec_module(_bench_utils)  # type: ignore
+    record_benchmark_results = _bench_utils.record_benchmark_results
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - Windows
+    resource = None  # type: ignore[assignment]
+
+BENCHMARKS_TOML = os.path.join(_project_root, "dev", "benchmarks.toml")
+DEFAULT_OUTPUT_DIR = "site/reports/benchmarks/artifacts"
+GIB = 1024 ** 3
+
+
+@dataclass
+class BenchmarkResult:
+    tracker: str
+    seeders: int
+    leechers: int
+    files: int
+    piece_size: int
+    size_bytes: int
+    completed: int
+    time_to_complete_s: float
+    mean_time_to_complete_s: float
+    throughput_bytes_per_s: float
+    cpu_s_per_gib: float
+    peak_rss_bytes: int
+    max_loop_lag_s: float
+    mean_loop_lag_s: float
+
+
+def parse_size(size_str: str) -> int:
+    suffixes = [("gib", 1024 ** 3), ("gb", 1024 ** 3), ("mib", 1024 ** 2), ("mb", 1024 ** 2), ("kib", 1024), ("kb", 1024), ("b", 1)]
+    s = size_str.strip().lower()
+    for suf, mul in suffixes:
+        if s.endswith(suf):
+            return int(float(s[:-len(suf)]) * mul)
+    return int(s)
+
+
+def parse_shape(shape: str) -> Tuple[int, int]:
+    """Parse a ``COUNTxSIZE`` file shape such as ``16x1MiB``."""
+    count, sep, size = shape.lower().partition("x")
+    if not sep:
+        return 1, parse_size(shape)
+    return int(count), parse_size(size)
+
+
+def format_bytes(n: Union[int, float]) -> str:
+    value: float = float(n)
+    for unit in ("B", "KiB", "MiB", "GiB"):
+        if value < 1024.0 or unit == "GiB":  # type: ignore[comparison-overlap]
+            if value.is_integer():
+                return f"{int(value)} {unit}"
+            return f"{value:.2f} {unit}"
+        value = value / 1024.0
+    return f"{value} B"
+
+
+def load_bench_config(path: str = BENCHMARKS_TOML) -> Dict[str, Any]:
+    try:
+        return toml.load(path)
+    except (OSError, toml.TomlDecodeError):
+        return {}
+
+
+def free_port(kind: int = socket.SOCK_STREAM) -> int:
+    with socket.socket(socket.AF_INET, kind) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def peak_rss_bytes() -> int:
+    if resource is None:
+        return 0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS reports bytes
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+# --------------------------------------------------------------------------
+# Tracker
+# --------------------------------------------------------------------------
+
+
+class _QuietAnnounceHandler(AnnounceHandler):
+    def log_message(self, format: str, *args: Any) -> None:  # noqa: A002
+        return
+
+
+class LocalTracker:
+    """HTTP or UDP tracker served from a background thread on loopback."""
+
+    def __init__(self, kind: str):
+        self.kind = kind
+        if kind == "udp":
+            self._server: Any = UDPTracker("127.0.0.1", free_port(socket.SOCK_DGRAM))
+            self.announce_url = f"udp://127.0.0.1:{self._server.port}"
+        else:
+            # Fresh store per run so peers from earlier cases are not returned
+            handler = type("SwarmAnnounceHandler", (_QuietAnnounceHandler,), {"store": InMemoryTrackerStore()})
+            self._server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+            self.announce_url = f"http://127.0.0.1:{self._server.server_address[1]}/announce"
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    def __enter__(self) -> "LocalTracker":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self._server.shutdown()
+        if self.kind == "http":
+            self._server.server_close()
+        self._thread.join(timeout=5)
+
+
+# --------------------------------------------------------------------------
+# Synthetic torrents
+# --------------------------------------------------------------------------
+
+
+def write_source(source_dir: Path, files: int, file_size: int) -> List[Path]:
+    source_dir.mkdir(parents=True, exist_ok=True)
+    paths = []
+    for i in range(files):
+        path = source_dir / f"file-{i:04d}.bin"
+        path.write_bytes(random.Random(i).randbytes(file_size))
+        paths.append(path)
+    return paths
+
+
+def iter_pieces(paths: List[Path], piece_length: int) -> Iterator[bytes]:
+    """Yield the concatenated contents of ``paths`` in ``piece_length`` chunks."""
+    buf = bytearray()
+    for path in paths:
+        with path.open("rb") as f:
+            while True:
+                data = f.read(piece_length - len(buf))
+                if not data:
+                    break
+                buf += data
+                if len(buf) == piece_length:
+                    yield bytes(buf)
+                    buf.clear()
+    if buf:
+        yield bytes(buf)
+
+
+def build_torrent(paths: List[Path], name: str, piece_length: int, announce_url: str) -> bytes:
+    pieces = b"".join(hashlib.sha1(piece).digest() for piece in iter_pieces(paths, piece_length))  # nosec B324
+    info: Dict[bytes, Any] = {b"name": name.encode(), b"piece length": piece_length, b"pieces": pieces}
+    if len(paths) == 1:
+        info[b"length"] = paths[0].stat().st_size
+    else:
+        info[b"files"] = [{b"length": p.stat().st_size, b"path": [p.name.encode()]} for p in paths]
+    return encode({b"announce": announce_url.encode(), b"info": info})
+
+
+# --------------------------------------------------------------------------
+# Peer process
+# --------------------------------------------------------------------------
+
+
+def write_peer_config(workdir: Path) -> None:
+    tcp_port = free_port()
+    workdir.joinpath("ccbt.toml").write_text(
+        f"""[network]
+listen_port = {tcp_port}
+listen_port_tcp = {tcp_port}
+listen_port_udp = {free_port(socket.SOCK_DGRAM)}
+tracker_udp_port = {free_port(socket.SOCK_DGRAM)}
+listen_interface = "127.0.0.1"
+enable_ipv6 = false
+
+[discovery]
+enable_dht = false
+enable_pex = false
+
+[nat]
+auto_map_ports = false
+enable_upnp = false
+enable_nat_pmp = false
+
+[observability]
+log_level = "WARNING"
+enable_metrics = false
+
+[disk]
+checkpoint_enabled = false
+""",
+        encoding="utf-8",
+    )
+
+
+# Peers report to the parent on the original stdout; client logging goes to peer.log
+_events = sys.stdout
+
+
+def emit(payload: Dict[str, Any]) -> None:
+    _events.write(json.dumps(payload) + "\n")
+    _events.flush()
+
+
+async def seed_pieces(piece_manager: Any, paths: List[Path], piece_length: int) -> None:
+    # There is no recheck-from-disk path, so seeders load their data through
+    # the same block handler leechers use and hold the verified pieces
+    for index, data in enumerate(iter_pieces(paths, piece_length)):
+        for block in piece_manager.pieces[index].blocks:
+            await piece_manager.handle_piece_block(index, block.begin, data[block.begin : block.begin + block.length])
+    while len(piece_manager.verified_pieces) < len(piece_manager.pieces):
+        await asyncio.sleep(0.01)
+
+
+async def run_peer(spec: Dict[str, Any]) -> Dict[str, Any]:
+    from ccbt.observability.loop_monitor import LoopMonitor
+    from ccbt.session.session import AsyncSessionManager
+
+    monitor = LoopMonitor(interval=0.05)
+    monitor.start()
+    manager = AsyncSessionManager(str(Path(spec["workdir"]) / "data"))
+    await manager.start()
+    try:
+        torrent_data = manager.load_torrent(spec["torrent"])
+        info_hash = await manager.add_torrent(torrent_data)
+        piece_manager = manager.torrents[bytes.fromhex(info_hash)].piece_manager
+        piece_length = torrent_data["pieces_info"]["piece_length"]
+
+        if spec["role"] == "seeder":
+            await seed_pieces(piece_manager, [Path(p) for p in spec["source"]], piece_length)
+            emit({"event": "ready"})
+            cpu_start = time.process_time()
+            await asyncio.get_running_loop().run_in_executor(None, sys.stdin.readline)
+            elapsed = 0.0
+            complete = True
+        else:
+            cpu_start = time.process_time()
+            start = time.perf_counter()
+            deadline = start + spec["timeout"]
+            while not piece_manager.download_complete and time.perf_counter() < deadline:
+                await asyncio.sleep(0.01)
+            elapsed = time.perf_counter() - start
+            complete = bool(piece_manager.download_complete)
+        cpu_s = time.process_time() - cpu_start
+        lag = monitor.snapshot()["lag"]
+    finally:
+        monitor.stop()
+        await manager.stop()
+    return {
+        "event": "result",
+        "role": spec["role"],
+        "complete": complete,
+        "elapsed_s": elapsed,
+        "cpu_s": cpu_s,
+        "peak_rss_bytes": peak_rss_bytes(),
+        "max_loop_lag_s": lag["max"],
+        "mean_loop_lag_s": lag["mean"],
+    }
+
+
+def peer_main(spec_json: str) -> int:
+    spec = json.loads(spec_json)
+    # The client reads ./ccbt.toml, so each peer runs in its own directory
+    os.chdir(spec["workdir"])
+    sys.stdout = sys.stderr
+    emit(asyncio.run(run_peer(spec)))
+    return 0
+
+
+# --------------------------------------------------------------------------
+# Swarm orchestration
+# --------------------------------------------------------------------------
+
+
+async def spawn_peer(workdir: Path, spec: Dict[str, Any]) -> asyncio.subprocess.Process:
+    workdir.mkdir(parents=True, exist_ok=True)
+    write_peer_config(workdir)
+    spec = dict(spec, workdir=str(workdir))
+    log = workdir.joinpath("peer.log").open("wb")
+    try:
+        return await asyncio.create_subprocess_exec(
+            sys.executable,
+            os.path.abspath(__file__),
+            "--peer",
+            json.dumps(spec),
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=log,
+            cwd=str(workdir),
+        )
+    finally:
+        log.close()
+
+
+async def read_event(proc: asyncio.subprocess.Process, timeout: float) -> Optional[Dict[str, Any]]:
+    assert proc.stdout is not None
+    while True:
+        try:
+            line = await asyncio.wait_for(proc.stdout.readline(), timeout)
+        except asyncio.TimeoutError:
+            return None
+        if not line:
+            return None
+        if line.startswith(b"{"):
+            return json.loads(line)
+
+
+async def reap(proc: asyncio.subprocess.Process) -> None:
+    if proc.returncode is None:
+        proc.kill()
+    await proc.wait()
+
+
+async def run_swarm(
+    root: Path,
+    torrent: Path,
+    source: List[Path],
+    seeders: int,
+    leechers: int,
+    timeout: float,
+) -> List[Optional[Dict[str, Any]]]:
+    seeder_spec = {"role": "seeder", "torrent": str(torrent), "source": [str(p) for p in source], "timeout": timeout}
+    leecher_spec = {"role": "leecher", "torrent": str(torrent), "timeout": timeout}
+    seeds = [await spawn_peer(root / f"seeder-{i}", seeder_spec) for i in range(seeders)]
+    leeches: List[asyncio.subprocess.Process] = []
+    try:
+        ready = await asyncio.gather(*(read_event(p, timeout) for p in seeds))
+        if not all(ready):
+            return [None] * (seeders + leechers)
+
+        leeches = [await spawn_peer(root / f"leecher-{i}", leecher_spec) for i in range(leechers)]
+        # Leechers stop their own clock; the margin covers interpreter startup
+        leech_results = await asyncio.gather(*(read_event(p, timeout + 60) for p in leeches))
+
+        for proc in seeds:
+            assert proc.stdin is not None
+            proc.stdin.write(b"stop\n")
+            await proc.stdin.drain()
+        seed_results = await asyncio.gather(*(read_event(p, 60) for p in seeds))
+        return list(seed_results) + list(leech_results)
+    finally:
+        for proc in seeds + leeches:
+            await asyncio.wait_for(reap(proc), 30)
+
+
+def run_case(
+    root: Path,
+    tracker_kind: str,
+    seeders: int,
+    leechers: int,
+    files: int,
+    file_size: int,
+    piece_size: int,
+    timeout: float,
+) -> BenchmarkResult:
+    case_dir = root / f"{tracker_kind}-{seeders}s{leechers}l-{files}x{file_size}-{piece_size}"
+    source = write_source(case_dir / "source", files, file_size)
+    size_bytes = files * file_size
+
+    with LocalTracker(tracker_kind) as tracker:
+        torrent = case_dir / "swarm.torrent"
+        torrent.write_bytes(build_torrent(source, "swarm", piece_size, tracker.announce_url))
+        peers = asyncio.run(run_swarm(case_dir, torrent, source, seeders, leechers, timeout))
+
+    reports = [p for p in peers if p is not None]
+    finished = [p for p in reports if p["role"] == "leecher" and p["complete"]]
+    times = [p["elapsed_s"] for p in finished]
+    time_to_complete = max(times) if times else 0.0
+    delivered = size_bytes * len(finished)
+    cpu_s = sum(p["cpu_s"] for p in reports)
+    return BenchmarkResult(
+        tracker=tracker_kind,
+        seeders=seeders,
+        leechers=leechers,
+        files=files,
+        piece_size=piece_size,
+        size_bytes=size_bytes,
+        completed=len(finished),
+        time_to_complete_s=time_to_complete,
+        mean_time_to_complete_s=sum(times) / len(times) if times else 0.0,
+        throughput_bytes_per_s=delivered / max(time_to_complete, 1e-9) if finished else 0.0,
+        cpu_s_per_gib=cpu_s / (delivered / GIB) if delivered else 0.0,
+        peak_rss_bytes=max((p["peak_rss_bytes"] for p in reports), default=0),
+        max_loop_lag_s=max((p["max_loop_lag_s"] for p in reports), default=0.0),
+        mean_loop_lag_s=sum(p["mean_loop_lag_s"] for p in reports) / len(reports) if reports else 0.0,
+    )
+
+
+def ensure_artifacts_dir(output_dir: Path) -> None:
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+
+def write_json(output_dir: Path, benchmark: str, config_name: str, results: List[BenchmarkResult]) -> Path:
+    """Legacy function for backward compatibility."""
+    meta = {
+        "benchmark": benchmark,
+        "config": config_name,
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "platform": {"system": platform.system(), "release": platform.release(), "python": sys.version.split()[0]},
+    }
+    data = {"meta": meta, "results": [asdict(r) for r in results]}
+    filename = f"{benchmark}-{config_name}-{platform.system()}-{platform.release()}.json"
+    path = output_dir / filename
+    with path.open("w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+    return path
+
+
+def derive_config_name(config_file: str | None) -> str:
+    if not config_file:
+        return "default"
+    stem = Path(config_file).stem
+    parts = stem.split("example-config-")
+    if len(parts) == 2 and parts[1]:
+        return parts[1]
+    return stem
+
+
+def main() -> int:
+    bench_config = load_bench_config()
+    defaults = bench_config.get("swarm", {})
+    output_dir = bench_config.get("global", {}).get("output_dir", DEFAULT_OUTPUT_DIR)
+
+    parser = argparse.ArgumentParser(description="End-to-end loopback swarm benchmark")
+    parser.add_argument("--tracker", choices=["http", "udp"], default=defaults.get("tracker", "http"), help="Local tracker protocol")
+    parser.add_argument("--seeders", type=int, default=defaults.get("seeders", 1), help="Seeding clients")
+    parser.add_argument("--leechers", type=int, default=defaults.get("leechers", 2), help="Downloading clients")
+    parser.add_argument("--shapes", nargs="*", default=defaults.get("shapes", ["1x16MiB", "16x1MiB"]), help="File shapes as COUNTxSIZE")
+    parser.add_argument("--piece-sizes", nargs="*", default=defaults.get("piece_sizes", ["256KiB", "1MiB"]), help="Piece sizes")
+    parser.add_argument("--timeout", type=float, default=defaults.get("timeout_s", 120.0), help="Seconds each leecher may take")
+    parser.add_argument("--workdir", default=None, help="Keep peer directories and logs here instead of a temp dir")
+    parser.add_argument("--peer", default=None, help=argparse.SUPPRESS)
+    parser.add_argument("--quick", action="store_true", help="Run minimal quick mode")
+    parser.add_argument("--config-file", default=None, help="Path to client config used (for labeling only)")
+    parser.add_argument("--output-dir", default=output_dir, help="Output directory for JSON results (default: dev/benchmarks.toml output_dir)")
+    parser.add_argument(
+        "--record-mode",
+        choices=["auto", "pre-commit", "commit", "both", "none"],
+        default="auto",
+        help="Recording mode: auto (detect), pre-commit, commit, both, or none",
+    )
+
+    args = parser.parse_args()
+    if args.peer:
+        return peer_main(args.peer)
+
+    shapes = [parse_shape(s) for s in args.shapes]
+    piece_sizes = [parse_size(s) for s in args.piece_sizes]
+    if args.quick:
+        shapes = [(files, min(size, 4 * 1024 * 1024 // files or 1)) for files, size in shapes[:1]]
+        piece_sizes = piece_sizes[:1]
+
+    workdir = Path(args.workdir) if args.workdir else Path(tempfile.mkdtemp(prefix="ccbt-swarm-"))
+    results: List[BenchmarkResult] = []
+    try:
+        for files, file_size in shapes:
+            for piece_size in piece_sizes:
+                results.append(run_case(workdir, args.tracker, args.seeders, args.leechers, files, file_size, piece_size, args.timeout))
+    finally:
+        if not args.workdir:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    print(" | ".join(("Tracker", "Peers", "Files", "Piece", "Size", "Done", "TTC (s)", "Throughput", "CPU s/GiB", "Peak RSS", "Max lag (ms)")))
+    print("-" * 120)
+    for r in results:
+        print(" | ".join([
+            r.tracker,
+            f"{r.seeders}s/{r.leechers}l",
+            str(r.files),
+            format_bytes(r.piece_size),
+            format_bytes(r.size_bytes),
+            f"{r.completed}/{r.leechers}",
+            f"{r.time_to_complete_s:.2f}",
+            f"{r.throughput_bytes_per_s / (1024**2):.2f} MiB/s",
+            f"{r.cpu_s_per_gib:.1f}",
+            format_bytes(r.peak_rss_bytes),
+            f"{r.max_loop_lag_s * 1000:.1f}",
+        ]))
+
+    config_name = derive_config_name(args.config_file)
+
+    # Record benchmark results using new system
+    per_run_path, timeseries_path = record_benchmark_results("swarm", config_name, results, args.record_mode)
+
+    output_path = Path(args.output_dir)
+    ensure_artifacts_dir(output_path)
+    out_path = write_json(output_path, "swarm", config_name, results)
+    print(f"\nWrote: {out_path}")
+
+    # Print recording results
+    if per_run_path:
+        print(f"Recorded per-run: {per_run_path}")
+    if timeseries_path:
+        print(f"Updated timeseries: {timeseries_path}")
+    if not per_run_path and not timeseries_path:
+        print("No benchmark recording (mode: none or auto detected none)")
+
+    # A leecher that never finished means the swarm is broken, not slow
+    return 0 if all(r.completed == r.leechers for r in results) else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
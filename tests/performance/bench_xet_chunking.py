@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import os
+import sys
+
+# Add project root to path for imports when run as script
+# This must be done before any local imports
+_script_dir = os.path.dirname(os.path.abspath(__file__))
+_project_root = os.path.abspath(os.path.join(_script_dir, os.pardir, os.pardir))
+if _project_root not in sys.path:
+    sys.path.insert(0, _project_root)
+
+import argparse
+import json
+import platform
+import random
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import List, Union
+
+import ccbt.storage.xet_chunking as xet_chunking  # type: ignore
+from ccbt.storage.xet_chunking import GearhashChunker  # type: ignore
+
+# Import bench_utils using relative import or direct import
+try:
+    from tests.performance.bench_utils import record_benchmark_results
+except ImportError:
+    # Fallback: import directly from same directory
+    import importlib.util
+    _bench_utils_path = os.path.join(os.path.dirname(__file__), "bench_utils.py")
+    _spec = importlib.util.spec_from_file_location("bench_utils", _bench_utils_path)
+    _bench_utils = importlib.util.module_from_spec(_spec)
+    _spec.loader.exec_module(_bench_utils)  # type: ignore
+    record_benchmark_results = _bench_utils.record_benchmark_results
+
+
+@dataclass
+class BenchmarkResult:
+    engine: str
+    size_bytes: int
+    buffers: int
+    elapsed_s: float
+    bytes_processed: int
+    throughput_bytes_per_s: float
+    chunks: int
+    boundaries_match: bool
+
+
+def parse_size(size_str: str) -> int:
+    suffixes = [("gib", 1024 ** 3), ("gb", 1024 ** 3), ("mib", 1024 ** 2), ("mb", 1024 ** 2), ("kib", 1024), ("kb", 1024), ("b", 1)]
+    s = size_str.strip().lower()
+    for suf, mul in suffixes:
+        if s.endswith(suf):
+            return int(float(s[:-len(suf)]) * mul)
+    return int(s)
+
+
+def format_bytes(n: Union[int, float]) -> str:
+    value: float = float(n)
+    for unit in ("B", "KiB", "MiB", "GiB"):
+        if value < 1024.0 or unit == "GiB":  # type: ignore[comparison-overlap]
+            if value.is_integer():
+                return f"{int(value)} {unit}"
+            return f"{value:.2f} {unit}"
+        value = value / 1024.0
+    return f"{value} B"
+
+
+def generate_buffer(size: int, seed: int = 123456) -> bytes:
+    return random.Random(seed).randbytes(size)
+
+
+def reference_boundaries(chunker: GearhashChunker, data: bytes) -> list[int]:
+    """Boundaries from the original per-byte implementation."""
+    boundaries = []
+    pos = 0
+    while pos < len(data):
+        pos = chunker._find_chunk_boundary(data, pos, 0, 0, chunker.target_mask)  # noqa: SLF001
+        boundaries.append(pos)
+    return boundaries
+
+
+def timed_boundaries(chunker: GearhashChunker, data: bytes, vectorized: bool) -> tuple[list[int], float]:
+    saved = xet_chunking.HAS_NUMPY
+    xet_chunking.HAS_NUMPY = saved and vectorized
+    try:
+        start = time.perf_counter()
+        boundaries = chunker.chunk_boundaries(data)
+        return boundaries, time.perf_counter() - start
+    finally:
+        xet_chunking.HAS_NUMPY = saved
+
+
+def run_case(chunker: GearhashChunker, size_bytes: int, reference_bytes: int) -> List[BenchmarkResult]:
+    data = generate_buffer(size_bytes)
+
+    # The reference is ~1 MB/s, so it only checks a prefix of larger buffers
+    sample = data[: min(size_bytes, reference_bytes)]
+    start = time.perf_counter()
+    expected = reference_boundaries(chunker, sample)
+    ref_elapsed = time.perf_counter() - start
+    results = [
+        BenchmarkResult(
+            engine="reference",
+            size_bytes=len(sample),
+            buffers=1,
+            elapsed_s=ref_elapsed,
+            bytes_processed=len(sample),
+            throughput_bytes_per_s=len(sample) / max(ref_elapsed, 1e-9),
+            chunks=len(expected),
+            boundaries_match=True,
+        )
+    ]
+
+    engines = [("scalar", False)]
+    if xet_chunking.HAS_NUMPY:
+        engines.append(("vector", True))
+    for name, vectorized in engines:
+        boundaries, elapsed = timed_boundaries(chunker, data, vectorized)
+        sample_boundaries, _ = timed_boundaries(chunker, sample, vectorized)
+        results.append(
+            BenchmarkResult(
+                engine=name,
+                size_bytes=size_bytes,
+                buffers=1,
+                elapsed_s=elapsed,
+                bytes_processed=size_bytes,
+                throughput_bytes_per_s=size_bytes / max(elapsed, 1e-9),
+                chunks=len(boundaries),
+                boundaries_match=sample_boundaries == expected,
+            )
+        )
+    return results
+
+
+def run_parallel_case(chunker: GearhashChunker, size_bytes: int, buffers: int) -> BenchmarkResult:
+    pieces = [generate_buffer(size_bytes, seed=i) for i in range(buffers)]
+    expected = [chunker.chunk_buffer(piece) for piece in pieces]
+    start = time.perf_counter()
+    chunked = chunker.chunk_buffers(pieces)
+    elapsed = time.perf_counter() - start
+    total = size_bytes * buffers
+    return BenchmarkResult(
+        engine=f"parallel-{os.cpu_count() or 1}cpu",
+        size_bytes=size_bytes,
+        buffers=buffers,
+        elapsed_s=elapsed,
+        bytes_processed=total,
+        throughput_bytes_per_s=total / max(elapsed, 1e-9),
+        chunks=sum(len(c) for c in chunked),
+        boundaries_match=chunked == expected,
+    )
+
+
+def ensure_artifacts_dir(output_dir: Path) -> None:
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+
+def write_json(output_dir: Path, benchmark: str, config_name: str, results: List[BenchmarkResult]) -> Path:
+    """Legacy function for backward compatibility."""
+    meta = {
+        "benchmark": benchmark,
+        "config": config_name,
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "platform": {"system": platform.system(), "release": platform.release(), "python": sys.version.split()[0]},
+    }
+    data = {"meta": meta, "results": [asdict(r) for r in results]}
+    filename = f"{benchmark}-{config_name}-{platform.system()}-{platform.release()}.json"
+    path = output_dir / filename
+    with path.open("w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+    return path
+
+
+def derive_config_name(config_file: str | None) -> str:
+    if not config_file:
+        return "default"
+    stem = Path(config_file).stem
+    parts = stem.split("example-config-")
+    if len(parts) == 2 and parts[1]:
+        return parts[1]
+    return stem
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Xet Gearhash chunking benchmark")
+    parser.add_argument("--sizes", nargs="*", default=["1MiB", "4MiB", "16MiB"], help="Buffer sizes")
+    parser.add_argument("--reference-bytes", default="2MiB", help="Prefix checked against the per-byte reference")
+    parser.add_argument("--parallel-buffers", type=int, default=8, help="Buffers chunked concurrently")
+    parser.add_argument("--quick", action="store_true", help="Run minimal quick mode")
+    parser.add_argument("--config-file", default=None, help="Path to client config used (for labeling only)")
+    parser.add_argument(
+        "--output-dir",
+        default="site/reports/benchmarks/artifacts",
+        help="Output directory for artifacts (deprecated, use --record-mode)",
+    )
+    parser.add_argument(
+        "--record-mode",
+        choices=["auto", "pre-commit", "commit", "both", "none"],
+        default="auto",
+        help="Recording mode: auto (detect), pre-commit, commit, both, or none",
+    )
+
+    args = parser.parse_args()
+
+    sizes = [parse_size(s) for s in args.sizes]
+    reference_bytes = parse_size(args.reference_bytes)
+    parallel_buffers = args.parallel_buffers
+    if args.quick:
+        sizes = sizes[:1]
+        reference_bytes = min(reference_bytes, 512 * 1024)
+        parallel_buffers = min(parallel_buffers, 4)
+
+    chunker = GearhashChunker()
+    results: List[BenchmarkResult] = []
+    for size in sizes:
+        results.extend(run_case(chunker, size, reference_bytes))
+    results.append(run_parallel_case(chunker, sizes[-1], parallel_buffers))
+
+    print(" | ".join(("Engine", "Size", "Buffers", "Elapsed (s)", "Throughput", "Chunks", "Match")))
+    print("-" * 80)
+    for r in results:
+        print(" | ".join([r.engine, format_bytes(r.size_bytes), str(r.buffers), f"{r.elapsed_s:.3f}", f"{r.throughput_bytes_per_s / (1024**2):.2f} MiB/s", str(r.chunks), "yes" if r.boundaries_match else "NO"]))
+
+    config_name = derive_config_name(args.config_file)
+
+    # Record benchmark results using new system
+    per_run_path, timeseries_path = record_benchmark_results("xet_chunking", config_name, results, args.record_mode)
+
+    # Backward compatibility: write to old location if --output-dir specified
+    if args.output_dir and args.output_dir != "site/reports/benchmarks/artifacts":
+        output_dir = Path(args.output_dir)
+        ensure_artifacts_dir(output_dir)
+        out_path = write_json(output_dir, "xet_chunking", config_name, results)
+        print(f"\nWrote (legacy): {out_path}")
+
+    # Print recording results
+    if per_run_path:
+        print(f"\nRecorded per-run: {per_run_path}")
+    if timeseries_path:
+        print(f"Updated timeseries: {timeseries_path}")
+    if not per_run_path and not timeseries_path:
+        print("\nNo benchmark recording (mode: none or auto detected none)")
+
+    # Different boundaries would break deduplication against existing chunks
+    return 0 if all(r.boundaries_match for r in results) else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
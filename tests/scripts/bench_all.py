@@ -52,6 +52,20 @@ def main() -> int:
             "--config-file",
             str(examples_cfg),
         ],
+        [
+            sys.executable,
+            str(repo_root / "tests" / "performance" / "bench_xet_chunking.py"),
+            "--quick",
+            "--config-file",
+            str(examples_cfg),
+        ],
+        [
+            sys.executable,
+            str(repo_root / "tests" / "performance" / "bench_swarm.py"),
+            "--quick",
+            "--config-file",
+            str(examples_cfg),
+        ],
     ]
 
     for cmd in commands:
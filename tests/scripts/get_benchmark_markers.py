@@ -41,11 +41,22 @@ BENCHMARK_MAPPINGS = {
     "bench_encryption.py": [
         "ccbt/security/",
     ],
+    "bench_xet_chunking.py": [
+        "ccbt/storage/xet_chunking.py",
+    ],
     "bench_loopback_throughput.py": [
         "ccbt/peer/",
         "ccbt/protocols/",
         "ccbt/utils/network_optimizer.py",
     ],
+    "bench_swarm.py": [
+        "ccbt/session/",
+        "ccbt/peer/",
+        "ccbt/piece/",
+        "ccbt/discovery/tracker_server_http.py",
+        "ccbt/discovery/tracker_server_udp.py",
+        "ccbt/discovery/tracker_udp_client.py",
+    ],
 }
 
 
@@ -81,6 +81,8 @@ def get_all_benchmark_scripts() -> list[str]:
         "bench_piece_assembly.py",
         "bench_encryption.py",
         "bench_loopback_throughput.py",
+        "bench_xet_chunking.py",
+        "bench_swarm.py",
     ]
     # Verify they exist
     existing = []
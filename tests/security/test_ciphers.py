@@ -266,3 +266,32 @@ def test_aes_large_data():
     assert len(encrypted) == len(large_data)
     assert decrypted == large_data
 
+
+def test_rc4_known_vector():
+    """Test RC4 against the classic "Key"/"Plaintext" test vector."""
+    cipher = RC4Cipher(b"Key")
+    assert cipher.encrypt(b"Plaintext") == bytes.fromhex("bbf316e8d940af0ad3")
+
+
+def test_rc4_stream_continues_across_calls():
+    """Test that split encryption matches one-shot encryption of the stream."""
+    key = b"test_key_16bytes"
+    data = bytes(range(256)) * 300
+
+    whole = RC4Cipher(key).encrypt(data)
+    cipher = RC4Cipher(key)
+    split = cipher.encrypt(data[:1000]) + cipher.encrypt(data[1000:])
+    assert split == whole
+
+    # Decrypt keystream is independent of the encrypt keystream
+    assert cipher.decrypt(whole[:5000]) + cipher.decrypt(whole[5000:]) == data
+
+
+def test_rc4_fallback_matches_native():
+    """Test the pure-Python keystream produces the same output as the default."""
+    from ccbt.security.ciphers.rc4 import _KEYSTREAM_CHUNK, _RC4State
+
+    key = b"\x01\x02\x03\x04\x05" * 4  # 20-byte MSE-style key
+    data = b"\xaa" * (_KEYSTREAM_CHUNK + 123)
+
+    assert _RC4State(key).update(data) == RC4Cipher(key).encrypt(data)
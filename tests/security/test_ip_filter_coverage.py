@@ -53,32 +53,28 @@ class TestIPFilterCoverage:
         assert loaded == 2
         assert errors == 0
 
-    @pytest.mark.asyncio
-    async def test_read_compressed_file_unsupported(self, ip_filter, tmp_path):
-        """Test reading unsupported compression format."""
+    def test_parse_file_unknown_extension_as_text(self, ip_filter, tmp_path):
+        """Test a file without a compression suffix or magic is read as text."""
         filter_file = tmp_path / "filter.txt.zip"
         filter_file.write_text("192.168.1.0/24\n")
         
-        with pytest.raises(ValueError, match="Unsupported compression"):
-            async for _line in ip_filter._read_compressed_file(filter_file):
-                pass
+        parsed = ip_filter._parse_file(filter_file)
+        assert parsed.loaded == 1
+        assert parsed.errors == 0
 
-    @pytest.mark.asyncio
-    async def test_parse_and_add_line_value_error(self, ip_filter):
-        """Test _parse_and_add_line with ValueError."""
-        # This will trigger the ValueError exception handler
-        result = await ip_filter._parse_and_add_line(
-            "definitely.not.an.ip.address", None, "test"
-        )
-        assert result is False
+    def test_parse_lines_value_error(self, ip_filter):
+        """Test _parse_lines counts an unparsable line as an error."""
+        parsed = ip_filter._parse_lines(["definitely.not.an.ip.address"])
+        assert parsed.loaded == 0
+        assert parsed.errors == 1
 
-    @pytest.mark.asyncio
-    async def test_parse_and_add_line_with_dash_space(self, ip_filter):
+    def test_parse_lines_with_dash_space(self, ip_filter):
         """Test parsing line with ' - ' format."""
-        result = await ip_filter._parse_and_add_line(
-            "192.168.1.0 - 192.168.1.255 Description", None, "test"
-        )
-        assert result is True
+        parsed = ip_filter._parse_lines(["192.168.1.0 - 192.168.1.255 Description"])
+        assert parsed.loaded == 1
+        assert parsed.errors == 0
+        
+        ip_filter._add_parsed(parsed, None, "test")
         assert len(ip_filter.rules) == 1
 
     @pytest.mark.asyncio
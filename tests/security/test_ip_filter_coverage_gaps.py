@@ -40,14 +40,11 @@ class TestIPFilterCoverageGaps:
         assert result[0] == 0  # loaded
         assert result[1] == 1  # errors (exception path)
 
-    @pytest.mark.asyncio
-    async def test_parse_and_add_line_exception_path(self, ip_filter):
-        """Test exception path in _parse_and_add_line (lines 482-485)."""
+    def test_parse_lines_exception_path(self, ip_filter):
+        """Test exception path in _parse_lines."""
         # This should trigger the ValueError handler
-        result = await ip_filter._parse_and_add_line(
-            "completely.invalid.ip.address", None, "test"
-        )
-        assert result is False
+        parsed = ip_filter._parse_lines(["completely.invalid.ip.address"])
+        assert parsed.errors == 1
 
     @pytest.mark.asyncio
     async def test_update_filter_lists_with_error(self, ip_filter, tmp_path):
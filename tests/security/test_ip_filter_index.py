@@ -0,0 +1,159 @@
+"""Unit tests for the compiled IP filter index and its on-disk cache."""
+
+import gzip
+import ipaddress
+import os
+import random
+from unittest.mock import patch
+
+import pytest
+
+from ccbt.security.ip_filter import FilterMode, IPFilter
+
+
+class TestIPFilterIndex:
+    """Tests for merged range lookup."""
+
+    @pytest.fixture
+    def ip_filter(self):
+        """Create IP filter instance."""
+        return IPFilter(enabled=True, mode=FilterMode.BLOCK)
+
+    def test_overlapping_and_adjacent_ranges_merge(self, ip_filter):
+        """Test overlapping and adjacent networks compile into one range."""
+        ip_filter.add_rule("10.0.0.0/24")
+        ip_filter.add_rule("10.0.1.0/24")  # Adjacent
+        ip_filter.add_rule("10.0.0.128/25")  # Contained
+        ip_filter.add_rule("10.0.5.0/24")
+
+        ip_filter._compile_index()
+
+        assert ip_filter._ipv4_starts == [
+            int(ipaddress.IPv4Address("10.0.0.0")),
+            int(ipaddress.IPv4Address("10.0.5.0")),
+        ]
+        assert ip_filter.is_blocked("10.0.1.255") is True
+        assert ip_filter.is_blocked("10.0.2.0") is False
+        assert ip_filter.is_blocked("10.0.5.1") is True
+        assert ip_filter.is_blocked("9.255.255.255") is False
+
+    def test_unaligned_range_covers_exactly(self, ip_filter):
+        """Test a range off CIDR boundaries blocks the whole range only."""
+        assert ip_filter.add_rule("192.168.0.5-192.168.1.10") is True
+
+        assert ip_filter.is_blocked("192.168.0.4") is False
+        assert ip_filter.is_blocked("192.168.0.5") is True
+        assert ip_filter.is_blocked("192.168.0.200") is True
+        assert ip_filter.is_blocked("192.168.1.10") is True
+        assert ip_filter.is_blocked("192.168.1.11") is False
+
+        # Networks summarize the range exactly
+        networks = ipaddress.summarize_address_range(
+            ipaddress.IPv4Address("192.168.0.5"),
+            ipaddress.IPv4Address("192.168.1.10"),
+        )
+        assert ip_filter.ipv4_ranges == sorted(networks)
+
+    def test_matches_naive_scan(self, ip_filter):
+        """Test bisect lookup agrees with scanning every network."""
+        rng = random.Random(1234)
+        for _ in range(200):
+            start = rng.randrange(0, 1 << 16)
+            ip_filter.add_rule(
+                f"{ipaddress.IPv4Address(start)}-"
+                f"{ipaddress.IPv4Address(start + rng.randrange(0, 512))}"
+            )
+        ip_filter.remove_rule(str(ip_filter.ipv4_ranges[0]))
+        ip_filter.add_rule("0.0.200.0/22")
+
+        networks = ip_filter.ipv4_ranges
+        for _ in range(2000):
+            ip = ipaddress.IPv4Address(rng.randrange(0, 1 << 17))
+            expected = any(ip in network for network in networks)
+            assert ip_filter.is_blocked(str(ip)) is expected
+
+    def test_index_recompiled_after_changes(self, ip_filter):
+        """Test lookups see rules added or removed after the first compile."""
+        ip_filter.add_rule("2001:db8::/32")
+        assert ip_filter.is_blocked("2001:db8::1") is True
+
+        ip_filter.add_rule("172.16.0.0/12")
+        assert ip_filter.is_blocked("172.20.0.1") is True
+
+        assert ip_filter.remove_rule("2001:db8::/32") is True
+        assert ip_filter.is_blocked("2001:db8::1") is False
+        assert ip_filter.get_filter_statistics()["total_rules"] == 1
+
+
+class TestIPFilterIndexCache:
+    """Tests for loading filter lists through the compiled index cache."""
+
+    @pytest.fixture
+    def ip_filter(self):
+        """Create IP filter instance."""
+        return IPFilter(enabled=True, mode=FilterMode.BLOCK)
+
+    @pytest.fixture
+    def filter_file(self, tmp_path):
+        """Create a gzip-compressed PeerGuardian-style filter list."""
+        path = tmp_path / "list.p2p.gz"
+        with gzip.open(path, "wt", encoding="utf-8") as f:
+            f.write("# comment\n")
+            f.write("10.0.0.0 - 10.0.0.255 Some range\n")
+            f.write("172.16.0.0/12\n")
+            f.write("2001:db8::/32\n")
+            f.write("not an ip\n")
+        return path
+
+    @pytest.mark.asyncio
+    async def test_cached_load_skips_parsing(self, ip_filter, filter_file, tmp_path):
+        """Test a second load of an unchanged file reads the compiled index."""
+        cache_dir = tmp_path / "cache"
+
+        first = await ip_filter.load_from_file(str(filter_file), cache_dir=cache_dir)
+        assert first == (4, 1)
+        assert len(list(cache_dir.glob("*.idx"))) == 1
+
+        reloaded = IPFilter(enabled=True, mode=FilterMode.BLOCK)
+        with patch.object(reloaded, "_parse_file") as mock_parse:
+            second = await reloaded.load_from_file(
+                str(filter_file), cache_dir=cache_dir
+            )
+        mock_parse.assert_not_called()
+
+        assert second == first
+        assert reloaded.get_filter_statistics() == ip_filter.get_filter_statistics()
+        assert reloaded.ipv6_ranges == ip_filter.ipv6_ranges
+        assert reloaded.is_blocked("10.0.0.200") is True
+        assert reloaded.is_blocked("2001:db8::5") is True
+        assert reloaded.is_blocked("10.0.1.0") is False
+
+    @pytest.mark.asyncio
+    async def test_stale_cache_is_rebuilt(self, ip_filter, filter_file, tmp_path):
+        """Test a modified file is re-parsed instead of using the old index."""
+        cache_dir = tmp_path / "cache"
+        await ip_filter.load_from_file(str(filter_file), cache_dir=cache_dir)
+
+        with gzip.open(filter_file, "wt", encoding="utf-8") as f:
+            f.write("8.8.8.8\n")
+        stat = filter_file.stat()
+        os.utime(filter_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        reloaded = IPFilter(enabled=True, mode=FilterMode.BLOCK)
+        assert await reloaded.load_from_file(str(filter_file), cache_dir=cache_dir) == (
+            1,
+            0,
+        )
+        assert reloaded.is_blocked("8.8.8.8") is True
+        assert reloaded.is_blocked("10.0.0.1") is False
+
+    @pytest.mark.asyncio
+    async def test_compressed_content_detected_without_extension(
+        self, ip_filter, tmp_path
+    ):
+        """Test compressed lists are detected by magic bytes (cached downloads)."""
+        path = tmp_path / "download.filter"
+        path.write_bytes(gzip.compress(b"192.168.0.0/16\n"))
+
+        assert await ip_filter.load_from_file(str(path)) == (1, 0)
+        assert ip_filter.is_blocked("192.168.10.1") is True
@@ -0,0 +1,184 @@
+"""Unit tests for single-pass parallel torrent hashing."""
+
+from __future__ import annotations
+
+import hashlib
+import io
+import random
+
+import pytest
+
+from ccbt.core.bencode import decode, encode, encode_to
+from ccbt.core.torrent_hasher import TorrentHasher
+from ccbt.core.torrent_v2 import (
+    TorrentV2Parser,
+    _calculate_info_hash_v1,
+    _calculate_info_hash_v2,
+)
+from ccbt.utils.exceptions import TorrentError
+
+pytestmark = [pytest.mark.unit, pytest.mark.core]
+
+PIECE_LENGTH = 16 * 1024
+
+
+def _reference_v1(contents: list[bytes], piece_length: int) -> bytes:
+    """SHA-1 pieces over the concatenated content."""
+    data = b"".join(contents)
+    return b"".join(
+        hashlib.sha1(data[i : i + piece_length]).digest()  # nosec B324
+        for i in range(0, len(data), piece_length)
+    )
+
+
+def _reference_v2(content: bytes, piece_length: int) -> list[bytes]:
+    """BEP 52 piece hashes of a single file, built from 16 KiB blocks."""
+    pieces = []
+    for i in range(0, len(content), piece_length):
+        piece = content[i : i + piece_length]
+        level = [
+            hashlib.sha256(piece[j : j + 16384]).digest()
+            for j in range(0, len(piece), 16384)
+        ]
+        # Pad to a whole piece, or to a power of two for a one-piece file
+        width = max(1, piece_length // 16384)
+        if len(content) <= piece_length:
+            width = 1 << (len(level) - 1).bit_length()
+        level += [bytes(32)] * (width - len(level))
+        while len(level) > 1:
+            level = [
+                hashlib.sha256(level[j] + level[j + 1]).digest()
+                for j in range(0, len(level), 2)
+            ]
+        pieces.append(level[0])
+    return pieces
+
+
+@pytest.fixture
+def files(tmp_path):
+    """Create files with sizes that do not align to pieces or chunks."""
+    rng = random.Random(42)
+    sizes = [PIECE_LENGTH * 3 + 17, 0, 5, PIECE_LENGTH - 1, PIECE_LENGTH * 7 + 123]
+    paths = []
+    contents = []
+    for i, size in enumerate(sizes):
+        content = rng.randbytes(size)
+        path = tmp_path / f"file{i}.bin"
+        path.write_bytes(content)
+        paths.append(path)
+        contents.append(content)
+    return paths, contents
+
+
+class TestTorrentHasher:
+    """Tests for TorrentHasher."""
+
+    @pytest.mark.parametrize("chunk_size", [PIECE_LENGTH, PIECE_LENGTH * 2, 1 << 22])
+    @pytest.mark.parametrize("workers", [1, 4])
+    def test_matches_reference_hashing(self, files, chunk_size, workers):
+        """Test hybrid hashing equals naive v1 and v2 hashing."""
+        paths, contents = files
+        hasher = TorrentHasher(PIECE_LENGTH, workers=workers, chunk_size=chunk_size)
+
+        result = hasher.hash_files(paths)
+
+        assert result.total_length == sum(len(c) for c in contents)
+        assert result.v1_pieces == _reference_v1(contents, PIECE_LENGTH)
+        assert result.v2_pieces == [_reference_v2(c, PIECE_LENGTH) for c in contents]
+
+    def test_v2_pieces_are_block_tree_roots(self, files):
+        """Test v2 hashes of multi-block pieces are padded Merkle roots."""
+        paths, contents = files
+        piece_length = PIECE_LENGTH * 4
+
+        result = TorrentHasher(piece_length, v1=False).hash_files(paths)
+
+        assert result.v2_pieces == [_reference_v2(c, piece_length) for c in contents]
+
+    def test_single_protocol_modes(self, files):
+        """Test v1-only and v2-only hashing produce just their own hashes."""
+        paths, contents = files
+
+        v1_only = TorrentHasher(PIECE_LENGTH, v2=False).hash_files(paths)
+        v2_only = TorrentHasher(PIECE_LENGTH, v1=False).hash_files(paths)
+
+        assert v1_only.v1_pieces == _reference_v1(contents, PIECE_LENGTH)
+        assert v1_only.v2_pieces == []
+        assert v2_only.v1_pieces == b""
+        assert v2_only.v2_pieces == [_reference_v2(c, PIECE_LENGTH) for c in contents]
+
+    def test_progress_reaches_total(self, files):
+        """Test progress is reported monotonically up to the total size."""
+        paths, contents = files
+        updates: list[tuple[int, int]] = []
+        hasher = TorrentHasher(
+            PIECE_LENGTH,
+            chunk_size=PIECE_LENGTH,
+            progress_callback=lambda done, total: updates.append((done, total)),
+        )
+
+        hasher.hash_files(paths)
+
+        total = sum(len(c) for c in contents)
+        assert updates[-1] == (total, total)
+        assert [done for done, _ in updates] == sorted(done for done, _ in updates)
+
+    def test_file_shrinking_while_hashing(self, files, monkeypatch):
+        """Test a short read raises instead of hashing truncated data."""
+        paths, _ = files
+        real_open = open
+
+        def truncating_open(path, mode="r", *args, **kwargs):
+            f = real_open(path, mode, *args, **kwargs)
+            return io.BufferedReader(io.BytesIO(f.read()[:-1])) if "b" in mode else f
+
+        monkeypatch.setattr("builtins.open", truncating_open)
+
+        with pytest.raises(TorrentError, match="File changed while hashing"):
+            TorrentHasher(PIECE_LENGTH).hash_files(paths[:1])
+
+    def test_invalid_piece_length(self):
+        """Test a non-positive piece length is rejected."""
+        with pytest.raises(ValueError, match="Piece length must be positive"):
+            TorrentHasher(0)
+
+
+class TestStreamingTorrentOutput:
+    """Tests for streamed bencoding and torrent file creation."""
+
+    def test_encode_to_matches_encode(self):
+        """Test streaming encoder output equals in-memory encoding."""
+        obj = {
+            b"info": {b"name": b"x", b"pieces": b"\x01" * 40, b"length": 12},
+            b"announce-list": [[b"http://a"], [b"http://b"]],
+            b"z": -3,
+        }
+        stream = io.BytesIO()
+
+        encode_to(obj, stream)
+
+        assert stream.getvalue() == encode(obj)
+
+    @pytest.mark.parametrize("hybrid", [False, True])
+    def test_create_torrent_file(self, tmp_path, files, hybrid):
+        """Test streamed torrent files decode and report matching info hashes."""
+        paths, contents = files
+        output = tmp_path / "out.torrent"
+
+        info_hash_v1, info_hash_v2 = TorrentV2Parser().create_torrent_file(
+            source=paths[0].parent,
+            output=output,
+            hybrid=hybrid,
+            trackers=["http://tracker.example/announce"],
+            piece_length=PIECE_LENGTH,
+        )
+
+        torrent = decode(output.read_bytes())
+        info = torrent[b"info"]
+        assert info_hash_v2 == _calculate_info_hash_v2(info)
+        if hybrid:
+            assert info_hash_v1 == _calculate_info_hash_v1(info)
+            assert info[b"pieces"] == _reference_v1(contents, PIECE_LENGTH)
+        else:
+            assert info_hash_v1 is None
+        assert not output.with_name(output.name + ".part").exists()
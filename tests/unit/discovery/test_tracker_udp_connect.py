@@ -0,0 +1,56 @@
+"""Tests for the UDP tracker connect handshake on the running event loop."""
+
+from __future__ import annotations
+
+import asyncio
+import struct
+
+import pytest
+
+pytestmark = [pytest.mark.unit, pytest.mark.tracker]
+
+from ccbt.discovery.tracker_udp_client import (
+    AsyncUDPTrackerClient,
+    TrackerAction,
+    TrackerSession,
+)
+
+
+class _ConnectResponder(asyncio.DatagramProtocol):
+    """Minimal tracker that answers BEP 15 connect requests."""
+
+    def connection_made(self, transport):
+        self.transport = transport
+
+    def datagram_received(self, data, addr):
+        _, _, transaction_id = struct.unpack("!QII", data[:16])
+        self.transport.sendto(
+            struct.pack("!IIQ", TrackerAction.CONNECT.value, transaction_id, 0xABCDEF),
+            addr,
+        )
+
+
+@pytest.mark.asyncio
+async def test_connect_to_local_tracker():
+    """The connect handshake completes on a non-Windows event loop.
+
+    ``asyncio.ProactorEventLoop`` only exists on Windows, so the loop type
+    check must not be reached elsewhere.
+    """
+    loop = asyncio.get_running_loop()
+    server, _ = await loop.create_datagram_endpoint(
+        _ConnectResponder, local_addr=("127.0.0.1", 0)
+    )
+    port = server.get_extra_info("sockname")[1]
+    client = AsyncUDPTrackerClient()
+    await client.start()
+    try:
+        session = TrackerSession(
+            url=f"udp://127.0.0.1:{port}", host="127.0.0.1", port=port
+        )
+        await client._connect_to_tracker(session)
+        assert session.connection_id == 0xABCDEF
+        assert session.is_connected
+    finally:
+        await client.stop()
+        server.close()
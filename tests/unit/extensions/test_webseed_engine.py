@@ -0,0 +1,347 @@
+"""Tests for the pipelined WebSeed engine against a local HTTP server."""
+
+from __future__ import annotations
+
+import asyncio
+import random
+
+import pytest
+import pytest_asyncio
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+pytestmark = [pytest.mark.unit, pytest.mark.extensions]
+
+from ccbt.extensions.webseed import WebSeedExtension
+from ccbt.extensions.webseed_engine import (
+    MAX_SEED_FAILURES,
+    FileSpan,
+    WebSeedEngine,
+    WebSeedFile,
+    WebSeedLayout,
+    coalesce_pieces,
+)
+from ccbt.models import FileInfo, PieceInfo, TorrentInfo
+
+PIECE_LENGTH = 16 * 1024
+
+
+def _layout(files: list[tuple[tuple[str, ...], int, bool]], multi_file=True):
+    entries = []
+    offset = 0
+    for path, length, is_padding in files:
+        entries.append(WebSeedFile(path, length, offset, is_padding))
+        offset += length
+    return WebSeedLayout("My Torrent", entries, PIECE_LENGTH, multi_file)
+
+
+class SeedServer:
+    """HTTP server serving files with Range support, like a BEP 19 seed."""
+
+    def __init__(self, files: dict[str, bytes], fail: bool = False):
+        self.files = files
+        self.fail = fail
+        self.requests: list[tuple[str, str]] = []
+        self.connections: set[int] = set()
+        self.server: TestServer | None = None
+
+    async def handle(self, request: web.Request) -> web.StreamResponse:
+        self.requests.append((request.path, request.headers.get("Range", "")))
+        self.connections.add(request.transport.get_extra_info("peername")[1])
+        if self.fail:
+            return web.Response(status=503)
+        data = self.files.get(request.path)
+        if data is None:
+            return web.Response(status=404)
+        rng = request.http_range
+        start, stop = rng.start or 0, rng.stop or len(data)
+        return web.Response(
+            status=206,
+            body=data[start:stop],
+            headers={"Content-Range": f"bytes {start}-{stop - 1}/{len(data)}"},
+        )
+
+    async def start(self) -> str:
+        app = web.Application()
+        app.router.add_get("/{tail:.*}", self.handle)
+        self.server = TestServer(app)
+        await self.server.start_server()
+        return str(self.server.make_url("/seed/"))
+
+    async def close(self) -> None:
+        if self.server is not None:
+            await self.server.close()
+
+
+@pytest.fixture
+def torrent():
+    """Multi-file torrent content with a padding file."""
+    rng = random.Random(7)
+    a = rng.randbytes(PIECE_LENGTH * 2 + 100)
+    b = rng.randbytes(PIECE_LENGTH * 3 - 100 - 50)
+    c = rng.randbytes(PIECE_LENGTH + 999)
+    layout = _layout(
+        [
+            (("a.bin",), len(a), False),
+            (("sub dir", "b.bin"), len(b), False),
+            ((".pad", "50"), 50, True),
+            (("c.bin",), len(c), False),
+        ]
+    )
+    content = a + b + bytes(50) + c
+    files = {
+        "/seed/My%20Torrent/a.bin": a,
+        "/seed/My%20Torrent/sub%20dir/b.bin": b,
+        "/seed/My%20Torrent/c.bin": c,
+    }
+    return layout, content, {k.replace("%20", " "): v for k, v in files.items()}
+
+
+@pytest_asyncio.fixture
+async def seed(torrent):
+    """Running seed server."""
+    server = SeedServer(torrent[2])
+    url = await server.start()
+    yield server, url
+    await server.close()
+
+
+class TestWebSeedLayout:
+    """Test BEP 19 file mapping."""
+
+    def test_file_urls(self, torrent):
+        """Test multi-file URLs append the torrent name and quoted path."""
+        layout = torrent[0]
+
+        assert layout.file_url("http://h/seed", 1) == (
+            "http://h/seed/My%20Torrent/sub%20dir/b.bin"
+        )
+        assert (
+            layout.file_url("http://h/seed/", 0) == "http://h/seed/My%20Torrent/a.bin"
+        )
+
+    def test_single_file_urls(self):
+        """Test a single-file URL is used as is unless it names a directory."""
+        layout = _layout([(("f",), 10, False)], multi_file=False)
+
+        assert layout.file_url("http://h/file.iso", 0) == "http://h/file.iso"
+        assert layout.file_url("http://h/pub/", 0) == "http://h/pub/My%20Torrent"
+
+    def test_map_range_across_files(self, torrent):
+        """Test a range is split at file boundaries and skips padding."""
+        layout = torrent[0]
+        start, _ = layout.piece_range(4)
+
+        assert layout.map_range(start, 2 * PIECE_LENGTH) == [
+            FileSpan(1, 2 * PIECE_LENGTH - 100, PIECE_LENGTH - 50, 0),
+            FileSpan(3, 0, PIECE_LENGTH, PIECE_LENGTH),
+        ]
+
+    def test_last_piece_length(self, torrent):
+        """Test the last piece is shorter than the piece length."""
+        layout, content, _ = torrent
+
+        assert layout.num_pieces == 7
+        assert layout.piece_range(6) == (PIECE_LENGTH * 6, 999)
+        assert len(content) == PIECE_LENGTH * 6 + 999
+        with pytest.raises(IndexError):
+            layout.piece_range(7)
+
+    def test_coalesce_pieces(self):
+        """Test adjacent pieces are grouped up to the request size."""
+        runs = coalesce_pieces([7, 1, 2, 3, 4, 9, 8], PIECE_LENGTH, PIECE_LENGTH * 3)
+
+        assert runs == [(1, 3), (4, 1), (7, 3)]
+
+
+class TestWebSeedEngine:
+    """Test downloading from local seed servers."""
+
+    @pytest.mark.asyncio
+    async def test_download_all_pieces(self, torrent, seed):
+        """Test pieces match the content and requests are coalesced."""
+        layout, content, _ = torrent
+        server, url = seed
+        received = {}
+
+        async with WebSeedEngine(layout, [url], max_concurrency=4) as engine:
+            failed = await engine.download(
+                range(layout.num_pieces), received.__setitem__
+            )
+
+        assert failed == []
+        for index, data in received.items():
+            start, length = layout.piece_range(index)
+            assert data == content[start : start + length]
+        assert sorted(received) == list(range(layout.num_pieces))
+        # One request per file, the padding file is never requested
+        assert len(server.requests) == 3
+        assert not any(".pad" in path for path, _ in server.requests)
+        assert engine.hosts[url].requests == 1
+
+    @pytest.mark.asyncio
+    async def test_pipelined_requests_reuse_connections(self, torrent, seed):
+        """Test several requests are in flight over a few kept-alive connections."""
+        layout, _, _ = torrent
+        server, url = seed
+        received = {}
+
+        async with WebSeedEngine(
+            layout, [url], max_request_size=PIECE_LENGTH, max_concurrency=2
+        ) as engine:
+            await engine.download(range(layout.num_pieces), received.__setitem__)
+            await engine.download(range(layout.num_pieces), received.__setitem__)
+
+        assert len(received) == layout.num_pieces
+        assert len(server.requests) >= 2 * layout.num_pieces
+        assert len(server.connections) <= 2
+
+    @pytest.mark.asyncio
+    async def test_failover_to_other_seed(self, torrent, seed):
+        """Test runs failing on one seed are fetched from another."""
+        layout, content, files = torrent
+        _, good_url = seed
+        bad = SeedServer(files, fail=True)
+        bad_url = await bad.start()
+        received = {}
+        try:
+            async with WebSeedEngine(
+                layout, [bad_url, good_url], max_request_size=PIECE_LENGTH
+            ) as engine:
+                failed = await engine.download(
+                    range(layout.num_pieces), received.__setitem__
+                )
+        finally:
+            await bad.close()
+
+        assert failed == []
+        assert b"".join(received[i] for i in range(layout.num_pieces)) == content
+        assert engine.hosts[bad_url].limit == 1
+        assert engine.hosts[bad_url].bytes_downloaded == 0
+
+    @pytest.mark.asyncio
+    async def test_all_seeds_failing(self, torrent):
+        """Test pieces are reported failed when no seed can serve them."""
+        layout, _, files = torrent
+        bad = SeedServer(files, fail=True)
+        url = await bad.start()
+        try:
+            async with WebSeedEngine(layout, [url]) as engine:
+                failed = await engine.download([0, 1, 6], lambda *_: None)
+        finally:
+            await bad.close()
+
+        assert failed == [0, 1, 6]
+
+    @pytest.mark.asyncio
+    async def test_run_retried_when_other_seed_becomes_unusable(self, torrent):
+        """Test a run left for a seed that stops being usable is retried."""
+        layout, _, _ = torrent
+        engine = WebSeedEngine(
+            layout,
+            ["http://a/", "http://b/"],
+            max_request_size=PIECE_LENGTH,
+            max_concurrency=1,
+        )
+        engine.hosts["http://b/"].failures = MAX_SEED_FAILURES - 1
+        a_failed = asyncio.Event()
+        received = {}
+
+        async def fetch_run(host, run, on_piece):
+            await asyncio.sleep(0)
+            if host.url == "http://b/":
+                await a_failed.wait()
+                host.record_failure()
+                return False
+            if run.first_piece == 0 and not a_failed.is_set():
+                a_failed.set()
+                host.record_failure()
+                return False
+            on_piece(run.first_piece, b"")
+            return True
+
+        engine._fetch_run = fetch_run
+        async with engine:
+            failed = await asyncio.wait_for(
+                engine.download(range(4), received.__setitem__), timeout=2.0
+            )
+
+        assert failed == []
+        assert sorted(received) == [0, 1, 2, 3]
+
+
+class TestWebSeedExtensionLayout:
+    """Test WebSeedExtension with a BEP 19 layout."""
+
+    @pytest.mark.asyncio
+    async def test_download_last_piece(self, torrent, seed):
+        """Test the last piece is read from its own file offset."""
+        layout, content, _ = torrent
+        _, url = seed
+        extension = WebSeedExtension()
+        extension.set_layout(layout)
+        webseed_id = extension.add_webseed(url)
+        start, length = layout.piece_range(6)
+        try:
+            data = await extension.download_piece(
+                webseed_id, PieceInfo(index=6, length=length, hash=b"x" * 20), b""
+            )
+        finally:
+            await extension.stop()
+
+        assert data == content[start:]
+        assert extension.webseeds[webseed_id].bytes_downloaded == length
+
+    @pytest.mark.asyncio
+    async def test_download_pieces(self, torrent, seed):
+        """Test download_pieces uses all active seeds."""
+        layout, content, _ = torrent
+        _, url = seed
+        extension = WebSeedExtension()
+        extension.set_layout(layout)
+        extension.add_webseed(url)
+        received = {}
+        try:
+            failed = await extension.download_pieces([2, 3], received.__setitem__)
+        finally:
+            await extension.stop()
+
+        assert failed == []
+        assert received[2] + received[3] == content[2 * PIECE_LENGTH : 4 * PIECE_LENGTH]
+        assert extension.webseeds[url].bytes_downloaded == 2 * PIECE_LENGTH
+
+    @pytest.mark.asyncio
+    async def test_add_webseed_builds_layout(self, torrent, seed):
+        """Test registering a seed with torrent info maps pieces onto files."""
+        layout, content, _ = torrent
+        _, url = seed
+        torrent_info = TorrentInfo(
+            name="My Torrent",
+            info_hash=b"\x00" * 20,
+            announce="http://tracker.example/announce",
+            files=[
+                FileInfo(
+                    name=f.path[-1],
+                    length=f.length,
+                    path=list(f.path),
+                    attributes="p" if f.is_padding else None,
+                )
+                for f in layout.files
+            ],
+            total_length=layout.total_length,
+            piece_length=PIECE_LENGTH,
+            pieces=[b"x" * 20] * layout.num_pieces,
+            num_pieces=layout.num_pieces,
+        )
+        extension = WebSeedExtension()
+        webseed_id = extension.add_webseed(url, torrent_info=torrent_info)
+        start, length = layout.piece_range(3)
+        try:
+            data = await extension.download_piece(
+                webseed_id, PieceInfo(index=3, length=length, hash=b"x" * 20), b""
+            )
+        finally:
+            await extension.stop()
+
+        assert extension.layout is not None
+        assert data == content[start : start + length]
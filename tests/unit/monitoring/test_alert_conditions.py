@@ -0,0 +1,111 @@
+"""Tests for compiled alert conditions and per-metric rule lookup."""
+
+from __future__ import annotations
+
+import ast
+import json
+from unittest.mock import patch
+
+import pytest
+
+pytestmark = [pytest.mark.unit, pytest.mark.monitoring]
+
+from ccbt.monitoring.alert_conditions import (
+    compile_condition,
+    evaluate_condition,
+    get_condition,
+)
+from ccbt.monitoring.alert_manager import AlertManager, AlertRule, AlertSeverity
+
+
+class TestCompiledConditions:
+    """Test conditions compile once and take the value as an argument."""
+
+    def test_compiled_condition_takes_value(self):
+        """Test the compiled function evaluates for any value."""
+        condition = compile_condition("value * 8 / 1024 < 50")
+
+        assert condition(1024) is True
+        assert condition(1024 * 1024) is False
+        assert compile_condition("0 < value <= 10")(10) is True
+        assert compile_condition("0 < value <= 10")(0) is False
+
+    def test_value_is_not_spliced_into_source(self):
+        """Test values whose text is not a number are compared as values."""
+        assert evaluate_condition("value == 'ok'", "ok") is True
+        assert evaluate_condition("value > 10", "42.5") is True
+        assert evaluate_condition("value > 10", "__import__('os')") is False
+
+    def test_unsafe_conditions_never_match(self):
+        """Test disallowed syntax fails to compile and never matches."""
+        for condition in ("value.__class__", "value & 1 == 1", "x > 1", "value >"):
+            with pytest.raises((SyntaxError, ValueError)):
+                compile_condition(condition)
+            assert evaluate_condition(condition, 3) is False
+
+    def test_each_condition_is_parsed_once(self):
+        """Test repeated evaluation reuses the compiled condition."""
+        get_condition.cache_clear()
+        with patch(
+            "ccbt.monitoring.alert_conditions.ast.parse", wraps=ast.parse
+        ) as parse:
+            for value in range(100):
+                evaluate_condition("value > 50", value)
+
+        assert parse.call_count == 1
+
+
+class TestAlertRuleIndex:
+    """Test samples only evaluate the rules of their metric."""
+
+    @pytest.mark.asyncio
+    async def test_sample_touches_only_its_rules(self, tmp_path):
+        """Test loading many rules does not evaluate them for other metrics."""
+        rules = [
+            {
+                "name": f"rule_{i}",
+                "metric_name": f"metric_{i}",
+                "condition": f"value > {i}",
+                "severity": "warning",
+            }
+            for i in range(300)
+        ]
+        path = tmp_path / "rules.json"
+        path.write_text(json.dumps({"rules": rules}), encoding="utf-8")
+        manager = AlertManager()
+        assert manager.load_rules_from_file(path) == 300
+
+        with patch(
+            "ccbt.monitoring.alert_manager.evaluate_condition",
+            wraps=evaluate_condition,
+        ) as evaluate:
+            await manager.process_alert("metric_7", 8)
+            await manager.process_alert("unknown", 8)
+
+        assert evaluate.call_count == 1
+        assert manager.stats["alerts_triggered"] == 1
+
+    @pytest.mark.asyncio
+    async def test_index_follows_rule_changes(self):
+        """Test added, updated and removed rules are picked up."""
+        manager = AlertManager()
+        manager.add_alert_rule(
+            AlertRule(
+                name="cpu",
+                metric_name="cpu",
+                condition="value > 90",
+                severity=AlertSeverity.WARNING,
+                description="",
+                cooldown_seconds=0,
+            )
+        )
+        await manager.process_alert("cpu", 50, 1.0)
+        assert manager.stats["alerts_triggered"] == 0
+
+        manager.update_alert_rule("cpu", {"condition": "value > 40"})
+        await manager.process_alert("cpu", 50, 2.0)
+        assert manager.stats["alerts_triggered"] == 1
+
+        manager.remove_alert_rule("cpu")
+        await manager.process_alert("cpu", 50, 3.0)
+        assert manager.stats["alerts_triggered"] == 1
@@ -396,6 +396,7 @@ class TestGetMetricsCollector:
             # Record a value that should trigger the alert
             initial_alerts = collector.stats["alerts_triggered"]
             collector.record_metric("test_metric", 20.0)
+            asyncio.run(collector.evaluate_alerts())
             
             # Verify alert was triggered (stats should be incremented)
             assert collector.stats["alerts_triggered"] > initial_alerts
@@ -407,6 +408,7 @@ class TestGetMetricsCollector:
             # Record another value - should NOT trigger alert (within cooldown)
             alerts_before = collector.stats["alerts_triggered"]
             collector.record_metric("test_metric", 25.0)
+            asyncio.run(collector.evaluate_alerts())
             
             # Alert count should not increase (cooldown active)
             assert collector.stats["alerts_triggered"] == alerts_before
@@ -0,0 +1,112 @@
+"""Tests for pre-registered metric series and current-value exposition."""
+
+from __future__ import annotations
+
+import threading
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+pytestmark = [pytest.mark.unit, pytest.mark.monitoring]
+
+from ccbt.monitoring.metrics_collector import MetricLabel, MetricsCollector
+from ccbt.monitoring.metrics_registry import MetricsRegistry
+
+
+class TestMetricsRegistry:
+    """Test counter, gauge and histogram families."""
+
+    def test_bound_labels_return_same_series(self):
+        """Test a label set is bound to one series, by position or by name."""
+        registry = MetricsRegistry()
+        blocks = registry.counter("blocks", "Blocks", ["kind", "peer"])
+
+        handle = blocks.labels("data", "p1")
+        handle.inc()
+        blocks.labels(kind="data", peer="p1").inc(2)
+
+        assert handle is blocks.labels(peer="p1", kind="data")
+        assert handle.value == 3
+        with pytest.raises(ValueError, match="expects labels"):
+            blocks.labels("data")
+        with pytest.raises(ValueError, match="already registered"):
+            registry.gauge("blocks", "Blocks", ["kind", "peer"])
+        assert registry.counter("blocks", "Blocks", ["kind", "peer"]) is blocks
+
+    def test_counter_adds_are_atomic(self):
+        """Test concurrent increments from threads are not lost."""
+        counter = MetricsRegistry().counter("bytes", "Bytes")
+
+        def work():
+            for _ in range(10_000):
+                counter.inc()
+
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert counter.labels().value == 40_000
+        with pytest.raises(ValueError, match="only increase"):
+            counter.inc(-1)
+
+    def test_render_current_values(self):
+        """Test exposition has one line per series and cumulative buckets."""
+        registry = MetricsRegistry()
+        registry.gauge("peers", "Peers", ["torrent"]).labels('a"b').set(3)
+        latency = registry.histogram("latency", "Latency", buckets=[0.1, 1.0])
+        for value in (0.05, 0.1, 0.5, 7.0):
+            latency.observe(value)
+
+        lines = registry.render().splitlines()
+
+        assert "# TYPE peers gauge" in lines
+        assert 'peers{torrent="a\\"b"} 3' in lines
+        assert 'latency_bucket{le="0.1"} 2' in lines
+        assert 'latency_bucket{le="1.0"} 3' in lines
+        assert 'latency_bucket{le="+Inf"} 4' in lines
+        assert "latency_sum 7.65" in lines
+        assert "latency_count 4" in lines
+
+
+class TestMetricsCollectorRegistry:
+    """Test MetricsCollector exports current values and samples alerts."""
+
+    def test_prometheus_export_has_latest_value_only(self):
+        """Test repeated samples export the latest value, without timestamps."""
+        collector = MetricsCollector()
+        labels = [MetricLabel(name="peer", value="p1")]
+        for value in (1.0, 2.0, 3.0):
+            collector.record_metric("rate", value, labels)
+        collector.registry.counter("blocks_total", "Blocks").inc(5)
+
+        lines = collector._export_prometheus_format().splitlines()
+
+        assert [line for line in lines if line.startswith("rate")] == [
+            'rate{peer="p1"} 3.0'
+        ]
+        assert "blocks_total 5" in lines
+
+    @pytest.mark.asyncio
+    async def test_alerts_evaluated_on_sampling(self):
+        """Test recording does not evaluate alerts until the next sample."""
+        collector = MetricsCollector()
+        collector.add_alert_rule("busy", "queue_depth", "value > 10")
+        queue_depth = collector.registry.gauge("queue_depth", "Queue depth")
+
+        with patch("ccbt.monitoring.get_alert_manager") as mock_get_am:
+            mock_am = MagicMock()
+            mock_am.process_alert = AsyncMock()
+            mock_get_am.return_value = mock_am
+            for value in range(20):
+                collector.record_metric("other", value)
+                queue_depth.set(value)
+            assert collector.stats["alerts_triggered"] == 0
+            assert not mock_am.process_alert.called
+
+            await collector.evaluate_alerts()
+
+        assert collector.stats["alerts_triggered"] == 1
+        samples = {c.args[0]: c.args[1] for c in mock_am.process_alert.call_args_list}
+        assert samples == {"other": 19, "queue_depth": 19}
@@ -0,0 +1,190 @@
+"""Tests for root sampling, span IDs and batched span export."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+pytestmark = [pytest.mark.unit, pytest.mark.monitoring]
+
+from ccbt import monitoring
+from ccbt.monitoring.tracing import (
+    SpanExporter,
+    SpanKind,
+    SpanStatus,
+    TraceContext,
+    TracingManager,
+)
+
+
+@pytest.fixture
+def tracing_manager():
+    """Tracing manager sampling every trace, in a fresh context."""
+    manager = TracingManager()
+    manager.trace_context.set(None)
+    return manager
+
+
+class TestRootSampling:
+    """Test the sampling decision is made once per trace."""
+
+    def test_unsampled_trace_records_nothing(self, tracing_manager):
+        """Test nested spans of an unsampled root are no-ops."""
+        tracing_manager.set_sampling_rate(0.0)
+
+        with TraceContext(tracing_manager, "root") as root:
+            with TraceContext(tracing_manager, "child") as child:
+                child.add_attribute("key", "value")
+                assert tracing_manager.start_span("direct") is None
+
+        assert root.span_id is None
+        assert child.span_id is None
+        assert tracing_manager.active_spans == {}
+        assert tracing_manager.stats["spans_created"] == 0
+        assert tracing_manager.stats["sampling_decisions"] == 1
+
+    def test_children_follow_root_decision(self, tracing_manager):
+        """Test child spans join the sampled trace without sampling again."""
+        with TraceContext(tracing_manager, "root") as root:
+            tracing_manager.set_sampling_rate(0.0)
+            with TraceContext(tracing_manager, "child") as child:
+                pass
+            # The enclosing span is current again after the child exits
+            assert tracing_manager._get_current_span_id() == root.span_id
+
+        trace = tracing_manager.completed_spans[-1].trace_id
+        spans = tracing_manager.get_trace_spans(trace)
+        assert [span.name for span in spans] == ["child", "root"]
+        assert spans[0].parent_span_id == root.span_id
+        assert child.span_id is not None
+        assert tracing_manager.stats["sampling_decisions"] == 1
+        assert tracing_manager.stats["traces_completed"] == 1
+
+    def test_ids(self, tracing_manager):
+        """Test span IDs are 64-bit integers and trace IDs 32 hex digits."""
+        span_id = tracing_manager.start_span("op")
+        span = tracing_manager.end_span(span_id)
+
+        assert isinstance(span_id, int)
+        assert 0 < span_id < 2**64
+        assert len(span.trace_id) == 32
+        int(span.trace_id, 16)
+
+    def test_global_manager_unsampled_until_configured(self, monkeypatch):
+        """Test the global manager records nothing before init_tracing."""
+        monkeypatch.setattr(monitoring, "_GLOBAL_TRACING_MANAGER", None)
+        manager = monitoring.get_tracing_manager()
+        manager.trace_context.set(None)
+
+        with TraceContext(manager, "root") as root:
+            pass
+
+        assert manager.sampling_rate == 0.0
+        assert root.span_id is None
+        assert manager.stats["spans_created"] == 0
+
+    def test_traces_capped(self, tracing_manager):
+        """Test the oldest traces are dropped beyond max_traces."""
+        tracing_manager.max_traces = 3
+        trace_ids = []
+        for _ in range(5):
+            span = tracing_manager.end_span(tracing_manager.start_span("root"))
+            tracing_manager.trace_context.set(None)
+            trace_ids.append(span.trace_id)
+
+        assert list(tracing_manager.traces) == trace_ids[2:]
+        assert tracing_manager.stats["traces_created"] == 5
+
+
+class TestSpanExport:
+    """Test finished spans are buffered and exported in batches."""
+
+    @pytest.mark.asyncio
+    async def test_json_batches(self, tracing_manager, tmp_path):
+        """Test spans are written as JSON lines in batches."""
+        path = tmp_path / "traces.jsonl"
+        exporter = SpanExporter(path)
+        writes = []
+        export = exporter.export
+        exporter.export = lambda spans: (writes.append(len(spans)), export(spans))
+        await tracing_manager.start_exporter(exporter, interval=60, batch_size=2)
+
+        with TraceContext(tracing_manager, "root", attributes={"piece": 3}):
+            for _ in range(4):
+                with TraceContext(tracing_manager, "block"):
+                    pass
+        await tracing_manager.stop_exporter()
+
+        lines = [json.loads(line) for line in path.read_text().splitlines()]
+        assert writes == [2, 2, 1]
+        assert [line["name"] for line in lines] == ["block"] * 4 + ["root"]
+        assert lines[-1]["attributes"] == {"piece": 3}
+        assert len(lines[0]["span_id"]) == 16
+        assert lines[0]["parent_span_id"] == lines[-1]["span_id"]
+        assert tracing_manager.stats["spans_exported"] == 5
+        assert tracing_manager.exporter is None
+
+    @pytest.mark.asyncio
+    async def test_otlp_request(self, tracing_manager, tmp_path):
+        """Test OTLP output is one ExportTraceServiceRequest per batch."""
+        path = tmp_path / "traces.otlp.jsonl"
+        await tracing_manager.start_exporter(
+            SpanExporter(path, "otlp", service_name="test"), interval=60
+        )
+
+        parent = tracing_manager.start_span("request", SpanKind.CLIENT)
+        child = tracing_manager.start_span(
+            "flush", parent_span_id=parent, attributes={"ok": True, "bytes": 16384}
+        )
+        tracing_manager.end_span(child, SpanStatus.ERROR)
+        tracing_manager.end_span(parent)
+        await tracing_manager.stop_exporter()
+
+        (line,) = path.read_text().splitlines()
+        resource_spans = json.loads(line)["resourceSpans"][0]
+        assert resource_spans["resource"]["attributes"] == [
+            {"key": "service.name", "value": {"stringValue": "test"}}
+        ]
+        flush, request = resource_spans["scopeSpans"][0]["spans"]
+        assert flush["parentSpanId"] == request["spanId"]
+        assert flush["traceId"] == request["traceId"]
+        assert flush["attributes"] == [
+            {"key": "ok", "value": {"boolValue": True}},
+            {"key": "bytes", "value": {"intValue": "16384"}},
+        ]
+        assert flush["status"]["code"] == 2
+        assert request["status"] == {"code": 1}
+        assert request["kind"] == 3
+        assert "parentSpanId" not in request
+        assert int(request["endTimeUnixNano"]) >= int(request["startTimeUnixNano"])
+
+    @pytest.mark.asyncio
+    async def test_full_ring_drops_oldest(self, tracing_manager, tmp_path):
+        """Test a full buffer drops the oldest spans and counts them."""
+        await tracing_manager.start_exporter(
+            SpanExporter(tmp_path / "t.jsonl"), interval=60
+        )
+        tracing_manager.export_buffer = type(tracing_manager.export_buffer)(maxlen=3)
+
+        for i in range(5):
+            tracing_manager.end_span(tracing_manager.start_span(f"span_{i}"))
+
+        assert [span.name for span in tracing_manager.export_buffer] == [
+            "span_2",
+            "span_3",
+            "span_4",
+        ]
+        assert tracing_manager.stats["spans_dropped"] == 2
+        await tracing_manager.stop_exporter()
+
+    def test_no_buffering_without_exporter(self, tracing_manager):
+        """Test spans are not queued for export when no exporter is attached."""
+        tracing_manager.end_span(tracing_manager.start_span("op"))
+
+        assert len(tracing_manager.export_buffer) == 0
+
+    def test_unsupported_format(self, tmp_path):
+        """Test unknown export formats are rejected."""
+        with pytest.raises(ValueError, match="Unsupported format"):
+            SpanExporter(tmp_path / "t", "zipkin")
@@ -499,6 +499,32 @@ class TestV2ProtocolHandling:
 
         assert callback_called
 
+    @pytest.mark.asyncio
+    async def test_handle_piece_layer_response_checks_root(self, async_peer_manager):
+        """Test a layer that does not hash to its known pieces_root is discarded."""
+        from ccbt.piece.hash_v2 import hash_piece_layer
+
+        connection = AsyncPeerConnection(
+            PeerInfo(ip="127.0.0.1", port=6881),
+            async_peer_manager.torrent_data,
+        )
+        piece_hashes = [bytes([i]) * 32 for i in range(3)]
+        pieces_root = hash_piece_layer(piece_hashes)
+        async_peer_manager.torrent_data["piece_layers"] = {pieces_root: piece_hashes}
+        received = []
+        async_peer_manager.on_piece_layer_received = lambda conn, msg: received.append(
+            msg
+        )
+
+        forged = PieceLayerResponse(pieces_root, piece_hashes[::-1])
+        await async_peer_manager._handle_piece_layer_response(connection, forged)
+        valid = PieceLayerResponse(pieces_root, piece_hashes)
+        await async_peer_manager._handle_piece_layer_response(connection, valid)
+        await async_peer_manager._handle_piece_layer_response(connection, valid)
+
+        assert received == [valid, valid]
+        assert pieces_root in async_peer_manager._piece_layer_trees
+
     @pytest.mark.asyncio
     async def test_handle_file_tree_request(self, async_peer_manager):
         """Test handling file tree request (lines 918-940)."""
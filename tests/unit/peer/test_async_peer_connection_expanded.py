@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
+import sys
 import time
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -12,6 +13,7 @@ import pytest_asyncio
 
 pytestmark = [pytest.mark.unit, pytest.mark.peer]
 
+from ccbt.models import MessageType
 from ccbt.peer.async_peer_connection import (
     AsyncPeerConnection,
     AsyncPeerConnectionManager,
@@ -88,11 +90,10 @@ async def async_peer_manager(mock_torrent_data, mock_piece_manager):
                 except Exception:
                     pass
         
-        # Cancel background tasks
-        if manager._choking_task and not manager._choking_task.done():
-            manager._choking_task.cancel()
-        if manager._stats_task and not manager._stats_task.done():
-            manager._stats_task.cancel()
+        # Cancel periodic jobs
+        for job in (manager._choking_job, manager._stats_job, manager._keepalive_job):
+            if job is not None:
+                job.cancel()
         
         # Wait with timeout for cancellation
         try:
@@ -107,9 +108,9 @@ async def async_peer_manager(mock_torrent_data, mock_piece_manager):
         try:
             await asyncio.wait_for(manager.stop(), timeout=0.1)
         except (asyncio.TimeoutError, Exception):
-            # If stop hangs, just clear tasks
-            manager._choking_task = None
-            manager._stats_task = None
+            # If stop hangs, just clear jobs
+            manager._choking_job = None
+            manager._stats_job = None
     except Exception:
         pass
 
@@ -234,17 +235,19 @@ class TestAsyncPeerConnectionManagerBasics:
     @pytest.mark.asyncio
     async def test_manager_start_stop(self, async_peer_manager):
         """Test manager start and stop."""
-        # Start background tasks
+        # Start periodic jobs
         await async_peer_manager.start()
-        assert async_peer_manager._choking_task is not None
-        assert async_peer_manager._stats_task is not None
+        choking_job = async_peer_manager._choking_job
+        stats_job = async_peer_manager._stats_job
+        assert choking_job is not None
+        assert stats_job is not None
         
         await async_peer_manager.stop()
         
-        # Tasks should be cancelled or done
-        await asyncio.sleep(0.01)  # Give time for cancellation
-        assert async_peer_manager._choking_task.done()
-        assert async_peer_manager._stats_task.done()
+        # Jobs should be cancelled and released
+        assert choking_job.cancelled
+        assert stats_job.cancelled
+        assert async_peer_manager._choking_job is None
 
     @pytest.mark.asyncio
     async def test_connect_to_peers_success(self, async_peer_manager, peer_info):
@@ -561,6 +564,28 @@ class TestAsyncPeerConnectionManagerMessageHandling:
 
         assert (0, 0, 16384) not in connection.outstanding_requests
 
+    @pytest.mark.asyncio
+    async def test_handle_message_dispatches_request_and_cancel(
+        self, async_peer_manager
+    ):
+        """Test REQUEST and CANCEL reach their registered handlers."""
+        connection = AsyncPeerConnection(
+            PeerInfo(ip="127.0.0.1", port=6881),
+            async_peer_manager.torrent_data,
+        )
+        request_handler = AsyncMock()
+        cancel_handler = AsyncMock()
+        async_peer_manager.message_handlers[MessageType.REQUEST] = request_handler
+        async_peer_manager.message_handlers[MessageType.CANCEL] = cancel_handler
+        request = RequestMessage(0, 0, 16384)
+        cancel = CancelMessage(0, 0, 16384)
+
+        await async_peer_manager._handle_message(connection, request)
+        await async_peer_manager._handle_message(connection, cancel)
+
+        request_handler.assert_awaited_once_with(connection, request)
+        cancel_handler.assert_awaited_once_with(connection, cancel)
+
 
 class TestAsyncPeerConnectionManagerConnectionLifecycle:
     """Test connection lifecycle management."""
@@ -594,6 +619,31 @@ class TestAsyncPeerConnectionManagerConnectionLifecycle:
         assert callback_called
         assert connection.state == ConnectionState.ERROR
 
+    @pytest.mark.asyncio
+    @pytest.mark.skipif(
+        sys.version_info < (3, 11), reason="Task.cancelling() needs Python 3.11"
+    )
+    async def test_disconnect_peer_from_own_message_loop(self, async_peer_manager):
+        """Test the message loop task disconnecting its own peer stays uncancelled."""
+        connection = AsyncPeerConnection(
+            PeerInfo(ip="127.0.0.1", port=6881),
+            async_peer_manager.torrent_data,
+        )
+        connection.writer = AsyncMock()
+        connection.writer.close = MagicMock()
+        connection.writer.wait_closed = AsyncMock()
+        async_peer_manager.connections[str(connection.peer_info)] = connection
+
+        async def message_loop():
+            await async_peer_manager._disconnect_peer(connection)
+
+        connection.connection_task = asyncio.create_task(message_loop())
+        await asyncio.wait_for(connection.connection_task, timeout=1.0)
+
+        assert connection.connection_task.cancelling() == 0
+        connection.writer.close.assert_called_once()
+        assert str(connection.peer_info) not in async_peer_manager.connections
+
     @pytest.mark.asyncio
     async def test_handle_peer_messages_keepalive(self, async_peer_manager):
         """Test handling keepalive messages."""
@@ -800,3 +850,82 @@ class TestAsyncPeerConnectionManagerChoking:
         await async_peer_manager._unchoke_peer(connection)
 
         assert connection.am_choking is False
+
+    @pytest.mark.asyncio
+    async def test_update_choking_runs_optimistic_unchoke(self, async_peer_manager):
+        """Test choking update reaches optimistic unchoke without deadlocking."""
+        uploader = MagicMock()
+        uploader.is_active.return_value = True
+        uploader.stats.upload_rate = 100.0
+        candidate = MagicMock()
+        candidate.is_active.return_value = True
+        candidate.stats.upload_rate = 0.0
+        candidate.peer_interested = True
+        async_peer_manager.connections = {"a": uploader, "b": candidate}
+        async_peer_manager.config.network.max_upload_slots = 1
+        async_peer_manager._choke_peer = AsyncMock()
+        async_peer_manager._unchoke_peer = AsyncMock()
+
+        await asyncio.wait_for(async_peer_manager._update_choking(), timeout=1.0)
+
+        assert async_peer_manager.upload_slots == [uploader]
+        assert async_peer_manager.optimistic_unchoke is candidate
+        assert not async_peer_manager.connection_lock.locked()
+
+
+class TestAsyncPeerConnectionManagerHandshake:
+    """Test the outgoing handshake exchange over a loopback socket."""
+
+    async def _connect_and_read_bitfield(self, manager, reserved_bytes):
+        """Connect to a loopback peer that sends a handshake and a bitfield."""
+        info_hash = manager.torrent_data["info_hash"]
+        bitfield = b"\xff" * 12 + b"\xf0"
+
+        async def serve(reader, writer):
+            await reader.readexactly(68)
+            handshake = Handshake(
+                info_hash, b"-XX0001-remote-peer1", reserved_bytes=reserved_bytes
+            )
+            writer.write(handshake.encode() + BitfieldMessage(bitfield).encode())
+            await writer.drain()
+            with contextlib.suppress(Exception):
+                await reader.read()
+            writer.close()
+
+        server = await asyncio.start_server(serve, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        manager.config.security.enable_encryption = False
+        manager._should_use_utp = lambda _: False
+        try:
+            peer_info = PeerInfo(ip="127.0.0.1", port=port)
+            await asyncio.wait_for(manager._connect_to_peer(peer_info), timeout=5.0)
+            connection = manager.connections[str(peer_info)]
+            for _ in range(100):
+                if connection.peer_state.bitfield:
+                    break
+                await asyncio.sleep(0.01)
+            return connection.peer_state.bitfield, bitfield
+        finally:
+            server.close()
+
+    @pytest.mark.asyncio
+    async def test_unencrypted_pooled_connection_keeps_streams(self, async_peer_manager):
+        """Test an unencrypted connection from the pool keeps its streams."""
+        received, sent = await self._connect_and_read_bitfield(
+            async_peer_manager, b"\x00" * 8
+        )
+
+        assert received == sent
+
+    @pytest.mark.asyncio
+    async def test_v2_reserved_bit_keeps_following_bitfield(self, async_peer_manager):
+        """Test a peer advertising v2 support still sends a 68-byte handshake.
+
+        The bitfield that follows must reach the message loop intact instead
+        of being read as extra handshake bytes.
+        """
+        received, sent = await self._connect_and_read_bitfield(
+            async_peer_manager, b"\x01" + b"\x00" * 7
+        )
+
+        assert received == sent
@@ -0,0 +1,215 @@
+"""Unit tests for incoming handshake routing and admission control."""
+
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from ccbt.models import NetworkConfig
+from ccbt.peer.handshake_router import AcceptLimiter, InfoHashRouter
+from ccbt.peer.peer import Handshake
+from ccbt.peer.tcp_server import IncomingPeerServer
+
+pytestmark = [pytest.mark.unit, pytest.mark.peer]
+
+INFO_HASH = b"\x11" * 20
+PEER_ID = b"-CC0001-" + b"\x00" * 12
+
+
+class TestInfoHashRouter:
+    """Tests for InfoHashRouter."""
+
+    @pytest.mark.asyncio
+    async def test_registered_and_unknown(self):
+        """Test registered hashes resolve and unknown ones return None at once."""
+        router = InfoHashRouter()
+        session = object()
+        router.register(INFO_HASH, session)
+
+        assert await router.resolve(INFO_HASH, timeout=5.0) is session
+        assert await asyncio.wait_for(router.resolve(b"\x22" * 20, 5.0), 0.1) is None
+
+        router.unregister(INFO_HASH, object())  # Different session: kept
+        assert INFO_HASH in router
+        router.unregister(INFO_HASH)
+        assert len(router) == 0
+
+    @pytest.mark.asyncio
+    async def test_pending_resolves_on_register(self):
+        """Test handshakes for an expected torrent wait for its registration."""
+        router = InfoHashRouter()
+        router.expect(INFO_HASH)
+        session = object()
+
+        waiters = [
+            asyncio.create_task(router.resolve(INFO_HASH, timeout=5.0))
+            for _ in range(3)
+        ]
+        await asyncio.sleep(0)
+        router.register(INFO_HASH, session)
+
+        assert await asyncio.gather(*waiters) == [session] * 3
+        assert not router.is_pending(INFO_HASH)
+
+    @pytest.mark.asyncio
+    async def test_pending_abandoned_or_timed_out(self):
+        """Test waiters give up on timeout without breaking other waiters."""
+        router = InfoHashRouter()
+        router.expect(INFO_HASH)
+
+        assert await router.resolve(INFO_HASH, timeout=0.01) is None
+        assert router.is_pending(INFO_HASH)
+
+        waiter = asyncio.create_task(router.resolve(INFO_HASH, timeout=5.0))
+        await asyncio.sleep(0)
+        router.abandon(INFO_HASH)
+        assert await waiter is None
+        assert await router.resolve(INFO_HASH, timeout=5.0) is None
+
+    @pytest.mark.asyncio
+    async def test_clear(self):
+        """Test clear drops sessions and rejects waiting handshakes."""
+        router = InfoHashRouter()
+        router.register(INFO_HASH, object())
+        router.expect(b"\x22" * 20)
+        waiter = asyncio.create_task(router.resolve(b"\x22" * 20, timeout=5.0))
+        await asyncio.sleep(0)
+
+        router.clear()
+
+        assert len(router) == 0
+        assert not router.is_pending(b"\x22" * 20)
+        assert await asyncio.wait_for(waiter, 0.1) is None
+
+
+class TestAcceptLimiter:
+    """Tests for AcceptLimiter."""
+
+    def _limiter(self, **overrides) -> AcceptLimiter:
+        params = {
+            "rate": 1000.0,
+            "burst": 1000,
+            "rate_per_ip": 1000.0,
+            "burst_per_ip": 1000,
+            "max_half_open": 3,
+            "max_half_open_per_ip": 2,
+        }
+        params.update(overrides)
+        return AcceptLimiter(**params)
+
+    def test_half_open_caps(self):
+        """Test global and per-IP half-open caps and release."""
+        limiter = self._limiter()
+
+        assert limiter.admit("10.0.0.1") is None
+        assert limiter.admit("10.0.0.1") is None
+        assert limiter.admit("10.0.0.1") == "per-IP half-open limit"
+        assert limiter.admit("10.0.0.2") is None
+        assert limiter.admit("10.0.0.3") == "half-open limit"
+
+        limiter.release("10.0.0.1")
+        assert limiter.half_open == 2
+        assert limiter.admit("10.0.0.3") is None
+
+    def test_accept_rate(self):
+        """Test bursts beyond the global and per-IP buckets are rejected."""
+        limiter = self._limiter(
+            rate=1.0, burst=3, rate_per_ip=0.01, burst_per_ip=2, max_half_open=100
+        )
+
+        assert limiter.admit("10.0.0.1") is None
+        limiter.release("10.0.0.1")
+        assert limiter.admit("10.0.0.1") is None
+        limiter.release("10.0.0.1")
+        assert limiter.admit("10.0.0.1") == "per-IP accept rate"
+        assert limiter.admit("10.0.0.2") is None
+        assert limiter.admit("10.0.0.3") == "accept rate"
+
+
+class TestIncomingPeerServerRouting:
+    """Tests for the accept path of IncomingPeerServer."""
+
+    @pytest.fixture
+    async def server(self):
+        """Run the connection handler on an ephemeral localhost port."""
+        session_manager = SimpleNamespace(
+            info_hash_router=InfoHashRouter(),
+            security_manager=None,
+        )
+        config = SimpleNamespace(
+            network=NetworkConfig(
+                handshake_timeout=2.0, incoming_pending_session_timeout=2.0
+            )
+        )
+        incoming = IncomingPeerServer(session_manager, config)
+        listener = await asyncio.start_server(
+            incoming._handle_connection, "127.0.0.1", 0
+        )
+        incoming.port = listener.sockets[0].getsockname()[1]
+        yield incoming
+        listener.close()
+        await listener.wait_closed()
+
+    async def _connect_and_handshake(self, port: int, info_hash: bytes) -> bytes:
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(Handshake(info_hash, PEER_ID).encode())
+        await writer.drain()
+        try:
+            return await asyncio.wait_for(reader.read(), timeout=1.0)
+        except ConnectionResetError:
+            return b""  # Aborted connections may surface as a reset
+        finally:
+            writer.close()
+
+    @pytest.mark.asyncio
+    async def test_unknown_info_hash_rejected_immediately(self, server):
+        """Test an unknown info hash is dropped without waiting."""
+        assert await self._connect_and_handshake(server.port, INFO_HASH) == b""
+        assert server.stats["rejected_unknown_info_hash"] == 1
+        assert server.accept_limiter.half_open == 0
+
+    @pytest.mark.asyncio
+    async def test_pending_session_receives_peer(self, server):
+        """Test a handshake waits for a torrent that is being added."""
+        router = server.session_manager.info_hash_router
+        router.expect(INFO_HASH)
+        session = MagicMock()
+        session.info.status = "starting"
+        session.accept_incoming_peer = AsyncMock(
+            side_effect=lambda _reader, writer, *_args: writer.close()
+        )
+
+        connect = asyncio.create_task(
+            self._connect_and_handshake(server.port, INFO_HASH)
+        )
+        await asyncio.sleep(0.1)
+        router.register(INFO_HASH, session)
+        await connect
+
+        session.accept_incoming_peer.assert_awaited_once()
+        handshake = session.accept_incoming_peer.await_args.args[2]
+        assert handshake.info_hash == INFO_HASH
+        assert server.stats["routed"] == 1
+
+    @pytest.mark.asyncio
+    async def test_blocked_ip_dropped_before_handshake(self, server):
+        """Test filtered addresses are dropped before anything is read."""
+        server.session_manager.security_manager = MagicMock()
+        server.session_manager.security_manager.is_ip_blocked.return_value = True
+
+        reader, writer = await asyncio.open_connection("127.0.0.1", server.port)
+        try:
+            assert await asyncio.wait_for(reader.read(), timeout=1.0) == b""
+        except ConnectionResetError:
+            pass  # Aborted connections may surface as a reset
+        finally:
+            writer.close()
+
+        server.session_manager.security_manager.is_ip_blocked.assert_called_once_with(
+            "127.0.0.1"
+        )
+        assert server.stats["rejected_filtered"] == 1
+        assert server.stats["accepted"] == 0
@@ -1,7 +1,9 @@
 """Tests for peer protocol implementation.
 """
 
+import asyncio
 import struct
+from unittest.mock import patch
 
 import pytest
 
@@ -608,6 +610,19 @@ class TestMessageDecoder:
         assert isinstance(messages[2], HaveMessage)
         assert messages[2].piece_index == 10
 
+    async def test_queued_message_survives_wait_timeout(self):
+        """Test a decoded message is returned even if waiting would time out."""
+        decoder = MessageDecoder()
+        await decoder.feed_data(struct.pack("!IB", 1, MessageType.CHOKE))
+
+        with patch(
+            "ccbt.peer.peer.asyncio.wait_for", side_effect=asyncio.TimeoutError
+        ):
+            message = await decoder.get_message()
+
+        assert isinstance(message, ChokeMessage)
+        assert decoder.message_queue.empty()
+
     async def test_decode_piece_message(self):
         """Test decoding piece message."""
         decoder = MessageDecoder()
@@ -117,6 +117,26 @@ class TestUTPPeerConnectionConnect:
             assert conn.connection_task is not None
             assert conn.stats.last_activity > 0
 
+    @pytest.mark.asyncio
+    async def test_connect_without_receiver(self, peer_info, mock_torrent_data, mock_utp_connection):
+        """Test connect leaves the reader to the caller when asked."""
+        conn = UTPPeerConnection(
+            peer_info=peer_info,
+            torrent_data=mock_torrent_data,
+        )
+
+        with patch("ccbt.peer.utp_peer.UTPConnection", return_value=mock_utp_connection):
+            async def mock_connect():
+                mock_utp_connection.state = UTPConnectionState.CONNECTED
+
+            mock_utp_connection.connect = AsyncMock(side_effect=mock_connect)
+
+            await conn.connect(start_receiver=False)
+
+            assert conn.state == ConnectionState.CONNECTED
+            assert isinstance(conn.reader, UTPStreamReader)
+            assert conn.connection_task is None
+
     @pytest.mark.asyncio
     async def test_connect_timeout(self, peer_info, mock_torrent_data, mock_utp_connection):
         """Test connection timeout (lines 204-214)."""
@@ -225,101 +245,74 @@ class TestUTPPeerConnectionReceiveMessages:
         await conn._receive_messages()
 
     @pytest.mark.asyncio
-    async def test_receive_messages_keep_alive(self, peer_info, mock_torrent_data, mock_utp_connection):
-        """Test receive messages handles keep-alive (lines 273-275)."""
-        conn = UTPPeerConnection(
-            peer_info=peer_info,
-            torrent_data=mock_torrent_data,
-        )
-
-        # Create mock reader with keep-alive message (length 0)
-        mock_reader = MagicMock()
-        mock_reader.readexactly = AsyncMock(
-            side_effect=[
-                (0).to_bytes(4, "big"),  # Keep-alive message
-                asyncio.CancelledError(),  # Cancel after first message
-            ]
-        )
-        conn.reader = mock_reader
-        conn.state = ConnectionState.CONNECTED
-
-        with pytest.raises(asyncio.CancelledError):
-            await conn._receive_messages()
-
-    @pytest.mark.asyncio
-    async def test_receive_messages_empty_length_data(self, peer_info, mock_torrent_data):
-        """Test receive messages handles empty length data (line 269-270)."""
+    async def test_receive_messages_stream_end(self, peer_info, mock_torrent_data):
+        """Test receive messages stops when the stream ends."""
         conn = UTPPeerConnection(
             peer_info=peer_info,
             torrent_data=mock_torrent_data,
         )
 
-        # Create mock reader that returns empty data (defensive check)
         mock_reader = MagicMock()
-        mock_reader.readexactly = AsyncMock(return_value=b"")  # Empty bytes
+        mock_reader.read = AsyncMock(return_value=b"")  # End of stream
         conn.reader = mock_reader
         conn.state = ConnectionState.CONNECTED
 
-        # Should break out of loop
         await conn._receive_messages()
 
-        assert conn.state == ConnectionState.CONNECTED  # State unchanged
+        assert conn.state == ConnectionState.DISCONNECTED
 
     @pytest.mark.asyncio
-    async def test_receive_messages_empty_message_data(self, peer_info, mock_torrent_data):
-        """Test receive messages handles empty message data (line 279-280)."""
+    async def test_receive_messages_normal(self, peer_info, mock_torrent_data):
+        """Test receive messages feeds each available chunk to the decoder."""
         conn = UTPPeerConnection(
             peer_info=peer_info,
             torrent_data=mock_torrent_data,
         )
 
-        # Create mock reader with length but empty message
-        message_length = 5
+        chunk = (5).to_bytes(4, "big") + b"hello"
         mock_reader = MagicMock()
-        mock_reader.readexactly = AsyncMock(
+        mock_reader.read = AsyncMock(
             side_effect=[
-                message_length.to_bytes(4, "big"),  # Message length
-                b"",  # Empty message data
+                chunk,
+                asyncio.CancelledError(),  # Cancel after first chunk
             ]
         )
         conn.reader = mock_reader
         conn.state = ConnectionState.CONNECTED
+        conn.message_decoder = MagicMock()
+        conn.message_decoder.feed_data = AsyncMock()
 
-        # Should break out of loop
-        await conn._receive_messages()
+        with pytest.raises(asyncio.CancelledError):
+            await conn._receive_messages()
 
-        assert conn.state == ConnectionState.CONNECTED  # State unchanged
+        # Verify message decoder was fed the whole chunk at once
+        conn.message_decoder.feed_data.assert_called_once_with(chunk)
+        mock_reader.read.assert_called_with(-1)
+        assert conn.stats.last_activity > 0
 
     @pytest.mark.asyncio
-    async def test_receive_messages_normal(self, peer_info, mock_torrent_data):
-        """Test receive messages normal flow (lines 267-286)."""
+    async def test_receive_messages_batches_frames(self, peer_info, mock_torrent_data):
+        """Test several frames in one chunk are all decoded, keep-alives included."""
         conn = UTPPeerConnection(
             peer_info=peer_info,
             torrent_data=mock_torrent_data,
         )
 
-        # Create mock reader with message data
-        message_length = 5
-        message_data = b"hello"
+        # keep-alive, unchoke, interested
+        chunk = (0).to_bytes(4, "big") + b"\x00\x00\x00\x01\x01" + b"\x00\x00\x00\x01\x02"
         mock_reader = MagicMock()
-        mock_reader.readexactly = AsyncMock(
-            side_effect=[
-                message_length.to_bytes(4, "big"),  # Message length
-                message_data,  # Message data
-                asyncio.CancelledError(),  # Cancel after first message
-            ]
-        )
+        mock_reader.read = AsyncMock(side_effect=[chunk[:7], chunk[7:], b""])
         conn.reader = mock_reader
         conn.state = ConnectionState.CONNECTED
-        conn.message_decoder = MagicMock()
-        conn.message_decoder.feed_data = AsyncMock()
 
-        with pytest.raises(asyncio.CancelledError):
-            await conn._receive_messages()
+        await conn._receive_messages()
 
-        # Verify message decoder was fed
-        conn.message_decoder.feed_data.assert_called_once()
-        assert conn.stats.last_activity > 0
+        messages = await conn.message_decoder.get_messages()
+        assert [type(m).__name__ for m in messages] == [
+            "KeepAliveMessage",
+            "UnchokeMessage",
+            "InterestedMessage",
+        ]
 
     @pytest.mark.asyncio
     async def test_receive_messages_eof_error(self, peer_info, mock_torrent_data):
@@ -330,7 +323,7 @@ class TestUTPPeerConnectionReceiveMessages:
         )
 
         mock_reader = MagicMock()
-        mock_reader.readexactly = AsyncMock(side_effect=EOFError("Connection closed"))
+        mock_reader.read = AsyncMock(side_effect=EOFError("Connection closed"))
         conn.reader = mock_reader
         conn.state = ConnectionState.CONNECTED
 
@@ -347,7 +340,7 @@ class TestUTPPeerConnectionReceiveMessages:
         )
 
         mock_reader = MagicMock()
-        mock_reader.readexactly = AsyncMock(side_effect=ConnectionError("Connection lost"))
+        mock_reader.read = AsyncMock(side_effect=ConnectionError("Connection lost"))
         conn.reader = mock_reader
         conn.state = ConnectionState.CONNECTED
 
@@ -364,7 +357,7 @@ class TestUTPPeerConnectionReceiveMessages:
         )
 
         mock_reader = MagicMock()
-        mock_reader.readexactly = AsyncMock(side_effect=ValueError("Unexpected error"))
+        mock_reader.read = AsyncMock(side_effect=ValueError("Unexpected error"))
         conn.reader = mock_reader
         conn.state = ConnectionState.CONNECTED
 
@@ -100,7 +100,7 @@ class TestUTPStreamReader:
         
         mock_utp_connection.receive = AsyncMock(side_effect=mock_receive)
         
-        with pytest.raises(EOFError, match="Connection closed: expected 10 bytes"):
+        with pytest.raises(asyncio.IncompleteReadError, match="10 expected bytes"):
             await reader.readexactly(10)
 
 
@@ -9,6 +9,7 @@ from __future__ import annotations
 import asyncio
 import hashlib
 import struct
+import time
 from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 import pytest
@@ -17,6 +18,7 @@ pytestmark = [pytest.mark.unit, pytest.mark.metadata]
 
 from ccbt.core.bencode import BencodeDecoder, BencodeEncoder
 from ccbt.piece.async_metadata_exchange import (
+    METADATA_PIPELINE_DEPTH,
     AsyncMetadataExchange,
     MetadataCache,
     MetadataMetrics,
@@ -365,17 +367,18 @@ class TestAsyncMetadataExchange:
 
     @pytest.mark.asyncio
     async def test_request_metadata_piece_success(self, exchange):
-        """Test _request_metadata_piece success."""
+        """Test _request_metadata_piece sends without waiting for the response."""
         session = PeerMetadataSession(peer_info=("192.168.1.1", 6881))
         session.ut_metadata_id = 1
         session.writer = AsyncMock()
 
-        with patch.object(exchange, "_wait_for_piece_response") as mock_wait:
-            await exchange._request_metadata_piece(session, 0)
+        assert await exchange._request_metadata_piece(session, 0) is True
 
-            assert session.writer.write.called
-            assert session.writer.drain.called
-            mock_wait.assert_called_once_with(session, 0)
+        assert session.writer.write.called
+        assert session.writer.drain.called
+        assert 0 in session.pieces_requested
+        assert 0 in session.pieces_in_flight
+        assert session.peer_info in exchange._inflight[0]
 
     @pytest.mark.asyncio
     async def test_request_metadata_piece_exception(self, exchange):
@@ -383,74 +386,178 @@ class TestAsyncMetadataExchange:
         session = PeerMetadataSession(peer_info=("192.168.1.1", 6881))
         session.ut_metadata_id = 1
         session.writer = AsyncMock()
+        session.writer.drain.side_effect = ConnectionResetError("Error")
 
-        with patch.object(exchange, "_wait_for_piece_response", side_effect=Exception("Error")):
-            await exchange._request_metadata_piece(session, 0)
+        assert await exchange._request_metadata_piece(session, 0) is False
 
-            assert 0 in session.pieces_failed
+        assert 0 in session.pieces_failed
+        assert 0 not in session.pieces_in_flight
 
     @pytest.mark.asyncio
-    async def test_wait_for_piece_response_no_reader(self, exchange):
-        """Test _wait_for_piece_response without reader."""
+    async def test_request_metadata_pieces_pipelines(self, exchange):
+        """Test all pieces are requested up front, bounded by pipeline depth."""
         session = PeerMetadataSession(peer_info=("192.168.1.1", 6881))
         session.ut_metadata_id = 1
-        session.reader = None
+        session.metadata_size = 16384 * (METADATA_PIPELINE_DEPTH + 4)
+        session.writer = AsyncMock()
 
-        # Exception is caught in the loop, piece is added to failed set after timeout
-        await exchange._wait_for_piece_response(session, 0)
+        await exchange._request_metadata_pieces(session)
 
-        assert 0 in session.pieces_failed
+        assert sorted(session.pieces_in_flight) == list(range(METADATA_PIPELINE_DEPTH))
+        assert session.writer.write.call_count == METADATA_PIPELINE_DEPTH
 
     @pytest.mark.asyncio
-    async def test_wait_for_piece_response_success(self, exchange):
-        """Test _wait_for_piece_response with successful piece - simplified due to complex parsing."""
-        session = PeerMetadataSession(peer_info=("192.168.1.1", 6881))
-        session.ut_metadata_id = 1
+    async def test_pieces_spread_across_peers(self, exchange):
+        """Test a second peer gets pieces not already in flight elsewhere."""
+        first = PeerMetadataSession(peer_info=("192.168.1.1", 6881))
+        second = PeerMetadataSession(peer_info=("192.168.1.2", 6881))
+        for session in (first, second):
+            session.ut_metadata_id = 1
+            session.metadata_size = 16384 * METADATA_PIPELINE_DEPTH * 2
+            session.writer = AsyncMock()
+
+        await exchange._request_metadata_pieces(first)
+        await exchange._request_metadata_pieces(second)
+
+        assert not set(first.pieces_in_flight) & set(second.pieces_in_flight)
+        assert len(exchange._inflight) == METADATA_PIPELINE_DEPTH * 2
+
+    def test_select_piece_re_requests_straggler(self, exchange):
+        """Test a piece stuck on another peer is duplicated once it is stale."""
+        exchange.metadata_pieces[0] = MetadataPiece(0)
+        exchange._inflight[0] = {("192.168.1.1", 6881): 0.0}
+        session = PeerMetadataSession(peer_info=("192.168.1.2", 6881))
+
+        assert exchange._select_piece_for(session) == 0
+
+        exchange._inflight[0] = {("192.168.1.1", 6881): time.time()}
+        assert exchange._select_piece_for(session) is None
 
-        # Mock reader to timeout quickly (complex piece parsing is tested via integration tests)
+    @pytest.mark.asyncio
+    async def test_receive_metadata_pieces_completes(self, exchange):
+        """Test responses are serviced until the metadata validates."""
+        metadata_bytes = BencodeEncoder().encode({b"name": b"x" * 20000})
+        exchange.info_hash = hashlib.sha1(metadata_bytes).digest()
+
+        messages = []
+        for idx in (1, 0):  # out of order
+            header = BencodeEncoder().encode({b"msg_type": 1, b"piece": idx})
+            body = metadata_bytes[idx * 16384 : (idx + 1) * 16384]
+            payload = bytes([20, 1]) + header + body
+            messages.extend([struct.pack("!I", len(payload)), payload])
+
+        session = PeerMetadataSession(peer_info=("192.168.1.1", 6881))
+        session.ut_metadata_id = 3
+        session.metadata_size = len(metadata_bytes)
+        session.writer = AsyncMock()
         session.reader = AsyncMock()
-        session.reader.readexactly = AsyncMock(side_effect=asyncio.TimeoutError())
+        session.reader.readexactly = AsyncMock(side_effect=messages)
 
-        # Should timeout and add to failed pieces
-        await exchange._wait_for_piece_response(session, 0)
+        await exchange._request_metadata_pieces(session)
 
-        assert 0 in session.pieces_failed
+        assert exchange.completed is True
+        assert exchange.metadata_data == metadata_bytes
+        assert not exchange._inflight
 
     @pytest.mark.asyncio
-    async def test_wait_for_piece_response_reject(self, exchange):
-        """Test _wait_for_piece_response with reject."""
+    async def test_receive_metadata_pieces_slow_body(self, exchange):
+        """Test a body arriving after the straggler timeout keeps the stream in sync."""
+        metadata_bytes = BencodeEncoder().encode({b"name": b"slow"})
+        exchange.info_hash = hashlib.sha1(metadata_bytes).digest()
+        header = BencodeEncoder().encode({b"msg_type": 1, b"piece": 0})
+        payload = bytes([20, 1]) + header + metadata_bytes
+
         session = PeerMetadataSession(peer_info=("192.168.1.1", 6881))
-        session.ut_metadata_id = 1
+        session.ut_metadata_id = 3
+        session.metadata_size = len(metadata_bytes)
+        session.writer = AsyncMock()
+        session.reader = asyncio.StreamReader()
+        session.reader.feed_data(struct.pack("!I", len(payload)))
+
+        async def feed_body_late():
+            await asyncio.sleep(0.05)
+            session.reader.feed_data(payload)
 
-        # Create mock reject response
-        header = {b"msg_type": 2}
-        header_bytes = BencodeEncoder().encode(header)
-        payload = struct.pack("!IBB", 2 + len(header_bytes), 20, 1) + header_bytes
+        feeder = asyncio.create_task(feed_body_late())
+        with patch(
+            "ccbt.piece.async_metadata_exchange.METADATA_STRAGGLER_TIMEOUT", 0.01
+        ):
+            await asyncio.wait_for(exchange._request_metadata_pieces(session), 1.0)
+        await feeder
 
+        assert exchange.completed is True
+        assert exchange.metadata_data == metadata_bytes
+
+    @pytest.mark.asyncio
+    async def test_receive_metadata_pieces_skips_malformed(self, exchange):
+        """Test a malformed ut_metadata message does not abort the exchange."""
+        metadata_bytes = BencodeEncoder().encode({b"name": b"x"})
+        exchange.info_hash = hashlib.sha1(metadata_bytes).digest()
+        header = BencodeEncoder().encode({b"msg_type": 1, b"piece": 0})
+        bad = bytes([20, 1]) + b"d8:msg_typei1e"
+        good = bytes([20, 1]) + header + metadata_bytes
+
+        session = PeerMetadataSession(peer_info=("192.168.1.1", 6881))
+        session.ut_metadata_id = 3
+        session.metadata_size = len(metadata_bytes)
+        session.writer = AsyncMock()
         session.reader = AsyncMock()
-        session.reader.readexactly = AsyncMock(side_effect=[
-            struct.pack("!I", len(payload)),  # Length
-            payload,  # Payload
-        ])
+        session.reader.readexactly = AsyncMock(
+            side_effect=[
+                struct.pack("!I", len(bad)),
+                bad,
+                struct.pack("!I", len(good)),
+                good,
+            ]
+        )
 
-        await exchange._wait_for_piece_response(session, 0)
+        await exchange._request_metadata_pieces(session)
 
-        assert 0 in session.pieces_failed
+        assert exchange.completed is True
+        assert exchange.metadata_data == metadata_bytes
 
     @pytest.mark.asyncio
-    async def test_wait_for_piece_response_timeout(self, exchange):
-        """Test _wait_for_piece_response timeout."""
+    async def test_handle_metadata_message_reject(self, exchange):
+        """Test a reject frees the piece and blacklists it for that peer only."""
+        exchange.metadata_pieces[0] = MetadataPiece(0)
         session = PeerMetadataSession(peer_info=("192.168.1.1", 6881))
-        session.ut_metadata_id = 1
+        session.pieces_in_flight[0] = time.time()
+        exchange._inflight[0] = {session.peer_info: session.pieces_in_flight[0]}
 
-        session.reader = AsyncMock()
-        session.reader.readexactly = AsyncMock(side_effect=asyncio.TimeoutError())
+        await exchange._handle_metadata_message(
+            session, BencodeEncoder().encode({b"msg_type": 2, b"piece": 0})
+        )
 
-        # Should eventually timeout
-        await exchange._wait_for_piece_response(session, 0)
+        assert 0 in session.pieces_failed
+        assert 0 not in exchange._inflight
+        other = PeerMetadataSession(peer_info=("192.168.1.2", 6881))
+        assert exchange._select_piece_for(other) == 0
 
+    @pytest.mark.asyncio
+    async def test_handle_metadata_piece_bad_length(self, exchange):
+        """Test a piece with the wrong size is dropped."""
+        exchange.metadata_size = 20000
+        exchange.num_pieces = 2
+        exchange.metadata_pieces[0] = MetadataPiece(0)
+        session = PeerMetadataSession(peer_info=("192.168.1.1", 6881))
+
+        await exchange._handle_metadata_piece(session, 0, b"short")
+
+        assert exchange.metadata_pieces[0].data is None
         assert 0 in session.pieces_failed
 
+    def test_incremental_hash_advances_over_prefix(self, exchange):
+        """Test only the contiguous received prefix is hashed."""
+        exchange.metadata_pieces = {i: MetadataPiece(i) for i in range(3)}
+        exchange.metadata_pieces[1].data = b"b"
+        exchange._advance_hash()
+        assert exchange._hashed_pieces == 0
+
+        exchange.metadata_pieces[0].data = b"a"
+        exchange._advance_hash()
+        assert exchange._hashed_pieces == 2
+        assert exchange._hasher.digest() == hashlib.sha1(b"ab").digest()
+
     @pytest.mark.asyncio
     async def test_handle_metadata_piece(self, exchange):
         """Test _handle_metadata_piece."""
@@ -470,3 +470,332 @@ class TestAsyncPieceManagerEdgeCases:
         assert status["downloading"] >= 1
         assert status["verified"] >= 1
 
+
+class TestAsyncPieceManagerV2Blocks:
+    """Test v2 block hashing as blocks arrive."""
+
+    @staticmethod
+    def _v2_manager(piece_length: int, pieces: list[bytes]) -> AsyncPieceManager:
+        layer = []
+        for data in pieces:
+            blocks = [
+                hashlib.sha256(data[i : i + 16384]).digest()
+                for i in range(0, len(data), 16384)
+            ]
+            level = blocks
+            while len(level) > 1:
+                level = [
+                    hashlib.sha256(level[i] + level[i + 1]).digest()
+                    for i in range(0, len(level), 2)
+                ]
+            layer.append(level[0])
+        torrent_data = {
+            "info_hash": b"\x00" * 20,
+            "file_info": {
+                "name": "v2.bin",
+                "total_length": piece_length * len(pieces),
+                "type": "single",
+            },
+            "pieces_info": {
+                "num_pieces": len(pieces),
+                "piece_length": piece_length,
+                "piece_hashes": [b"\x00" * 32] * len(pieces),
+            },
+            "meta_version": 2,
+            "piece_layers": {b"\x01" * 32: layer},
+        }
+        return AsyncPieceManager(torrent_data)
+
+    @pytest.mark.asyncio
+    async def test_bad_single_block_piece_rejected_on_verification(self):
+        """Test a bad one-block piece is caught by piece verification."""
+        pieces = [b"a" * 16384, b"b" * 16384]
+        manager = self._v2_manager(16384, pieces)
+        piece = manager.pieces[0]
+
+        await manager.handle_piece_block(0, 0, b"z" * 16384, peer_key="10.0.0.1:6881")
+        assert 0 in manager.completed_pieces
+
+        await manager._verify_piece_hash(0, piece)
+
+        assert 0 not in manager.verified_pieces
+        assert piece.state == PieceState.MISSING
+        assert manager.bad_blocks["10.0.0.1:6881"] == 1
+
+    @pytest.mark.asyncio
+    async def test_piece_verified_from_block_hashes(self):
+        """Test a multi-block piece verifies from hashes taken on arrival."""
+        pieces = [bytes(range(256)) * 256, b"c" * 65536]
+        manager = self._v2_manager(65536, pieces)
+        piece = manager.pieces[0]
+
+        for block in piece.blocks:
+            await manager.handle_piece_block(
+                0, block.begin, pieces[0][block.begin : block.begin + block.length]
+            )
+
+        assert all(block.leaf_hashes for block in piece.blocks)
+        with patch("ccbt.piece.async_piece_manager.hash_blocks_v2") as rehash:
+            await manager._verify_piece_hash(0, piece)
+        rehash.assert_not_called()
+        assert 0 in manager.verified_pieces
+
+    @pytest.mark.asyncio
+    async def test_coalesced_block_hashes_split_per_block(self):
+        """Test a block spanning several blocks gives each its own leaf hash."""
+        pieces = [bytes(range(256)) * 256, b"c" * 65536]
+        manager = self._v2_manager(65536, pieces)
+        piece = manager.pieces[0]
+
+        await manager.handle_piece_block(0, 16384, pieces[0][16384:49152])
+
+        assert [len(block.leaf_hashes) for block in piece.blocks] == [0, 1, 1, 0]
+        assert piece.blocks[2].leaf_hashes == [
+            hashlib.sha256(pieces[0][32768:49152]).digest()
+        ]
+
+    @pytest.mark.asyncio
+    async def test_bad_piece_reset_and_senders_penalized(self):
+        """Test a piece failing verification is reset and its sender penalized."""
+        pieces = [b"c" * 65536, b"d" * 65536]
+        manager = self._v2_manager(65536, pieces)
+        piece = manager.pieces[0]
+
+        for block in piece.blocks:
+            await manager.handle_piece_block(
+                0, block.begin, b"\xff" * block.length, peer_key="10.0.0.3:6881"
+            )
+        assert 0 in manager.completed_pieces
+
+        await manager._verify_piece_hash(0, piece)
+
+        assert 0 not in manager.verified_pieces
+        assert piece.state == PieceState.MISSING
+        assert 0 not in manager.completed_pieces
+        assert manager.bad_blocks["10.0.0.3:6881"] == 1
+
+
+class TestAsyncPieceManagerCoalescedRequests:
+    """Test requests spanning several blocks."""
+
+    @staticmethod
+    def _manager() -> AsyncPieceManager:
+        return AsyncPieceManager(
+            {
+                "info_hash": b"\x00" * 20,
+                "file_info": {
+                    "name": "coalesced.bin",
+                    "total_length": 2 * 65536,
+                    "type": "single",
+                },
+                "pieces_info": {
+                    "num_pieces": 2,
+                    "piece_length": 65536,
+                    "piece_hashes": [b"\x01" * 20, b"\x02" * 20],
+                },
+            }
+        )
+
+    def test_add_block_splits_coalesced_data(self):
+        """Test data for a coalesced request fills each block it covers."""
+        piece = self._manager().pieces[0]
+        data = bytes(range(256)) * 128
+
+        assert piece.add_block(16384, data, peer_key="10.0.0.1:6881")
+
+        assert [block.received for block in piece.blocks] == [False, True, True, False]
+        assert piece.blocks[1].data == data[:16384]
+        assert piece.blocks[2].data == data[16384:]
+        assert piece.blocks[2].peer_key == "10.0.0.1:6881"
+        # Data must end on a block boundary
+        assert not piece.add_block(0, b"x" * 20000)
+        assert not piece.blocks[0].received
+
+    def test_get_block_spans_blocks(self):
+        """Test a request crossing block boundaries is served in one piece."""
+        manager = self._manager()
+        piece = manager.pieces[0]
+        data = bytes(range(256)) * 256
+        assert piece.add_block(0, data)
+        piece.state = PieceState.VERIFIED
+
+        assert manager.get_block(0, 8192, 32768) == data[8192:40960]
+        assert manager.get_block(0, 0, 65536) == data
+
+
+class TestAsyncPieceManagerBlockArrival:
+    """Test what happens as blocks of a downloading piece arrive."""
+
+    @pytest.mark.asyncio
+    async def test_piece_verified_once_all_blocks_arrive(self):
+        """Test completion and verification wait for the last block."""
+        manager = TestAsyncPieceManagerCoalescedRequests._manager()
+        manager.on_piece_completed = MagicMock()
+        manager._verify_piece_hash = AsyncMock()
+        piece = manager.pieces[0]
+        piece.state = PieceState.DOWNLOADING
+
+        for block in piece.blocks[:-1]:
+            await manager.handle_piece_block(0, block.begin, b"a" * block.length)
+            await asyncio.sleep(0)
+        manager.on_piece_completed.assert_not_called()
+        manager._verify_piece_hash.assert_not_called()
+
+        last = piece.blocks[-1]
+        await manager.handle_piece_block(0, last.begin, b"a" * last.length)
+        await asyncio.sleep(0)
+
+        manager.on_piece_completed.assert_called_once_with(0)
+        manager._verify_piece_hash.assert_awaited_once_with(0, piece)
+
+    @pytest.mark.asyncio
+    async def test_arriving_block_requests_blocks_left_unrequested(self):
+        """Test blocks that did not fit a pipeline are requested as slots free up."""
+        manager = TestAsyncPieceManagerCoalescedRequests._manager()
+        manager._peer_manager = MagicMock()
+        peer = MagicMock()
+        manager._get_peers_for_piece = AsyncMock(return_value=[peer])
+        manager._request_blocks_normal = AsyncMock()
+        piece = manager.pieces[0]
+        piece.state = PieceState.DOWNLOADING
+        for block in piece.blocks[:2]:
+            block.requested_from.add("10.0.0.1:6881")
+
+        await manager.handle_piece_block(0, 0, b"a" * 16384, peer_key="10.0.0.1:6881")
+        await asyncio.sleep(0)
+
+        manager._request_blocks_normal.assert_awaited_once_with(
+            0, piece.blocks[2:], [peer], manager._peer_manager
+        )
+
+    @pytest.mark.asyncio
+    async def test_arriving_blocks_share_one_refill(self):
+        """Test blocks arriving before a refill ran schedule it only once."""
+        manager = TestAsyncPieceManagerCoalescedRequests._manager()
+        manager._peer_manager = MagicMock()
+        manager._request_unrequested_blocks = AsyncMock()
+        piece = manager.pieces[0]
+        piece.state = PieceState.DOWNLOADING
+        for block in piece.blocks[:2]:
+            manager._mark_requested(block, "10.0.0.1:6881")
+
+        await manager.handle_piece_block(0, 0, b"a" * 16384, peer_key="10.0.0.1:6881")
+        await manager.handle_piece_block(
+            0, 16384, b"a" * 16384, peer_key="10.0.0.1:6881"
+        )
+        await asyncio.sleep(0)
+
+        manager._request_unrequested_blocks.assert_awaited_once_with()
+        assert not manager._peer_requests["10.0.0.1:6881"]
+
+    @pytest.mark.asyncio
+    async def test_no_refill_when_every_block_requested(self):
+        """Test an arriving block schedules nothing if no block is left unrequested."""
+        manager = TestAsyncPieceManagerCoalescedRequests._manager()
+        manager._peer_manager = MagicMock()
+        manager._request_unrequested_blocks = AsyncMock()
+        piece = manager.pieces[0]
+        piece.state = PieceState.DOWNLOADING
+        for block in piece.blocks:
+            manager._mark_requested(block, "10.0.0.1:6881")
+
+        await manager.handle_piece_block(0, 0, b"a" * 16384, peer_key="10.0.0.1:6881")
+        await asyncio.sleep(0)
+
+        manager._request_unrequested_blocks.assert_not_called()
+        assert not manager._refill_pending
+
+    @pytest.mark.asyncio
+    async def test_verified_piece_selects_next_pieces(self):
+        """Test a verified piece frees its slot for the next selection right away."""
+        data = b"v" * 65536
+        manager = AsyncPieceManager(
+            {
+                "info_hash": b"\x00" * 20,
+                "file_info": {
+                    "name": "select.bin",
+                    "total_length": 2 * 65536,
+                    "type": "single",
+                },
+                "pieces_info": {
+                    "num_pieces": 2,
+                    "piece_length": 65536,
+                    "piece_hashes": [hashlib.sha1(data).digest(), b"\x02" * 20],
+                },
+            }
+        )
+        manager.is_downloading = True
+        manager._peer_manager = MagicMock()
+        manager._select_pieces = AsyncMock()
+        piece = manager.pieces[0]
+        assert piece.add_block(0, data)
+
+        await manager._verify_piece_hash(0, piece)
+        await asyncio.sleep(0)
+
+        assert 0 in manager.verified_pieces
+        manager._select_pieces.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_unavailable_peer_not_logged_as_warning(self, caplog):
+        """Test a peer without the piece is routine, not a warning."""
+        manager = TestAsyncPieceManagerCoalescedRequests._manager()
+        connection = MagicMock()
+        connection.peer_info = PeerInfo(ip="10.0.0.1", port=6881)
+        connection.can_request.return_value = True
+        connection.outstanding_requests = {}
+        connection.max_pipeline_depth = 16
+        peer_manager = MagicMock()
+        peer_manager.get_active_peers.return_value = [connection]
+        peer_manager.connections = {"10.0.0.1:6881": connection}
+
+        with caplog.at_level("WARNING", logger="ccbt.piece.async_piece_manager"):
+            peers = await manager._get_peers_for_piece(0, peer_manager)
+
+        assert peers == []
+        assert not caplog.records
+
+
+class TestAsyncPieceManagerPeerDisconnect:
+    """Test forgetting a peer that dropped out."""
+
+    @pytest.mark.asyncio
+    async def test_peer_disconnect_releases_requested_blocks(self):
+        """Test blocks still owed by a disconnected peer can be requested again."""
+        manager = TestAsyncPieceManagerCoalescedRequests._manager()
+        await manager.update_peer_have("10.0.0.1:6881", 0)
+        await manager.update_peer_have("10.0.0.2:6881", 0)
+        piece = manager.pieces[0]
+        piece.state = PieceState.DOWNLOADING
+        assert piece.add_block(0, b"a" * 16384)
+        for block in piece.blocks:
+            manager._mark_requested(block, "10.0.0.1:6881")
+        manager._mark_requested(piece.blocks[3], "10.0.0.2:6881")
+
+        await manager.handle_peer_disconnected("10.0.0.1:6881")
+
+        assert "10.0.0.1:6881" not in manager.peer_availability
+        assert manager.piece_frequency[0] == 1
+        assert piece.blocks[0].requested_from == {"10.0.0.1:6881"}
+        assert not piece.blocks[1].requested_from
+        assert piece.blocks[3].requested_from == {"10.0.0.2:6881"}
+        assert 0 in manager._unrequested_pieces
+        assert "10.0.0.1:6881" not in manager._peer_requests
+        assert manager._peer_requests["10.0.0.2:6881"] == {(0, 3 * 16384)}
+
+    @pytest.mark.asyncio
+    async def test_peer_disconnect_only_visits_its_requests(self):
+        """Test a disconnect does not walk blocks the peer was never asked for."""
+        manager = TestAsyncPieceManagerCoalescedRequests._manager()
+        piece = manager.pieces[0]
+        manager._mark_requested(piece.blocks[1], "10.0.0.1:6881")
+
+        with patch.object(
+            type(piece), "get_block", autospec=True, side_effect=PieceData.get_block
+        ) as get_block:
+            await manager.handle_peer_disconnected("10.0.0.2:6881")
+            get_block.assert_not_called()
+            await manager.handle_peer_disconnected("10.0.0.1:6881")
+
+        get_block.assert_called_once_with(piece, 16384)
+        assert not piece.blocks[1].requested_from
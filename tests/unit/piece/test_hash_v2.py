@@ -15,8 +15,10 @@ from ccbt.piece.hash_v2 import (
     HashAlgorithm,
     hash_file_tree,
     hash_piece_layer,
+    hash_piece_root_v2,
     hash_piece_v2,
     hash_piece_v2_streaming,
+    piece_root_v2,
     verify_piece,
     verify_piece_layer,
     verify_piece_v2,
@@ -195,14 +197,26 @@ class TestHashPieceLayer:
         root = hash_piece_layer([hash1, hash2, hash3])
 
         assert len(root) == 32
-        # With odd number, last piece is duplicated
-        # First level: hash(hash1+hash2), hash(hash3+hash3)
+        # With odd number, the layer is padded with zero hashes (BEP 52)
+        # First level: hash(hash1+hash2), hash(hash3+zeros)
         level1_0 = hashlib.sha256(hash1 + hash2).digest()
-        level1_1 = hashlib.sha256(hash3 + hash3).digest()
+        level1_1 = hashlib.sha256(hash3 + bytes(32)).digest()
         # Root: hash(level1_0 + level1_1)
         expected = hashlib.sha256(level1_0 + level1_1).digest()
         assert root == expected
 
+    def test_hash_piece_layer_pads_with_zero_pieces(self):
+        """Test padding uses the root of an all-zero piece of piece_length."""
+        hashes = [hash_piece_v2(f"piece {i}".encode()) for i in range(3)]
+        zero_block = bytes(32)
+        zero_piece = hashlib.sha256(zero_block + zero_block).digest()  # 32 KiB
+        level1_0 = hashlib.sha256(hashes[0] + hashes[1]).digest()
+        level1_1 = hashlib.sha256(hashes[2] + zero_piece).digest()
+
+        root = hash_piece_layer(hashes, piece_length=32768)
+
+        assert root == hashlib.sha256(level1_0 + level1_1).digest()
+
     def test_hash_piece_layer_many_pieces(self):
         """Test piece layer with many pieces."""
         piece_hashes = [hash_piece_v2(f"piece {i}".encode()) for i in range(10)]
@@ -223,6 +237,45 @@ class TestHashPieceLayer:
             hash_piece_layer([invalid_hash])
 
 
+class TestPieceRootV2:
+    """Test BEP 52 piece hashes built from 16 KiB block hashes."""
+
+    def test_single_block_piece(self):
+        """Test a piece of one block hashes to the block hash."""
+        data = b"x" * 16384
+        assert hash_piece_root_v2(data) == hashlib.sha256(data).digest()
+        assert hash_piece_root_v2(data, 16384) == hashlib.sha256(data).digest()
+
+    def test_blocks_combined_into_root(self):
+        """Test block hashes are combined pairwise into the piece root."""
+        data = bytes(range(256)) * 256  # 64 KiB
+        blocks = [hashlib.sha256(data[i : i + 16384]).digest() for i in range(0, 65536, 16384)]
+        left = hashlib.sha256(blocks[0] + blocks[1]).digest()
+        right = hashlib.sha256(blocks[2] + blocks[3]).digest()
+
+        assert hash_piece_root_v2(data) == hashlib.sha256(left + right).digest()
+
+    def test_short_last_piece_padded_to_piece_length(self):
+        """Test a short piece is padded with zero blocks to the piece length."""
+        data = b"y" * 20000
+        blocks = [
+            hashlib.sha256(data[:16384]).digest(),
+            hashlib.sha256(data[16384:]).digest(),
+        ]
+        zero = bytes(32)
+        left = hashlib.sha256(blocks[0] + blocks[1]).digest()
+        right = hashlib.sha256(zero + zero).digest()
+
+        assert hash_piece_root_v2(data) == left
+        assert hash_piece_root_v2(data, 65536) == hashlib.sha256(left + right).digest()
+        assert piece_root_v2(blocks, 65536) == hash_piece_root_v2(data, 65536)
+
+    def test_empty_piece(self):
+        """Test empty data raises ValueError."""
+        with pytest.raises(ValueError):
+            hash_piece_root_v2(b"")
+
+
 class TestVerifyPieceLayer:
     """Test verify_piece_layer function."""
 
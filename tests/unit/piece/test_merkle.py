@@ -0,0 +1,105 @@
+"""Unit tests for the incremental Merkle tree engine.
+
+Tests roots for both padding modes against a whole-tree rebuild, incremental
+appends, inclusion proofs and BEP 52 hash response verification.
+"""
+
+from __future__ import annotations
+
+import hashlib
+
+import pytest
+
+from ccbt.piece.merkle import (
+    ZERO_HASH,
+    MerkleTree,
+    piece_layer_pad,
+    zero_subtree_hashes,
+)
+
+
+def _leaves(count: int) -> list[bytes]:
+    return [hashlib.sha256(str(i).encode()).digest() for i in range(count)]
+
+
+def _rebuild(leaves: list[bytes], pad: bytes | None) -> bytes:
+    """Build the root level by level, padding each odd level."""
+    level = list(leaves)
+    height = 0
+    while len(level) > 1:
+        if len(level) % 2:
+            if pad is None:
+                level.append(level[-1])
+            else:
+                level.append(zero_subtree_hashes(height, pad)[height])
+        level = [
+            hashlib.sha256(level[i] + level[i + 1]).digest()
+            for i in range(0, len(level), 2)
+        ]
+        height += 1
+    return level[0]
+
+
+class TestMerkleTree:
+    """Test MerkleTree class."""
+
+    @pytest.mark.parametrize("pad", [ZERO_HASH, None])
+    @pytest.mark.parametrize("count", [1, 2, 3, 5, 8, 13, 33])
+    def test_root_matches_rebuild(self, count, pad):
+        """Test roots built in bulk and by appending match a full rebuild."""
+        leaves = _leaves(count)
+        incremental = MerkleTree(pad=pad)
+        for i, leaf in enumerate(leaves):
+            incremental.append(leaf)
+            assert incremental.root() == _rebuild(leaves[: i + 1], pad)
+
+        assert MerkleTree(leaves, pad=pad).root() == _rebuild(leaves, pad)
+
+    def test_zero_padding_equals_padded_leaves(self):
+        """Test zero padding equals padding the leaves to a power of two."""
+        leaves = _leaves(5)
+        padded = MerkleTree([*leaves, ZERO_HASH, ZERO_HASH, ZERO_HASH])
+
+        assert MerkleTree(leaves).root() == padded.root()
+        assert MerkleTree(leaves).node(2, 1) == padded.node(2, 1)
+
+    def test_empty_tree(self):
+        """Test an empty tree has no root."""
+        with pytest.raises(ValueError, match="no leaves"):
+            MerkleTree().root()
+
+    @pytest.mark.parametrize("pad", [ZERO_HASH, None])
+    def test_proofs(self, pad):
+        """Test every node of a ragged tree proves against the root."""
+        tree = MerkleTree(_leaves(11), pad=pad)
+        root = tree.root()
+
+        for level in range(tree.height + 1):
+            for index in range(len(tree.layer(level))):
+                proof = tree.proof(index, level)
+                node = tree.node(level, index)
+                assert MerkleTree.verify_proof(node, index, proof, root)
+
+        assert not MerkleTree.verify_proof(b"\x01" * 32, 3, tree.proof(3), root)
+        with pytest.raises(IndexError):
+            tree.proof(11)
+
+    def test_verify_hashes(self):
+        """Test a BEP 52 style run of hashes with uncle hashes verifies."""
+        tree = MerkleTree(_leaves(13))
+        root = tree.root()
+        hashes = tree.layer(0, 8, 4)  # Includes padding past leaf 12
+        proof = tree.proof(2, level=2)
+
+        assert MerkleTree.verify_hashes(hashes, 8, proof, root)
+        assert not MerkleTree.verify_hashes(hashes[::-1], 8, proof, root)
+        assert not MerkleTree.verify_hashes(hashes[:3], 8, proof, root)
+
+    def test_piece_layer_pad(self):
+        """Test piece padding is the root of a zero subtree of one piece."""
+        zeros = zero_subtree_hashes(3)
+
+        assert piece_layer_pad(16384) == ZERO_HASH
+        assert piece_layer_pad(131072) == zeros[3]
+        with pytest.raises(ValueError, match="power of two"):
+            piece_layer_pad(3000)
@@ -891,6 +891,27 @@ class TestTorrentQueueManagerSyncActiveSets:
         # Restore original
         queue_manager._enforce_queue_limits = original_enforce
 
+    @pytest.mark.asyncio
+    async def test_monitor_loop_iteration_does_not_deadlock(self, queue_manager):
+        """Test a monitor iteration enforces limits without re-taking its lock."""
+        sleeps = 0
+
+        async def fake_sleep(_delay):
+            nonlocal sleeps
+            sleeps += 1
+            if sleeps > 1:
+                raise asyncio.CancelledError
+
+        queue_manager._enforce_queue_limits = AsyncMock(
+            wraps=queue_manager._enforce_queue_limits
+        )
+        with patch("ccbt.queue.manager.asyncio.sleep", side_effect=fake_sleep):
+            await asyncio.wait_for(queue_manager._monitor_loop(), timeout=2.0)
+
+        # The loop reached its next sleep instead of blocking on the lock
+        assert sleeps == 2
+        queue_manager._enforce_queue_limits.assert_awaited_once()
+
 
     @pytest.mark.asyncio
     async def test_bandwidth_allocation_loop_runs(self, queue_manager):
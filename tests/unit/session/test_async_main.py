@@ -338,6 +338,7 @@ class TestAsyncDownloadManager:
                 5,
                 0,
                 b"block_data",
+                peer_key="192.168.1.1:6881",
             )
 
     @pytest.mark.asyncio
@@ -29,6 +29,8 @@ def mock_config():
     config.discovery.tracker_auto_scrape = False
     config.discovery.tracker_scrape_interval = 300.0  # 5 minutes
     config.discovery.enable_dht = False  # Disable DHT to avoid network operations
+    config.network = MagicMock()
+    config.network.announce_interval = 1800.0  # Real numeric value
     config.nat = MagicMock()
     config.nat.auto_map_ports = False  # Disable NAT to avoid network operations
     config.security = MagicMock()
@@ -1,14 +1,13 @@
-"""Tests for session background loops."""
+"""Tests for session background jobs."""
 
-import asyncio
 import pytest
 
 from ccbt.models import TorrentCheckpoint
 
 
 @pytest.mark.asyncio
-async def test_announce_loop_cancel_breaks_cleanly(monkeypatch):
-    """Test _announce_loop handles CancelledError and breaks."""
+async def test_announce_step_returns_interval(monkeypatch):
+    """Test a successful announce schedules the next one after the interval."""
     from ccbt.session.session import AsyncTorrentSession
 
     class _Tracker:
@@ -16,39 +15,27 @@ async def test_announce_loop_cancel_breaks_cleanly(monkeypatch):
             pass
         async def stop(self):
             pass
-        async def announce(self, td):
+        async def announce(self, td, port=6881):
             return type("Response", (), {"peers": []})()
 
     td = {
         "name": "test",
         "info_hash": b"1" * 20,
+        "announce": "http://tracker.example.com/announce",
         "pieces_info": {"num_pieces": 0, "piece_length": 0, "piece_hashes": [], "total_length": 0},
         "file_info": {"total_length": 0},
     }
 
     session = AsyncTorrentSession(td, ".")
     session.tracker = _Tracker()
-    session._stop_event = asyncio.Event()
-
-    # Mock config to have short announce interval
     session.config.network.announce_interval = 0.01
 
-    # Start loop as task and cancel it quickly
-    task = asyncio.create_task(session._announce_loop())
-    await asyncio.sleep(0.01)
-    task.cancel()
-    session._stop_event.set()  # Also set stop event
-
-    try:
-        await task
-        # Task may complete normally if cancellation wasn't caught in time
-    except asyncio.CancelledError:
-        pass
+    assert await session._announce_loop_step() == 0.01
 
 
 @pytest.mark.asyncio
-async def test_status_loop_cancel_breaks_cleanly(monkeypatch):
-    """Test _status_loop handles CancelledError and breaks."""
+async def test_status_step_without_callback(monkeypatch):
+    """Test the status step is a no-op without a status callback."""
     from ccbt.session.session import AsyncTorrentSession
 
     class _DM:
@@ -64,27 +51,21 @@ async def test_status_loop_cancel_breaks_cleanly(monkeypatch):
 
     session = AsyncTorrentSession(td, ".")
     session.download_manager = _DM()
-    session._stop_event = asyncio.Event()
-
-    task = asyncio.create_task(session._status_loop())
-    await asyncio.sleep(0.01)
-    task.cancel()
-    session._stop_event.set()
+    session.on_status_update = None
 
-    try:
-        await task
-    except asyncio.CancelledError:
-        pass
+    await session._status_loop_step()
 
 
 @pytest.mark.asyncio
-async def test_checkpoint_loop_cancel_breaks_cleanly(monkeypatch):
-    """Test _checkpoint_loop handles CancelledError and breaks."""
+async def test_checkpoint_step_saves_checkpoint(monkeypatch):
+    """Test the checkpoint step saves the piece manager's checkpoint."""
     from ccbt.session.session import AsyncTorrentSession
 
+    saved = []
+
     class _CPM:
-        async def save_checkpoint(self, cp):
-            pass
+        async def save_checkpoint(self, cp, changed_pieces=None):
+            saved.append(cp)
 
     class _PM:
         async def get_checkpoint_state(self, name, ih, path):
@@ -112,24 +93,16 @@ async def test_checkpoint_loop_cancel_breaks_cleanly(monkeypatch):
     session = AsyncTorrentSession(td, ".")
     session.checkpoint_manager = _CPM()
     session.piece_manager = _PM()
-    session._stop_event = asyncio.Event()
-    session.config.disk.checkpoint_interval = 0.01
 
-    task = asyncio.create_task(session._checkpoint_loop())
-    await asyncio.sleep(0.01)
-    task.cancel()
-    session._stop_event.set()
+    await session._checkpoint_loop_step()
 
-    try:
-        await task
-    except asyncio.CancelledError:
-        pass
+    assert len(saved) == 1
 
 
 @pytest.mark.asyncio
-async def test_announce_loop_handles_exception_gracefully(monkeypatch):
-    """Test _announce_loop handles exception gracefully without crashing."""
-    from ccbt.session.session import AsyncTorrentSession
+async def test_announce_step_handles_exception_gracefully(monkeypatch):
+    """Test a failed announce is logged and retried later, not raised."""
+    from ccbt.session.session import ANNOUNCE_RETRY_INTERVAL, AsyncTorrentSession
 
     call_count = []
 
@@ -138,39 +111,29 @@ async def test_announce_loop_handles_exception_gracefully(monkeypatch):
             pass
         async def stop(self):
             pass
-        async def announce(self, td):
+        async def announce(self, td, port=6881):
             call_count.append(1)
             raise RuntimeError("announce failed")  # Always fail
 
     td = {
         "name": "test",
         "info_hash": b"1" * 20,
+        "announce": "http://tracker.example.com/announce",
         "pieces_info": {"num_pieces": 0, "piece_length": 0, "piece_hashes": [], "total_length": 0},
         "file_info": {"total_length": 0},
     }
 
     session = AsyncTorrentSession(td, ".")
     session.tracker = _Tracker()
-    session._stop_event = asyncio.Event()
     session.config.network.announce_interval = 0.01
 
-    task = asyncio.create_task(session._announce_loop())
-    await asyncio.sleep(0.02)  # Allow for one attempt
-    task.cancel()
-    session._stop_event.set()
-
-    try:
-        await task
-    except asyncio.CancelledError:
-        pass
-
-    # Loop should have attempted at least once despite error
-    assert len(call_count) >= 1
+    assert await session._announce_loop_step() == ANNOUNCE_RETRY_INTERVAL
+    assert len(call_count) == 1
 
 
 @pytest.mark.asyncio
-async def test_status_loop_calls_on_status_update(monkeypatch):
-    """Test _status_loop calls on_status_update callback."""
+async def test_status_step_calls_on_status_update(monkeypatch):
+    """Test the status step calls on_status_update callback."""
     from ccbt.session.session import AsyncTorrentSession
 
     callback_called = []
@@ -192,16 +155,49 @@ async def test_status_loop_calls_on_status_update(monkeypatch):
     session = AsyncTorrentSession(td, ".")
     session.download_manager = _DM()
     session.on_status_update = _cb
-    session._stop_event = asyncio.Event()
 
-    task = asyncio.create_task(session._status_loop())
-    await asyncio.sleep(0.1)
-    task.cancel()
+    await session._status_loop_step()
+
+    assert len(callback_called) == 1
+
 
-    try:
-        await task
-    except asyncio.CancelledError:
-        pass
+@pytest.mark.asyncio
+async def test_announce_step_connects_tracker_peers(monkeypatch):
+    """Test tracker peers reach the peer manager, announcing our listen port."""
+    from unittest.mock import AsyncMock, MagicMock
+
+    from ccbt.models import PeerInfo
+    from ccbt.session.session import AsyncTorrentSession
 
-    assert len(callback_called) > 0
+    td = {
+        "name": "test",
+        "info_hash": b"1" * 20,
+        "announce": "http://tracker.example.com/announce",
+        "pieces_info": {"num_pieces": 0, "piece_length": 0, "piece_hashes": [], "total_length": 0},
+        "file_info": {"total_length": 0},
+    }
 
+    session = AsyncTorrentSession(td, ".")
+    session.config.network.listen_port_tcp = 51413
+    session.tracker = MagicMock()
+    session.tracker.announce = AsyncMock(
+        return_value=type(
+            "Response",
+            (),
+            {
+                "peers": [
+                    PeerInfo(ip="127.0.0.1", port=51413),
+                    PeerInfo(ip="10.0.0.2", port=6881),
+                ]
+            },
+        )()
+    )
+    session.download_manager.peer_manager = MagicMock()
+    session.download_manager.peer_manager.connect_to_peers = AsyncMock()
+
+    await session._announce_loop_step()
+
+    session.tracker.announce.assert_awaited_once_with(td, port=51413)
+    session.download_manager.peer_manager.connect_to_peers.assert_awaited_once_with(
+        [{"ip": "10.0.0.2", "port": 6881, "peer_source": "tracker"}]
+    )
@@ -14,7 +14,7 @@ async def test_save_checkpoint_enriches_announce_and_display_name(monkeypatch):
     checkpoint_saved = []
 
     class _CPM:
-        async def save_checkpoint(self, cp):
+        async def save_checkpoint(self, cp, changed_pieces=None):
             checkpoint_saved.append(cp)
 
     class _PM:
@@ -117,7 +117,7 @@ async def test_save_checkpoint_with_torrent_file_path(monkeypatch):
     checkpoint_saved = []
 
     class _CPM:
-        async def save_checkpoint(self, cp):
+        async def save_checkpoint(self, cp, changed_pieces=None):
             checkpoint_saved.append(cp)
 
     class _PM:
@@ -176,3 +176,52 @@ async def test_save_checkpoint_exception_logs(monkeypatch):
     with pytest.raises(RuntimeError):
         await session._save_checkpoint()
 
+
+
+@pytest.mark.asyncio
+async def test_save_checkpoint_passes_verified_pieces(monkeypatch):
+    """Test _save_checkpoint journals the pieces verified since the last save."""
+    from ccbt.session.session import AsyncTorrentSession
+
+    saved = []
+    fail = []
+
+    class _CPM:
+        async def save_checkpoint(self, cp, changed_pieces=None):
+            if fail:
+                raise RuntimeError("disk full")
+            saved.append(set(changed_pieces))
+
+    class _PM:
+        async def get_checkpoint_state(self, name, ih, path):
+            return TorrentCheckpoint(
+                info_hash=b"1" * 20,
+                torrent_name=name,
+                total_pieces=4,
+                piece_length=16384,
+                total_length=4 * 16384,
+                output_dir=path,
+            )
+
+    td = {
+        "name": "test",
+        "info_hash": b"1" * 20,
+        "pieces_info": {"num_pieces": 4, "piece_length": 16384, "piece_hashes": [b"x" * 20] * 4, "total_length": 4 * 16384},
+        "file_info": {"total_length": 4 * 16384},
+    }
+
+    session = AsyncTorrentSession(td, ".")
+    session.config.disk.checkpoint_on_piece = False
+    session.checkpoint_manager = _CPM()
+    session.download_manager = type("_DM", (), {"piece_manager": _PM()})()
+
+    await session._on_piece_verified(1)
+    await session._on_piece_verified(3)
+    fail.append(True)
+    with pytest.raises(RuntimeError):
+        await session._save_checkpoint()
+    fail.clear()
+    await session._save_checkpoint()
+    await session._save_checkpoint()
+
+    assert saved == [{1, 3}, set()]
@@ -5,7 +5,6 @@ Focuses on uncovered paths that can be tested without network dependencies.
 
 from __future__ import annotations
 
-import asyncio
 import time
 from pathlib import Path
 from types import SimpleNamespace
@@ -14,7 +13,11 @@ from unittest.mock import AsyncMock, MagicMock, Mock, patch
 import pytest
 
 from ccbt.models import FileInfo, TorrentInfo
-from ccbt.session.session import AsyncSessionManager, AsyncTorrentSession
+from ccbt.session.session import (
+    ANNOUNCE_RETRY_INTERVAL,
+    AsyncSessionManager,
+    AsyncTorrentSession,
+)
 
 
 @pytest.mark.unit
@@ -237,7 +240,7 @@ class TestSessionPrivateTorrentExtraction:
 @pytest.mark.unit
 @pytest.mark.session
 class TestSessionAnnounceLoop:
-    """Test _announce_loop paths."""
+    """Test _announce_loop_step paths."""
 
     @pytest.mark.asyncio
     async def test_announce_loop_with_peers_and_sync_add_peers(self, tmp_path):
@@ -247,6 +250,7 @@ class TestSessionAnnounceLoop:
         td = {
             "name": "test",
             "info_hash": b"x" * 20,
+            "announce": "http://tracker.example.com/announce",
             "pieces_info": {
                 "num_pieces": 1,
                 "piece_length": 16384,
@@ -270,7 +274,7 @@ class TestSessionAnnounceLoop:
         session.download_manager = sync_dm
         
         # Mock tracker to return peers
-        async def mock_announce(_):
+        async def mock_announce(_, port=None):
             return TrackerResponse(
                 peers=[{"ip": "127.0.0.1", "port": 6881}],
                 interval=60,
@@ -281,24 +285,10 @@ class TestSessionAnnounceLoop:
         session.tracker = Mock()
         session.tracker.announce = mock_announce
         
-        # Start announce loop briefly
-        session._stop_event = asyncio.Event()
-        session._stop_event.set()  # Set immediately to prevent infinite loop
-        task = asyncio.create_task(session._announce_loop())
-        
-        # Wait with timeout
-        try:
-            await asyncio.wait_for(task, timeout=0.1)
-        except (asyncio.CancelledError, asyncio.TimeoutError):
-            task.cancel()
-            try:
-                await task
-            except asyncio.CancelledError:
-                pass
-        
-        # Verify sync add_peers was called (may not be called if stopped immediately)
-        # Just verify the test doesn't hang
-        assert True
+        session.config.network.announce_interval = 60
+        
+        assert await session._announce_loop_step() == 60
+        assert sync_dm.add_peers_called == [[{"ip": "127.0.0.1", "port": 6881}]]
 
     @pytest.mark.asyncio
     async def test_announce_loop_exception_handling(self, tmp_path):
@@ -306,6 +296,7 @@ class TestSessionAnnounceLoop:
         td = {
             "name": "test",
             "info_hash": b"x" * 20,
+            "announce": "http://tracker.example.com/announce",
             "pieces_info": {
                 "num_pieces": 1,
                 "piece_length": 16384,
@@ -318,40 +309,25 @@ class TestSessionAnnounceLoop:
         session = AsyncTorrentSession(td, str(tmp_path))
         
         # Mock tracker to raise exception
-        async def failing_announce(_):
+        async def failing_announce(_, port=None):
             raise RuntimeError("Tracker error")
         
         session.tracker = Mock()
         session.tracker.announce = failing_announce
         
-        with patch("ccbt.session.session.logging.getLogger") as mock_logger:
-            logger = Mock()
-            logger.warning = Mock()
-            mock_logger.return_value = logger
-            
-            session._stop_event = asyncio.Event()
-            session._stop_event.set()  # Set immediately to prevent infinite loop
-            task = asyncio.create_task(session._announce_loop())
-            
-            # Wait with timeout
-            try:
-                await asyncio.wait_for(task, timeout=0.1)
-            except (asyncio.CancelledError, asyncio.TimeoutError):
-                task.cancel()
-                try:
-                    await task
-                except asyncio.CancelledError:
-                    pass
-            
-            # Should log warning but not crash
-            # Note: May not be called if stopped immediately, just verify no hang
-            assert True
+        
+        # Should log warning but not crash
+        with patch.object(session.logger, "warning") as warning:
+            delay = await session._announce_loop_step()
+        
+        assert delay == ANNOUNCE_RETRY_INTERVAL
+        warning.assert_called_once()
 
 
 @pytest.mark.unit
 @pytest.mark.session
 class TestSessionStatusLoop:
-    """Test _status_loop paths."""
+    """Test _status_loop_step paths."""
 
     @pytest.mark.asyncio
     async def test_status_loop_with_get_status_error(self, tmp_path):
@@ -372,26 +348,14 @@ class TestSessionStatusLoop:
         
         # Mock download_manager.get_status to raise
         class FailingDM:
-            async def get_status(self):
+            def get_status(self):
                 raise RuntimeError("Status error")
         
         session.download_manager = FailingDM()
         session.on_status_update = None
-        session._stop_event = asyncio.Event()
-        session._stop_event.set()  # Set immediately to prevent infinite loop
-        
-        task = asyncio.create_task(session._status_loop())
-        
-        # Wait with timeout
-        try:
-            await asyncio.wait_for(task, timeout=0.1)
-        except (asyncio.CancelledError, asyncio.TimeoutError):
-            task.cancel()
-            try:
-                await task
-            except asyncio.CancelledError:
-                pass
+        
         # Should not crash
+        await session._status_loop_step()
 
 
 @pytest.mark.unit
@@ -573,7 +537,7 @@ class TestSessionCheckpointPaths:
         
         saved_checkpoint = []
         
-        async def capture_checkpoint(cp):
+        async def capture_checkpoint(cp, changed_pieces=None):
             saved_checkpoint.append(cp)
         
         session.checkpoint_manager = Mock()
@@ -27,9 +27,9 @@ async def test_pause_handles_checkpoint_save_error(monkeypatch, tmp_path):
     session.piece_manager = _PM()
     session.config.disk.checkpoint_enabled = True
     session._stop_event = asyncio.Event()
-    session._announce_task = None
-    session._status_task = None
-    session._checkpoint_task = None
+    session._announce_job = None
+    session._status_job = None
+    session._checkpoint_job = None
 
     # Mock components
     class _Tracker:
@@ -69,9 +69,9 @@ async def test_pause_stops_pex_manager(monkeypatch, tmp_path):
     session = AsyncTorrentSession(td, str(tmp_path))
     session.config.disk.checkpoint_enabled = False
     session._stop_event = asyncio.Event()
-    session._announce_task = None
-    session._status_task = None
-    session._checkpoint_task = None
+    session._announce_job = None
+    session._status_job = None
+    session._checkpoint_job = None
     session.pex_manager = _PEX()
 
     class _Tracker:
@@ -116,11 +116,10 @@ async def test_resume_propagates_exception(monkeypatch, tmp_path):
 
 @pytest.mark.asyncio
 async def test_announce_loop_with_torrent_info_model(monkeypatch, tmp_path):
-    """Test _announce_loop handles TorrentInfoModel torrent_data."""
+    """Test _announce_loop_step handles TorrentInfoModel torrent_data."""
     from ccbt.session.session import AsyncTorrentSession
     from ccbt.models import TorrentInfo
 
-    announce_called = []
     announce_data = []
 
     class _Tracker:
@@ -130,37 +129,35 @@ async def test_announce_loop_with_torrent_info_model(monkeypatch, tmp_path):
         async def stop(self):
             pass
 
-        async def announce(self, td):
-            announce_called.append(1)
+        async def announce(self, td, port=6881):
             announce_data.append(td)
+            return type("Response", (), {"peers": []})()
 
     # Create TorrentInfo model (not dict)
-    class _TorrentInfoModel:
-        def __init__(self):
-            self.info_hash = b"1" * 20
-            self.name = "model-torrent"
-            self.announce = "http://tracker.example.com/announce"
-
-    td_model = _TorrentInfoModel()
+    td_model = TorrentInfo(
+        name="model-torrent",
+        info_hash=b"1" * 20,
+        announce="http://tracker.example.com/announce",
+        total_length=0,
+        piece_length=16384,
+        num_pieces=0,
+    )
 
     session = AsyncTorrentSession({"name": "test", "info_hash": b"1" * 20, "pieces_info": {"num_pieces": 0, "piece_length": 0, "piece_hashes": [], "total_length": 0}, "file_info": {"total_length": 0}}, str(tmp_path))
     session.torrent_data = td_model  # Set as model
     session.tracker = _Tracker()
-    session._stop_event = asyncio.Event()
     session.config.network.announce_interval = 0.01
 
-    task = asyncio.create_task(session._announce_loop())
-    await asyncio.sleep(0.02)
-    task.cancel()
-    session._stop_event.set()
-
-    try:
-        await task
-    except asyncio.CancelledError:
-        pass
+    assert await session._announce_loop_step() == 0.01
 
-    # Should have attempted announce with model data
-    assert len(announce_called) >= 1 or len(announce_data) >= 1
+    # Should have announced with model data
+    assert announce_data == [
+        {
+            "info_hash": b"1" * 20,
+            "name": "model-torrent",
+            "announce": "http://tracker.example.com/announce",
+        }
+    ]
 
 
 @pytest.mark.asyncio
@@ -196,7 +193,9 @@ async def test_resume_from_checkpoint_with_validation_failure(monkeypatch, tmp_p
         def get_written_pieces(self):
             return set()
 
-        async def verify_existing_pieces(self, checkpoint):
+        async def verify_existing_pieces(
+            self, checkpoint, progress_callback=None, hash_executor=None
+        ):
             return {
                 "valid": False,
                 "missing_files": ["file1.txt"],
@@ -248,7 +247,9 @@ async def test_resume_from_checkpoint_with_missing_files_only(monkeypatch, tmp_p
         def get_written_pieces(self):
             return set()
 
-        async def verify_existing_pieces(self, checkpoint):
+        async def verify_existing_pieces(
+            self, checkpoint, progress_callback=None, hash_executor=None
+        ):
             return {
                 "valid": False,
                 "missing_files": ["file1.txt"],
@@ -299,7 +300,9 @@ async def test_resume_from_checkpoint_with_corrupted_pieces_only(monkeypatch, tm
         def get_written_pieces(self):
             return set()
 
-        async def verify_existing_pieces(self, checkpoint):
+        async def verify_existing_pieces(
+            self, checkpoint, progress_callback=None, hash_executor=None
+        ):
             return {
                 "valid": False,
                 # No missing_files
@@ -360,11 +363,11 @@ async def test_resume_from_checkpoint_without_file_assembler(monkeypatch, tmp_pa
 
 @pytest.mark.asyncio
 async def test_checkpoint_loop_handles_save_error(monkeypatch, tmp_path):
-    """Test _checkpoint_loop handles save errors gracefully."""
+    """Test _checkpoint_loop_step handles save errors gracefully."""
     from ccbt.session.session import AsyncTorrentSession
 
     class _CPM:
-        async def save_checkpoint(self, cp):
+        async def save_checkpoint(self, cp, changed_pieces=None):
             raise RuntimeError("save failed")
 
     class _PM:
@@ -381,18 +384,7 @@ async def test_checkpoint_loop_handles_save_error(monkeypatch, tmp_path):
     session = AsyncTorrentSession(td, str(tmp_path))
     session.checkpoint_manager = _CPM()
     session.piece_manager = _PM()
-    session._stop_event = asyncio.Event()
-    session.config.disk.checkpoint_interval = 0.01
-
-    task = asyncio.create_task(session._checkpoint_loop())
-    await asyncio.sleep(0.02)
-    task.cancel()
-    session._stop_event.set()
-
-    try:
-        await task
-    except asyncio.CancelledError:
-        pass
+    await session._checkpoint_loop_step()
 
     # Should not crash despite errors
 
@@ -112,7 +112,7 @@ async def test_on_piece_verified_saves_checkpoint_when_configured(monkeypatch, t
     checkpoint_saved = []
 
     class _CPM:
-        async def save_checkpoint(self, cp):
+        async def save_checkpoint(self, cp, changed_pieces=None):
             checkpoint_saved.append(cp)
 
     class _PM:
@@ -207,7 +207,9 @@ async def test_resume_from_checkpoint_in_session_loads_state(monkeypatch, tmp_pa
 
     # Mock download manager with file_assembler
     class _FA:
-        async def verify_existing_pieces(self, checkpoint):
+        async def verify_existing_pieces(
+            self, checkpoint, progress_callback=None, hash_executor=None
+        ):
             return {"valid": True}
         
         def get_written_pieces(self):
@@ -221,3 +223,125 @@ async def test_resume_from_checkpoint_in_session_loads_state(monkeypatch, tmp_pa
 
     await session._resume_from_checkpoint(checkpoint)
 
+
+
+@pytest.mark.asyncio
+async def test_peer_blocks_and_bitfields_reach_piece_manager(tmp_path):
+    """Test received blocks and bitfields are handed to the piece manager."""
+    import asyncio
+    from unittest.mock import AsyncMock, MagicMock
+
+    from ccbt.peer.peer import BitfieldMessage, PieceMessage
+    from ccbt.session.session import AsyncTorrentSession
+
+    td = {
+        "name": "test",
+        "info_hash": b"1" * 20,
+        "pieces_info": {"num_pieces": 1, "piece_length": 16384, "piece_hashes": [b"x" * 20], "total_length": 16384},
+        "file_info": {"total_length": 16384},
+    }
+
+    session = AsyncTorrentSession(td, str(tmp_path))
+    session.piece_manager.handle_piece_block = AsyncMock()
+    session.piece_manager.update_peer_availability = AsyncMock()
+    connection = MagicMock()
+    connection.peer_info = "10.0.0.1:6881"
+
+    session._on_peer_piece_received(connection, PieceMessage(0, 0, b"d" * 16384))
+    session._on_peer_bitfield_received(connection, BitfieldMessage(b"\x80"))
+    await asyncio.sleep(0)
+
+    session.piece_manager.handle_piece_block.assert_awaited_once_with(
+        0, 0, b"d" * 16384, peer_key="10.0.0.1:6881"
+    )
+    session.piece_manager.update_peer_availability.assert_awaited_once_with(
+        "10.0.0.1:6881", b"\x80"
+    )
+
+
+@pytest.mark.asyncio
+async def test_verified_piece_is_advertised_and_handled(tmp_path):
+    """Test a verified piece is announced to peers and runs the session handler."""
+    import asyncio
+    from unittest.mock import AsyncMock, MagicMock
+
+    from ccbt.session.session import AsyncTorrentSession
+
+    td = {
+        "name": "test",
+        "info_hash": b"1" * 20,
+        "pieces_info": {"num_pieces": 1, "piece_length": 16384, "piece_hashes": [b"x" * 20], "total_length": 16384},
+        "file_info": {"total_length": 16384},
+    }
+
+    session = AsyncTorrentSession(td, str(tmp_path))
+    session.download_manager.peer_manager = MagicMock()
+    session.download_manager.peer_manager.broadcast_have = AsyncMock()
+    session._on_piece_verified = AsyncMock()
+    session._on_download_complete = AsyncMock()
+
+    session._on_piece_hash_verified(0)
+    session._on_pieces_complete()
+    await asyncio.sleep(0)
+
+    session.download_manager.peer_manager.broadcast_have.assert_awaited_once_with(0)
+    session._on_piece_verified.assert_awaited_once_with(0)
+    session._on_download_complete.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_peer_disconnect_reaches_piece_manager(tmp_path):
+    """Test a disconnected peer is forgotten by the piece manager."""
+    import asyncio
+    from unittest.mock import AsyncMock, MagicMock
+
+    from ccbt.session.session import AsyncTorrentSession
+
+    td = {
+        "name": "test",
+        "info_hash": b"1" * 20,
+        "pieces_info": {"num_pieces": 1, "piece_length": 16384, "piece_hashes": [b"x" * 20], "total_length": 16384},
+        "file_info": {"total_length": 16384},
+    }
+
+    session = AsyncTorrentSession(td, str(tmp_path))
+    session.piece_manager.handle_peer_disconnected = AsyncMock()
+    connection = MagicMock()
+    connection.peer_info = "10.0.0.1:6881"
+
+    session._on_peer_disconnected(connection)
+    await asyncio.sleep(0)
+
+    session.piece_manager.handle_peer_disconnected.assert_awaited_once_with(
+        "10.0.0.1:6881"
+    )
+
+
+@pytest.mark.asyncio
+async def test_accept_incoming_peer_hands_off_to_peer_manager(tmp_path):
+    """Test a routed incoming connection is accepted by the peer manager."""
+    from unittest.mock import AsyncMock, MagicMock
+
+    from ccbt.session.session import AsyncTorrentSession
+
+    td = {
+        "name": "test",
+        "info_hash": b"1" * 20,
+        "pieces_info": {"num_pieces": 1, "piece_length": 16384, "piece_hashes": [b"x" * 20], "total_length": 16384},
+        "file_info": {"total_length": 16384},
+    }
+
+    session = AsyncTorrentSession(td, str(tmp_path))
+    reader, writer, handshake = AsyncMock(), MagicMock(), MagicMock()
+
+    session.download_manager.peer_manager = None
+    await session.accept_incoming_peer(reader, writer, handshake, "10.0.0.1", 6881)
+    writer.close.assert_called_once()
+
+    session.download_manager.peer_manager = MagicMock()
+    session.download_manager.peer_manager.accept_incoming = AsyncMock()
+    await session.accept_incoming_peer(reader, writer, handshake, "10.0.0.1", 6881)
+
+    session.download_manager.peer_manager.accept_incoming.assert_awaited_once_with(
+        reader, writer, handshake, "10.0.0.1", 6881
+    )
@@ -60,6 +60,22 @@ class TestSessionManagerLifecycle:
         # Should not raise
         await manager.stop()
 
+    @pytest.mark.asyncio
+    async def test_stop_clears_info_hash_router(self, tmp_path):
+        """Test stopping the manager drops stopped sessions from the router."""
+        manager = AsyncSessionManager(output_dir=str(tmp_path))
+        info_hash = b"\x11" * 20
+        session = MagicMock()
+        session.stop = AsyncMock()
+        manager.torrents[info_hash] = session
+        manager.info_hash_router.register(info_hash, session)
+
+        await manager.stop()
+
+        assert not manager.torrents
+        assert manager.info_hash_router.get(info_hash) is None
+        assert len(manager.info_hash_router) == 0
+
 
 class TestSessionManagerAddTorrent:
     """Test adding torrents to session manager."""
@@ -2,14 +2,14 @@
 
 from __future__ import annotations
 
-import asyncio
 from pathlib import Path
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
 from ccbt.models import FileInfo, TorrentInfo
-from ccbt.session.session import AsyncTorrentSession, AsyncSessionManager
+from ccbt.session.session import AsyncSessionManager, AsyncTorrentSession
+from ccbt.utils.tasks import get_scheduler
 
 
 @pytest.mark.unit
@@ -305,10 +305,14 @@ class TestSessionMissingCoverage:
         
         session = AsyncTorrentSession(td, str(tmp_path))
         
-        # Create background tasks
-        session._announce_task = asyncio.create_task(asyncio.sleep(10))
-        session._status_task = asyncio.create_task(asyncio.sleep(10))
-        session._checkpoint_task = asyncio.create_task(asyncio.sleep(10))
+        # Register periodic jobs
+        scheduler = get_scheduler()
+        announce_job = scheduler.schedule(AsyncMock(), 10.0, name="announce")
+        status_job = scheduler.schedule(AsyncMock(), 10.0, name="status")
+        checkpoint_job = scheduler.schedule(AsyncMock(), 10.0, name="checkpoint")
+        session._announce_job = announce_job
+        session._status_job = status_job
+        session._checkpoint_job = checkpoint_job
         
         # Mock stop methods
         session.tracker.stop = AsyncMock()
@@ -320,10 +324,11 @@ class TestSessionMissingCoverage:
         
         await session.stop()
         
-        # Verify tasks were cancelled
-        assert session._announce_task.cancelled()
-        assert session._status_task.cancelled()
-        assert session._checkpoint_task.cancelled()
+        # Verify jobs were cancelled
+        assert announce_job.cancelled
+        assert status_job.cancelled
+        assert checkpoint_job.cancelled
+        assert session._announce_job is None
         
         # Verify components stopped
         session.tracker.stop.assert_called_once()
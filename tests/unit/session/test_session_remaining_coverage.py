@@ -255,7 +255,7 @@ async def test_aggregate_torrent_stats_with_torrents(monkeypatch):
 
 @pytest.mark.asyncio
 async def test_status_loop_with_callback_error(monkeypatch, tmp_path):
-    """Test _status_loop handles callback errors (lines 344-353)."""
+    """Test _status_loop_step handles callback errors."""
     from ccbt.session.session import AsyncTorrentSession
 
     class _DM:
@@ -275,18 +275,7 @@ async def test_status_loop_with_callback_error(monkeypatch, tmp_path):
     session = AsyncTorrentSession(td, str(tmp_path))
     session.download_manager = _DM()
     session.on_status_update = _failing_callback
-    import asyncio
-    session._stop_event = asyncio.Event()
-
-    task = asyncio.create_task(session._status_loop())
-    await asyncio.sleep(0.02)
-    task.cancel()
-    session._stop_event.set()
-
-    try:
-        await task
-    except asyncio.CancelledError:
-        pass
+    await session._status_loop_step()
 
     # Should not crash despite callback error
 
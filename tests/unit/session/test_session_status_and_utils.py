@@ -184,7 +184,7 @@ async def test_pause_saves_checkpoint(monkeypatch, tmp_path):
     checkpoint_saved = []
 
     class _CPM:
-        async def save_checkpoint(self, cp):
+        async def save_checkpoint(self, cp, changed_pieces=None):
             checkpoint_saved.append(cp)
 
     class _PM:
@@ -229,13 +229,10 @@ async def test_pause_saves_checkpoint(monkeypatch, tmp_path):
 
 @pytest.mark.asyncio
 async def test_resume_starts_background_tasks(monkeypatch, tmp_path):
-    """Test resume starts background tasks."""
-    from ccbt.session.session import AsyncTorrentSession
-
-    tasks_started = []
+    """Test resume schedules the periodic jobs."""
+    from unittest.mock import AsyncMock
 
-    async def _mock_task():
-        tasks_started.append(1)
+    from ccbt.session.session import AsyncTorrentSession
 
     td = {
         "name": "test",
@@ -248,13 +245,15 @@ async def test_resume_starts_background_tasks(monkeypatch, tmp_path):
     session._stop_event = type("Event", (), {"clear": lambda: None})()
     session._background_tasks = []
     
-    # Mock background task methods
-    session._announce_loop = _mock_task
-    session._status_loop = _mock_task
-    session._checkpoint_loop = _mock_task
+    # Mock the periodic job steps
+    session._announce_loop_step = AsyncMock(return_value=60.0)
+    session._status_loop_step = AsyncMock()
+    session._checkpoint_loop_step = AsyncMock()
 
     await session.resume()
 
-    # Tasks should have been started (or at least attempted)
-    # Note: actual task creation might be mocked differently
+    # Jobs run on the shared scheduler rather than per-torrent tasks
+    assert session._announce_job is not None
+    assert session._status_job is not None
+    session._cancel_jobs()
 
@@ -0,0 +1,209 @@
+"""Tests for the paginated, projected torrent and peer listings."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from ccbt.session.torrent_index import ListQuery, TorrentIndex, query_peers
+
+
+def status(**fields):
+    """Build a get_status() entry with defaults."""
+    row = {"name": "t", "status": "downloading", "downloaded": 0, "uploaded": 0}
+    row.update(fields)
+    return row
+
+
+@pytest.fixture
+def index():
+    """Index over five torrents in two states."""
+    index = TorrentIndex()
+    index.update(
+        {
+            f"{i:02x}" * 20: status(
+                name=f"t{i}",
+                status="seeding" if i % 2 else "downloading",
+                downloaded=100,
+                uploaded=50 * i,
+                download_rate=None,
+            )
+            for i in range(5)
+        }
+    )
+    return index
+
+
+def walk(index: TorrentIndex, query: ListQuery) -> list[list[dict]]:
+    """Follow next_cursor until the last page."""
+    pages = []
+    while True:
+        page = index.query(query)
+        pages.append(page["torrents"])
+        if page["next_cursor"] is None:
+            return pages
+        query.cursor = page["next_cursor"]
+
+
+class TestTorrentIndex:
+    """Test filtering, sorting and keyset paging over status rows."""
+
+    def test_pages_cover_all_rows_once(self, index):
+        """Test cursor paging visits every torrent in info hash order."""
+        pages = walk(index, ListQuery(fields=frozenset({"name"}), limit=2))
+        assert [len(page) for page in pages] == [2, 2, 1]
+        rows = [row for page in pages for row in page]
+        assert [row["name"] for row in rows] == [f"t{i}" for i in range(5)]
+        # Only requested fields, plus the key
+        assert set(rows[0]) == {"info_hash", "name"}
+
+    def test_sort_descending_and_defaults(self, index):
+        """Test sorting on a field, with missing values defaulted."""
+        page = index.query(ListQuery(sort="-ratio", limit=2))
+        assert [row["ratio"] for row in page["torrents"]] == [2.0, 1.5]
+        assert page["total"] == 5
+        assert page["torrents"][0]["download_rate"] == 0.0
+
+        pages = walk(index, ListQuery(sort="-ratio", limit=2))
+        assert [row["name"] for page in pages for row in page] == [
+            "t4",
+            "t3",
+            "t2",
+            "t1",
+            "t0",
+        ]
+
+    def test_filters(self, index):
+        """Test state and ratio filters, and the filtered total."""
+        page = index.query(ListQuery(states=frozenset({"seeding"}), min_ratio=1.0))
+        assert [row["name"] for row in page["torrents"]] == ["t3"]
+        assert page["total"] == 1
+
+        page = index.query(ListQuery(max_ratio=0.5, limit=1))
+        assert [row["name"] for row in page["torrents"]] == ["t0"]
+        assert page["total"] == 2
+        assert page["next_cursor"] is not None
+
+    def test_rows_removed_between_pages(self, index):
+        """Test a keyset cursor survives torrents being removed."""
+        first = index.query(ListQuery(limit=2))
+        index.update({ih: status() for ih in list(index.rows)[1:]})
+        second = index.query(ListQuery(limit=2, cursor=first["next_cursor"]))
+        assert [row["info_hash"] for row in second["torrents"]] == [
+            f"{i:02x}" * 20 for i in (2, 3)
+        ]
+
+    def test_set_status_moves_changed_rows(self, index):
+        """Test per-torrent updates keep cached orders sorted without a resort."""
+        index.query(ListQuery(sort="ratio"))
+        index.query(ListQuery(sort="name"))
+        first = "00" * 20
+
+        index.set_status(
+            first, status(name="t0", status="seeding", downloaded=100, uploaded=300)
+        )
+        index.set_status("ff" * 20, status(name="new", downloaded=100, uploaded=100))
+
+        for field, order in index._orders.items():
+            assert order == sorted((row[field], ih) for ih, row in index.rows.items())
+        page = index.query(ListQuery(sort="-ratio", limit=1))
+        assert page["torrents"][0]["name"] == "t0"
+        page = index.query(ListQuery(states=frozenset({"seeding"})))
+        assert [row["name"] for row in page["torrents"]] == ["t0", "t1", "t3"]
+
+        index.remove(first)
+        index.remove("ee" * 20)
+
+        assert first not in index.rows
+        assert all(ih != first for _, ih in index._orders["ratio"])
+        assert index.query(ListQuery(states=frozenset({"seeding"})))["total"] == 2
+
+    def test_invalid_queries(self, index):
+        """Test bad sort fields, cursors and limits are rejected."""
+        with pytest.raises(ValueError, match="sort"):
+            index.query(ListQuery(sort="nope"))
+        with pytest.raises(ValueError, match="cursor"):
+            index.query(ListQuery(cursor="!!"))
+        cursor = index.query(ListQuery(limit=1))["next_cursor"]
+        with pytest.raises(ValueError, match="sort order"):
+            index.query(ListQuery(sort="ratio", cursor=cursor))
+        with pytest.raises(ValueError, match="limit"):
+            ListQuery(limit=5000)
+
+    def test_params_round_trip(self):
+        """Test a query survives encoding as URL parameters."""
+        query = ListQuery(
+            fields=frozenset({"name", "progress"}),
+            limit=10,
+            sort="-progress",
+            states=frozenset({"seeding"}),
+            min_ratio=1.0,
+        )
+        assert ListQuery.from_params(query.to_params()) == query
+        keys_only = ListQuery(fields=frozenset())
+        assert ListQuery.from_params(keys_only.to_params()) == keys_only
+
+
+@pytest.mark.asyncio
+async def test_session_manager_samples_only_new_torrents():
+    """Test query_torrents reads rows kept by status jobs, sampling only new ones."""
+    from ccbt.session.session import AsyncSessionManager
+
+    manager = AsyncSessionManager(".")
+    known = MagicMock(get_status=AsyncMock())
+    added = MagicMock(get_status=AsyncMock(return_value=status(name="added")))
+    manager.torrents = {b"\x01" * 20: known, b"\x02" * 20: added}
+    manager.torrent_index.set_status("01" * 20, status(name="known"))
+    for removed in ("03", "04"):
+        manager.torrent_index.set_status(removed * 20, status(name="removed"))
+
+    page = await manager.query_torrents(ListQuery(sort="name"))
+
+    assert [row["name"] for row in page["torrents"]] == ["added", "known"]
+    known.get_status.assert_not_called()
+    added.get_status.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_status_job_updates_manager_index():
+    """Test a session's status job refreshes its row in the manager's index."""
+    from ccbt.session.session import AsyncTorrentSession
+
+    manager = MagicMock()
+    session = AsyncTorrentSession(
+        {
+            "name": "t",
+            "info_hash": b"\x07" * 20,
+            "pieces_info": {"num_pieces": 0, "piece_length": 0, "piece_hashes": [], "total_length": 0},
+            "file_info": {"total_length": 0},
+        },
+        ".",
+        manager,
+    )
+    session.get_status = AsyncMock(return_value=status(name="t", progress=0.5))
+
+    await session._status_loop_step()
+
+    manager.torrent_index.set_status.assert_called_once_with(
+        "07" * 20, status(name="t", progress=0.5)
+    )
+
+
+def test_query_peers_projects_and_sorts():
+    """Test peers are sorted, paged and limited to requested fields."""
+    peers = [
+        {"ip": "10.0.0.1", "port": 1, "download_rate": 5.0, "client": "a"},
+        {"ip": "10.0.0.2", "port": 2, "download_rate": None, "client": "b"},
+        {"ip": "10.0.0.3", "port": 3, "download_rate": 9.0, "client": "c"},
+    ]
+    page = query_peers(
+        peers, ListQuery(fields=frozenset({"download_rate"}), sort="-download_rate")
+    )
+    assert [p["port"] for p in page["peers"]] == [3, 1, 2]
+    assert set(page["peers"][0]) == {"ip", "port", "download_rate"}
+
+    first = query_peers(peers, ListQuery(limit=2))
+    rest = query_peers(peers, ListQuery(limit=2, cursor=first["next_cursor"]))
+    assert [p["port"] for p in first["peers"] + rest["peers"]] == [1, 2, 3]
+    assert rest["next_cursor"] is None
@@ -0,0 +1,229 @@
+"""Tests for incremental binary checkpoints (snapshot plus journal)."""
+
+from __future__ import annotations
+
+import msgpack
+import pytest
+
+pytestmark = [pytest.mark.unit, pytest.mark.checkpoint]
+
+from ccbt.models import CheckpointFormat, DiskConfig, PieceState, TorrentCheckpoint
+from ccbt.storage.checkpoint import CheckpointManager
+from ccbt.storage.checkpoint_journal import (
+    CheckpointJournal,
+    JournalState,
+    RecordType,
+    apply_records,
+    decode_piece_states,
+    encode_piece_states,
+)
+
+INFO_HASH = b"\x5a" * 20
+TOTAL_PIECES = 50_000
+
+
+def _checkpoint(verified: list[int], states: dict[int, PieceState] | None = None):
+    return TorrentCheckpoint(
+        info_hash=INFO_HASH,
+        torrent_name="big",
+        total_pieces=TOTAL_PIECES,
+        piece_length=16384,
+        total_length=TOTAL_PIECES * 16384,
+        verified_pieces=verified,
+        piece_states=states or {},
+        output_dir="/tmp/big",
+    )
+
+
+@pytest.fixture
+def config(tmp_path):
+    """Binary checkpoints with journaling."""
+    return DiskConfig(
+        checkpoint_enabled=True,
+        checkpoint_format=CheckpointFormat.BINARY,
+        checkpoint_dir=str(tmp_path),
+        checkpoint_incremental=True,
+    )
+
+
+@pytest.fixture
+def manager(config):
+    """Checkpoint manager."""
+    return CheckpointManager(config)
+
+
+class TestJournalRecords:
+    """Test journal encoding and replay."""
+
+    def test_piece_state_codes_round_trip(self):
+        """Test piece states survive encoding as code bytes."""
+        states = {
+            0: PieceState.VERIFIED,
+            7: PieceState.DOWNLOADING,
+            9: PieceState.MISSING,
+        }
+
+        codes = encode_piece_states(states, 10)
+
+        assert len(codes) == 10
+        assert decode_piece_states(codes) == states
+
+    def test_diff_only_contains_changes(self):
+        """Test a diff lists new pieces and is empty when nothing changed."""
+        state = JournalState.from_checkpoint(_checkpoint([1, 2]))
+
+        records = state.diff(_checkpoint([1, 2, 3], {3: PieceState.VERIFIED}))
+
+        assert [t for t, _ in records] == [
+            RecordType.VERIFIED,
+            RecordType.PIECE_STATES,
+            RecordType.METADATA,
+        ]
+        assert records[0][1] == (3).to_bytes(4, "little")
+        assert state.diff(_checkpoint([1, 2, 3], {3: PieceState.VERIFIED})) == []
+
+    def test_diff_of_changed_pieces(self):
+        """Test a diff given the changed pieces compares only those pieces."""
+        state = JournalState.from_checkpoint(_checkpoint([1]))
+
+        # Piece 7 differs too but was not reported as changed
+        records = state.diff(
+            _checkpoint([1, 2, 7], {2: PieceState.VERIFIED, 7: PieceState.VERIFIED}),
+            changed_pieces=[1, 2],
+        )
+
+        assert records[0] == (RecordType.VERIFIED, (2).to_bytes(4, "little"))
+        assert state.verified == {1, 2}
+        assert state.piece_states == {2: PieceState.VERIFIED}
+
+    def test_diff_dumps_only_changed_metadata(self):
+        """Test the metadata record holds only the fields that changed."""
+        state = JournalState.from_checkpoint(_checkpoint([]))
+        latest = _checkpoint([])
+        latest.endgame_mode = True
+        latest.download_stats = state.metadata["download_stats"]
+
+        records = state.diff(latest)
+
+        assert [t for t, _ in records] == [RecordType.METADATA]
+        assert set(msgpack.unpackb(records[0][1], raw=False)) == {
+            "endgame_mode",
+            "updated_at",
+        }
+
+    def test_torn_and_corrupt_tails_are_ignored(self, tmp_path):
+        """Test reading stops at the first incomplete or corrupt record."""
+        path = tmp_path / "j.journal"
+        journal = CheckpointJournal.create(path, INFO_HASH, b"12345678")
+        state = JournalState.from_checkpoint(_checkpoint([]))
+        journal.append(state.diff(_checkpoint([1])))
+        good_size = journal.size
+        journal.append(state.diff(_checkpoint([1, 2])))
+        journal.close()
+
+        data = path.read_bytes()
+        path.write_bytes(data[:-3])
+        verified: set[int] = set()
+        apply_records(
+            CheckpointJournal.read(path, INFO_HASH, b"12345678"), verified, {}, {}
+        )
+        assert verified == {1}
+
+        corrupt = bytearray(data)
+        corrupt[good_size + 9] ^= 0xFF
+        path.write_bytes(bytes(corrupt))
+        verified = set()
+        apply_records(
+            CheckpointJournal.read(path, INFO_HASH, b"12345678"), verified, {}, {}
+        )
+        assert verified == {1}
+
+    def test_journal_of_other_snapshot_is_ignored(self, tmp_path):
+        """Test records are not replayed onto a different snapshot."""
+        path = tmp_path / "j.journal"
+        journal = CheckpointJournal.create(path, INFO_HASH, b"aaaaaaaa")
+        journal.append(JournalState().diff(_checkpoint([1])))
+        journal.close()
+
+        assert list(CheckpointJournal.read(path, INFO_HASH, b"bbbbbbbb")) == []
+        assert list(CheckpointJournal.read(path, b"\x00" * 20, b"aaaaaaaa")) == []
+
+
+class TestIncrementalCheckpoints:
+    """Test CheckpointManager saves through the journal."""
+
+    @pytest.mark.asyncio
+    async def test_saves_append_to_journal(self, manager):
+        """Test later saves append a few bytes instead of rewriting the snapshot."""
+        path = await manager.save_checkpoint(_checkpoint(list(range(100))))
+        snapshot = path.read_bytes()
+        journal_path = manager._get_journal_path(INFO_HASH)
+        header_size = journal_path.stat().st_size
+
+        for i in range(100, 110):
+            await manager.save_checkpoint(
+                _checkpoint(list(range(i + 1)), {i: PieceState.VERIFIED})
+            )
+
+        assert path.read_bytes() == snapshot
+        assert journal_path.stat().st_size - header_size < 10 * 128
+
+    @pytest.mark.asyncio
+    async def test_load_replays_journal(self, manager, config):
+        """Test a new manager sees the journaled changes."""
+        await manager.save_checkpoint(_checkpoint([0, 1], {2: PieceState.DOWNLOADING}))
+        latest = _checkpoint([0, 1, 2, 40_000], {2: PieceState.VERIFIED})
+        latest.endgame_mode = True
+        await manager.save_checkpoint(latest)
+        await manager.save_checkpoint(_checkpoint([0, 1, 2, 40_000], {}))
+
+        loaded = await CheckpointManager(config).load_checkpoint(INFO_HASH)
+
+        assert loaded is not None
+        assert loaded.verified_pieces == [0, 1, 2, 40_000]
+        assert loaded.piece_states == {}
+        assert loaded.endgame_mode is False
+        assert loaded.torrent_name == "big"
+
+    @pytest.mark.asyncio
+    async def test_compaction_starts_new_journal(self, manager, config):
+        """Test an oversized journal is folded into a new snapshot."""
+        manager.JOURNAL_COMPACT_MIN = 0
+        manager.JOURNAL_COMPACT_RATIO = 0
+        path = await manager.save_checkpoint(_checkpoint([0]))
+        first = path.read_bytes()
+
+        await manager.save_checkpoint(_checkpoint([0, 1]))
+
+        assert path.read_bytes() != first
+        loaded = await CheckpointManager(config).load_checkpoint(INFO_HASH)
+        assert loaded is not None
+        assert loaded.verified_pieces == [0, 1]
+
+    @pytest.mark.asyncio
+    async def test_stale_journal_after_new_snapshot(self, manager, config):
+        """Test a journal left from an earlier snapshot is not replayed."""
+        await manager.save_checkpoint(_checkpoint([0]))
+        await manager.save_checkpoint(_checkpoint([0, 5]))
+        journal_path = manager._get_journal_path(INFO_HASH)
+        stale = journal_path.read_bytes()
+        await manager.flush_journals()
+
+        # Next session writes a new snapshot; simulate a crash before its
+        # journal replaced the old one
+        await manager.save_checkpoint(_checkpoint([0, 7]))
+        journal_path.write_bytes(stale)
+
+        loaded = await CheckpointManager(config).load_checkpoint(INFO_HASH)
+        assert loaded is not None
+        assert loaded.verified_pieces == [0, 7]
+
+    @pytest.mark.asyncio
+    async def test_delete_removes_journal(self, manager):
+        """Test deleting a checkpoint deletes its journal."""
+        await manager.save_checkpoint(_checkpoint([0]))
+        journal_path = manager._get_journal_path(INFO_HASH)
+        assert journal_path.exists()
+
+        assert await manager.delete_checkpoint(INFO_HASH)
+        assert not journal_path.exists()
@@ -0,0 +1,315 @@
+"""Tests for resume verification of checkpointed pieces."""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+pytestmark = [pytest.mark.unit, pytest.mark.storage]
+
+from ccbt.models import FileCheckpoint, FileInfo, TorrentCheckpoint
+from ccbt.session.fast_resume import FastResumeLoader
+from ccbt.storage.file_assembler import AsyncFileAssembler
+from ccbt.storage.resume_data import FastResumeData
+from ccbt.storage.resume_verifier import ResumeVerifier
+
+PIECE_LENGTH = 1024
+
+
+@pytest.fixture
+def torrent(tmp_path):
+    """Multi-file torrent with a padding file, written to disk.
+
+    Pieces 0-1 are in a, piece 2 spans a, b and the padding, and pieces 3-4
+    are in c (piece 4 is 10 bytes).
+    """
+    rng = random.Random(3)
+    a = rng.randbytes(2 * PIECE_LENGTH + 300)
+    b = rng.randbytes(PIECE_LENGTH - 300 - 100)
+    c = rng.randbytes(PIECE_LENGTH + 10)
+    content = a + b + bytes(100) + c
+    pieces = [
+        hashlib.sha1(content[i : i + PIECE_LENGTH]).digest()  # nosec B324
+        for i in range(0, len(content), PIECE_LENGTH)
+    ]
+    files = [
+        FileInfo(name="a", length=len(a), path=["a"], full_path="a"),
+        FileInfo(name="b", length=len(b), path=["b"], full_path="b"),
+        FileInfo(
+            name="pad",
+            length=100,
+            path=[".pad", "100"],
+            full_path=".pad/100",
+            attributes="p",
+        ),
+        FileInfo(name="c", length=len(c), path=["c"], full_path="c"),
+    ]
+    for name, data in (("a", a), ("b", b), ("c", c)):
+        (tmp_path / name).write_bytes(data)
+    torrent_data = {
+        "name": "t",
+        "info_hash": b"r" * 20,
+        "files": files,
+        "total_length": len(content),
+        "piece_length": PIECE_LENGTH,
+        "pieces": pieces,
+        "num_pieces": len(pieces),
+    }
+    disk_io = Mock()
+    disk_io.start = AsyncMock()
+    disk_io.stop = AsyncMock()
+    return AsyncFileAssembler(torrent_data, str(tmp_path), disk_io_manager=disk_io)
+
+
+def _v2_piece_hash(data: bytes, width: int) -> bytes:
+    """BEP 52 piece hash over ``width`` 16 KiB leaves, padded with zero hashes."""
+    level = [
+        hashlib.sha256(data[i : i + 16384]).digest()
+        for i in range(0, len(data), 16384)
+    ]
+    level += [bytes(32)] * (width - len(level))
+    while len(level) > 1:
+        level = [
+            hashlib.sha256(level[i] + level[i + 1]).digest()
+            for i in range(0, len(level), 2)
+        ]
+    return level[0]
+
+
+@pytest.fixture
+def torrent_v2(tmp_path):
+    """v2 torrent without SHA-1 hashes: a is 3 pieces, b is one short piece."""
+    piece_length = 32768
+    rng = random.Random(5)
+    a = rng.randbytes(2 * piece_length + 20000)
+    b = rng.randbytes(5000)
+    pad = piece_length - 20000
+    files = [
+        FileInfo(name="a", length=len(a), path=["a"], full_path="a"),
+        FileInfo(
+            name="pad",
+            length=pad,
+            path=[".pad", str(pad)],
+            full_path=f".pad/{pad}",
+            attributes="p",
+        ),
+        FileInfo(name="b", length=len(b), path=["b"], full_path="b"),
+    ]
+    for name, data in (("a", a), ("b", b)):
+        (tmp_path / name).write_bytes(data)
+    layers = {
+        b"\x0a" * 32: [
+            _v2_piece_hash(a[i : i + piece_length], 2)
+            for i in range(0, len(a), piece_length)
+        ],
+        b"\x0b" * 32: [_v2_piece_hash(b, 1)],
+    }
+    torrent_data = {
+        "name": "t",
+        "info_hash": b"r" * 20,
+        "files": files,
+        "total_length": len(a) + pad + len(b),
+        "piece_length": piece_length,
+        "pieces": [],
+        "num_pieces": 4,
+        "piece_layers": layers,
+    }
+    disk_io = Mock()
+    disk_io.start = AsyncMock()
+    disk_io.stop = AsyncMock()
+    return AsyncFileAssembler(torrent_data, str(tmp_path), disk_io_manager=disk_io)
+
+
+def _checkpoint(assembler: AsyncFileAssembler) -> TorrentCheckpoint:
+    """Checkpoint with every piece verified and the files as they are now."""
+    files = []
+    for path, size in sorted(assembler.get_file_sizes().items()):
+        st = os.stat(path)
+        files.append(
+            FileCheckpoint(
+                path=path, size=size, disk_size=st.st_size, mtime_ns=st.st_mtime_ns
+            )
+        )
+    return TorrentCheckpoint(
+        info_hash=b"r" * 20,
+        torrent_name="t",
+        created_at=time.time(),
+        updated_at=time.time(),
+        total_pieces=assembler.num_pieces,
+        piece_length=PIECE_LENGTH,
+        total_length=assembler.total_length,
+        output_dir=assembler.output_dir,
+        verified_pieces=list(range(assembler.num_pieces)),
+        files=files,
+    )
+
+
+def _touch(path: str, data: bytes) -> None:
+    st = os.stat(path)
+    with open(path, "r+b") as f:
+        f.write(data)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+class TestResumeVerifier:
+    """Test skipping unchanged files and rehashing changed ones."""
+
+    @pytest.mark.asyncio
+    async def test_unchanged_files_are_not_read(self, torrent):
+        """Test files matching size and mtime are trusted without hashing."""
+        checkpoint = _checkpoint(torrent)
+        verifier = torrent.get_resume_verifier()
+        verifier.read_piece = Mock(side_effect=AssertionError("read"))
+
+        result = await verifier.verify(checkpoint.files, checkpoint.verified_pieces)
+
+        assert result.valid_pieces == set(range(torrent.num_pieces))
+        assert len(result.unchanged_files) == 3
+        assert result.bytes_hashed == 0
+
+    @pytest.mark.asyncio
+    async def test_changed_file_is_rehashed(self, torrent, tmp_path):
+        """Test only pieces of a changed file are rehashed, with progress."""
+        checkpoint = _checkpoint(torrent)
+        _touch(str(tmp_path / "b"), b"corrupt")
+        progress = []
+        verifier = torrent.get_resume_verifier(
+            lambda p: progress.append((p.pieces_checked, p.pieces_total))
+        )
+
+        result = await verifier.verify(checkpoint.files, checkpoint.verified_pieces)
+
+        # b covers the end of piece 2 (shared with a) only
+        assert result.changed_files == [str(tmp_path / "b")]
+        assert result.failed_pieces == {2}
+        assert result.valid_pieces == {0, 1, 3, 4}
+        assert result.bytes_hashed == PIECE_LENGTH
+        assert progress[0] == (0, 1)
+        assert progress[-1] == (1, 1)
+
+    @pytest.mark.asyncio
+    async def test_rehash_runs_on_given_executor(self, torrent, tmp_path):
+        """Test verify_existing_pieces hashes on the executor it is given."""
+        checkpoint = _checkpoint(torrent)
+        _touch(str(tmp_path / "b"), b"corrupt")
+        torrent.written_pieces = set(checkpoint.verified_pieces)
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            submit = Mock(wraps=executor.submit)
+            executor.submit = submit
+            results = await torrent.verify_existing_pieces(
+                checkpoint, hash_executor=executor
+            )
+
+        assert results["corrupted_pieces"] == [2]
+        assert submit.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_touched_but_intact_file_passes(self, torrent, tmp_path):
+        """Test a file with a new mtime but the same data keeps its pieces."""
+        checkpoint = _checkpoint(torrent)
+        path = str(tmp_path / "a")
+        with open(path, "rb") as f:
+            head = f.read(16)
+        _touch(path, head)
+
+        result = await torrent.get_resume_verifier().verify(
+            checkpoint.files, checkpoint.verified_pieces
+        )
+
+        assert result.changed_files == [path]
+        assert result.failed_pieces == set()
+        assert result.bytes_hashed == 3 * PIECE_LENGTH
+
+    @pytest.mark.asyncio
+    async def test_missing_and_truncated_files(self, torrent, tmp_path):
+        """Test pieces in missing or short files fail."""
+        checkpoint = _checkpoint(torrent)
+        os.remove(tmp_path / "c")
+        with open(tmp_path / "a", "r+b") as f:
+            f.truncate(PIECE_LENGTH)
+
+        result = await torrent.get_resume_verifier().verify(
+            checkpoint.files, checkpoint.verified_pieces
+        )
+
+        assert result.missing_files == [str(tmp_path / "c")]
+        assert result.failed_pieces == {1, 2, 3, 4}
+        assert result.valid_pieces == {0}
+
+    @pytest.mark.asyncio
+    async def test_checkpoint_without_mtimes_checks_size(self, torrent, tmp_path):
+        """Test files from older checkpoints are trusted when the size matches."""
+        checkpoint = _checkpoint(torrent)
+        for file_checkpoint in checkpoint.files:
+            file_checkpoint.disk_size = file_checkpoint.mtime_ns = None
+        _touch(str(tmp_path / "c"), b"corrupt")
+
+        result = await torrent.get_resume_verifier().verify(
+            checkpoint.files, checkpoint.verified_pieces
+        )
+
+        assert result.changed_files == []
+        assert result.failed_pieces == set()
+
+    def test_read_piece_fills_padding(self, torrent):
+        """Test padding inside a piece reads as zeros."""
+        verifier = ResumeVerifier(
+            torrent.file_segments, torrent.pieces, PIECE_LENGTH, torrent.total_length
+        )
+
+        assert verifier.check_piece(2, verifier.read_piece(2))
+        assert len(verifier.read_piece(4)) == 10
+
+    @pytest.mark.asyncio
+    async def test_v2_pieces_checked_against_piece_layers(self, torrent_v2, tmp_path):
+        """Test pieces without a SHA-1 hash are checked against their v2 hash."""
+        checkpoint = _checkpoint(torrent_v2)
+        verifier = torrent_v2.get_resume_verifier()
+
+        assert all(verifier.check_piece(i, verifier.read_piece(i)) for i in range(4))
+
+        _touch(str(tmp_path / "b"), b"corrupt")
+        result = await verifier.verify(checkpoint.files, checkpoint.verified_pieces)
+
+        assert result.failed_pieces == {3}
+        assert result.valid_pieces == {0, 1, 2}
+
+
+class TestResumeVerificationCallers:
+    """Test the file assembler and fast resume loader use the verifier."""
+
+    @pytest.mark.asyncio
+    async def test_verify_existing_pieces_reports_rehash(self, torrent, tmp_path):
+        """Test verify_existing_pieces lists rehashed files and bad pieces."""
+        checkpoint = _checkpoint(torrent)
+        _touch(str(tmp_path / "c"), b"corrupt")
+
+        result = await torrent.verify_existing_pieces(checkpoint)
+
+        assert result["valid"] is False
+        assert result["corrupted_pieces"] == [3]
+        assert result["rehashed_files"] == [str(tmp_path / "c")]
+        assert len(result["skipped_files"]) == 2
+
+    @pytest.mark.asyncio
+    async def test_fast_resume_verify_integrity(self, torrent, tmp_path):
+        """Test sampled pieces are read from disk and checked."""
+        _touch(str(tmp_path / "c"), b"corrupt")
+        resume_data = FastResumeData(info_hash=b"r" * 20)
+        resume_data.piece_completion_bitmap = FastResumeData.encode_piece_bitmap(
+            set(range(torrent.num_pieces)), torrent.num_pieces
+        )
+        torrent_info = {"pieces": b"".join(torrent.pieces)}
+
+        result = await FastResumeLoader(Mock()).verify_integrity(
+            resume_data, torrent_info, torrent, num_pieces_to_verify=10
+        )
+
+        assert sorted(result["verified_pieces"]) == [0, 1, 2, 3, 4]
+        assert result["failed_pieces"] == [3]
@@ -320,3 +320,78 @@ class TestGearhashChunker:
         # Should process all data
         assert len(chunks) > 0
 
+
+class TestGearhashChunkerEngine:
+    """Test the fast boundary engine against the per-byte reference."""
+
+    @staticmethod
+    def _reference_boundaries(chunker, data):
+        boundaries = []
+        pos = 0
+        while pos < len(data):
+            pos = chunker._find_chunk_boundary(data, pos, 0, 0, chunker.target_mask)
+            boundaries.append(pos)
+        return boundaries
+
+    @pytest.fixture(params=[True, False], ids=["numpy", "pure-python"])
+    def vectorized(self, request, monkeypatch):
+        """Run with and without the NumPy engine."""
+        import ccbt.storage.xet_chunking as xet_chunking
+
+        if request.param and not xet_chunking.HAS_NUMPY:
+            pytest.skip("NumPy not installed")
+        monkeypatch.setattr(xet_chunking, "HAS_NUMPY", request.param)
+        return request.param
+
+    @pytest.mark.parametrize(
+        "target_size", [MIN_CHUNK_SIZE, TARGET_CHUNK_SIZE, MAX_CHUNK_SIZE]
+    )
+    def test_boundaries_match_reference(self, vectorized, target_size):
+        """Test boundaries are identical to the original implementation."""
+        import random
+
+        rng = random.Random(target_size)
+        chunker = GearhashChunker(target_size=target_size)
+        for data in (
+            rng.randbytes(1_500_000),
+            bytes(300_000),
+            bytes(rng.choice(b"ab") for _ in range(200_000)),
+            rng.randbytes(MIN_CHUNK_SIZE + 20),
+        ):
+            assert chunker.chunk_boundaries(data) == self._reference_boundaries(
+                chunker, data
+            )
+
+    def test_stream_matches_reference(self, vectorized):
+        """Test streaming cuts at the same places for any read size."""
+        import random
+
+        chunker = GearhashChunker(target_size=MAX_CHUNK_SIZE)
+        data = random.Random(7).randbytes(600_000)
+        for read_size in (1000, 65536):
+            pieces = [data[i : i + read_size] for i in range(0, len(data), read_size)]
+            expected = []
+            buffer = b""
+            for piece in pieces:
+                buffer += piece
+                while len(buffer) >= MIN_CHUNK_SIZE:
+                    end = chunker._find_chunk_boundary(
+                        buffer, 0, 0, 0, chunker.target_mask
+                    )
+                    expected.append(buffer[:end])
+                    buffer = buffer[end:]
+            if buffer:
+                expected.append(buffer)
+
+            assert list(chunker.chunk_stream(iter(pieces))) == expected
+
+    def test_chunk_buffers_preserves_order(self, vectorized):
+        """Test parallel chunking returns each buffer's chunks in order."""
+        import random
+
+        chunker = GearhashChunker()
+        buffers = [random.Random(i).randbytes(300_000) for i in range(4)]
+
+        result = chunker.chunk_buffers(buffers, max_workers=4)
+
+        assert result == [chunker.chunk_buffer(data) for data in buffers]
@@ -88,12 +88,11 @@ class TestXetDeduplication:
         result = await dedup.check_chunk_exists(chunk_hash)
         assert result is not None
 
-        # Verify file was created
+        # Verify pack file was created
         assert storage_path.exists()
 
-        # Verify file content
-        with open(storage_path, "rb") as f:
-            assert f.read() == chunk_data
+        # Verify chunk content
+        assert await dedup.read_chunk(chunk_hash) == chunk_data
 
     @pytest.mark.asyncio
     async def test_store_chunk_reference_counting(self, dedup):
@@ -178,6 +177,8 @@ class TestXetDeduplication:
 
         # Check chunk (should update timestamp)
         await dedup.check_chunk_exists(chunk_hash)
+        # Access times are batched; flush before reading from another connection
+        await dedup.flush()
 
         # Get updated timestamp
         conn = sqlite3.connect(dedup.cache_path)
@@ -707,3 +708,99 @@ class TestXetDeduplication:
         # Should complete without error
         assert isinstance(removed, bool)
 
+
+class TestXetDeduplicationIndex:
+    """Tests for the off-loop, batched chunk index."""
+
+    @pytest.fixture
+    def dedup(self, tmp_path):
+        """Create XetDeduplication instance for testing."""
+        dedup = XetDeduplication(cache_db_path=tmp_path / "chunks.db")
+        yield dedup
+        dedup.close()
+
+    def test_bloom_filter_has_no_false_negatives(self):
+        """Test every added hash is reported as possibly present."""
+        from ccbt.storage.xet_deduplication import ChunkBloomFilter
+
+        bloom = ChunkBloomFilter(capacity=1000)
+        added = [os.urandom(32) for _ in range(1000)]
+        for chunk_hash in added:
+            bloom.add(chunk_hash)
+
+        assert all(chunk_hash in bloom for chunk_hash in added)
+        false_positives = sum(os.urandom(32) in bloom for _ in range(10000))
+        assert false_positives < 300  # ~1% target
+
+    @pytest.mark.asyncio
+    async def test_unknown_chunk_answered_without_database(self, dedup):
+        """Test misses are answered by the filter, not the writer thread."""
+        await dedup.store_chunk(b"N" * 32, b"known")
+
+        dedup._submit = None  # Any database round trip would fail
+        assert await dedup.check_chunk_exists(b"O" * 32) is None
+
+    @pytest.mark.asyncio
+    async def test_concurrent_stores_share_transactions(self, dedup):
+        """Test concurrent stores are group-committed and reference counted."""
+        import asyncio
+
+        commits = 0
+        run_batch = dedup._run_batch
+
+        def counting_run_batch(batch, **kwargs):
+            nonlocal commits
+            if batch:
+                commits += 1
+            run_batch(batch, **kwargs)
+
+        dedup._run_batch = counting_run_batch
+        hashes = [bytes([i]) * 32 for i in range(50)]
+
+        paths = await asyncio.gather(
+            *(dedup.store_chunk(h, h[:4]) for h in hashes + hashes[:10])
+        )
+
+        assert commits < len(paths)
+        assert paths[:10] == paths[50:]
+        assert dedup.get_chunk_info(hashes[0])["ref_count"] == 2
+        assert dedup.get_cache_stats()["total_chunks"] == 50
+
+    @pytest.mark.asyncio
+    async def test_access_times_flushed_on_close(self, tmp_path):
+        """Test batched last_accessed updates are persisted by close()."""
+        import asyncio
+
+        db_path = tmp_path / "chunks.db"
+        dedup = XetDeduplication(cache_db_path=db_path)
+        chunk_hash = b"P" * 32
+        await dedup.store_chunk(chunk_hash, b"data")
+        stored_at = dedup.get_chunk_info(chunk_hash)["last_accessed"]
+
+        await asyncio.sleep(0.01)
+        await dedup.check_chunk_exists(chunk_hash)
+        dedup.close()
+
+        conn = sqlite3.connect(db_path)
+        (last_accessed,) = conn.execute(
+            "SELECT last_accessed FROM chunks WHERE hash = ?", (chunk_hash,)
+        ).fetchone()
+        conn.close()
+        assert last_accessed > stored_at
+
+    @pytest.mark.asyncio
+    async def test_reopened_index_finds_existing_chunks(self, tmp_path):
+        """Test the filter is rebuilt from the database on open."""
+        db_path = tmp_path / "chunks.db"
+        with XetDeduplication(cache_db_path=db_path) as dedup:
+            path = await dedup.store_chunk(b"Q" * 32, b"persisted")
+
+        with XetDeduplication(cache_db_path=db_path) as reopened:
+            assert await reopened.check_chunk_exists(b"Q" * 32) == path
+
+    def test_closed_index_rejects_operations(self, dedup):
+        """Test operations after close fail like a closed connection."""
+        dedup.close()
+
+        with pytest.raises(sqlite3.ProgrammingError):
+            dedup.get_cache_stats()
@@ -0,0 +1,164 @@
+"""Unit tests for the Xet chunk pack store.
+
+Tests appending and reading chunks, sealing packs into valid xorbs,
+crash recovery, compaction and migration of legacy chunk files.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import time
+
+import pytest
+
+from ccbt.storage.xet_deduplication import XetDeduplication
+from ccbt.storage.xet_pack import PACK_SUFFIX, ChunkPackStore
+from ccbt.storage.xet_xorb import Xorb
+
+pytestmark = [pytest.mark.unit, pytest.mark.storage]
+
+
+def _chunk(i: int, size: int = 1000) -> tuple[bytes, bytes]:
+    return bytes([i % 256]) * 32, bytes([i % 251]) * size
+
+
+class TestChunkPackStore:
+    """Test ChunkPackStore class."""
+
+    @pytest.fixture
+    def store(self, tmp_path):
+        """Create a pack store with small packs."""
+        store = ChunkPackStore(tmp_path, max_pack_size=4096)
+        yield store
+        store.close()
+
+    def test_append_and_read(self, store):
+        """Test chunks read back from the active and sealed packs."""
+        chunks = [_chunk(i) for i in range(6)]
+        locations = []
+        for chunk_hash, data in chunks:
+            store.reserve(len(data))
+            locations.append(store.append(chunk_hash, data))
+
+        assert len({path for path, _ in locations}) > 1
+        for (chunk_hash, data), (path, offset) in zip(chunks, locations):
+            assert store.read(path, offset, len(data), chunk_hash) == data
+
+    def test_sealed_pack_is_xorb(self, store):
+        """Test a sealed pack deserializes as an ordinary xorb."""
+        chunks = [_chunk(i, 100) for i in range(3)]
+        for chunk_hash, data in chunks:
+            path, _ = store.append(chunk_hash, data)
+        assert store.seal() == path
+
+        xorb = Xorb.deserialize(path.read_bytes())
+        assert xorb.chunks == chunks
+
+    def test_read_checks_chunk_hash(self, store):
+        """Test a stale location is rejected instead of returning other data."""
+        chunk_hash, data = _chunk(1)
+        path, offset = store.append(chunk_hash, data)
+
+        with pytest.raises(ValueError, match="not found"):
+            store.read(path, offset, len(data), b"\xff" * 32)
+
+    def test_resume_drops_uncommitted_bytes(self, tmp_path, store):
+        """Test reopening an active pack truncates bytes past its committed size."""
+        path, _ = store.append(*_chunk(1))
+        committed = store.active_size
+        store.append(*_chunk(2))
+        store.close()
+
+        reopened = ChunkPackStore(tmp_path, max_pack_size=4096)
+        reopened.resume(path, committed)
+        assert path.stat().st_size == committed
+        _, offset = reopened.append(*_chunk(3))
+        assert reopened.read(path, offset, 1000, _chunk(3)[0]) == _chunk(3)[1]
+        reopened.close()
+
+
+class TestXetDeduplicationPacks:
+    """Test XetDeduplication on top of pack files."""
+
+    @pytest.fixture
+    def dedup(self, tmp_path):
+        """Create XetDeduplication instance with small packs."""
+        dedup = XetDeduplication(cache_db_path=tmp_path / "chunks.db")
+        dedup.packs.max_pack_size = 8192
+        yield dedup
+        dedup.close()
+
+    @pytest.mark.asyncio
+    async def test_chunks_share_pack_files(self, dedup):
+        """Test many chunks are stored in a few pack files."""
+        chunks = [_chunk(i) for i in range(40)]
+        for chunk_hash, data in chunks:
+            await dedup.store_chunk(chunk_hash, data)
+
+        files = list(dedup.chunk_store_path.iterdir())
+        assert all(f.name.endswith(PACK_SUFFIX) for f in files)
+        assert len(files) < len(chunks) // 4
+        for chunk_hash, data in chunks:
+            assert await dedup.read_chunk(chunk_hash) == data
+        assert await dedup.read_chunk(b"\xee" * 32) is None
+
+    @pytest.mark.asyncio
+    async def test_compaction_reclaims_dead_chunks(self, dedup):
+        """Test packs whose chunks are unreferenced are rewritten and removed."""
+        chunks = [_chunk(i) for i in range(32)]
+        for chunk_hash, data in chunks:
+            await dedup.store_chunk(chunk_hash, data)
+        for chunk_hash, _ in chunks[:24]:
+            assert dedup.remove_chunk_reference(chunk_hash) is True
+        packs_before = set(dedup.chunk_store_path.iterdir())
+        assert dedup.get_cache_stats()["dead_bytes"] > 0
+
+        reclaimed = await dedup.compact()
+
+        assert reclaimed > 0
+        assert set(dedup.chunk_store_path.iterdir()) < packs_before | {
+            dedup.packs.active_path
+        }
+        for chunk_hash, data in chunks[24:]:
+            assert await dedup.read_chunk(chunk_hash) == data
+        for chunk_hash, _ in chunks[:24]:
+            assert await dedup.read_chunk(chunk_hash) is None
+
+    @pytest.mark.asyncio
+    async def test_reopen_resumes_active_pack(self, tmp_path):
+        """Test chunks survive a reopen and new chunks append to the same pack."""
+        db_path = tmp_path / "chunks.db"
+        with XetDeduplication(cache_db_path=db_path) as dedup:
+            first = await dedup.store_chunk(*_chunk(1))
+
+        with XetDeduplication(cache_db_path=db_path) as reopened:
+            assert await reopened.store_chunk(*_chunk(2)) == first
+            assert await reopened.read_chunk(_chunk(1)[0]) == _chunk(1)[1]
+            assert await reopened.read_chunk(_chunk(2)[0]) == _chunk(2)[1]
+
+    @pytest.mark.asyncio
+    async def test_legacy_chunk_files_migrated(self, tmp_path):
+        """Test chunks from the one-file-per-chunk layout are moved into packs."""
+        db_path = tmp_path / "chunks.db"
+        XetDeduplication(cache_db_path=db_path).close()
+        chunk_hash, data = _chunk(7)
+        legacy_file = tmp_path / "xet_chunks" / chunk_hash.hex()
+        legacy_file.write_bytes(data)
+        conn = sqlite3.connect(db_path)
+        conn.execute(
+            """INSERT INTO chunks (hash, size, storage_path, created_at, last_accessed)
+               VALUES (?, ?, ?, ?, ?)""",
+            (chunk_hash, len(data), str(legacy_file), time.time(), time.time()),
+        )
+        conn.commit()
+        conn.close()
+
+        with XetDeduplication(cache_db_path=db_path) as dedup:
+            assert await dedup.read_chunk(chunk_hash) == data
+            await dedup.compact()
+
+            assert not legacy_file.exists()
+            assert dedup.get_chunk_info(chunk_hash)["storage_path"].endswith(
+                PACK_SUFFIX
+            )
+            assert await dedup.read_chunk(chunk_hash) == data
@@ -179,6 +179,22 @@ class TestAnnounceHandler:
         response = handler.wfile.read()
         assert response.startswith(b"d")  # Bencoded dict
 
+    def test_do_get_binary_info_hash(self):
+        """Test a percent-encoded binary info_hash is stored byte for byte."""
+        handler = self._create_handler()
+
+        from urllib.parse import quote
+
+        info_hash = bytes(range(236, 256))
+        peer_id = b"\x01" * 20
+        handler.path = f"/announce?info_hash={quote(info_hash)}&peer_id={quote(peer_id)}&port=6881&event=started"
+
+        with patch.object(AnnounceHandler, "store", InMemoryTrackerStore()) as store:
+            handler.do_GET()
+
+        handler.send_response.assert_called_once_with(200)
+        assert list(store.torrents) == [info_hash]
+
     def test_do_get_exception_handling(self):
         """Test do_GET exception handling (lines 97-103)."""
         handler = self._create_handler()
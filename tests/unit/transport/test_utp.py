@@ -566,9 +566,8 @@ class TestUTPConnection:
 
             conn._start_background_tasks()
 
-            # Tasks should be created
+            # Send task should be created
             assert conn._send_task is not None
-            assert conn._retransmission_task is not None
 
             # Cleanup
             if conn._send_task:
@@ -577,12 +576,6 @@ class TestUTPConnection:
                     await conn._send_task
                 except asyncio.CancelledError:
                     pass
-            if conn._retransmission_task:
-                conn._retransmission_task.cancel()
-                try:
-                    await conn._retransmission_task
-                except asyncio.CancelledError:
-                    pass
 
     @pytest.mark.asyncio
     async def test_receive_zero_bytes(self, mock_config, remote_addr):
@@ -664,8 +657,8 @@ class TestUTPConnection:
             assert rate == conn.current_send_rate
 
     @pytest.mark.asyncio
-    async def test_retransmission_loop(self, utp_connection):
-        """Test retransmission loop."""
+    async def test_retransmission_timer(self, utp_connection):
+        """Test RTO timer on the timer wheel retransmits an expired packet."""
         utp_connection.state = UTPConnectionState.CONNECTED
         mock_transport = MagicMock()
         mock_transport.sendto = Mock()
@@ -684,21 +677,16 @@ class TestUTPConnection:
         old_send_time = time.perf_counter() - 10.0  # Sent 10 seconds ago
         utp_connection.send_buffer[1] = (packet, old_send_time, 0)
 
-        # Start retransmission task
-        task = asyncio.create_task(utp_connection._retransmission_loop())
+        # Arm the timer (already expired, fires on the next tick)
+        utp_connection._arm_retransmit_timer(1)
 
         # Wait a bit
-        await asyncio.sleep(0.2)
-
-        # Stop task
-        task.cancel()
-        try:
-            await task
-        except asyncio.CancelledError:
-            pass
+        await asyncio.sleep(0.1)
 
-        # Retransmission should have been attempted
-        assert utp_connection.packets_retransmitted >= 0
+        # Retransmission should have happened and a new timer armed
+        assert utp_connection.packets_retransmitted == 1
+        assert 1 in utp_connection._rto_timers
+        await utp_connection.timer_wheel.stop()
 
 
 class TestUTPSocketManager:
@@ -1073,7 +1061,7 @@ class TestUTPIntegration:
             conn.rtt = 0.1
             conn.rtt_variance = 0.01
 
-            await conn._check_retransmissions()
+            conn._on_retransmit_timeout(1)
 
             # Should have attempted retransmission
             assert mock_transport.sendto.called or conn.packets_retransmitted >= 0
@@ -1105,7 +1093,7 @@ class TestUTPIntegration:
             conn.rtt_variance = 0.01
 
             original_state = conn.state
-            await conn._check_retransmissions()
+            conn._on_retransmit_timeout(1)
 
             # Connection should be closed if max retries exceeded
             # (actual behavior depends on implementation)
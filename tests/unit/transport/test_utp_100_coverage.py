@@ -487,7 +487,7 @@ class TestUTPConnectionEdgeCases:
 
         # Should use legacy calculation
         # RTO = rtt + 4 * rtt_variance = 0.1 + 4 * 0.01 = 0.14
-        # This should be covered by _check_retransmissions
+        # This should be covered by _on_retransmit_timeout
 
     def test_retransmission_rto_bounds(self, connection):
         """Test RTO calculation respects min/max bounds."""
@@ -1,6 +1,7 @@
 """Additional tests to improve coverage for utp.py."""
 
 import asyncio
+import time
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -602,7 +603,7 @@ class TestReceiveMethod:
     async def test_receive_data(self, connection):
         """Test receiving data."""
         # Add data to receive buffer
-        connection.recv_data_buffer = bytearray(b"received data")
+        connection.recv_data_buffer.extend(b"received data")
 
         # Receive data
         data = await connection.receive(-1)
@@ -612,7 +613,7 @@ class TestReceiveMethod:
     @pytest.mark.asyncio
     async def test_receive_with_timeout(self, connection):
         """Test receiving with timeout."""
-        connection.recv_data_buffer = bytearray()
+        connection.recv_data_buffer.clear()
 
         # Try to receive with short timeout
         with pytest.raises(asyncio.TimeoutError):
@@ -636,30 +637,33 @@ class TestBackgroundTasks:
         """Test starting background tasks."""
         connection._start_background_tasks()
 
-        # Tasks should be created
-        assert connection._retransmission_task is not None
+        # Send task should be created (timers live on the timer wheel)
         assert connection._send_task is not None
 
         # Cleanup
         await connection.close()
 
     @pytest.mark.asyncio
-    async def test_retransmission_loop(self, connection):
-        """Test retransmission loop."""
+    async def test_retransmission_timer(self, connection):
+        """Test RTO timer retransmits through the timer wheel."""
         connection.state = UTPConnectionState.CONNECTED
-        connection._retransmission_task = asyncio.create_task(
-            connection._retransmission_loop()
+        packet = UTPPacket(
+            type=UTPPacketType.ST_DATA,
+            connection_id=12345,
+            seq_nr=1,
+            ack_nr=0,
+            wnd_size=65535,
+            data=b"data",
         )
+        connection.send_buffer[1] = (packet, time.perf_counter(), 0)
+        connection._arm_retransmit_timer(1)
 
-        # Wait a bit
-        await asyncio.sleep(0.15)  # Longer than check interval
+        # Wait longer than the minimum RTO
+        await asyncio.sleep(0.15)
 
-        # Cancel task
-        connection._retransmission_task.cancel()
-        try:
-            await connection._retransmission_task
-        except asyncio.CancelledError:
-            pass
+        assert connection.packets_retransmitted >= 1
+        assert connection.send_buffer[1][2] >= 1
+        await connection.timer_wheel.stop()
 
     @pytest.mark.asyncio
     async def test_send_loop(self, connection):
@@ -717,14 +721,22 @@ class TestCloseMethod:
     async def test_close_stops_tasks(self, connection):
         """Test close() stops background tasks."""
         connection._start_background_tasks()
-        connection._start_ack_timer()
+        connection._queue_ack(
+            UTPPacket(
+                type=UTPPacketType.ST_STATE,
+                connection_id=12345,
+                seq_nr=0,
+                ack_nr=1,
+                wnd_size=65535,
+            )
+        )
 
         await connection.close()
 
-        # Tasks should be cancelled
-        assert connection._retransmission_task is None or connection._retransmission_task.done()
+        # Tasks should be cancelled and timers released
         assert connection._send_task is None or connection._send_task.done()
-        assert connection.ack_timer is None or connection.ack_timer.done()
+        assert connection.ack_timer is None
+        assert len(connection.timer_wheel) == 0
 
 
 class TestShouldSendImmediateAck:
@@ -394,9 +394,9 @@ class TestConnectionClose:
         )
         connection.send_buffer[1] = (packet, 0.0, 0)
 
-        # Start background tasks
+        # Start background tasks and arm the packet's RTO timer
         connection._start_background_tasks()
-        connection._start_ack_timer()
+        connection._arm_retransmit_timer(1)
 
         # Close connection
         await connection.close()
@@ -404,6 +404,7 @@ class TestConnectionClose:
         # Should send FIN and transition to CLOSED
         assert connection.state == UTPConnectionState.CLOSED
         assert connection.transport.sendto.called
+        assert connection._rto_timers == {}
 
     @pytest.mark.asyncio
     async def test_close_already_closed(self, connection):
@@ -420,9 +421,8 @@ class TestConnectionClose:
     async def test_close_sends_pending_acks(self, connection):
         """Test closing sends pending ACKs."""
         connection.state = UTPConnectionState.CONNECTED
-        connection._start_ack_timer()
 
-        # Queue an ACK
+        # Queue an ACK (arms the delayed ACK timer)
         ack_packet = UTPPacket(
             type=UTPPacketType.ST_STATE,
             connection_id=12345,
@@ -430,13 +430,15 @@ class TestConnectionClose:
             ack_nr=100,
             wnd_size=65535,
         )
-        connection.pending_acks.append(ack_packet)
+        connection._queue_ack(ack_packet)
+        assert connection.ack_timer is not None
 
         # Close
         await connection.close()
 
-        # Pending ACK should be sent
+        # Pending ACK should be sent and the timer cancelled
         assert connection.transport.sendto.called
+        assert connection.ack_timer is None
 
 
 class TestSequenceNumberHandling:
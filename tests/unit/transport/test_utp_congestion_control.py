@@ -116,7 +116,7 @@ class TestRTOCalculation:
         connection.rttvar = 0.02  # 20ms
 
         # RTO = SRTT + 4 * RTTVAR = 0.1 + 4 * 0.02 = 0.18
-        # This is tested indirectly through _check_retransmissions
+        # This is tested indirectly through _on_retransmit_timeout
 
     def test_rto_bounds(self, connection):
         """Test RTO is bounded between 100ms and 60s."""
@@ -125,14 +125,14 @@ class TestRTOCalculation:
         connection.rttvar = 0.001
 
         # RTO should be at least 100ms
-        # This is tested in _check_retransmissions
+        # This is tested in _on_retransmit_timeout
 
         # Test maximum bound
         connection.srtt = 100.0  # Very large
         connection.rttvar = 10.0
 
         # RTO should be at most 60s
-        # This is tested in _check_retransmissions
+        # This is tested in _on_retransmit_timeout
 
 
 class TestLEDBATCongestionControl:
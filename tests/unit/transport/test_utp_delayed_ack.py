@@ -126,8 +126,8 @@ class TestDelayedACK:
         assert not connection.transport.sendto.called
 
     @pytest.mark.asyncio
-    async def test_delayed_ack_loop(self, connection):
-        """Test delayed ACK loop."""
+    async def test_delayed_ack_timer(self, connection):
+        """Test delayed ACK is sent when its timer expires."""
         # Set short delay for testing
         connection.ack_delay = 0.01  # 10ms
 
@@ -139,23 +139,17 @@ class TestDelayedACK:
             ack_nr=100,
             wnd_size=65535,
         )
-        connection.pending_acks.append(ack_packet)
-
-        # Start ACK timer
-        task = asyncio.create_task(connection._delayed_ack_loop())
+        connection._queue_ack(ack_packet)
+        assert connection.ack_timer is not None
+        assert not connection.transport.sendto.called
 
         # Wait a bit longer than delay
-        await asyncio.sleep(0.02)
-
-        # Cancel task
-        task.cancel()
-        try:
-            await task
-        except asyncio.CancelledError:
-            pass
+        await asyncio.sleep(0.05)
 
         # Verify ACK was sent
         assert connection.transport.sendto.called
+        assert connection.pending_acks == []
+        assert connection.ack_timer is None
 
     def test_send_ack_immediate(self, connection):
         """Test sending immediate ACK."""
@@ -192,24 +186,43 @@ class TestDelayedACK:
         assert len(connection.pending_acks) == 1
         # Note: sendto might be called for other reasons, so we check pending_acks
 
-    @pytest.mark.asyncio
-    async def test_ack_timer_lifecycle(self, connection):
-        """Test ACK timer start/stop lifecycle."""
-        # Start timer
-        connection._start_ack_timer()
-        assert connection.ack_timer is not None
-        assert not connection.ack_timer.done()
+    def test_ack_timer_single_per_connection(self, connection):
+        """Test queueing several ACKs arms a single delayed ACK timer."""
+        ack_packet = UTPPacket(
+            type=UTPPacketType.ST_STATE,
+            connection_id=12345,
+            seq_nr=0,
+            ack_nr=100,
+            wnd_size=65535,
+        )
+        connection._queue_ack(ack_packet)
+        timer = connection.ack_timer
+        connection._queue_ack(ack_packet)
 
-        # Stop timer
-        await connection._stop_ack_timer()
+        assert connection.ack_timer is timer
+        assert len(connection.timer_wheel) == 1
+
+    def test_ack_timer_cancelled_when_sent(self, connection):
+        """Test sending batched ACKs cancels the delayed ACK timer."""
+        ack_packet = UTPPacket(
+            type=UTPPacketType.ST_STATE,
+            connection_id=12345,
+            seq_nr=0,
+            ack_nr=100,
+            wnd_size=65535,
+        )
+        connection._queue_ack(ack_packet)
+
+        connection._send_batched_acks()
+
+        assert connection.transport.sendto.call_count == 1
         assert connection.ack_timer is None
+        assert len(connection.timer_wheel) == 0
 
     @pytest.mark.asyncio
-    async def test_ack_timer_stop_with_pending(self, connection):
-        """Test stopping ACK timer sends pending ACKs."""
-        connection._start_ack_timer()
-
-        # Queue an ACK
+    async def test_data_packet_piggybacks_pending_ack(self, connection):
+        """Test outgoing data carries ack_nr, so a plain pending ACK is dropped."""
+        connection.send_window = 1 << 20
         ack_packet = UTPPacket(
             type=UTPPacketType.ST_STATE,
             connection_id=12345,
@@ -217,17 +230,43 @@ class TestDelayedACK:
             ack_nr=100,
             wnd_size=65535,
         )
-        connection.pending_acks.append(ack_packet)
+        connection._queue_ack(ack_packet)
 
-        # Stop timer - this should send pending ACKs via _delayed_ack_loop cancellation
-        await connection._stop_ack_timer()
+        await connection.send(b"payload")
 
-        # Give async cancellation time to complete and send ACKs
-        await asyncio.sleep(0.05)
+        assert connection.transport.sendto.call_count == 1
+        assert connection.pending_acks == []
+        assert connection.ack_timer is None
+        await connection.timer_wheel.stop()
+
+    @pytest.mark.asyncio
+    async def test_immediate_acks_coalesced_per_burst(self, connection):
+        """Test immediate ACKs within one datagram burst are sent once."""
+        from ccbt.transport.utp_socket import UTPSocketManager
+
+        manager = UTPSocketManager()
+        connection.socket_manager = manager
+
+        for seq in (5, 7, 9):  # Out-of-order packets request immediate ACKs
+            connection._handle_data_packet(
+                UTPPacket(
+                    type=UTPPacketType.ST_DATA,
+                    connection_id=12345,
+                    seq_nr=seq,
+                    ack_nr=0,
+                    wnd_size=65535,
+                    data=b"data",
+                )
+            )
+        assert not connection.transport.sendto.called
+
+        # Flush runs once the burst has been processed
+        await asyncio.sleep(0)
 
-        # Verify pending ACK was sent (via _delayed_ack_loop cancellation handler)
-        # The ACK should be sent when the loop is cancelled
-        assert connection.transport.sendto.called or len(connection.pending_acks) == 0
+        assert connection.transport.sendto.call_count == 1
+        ack = UTPPacket.unpack(connection.transport.sendto.call_args[0][0])
+        assert ack.type == UTPPacketType.ST_STATE
+        assert ack.ack_nr == 9
 
     def test_handle_data_packet_triggers_ack(self, connection):
         """Test that handling data packet triggers ACK."""
@@ -136,7 +136,7 @@ class TestEdgeCases:
     def test_receive_when_no_data(self, connection):
         """Test receiving when no data available."""
         connection.state = UTPConnectionState.CONNECTED
-        connection.recv_data_buffer = bytearray()
+        connection.recv_data_buffer.clear()
 
         # Should wait for data
         # This is tested in integration tests with actual async waits
@@ -145,10 +145,8 @@ class TestEdgeCases:
         """Test retransmission with empty send buffer."""
         connection.send_buffer = {}
 
-        # Should not crash
-        import asyncio
-
-        asyncio.run(connection._check_retransmissions())
+        # Should not crash (timer for a packet that is no longer buffered)
+        connection._on_retransmit_timeout(1)
 
     def test_sack_empty_received_seqs(self, connection):
         """Test SACK generation with empty received sequences."""
@@ -489,7 +489,7 @@ class TestReceiveMethod:
     async def test_receive_partial_data(self, connection):
         """Test receiving partial data."""
         # Add some data to buffer
-        connection.recv_data_buffer = bytearray(b"partial")
+        connection.recv_data_buffer.extend(b"partial")
 
         # Request more than available
         receive_task = asyncio.create_task(connection.receive(100))
@@ -507,7 +507,7 @@ class TestReceiveMethod:
     @pytest.mark.asyncio
     async def test_receive_exact_amount(self, connection):
         """Test receiving exact amount of data."""
-        connection.recv_data_buffer = bytearray(b"exact data")
+        connection.recv_data_buffer.extend(b"exact data")
 
         data = await connection.receive(10)  # Exactly 10 bytes
 
@@ -518,7 +518,7 @@ class TestReceiveMethod:
     @pytest.mark.asyncio
     async def test_receive_less_than_available(self, connection):
         """Test receiving less than available."""
-        connection.recv_data_buffer = bytearray(b"more data than needed")
+        connection.recv_data_buffer.extend(b"more data than needed")
 
         data = await connection.receive(4)  # Only 4 bytes
 
@@ -526,14 +526,14 @@ class TestReceiveMethod:
         assert data == b"more"
         # Rest should remain in buffer
         assert len(connection.recv_data_buffer) > 0
-        assert connection.recv_data_buffer == bytearray(b" data than needed")
+        assert bytes(connection.recv_data_buffer) == b" data than needed"
         # Should set event since more data available
         assert connection.recv_data_available.is_set()
 
     @pytest.mark.asyncio
     async def test_receive_all_available(self, connection):
         """Test receiving all available data."""
-        connection.recv_data_buffer = bytearray(b"all data")
+        connection.recv_data_buffer.extend(b"all data")
 
         data = await connection.receive(-1)  # All available
 
@@ -554,38 +554,28 @@ class TestBackgroundTasks:
         return conn
 
     @pytest.mark.asyncio
-    async def test_retransmission_loop_exception(self, connection):
-        """Test retransmission loop handles exceptions."""
+    async def test_retransmission_timer_exception(self, connection):
+        """Test an exception in one RTO callback does not stop the timer wheel."""
         connection.state = UTPConnectionState.CONNECTED
-        
-        # Mock _check_retransmissions to raise exception
-        original_check = connection._check_retransmissions
         call_count = 0
-        
-        async def mock_check():
+
+        def mock_timeout(seq):
             nonlocal call_count
             call_count += 1
             if call_count == 1:
                 raise Exception("Test exception")
-            # After exception, call original
-            await original_check()
-        
-        connection._check_retransmissions = mock_check
-        
-        task = asyncio.create_task(connection._retransmission_loop())
-        
-        # Wait a bit for exception to occur and loop to continue
-        await asyncio.sleep(0.25)
-        
-        # Verify loop continued after exception (call_count should be > 1)
-        assert call_count > 1, "Loop should continue after exception"
-        
-        # Cancel task
-        task.cancel()
-        try:
-            await task
-        except asyncio.CancelledError:
-            pass
+
+        connection._on_retransmit_timeout = mock_timeout
+
+        connection.timer_wheel.schedule(0.0, connection._on_retransmit_timeout, 1)
+        connection.timer_wheel.schedule(0.05, connection._on_retransmit_timeout, 2)
+
+        # Wait for both timers
+        await asyncio.sleep(0.15)
+
+        # Wheel kept running after the exception
+        assert call_count == 2
+        await connection.timer_wheel.stop()
 
     @pytest.mark.asyncio
     async def test_send_loop_exception(self, connection):
@@ -651,24 +641,24 @@ class TestDelayedAckLoop:
         return conn
 
     @pytest.mark.asyncio
-    async def test_delayed_ack_loop_exception(self, connection):
-        """Test delayed ACK loop handles exceptions."""
+    async def test_delayed_ack_timer_exception(self, connection):
+        """Test delayed ACK timer handles exceptions and can be re-armed."""
         connection.state = UTPConnectionState.CONNECTED
         connection.ack_delay = 0.01
-        
+
         # Mock _send_batched_acks to raise exception
         original_send = connection._send_batched_acks
         call_count = 0
-        
+
         def mock_send():
             nonlocal call_count
             call_count += 1
             if call_count == 1:
                 raise Exception("Test exception")
             original_send()
-        
+
         connection._send_batched_acks = mock_send
-        
+
         # Add pending ACK
         ack = UTPPacket(
             type=UTPPacketType.ST_STATE,
@@ -677,19 +667,19 @@ class TestDelayedAckLoop:
             ack_nr=100,
             wnd_size=65535,
         )
-        connection.pending_acks.append(ack)
-        
-        task = asyncio.create_task(connection._delayed_ack_loop())
-        
+        connection._queue_ack(ack)
+
         # Wait a bit
         await asyncio.sleep(0.05)
-        
-        # Cancel task
-        task.cancel()
-        try:
-            await task
-        except asyncio.CancelledError:
-            pass
+        assert call_count == 1
+        assert connection.ack_timer is None
+
+        # Next ACK arms a fresh timer
+        connection._queue_ack(ack)
+        await asyncio.sleep(0.05)
+        assert call_count == 2
+        assert connection.pending_acks == []
+        await connection.timer_wheel.stop()
 
 
 class TestSACKBlockGeneration:
@@ -1178,8 +1168,8 @@ class TestProcessOutOfOrderPackets:
         assert 100 not in connection.recv_buffer
         assert 101 not in connection.recv_buffer
         assert connection.recv_buffer_expected_seq == 102
-        assert b"packet1" in connection.recv_data_buffer
-        assert b"packet2" in connection.recv_data_buffer
+        assert b"packet1" in bytes(connection.recv_data_buffer)
+        assert b"packet2" in bytes(connection.recv_data_buffer)
 
     def test_process_out_of_order_chain(self, connection):
         """Test processing chain of out-of-order packets."""
@@ -1213,8 +1203,8 @@ class TestProcessOutOfOrderPackets:
         # All should be processed (continuous chain from 100-103)
         assert len(connection.recv_buffer) == 0
         assert connection.recv_buffer_expected_seq == 104
-        assert b"packet100" in connection.recv_data_buffer
-        assert b"packet101" in connection.recv_data_buffer
-        assert b"packet102" in connection.recv_data_buffer
-        assert b"packet103" in connection.recv_data_buffer
+        assert b"packet100" in bytes(connection.recv_data_buffer)
+        assert b"packet101" in bytes(connection.recv_data_buffer)
+        assert b"packet102" in bytes(connection.recv_data_buffer)
+        assert b"packet103" in bytes(connection.recv_data_buffer)
 
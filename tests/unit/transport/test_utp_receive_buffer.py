@@ -0,0 +1,136 @@
+"""Unit tests for the uTP chunked receive buffer and receive path."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+from ccbt.transport.utp import (
+    UTPConnection,
+    UTPConnectionState,
+    UTPPacket,
+    UTPPacketType,
+    UTPReceiveBuffer,
+)
+
+pytestmark = [pytest.mark.unit, pytest.mark.transport]
+
+
+def _data_packet(seq_nr: int, data: bytes) -> UTPPacket:
+    return UTPPacket(
+        type=UTPPacketType.ST_DATA,
+        connection_id=12345,
+        seq_nr=seq_nr,
+        ack_nr=0,
+        wnd_size=65535,
+        data=data,
+    )
+
+
+class TestUTPReceiveBuffer:
+    """Tests for UTPReceiveBuffer."""
+
+    def test_read_across_chunks(self):
+        """Test partial reads spanning chunk boundaries."""
+        buf = UTPReceiveBuffer()
+        buf.extend(b"abc")
+        buf.extend(bytearray(b"defg"))
+        buf.extend(b"")
+        buf.extend(b"hi")
+
+        assert len(buf) == 9
+        assert buf.read(2) == b"ab"
+        assert buf.read(3) == b"cde"
+        assert bytes(buf) == b"fghi"
+        assert buf.read(-1) == b"fghi"
+        assert len(buf) == 0
+        assert buf.read(4) == b""
+
+    def test_readinto(self):
+        """Test readinto copies into a caller buffer and consumes the data."""
+        buf = UTPReceiveBuffer(b"hello ")
+        buf.extend(b"world")
+        out = bytearray(8)
+
+        assert buf.readinto(out) == 8
+        assert out == b"hello wo"
+        assert buf.readinto(memoryview(out)[2:]) == 3
+        assert out[2:5] == b"rld"
+        assert len(buf) == 0
+
+    def test_bytes_does_not_consume(self):
+        """Test bytes() copies the buffered data without consuming it."""
+        buf = UTPReceiveBuffer(b"packet1")
+        buf.extend(b"packet2")
+        buf.read(3)
+
+        assert bytes(buf) == b"ket1packet2"
+        assert len(buf) == 11
+
+    def test_many_small_reads(self):
+        """Test consuming a large buffer in small reads keeps data intact."""
+        payload = bytes(range(256)) * 64
+        buf = UTPReceiveBuffer()
+        for i in range(0, len(payload), 1400):
+            buf.extend(payload[i : i + 1400])
+
+        out = b"".join(buf.read(68) for _ in range(0, len(payload), 68))
+
+        assert out == payload
+        assert len(buf) == 0
+
+
+class TestUTPConnectionReceive:
+    """Tests for UTPConnection receive path."""
+
+    @pytest.fixture
+    def connection(self):
+        """Create a UTP connection for testing."""
+        conn = UTPConnection(remote_addr=("127.0.0.1", 6881), connection_id=12345)
+        conn.transport = MagicMock()
+        conn.state = UTPConnectionState.CONNECTED
+        return conn
+
+    def test_duplicate_packet_not_buffered(self, connection):
+        """Test retransmitted data behind the expected seq is dropped."""
+        connection.recv_buffer_expected_seq = 10
+        connection._handle_data_packet(_data_packet(9, b"old"))
+
+        assert 9 not in connection.recv_buffer
+        assert len(connection.recv_data_buffer) == 0
+
+    def test_reassembly_across_wraparound(self, connection):
+        """Test out-of-order packets are reassembled across seq wraparound."""
+        connection.recv_buffer_expected_seq = 0xFFFF
+        connection._handle_data_packet(_data_packet(0, b"B"))
+        connection._handle_data_packet(_data_packet(0xFFFF, b"A"))
+
+        assert bytes(connection.recv_data_buffer) == b"AB"
+        assert connection.recv_buffer_expected_seq == 1
+
+    @pytest.mark.asyncio
+    async def test_readinto_waits_for_data(self, connection):
+        """Test readinto wakes up when a data packet arrives."""
+        out = bytearray(16)
+        task = asyncio.create_task(connection.readinto(out))
+        await asyncio.sleep(0)
+
+        connection._handle_data_packet(_data_packet(0, b"payload"))
+
+        assert await asyncio.wait_for(task, timeout=1.0) == 7
+        assert out[:7] == b"payload"
+
+    @pytest.mark.asyncio
+    async def test_reset_wakes_pending_receive(self, connection):
+        """Test a RESET ends a pending receive with the buffered remainder."""
+        connection.recv_data_buffer.extend(b"tail")
+        task = asyncio.create_task(connection.receive(10))
+        await asyncio.sleep(0)
+
+        connection._handle_reset_packet(_data_packet(0, b""))
+
+        assert await asyncio.wait_for(task, timeout=1.0) == b"tail"
+        assert connection.at_eof
+        assert await connection.receive(-1) == b""
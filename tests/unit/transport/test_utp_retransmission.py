@@ -26,7 +26,7 @@ class TestRetransmission:
         return conn
 
     @pytest.mark.asyncio
-    async def test_check_retransmissions_timeout(self, connection):
+    async def test_retransmit_timeout_timeout(self, connection):
         """Test retransmission on timeout."""
         # Add packet to send buffer with old send time
         packet = UTPPacket(
@@ -46,15 +46,15 @@ class TestRetransmission:
         old_time = time.perf_counter() - 1.0  # 1 second ago
         connection.send_buffer[100] = (packet, old_time, 0)
 
-        # Check retransmissions
-        await connection._check_retransmissions()
+        # Fire the RTO timer
+        connection._on_retransmit_timeout(100)
 
         # Verify packet was retransmitted
         assert connection.transport.sendto.called
         assert 100 in connection.retransmitted_packets
 
     @pytest.mark.asyncio
-    async def test_check_retransmissions_exponential_backoff(self, connection):
+    async def test_retransmit_timeout_exponential_backoff(self, connection):
         """Test exponential backoff for retransmissions."""
         packet = UTPPacket(
             type=UTPPacketType.ST_DATA,
@@ -72,14 +72,14 @@ class TestRetransmission:
         old_time = time.perf_counter() - 1.0
         connection.send_buffer[100] = (packet, old_time, 2)  # Already retried 2 times
 
-        # Check retransmissions
-        await connection._check_retransmissions()
+        # Fire the RTO timer
+        connection._on_retransmit_timeout(100)
 
         # Verify retry count increased
         assert connection.send_buffer[100][2] == 3  # retry_count
 
     @pytest.mark.asyncio
-    async def test_check_retransmissions_max_retries(self, connection):
+    async def test_retransmit_timeout_max_retries(self, connection):
         """Test connection fails after max retries."""
         connection.state = UTPConnectionState.CONNECTED
         connection.transport = MagicMock()
@@ -98,7 +98,7 @@ class TestRetransmission:
         connection.rttvar = 0.01
         import time
 
-        # Get max_retries using same logic as _check_retransmissions
+        # Get max_retries using same logic as _on_retransmit_timeout
         # The implementation checks hasattr and defaults to 5 if not found
         max_retries = (
             connection.config.network.utp.max_retransmits
@@ -124,15 +124,15 @@ class TestRetransmission:
         # The code checks: if retry_count >= max_retries: then close
         connection.send_buffer[100] = (packet, old_time, max_retries)
 
-        # Check retransmissions
-        await connection._check_retransmissions()
+        # Fire the RTO timer
+        connection._on_retransmit_timeout(100)
 
         # Connection should be closed after max retries
         assert connection.state == UTPConnectionState.CLOSED
 
     @pytest.mark.asyncio
-    async def test_check_retransmissions_no_timeout(self, connection):
-        """Test no retransmission when not timed out."""
+    async def test_retransmit_timeout_no_timeout(self, connection):
+        """Test a timer firing before the packet's RTO re-arms instead."""
         packet = UTPPacket(
             type=UTPPacketType.ST_DATA,
             connection_id=12345,
@@ -152,11 +152,12 @@ class TestRetransmission:
         # Clear call count
         connection.transport.sendto.reset_mock()
 
-        # Check retransmissions
-        await connection._check_retransmissions()
+        # Fire the RTO timer
+        connection._on_retransmit_timeout(100)
 
-        # Should not retransmit
+        # Should not retransmit, but keep a timer for the packet
         assert not connection.transport.sendto.called
+        assert 100 in connection._rto_timers
 
     def test_rto_calculation(self, connection):
         """Test RTO calculation."""
@@ -164,7 +165,7 @@ class TestRetransmission:
         connection.rttvar = 0.02  # 20ms
 
         # RTO = SRTT + 4 * RTTVAR = 0.1 + 4 * 0.02 = 0.18
-        # This is tested indirectly in _check_retransmissions
+        # This is tested indirectly in _on_retransmit_timeout
 
     def test_rto_bounds(self, connection):
         """Test RTO is bounded."""
@@ -173,14 +174,14 @@ class TestRetransmission:
         connection.rttvar = 0.0001
 
         # RTO should be at least 100ms
-        # Tested in _check_retransmissions
+        # Tested in _on_retransmit_timeout
 
         # Test maximum bound
         connection.srtt = 100.0  # Very large
         connection.rttvar = 10.0
 
         # RTO should be at most 60s
-        # Tested in _check_retransmissions
+        # Tested in _on_retransmit_timeout
 
     def test_retransmitted_packet_tracking(self, connection):
         """Test tracking retransmitted packets."""
@@ -0,0 +1,90 @@
+"""Unit tests for the uTP timer wheel."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+import pytest
+
+from ccbt.transport.utp_timer import UTPTimerWheel
+
+pytestmark = [pytest.mark.unit, pytest.mark.transport]
+
+
+class TestUTPTimerWheel:
+    """Tests for UTPTimerWheel."""
+
+    def test_advance_fires_only_expired(self):
+        """Test manual advance fires timers whose tick has been reached."""
+        wheel = UTPTimerWheel(tick_interval=0.01, slots=8)
+        fired: list[str] = []
+        wheel.schedule(0.02, fired.append, "a")
+        wheel.schedule(0.05, fired.append, "b")
+        now = time.perf_counter()
+
+        assert wheel.advance(now + 0.035) == 1
+        assert fired == ["a"]
+        assert len(wheel) == 1
+        assert wheel.advance(now + 0.07) == 1
+        assert fired == ["a", "b"]
+        assert len(wheel) == 0
+
+    def test_delay_longer_than_one_revolution(self):
+        """Test timers beyond one revolution wait for their round."""
+        wheel = UTPTimerWheel(tick_interval=0.01, slots=4)
+        fired: list[int] = []
+        wheel.schedule(0.1, fired.append, 1)  # 10 ticks on a 4-slot wheel
+        now = time.perf_counter()
+
+        wheel.advance(now + 0.05)
+        assert fired == []
+        wheel.advance(now + 0.12)
+        assert fired == [1]
+
+    def test_cancel(self):
+        """Test cancelled timers never fire and are not counted."""
+        wheel = UTPTimerWheel(tick_interval=0.01, slots=8)
+        fired: list[int] = []
+        timer = wheel.schedule(0.01, fired.append, 1)
+
+        timer.cancel()
+        timer.cancel()  # Idempotent
+
+        assert len(wheel) == 0
+        assert wheel.advance(time.perf_counter() + 1.0) == 0
+        assert fired == []
+
+    def test_callback_exception_does_not_stop_others(self):
+        """Test an exception in one callback still fires the rest."""
+        wheel = UTPTimerWheel(tick_interval=0.01, slots=8)
+        fired: list[int] = []
+
+        def boom() -> None:
+            msg = "boom"
+            raise RuntimeError(msg)
+
+        wheel.schedule(0.01, boom)
+        wheel.schedule(0.01, fired.append, 2)
+
+        assert wheel.advance(time.perf_counter() + 0.05) == 2
+        assert fired == [2]
+
+    @pytest.mark.asyncio
+    async def test_driver_fires_and_idles(self):
+        """Test the driver task fires timers and sleeps when none are pending."""
+        wheel = UTPTimerWheel()
+        done = asyncio.Event()
+        wheel.schedule(0.02, done.set)
+
+        await asyncio.wait_for(done.wait(), timeout=1.0)
+        await asyncio.sleep(0.03)
+
+        # No pending timers: driver is parked on the wakeup event
+        assert len(wheel) == 0
+        assert not wheel._wakeup.is_set()
+        fired_before = wheel.timers_fired
+        await asyncio.sleep(0.05)
+        assert wheel.timers_fired == fired_before
+
+        await wheel.stop()
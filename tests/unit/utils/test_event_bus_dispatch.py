@@ -0,0 +1,171 @@
+"""Tests for prioritized, coalescing, multi-worker event dispatch."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+pytestmark = [pytest.mark.unit]
+
+from ccbt.utils.events import (
+    Event,
+    EventBus,
+    EventHandler,
+    EventPriority,
+    EventQueue,
+    EventType,
+)
+
+
+class RecordingHandler(EventHandler):
+    """Handler recording events, optionally waiting on a gate first."""
+
+    def __init__(self, name: str, gate: asyncio.Event | None = None):
+        super().__init__(name)
+        self.gate = gate
+        self.events: list[Event] = []
+
+    async def handle(self, event: Event) -> None:
+        if self.gate is not None:
+            await self.gate.wait()
+        self.events.append(event)
+
+
+class TestEventQueue:
+    """Test priority order, eviction and coalescing."""
+
+    def test_highest_priority_first(self):
+        """Test events are taken by priority, then in order."""
+        queue = EventQueue()
+        for name, priority in (
+            ("low", EventPriority.LOW),
+            ("normal_1", EventPriority.NORMAL),
+            ("critical", EventPriority.CRITICAL),
+            ("normal_2", EventPriority.NORMAL),
+        ):
+            queue.put_nowait(Event(event_type=name, priority=priority))
+
+        order = [queue.get_nowait().event_type for _ in range(queue.qsize())]
+
+        assert order == ["critical", "normal_1", "normal_2", "low"]
+        with pytest.raises(asyncio.QueueEmpty):
+            queue.get_nowait()
+
+    def test_full_queue_evicts_lower_priority(self):
+        """Test a full queue makes room only for higher priority events."""
+        queue = EventQueue(maxsize=2)
+        queue.put_nowait(Event(event_type="low", priority=EventPriority.LOW))
+        queue.put_nowait(Event(event_type="normal"))
+
+        assert queue.put_nowait(Event(event_type="normal_2")) == "evicted"
+        assert queue.put_nowait(Event(event_type="normal_3")) == "dropped"
+        assert (
+            queue.put_nowait(Event(event_type="high", priority=EventPriority.HIGH))
+            == "evicted"
+        )
+        assert [queue.get_nowait().event_type for _ in range(2)] == [
+            "high",
+            "normal_2",
+        ]
+
+    def test_coalesced_event_keeps_its_place(self):
+        """Test a newer event with the same key replaces the queued one."""
+        queue = EventQueue()
+        queue.put_nowait(Event(event_type="rate", data={"v": 1}), ("rate",))
+        queue.put_nowait(Event(event_type="other"))
+
+        assert (
+            queue.put_nowait(Event(event_type="rate", data={"v": 2}), ("rate",))
+            == "coalesced"
+        )
+        assert queue.qsize() == 2
+        first = queue.get_nowait()
+        assert (first.event_type, first.data) == ("rate", {"v": 2})
+        # Once taken, the next event with the key is queued again
+        assert queue.put_nowait(Event(event_type="rate"), ("rate",)) == "queued"
+
+
+class TestEventBusDispatch:
+    """Test the bus dispatches through a pool of workers."""
+
+    @pytest.mark.asyncio
+    async def test_slow_handler_does_not_stall_other_events(self):
+        """Test one blocked handler leaves other workers dispatching."""
+        gate = asyncio.Event()
+        slow = RecordingHandler("slow", gate)
+        fast = RecordingHandler("fast")
+        bus = EventBus(workers=2)
+        bus.register_handler("slow_event", slow)
+        bus.register_handler("fast_event", fast)
+        await bus.start()
+        try:
+            bus.emit_nowait(Event(event_type="slow_event"))
+            for _ in range(10):
+                bus.emit_nowait(Event(event_type="fast_event"))
+            await asyncio.sleep(0.05)
+
+            assert len(fast.events) == 10
+            assert slow.events == []
+
+            gate.set()
+            await asyncio.sleep(0.05)
+            assert len(slow.events) == 1
+            assert bus.stats["events_processed"] == 11
+        finally:
+            await bus.stop()
+
+    @pytest.mark.asyncio
+    async def test_metric_updates_are_coalesced(self):
+        """Test queued state updates collapse to the latest per key."""
+        handler = RecordingHandler("metrics")
+        bus = EventBus()
+        bus.register_handler("*", handler)
+
+        for i in range(100):
+            for name in ("download_rate", "upload_rate"):
+                assert bus.emit_nowait(
+                    Event(
+                        event_type=EventType.PERFORMANCE_METRIC.value,
+                        data={"metric_name": name, "metric_value": i},
+                    )
+                )
+        assert bus.event_queue.qsize() == 2
+        assert bus.stats["events_coalesced"] == 198
+
+        await bus.start()
+        await asyncio.sleep(0.05)
+        await bus.stop()
+
+        assert [e.data for e in handler.events] == [
+            {"metric_name": "download_rate", "metric_value": 99},
+            {"metric_name": "upload_rate", "metric_value": 99},
+        ]
+        # Every event is still kept for replay
+        assert len(bus.get_replay_events(limit=0)) == 200
+
+    def test_handler_lookup_follows_registration(self):
+        """Test the precomputed handler lists are rebuilt on (un)registration."""
+        bus = EventBus()
+        specific = RecordingHandler("specific")
+        wildcard = RecordingHandler("wildcard")
+        bus.register_handler("*", wildcard)
+        assert bus._handlers_for("piece_completed") == (wildcard,)
+
+        bus.register_handler("piece_completed", specific)
+        assert bus._handlers_for("piece_completed") == (specific, wildcard)
+
+        bus.unregister_handler("*", wildcard)
+        assert bus._handlers_for("piece_completed") == (specific,)
+
+    def test_replay_buffer_is_bounded(self):
+        """Test the replay buffer keeps the newest events."""
+        bus = EventBus(max_queue_size=1)
+        bus.max_replay_events = 3
+
+        results = [bus.emit_nowait(Event(event_type=f"e{i}")) for i in range(5)]
+
+        assert results == [True, False, False, False, False]
+        assert [e.event_type for e in bus.get_replay_events()] == ["e2", "e3", "e4"]
+        assert [e.event_type for e in bus.get_replay_events(limit=2)] == ["e3", "e4"]
+        assert bus.stats["events_dropped"] == 4
@@ -268,7 +268,7 @@ class TestEventBus:
         
         assert bus.max_queue_size == 50
         assert bus.handlers == {}
-        assert bus.replay_buffer == []
+        assert list(bus.replay_buffer) == []
         assert bus.max_replay_events == 1000
         assert bus.running is False
         assert bus.stats["events_processed"] == 0
@@ -346,7 +346,7 @@ class TestEventBus:
         
         # Fill queue completely (without processing)
         event1 = Event(event_type="event1")
-        await bus.event_queue.put(event1)
+        bus.event_queue.put_nowait(event1)
         
         # Now queue is full - emit another should be dropped
         initial_dropped = bus.stats["events_dropped"]
@@ -364,8 +364,8 @@ class TestEventBus:
         """Test EventBus.emit() - exception handling path (lines 484-485)."""
         await event_bus.start()
         
-        # Mock event_queue.put to raise exception
-        with patch.object(event_bus.event_queue, "put", side_effect=Exception("Test error")):
+        # Mock event_queue.put_nowait to raise exception
+        with patch.object(event_bus.event_queue, "put_nowait", side_effect=Exception("Test error")):
             event = Event(event_type="test_event")
             # Should not raise, just log exception
             await event_bus.emit(event)
@@ -373,22 +373,14 @@ class TestEventBus:
         await event_bus.stop()
 
     @pytest.mark.asyncio
-    async def test_emit_loop_rebinding(self, event_bus):
-        """Test EventBus.emit() - loop rebinding when loop changes (lines 458-480)."""
-        await event_bus.start()
-        original_loop = event_bus._loop
-        
-        # Simulate loop change by manually setting _loop to None first
-        event_bus._loop = None
-        
+    async def test_emit_before_start(self, event_bus):
+        """Test EventBus.emit() - events emitted before start are kept."""
         event = Event(event_type="test_event")
         await event_bus.emit(event)
-        
-        # Should handle loop initialization and rebinding
+
         assert event in event_bus.replay_buffer
-        assert event_bus._loop is not None
-        
-        await event_bus.stop()
+        assert event_bus.event_queue.qsize() == 1
+        assert event_bus._loop is None
 
     @pytest.mark.asyncio
     async def test_start_already_running(self, event_bus):
@@ -413,13 +405,16 @@ class TestEventBus:
         
         # Simulate different loop scenario by setting _loop to None
         event_bus._loop = None
-        event_bus.event_queue = None  # Clear queue
+        event = Event(event_type="test_event")
+        await event_bus.emit(event)
         
-        # Start again - should rebind to current loop
+        # Start again - should rebind to current loop, keeping queued events
         await event_bus.start()
         
-        # Should have a loop assigned (lines 495-496)
         assert event_bus._loop is not None
+        assert len(event_bus._workers) == event_bus.workers
+        await asyncio.sleep(0.05)
+        assert event_bus.event_queue.qsize() == 0
         
         await event_bus.stop()
 
@@ -435,14 +430,14 @@ class TestEventBus:
         """Test EventBus.stop() - task cancellation handling (lines 514-527)."""
         await event_bus.start()
         
-        task = event_bus._task
-        assert task is not None
+        workers = event_bus._workers
+        assert workers
         
         await event_bus.stop()
         
-        # Task should be cancelled or done
-        assert task.cancelled() or task.done()
-        assert event_bus._task is None
+        # Workers should be cancelled or done
+        assert all(task.cancelled() or task.done() for task in workers)
+        assert event_bus._workers == []
 
     @pytest.mark.asyncio
     async def test_process_events_normal(self, event_bus):
@@ -485,10 +480,10 @@ class TestEventBus:
         """Test EventBus._process_events() - CancelledError handling (lines 540-541)."""
         await event_bus.start()
         
-        # Cancel the processing task
-        if event_bus._task:
-            event_bus._task.cancel()
-            await asyncio.sleep(0.05)
+        # Cancel the workers
+        for task in event_bus._workers:
+            task.cancel()
+        await asyncio.sleep(0.05)
         
         await event_bus.stop()
 
@@ -598,12 +593,15 @@ class TestEventBus:
         """Test EventBus._handle_event() - exception handling (lines 579-580)."""
         await event_bus.start()
         
-        # Create event that causes exception in LoggingContext or handler processing
-        # Mock LoggingContext to raise exception
-        with patch("ccbt.utils.events.LoggingContext", side_effect=Exception("Context error")):
-            event = Event(event_type="test_event")
-            # Should handle exceptions gracefully (lines 579-580)
-            await event_bus._handle_event(event)
+        # Create handler whose can_handle() raises
+        handler = MagicMock(spec=EventHandler)
+        handler.name = "broken_handler"
+        handler.can_handle = MagicMock(side_effect=Exception("Filter error"))
+        event_bus.register_handler("test_event", handler)
+
+        event = Event(event_type="test_event")
+        # Should handle exceptions gracefully
+        await event_bus._handle_event(event)
         
         await event_bus.stop()
 
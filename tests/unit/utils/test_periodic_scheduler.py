@@ -0,0 +1,173 @@
+"""Tests for the timer-wheel periodic job scheduler."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+import pytest
+
+pytestmark = [pytest.mark.unit]
+
+from ccbt.monitoring.metrics_collector import MetricsCollector
+from ccbt.utils.tasks import PeriodicScheduler, get_scheduler, scheduler_registry
+
+
+def recorder(log: list[float], result: float | None = None, work: float = 0.0):
+    """Job callback appending its start time to ``log``."""
+
+    async def job() -> float | None:
+        log.append(asyncio.get_running_loop().time())
+        if work:
+            await asyncio.sleep(work)
+        return result
+
+    return job
+
+
+class TestPeriodicScheduler:
+    """Test jobs run when due, without overlapping, from one timer."""
+
+    @pytest.mark.asyncio
+    async def test_runs_at_interval(self):
+        """Test a job runs first after its delay, then every interval."""
+        scheduler = PeriodicScheduler(tick=0.005)
+        runs: list[float] = []
+        start = asyncio.get_running_loop().time()
+        job = scheduler.schedule(
+            recorder(runs), 0.03, name="tick", jitter=0.0, delay=0.0
+        )
+        await asyncio.sleep(0.1)
+        job.cancel()
+
+        assert 3 <= len(runs) <= 4
+        assert runs[0] - start < 0.02
+        gaps = [b - a for a, b in zip(runs, runs[1:])]
+        assert all(gap >= 0.03 - scheduler.tick for gap in gaps)
+        await scheduler.close()
+
+    @pytest.mark.asyncio
+    async def test_far_deadlines_cascade(self):
+        """Test jobs in higher rings and beyond the wheel run on time."""
+        # Two rings of 64 ticks span 4096 ticks (0.4s); one ring 64 ticks
+        for levels, delay in ((2, 0.15), (1, 0.1)):
+            scheduler = PeriodicScheduler(tick=0.001, levels=levels)
+            runs: list[float] = []
+            start = asyncio.get_running_loop().time()
+            scheduler.schedule(recorder(runs), 10.0, name="far", delay=delay)
+            await asyncio.sleep(delay + 0.05)
+            assert len(runs) == 1
+            assert runs[0] - start >= delay - scheduler.tick
+            await scheduler.close()
+
+    @pytest.mark.asyncio
+    async def test_returned_delay_and_no_overlap(self):
+        """Test a callback can set its next delay and runs never overlap."""
+        scheduler = PeriodicScheduler(tick=0.005)
+        slow: list[float] = []
+        backoff: list[float] = []
+        scheduler.schedule(
+            recorder(slow, work=0.04), 0.01, name="slow", jitter=0.0, delay=0.0
+        )
+        scheduler.schedule(
+            recorder(backoff, result=1.0), 0.01, name="backoff", delay=0.0
+        )
+        await asyncio.sleep(0.1)
+
+        assert len(backoff) == 1
+        assert 2 <= len(slow) <= 3
+        assert all(b - a >= 0.04 for a, b in zip(slow, slow[1:]))
+        await scheduler.close()
+
+    @pytest.mark.asyncio
+    async def test_missed_periods_coalesce(self):
+        """Test a blocked loop causes one late run, not a burst."""
+        scheduler = PeriodicScheduler(tick=0.005)
+        runs: list[float] = []
+        scheduler.schedule(recorder(runs), 0.02, name="late", jitter=0.0, delay=0.01)
+        time.sleep(0.1)  # Block the event loop over several periods
+        await asyncio.sleep(0.015)
+
+        assert len(runs) == 1
+        assert scheduler.stats()["late"]["coalesced"] >= 4
+        await scheduler.close()
+
+    @pytest.mark.asyncio
+    async def test_only_due_jobs_run_and_idle_disarms(self):
+        """Test thousands of waiting jobs cost nothing until due."""
+        scheduler = PeriodicScheduler(tick=0.005)
+        idle: list[float] = []
+        busy: list[float] = []
+        jobs = [
+            scheduler.schedule(recorder(idle), 3600.0, name="idle") for _ in range(5000)
+        ]
+        jobs.append(scheduler.schedule(recorder(busy), 0.01, name="busy", delay=0.0))
+        await asyncio.sleep(0.05)
+
+        assert idle == []
+        assert len(busy) >= 3
+        assert scheduler.jobs == 5001
+
+        for job in jobs:
+            job.cancel()
+        await asyncio.sleep(0.02)
+        assert scheduler.jobs == 0
+        assert scheduler._timer is None
+        await scheduler.close()
+
+    @pytest.mark.asyncio
+    async def test_errors_and_histograms(self):
+        """Test failing runs are counted and the job keeps running."""
+        scheduler = PeriodicScheduler(tick=0.005)
+        calls = []
+
+        async def failing() -> None:
+            calls.append(1)
+            raise RuntimeError("boom")
+
+        scheduler.schedule(failing, 0.01, name="failing", delay=0.0)
+        await asyncio.sleep(0.05)
+
+        stats = scheduler.stats()["failing"]
+        assert stats["jobs"] == 1
+        assert stats["runs"] == len(calls) >= 2
+        assert stats["errors"] == len(calls)
+        assert stats["buckets"][-1][1] == len(calls)
+        assert "ccbt_scheduler_job_run_seconds_count" in scheduler.registry.render()
+        await scheduler.close()
+        assert scheduler.jobs == 0
+
+    @pytest.mark.asyncio
+    async def test_cancel_interrupts_run(self):
+        """Test cancelling a job cancels its run in progress."""
+        scheduler = PeriodicScheduler(tick=0.005)
+        started = asyncio.Event()
+
+        async def forever() -> None:
+            started.set()
+            await asyncio.sleep(10)
+
+        job = scheduler.schedule(forever, 1.0, name="forever", delay=0.0)
+        await asyncio.wait_for(started.wait(), 1.0)
+        assert job.running
+        job.cancel()
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        assert not job.running
+        assert job.cancelled
+        await scheduler.close()
+
+
+@pytest.mark.asyncio
+async def test_get_scheduler_per_loop():
+    """Test the shared scheduler is reused within a loop and exported."""
+    scheduler = get_scheduler()
+    assert get_scheduler() is scheduler
+    assert scheduler.registry is scheduler_registry
+    job = scheduler.schedule(recorder([]), 1.0, name="shared", delay=0.0)
+    assert scheduler.loop is asyncio.get_running_loop()
+    await asyncio.sleep(0.15)
+    job.cancel()
+
+    exported = MetricsCollector()._export_prometheus_format()
+    assert 'ccbt_scheduler_job_run_seconds_count{job="shared"}' in exported